@@ -17,6 +17,8 @@ import threading
 import multiprocessing
 from typing import Callable
 
+from hopp.simulation.technologies.resource.shared_resource import attach_shared_resources
+
 
 def get_best_from_cache(cache: Cache, objective: Callable) -> tuple:
     """
@@ -90,18 +92,21 @@ class Worker(multiprocessing.Process):
     Process-contained worker to execute objective calculations.
     """
 
-    def __init__(self, task_queue, cache, setup: Callable) -> None:
+    def __init__(self, task_queue, cache, setup: Callable, shared_resources: dict = None) -> None:
         """
         Process-contained worker, having an independent instance of the problem and simulation to evaluate the objective
 
         :param task_queue: multiprocessing.JoinableQueue()
         :param cache: multiprocessing.manager.dict()
         :param setup: function to create a new instance of the design problem
+        :param shared_resources: optional SharedResourceStore.handle, attached before the problem is created so that
+            the worker's SiteInfo uses the parent's resource arrays instead of loading its own copy
         """
         super().__init__()
         self.task_queue = task_queue
         self.cache = cache
         self.setup = setup
+        self.shared_resources = shared_resources
 
     def run(self):
         """
@@ -112,6 +117,7 @@ class Worker(multiprocessing.Process):
         """
 
         # Create a new problem for the worker
+        attach_shared_resources(self.shared_resources)
         problem = self.setup()
 
         # proc_name = self.name # not currently used
@@ -189,6 +195,9 @@ class OptimizationDriver():
     
     retry : initializer(bool), optional
         ``True`` if any evaluations ending in an exception should be retried on restart
+
+    shared_resources : initializer(dict), optional
+        ``SharedResourceStore.handle`` of resources loaded once in the parent and attached read-only by each worker
     """
     DEFAULT_KWARGS = dict(time_limit=np.inf,  # total time limit in seconds
                           eval_limit=np.inf,  # objective evaluation limit (counts new evaluations only)
@@ -200,7 +209,8 @@ class OptimizationDriver():
                           dataframe_file='study_results.df.gz',  # filename for the driver cache dataframe file
                           csv_file='study_results.csv',  # filename for the driver cache csv file
                           scaled=True,  # True if the sample/optimizer candidates need to be scaled to problem units
-                          retry=True)  # True if any evaluations ending in an exception should be retried on restart
+                          retry=True,  # True if any evaluations ending in an exception should be retried on restart
+                          shared_resources=None)  # SharedResourceStore.handle attached by each worker before setup
 
     def __init__(self,
                  setup: Callable,
@@ -269,7 +279,7 @@ class OptimizationDriver():
             self.lock = threading.Lock()
 
         print(f"Creating {num_workers} workers")
-        self.workers = [Worker(self.tasks, self.cache, self.setup)
+        self.workers = [Worker(self.tasks, self.cache, self.setup, self.options['shared_resources'])
                         for _ in range(num_workers)]
 
         # Start the workers polling the task queue
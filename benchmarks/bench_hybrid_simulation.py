@@ -0,0 +1,136 @@
+"""
+Benchmarks of ``HybridSimulation.simulate`` for representative plant configurations.
+
+Run from the repository root with ``pytest benchmarks``; see ``benchmarks/README.md``.
+"""
+from copy import deepcopy
+
+import pytest
+
+from hopp import ROOT_DIR
+from hopp.simulation import HoppInterface
+from hopp.simulation.technologies.financial.mhk_cost_model import MHKCostModelInputs
+from hopp.utilities import load_yaml
+
+
+INPUTS_DIR = ROOT_DIR.parent / "tests" / "hopp" / "inputs"
+WAVE_RESOURCE_FILE = ROOT_DIR.parent / "resource_files" / "wave" / "Wave_resource_timeseries.csv"
+
+interconnect_kw = 15000
+
+technologies = {
+    "pv": {
+        "system_capacity_kw": 5000,
+    },
+    "wind": {
+        "num_turbines": 5,
+        "turbine_rating_kw": 2000,
+    },
+    "battery": {
+        "system_capacity_kw": 5000,
+        "system_capacity_kwh": 20000,
+    },
+    "tower": {
+        "cycle_capacity_kw": 15000,
+        "solar_multiple": 2.0,
+        "tes_hours": 6.0,
+    },
+    "trough": {
+        "cycle_capacity_kw": 15000,
+        "solar_multiple": 2.0,
+        "tes_hours": 6.0,
+    },
+    "grid": {
+        "interconnect_kw": interconnect_kw,
+        "ppa_price": 0.05,
+    },
+}
+
+battery_dispatch_options = [
+    "simple",
+    "one_cycle_heuristic",
+    "heuristic",
+    "non_convex_LV",
+    "convex_LV",
+    "load_following_heuristic",
+]
+
+
+@pytest.fixture
+def hybrid_config():
+    return load_yaml(INPUTS_DIR / "hybrid_run.yaml")
+
+
+@pytest.fixture
+def dispatch_solver(request):
+    return request.config.getoption("--dispatch-solver")
+
+
+def create_hybrid(hybrid_config, techs, dispatch_options=None):
+    hybrid_config["technologies"] = {key: deepcopy(technologies[key]) for key in techs}
+    hybrid_config["config"]["dispatch_options"] = dispatch_options
+    return HoppInterface(hybrid_config).system
+
+
+def bench_pv_only(hybrid_config, simulate_benchmark):
+    hybrid_plant = create_hybrid(hybrid_config, ("pv", "grid"))
+    simulate_benchmark(hybrid_plant)
+
+
+def bench_wind_pv(hybrid_config, simulate_benchmark):
+    hybrid_plant = create_hybrid(hybrid_config, ("pv", "wind", "grid"))
+    simulate_benchmark(hybrid_plant)
+
+
+@pytest.mark.parametrize("battery_dispatch", battery_dispatch_options)
+def bench_wind_pv_battery(hybrid_config, simulate_benchmark, dispatch_solver, battery_dispatch):
+    if battery_dispatch == "load_following_heuristic":
+        hybrid_config["site"]["desired_schedule"] = [interconnect_kw / 2e3] * 8760
+    dispatch_options = {
+        "battery_dispatch": battery_dispatch,
+        "solver": dispatch_solver,
+        "grid_charging": False,
+    }
+    hybrid_plant = create_hybrid(hybrid_config, ("pv", "wind", "battery", "grid"), dispatch_options)
+    simulate_benchmark(hybrid_plant)
+
+
+@pytest.mark.parametrize("use_clustering", [False, True], ids=["test_days", "clustering"])
+@pytest.mark.parametrize("csp", ["tower", "trough"])
+def bench_csp_pv(hybrid_config, simulate_benchmark, dispatch_solver, csp, use_clustering):
+    # a full year of CSP dispatch takes hours, so the unclustered case simulates the first and last 5 days only
+    if use_clustering:
+        dispatch_options = {"use_clustering": True, "n_clusters": 10}
+    else:
+        dispatch_options = {"is_test_start_year": True, "is_test_end_year": True}
+    dispatch_options["solver"] = dispatch_solver
+    hybrid_plant = create_hybrid(hybrid_config, (csp, "pv", "grid"), dispatch_options)
+    simulate_benchmark(hybrid_plant)
+
+
+def bench_wave_only(hybrid_config, simulate_benchmark):
+    mhk_config = load_yaml(INPUTS_DIR / "wave" / "wave_device.yaml")
+    hybrid_config["site"]["wave"] = True
+    hybrid_config["site"]["wave_resource_file"] = WAVE_RESOURCE_FILE
+    hybrid_config["site"]["data"] = {"lat": 44.6899, "lon": 124.1346, "year": 2010, "tz": -7}
+    hybrid_config["site"]["solar"] = False
+    hybrid_config["site"]["wind"] = False
+    hybrid_config["technologies"] = {
+        "wave": {
+            "device_rating_kw": mhk_config["device_rating_kw"],
+            "num_devices": 10,
+            "wave_power_matrix": mhk_config["wave_power_matrix"],
+        },
+        "grid": deepcopy(technologies["grid"]),
+    }
+    hybrid_plant = HoppInterface(hybrid_config).system
+    hybrid_plant.wave.create_mhk_cost_calculator(MHKCostModelInputs.from_dict({
+        "reference_model_num": 3,
+        "water_depth": 100,
+        "distance_to_shore": 80,
+        "number_rows": 10,
+        "device_spacing": 600,
+        "row_spacing": 600,
+        "cable_system_overbuild": 20,
+    }))
+    simulate_benchmark(hybrid_plant)
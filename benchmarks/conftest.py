@@ -0,0 +1,110 @@
+"""
+Pytest configuration for the HybridSimulation benchmarks.
+
+Each benchmark times ``HybridSimulation.simulate`` with pytest-benchmark and stores the mean time of every stage
+recorded by ``HybridSimulation.timer`` in the benchmark's ``extra_info``, so that saved runs hold the stage breakdown.
+A saved run can be passed to ``--stage-baseline`` to report, and optionally fail on, per-stage regressions.
+"""
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from hopp import TEST_ENV_VAR
+
+
+_stage_results = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("hopp benchmarks")
+    group.addoption("--bench-rounds", type=int, default=1,
+                    help="Number of timed HybridSimulation.simulate calls per benchmark")
+    group.addoption("--dispatch-solver", default="cbc",
+                    help="Dispatch solver used by the benchmarks with dispatch optimization")
+    group.addoption("--stage-baseline", default=None,
+                    help="Saved pytest-benchmark json file to compare the stage times against")
+    group.addoption("--stage-fail-threshold", type=float, default=None,
+                    help="Fail the session if a stage is slower than in the baseline by more than this percentage")
+
+
+def pytest_sessionstart(session):
+    os.environ["ENV"] = TEST_ENV_VAR
+
+
+@pytest.fixture
+def simulate_benchmark(benchmark, request):
+    """
+    Times ``simulate`` of a HybridSimulation and records its stage breakdown.
+    """
+    rounds = request.config.getoption("--bench-rounds")
+
+    def run(hybrid_plant, project_life: int = 25):
+        stage_times = {}
+
+        def target():
+            hybrid_plant.simulate(project_life)
+            for stage, total in hybrid_plant.timer.totals.items():
+                stage_times.setdefault(stage, []).append(total)
+
+        benchmark.pedantic(target, rounds=rounds, iterations=1)
+        stages = {stage: float(np.mean(times)) for stage, times in stage_times.items()}
+        benchmark.extra_info["stages"] = stages
+        benchmark.extra_info["stage_calls"] = dict(hybrid_plant.timer.counts)
+        _stage_results[request.node.name] = stages
+        return hybrid_plant
+
+    return run
+
+
+def _load_baseline(filename):
+    with open(filename) as f:
+        saved = json.load(f)
+    return {bench["name"]: bench.get("extra_info", {}).get("stages", {}) for bench in saved["benchmarks"]}
+
+
+def _stage_regressions(config):
+    filename = config.getoption("--stage-baseline")
+    if filename is None or not _stage_results:
+        return None, []
+    baseline = _load_baseline(Path(filename))
+    threshold = config.getoption("--stage-fail-threshold")
+    rows = []
+    for name, stages in _stage_results.items():
+        for stage, mean in stages.items():
+            base = baseline.get(name, {}).get(stage)
+            if base is None or base <= 0:
+                continue
+            change = (mean - base) / base * 100
+            rows.append((name, stage, base, mean, change, threshold is not None and change > threshold))
+    return baseline, rows
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not _stage_results:
+        return
+    terminalreporter.section("HybridSimulation stage times [s]")
+    stage_names = []
+    for stages in _stage_results.values():
+        stage_names.extend(s for s in stages if s not in stage_names)
+    width = max(len(name) for name in _stage_results)
+    terminalreporter.write_line(f"{'benchmark':<{width}}  " + "  ".join(f"{s:>18}" for s in stage_names))
+    for name, stages in _stage_results.items():
+        times = "  ".join(f"{stages[s]:>18.4f}" if s in stages else f"{'-':>18}" for s in stage_names)
+        terminalreporter.write_line(f"{name:<{width}}  {times}")
+
+    baseline, rows = _stage_regressions(config)
+    if baseline is None:
+        return
+    terminalreporter.section(f"Stage changes against {config.getoption('--stage-baseline')}")
+    for name, stage, base, mean, change, failed in rows:
+        flag = "  REGRESSION" if failed else ""
+        terminalreporter.write_line(f"{name:<{width}}  {stage:>18}  {base:>10.4f} -> {mean:>10.4f}  {change:+7.1f}%{flag}")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    _, rows = _stage_regressions(session.config)
+    if any(row[-1] for row in rows) and exitstatus == 0:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
@@ -17,10 +17,12 @@ from hopp.simulation.technologies.csp.trough_plant import TroughConfig, TroughPl
 from hopp.simulation.technologies.wave.mhk_wave_plant import MHKWavePlant, MHKConfig
 from hopp.simulation.technologies.battery import Battery, BatteryConfig, BatteryStateless, BatteryStatelessConfig
 from hopp.simulation.technologies.grid import Grid, GridConfig
+from hopp.simulation.technologies.lifetime_series import LifetimeSeries
 from hopp.simulation.technologies.reopt import REopt
 from hopp.simulation.technologies.layout.hybrid_layout import HybridLayout
 from hopp.simulation.technologies.dispatch.hybrid_dispatch_builder_solver import HybridDispatchBuilderSolver
 from hopp.utilities.log import hybrid_logger as logger
+from hopp.utilities.timing import StageTimer
 from hopp.simulation.base import BaseClass
 
 
@@ -191,10 +193,12 @@ class HybridSimulation(BaseClass):
     technologies: Dict[str, PowerSourceTypes] = field(init=False)
 
     dispatch_builder: HybridDispatchBuilderSolver = field(init=False)
+    timer: StageTimer = field(init=False)
     _fileout: Path = field(init=False)
 
     def __attrs_post_init__(self):
         self.technologies = {} # store technologies after they've been initialized
+        self.timer = StageTimer()
         self._fileout = Path.cwd() / "results"
         self.sim_options = self.simulation_options or {}
 
@@ -278,7 +282,8 @@ class HybridSimulation(BaseClass):
 
         self.dispatch_builder = HybridDispatchBuilderSolver(self.site,
                                                             self.technologies,
-                                                            dispatch_options=self.dispatch_options or {})
+                                                            dispatch_options=self.dispatch_options or {},
+                                                            timer=self.timer)
 
         # Default cost calculator, can be overwritten
         self.cost_model = create_cost_calculator(self.interconnect_kw, **self.cost_info or {})
@@ -622,44 +627,66 @@ class HybridSimulation(BaseClass):
             For simulation modules which support simulating each year of the project_life, whether or not to do so; otherwise the first year data is repeated
         :return:
         """
-        self.setup_performance_models()
+        with self.timer.stage("setup"):
+            self.setup_performance_models()
         # simulate non-dispatchable systems
         non_dispatchable_systems = ['pv', 'wind','wave']
-        for system in non_dispatchable_systems:
-            model = getattr(self, system)
-            if model:
-                model.simulate_power(project_life, lifetime_sim)
+        with self.timer.stage("generation"):
+            for system in non_dispatchable_systems:
+                model = getattr(self, system)
+                if model:
+                    model.simulate_power(project_life, lifetime_sim)
 
         # simulate dispatchable systems using dispatch optimization
         self.dispatch_builder.simulate_power()
 
-        # Put the hybrid together for grid simulation
+        with self.timer.stage("aggregation"):
+            self._aggregate_power(project_life, lifetime_sim, non_dispatchable_systems)
+        logger.info(f"Hybrid Peformance Simulation Complete. AEPs are {self.annual_energies}.")
+
+    def _aggregate_power(self, project_life: int, lifetime_sim: bool, non_dispatchable_systems: Sequence[str]):
+        """
+        Combines the generation of the individual systems and simulates the grid connection.
+        """
+        # Put the hybrid together for grid simulation. Single-year profiles are repeated over the project life
+        # lazily, summing them over the longest simulated period only
         hybrid_size_kw = 0
         hybrid_nominal_capacity = 0
-        total_gen = np.zeros(self.site.n_timesteps * project_life)
-        total_gen_before_battery = np.zeros(self.site.n_timesteps * project_life)
+        n_total = self.site.n_timesteps * project_life
         total_gen_max_feasible_year1 = np.zeros(self.site.n_timesteps)
 
+        generation_profiles = {}
         for system in self.technologies.keys():
             if system != 'grid':
                 model = getattr(self, system)
                 if model:
                     hybrid_size_kw += model.system_capacity_kw
                     hybrid_nominal_capacity += model.calc_nominal_capacity(self.interconnect_kw)
-                    project_life_gen = np.tile(model.generation_profile, int(project_life / (len(model.generation_profile) // self.site.n_timesteps)))
-                    if len(project_life_gen) != len(total_gen):
+                    gen = np.asarray(model.generation_profile, dtype=float)
+                    if len(gen) == 0 or n_total % len(gen) != 0 or len(gen) % self.site.n_timesteps != 0:
                         raise ValueError("Generation profile, `gen`, from system {} should have length that divides"
                                         " n_timesteps {} * project_life {}".format(system, self.site.n_timesteps,
                                                                                     project_life))
-                    if system in non_dispatchable_systems:
-                        total_gen_before_battery += project_life_gen
-                    total_gen += project_life_gen
+                    generation_profiles[system] = gen
                     model.gen_max_feasible = model.calc_gen_max_feasible_kwh(self.interconnect_kw)
                     total_gen_max_feasible_year1 += model.gen_max_feasible
 
+        n_period = self.site.n_timesteps
+        for gen in generation_profiles.values():
+            n_period = int(np.lcm(n_period, len(gen)))
+        period_gen = np.zeros(n_period)
+        period_gen_before_battery = np.zeros(n_period)
+        for system, gen in generation_profiles.items():
+            period_profile = np.tile(gen, n_period // len(gen))
+            if system in non_dispatchable_systems:
+                period_gen_before_battery += period_profile
+            period_gen += period_profile
+        total_gen = LifetimeSeries(period_gen, n_total)
+        total_gen_before_battery = LifetimeSeries(period_gen_before_battery, n_total)
+
         # Consolidate grid generation by copying over power and storage generation information
         if self.battery:
-            self.grid.generation_profile_wo_battery = total_gen_before_battery
+            self.grid.generation_profile_wo_battery = np.asarray(total_gen_before_battery)
         self.grid.simulate_grid_connection(
             hybrid_size_kw, 
             total_gen, 
@@ -670,7 +697,6 @@ class HybridSimulation(BaseClass):
         )
         self.grid.hybrid_nominal_capacity = hybrid_nominal_capacity
         self.grid.total_gen_max_feasible_year1 = total_gen_max_feasible_year1
-        logger.info(f"Hybrid Peformance Simulation Complete. AEPs are {self.annual_energies}.")
 
     def simulate_financials(self, project_life):
         """
@@ -725,14 +751,19 @@ class HybridSimulation(BaseClass):
         """
         Runs the individual system models then combines the financials
 
+        The time spent in each stage of the simulation is recorded in :attr:`timer`, which is reset at the start of
+        every call.
+
         :param lifetime_sim: ``bool``,
             For simulation modules which support simulating each year of the project_life, whether or not to do so; otherwise the first year data is repeated
         :return:
         """
+        self.timer.reset()
         self.simulate_power(project_life, lifetime_sim)
-        self.calculate_installed_cost()
-        self.calculate_financials()
-        self.simulate_financials(project_life)
+        with self.timer.stage("financials"):
+            self.calculate_installed_cost()
+            self.calculate_financials()
+            self.simulate_financials(project_life)
 
     @property
     def interconnect_kw(self) -> float:
@@ -1,7 +1,6 @@
 from dataclasses import dataclass, asdict
 from typing import Optional, Sequence, List, Union
 import numpy as np
-import pandas as pd
 
 from attrs import define, field
 import PySAM.BatteryStateful as BatteryModel
@@ -11,7 +10,9 @@ from hopp.simulation.base import BaseClass
 from hopp.simulation.technologies.financial import FinancialModelType, CustomFinancialModel
 
 from hopp.simulation.technologies.power_source import PowerSource
+from hopp.simulation.technologies.capacity_credit import storage_max_feasible_generation_kwh
 from hopp.simulation.technologies.sites.site_info import SiteInfo
+from hopp.type_dec import NDArrayFloat
 
 from hopp.utilities.log import hybrid_logger as logger
 from hopp.utilities.validators import contains, gt_zero, range_val
@@ -53,11 +54,11 @@ class BatteryOutputs:
         """Class for storing stateful battery and dispatch outputs."""
         self.stateful_attributes = ['I', 'P', 'Q', 'SOC', 'T_batt', 'gen', 'n_cycles']
         for attr in self.stateful_attributes:
-            setattr(self, attr, [0.0] * n_timesteps)
+            setattr(self, attr, np.zeros(n_timesteps))
 
         dispatch_attributes = ['I', 'P', 'SOC']
         for attr in dispatch_attributes:
-            setattr(self, 'dispatch_'+attr, [0.0] * n_timesteps)
+            setattr(self, 'dispatch_'+attr, np.zeros(n_timesteps))
 
         self.dispatch_lifecycles_per_day = [None] * int(n_timesteps / n_periods_per_day)
 
@@ -260,25 +261,28 @@ class Battery(PowerSource):
             raise ValueError("No dispatch set for this battery.")
 
         # Set stateful control value [Discharging (+) + Charging (-)]
-        if self.value("control_mode") == 1.0:
+        controls = self._system_model.Controls
+        if controls.control_mode == 1.0:
             control = [pow_MW*1e3 for pow_MW in self.dispatch.power]    # MW -> kW
-        elif self.value("control_mode") == 0.0:
+        elif controls.control_mode == 0.0:
             control = [cur_MA * 1e6 for cur_MA in self.dispatch.current]    # MA -> A
         else:
             raise ValueError("Stateful battery module 'control_mode' invalid value.")
 
+        # Bind the PySAM groups once per dispatch horizon instead of resolving each variable name per time step
+        control_variable = self.dispatch.control_variable
+        state_handles = self._stateful_output_handles()
         time_step_duration = self.dispatch.time_duration
         for t in range(n_periods):
-            self.value('dt_hr', time_step_duration[t])
-            self.value(self.dispatch.control_variable, control[t])
+            controls.dt_hr = time_step_duration[t]
+            setattr(controls, control_variable, control[t])
+            self._system_model.execute(0)
 
             # Only store information if passed the previous day simulations (used in clustering)
             if sim_start_time is not None:
-                index_time_step = sim_start_time + t  # Store information
-            else:
-                index_time_step = None
-
-            self.simulate_power(time_step=index_time_step)
+                index_time_step = sim_start_time + t
+                for buffer, group, attr in state_handles:
+                    buffer[index_time_step] = getattr(group, attr)
 
         # Store Dispatch model values
         if sim_start_time is not None:
@@ -315,12 +319,28 @@ class Battery(PowerSource):
         Args:
             time_step: time step where outputs will be stored.
         """
+        for buffer, group, attr in self._stateful_output_handles():
+            buffer[time_step] = getattr(group, attr)
+
+    def _stateful_output_handles(self) -> list:
+        """
+        Binds each stateful output buffer to the BatteryStateful group holding its value.
+
+        Returns:
+            List of (output buffer, PySAM group, variable name), where 'gen' is read from 'P'
+        """
+        state_pack = self._system_model.StatePack
+        state_cell = self._system_model.StateCell
+        handles = []
         for attr in self.outputs.stateful_attributes:
-            if hasattr(self._system_model.StatePack, attr) or hasattr(self._system_model.StateCell, attr):
-                getattr(self.outputs, attr)[time_step] = self.value(attr)
-            else:
-                if attr == 'gen':
-                    getattr(self.outputs, attr)[time_step] = self.value('P')
+            buffer = getattr(self.outputs, attr)
+            if hasattr(state_pack, attr):
+                handles.append((buffer, state_pack, attr))
+            elif hasattr(state_cell, attr):
+                handles.append((buffer, state_cell, attr))
+            elif attr == 'gen':
+                handles.append((buffer, state_pack, 'P'))
+        return handles
 
     def validate_replacement_inputs(self, project_life):
         """
@@ -404,7 +424,7 @@ class Battery(PowerSource):
         self._financial_model.execute(0)
         logger.info("{} simulation executed".format('battery'))
 
-    def calc_gen_max_feasible_kwh(self, interconnect_kw, use_avail_storage: bool = True) -> List[float]:
+    def calc_gen_max_feasible_kwh(self, interconnect_kw, use_avail_storage: bool = True) -> NDArrayFloat:
         """
         Calculates the maximum feasible capacity (generation profile) that could have occurred.
 
@@ -417,23 +437,16 @@ class Battery(PowerSource):
             Maximum feasible capacity [kWh]
         """
         t_step = self.site.interval / 60                                                # hr
-        df = pd.DataFrame()
-        df['E_delivered'] = [max(0, x * t_step) for x in self.outputs.P]                # [kWh]
-        df['SOC_perc'] = self.outputs.SOC                                               # [%]
-        df['E_stored'] = df.SOC_perc / 100 * self.system_capacity_kwh                   # [kWh]
-
-        def max_feasible_kwh(row):
-            return min(self.system_capacity_kw * t_step, row.E_delivered + row.E_stored)
-
-        if use_avail_storage:
-            E_max_feasible = df.apply(max_feasible_kwh, axis=1)                             # [kWh]
-        else:
-            E_max_feasible = df['E_delivered']
-
         W_ac_nom = self.calc_nominal_capacity(interconnect_kw)
-        E_max_feasible = np.minimum(E_max_feasible, W_ac_nom*t_step) 
-        
-        return list(E_max_feasible)
+        return storage_max_feasible_generation_kwh(
+            self.outputs.P,
+            self.outputs.SOC,
+            self.system_capacity_kwh,
+            self.system_capacity_kw,
+            W_ac_nom,
+            t_step,
+            use_avail_storage
+        )
 
     @property
     def generation_profile(self) -> Sequence:
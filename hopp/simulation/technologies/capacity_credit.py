@@ -0,0 +1,116 @@
+"""
+Vectorized capacity value calculations shared by the technologies and the grid.
+
+All profiles are year-1 numpy arrays at the site's time resolution, so the same functions serve hourly and
+sub-hourly simulations. Capacity hours may be given either per timestep or hourly, in which case they are
+repeated to the timestep resolution.
+"""
+from typing import Optional, Sequence, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hopp.type_dec import NDArrayFloat
+
+
+def max_feasible_generation_kwh(
+    generation_kw: Union[Sequence, NDArrayFloat],
+    nominal_capacity_kw: float,
+    interval_hr: float
+) -> NDArrayFloat:
+    """
+    Maximum feasible generation of a non-dispatchable source, limited by its nominal capacity.
+
+    Args:
+        generation_kw: generation profile [kW]
+        nominal_capacity_kw: nominal capacity of the source [kW]
+        interval_hr: timestep [hr]
+
+    Returns:
+        maximum feasible generation per timestep [kWh]
+    """
+    return np.minimum(np.asarray(generation_kw, dtype=float), nominal_capacity_kw) * interval_hr
+
+
+def storage_max_feasible_generation_kwh(
+    power_kw: Union[Sequence, NDArrayFloat],
+    soc_percent: Union[Sequence, NDArrayFloat],
+    capacity_kwh: float,
+    capacity_kw: float,
+    nominal_capacity_kw: float,
+    interval_hr: float,
+    use_avail_storage: bool = True
+) -> NDArrayFloat:
+    """
+    Maximum feasible generation of a storage system.
+
+    Args:
+        power_kw: dispatched power profile, positive when discharging [kW]
+        soc_percent: state-of-charge profile [%]
+        capacity_kwh: energy capacity [kWh]
+        capacity_kw: power capacity [kW]
+        nominal_capacity_kw: nominal capacity of the system [kW]
+        interval_hr: timestep [hr]
+        use_avail_storage: base the feasible generation on the available stored energy (True), otherwise use only
+            the dispatched generation (False)
+
+    Returns:
+        maximum feasible generation per timestep [kWh]
+    """
+    E_delivered = np.maximum(np.asarray(power_kw, dtype=float) * interval_hr, 0.)       # [kWh]
+    if use_avail_storage:
+        E_stored = np.asarray(soc_percent, dtype=float) / 100 * capacity_kwh             # [kWh]
+        E_max_feasible = np.minimum(E_delivered + E_stored, capacity_kw * interval_hr)
+    else:
+        E_max_feasible = E_delivered
+    return np.minimum(E_max_feasible, nominal_capacity_kw * interval_hr)
+
+
+def expand_capacity_hours(capacity_hours: Union[Sequence, NDArray], n_timesteps: int) -> Optional[NDArray]:
+    """
+    Capacity hours at the timestep resolution.
+
+    Args:
+        capacity_hours: per-timestep or hourly flags of the hours that count towards capacity payments
+        n_timesteps: number of timesteps in the year
+
+    Returns:
+        boolean array of length ``n_timesteps``, or None if ``capacity_hours`` cannot be mapped onto the timesteps
+    """
+    capacity_hours = np.asarray(capacity_hours, dtype=bool)
+    if len(capacity_hours) == n_timesteps:
+        return capacity_hours
+    if len(capacity_hours) > 0 and n_timesteps % len(capacity_hours) == 0:
+        return np.repeat(capacity_hours, n_timesteps // len(capacity_hours))
+    return None
+
+
+def capacity_value_percent(
+    gen_max_feasible_kwh: Union[Sequence, NDArrayFloat],
+    capacity_hours: Union[Sequence, NDArray],
+    nominal_capacity_kw: float,
+    interval_hr: float
+) -> Optional[float]:
+    """
+    Capacity credit as the average fraction of nominal capacity deliverable during the capacity hours.
+
+    Args:
+        gen_max_feasible_kwh: maximum feasible generation per timestep of year 1 [kWh]
+        capacity_hours: per-timestep or hourly flags of the hours that count towards capacity payments
+        nominal_capacity_kw: nominal capacity of the system [kW]
+        interval_hr: timestep [hr]
+
+    Returns:
+        capacity credit [%], or None if the capacity hours do not match the generation profile
+    """
+    gen_max_feasible_kwh = np.asarray(gen_max_feasible_kwh, dtype=float)
+    selected = expand_capacity_hours(capacity_hours, len(gen_max_feasible_kwh))
+    if selected is None:
+        return None
+
+    n_selected = np.count_nonzero(selected)
+    if n_selected == 0 or nominal_capacity_kw <= 0:
+        return 0
+
+    fraction = np.minimum(gen_max_feasible_kwh[selected] / (nominal_capacity_kw * interval_hr), 1.0)
+    return min(100, fraction.sum() / n_selected * 100)
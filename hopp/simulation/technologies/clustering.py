@@ -6,6 +6,8 @@ import numpy as np
 import pysolar
 import datetime
 
+from hopp.simulation.technologies.resource.solar_csv import read_solar_csv
+
 
 class Clustering:
 
@@ -139,16 +141,11 @@ class Clustering:
     def read_weather(self):
         weather = {k:[] for k in ['year', 'month', 'day', 'hour', 'ghi', 'dhi', 'dni', 'tdry', 'wspd']}
 
-        # Get header info
-        header = np.genfromtxt(self.solar_resource_file, delimiter = ',', dtype = 'str', skip_header = 0, max_rows = 2)
-        i = np.where(header[0,:] == 'Latitude')[0][0]
-        weather['lat' ] = float(header[1,i])
-        i = np.where(header[0,:] == 'Longitude')[0][0]
-        weather['lon'] = float(header[1,i])
-        i = np.where(header[0,:] == 'Time Zone')[0][0]
-        weather['tz'] = float(header[1,i])
-        i = np.where(header[0,:] == 'Elevation')[0][0]
-        weather['elev'] = float(header[1,i]) 
+        header, columns = read_solar_csv(self.solar_resource_file)
+        weather['lat'] = float(header['Latitude'])
+        weather['lon'] = float(header['Longitude'])
+        weather['tz'] = float(header['Time Zone'])
+        weather['elev'] = float(header['Elevation'])
 
         # Read in weather data
         labels = {'year': ['Year'],
@@ -161,15 +158,12 @@ class Clustering:
                 'tdry': ['Tdry', 'Temperature'],
                 'wspd': ['Wspd', 'Wind Speed']}
 
-        header = np.genfromtxt(self.solar_resource_file, dtype=str, delimiter=',', max_rows=1, skip_header=2)
-        data = np.genfromtxt(self.solar_resource_file, dtype=float, delimiter=',', skip_header=3)
         for k in labels.keys():
             found = False
             for j in labels[k]:
-                if j in header:
+                if j in columns:
                     found = True
-                    c = header.tolist().index(j)
-                    weather[k] = data[:, c]
+                    weather[k] = np.array(columns[j])
             if not found:
                 print('Failed to find data for ' + k + ' in weather file')
 
@@ -292,7 +286,7 @@ class Clustering:
 
         #--- Read in price data
         hourly_data['price'] = np.ones(n_pts)
-        if self.price is None or self.price == {}:
+        if self.price is None or len(self.price) == 0:
             if self.weights['price'] > 0 or self.weights['price_prev'] > 0 or self.weights['price_next'] > 0:
                 print('Warning: Electricity price array was not provided. ' +
                     'Classification metrics will be calculated with a uniform price multiplier.')
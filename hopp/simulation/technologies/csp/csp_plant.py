@@ -14,14 +14,36 @@ from hopp.simulation.base import BaseClass
 from hopp.simulation.technologies.dispatch.power_sources.csp_dispatch import CspDispatch
 from hopp.simulation.technologies.power_source import PowerSource
 from hopp.simulation.technologies.sites import SiteInfo
+from hopp.simulation.technologies.resource.solar_csv import read_solar_csv
 from hopp.simulation.technologies.financial import FinancialModelType, CustomFinancialModel
 from hopp.utilities.validators import contains, gt_zero
 from hopp.utilities.log import hybrid_logger as logger
 
 
+# SSC time series read by CspPlant (generation, capacity credit, clustering state estimates), always stored
+REQUIRED_SSC_TIME_SERIES = ('gen', 'P_out_net', 'P_cycle', 'q_dot_pc_startup', 'q_pc_startup', 'e_ch_tes', 'eta',
+                            'q_pb')
+
+
+def with_required_time_series(names: Optional[List[str]]) -> Optional[List[str]]:
+    """Adds REQUIRED_SSC_TIME_SERIES to a list of SSC time series outputs, None (all outputs) is unchanged"""
+    if names is None:
+        return None
+    return list(dict.fromkeys([*names, *REQUIRED_SSC_TIME_SERIES]))
+
+
 class CspOutputs:
-    """Object for storing CSP outputs from SSC (SAM's Simulation Core) and dispatch optimization."""
-    def __init__(self):
+    """
+    Object for storing CSP outputs from SSC (SAM's Simulation Core) and dispatch optimization.
+
+    Args:
+        time_series_names: (optional) Names of the SSC time series outputs to store, o.w. all annual-length outputs
+            of the first stored simulation are stored
+        n_dispatch_periods: Number of dispatch periods in a year, of which the dispatch outputs are stored
+    """
+    def __init__(self, time_series_names: Optional[List[str]] = None, n_dispatch_periods: int = 8760):
+        self.time_series_names = None if time_series_names is None else list(time_series_names)
+        self.n_dispatch_periods = n_dispatch_periods
         self.ssc_time_series = {}
         self.dispatch = {}
 
@@ -29,6 +51,9 @@ class CspOutputs:
         """
         Updates stored outputs based on SSC's output dictionary.
 
+        The stored time series are annual numpy arrays, allocated on the first update, of which only the simulated
+        window is updated.
+
         Args:
             ssc_outputs: SSC's output dictionary containing the previous simulation results
             skip_hr_start: (optional) Hours to skip at beginning of simulated array
@@ -48,12 +73,14 @@ class CspOutputs:
         n -= (s1+s2)  
 
         if is_empty:
-            for name, val in ssc_outputs.items():
-                if isinstance(val, list) and len(val) == ntot:  
-                    self.ssc_time_series[name] = [0.0]*ntot
+            names = ssc_outputs.keys() if self.time_series_names is None else self.time_series_names
+            for name in names:
+                val = ssc_outputs.get(name)
+                if isinstance(val, (list, tuple, np.ndarray)) and len(val) == ntot:
+                    self.ssc_time_series[name] = np.zeros(ntot)
         
-        for name in self.ssc_time_series.keys():
-            self.ssc_time_series[name][i:i+n] = ssc_outputs[name][s1:s1+n]
+        for name, series in self.ssc_time_series.items():
+            series[i:i+n] = ssc_outputs[name][s1:s1+n]
 
     def store_dispatch_outputs(self, dispatch: CspDispatch, n_periods: int, sim_start_time: int):
         """
@@ -62,7 +89,7 @@ class CspOutputs:
         Args:
             dispatch: CSP dispatch objective with attributes to store
             n_periods: Number of periods to store dispatch outputs
-            sim_start_time: The first simulation hour of the dispatch horizon
+            sim_start_time: The first simulation period of the dispatch horizon
         """
         outputs_keys = ['available_thermal_generation', 'cycle_ambient_efficiency_correction', 'condenser_losses',
                         'thermal_energy_storage', 'receiver_startup_inventory', 'receiver_thermal_power',
@@ -73,7 +100,7 @@ class CspOutputs:
         is_empty = (len(self.dispatch) == 0)
         if is_empty:
             for key in outputs_keys:
-                self.dispatch[key] = [0.0] * 8760
+                self.dispatch[key] = [0.0] * self.n_dispatch_periods
 
         for key in outputs_keys:
             self.dispatch[key][sim_start_time: sim_start_time + n_periods] = getattr(dispatch, key)[0: n_periods]
@@ -90,6 +117,14 @@ class CspConfig(BaseClass):
         tes_hours: Full load hours of thermal energy storage [hrs]
         fin_model: Financial model for the specific technology
         name: Configured name for this plant
+        ssc_time_series_outputs: (optional) Names of the SSC time series outputs stored in the plant's outputs,
+            o.w. all annual time series are stored. SSC outputs that are not stored are not converted from SSC
+            during simulations with dispatch. REQUIRED_SSC_TIME_SERIES, which HOPP reads, are always included
+        time_steps_per_hour: (optional) SSC simulation time steps per hour, o.w. that of the site's resource data.
+            Dispatch is optimized at the site's resolution and SSC tracks the dispatch targets at this resolution, so
+            it must be a multiple of the site's time steps per hour. Site time steps are not aggregated into longer
+            dispatch periods, so hourly dispatch with sub-hourly tracking requires hourly site data. Weather data is
+            held constant within its time steps when they are longer than the simulation time steps
     """
     tech_name: str = field(validator=contains(["tcsmolten_salt", "trough_physical"]))
     cycle_capacity_kw: float = field(validator=gt_zero)
@@ -97,6 +132,8 @@ class CspConfig(BaseClass):
     tes_hours: float = field(validator=gt_zero)
     fin_model: Optional[Union[dict, FinancialModelType]] = field(default=None)
     name: str = field(default="TowerPlant")
+    ssc_time_series_outputs: Optional[List[str]] = field(default=None, converter=with_required_time_series)
+    time_steps_per_hour: Optional[int] = field(default=None)
 
 
 @define
@@ -141,6 +178,7 @@ class CspPlant(PowerSource):
         self.initialize_params()
 
         self.year_weather_df = self.tmy3_to_df()  # read entire weather file
+        self.year_weather_df = self.resample_weather(self.year_weather_df, self.ssc.get('time_steps_per_hour'))
 
         # set from config
         self.cycle_capacity_kw = self.config.cycle_capacity_kw
@@ -157,7 +195,7 @@ class CspPlant(PowerSource):
         self.plant_state = self.set_initial_plant_state()
         self.update_ssc_inputs_from_plant_state()
 
-        self.outputs = CspOutputs()
+        self.outputs = CspOutputs(self.config.ssc_time_series_outputs, self.site.n_timesteps)
 
     def param_file_paths(self, relative_path: str):
         """
@@ -177,12 +215,23 @@ class CspPlant(PowerSource):
         Initializes SSC parameters using default values stored in files.
         """
         self.set_params_from_files()
-        self.ssc.set({'time_steps_per_hour': 1}) 
+        time_steps_per_hour = self.config.time_steps_per_hour
+        if time_steps_per_hour is None:
+            time_steps_per_hour = self.dispatch_time_steps_per_hour
+        elif time_steps_per_hour % self.dispatch_time_steps_per_hour != 0:
+            raise ValueError('CSP time_steps_per_hour ({x}) must be a multiple of the site\'s time steps per hour '
+                             '({y})'.format(x=time_steps_per_hour, y=self.dispatch_time_steps_per_hour))
+        self.ssc.set({'time_steps_per_hour': time_steps_per_hour})
         n_steps_year = int(8760 * self.ssc.get('time_steps_per_hour'))
         self.ssc.set({'sf_adjust:hourly': n_steps_year * [0]})
 
-        if len(self.site.elec_prices.data) == n_steps_year: 
-            self.ssc.set({'ppa_multiplier_model': 1, 'dispatch_factors_ts': self.site.elec_prices.data})
+        prices = self.site.elec_prices.data
+        if len(prices) == n_steps_year: 
+            self.ssc.set({'ppa_multiplier_model': 1, 'dispatch_factors_ts': prices})
+        elif len(prices) > 0 and n_steps_year % len(prices) == 0:
+            # prices are held constant within their time steps
+            self.ssc.set({'ppa_multiplier_model': 1,
+                          'dispatch_factors_ts': np.repeat(prices, n_steps_year // len(prices)).tolist()})
         else:
             raise ValueError('Electricity prices have not been set correctly in SiteInfo.')
 
@@ -196,28 +245,47 @@ class CspPlant(PowerSource):
         Returns:
             Weather file data (DataFrame)
         """
-        df = pd.read_csv(self.site.solar_resource.filename, sep=',', skiprows=2, header=0)
+        header, columns = read_solar_csv(self.site.solar_resource.filename)
         date_cols = ['Year', 'Month', 'Day', 'Hour', 'Minute']
-        df.index = pd.to_datetime(df[date_cols])
+        df = pd.DataFrame({k: v for k, v in columns.items() if k not in date_cols})
+        df.index = pd.to_datetime(pd.DataFrame({k: columns[k].astype(int) for k in date_cols}))
         df.index.name = 'datetime'
-        df.drop(date_cols, axis=1, inplace=True)
 
         df.index = df.index.map(lambda t: t.replace(year=df.index[0].year))  # normalize all years to that of 1/1
-        df = df[df.columns.drop(list(df.filter(regex='Unnamed')))]  # drop unnamed columns (which are empty)
-
-        def get_weatherfile_location(tmy3_path):
-            df_meta = pd.read_csv(tmy3_path, sep=',', header=0, nrows=1)
-            return {
-                'latitude': float(df_meta['Latitude'][0]),
-                'longitude': float(df_meta['Longitude'][0]),
-                'timezone': int(df_meta['Time Zone'][0]),
-                'elevation': float(df_meta['Elevation'][0])
-            }
 
-        location = get_weatherfile_location(self.site.solar_resource.filename)
-        df.attrs.update(location)
+        df.attrs.update({
+            'latitude': float(header['Latitude']),
+            'longitude': float(header['Longitude']),
+            'timezone': int(header['Time Zone']),
+            'elevation': float(header['Elevation'])
+        })
         return df
 
+    @staticmethod
+    def resample_weather(weather_df: pd.DataFrame, time_steps_per_hour: int) -> pd.DataFrame:
+        """
+        Resamples weather data to a finer resolution by holding values constant within each of its time steps
+
+        Args:
+            weather_df: weather information
+            time_steps_per_hour: time steps per hour of the resampled data, a multiple of that of the weather data
+
+        Returns:
+            Weather data with time_steps_per_hour, or weather_df if it already has that resolution
+        """
+        weather_timedelta = weather_df.index[1] - weather_df.index[0]
+        n_repeat = int(time_steps_per_hour * weather_timedelta.total_seconds() / 3600)
+        if n_repeat <= 1:
+            return weather_df
+
+        step = weather_timedelta / n_repeat
+        index = np.repeat(weather_df.index, n_repeat) + pd.to_timedelta(np.tile(np.arange(n_repeat), len(weather_df))
+                                                                           * step)
+        resampled = pd.DataFrame(np.repeat(weather_df.values, n_repeat, axis=0), columns=weather_df.columns,
+                                 index=pd.DatetimeIndex(index, name=weather_df.index.name))
+        resampled.attrs.update(weather_df.attrs)
+        return resampled
+
     def set_params_from_files(self):
         """
         Loads default case parameters from files
@@ -438,11 +506,11 @@ class CspPlant(PowerSource):
         time_steps_per_hour = self.ssc.get('time_steps_per_hour')
         time_start = self.ssc.get('time_start')
         # Note: values returned in ssc_outputs are at the front of the output arrays
-        idx = round(seconds_relative_to_start/3600) * int(time_steps_per_hour) - 1
+        idx = round(seconds_relative_to_start * time_steps_per_hour / 3600) - 1
         io_map = self.get_plant_state_io_map()
         for ssc_input, output in io_map.items():
             if ssc_input == 'T_out_scas_initial':
-                self.plant_state[ssc_input] = ssc_outputs[output]
+                self.plant_state[ssc_input] = list(ssc_outputs[output])
             else:
                 self.plant_state[ssc_input] = ssc_outputs[output][idx]
         # Track time at which plant state was last updated
@@ -545,20 +613,22 @@ class CspPlant(PowerSource):
         Simulate CSP system using dispatch solution as targets
 
         Args:
-            n_periods: Number of hours to simulate [hrs]
-            sim_start_time: Start hour of simulation horizon
+            n_periods: Number of dispatch periods to simulate
+            sim_start_time: Start period of simulation horizon
             store_outputs: When *True* SSC and dispatch results are stored in CspOutputs,
                                 o.w. they are not stored
         """
         # Set up start and end time of simulation
-        start_datetime, end_datetime = CspDispatch.get_start_end_datetime(sim_start_time, n_periods)
+        hours_per_period = 1 / self.dispatch_time_steps_per_hour
+        start_datetime, end_datetime = CspDispatch.get_start_end_datetime(sim_start_time * hours_per_period,
+                                                                          n_periods * hours_per_period)
         self.value('time_start', CspDispatch.seconds_since_newyear(start_datetime))
         self.value('time_stop', CspDispatch.seconds_since_newyear(end_datetime))
 
         self.set_dispatch_targets(n_periods)
         self.update_ssc_inputs_from_plant_state()
 
-        results = self.simulate_power()
+        results = self.simulate_power(self.get_dispatch_simulation_outputs(store_outputs))
 
         # Save plant state at end of simulation
         simulation_time = int((end_datetime - start_datetime).total_seconds())
@@ -569,16 +639,39 @@ class CspPlant(PowerSource):
             self.outputs.update_from_ssc_output(results)
             self.outputs.store_dispatch_outputs(self.dispatch, n_periods, sim_start_time)
 
-    def simulate_power(self) -> dict:
+    def get_dispatch_simulation_outputs(self, store_outputs: bool = True) -> Optional[set]:
+        """
+        Names of the SSC outputs used from simulations with dispatch, so that other outputs are not converted.
+
+        Args:
+            store_outputs: Whether the outputs are stored in CspOutputs
+
+        Returns:
+            set of output names, or None for all outputs while the stored time series are not yet known
+        """
+        stored_names = self.outputs.ssc_time_series.keys()
+        if self.outputs.time_series_names is not None:
+            stored_names = self.outputs.time_series_names
+        elif store_outputs and not stored_names:
+            return None
+        names = set(self.get_plant_state_io_map().values()) | {'time_steps_per_hour', 'time_start', 'time_stop'}
+        if store_outputs:
+            names.update(stored_names)
+        return names
+
+    def simulate_power(self, outputs: Optional[set] = None) -> dict:
         """
         Runs CSP system model simulate
 
-        :returns: SSC results dictionary
+        Args:
+            outputs: (optional) Names of the SSC outputs to return, all outputs if None
+
+        :returns: SSC results dictionary, with arrays as numpy arrays
         """
         if not self.ssc:
             raise ValueError('SSC was not correctly setup...')
 
-        results = self.ssc.execute()
+        results = self.ssc.execute(outputs, numpy_arrays=True)
         if not results["cmod_success"]:
             raise ValueError('PySSC simulation failed...')
 
@@ -587,7 +680,9 @@ class CspPlant(PowerSource):
     def set_dispatch_targets(self, n_periods: int):
         """Set PySSC targets using dispatch model solution.
 
-        :param n_periods: Number of hours to simulate [hrs]
+        The target of each dispatch period is held for each SSC time step within the period.
+
+        :param n_periods: Number of dispatch periods to simulate
         """
         # Set targets
         dis = self.dispatch
@@ -614,6 +709,12 @@ class CspPlant(PowerSource):
                   zip(dis.cycle_thermal_power[0:n_periods], dispatch_targets['q_pc_target_su_in'])]
         dispatch_targets['q_pc_max_in'] = pc_max
 
+        n_steps = self.ssc_time_steps_per_dispatch_period
+        if n_steps > 1:
+            for k, targets in dispatch_targets.items():
+                if isinstance(targets, list):
+                    dispatch_targets[k] = np.repeat(targets, n_steps).tolist()
+
         self.ssc.set(dispatch_targets)
 
     def get_design_storage_mass(self) -> float:
@@ -758,10 +859,14 @@ class CspPlant(PowerSource):
         SIGMA = 1e-6
 
         # Verify power block startup does not span timesteps
-        t_step = self.value("time_steps_per_hour")                            # [hr]
+        t_step = 1 / self.value("time_steps_per_hour")                        # [hr]
         if self.value("startup_time") > t_step:
-            raise NotImplementedError("Capacity credit calculations have not been implemented \
-                                      for power block startup times greater than one timestep.")
+            if t_step >= 1:
+                raise NotImplementedError("Capacity credit calculations have not been implemented \
+                                          for power block startup times greater than one timestep.")
+            logger.warning("Power block startup spans sub-hourly timesteps, so the capacity credit of {} is based "
+                           "on its generation only.".format(type(self).__name__))
+            cap_cred_avail_storage = False
 
         df = pd.DataFrame()
         df['Q_pb_startup'] = [x * 1e3 for x in self.outputs.ssc_time_series["q_dot_pc_startup"]]    # [kWt]
@@ -873,6 +978,9 @@ class CspPlant(PowerSource):
         W_ac_nom = self.calc_nominal_capacity(interconnect_kw)
         E_pb_max_feasible = np.minimum(E_pb_max_feasible, W_ac_nom*t_step)  # Limit to nominal capacity here, to avoid discrepancies between single-technology and hybrid capacity credits
 
+        n_steps = self.ssc_time_steps_per_dispatch_period
+        if n_steps > 1:     # energy of each site time step
+            E_pb_max_feasible = np.asarray(E_pb_max_feasible).reshape(-1, n_steps).sum(axis=1)
         return list(E_pb_max_feasible)
 
     def value(self, var_name, var_value=None):
@@ -942,6 +1050,32 @@ class CspPlant(PowerSource):
     def _system_model(self, value):
         pass
 
+    @property
+    def dispatch_time_steps_per_hour(self) -> int:
+        """Dispatch periods per hour, those of the site's resource data [-]"""
+        return self.site.n_timesteps // 8760
+
+    @property
+    def ssc_time_steps_per_dispatch_period(self) -> int:
+        """SSC simulation time steps per dispatch period [-]"""
+        return int(self.ssc.get('time_steps_per_hour')) // self.dispatch_time_steps_per_hour
+
+    def to_dispatch_resolution(self, values) -> np.ndarray:
+        """
+        Averages SSC time series over each dispatch period
+
+        Args:
+            values: time series with a value per SSC time step
+
+        Returns:
+            time series with a value per dispatch period
+        """
+        values = np.asarray(values, dtype=float)
+        n_steps = self.ssc_time_steps_per_dispatch_period
+        if n_steps > 1:
+            values = values.reshape(-1, n_steps).mean(axis=1)
+        return values
+
     @property
     def system_capacity_kw(self) -> float:
         """Gross power cycle design rating [kWe]"""
@@ -1035,13 +1169,16 @@ class CspPlant(PowerSource):
     @property
     def annual_energy_kwh(self) -> float:
         if self.system_capacity_kw > 0:
-            return sum(list(self.outputs.ssc_time_series['gen']))
+            return sum(list(self.outputs.ssc_time_series['gen'])) / self.ssc.get('time_steps_per_hour')
         else:
             return 0
 
     @property
     def generation_profile(self) -> list:
+        """Generation of each site time step [kW]"""
         if self.system_capacity_kw:
+            if self.ssc_time_steps_per_dispatch_period > 1:
+                return self.to_dispatch_resolution(self.outputs.ssc_time_series['gen']).tolist()
             return list(self.outputs.ssc_time_series['gen'])
         else:
             return [0] * self.site.n_timesteps
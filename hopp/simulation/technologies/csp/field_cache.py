@@ -0,0 +1,180 @@
+"""
+Cache of the heliostat fields and flux maps generated by SolarPILOT for `TowerPlant`, so that design sweeps and
+optimizations reuse the field of every candidate with the same field design rather than regenerating it.
+
+Fields are keyed on a digest of the SSC inputs they depend on and can be persisted to a directory of json files, one
+per field, to be reused across runs. Fields can also be generated in a separate process, which contains the memory
+that SolarPILOT's optimization does not release.
+"""
+import hashlib
+import json
+import multiprocessing as mp
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from hopp.simulation.technologies.csp.pySSC_daotk.ssc_wrap import PysscWrap
+from hopp.utilities.log import hybrid_logger as logger
+
+
+# SSC inputs of the MSPT model that the field layout, tower and receiver design and flux maps depend on
+FIELD_DESIGN_INPUTS = (
+    # site and weather
+    'solar_resource_data', 'dni_des',
+    # heliostats
+    'helio_width', 'helio_height', 'helio_optical_error_mrad', 'helio_active_fraction', 'dens_mirror',
+    'helio_reflectance', 'n_facet_x', 'n_facet_y', 'focus_type', 'cant_type', 'p_start', 'p_track',
+    'hel_stow_deploy', 'v_wind_max', 'water_usage_per_wash', 'washing_frequency', 'c_atm_0', 'c_atm_1', 'c_atm_2',
+    'c_atm_3',
+    # land
+    'land_max', 'land_min', 'csp.pt.sf.fixed_land_area', 'csp.pt.sf.land_overhead_factor',
+    # receiver and tower
+    'rec_height', 'D_rec', 'h_tower', 'N_panels', 'rec_absorptance', 'rec_hl_perm2', 'flux_max', 'check_max_flux',
+    # design point thermal rating
+    'P_ref', 'design_eff', 'gross_net_conversion_factor', 'solarm', 'sf_excess',
+    # flux maps
+    'n_flux_days', 'delta_flux_hrs',
+    # field and tower optimization
+    'field_model_type', 'opt_algorithm', 'opt_conv_tol', 'opt_flux_penalty', 'opt_init_step', 'opt_max_iter',
+    'tower_fixed_cost', 'tower_exp', 'rec_ref_cost', 'rec_ref_area', 'rec_cost_exp', 'heliostat_spec_cost',
+    'site_spec_cost', 'land_spec_cost', 'cost_sf_fixed', 'plant_spec_cost', 'bop_spec_cost', 'tes_spec_cost',
+    'fossil_spec_cost', 'contingency_rate', 'sales_tax_rate', 'sales_tax_frac', 'tshours',
+    'csp.pt.cost.epc.per_acre', 'csp.pt.cost.epc.percent', 'csp.pt.cost.epc.per_watt', 'csp.pt.cost.epc.fixed',
+    'csp.pt.cost.plm.percent', 'csp.pt.cost.plm.per_watt', 'csp.pt.cost.plm.fixed',
+)
+
+# SSC outputs of a field generation that make up the field and flux maps
+FIELD_OUTPUTS = ('eta_map_out', 'flux_maps_for_import', 'A_sf', 'helio_positions', 'N_hel', 'D_rec', 'rec_height',
+                 'h_tower', 'land_area_base')
+
+
+def _to_json(value):
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def field_design_inputs(params: dict) -> dict:
+    """Values of the FIELD_DESIGN_INPUTS within SSC parameters, inputs that are not set are omitted"""
+    return {k: params[k] for k in FIELD_DESIGN_INPUTS if k in params}
+
+
+def field_key(params: dict) -> str:
+    """Content address of the field generated from SSC parameters"""
+    encoded = json.dumps(field_design_inputs(params), sort_keys=True, default=_to_json).encode()
+    return hashlib.sha256(encoded).hexdigest()[:24]
+
+
+def field_and_flux_maps_from_outputs(tech_outputs: dict) -> dict:
+    """
+    Field and flux maps, as set in the SSC inputs of the model, from the outputs of a field generation
+
+    Args:
+        tech_outputs: SSC outputs including FIELD_OUTPUTS
+    """
+    field_and_flux_maps = {
+        'eta_map': tech_outputs['eta_map_out'],
+        'flux_maps': [r[2:] for r in tech_outputs['flux_maps_for_import']],  # don't include first two columns
+        'A_sf_in': tech_outputs['A_sf']
+    }
+    for k in ['helio_positions', 'N_hel', 'D_rec', 'rec_height', 'h_tower', 'land_area_base']:
+        field_and_flux_maps[k] = tech_outputs[k]
+    return field_and_flux_maps
+
+
+def generate_field(tech_name: str, params: dict) -> dict:
+    """
+    Runs SSC with a new data container to generate the field and flux maps of SSC parameters
+
+    Args:
+        tech_name: SSC technology model name
+        params: SSC parameters, set up for a field generation
+
+    Returns:
+        SSC outputs of the field generation, FIELD_OUTPUTS only
+    """
+    ssc = PysscWrap(tech_name, None, defaults=params)
+    tech_outputs = ssc.execute(outputs=FIELD_OUTPUTS)
+    if not tech_outputs['cmod_success']:
+        raise RuntimeError("SSC failed to generate the heliostat field")
+    return {k: tech_outputs[k] for k in FIELD_OUTPUTS}
+
+
+def generate_field_in_subprocess(tech_name: str, params: dict) -> dict:
+    """
+    Runs `generate_field` in a new process, so memory that is not released by SolarPILOT is freed when the process
+    exits
+
+    Args:
+        tech_name: SSC technology model name
+        params: SSC parameters, set up for a field generation
+
+    Returns:
+        SSC outputs of the field generation, FIELD_OUTPUTS only
+    """
+    with mp.Pool(processes=1) as pool:
+        return pool.apply(generate_field, (tech_name, params))
+
+
+class FieldCache:
+    """
+    Heliostat fields and flux maps keyed on the content address of their field design inputs, see `field_key`
+
+    Args:
+        cache_dir: directory of persisted fields, created when a field is saved. None to keep fields in memory only
+    """
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        self.cache_dir = None if cache_dir is None else Path(cache_dir)
+        self.fields: Dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key: str) -> Path:
+        return self.cache_dir / f"field_{key}.json"
+
+    def load(self, key: str) -> Optional[dict]:
+        """Field and flux maps of a key, or None if the field is not in the cache"""
+        if key not in self.fields and self.cache_dir is not None and self.path(key).exists():
+            with open(self.path(key)) as f:
+                self.fields[key] = json.load(f)
+        if key in self.fields:
+            self.hits += 1
+            return json.loads(json.dumps(self.fields[key]))
+        self.misses += 1
+        return None
+
+    def save(self, key: str, field_and_flux_maps: dict):
+        """Adds a field to the cache, replacing any field of the same key"""
+        self.fields[key] = json.loads(json.dumps(field_and_flux_maps, default=_to_json))
+        if self.cache_dir is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.fields[key], f)
+        os.replace(tmp_path, path)
+        logger.info("Saved heliostat field {} to {}".format(key, path))
+
+    def clear(self, disk: bool = False):
+        """
+        Clears the fields held in memory and the hit and miss counts.
+
+        Args:
+            disk: also delete the persisted fields
+        """
+        self.fields.clear()
+        self.hits = 0
+        self.misses = 0
+        if disk and self.cache_dir is not None:
+            for path in self.cache_dir.glob("field_*.json"):
+                path.unlink()
+
+
+@lru_cache(maxsize=None)
+def get_field_cache(cache_dir: Optional[str] = None) -> FieldCache:
+    """FieldCache of a directory, shared by the plants of a process"""
+    return FieldCache(cache_dir)
@@ -5,6 +5,7 @@ c_number = c_double  # must be c_double or c_float depending on how defined in s
 import abc
 import importlib
 import copy
+import numpy as np
 
 PYSAM_MODULE_NAME = 'PySAM_DAOTk'
 # PYSAM_MODULE_NAME = 'PySAM'
@@ -41,7 +42,7 @@ class SscWrap(metaclass=abc.ABCMeta):
         return
 
     @abc.abstractmethod
-    def execute(self):
+    def execute(self, outputs=None, numpy_arrays=False):
         return
 
     @abc.abstractmethod
@@ -50,6 +51,12 @@ class SscWrap(metaclass=abc.ABCMeta):
 
 
 class PysscWrap(SscWrap):
+    """PySSC wrapper that keeps an SSC data container of the parameters between executions
+
+    Parameters are marshaled into the data container when they are first executed and afterwards only when they are
+    set to a new value, so large static inputs (e.g., weather data, flux maps) are not converted again on every
+    execution. Parameters must be changed through set(), changes made in place to a value are not tracked.
+    """
     def __init__(self, tech_name, financial_name, defaults=None):
         self.ssc = PySSC()
         self.wrapper = 'pyssc'
@@ -63,23 +70,86 @@ class PysscWrap(SscWrap):
             self.params = {}
         self.params['tech_model'] = self.tech_name
         self.params['financial_model'] = self.financial_name
-	
+        self._data = None           # persistent ssc data container
+        self._dirty = set()         # parameters set since they were last marshaled into the data container
+
     def set(self, param_dict):
         if 'is_elec_heat_dur_off' in param_dict and type(param_dict['is_elec_heat_dur_off']) == list:
             param_dict['is_elec_heat_dur_off'] = param_dict['is_elec_heat_dur_off'][0]
 
+        for key, value in param_dict.items():
+            if key not in self.params or is_changed(self.params[key], value):
+                self._dirty.add(key)
         self.params.update(param_dict)
 
     def get(self, name):
         return self.params[name]
 
-    def execute(self):
-        results = ssc_sim_from_dict(self.ssc, self.params)
+    def execute(self, outputs=None, numpy_arrays=False):
+        """Runs the technology and financial models
+
+        Args:
+            outputs: names of the variables to return, or None to return all variables of the models
+            numpy_arrays: return arrays as numpy arrays, which are copied from ssc without creating a python float
+                for each value, rather than lists
+
+        Returns:
+            dict of variables, with 'cmod_success' set to 1 if all models ran successfully and 0 otherwise
+        """
+        module_names = [self.tech_name]
+        if self.financial_name not in [None, "none"]:
+            module_names.append(self.financial_name)
+        var_info = [info for name in module_names for info in ssc_module_var_info(self.ssc, name)]
+
+        if self._data is None:
+            self._data = self.ssc.data_create()
+            self._dirty = set(self.params.keys())
+        for name, var_type, data_type in var_info:
+            if name in self._dirty and var_type in (PySSC.INPUT, PySSC.INOUT):
+                # unassign first, so that empty values, which are not set, do not leave previous values in place
+                self.ssc.data_unassign(self._data, name.encode("ascii"))
+                set_ssc_var(data_type, self.ssc, self._data, name, self.params[name])
+        self._dirty = set()
+
+        names = None if outputs is None else set(outputs)
+        results = {}
+        success = True
+        for module_name in module_names:
+            success = ssc_cmod_exec(self.ssc, self._data, module_name)
+            results.update(ssc_data_to_dict(self.ssc, self._data, ssc_module_var_info(self.ssc, module_name), names,
+                                            numpy_arrays))
+            if not success:
+                break
+        results["tech_model"] = self.tech_name
+        results["financial_model"] = self.financial_name
+        results["cmod_success"] = int(success)
+
+        # restore the data container to the parameters alone, as the models may have assigned or changed variables
+        for name, var_type, _ in var_info:
+            if var_type in (PySSC.OUTPUT, PySSC.INOUT):
+                self.ssc.data_unassign(self._data, name.encode("ascii"))
+                if name in self.params:
+                    self._dirty.add(name)
         return results
 
     def export_params(self):
         return copy.deepcopy(self.params)
 
+    def __getstate__(self):
+        # the data container is not copied, copies marshal all parameters on their first execution
+        state = self.__dict__.copy()
+        state['_data'] = None
+        state['_dirty'] = set()
+        return state
+
+    def __del__(self):
+        if getattr(self, '_data', None) is not None:
+            try:
+                self.ssc.data_free(self._data)
+            except Exception:       # the ssc library may already be unloaded at exit
+                pass
+            self._data = None
+
     def create_lk_inputs_file(self, filename: str, weather_file):
         file = open(filename, "w")
         file.write("clear();\n")
@@ -185,12 +255,16 @@ class PysamWrap(SscWrap):
         except Exception as err:
             raise(err)
 
-    def execute(self):
+    def execute(self, outputs=None, numpy_arrays=False):
         self.tech_model.execute(1)
         results = self.tech_model.Outputs.export()
         if self.financial_name is not None:
             self.financial_model.execute(1)
             results.update(self.financial_model.Outputs.export())
+        if outputs is not None:
+            results = {name: results[name] for name in outputs if name in results}
+        if numpy_arrays:
+            results = {name: np.array(val) if isinstance(val, tuple) else val for name, val in results.items()}
         return results
 
     def export_params(self):
@@ -372,6 +446,87 @@ def set_ssc_var(ssc_input_data_type, ssc, dat, ssc_input_data_name, value):
             ssc.data_free(table)
 
 
+# Module variable info does not change within a process, so it is read from ssc once per module
+_module_var_info = {}
+
+
+def ssc_module_var_info(ssc, cmod_name):
+    """Returns list of (name, variable type, data type) of the variables of a compute module"""
+    if cmod_name not in _module_var_info:
+        cmod = ssc.module_create(cmod_name.encode("utf-8"))
+        var_info = []
+        i = 0
+        while (True):
+            p_ssc_entry = ssc.module_var_info(cmod, i)
+            data_type = ssc.info_data_type(p_ssc_entry)
+            # 1 = String, 2 = Number, 3 = Array, 4 = Matrix, 5 = Table
+            if (data_type <= 0 or data_type > 5):
+                break
+            var_info.append((str(ssc.info_name(p_ssc_entry).decode("ascii")), ssc.info_var_type(p_ssc_entry), data_type))
+            i = i + 1
+        ssc.module_free(cmod)
+        _module_var_info[cmod_name] = var_info
+    return _module_var_info[cmod_name]
+
+
+def ssc_cmod_exec(ssc, dat, name):
+    """Runs a compute module on a data container, printing the module log on failure. Returns True if successful"""
+    cmod = ssc.module_create(name.encode("utf-8"))
+    ssc.module_exec_set_print(0)
+
+    success = ssc.module_exec(cmod, dat) != 0
+    if not success:
+        print(name + ' simulation error')
+        idx = 1
+        msg = ssc.module_log(cmod, 0)
+        while msg is not None:
+            print(' : ' + msg.decode("utf - 8"))
+            msg = ssc.module_log(cmod, idx)
+            idx = idx + 1
+    ssc.module_free(cmod)
+    return success
+
+
+def ssc_data_to_dict(ssc, dat, var_info, names=None, numpy_arrays=False):
+    """Returns python dictionary of the variables assigned in a data container, without freeing the container
+
+    Args:
+        var_info: list of (name, variable type, data type) of the variables, see ssc_module_var_info
+        names: names of the variables to convert, or None to convert all variables
+        numpy_arrays: convert arrays to numpy arrays rather than lists
+    """
+    ssc_out = {}
+    for name, _, data_type in var_info:
+        if names is not None and name not in names:
+            continue
+        key = name.encode("ascii")
+        if ssc.data_query(dat, key) > 0:
+            if (data_type == 1):
+                ssc_out[name] = ssc.data_get_string(dat, key).decode("ascii")
+            elif (data_type == 2):
+                ssc_out[name] = ssc.data_get_number(dat, key)
+            elif (data_type == 3):
+                if numpy_arrays:
+                    ssc_out[name] = ssc.data_get_numpy_array(dat, key)
+                else:
+                    ssc_out[name] = ssc.data_get_array(dat, key)
+            elif (data_type == 4):
+                ssc_out[name] = ssc.data_get_matrix(dat, key)
+            elif (data_type == 5):
+                ssc_out[name] = ssc.data_get_table(dat, key)
+    return ssc_out
+
+
+def is_changed(old, new):
+    """Whether a parameter value differs from its previous value, treating the same mutable object as changed"""
+    if old is new:
+        return not isinstance(new, (str, int, float, bool, type(None)))
+    try:
+        return bool(old != new)
+    except ValueError:      # e.g., numpy arrays
+        return True
+
+
 # Returns SSC data type of Python data type
 def ssc_data_type(v):
     if type(v) is str:
@@ -502,11 +657,7 @@ class PySSC:
         ncols = len(mat[0])
         size = nrows * ncols
         arr = (c_number * size)()
-        idx = 0
-        for r in range(nrows):
-            for c in range(ncols):
-                arr[idx] = c_number(mat[r][c])
-                idx = idx + 1
+        arr[:] = [float(x) for row in mat for x in row]  # set all at once instead of looping
         return self.pdll.ssc_data_set_matrix(c_void_p(p_data), c_char_p(name), pointer(arr), c_int(nrows), c_int(ncols))
 
     def data_set_matrix_from_csv(self, p_data, name, fn):
@@ -537,20 +688,21 @@ class PySSC:
         arr = parr[0:count.value]  # extract all at once
         return arr
 
+    def data_get_numpy_array(self, p_data, name):
+        count = c_int()
+        self.pdll.ssc_data_get_array.restype = POINTER(c_number)
+        parr = self.pdll.ssc_data_get_array(c_void_p(p_data), c_char_p(name), byref(count))
+        if count.value == 0:
+            return np.zeros(0)
+        return np.ctypeslib.as_array(parr, shape=(count.value,)).copy()  # copy, the array is owned by ssc
+
     def data_get_matrix(self, p_data, name):
         nrows = c_int()
         ncols = c_int()
         self.pdll.ssc_data_get_matrix.restype = POINTER(c_number)
         parr = self.pdll.ssc_data_get_matrix(c_void_p(p_data), c_char_p(name), byref(nrows), byref(ncols))
-        idx = 0
-        mat = []
-        for r in range(nrows.value):
-            row = []
-            for c in range(ncols.value):
-                row.append(float(parr[idx]))
-                idx = idx + 1
-            mat.append(row)
-        return mat
+        arr = parr[0:nrows.value * ncols.value]  # extract all at once
+        return [arr[r * ncols.value:(r + 1) * ncols.value] for r in range(nrows.value)]
 
     # don't call data_free() on the result, it's an internal
     # pointer inside SSC
@@ -1,12 +1,14 @@
 import os
 import numpy as np
 from math import pi, log, sin
+from typing import Optional
 
 from attrs import define, field
 import PySAM.Singleowner as Singleowner
 
 from hopp.simulation.technologies.csp.csp_plant import CspConfig
 from hopp.simulation.technologies.csp.csp_plant import CspPlant
+from hopp.simulation.technologies.csp import field_cache
 from hopp.simulation.technologies.sites import SiteInfo
 from hopp.utilities.validators import contains
 
@@ -41,10 +43,19 @@ class TowerConfig(CspConfig):
             inputs.
         scale_input_params: If True, HOPP will run
             :py:func:`hopp.simulation.technologies.csp.tower_plant.scale_params` before system simulation.
+        field_cache: If True, heliostat fields and flux maps are reused from the field cache when the field design
+            inputs are unchanged, see :py:mod:`hopp.simulation.technologies.csp.field_cache`
+        field_cache_dir: (optional) Directory of the field cache, which persists fields across runs, o.w., fields are
+            only cached in memory
+        generate_field_in_subprocess: If True, SolarPilot runs in a separate process that exits after generating
+            the field, so memory that SolarPilot does not release is freed
     """
     tech_name: str = field(validator=contains(["tcsmolten_salt", "trough_physical"]), default="tcsmolten_salt")
     optimize_field_before_sim: bool = field(default=True)
     scale_input_params: bool = field(default=False)
+    field_cache: bool = field(default=False)
+    field_cache_dir: Optional[str] = field(default=None)
+    generate_field_in_subprocess: bool = field(default=False)
     name: str = field(default="TowerPlant")
 
 
@@ -181,18 +192,28 @@ class TowerPlant(CspPlant):
         original_values = {k: self.ssc.get(k) for k in['is_dispatch_targets', 'rec_clearsky_model', 'time_steps_per_hour', 'sf_adjust:hourly']}
         # set so unneeded dispatch targets and clearsky DNI are not required
         # TODO: probably don't need hourly sf adjustment factors
-        self.ssc.set({'is_dispatch_targets': False, 'rec_clearsky_model': 1, 'time_steps_per_hour': 1,
-                      'sf_adjust:hourly': [0.0 for j in range(8760)]})
-        tech_outputs = self.ssc.execute()
-        print('Finished creating field layout and simulating flux and eta maps. # Heliostats = %d, Tower height = %.1fm, Receiver height = %.2fm, Receiver diameter = %.2fm'%
-             (tech_outputs['N_hel'], tech_outputs['h_tower'], tech_outputs['rec_height'], tech_outputs['D_rec']))
+        # time steps are kept at those of the weather data set in solar_resource_data
+        self.ssc.set({'is_dispatch_targets': False, 'rec_clearsky_model': 1,
+                      'sf_adjust:hourly': [0.0 for j in range(8760 * int(original_values['time_steps_per_hour']))]})
+
+        cache = field_cache.get_field_cache(self.config.field_cache_dir) if self.config.field_cache else None
+        key = field_cache.field_key(self.ssc.params) if cache is not None else None
+        field_and_flux_maps = cache.load(key) if cache is not None else None
+        if field_and_flux_maps is None:
+            if self.config.generate_field_in_subprocess:
+                tech_outputs = field_cache.generate_field_in_subprocess(self.ssc.tech_name, self.ssc.export_params())
+            else:
+                tech_outputs = self.ssc.execute(outputs=field_cache.FIELD_OUTPUTS)
+            field_and_flux_maps = field_cache.field_and_flux_maps_from_outputs(tech_outputs)
+            if cache is not None:
+                cache.save(key, field_and_flux_maps)
+            print('Finished creating field layout and simulating flux and eta maps.', end=' ')
+        else:
+            print('Using cached field layout and flux and eta maps.', end=' ')
+        print('# Heliostats = %d, Tower height = %.1fm, Receiver height = %.2fm, Receiver diameter = %.2fm'%
+             (field_and_flux_maps['N_hel'], field_and_flux_maps['h_tower'], field_and_flux_maps['rec_height'],
+              field_and_flux_maps['D_rec']))
         self.ssc.set(original_values)
-        eta_map = tech_outputs["eta_map_out"]
-        flux_maps = [r[2:] for r in tech_outputs['flux_maps_for_import']]  # don't include first two columns
-        A_sf_in = tech_outputs["A_sf"]
-        field_and_flux_maps = {'eta_map': eta_map, 'flux_maps': flux_maps, 'A_sf_in': A_sf_in}
-        for k in ['helio_positions', 'N_hel', 'D_rec', 'rec_height', 'h_tower', 'land_area_base']:
-            field_and_flux_maps[k] = tech_outputs[k]
 
         # Check if specified receiver dimensions make sense relative to heliostat dimensions
         if min(field_and_flux_maps['rec_height'], field_and_flux_maps['D_rec']) < max(self.ssc.get('helio_width'), self.ssc.get('helio_height')):
@@ -217,7 +238,8 @@ class TowerPlant(CspPlant):
 
             We believe there is a memory leak when calling SolarPILOT's optimization routine. This is not problematic
             when running a single hybrid simulation. However, this can be a problem when iterating HOPP for
-            optimization.
+            optimization, in which case set ``generate_field_in_subprocess`` and ``field_cache`` in the config so
+            the leak is contained and fields are reused between iterations.
         """
         self.create_field_layout_and_simulate_flux_eta_maps(optimize_tower_field=True)
 
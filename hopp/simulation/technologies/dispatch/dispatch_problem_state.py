@@ -4,6 +4,20 @@ from pyomo.opt import TerminationCondition
 class DispatchProblemState:
     """Class for tracking dispatch problem solve state and metrics"""
 
+    _metric_names = (
+        "start_time",
+        "n_days",
+        "termination_condition",
+        "solve_time",
+        "objective",
+        "upper_bound",
+        "lower_bound",
+        "constraints",
+        "variables",
+        "non_zeros",
+        "gap",
+    )
+
     def __init__(self):
         self._start_time = ()
         self._n_days = ()
@@ -51,6 +65,24 @@ class DispatchProblemState:
         ):
             self._n_non_optimal_solves += 1
 
+    def get_problem_metrics(self, start_index: int = 0) -> dict:
+        """Returns stored metrics of the solves from start_index onwards, see `extend_problem_metrics`"""
+        metrics = {
+            name: getattr(self, name)[start_index:] for name in self._metric_names
+        }
+        metrics["n_non_optimal_solves"] = sum(
+            1
+            for condition in self.termination_condition[start_index:]
+            if condition != str(TerminationCondition.optimal)
+        )
+        return metrics
+
+    def extend_problem_metrics(self, metrics: dict):
+        """Appends metrics of solves performed elsewhere (e.g., by a worker process) to the stored metrics"""
+        for name in self._metric_names:
+            setattr(self, "_" + name, getattr(self, name) + tuple(metrics[name]))
+        self._n_non_optimal_solves += metrics["n_non_optimal_solves"]
+
     def _update_metric(self, metric_name, value):
         data = list(getattr(self, metric_name))
         data.append(value)
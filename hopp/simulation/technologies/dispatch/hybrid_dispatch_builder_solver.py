@@ -1,6 +1,9 @@
 import sys, os
 from pathlib import Path
 import time
+import multiprocessing
+
+import numpy as np
 
 import pyomo.environ as pyomo
 from pyomo.opt import TerminationCondition
@@ -14,6 +17,7 @@ from hopp.simulation.technologies.dispatch import (
 )
 from hopp.simulation.technologies.clustering import Clustering
 from hopp.utilities.log import hybrid_logger as logger
+from hopp.utilities.timing import StageTimer
 
 
 class HybridDispatchBuilderSolver:
@@ -21,7 +25,11 @@ class HybridDispatchBuilderSolver:
     with dispatch solution."""
 
     def __init__(
-        self, site: SiteInfo, power_sources: dict, dispatch_options: dict = None
+        self,
+        site: SiteInfo,
+        power_sources: dict,
+        dispatch_options: dict = None,
+        timer: StageTimer = None,
     ):
         """
 
@@ -30,9 +38,13 @@ class HybridDispatchBuilderSolver:
         dispatch_options :
             Contains attribute key, value pairs to change default dispatch options.
             For details see HybridDispatchOptions in hybrid_dispatch_options.py
+        timer :
+            Records the time spent updating and solving the dispatch problem and stepping the dispatchable
+            models. A new timer is created if not provided.
 
         """
         self.opt = None
+        self.timer = timer if timer is not None else StageTimer()
         self.site: SiteInfo = site
         self.power_sources = power_sources
         self.options = HybridDispatchOptions(dispatch_options)
@@ -146,6 +158,8 @@ class HybridDispatchBuilderSolver:
             solver_results = self.gurobi_ampl_solve()
         elif self.options.solver == "gurobi":
             solver_results = self.gurobi_solve()
+        elif self.options.solver == "appsi_highs":
+            solver_results = self.appsi_highs_solve()
         else:
             raise ValueError("{} is not a supported solver".format(self.options.solver))
 
@@ -369,6 +383,50 @@ class HybridDispatchBuilderSolver:
             self.options.solver_options,
         )
 
+    @staticmethod
+    def appsi_highs_solve_call(
+        opt: pyomo.SolverFactory,
+        pyomo_model: pyomo.ConcreteModel,
+        log_name: str = "",
+        user_solver_options: dict = None,
+    ):
+
+        # Ref. on solver options: https://ergo-code.github.io/HiGHS/dev/options/definitions/
+        highs_solver_options = {"mip_rel_gap": 0.001, "time_limit": 30}
+        solver_options = SolverOptions(
+            highs_solver_options, log_name, user_solver_options, "log_file"
+        )
+
+        # In-process persistent solver: the model is handed to HiGHS on the first call only. Subsequent calls with
+        # the same model push just the changed mutable parameter values (and variable bounds) to the solver.
+        results = opt.solve(pyomo_model, options=solver_options.constructed)
+        HybridDispatchBuilderSolver.log_and_solution_check(
+            log_name,
+            solver_options.instance_log,
+            results.solver.termination_condition,
+            pyomo_model,
+        )
+        return results
+
+    def appsi_highs_solve(self):
+        if self.opt is None:
+            self.opt = pyomo.SolverFactory("appsi_highs")
+            # The dispatch model structure is fixed for the whole simulation, only parameter values change
+            # between rolling-horizon windows. Skip scanning the model for added/removed components.
+            self.opt.update_config.check_for_new_or_removed_constraints = False
+            self.opt.update_config.check_for_new_or_removed_vars = False
+            self.opt.update_config.check_for_new_or_removed_params = False
+            self.opt.update_config.check_for_new_objective = False
+            self.opt.update_config.update_constraints = False
+            self.opt.update_config.update_objective = False
+
+        return HybridDispatchBuilderSolver.appsi_highs_solve_call(
+            self.opt,
+            self.pyomo_model,
+            self.options.log_name,
+            self.options.solver_options,
+        )
+
     @staticmethod
     def mindtpy_solve_call(pyomo_model: pyomo.ConcreteModel, log_name: str = ""):
         raise NotImplementedError
@@ -489,7 +547,6 @@ class HybridDispatchBuilderSolver:
                         logger.info("\t {:.0f} % complete".format(i * 20 / 73))
                     self.simulate_with_dispatch(t)
         else:
-
             initial_states = {
                 tech: {"day": [], "soc": [], "load": []}
                 for tech in ["trough", "tower", "battery"]
@@ -499,67 +556,24 @@ class HybridDispatchBuilderSolver:
             inds = sorted(
                 range(len(npercluster)), key=npercluster.__getitem__
             )  # Indicies to sort clusters by low-to-high number of days represented
-            for i in range(self.clustering.clusters["n_cluster"]):
-                j = inds[i]  # cluster index
-                time_start, time_stop = self.clustering.get_sim_start_end_times(j)
-                battery_soc = (
-                    self.clustering.battery_soc_heuristic(j, initial_states["battery"])
-                    if "battery" in self.power_sources.keys()
-                    else None
-                )
-
-                # Set CSP initial states (need to do this prior to update_time_series_parameters() or update_initial_conditions(), both pull from the stored plant state)
-                for tech in ["trough", "tower"]:
-                    if tech in self.power_sources.keys():
-                        self.power_sources[tech].plant_state = self.power_sources[
-                            tech
-                        ].set_initial_plant_state()  # Reset to default initial state
-                        csp_soc, is_cycle_on, initial_cycle_load = (
-                            self.clustering.csp_initial_state_heuristic(
-                                j,
-                                self.power_sources[tech].solar_multiple,
-                                initial_states[tech],
-                            )
-                        )
-                        self.power_sources[tech].set_tes_soc(csp_soc)
-                        self.power_sources[tech].set_cycle_state(is_cycle_on)
-                        self.power_sources[tech].set_cycle_load(initial_cycle_load)
-
-                self.simulate_with_dispatch(
-                    time_start, self.clustering.ndays + 1, battery_soc, n_initial_sims=1
-                )
 
-                # Update lists of known states at 12am
-                for tech in ["trough", "tower", "battery"]:
-                    if tech in self.power_sources.keys():
-                        for d in range(self.clustering.ndays):
-                            day = self.clustering.sim_start_days[j] + d
-                            initial_states[tech]["day"].append(day)
-                            if tech in ["trough", "tower"]:
-                                initial_states[tech]["soc"].append(
-                                    self.power_sources[tech].get_tes_soc(day * 24)
-                                )
-                                initial_states[tech]["load"].append(
-                                    self.power_sources[tech].get_cycle_load(day * 24)
-                                )
-                            elif tech in ["battery"]:
-                                step = day * 24 * int(self.site.n_timesteps / 8760)
-                                initial_states[tech]["soc"].append(
-                                    self.power_sources[tech].Outputs.SOC[step]
-                                )
+            if self.options.n_cluster_processes > 1:
+                self.simulate_clusters_parallel(inds, initial_states)
+            else:
+                for j in inds:
+                    self.simulate_cluster(j, initial_states)
+                    self.store_cluster_initial_states(j, initial_states)
 
             # After exemplar simulations, update to full annual generation array for dispatchable technologies
             for tech in self.power_sources.keys():
                 if tech in ["battery"]:
                     for key in ["gen", "P", "SOC"]:
-                        val = getattr(self.power_sources[tech].Outputs, key)
+                        val = getattr(self.power_sources[tech].outputs, key)
                         setattr(
-                            self.power_sources[tech].Outputs,
+                            self.power_sources[tech].outputs,
                             key,
-                            list(
-                                self.clustering.compute_annual_array_from_cluster_exemplar_data(
-                                    val
-                                )
+                            self.clustering.compute_annual_array_from_cluster_exemplar_data(
+                                val
                             ),
                         )
                 elif tech in ["trough", "tower"]:
@@ -573,12 +587,188 @@ class HybridDispatchBuilderSolver:
                         "eta",
                         "q_pb",
                     ]:  # Data quantities used in capacity value calculations
-                        self.power_sources[tech].outputs.ssc_time_series[key] = list(
+                        self.power_sources[tech].outputs.ssc_time_series[key] = (
                             self.clustering.compute_annual_array_from_cluster_exemplar_data(
                                 self.power_sources[tech].outputs.ssc_time_series[key]
                             )
                         )
 
+    def simulate_cluster(self, j: int, initial_states: dict):
+        """
+        Simulates the exemplar group of a single cluster with dispatch.
+
+        Args:
+            j: Cluster index
+            initial_states: Known states at 12 am from completed exemplar simulations, used to estimate initial states
+        """
+        time_start, time_stop = self.clustering.get_sim_start_end_times(j)
+        battery_soc = (
+            self.clustering.battery_soc_heuristic(j, initial_states["battery"])
+            if "battery" in self.power_sources.keys()
+            else None
+        )
+
+        # Set CSP initial states (need to do this prior to update_time_series_parameters() or update_initial_conditions(), both pull from the stored plant state)
+        for tech in ["trough", "tower"]:
+            if tech in self.power_sources.keys():
+                self.power_sources[tech].plant_state = self.power_sources[
+                    tech
+                ].set_initial_plant_state()  # Reset to default initial state
+                csp_soc, is_cycle_on, initial_cycle_load = (
+                    self.clustering.csp_initial_state_heuristic(
+                        j,
+                        self.power_sources[tech].solar_multiple,
+                        initial_states[tech],
+                    )
+                )
+                self.power_sources[tech].set_tes_soc(csp_soc)
+                self.power_sources[tech].set_cycle_state(is_cycle_on)
+                self.power_sources[tech].set_cycle_load(initial_cycle_load)
+
+        steps_per_hour = int(self.site.n_timesteps / 8760)
+        self.simulate_with_dispatch(
+            time_start * steps_per_hour,
+            self.clustering.ndays + 1,
+            battery_soc,
+            n_initial_sims=1,
+        )
+
+    def store_cluster_initial_states(self, j: int, initial_states: dict):
+        """
+        Appends the simulated states at 12 am of each day in the exemplar group of cluster j to the known states.
+        """
+        for tech in ["trough", "tower", "battery"]:
+            if tech in self.power_sources.keys():
+                for d in range(self.clustering.ndays):
+                    day = self.clustering.sim_start_days[j] + d
+                    initial_states[tech]["day"].append(day)
+                    if tech in ["trough", "tower"]:
+                        initial_states[tech]["soc"].append(
+                            self.power_sources[tech].get_tes_soc(day * 24)
+                        )
+                        initial_states[tech]["load"].append(
+                            self.power_sources[tech].get_cycle_load(day * 24)
+                        )
+                    elif tech in ["battery"]:
+                        step = day * 24 * int(self.site.n_timesteps / 8760)
+                        initial_states[tech]["soc"].append(
+                            self.power_sources[tech].outputs.SOC[step]
+                        )
+
+    def simulate_clusters_parallel(self, cluster_order: list, initial_states: dict):
+        """
+        Simulates cluster exemplar groups on a pool of worker processes.
+
+        Each worker is forked from this process, so it owns a private copy of the plant models and dispatch problem.
+        Clusters are submitted in batches of ``n_cluster_processes`` following ``cluster_order``. Initial states of
+        a batch are estimated from the states known after the previous batches, whereas the serial simulation updates
+        them after every cluster, so results can differ slightly from a serial run.
+
+        Args:
+            cluster_order: Cluster indices in the order to be simulated
+            initial_states: Known states at 12 am from completed exemplar simulations
+        """
+        if "fork" not in multiprocessing.get_all_start_methods():
+            logger.warning(
+                "Warning: Parallel cluster simulation requires the 'fork' start method. Simulating clusters in series."
+            )
+            for j in cluster_order:
+                self.simulate_cluster(j, initial_states)
+                self.store_cluster_initial_states(j, initial_states)
+            return
+
+        global _cluster_builder
+        _cluster_builder = self
+        n_procs = min(self.options.n_cluster_processes, len(cluster_order))
+        try:
+            with multiprocessing.get_context("fork").Pool(processes=n_procs) as pool:
+                for b in range(0, len(cluster_order), n_procs):
+                    batch = cluster_order[b : b + n_procs]
+                    results = pool.map(
+                        _simulate_cluster_worker, [(j, initial_states) for j in batch]
+                    )
+                    for j, (outputs, metrics) in zip(batch, results):
+                        self.set_cluster_outputs(j, outputs)
+                        self.problem_state.extend_problem_metrics(metrics)
+                    for j in batch:
+                        self.store_cluster_initial_states(j, initial_states)
+        finally:
+            _cluster_builder = None
+
+    def get_cluster_outputs(self, j: int) -> dict:
+        """
+        Returns the stored outputs of dispatchable technologies over the solution days of cluster j's exemplar group.
+        """
+        time_start, time_stop = self.clustering.get_soln_start_end_times(j)
+        outputs = {}
+        if "battery" in self.power_sources.keys():
+            battery_outputs = self.power_sources["battery"].outputs
+            steps_per_hour = int(self.site.n_timesteps / 8760)
+            step_slice = slice(time_start * steps_per_hour, time_stop * steps_per_hour)
+            day_slice = slice(time_start // 24, time_stop // 24)
+            outputs["battery"] = {
+                attr: getattr(battery_outputs, attr)[step_slice]
+                for attr in battery_outputs.stateful_attributes
+                + ["dispatch_I", "dispatch_P", "dispatch_SOC"]
+            }
+            outputs["battery"]["dispatch_lifecycles_per_day"] = (
+                battery_outputs.dispatch_lifecycles_per_day[day_slice]
+            )
+        for tech in ["trough", "tower"]:
+            if tech in self.power_sources.keys():
+                csp_outputs = self.power_sources[tech].outputs
+                steps_per_hour = int(self.power_sources[tech].ssc.get("time_steps_per_hour"))
+                step_slice = slice(time_start * steps_per_hour, time_stop * steps_per_hour)
+                periods_per_hour = int(self.site.n_timesteps / 8760)
+                period_slice = slice(
+                    time_start * periods_per_hour, time_stop * periods_per_hour
+                )
+                outputs[tech] = {
+                    "ssc_time_series": {
+                        key: (len(val), np.array(val[step_slice]))
+                        for key, val in csp_outputs.ssc_time_series.items()
+                    },
+                    "dispatch": {
+                        key: val[period_slice]
+                        for key, val in csp_outputs.dispatch.items()
+                    },
+                }
+        return outputs
+
+    def set_cluster_outputs(self, j: int, outputs: dict):
+        """
+        Stores outputs of cluster j's exemplar group, as returned by `get_cluster_outputs`, in the plant outputs.
+        """
+        time_start, time_stop = self.clustering.get_soln_start_end_times(j)
+        if "battery" in outputs:
+            battery_outputs = self.power_sources["battery"].outputs
+            steps_per_hour = int(self.site.n_timesteps / 8760)
+            step_slice = slice(time_start * steps_per_hour, time_stop * steps_per_hour)
+            for attr, val in outputs["battery"].items():
+                if attr == "dispatch_lifecycles_per_day":
+                    battery_outputs.dispatch_lifecycles_per_day[
+                        time_start // 24 : time_stop // 24
+                    ] = val
+                else:
+                    getattr(battery_outputs, attr)[step_slice] = val
+        for tech in ["trough", "tower"]:
+            if tech in outputs:
+                csp_outputs = self.power_sources[tech].outputs
+                steps_per_hour = int(self.power_sources[tech].ssc.get("time_steps_per_hour"))
+                step_slice = slice(time_start * steps_per_hour, time_stop * steps_per_hour)
+                for key, (ntot, val) in outputs[tech]["ssc_time_series"].items():
+                    if key not in csp_outputs.ssc_time_series:
+                        csp_outputs.ssc_time_series[key] = np.zeros(ntot)
+                    csp_outputs.ssc_time_series[key][step_slice] = val
+                periods_per_hour = int(self.site.n_timesteps / 8760)
+                period_slice = slice(
+                    time_start * periods_per_hour, time_stop * periods_per_hour
+                )
+                for key, val in outputs[tech]["dispatch"].items():
+                    if key not in csp_outputs.dispatch:
+                        csp_outputs.dispatch[key] = [0.0] * self.site.n_timesteps
+                    csp_outputs.dispatch[key][period_slice] = val
+
     def simulate_with_dispatch(
         self,
         start_time: int,
@@ -603,10 +793,11 @@ class HybridDispatchBuilderSolver:
                 )
                 initial_soc = None
 
-            for model in self.power_sources.values():
-                if model.system_capacity_kw == 0:
-                    continue
-                model.dispatch.update_time_series_parameters(sim_start_time)
+            with self.timer.stage("dispatch_update"):
+                for model in self.power_sources.values():
+                    if model.system_capacity_kw == 0:
+                        continue
+                    model.dispatch.update_time_series_parameters(sim_start_time)
 
             if self.site.follow_desired_schedule:
                 n_horizon = len(self.power_sources["grid"].dispatch.blocks.index_set())
@@ -640,12 +831,13 @@ class HybridDispatchBuilderSolver:
                     system_limit
                 )
 
-            if "heuristic" in self.options.battery_dispatch:
-                # TODO: this is not a good way to do this... This won't work with CSP addition...
-                self.battery_heuristic()
-                # TODO: we could just run the csp model without dispatch here
-            else:
-                self.solve_dispatch_model(start_time, n_days)
+            with self.timer.stage("dispatch_solve"):
+                if "heuristic" in self.options.battery_dispatch:
+                    # TODO: this is not a good way to do this... This won't work with CSP addition...
+                    self.battery_heuristic()
+                    # TODO: we could just run the csp model without dispatch here
+                else:
+                    self.solve_dispatch_model(start_time, n_days)
 
             store_outputs = True
             battery_sim_start_time = sim_start_time
@@ -655,22 +847,25 @@ class HybridDispatchBuilderSolver:
 
             # simulate using dispatch solution
             if "battery" in self.power_sources.keys():
-                self.power_sources["battery"].simulate_with_dispatch(
-                    self.options.n_roll_periods, sim_start_time=battery_sim_start_time
-                )
+                with self.timer.stage("battery_simulation"):
+                    self.power_sources["battery"].simulate_with_dispatch(
+                        self.options.n_roll_periods, sim_start_time=battery_sim_start_time
+                    )
 
             if "trough" in self.power_sources.keys():
-                self.power_sources["trough"].simulate_with_dispatch(
-                    self.options.n_roll_periods,
-                    sim_start_time=sim_start_time,
-                    store_outputs=store_outputs,
-                )
+                with self.timer.stage("csp_simulation"):
+                    self.power_sources["trough"].simulate_with_dispatch(
+                        self.options.n_roll_periods,
+                        sim_start_time=sim_start_time,
+                        store_outputs=store_outputs,
+                    )
             if "tower" in self.power_sources.keys():
-                self.power_sources["tower"].simulate_with_dispatch(
-                    self.options.n_roll_periods,
-                    sim_start_time=sim_start_time,
-                    store_outputs=store_outputs,
-                )
+                with self.timer.stage("csp_simulation"):
+                    self.power_sources["tower"].simulate_with_dispatch(
+                        self.options.n_roll_periods,
+                        sim_start_time=sim_start_time,
+                        store_outputs=store_outputs,
+                    )
 
     def battery_heuristic(self):
         tot_gen = [0.0] * self.options.n_look_ahead_periods
@@ -722,6 +917,19 @@ class HybridDispatchBuilderSolver:
         return self._dispatch
 
 
+# Builder used by forked worker processes in `HybridDispatchBuilderSolver.simulate_clusters_parallel`
+_cluster_builder = None
+
+
+def _simulate_cluster_worker(args):
+    """Simulates a cluster exemplar group on the worker's copy of the builder and returns its outputs"""
+    j, initial_states = args
+    builder = _cluster_builder
+    n_solves = len(builder.problem_state.start_time)
+    builder.simulate_cluster(j, initial_states)
+    return builder.get_cluster_outputs(j), builder.problem_state.get_problem_metrics(n_solves)
+
+
 class SolverOptions:
     """Class for housing solver options"""
 
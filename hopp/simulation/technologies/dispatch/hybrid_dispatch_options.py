@@ -17,7 +17,7 @@ class HybridDispatchOptions:
     Args:
         dispatch_options (dict): Contains attribute key-value pairs to change default options.
 
-            - **solver** (str, default='cbc'): MILP solver used for dispatch optimization problem. Options are `('glpk', 'cbc', 'xpress', 'xpress_persistent', 'gurobi_ampl', 'gurobi')`.
+            - **solver** (str, default='cbc'): MILP solver used for dispatch optimization problem. Options are `('glpk', 'cbc', 'xpress', 'xpress_persistent', 'gurobi_ampl', 'gurobi', 'appsi_highs')`. `'appsi_highs'` is an in-process persistent solver (requires `highspy`) that only updates changed parameters between rolling-horizon windows.
 
             - **solver_options** (dict): Dispatch solver options.
 
@@ -53,6 +53,8 @@ class HybridDispatchOptions:
 
             - **clustering_divisions** (dict, default={}): Custom number of averaging periods for classification metrics for data clustering. If empty, default values will be used.
 
+            - **n_cluster_processes** (int, default=1): Number of worker processes used to simulate the cluster exemplars in parallel. If 1, exemplars are simulated in series. Parallel simulation requires the 'fork' start method (not available on Windows).
+
             - **use_higher_hours** bool (default = False): if True, the simulation will run extra hours analysis (must be used with load following)
 
             - **higher_hours** (dict, default = {}): Higher hour count parameters: the value of power that must be available above the schedule and the number of hours in a row
@@ -83,6 +85,7 @@ class HybridDispatchOptions:
         self.n_clusters: int = 30
         self.clustering_weights: dict = {}
         self.clustering_divisions: dict = {}
+        self.n_cluster_processes: int = 1
 
         self.use_higher_hours: bool = False
         self.higher_hours: dict = {}
@@ -37,6 +37,10 @@ class CspDispatch(Dispatch):
             block_set_name=block_set_name,
         )
         self._create_linking_constraints()
+        # parameter of each block by parameter name, see _set_time_series_param
+        self._block_params = {}
+        # annual values of time series parameters, see set_annual_time_series_parameters
+        self._annual_time_series = {}
 
         self.objective_cost_terms = {
             "cost_per_field_generation": 0.5,
@@ -967,36 +971,57 @@ class CspDispatch(Dispatch):
             csp.value("cycle_max_frac") * cycle_rated_thermal
         )
         self.set_part_load_cycle_parameters()
+        self.set_annual_time_series_parameters()
+
+    def set_annual_time_series_parameters(self):
+        """Computes the time series parameters of the dispatch model for the whole year.
+
+        Notes:
+            The parameters of each dispatch horizon are taken from these annual values by
+            update_time_series_parameters, so they must be recomputed when the solar thermal
+            resource, the weather or the cycle efficiency tables of the system model change.
+            Dispatch periods are the time steps of the site, so the thermal resource and
+            weather of SSC simulations finer than the site are averaged over each period.
+
+        """
+        csp = self._system_model
+        self.min_receiver_start_time = csp.value("rec_su_delay")
+
+        field_gen = csp.to_dispatch_resolution(csp.solar_thermal_resource)
+        temperature = csp.to_dispatch_resolution(csp.year_weather_df.Temperature.values)
+        cycle_ambient_efficiency_correction, condenser_losses = (
+            self.calc_ambient_temperature_cycle_parameters(temperature)
+        )
+        self._annual_time_series = {
+            "available_thermal_generation": field_gen,
+            "cycle_ambient_efficiency_correction": cycle_ambient_efficiency_correction,
+            "condenser_losses": condenser_losses,
+            "receiver_startup_fraction": self.calc_receiver_startup_fraction(
+                field_gen, np.full(len(field_gen), self.period_duration)
+            ),
+        }
+
+    @property
+    def period_duration(self) -> float:
+        """Duration of each dispatch period, a time step of the site [hr]."""
+        return 1.0 / self._system_model.dispatch_time_steps_per_hour
 
     def update_time_series_parameters(self, start_time: int):
-        """Sets up SSC simulation to get time series performance parameters after simulation.
+        """Sets the time series parameters of the dispatch horizon from their annual values.
 
         Args:
-            start_time (int): Hour of the year starting dispatch horizon.
+            start_time (int): Period of the year starting dispatch horizon.
 
         """
         n_horizon = len(self.blocks.index_set())
-        self.time_duration = [1.0] * n_horizon  # assume hourly for now
-
-        # Set available thermal energy based on forecast
-        thermal_resource = self._system_model.solar_thermal_resource
-        temperature = list(self._system_model.year_weather_df.Temperature.values)
-        if start_time + n_horizon > len(thermal_resource):
-            field_gen = list(thermal_resource[start_time:])
-            field_gen.extend(list(thermal_resource[0 : n_horizon - len(field_gen)]))
-
-            dry_bulb_temperature = list(temperature[start_time:])
-            dry_bulb_temperature.extend(
-                list(temperature[0 : n_horizon - len(dry_bulb_temperature)])
-            )
-        else:
-            field_gen = thermal_resource[start_time : start_time + n_horizon]
-            dry_bulb_temperature = temperature[start_time : start_time + n_horizon]
+        self.time_duration = [self.period_duration] * n_horizon
 
-        self.available_thermal_generation = field_gen
-        # Set cycle performance parameters that depend on ambient temperature
-        self.set_ambient_temperature_cycle_parameters(dry_bulb_temperature)
-        self.set_receiver_require_startup_time_fraction(field_gen)
+        # Horizons extending past the end of the year wrap around to its start
+        horizon = np.arange(start_time, start_time + n_horizon)
+        for name, annual_values in self._annual_time_series.items():
+            self._set_time_series_param(
+                name, annual_values.take(horizon, mode="wrap").tolist()
+            )
 
         self.update_initial_conditions()  # other dispatch models do not have this method
 
@@ -1088,6 +1113,24 @@ class CspDispatch(Dispatch):
             such as cycle efficiency corrections and condenser losses based on the provided
             dry bulb temperature(s).
 
+        """
+        cycle_ambient_efficiency_correction, condenser_losses = (
+            self.calc_ambient_temperature_cycle_parameters(dry_bulb_temperature)
+        )
+        self.cycle_ambient_efficiency_correction = cycle_ambient_efficiency_correction
+        self.condenser_losses = condenser_losses
+        return
+
+    def calc_ambient_temperature_cycle_parameters(self, dry_bulb_temperature):
+        """Calculate ambient temperature dependent cycle performance parameters.
+
+        Args:
+            dry_bulb_temperature (float or list): Ambient dry bulb temperature(s) [°C].
+
+        Returns:
+            tuple: Cycle ambient efficiency correction and condenser losses arrays for each
+                dry bulb temperature.
+
         """
         # --- Cycle ambient-temperature efficiency corrections
         tables = self._system_model.cycle_efficiency_tables
@@ -1102,7 +1145,7 @@ class CspDispatch(Dispatch):
             wcondfpts = [
                 tables["cycle_wcond_Tdb_table"][i][1] for i in range(nT)
             ]  # Fraction of cycle design gross output consumed by cooling
-            self.set_cycle_ambient_corrections(
+            return self.calc_cycle_ambient_corrections(
                 dry_bulb_temperature, Tpts, efficiency_pts, wcondfpts
             )
         elif "ud_ind_od" in tables:
@@ -1122,7 +1165,7 @@ class CspDispatch(Dispatch):
                 * tables["ud_ind_od"][j][5]
                 for j in range(k, k + npts)
             ]  # Fraction of cycle design gross output consumed by cooling
-            self.set_cycle_ambient_corrections(
+            return self.calc_cycle_ambient_corrections(
                 dry_bulb_temperature, D["Tambpts"], efficiency_pts, wcondfpts
             )
         else:
@@ -1130,11 +1173,10 @@ class CspDispatch(Dispatch):
                 "WARNING: Dispatch optimization cycle ambient temperature corrections are not set up."
             )
             n = len(dry_bulb_temperature)
-            self.cycle_ambient_efficiency_correction = [
-                self._system_model.cycle_nominal_efficiency
-            ] * n
-            self.condenser_losses = [0.0] * n
-        return
+            return (
+                np.full(n, self._system_model.cycle_nominal_efficiency, dtype=float),
+                np.zeros(n),
+            )
 
     def set_cycle_ambient_corrections(self, Tdb, Tpts, etapts, wcondfpts):
         """Set cycle ambient corrections based on ambient temperature.
@@ -1153,24 +1195,42 @@ class CspDispatch(Dispatch):
             ambient temperature(s) and tabulated values. The corrections are set for each dispatch time step.
 
         """
-        n = len(
-            Tdb
-        )  # Tdb = set of ambient temperature points for each dispatch time step
-        npts = len(Tpts)  # Tpts = ambient temperature points with tabulated values
-        cycle_ambient_efficiency_correction = [1.0] * n
-        condenser_losses = [0.0] * n
-        Tstep = Tpts[1] - Tpts[0]
-        for j in range(n):
-            i = max(0, min(int((Tdb[j] - Tpts[0]) / Tstep), npts - 2))
-            r = (Tdb[j] - Tpts[i]) / Tstep
-            cycle_ambient_efficiency_correction[j] = (
-                etapts[i] + (etapts[i + 1] - etapts[i]) * r
-            )
-            condenser_losses[j] = wcondfpts[i] + (wcondfpts[i + 1] - wcondfpts[i]) * r
+        cycle_ambient_efficiency_correction, condenser_losses = (
+            self.calc_cycle_ambient_corrections(Tdb, Tpts, etapts, wcondfpts)
+        )
         self.cycle_ambient_efficiency_correction = cycle_ambient_efficiency_correction
         self.condenser_losses = condenser_losses
         return
 
+    @staticmethod
+    def calc_cycle_ambient_corrections(Tdb, Tpts, etapts, wcondfpts):
+        """Calculate cycle ambient corrections by linear interpolation of tabulated values.
+
+        Args:
+            Tdb (float or list): Ambient temperature(s) for each dispatch time step [°C].
+            Tpts (list): Ambient temperature points with tabulated values [°C], evenly spaced.
+            etapts (list): Efficiency values corresponding to each Tpts.
+            wcondfpts (list): Fraction of cycle design gross output consumed by cooling corresponding to each Tpts.
+
+        Returns:
+            tuple: Cycle ambient efficiency correction and condenser losses arrays, extrapolated
+                linearly beyond the tabulated temperatures.
+
+        """
+        Tdb = np.atleast_1d(np.asarray(Tdb, dtype=float))
+        Tpts = np.asarray(Tpts, dtype=float)
+        etapts = np.asarray(etapts, dtype=float)
+        wcondfpts = np.asarray(wcondfpts, dtype=float)
+
+        Tstep = Tpts[1] - Tpts[0]
+        i = np.clip(((Tdb - Tpts[0]) / Tstep).astype(int), 0, len(Tpts) - 2)
+        r = (Tdb - Tpts[i]) / Tstep
+        cycle_ambient_efficiency_correction = (
+            etapts[i] + (etapts[i + 1] - etapts[i]) * r
+        )
+        condenser_losses = wcondfpts[i] + (wcondfpts[i + 1] - wcondfpts[i]) * r
+        return cycle_ambient_efficiency_correction, condenser_losses
+
     @staticmethod
     def interpret_user_defined_cycle_data(ud_ind_od):
         """Interpret user-defined cycle data.
@@ -1238,22 +1298,31 @@ class CspDispatch(Dispatch):
 
         """
         self.min_receiver_start_time = self._system_model.value("rec_su_delay")
+        self.receiver_startup_fraction = self.calc_receiver_startup_fraction(
+            field_gen, self.time_duration
+        )
 
-        su_fraction = [1.0] * len(field_gen)
-        epsilon = 1e-6
-        time_duration = self.time_duration
-
-        for i in range(len(field_gen)):
-            su_fraction[i] = min(
-                1.0,
-                max(
-                    self.min_receiver_start_time / time_duration[i],
-                    self.receiver_required_startup_energy
-                    / max(1e-6, field_gen[i] * time_duration[i]),
-                ),
-            )
+    def calc_receiver_startup_fraction(self, field_gen, time_duration):
+        """Calculates the fraction of time periods required for receiver start-up.
 
-        self.receiver_startup_fraction = su_fraction
+        Args:
+            field_gen (list): Field generation profile [MWt].
+            time_duration (list): Duration of each time period [hr].
+
+        Returns:
+            numpy.ndarray: Receiver start-up fraction of each time period [-].
+
+        """
+        field_gen = np.asarray(field_gen, dtype=float)
+        time_duration = np.asarray(time_duration, dtype=float)
+        return np.minimum(
+            1.0,
+            np.maximum(
+                self.min_receiver_start_time / time_duration,
+                self.receiver_required_startup_energy
+                / np.maximum(1e-6, field_gen * time_duration),
+            ),
+        )
 
     def update_initial_conditions(self):
         """This method updates the initial conditions for the dispatch optimization,
@@ -1320,15 +1389,15 @@ class CspDispatch(Dispatch):
         """Get start and end datetimes based on simulation start time and horizon length.
 
         Args:
-            start_time (int): Start time of the simulation in hours.
-            n_horizon (int): Length of the simulation horizon in hours.
+            start_time (float): Start time of the simulation in hours.
+            n_horizon (float): Length of the simulation horizon in hours.
 
         Returns:
             tuple: A tuple containing the start and end datetime objects.
 
         Notes:
             This method calculates the start and end datetimes based on the provided start time
-            and horizon length, assuming hourly data.
+            and horizon length, which may be fractional hours for sub-hourly dispatch periods.
 
         """
         # Setting simulation times
@@ -1379,6 +1448,26 @@ class CspDispatch(Dispatch):
         time_diff = dt - newyear
         return int(time_diff.total_seconds())
 
+    def _set_time_series_param(self, name: str, values: list):
+        """Sets a parameter of each block of the dispatch horizon, rounded to round_digits.
+
+        Args:
+            name (str): Name of the block parameter.
+            values (list): Value of each time period of the dispatch horizon.
+
+        """
+        if name not in self._block_params:
+            self._block_params[name] = [
+                getattr(self.blocks[t], name) for t in self.blocks.index_set()
+            ]
+        params = self._block_params[name]
+        if isinstance(values, np.ndarray):
+            values = values.tolist()
+        if len(values) != len(params):
+            raise ValueError(name + " list must be the same length as time horizon")
+        for param, value in zip(params, values):
+            param.set_value(round(value, self.round_digits))
+
     #################################
     # INPUTS                        #
     #################################
@@ -1390,14 +1479,7 @@ class CspDispatch(Dispatch):
 
     @time_duration.setter
     def time_duration(self, time_duration: list):
-        if len(time_duration) == len(self.blocks):
-            for t, delta in zip(self.blocks, time_duration):
-                self.blocks[t].time_duration = round(delta, self.round_digits)
-        else:
-            raise ValueError(
-                self.time_duration.__name__
-                + " list must be the same length as time horizon"
-            )
+        self._set_time_series_param("time_duration", time_duration)
 
     @property
     def available_thermal_generation(self) -> list:
@@ -1409,16 +1491,9 @@ class CspDispatch(Dispatch):
 
     @available_thermal_generation.setter
     def available_thermal_generation(self, available_thermal_generation: list):
-        if len(available_thermal_generation) == len(self.blocks):
-            for t, value in zip(self.blocks, available_thermal_generation):
-                self.blocks[t].available_thermal_generation = round(
-                    value, self.round_digits
-                )
-        else:
-            raise ValueError(
-                self.available_thermal_generation.__name__
-                + " list must be the same length as time horizon"
-            )
+        self._set_time_series_param(
+            "available_thermal_generation", available_thermal_generation
+        )
 
     @property
     def cycle_ambient_efficiency_correction(self) -> list:
@@ -1432,16 +1507,9 @@ class CspDispatch(Dispatch):
     def cycle_ambient_efficiency_correction(
         self, cycle_ambient_efficiency_correction: list
     ):
-        if len(cycle_ambient_efficiency_correction) == len(self.blocks):
-            for t, value in zip(self.blocks, cycle_ambient_efficiency_correction):
-                self.blocks[t].cycle_ambient_efficiency_correction = round(
-                    value, self.round_digits
-                )
-        else:
-            raise ValueError(
-                self.cycle_ambient_efficiency_correction.__name__
-                + " list must be the same length as time horizon"
-            )
+        self._set_time_series_param(
+            "cycle_ambient_efficiency_correction", cycle_ambient_efficiency_correction
+        )
 
     @property
     def condenser_losses(self) -> list:
@@ -1450,14 +1518,7 @@ class CspDispatch(Dispatch):
 
     @condenser_losses.setter
     def condenser_losses(self, condenser_losses: list):
-        if len(condenser_losses) == len(self.blocks):
-            for t, value in zip(self.blocks, condenser_losses):
-                self.blocks[t].condenser_losses = round(value, self.round_digits)
-        else:
-            raise ValueError(
-                self.condenser_losses.__name__
-                + " list must be the same length as time horizon"
-            )
+        self._set_time_series_param("condenser_losses", condenser_losses)
 
     @property
     def receiver_startup_fraction(self) -> list:
@@ -1469,16 +1530,9 @@ class CspDispatch(Dispatch):
 
     @receiver_startup_fraction.setter
     def receiver_startup_fraction(self, receiver_startup_fraction: list):
-        if len(receiver_startup_fraction) == len(self.blocks):
-            for t, value in zip(self.blocks, receiver_startup_fraction):
-                self.blocks[t].receiver_startup_fraction = round(
-                    value, self.round_digits
-                )
-        else:
-            raise ValueError(
-                self.receiver_startup_fraction.__name__
-                + " list must be the same length as time horizon"
-            )
+        self._set_time_series_param(
+            "receiver_startup_fraction", receiver_startup_fraction
+        )
 
     @property
     def min_receiver_start_time(self) -> float:
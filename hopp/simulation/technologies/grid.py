@@ -7,6 +7,8 @@ import PySAM.Singleowner as Singleowner
 
 from hopp.simulation.technologies.sites import SiteInfo
 from hopp.simulation.technologies.power_source import PowerSource
+from hopp.simulation.technologies.capacity_credit import max_feasible_generation_kwh
+from hopp.simulation.technologies.lifetime_series import LifetimeSeries
 from hopp.simulation.base import BaseClass
 from hopp.simulation.technologies.financial import FinancialModelType, CustomFinancialModel
 from hopp.type_dec import NDArrayFloat
@@ -91,7 +93,7 @@ class Grid(PowerSource):
         # TODO: update args to use numpy types, once PowerSource is refactored
         self,
         hybrid_size_kw: float, 
-        total_gen: Union[List[float], NDArrayFloat], 
+        total_gen: Union[List[float], NDArrayFloat, LifetimeSeries], 
         project_life: int, 
         lifetime_sim: bool, 
         total_gen_max_feasible_year1: Union[List[float], NDArrayFloat],
@@ -104,7 +106,8 @@ class Grid(PowerSource):
 
         Args:
             hybrid_size_kw: Hybrid system capacity [kW]
-            total_gen: Hybrid system generation profile [kWh]
+            total_gen: Hybrid system generation profile over the project life [kWh]. A
+                ``LifetimeSeries`` keeps repeated years lazy
             project_life: Number of year in the analysis period (expected project
                 lifetime) [years]
             lifetime_sim: For simulation modules which support simulating each year of
@@ -116,36 +119,39 @@ class Grid(PowerSource):
                 power analysis for frequency regulation is run
 
         """
-        if self.site.follow_desired_schedule:
-            # Desired schedule sets the upper bound of the system output, any over generation is curtailed
-            lifetime_schedule: NDArrayFloat = np.tile([
-                x * 1e3 for x in self.site.desired_schedule],
-                int(project_life / (len(self.site.desired_schedule) // self.site.n_timesteps))
-            )
-            self.generation_profile = list(np.minimum(total_gen, lifetime_schedule)) # TODO: remove list() cast once parent class uses numpy 
-
-            self.missed_load = np.array([schedule - gen if gen > 0 else schedule for (schedule, gen) in
-                                     zip(lifetime_schedule, self.generation_profile)])
-            self.missed_load_percentage = sum(self.missed_load)/sum(lifetime_schedule)
+        n_total = self.site.n_timesteps * project_life
+        if not isinstance(total_gen, LifetimeSeries):
+            total_gen = LifetimeSeries(total_gen, len(total_gen))
 
-            self.schedule_curtailed = np.array([gen - schedule if gen > schedule else 0. for (gen, schedule) in
-                                            zip(total_gen, lifetime_schedule)])
-            self.schedule_curtailed_percentage = sum(self.schedule_curtailed)/sum(lifetime_schedule)
+        if self.site.follow_desired_schedule:
+            # Desired schedule sets the upper bound of the system output, any over generation is curtailed.
+            # Generation and schedule both repeat over the project life, so the metrics are evaluated over their
+            # common period only
+            schedule_kw = np.asarray(self.site.desired_schedule, dtype=float) * 1e3
+            period = np.lcm(len(total_gen.base), len(schedule_kw))
+            lifetime_schedule = LifetimeSeries(schedule_kw, n_total)
+            schedule = lifetime_schedule[0:period]
+            final_power_production = total_gen[0:period]
+
+            generation = np.minimum(final_power_production, schedule)
+            self.generation_profile = np.asarray(LifetimeSeries(generation, n_total))
+
+            missed_load = LifetimeSeries(np.where(generation > 0, schedule - generation, schedule), n_total)
+            self.missed_load = np.asarray(missed_load)
+            self.missed_load_percentage = missed_load.sum() / lifetime_schedule.sum()
+
+            schedule_curtailed = LifetimeSeries(np.maximum(final_power_production - schedule, 0.), n_total)
+            self.schedule_curtailed = np.asarray(schedule_curtailed)
+            self.schedule_curtailed_percentage = schedule_curtailed.sum() / lifetime_schedule.sum()
 
             # NOTE: This is currently only happening for load following, would be good to make it more general
             #           i.e. so that this analysis can be used when load following isn't being used (without storage)
             #           for comparison 
-            N_hybrid = len(self.generation_profile)
-
-            final_power_production = total_gen
-            schedule = [x for x in lifetime_schedule]
-            hybrid_power = [(final_power_production[x] - (schedule[x]*0.95)) for x in range(len(final_power_production))]
+            hybrid_power = final_power_production - schedule * 0.95
 
-            load_met = len([i for i in hybrid_power if i  >= 0])
-            self.time_load_met = 100 * load_met/N_hybrid
+            self.time_load_met = 100 * np.count_nonzero(hybrid_power >= 0) / period
 
-            final_power_array = np.array(final_power_production)
-            power_met = np.where(final_power_array > schedule, schedule, final_power_array)
+            power_met = np.minimum(final_power_production, schedule)
             self.capacity_factor_load = np.sum(power_met) / np.sum(schedule) * 100
 
             logger.info('Percent of time firm power requirement is met: ', np.round(self.time_load_met,2))
@@ -170,12 +176,12 @@ class Grid(PowerSource):
 
                 # Performing frequency regulation analysis:
                 #    finding how many groups of hours satisfiy the ERS minimum power requirement
+                #    (over the whole project life, as groups may span the end of a period)
                 min_regulation_hours = dispatch_options.higher_hours['min_regulation_hours']
                 min_regulation_power = dispatch_options.higher_hours['min_regulation_power']
 
-                frequency_power_array = np.array(hybrid_power)
-                frequency_test = np.where(frequency_power_array > min_regulation_power, frequency_power_array, 0)
-                mask = (frequency_test!=0).astype(int)
+                frequency_power_array = np.asarray(LifetimeSeries(hybrid_power, n_total))
+                mask = (frequency_power_array > min_regulation_power).astype(int)
                 padded_mask = np.pad(mask,(1,), "constant")
                 edge_mask = padded_mask[1:] - padded_mask[:-1]  # finding the difference between each array value
 
@@ -183,26 +189,25 @@ class Grid(PowerSource):
                 group_stops = np.where(edge_mask == -1)[0]
 
                 # Find groups and drop groups that are too small
-                groups = [group for group in zip(group_starts,group_stops) if ((group[1]-group[0]) >= min_regulation_hours)]
-                group_lengths = [len(final_power_production[group[0]:group[1]]) for group in groups]
-                self.total_number_hours = sum(group_lengths)
+                group_lengths = group_stops - group_starts
+                self.total_number_hours = int(np.sum(group_lengths[group_lengths >= min_regulation_hours]))
 
                 logger.info('Total number of hours available for ERS: ', np.round(self.total_number_hours,2))
         else:
-            self.generation_profile = total_gen
+            self.generation_profile = np.asarray(total_gen)
 
         self.total_gen_max_feasible_year1 = np.array(total_gen_max_feasible_year1)
         self.system_capacity_kw = hybrid_size_kw  # TODO: Should this be interconnection limit?
-        self.gen_max_feasible = list(np.minimum(  # TODO: remove list() cast once parent class uses numpy 
-            total_gen_max_feasible_year1, 
+        self.gen_max_feasible = np.minimum(
+            self.total_gen_max_feasible_year1,
             self.interconnect_kw * self.site.interval / 60
-        ))
+        )
         self.simulate_power(project_life, lifetime_sim)
 
         # FIXME: updating capacity credit for reporting only.
         self.capacity_credit_percent = [i * (self.system_capacity_kw / self.interconnect_kw) for i in self.capacity_credit_percent]
 
-    def calc_gen_max_feasible_kwh(self, interconnect_kw: float) -> list:
+    def calc_gen_max_feasible_kwh(self, interconnect_kw: float) -> NDArrayFloat:
         """
         Calculates the maximum feasible generation profile that could have occurred (year 1)
 
@@ -213,8 +218,7 @@ class Grid(PowerSource):
         """
         W_ac_nom = self.calc_nominal_capacity(interconnect_kw)
         t_step = self.site.interval / 60                                                # hr
-        E_net_max_feasible = [min(x,W_ac_nom) * t_step for x in self.total_gen_max_feasible_year1[0:self.site.n_timesteps]]      # [kWh]
-        return E_net_max_feasible
+        return max_feasible_generation_kwh(self.total_gen_max_feasible_year1[0:self.site.n_timesteps], W_ac_nom, t_step)
 
     @property
     def system_capacity_kw(self) -> float:
@@ -40,6 +40,154 @@ def calc_current(P_T,p1,p2,p3,p4,p5,p6): #calculates i-v curve coefficients give
     i_stack=p1*(pwr**3) + p2*(pwr**2) +  (p3*pwr) + (p4*pwr**(1/2)) + p5
     return i_stack 
 
+class RainflowCounter:
+    """
+    Incremental rainflow cycle counting (ASTM E1049, as in `rainflow.extract_cycles`)
+    of a signal that is received in chunks.
+
+    Reversals that have not closed a cycle yet are kept as residue between chunks,
+    so counting a signal in chunks gives the same cycles as counting it at once.
+    A cycle is counted at the time its closing reversal is confirmed, which is the
+    time of the next distinct value of the signal.
+    """
+    def __init__(self):
+        self.residue = [] #reversals that are not part of a counted cycle yet
+        self._last = None #last distinct value, not yet known to be a reversal
+        self._direction = 0 #sign of the change that led to the last value
+
+    def add(self,values,times):
+        """
+        Adds a chunk of the signal.
+
+        Parameters
+        _____________
+        np_array values
+            1-D array of signal values
+        np_array times
+            1-D array of the time index of each value
+
+        Returns
+        _____________
+        np_array cycle_times
+            time index at which each cycle was counted
+        np_array cycle_ranges
+            range of each cycle multiplied by its count (1 for full cycles,
+            0.5 for the half cycles at the start of the signal)
+        """
+        values = np.asarray(values,dtype=float)
+        times = np.asarray(times)
+        cycle_times = []
+        cycle_ranges = []
+        if len(values) == 0:
+            return np.array(cycle_times,dtype=int),np.array(cycle_ranges)
+
+        #drop repeated values, which are not reversals
+        keep = np.ones(len(values),dtype=bool)
+        keep[1:] = values[1:] != values[:-1]
+        if self._last is not None:
+            keep[0] = values[0] != self._last
+        values = values[keep]
+        times = times[keep]
+        if len(values) == 0:
+            return np.array(cycle_times,dtype=int),np.array(cycle_ranges)
+
+        if self._last is None:
+            #the first value of the signal is a reversal
+            self._push(values[0],times[0],cycle_times,cycle_ranges)
+            self._last = values[0]
+            values = values[1:]
+            times = times[1:]
+            if len(values) == 0:
+                return np.array(cycle_times,dtype=int),np.array(cycle_ranges)
+
+        sequence = np.concatenate(([self._last],values))
+        direction = np.sign(np.diff(sequence))
+        directions = np.concatenate(([self._direction],direction))
+        #sequence[k] is a reversal if the direction changes after it, confirmed at times[k]
+        is_reversal = (directions[:-1] != 0) & (directions[:-1] != directions[1:])
+        for k in np.flatnonzero(is_reversal):
+            self._push(sequence[k],times[k],cycle_times,cycle_ranges)
+
+        self._last = sequence[-1]
+        self._direction = direction[-1]
+        return np.array(cycle_times,dtype=int),np.array(cycle_ranges)
+
+    def _push(self,value,time,cycle_times,cycle_ranges):
+        points = self.residue
+        points.append(value)
+        while len(points) >= 3:
+            X = abs(points[-1] - points[-2])
+            Y = abs(points[-2] - points[-3])
+            if X < Y:
+                break
+            elif len(points) == 3:
+                #Y contains the starting point: one-half cycle
+                cycle_times.append(time)
+                cycle_ranges.append(0.5*Y)
+                points.pop(0)
+            else:
+                cycle_times.append(time)
+                cycle_ranges.append(Y)
+                last = points.pop()
+                points.pop()
+                points.pop()
+                points.append(last)
+
+    def residue_ranges(self):
+        """
+        Sum of the ranges of the cycles that would still be counted if the signal ended
+        after the last value added, with half cycles weighted by 0.5.
+        """
+        if self._last is None:
+            return 0.0
+        counter = RainflowCounter()
+        counter.residue = list(self.residue)
+        cycle_times = []
+        cycle_ranges = []
+        if len(counter.residue) == 0 or counter.residue[-1] != self._last:
+            #the last value of the signal is a reversal
+            counter._push(self._last,0,cycle_times,cycle_ranges)
+        points = counter.residue
+        return np.sum(cycle_ranges) + 0.5*np.sum(np.abs(np.diff(points)))
+
+
+class LifetimeDegradationState:
+    """
+    Degradation state of a single cluster that is carried between the chunks of a
+    lifetime simulation (see `PEM_H2_Clusters.stream_lifetime`).
+    """
+    def __init__(self):
+        self.time_index = 0 #index of the next timestep
+        self.last_status = None #on/off status of the last timestep
+        self.uptime_deg = 0.0 #cumulative uptime degradation [V]
+        self.onoff_deg = 0.0 #cumulative on/off degradation [V]
+        self.fatigue_deg = 0.0 #cumulative fatigue degradation [V]
+        self.rainflow = RainflowCounter()
+
+    def replace_stacks(self):
+        """Resets the degradation when the stacks are replaced."""
+        self.uptime_deg = 0.0
+        self.onoff_deg = 0.0
+        self.fatigue_deg = 0.0
+        self.rainflow = RainflowCounter()
+
+    def copy(self):
+        state = LifetimeDegradationState()
+        state.restore(self)
+        return state
+
+    def restore(self,state):
+        """Sets this state to a copy of `state`."""
+        self.__dict__.update(state.__dict__)
+        self.rainflow = RainflowCounter()
+        self.rainflow.__dict__.update(state.rainflow.__dict__)
+        self.rainflow.residue = list(state.rainflow.residue)
+
+
+#I-V curve coefficients are shared by all clusters of the same stack design
+_iv_curve_cache = {}
+
+
 class PEM_H2_Clusters:
     """
     Create an instance of a low-temperature PEM Electrolyzer System. Each
@@ -60,6 +208,12 @@ class PEM_H2_Clusters:
     Returns
     _____________
 
+    Notes
+    _____________
+    Time series inputs to `run` may be 1-D (a single cluster) or 2-D with one
+    row per cluster, in which case identical clusters are simulated together
+    and results hold one row or value per cluster.
+
     """
     #Remove: estimate_lifetime_capacity_factor
     #Remove: make_lifetime_performance_df_all_opt [x]
@@ -149,8 +303,7 @@ class PEM_H2_Clusters:
         self.cluster_status = self.system_design(input_power_kw,self.max_stacks)
         #calculate number of on/off cycles
         #no delay at beginning of sim
-        cluster_cycling = [0] + list(np.diff(self.cluster_status)) 
-        cluster_cycling = np.array(cluster_cycling)
+        cluster_cycling = self.calc_status_change(self.cluster_status)
         
         #how much to reduce h2 by based on cycling status
         h2_multiplier = np.where(cluster_cycling > 0, startup_ratio, 1)
@@ -191,7 +344,8 @@ class PEM_H2_Clusters:
 
         h20_gal_used_system=self.water_supply(h2_kg_hr_system)
 
-        pem_cf = np.sum(h2_kg_hr_system)/(rated_h2_hr*len(input_power_kw)*self.max_stacks)
+        sim_length = np.shape(input_power_kw)[-1]
+        pem_cf = np.sum(h2_kg_hr_system,axis=-1)/(rated_h2_hr*sim_length*self.max_stacks)
         efficiency = self.system_efficiency(input_power_kw,stack_current) #Efficiency as %-HHV
         
         h2_results={}
@@ -203,7 +357,7 @@ class PEM_H2_Clusters:
         h2_results['electrolyzer_total_efficiency_perc'] = efficiency
         h2_results['kwh_per_kgH2'] = input_power_kw / h2_kg_hr_system
         h2_results['Power Consumed [kWh]'] = system_power_consumed
-        h2_results_aggregates['Warm-Up Losses on H2 Production'] = np.sum(h2_kg_hr_system_init) - np.sum(h2_kg_hr_system)
+        h2_results_aggregates['Warm-Up Losses on H2 Production'] = np.sum(h2_kg_hr_system_init,axis=-1) - np.sum(h2_kg_hr_system,axis=-1)
         
         
         h2_results_aggregates['Stack Life [hours]'] = stack_life
@@ -212,9 +366,9 @@ class PEM_H2_Clusters:
         h2_results_aggregates['Stack Rated H2 Production [kg/hr]'] = rated_h2_hr
         h2_results_aggregates['Cluster Rated Power Consumed [kWh]'] = p_consumed_max*self.max_stacks
         h2_results_aggregates['Cluster Rated H2 Production [kg/hr]'] = rated_h2_hr*self.max_stacks
-        h2_results_aggregates['gal H20 per kg H2'] = np.sum(h20_gal_used_system)/np.sum(h2_kg_hr_system)
+        h2_results_aggregates['gal H20 per kg H2'] = np.sum(h20_gal_used_system,axis=-1)/np.sum(h2_kg_hr_system,axis=-1)
         h2_results_aggregates['Stack Rated Efficiency [kWh/kg]'] = p_consumed_max/rated_h2_hr
-        h2_results_aggregates['Cluster Rated H2 Production [kg/yr]'] = rated_h2_hr*len(input_power_kw)*self.max_stacks
+        h2_results_aggregates['Cluster Rated H2 Production [kg/yr]'] = rated_h2_hr*sim_length*self.max_stacks
         h2_results_aggregates['Operational Time / Simulation Time (ratio)'] = self.percent_of_sim_operating #added
         h2_results_aggregates['Fraction of Life used during sim'] = self.frac_of_life_used #added
         #TODO: add results for stack replacement stuff based on RATED voltage, not distribution
@@ -222,12 +376,12 @@ class PEM_H2_Clusters:
         # h2_results_aggregates['Number of Lifetime Cluster Replacements'] = nsr_life
         h2_results_aggregates['PEM Capacity Factor (simulation)'] = pem_cf
         
-        h2_results_aggregates['Total H2 Production [kg]'] =np.sum(h2_kg_hr_system)
-        h2_results_aggregates['Total Input Power [kWh]'] =np.sum(input_external_power_kw)
-        h2_results_aggregates['Total kWh/kg'] =np.sum(input_external_power_kw)/np.sum(h2_kg_hr_system)
-        h2_results_aggregates['Total Uptime [sec]'] = np.sum(self.cluster_status * self.dt)
-        h2_results_aggregates['Total Off-Cycles'] = np.sum(self.off_cycle_cnt)
-        h2_results_aggregates['Final Degradation [V]'] =self.cumulative_Vdeg_per_hr_sys[-1]
+        h2_results_aggregates['Total H2 Production [kg]'] =np.sum(h2_kg_hr_system,axis=-1)
+        h2_results_aggregates['Total Input Power [kWh]'] =np.sum(input_external_power_kw,axis=-1)
+        h2_results_aggregates['Total kWh/kg'] =np.sum(input_external_power_kw,axis=-1)/np.sum(h2_kg_hr_system,axis=-1)
+        h2_results_aggregates['Total Uptime [sec]'] = np.sum(self.cluster_status * self.dt,axis=-1)
+        h2_results_aggregates['Total Off-Cycles'] = np.sum(self.off_cycle_cnt,axis=-1)
+        h2_results_aggregates['Final Degradation [V]'] =self.cumulative_Vdeg_per_hr_sys[...,-1]
         # h2_results_aggregates['IV curve coeff'] = self.curve_coeff
         # h2_results_aggregates.update(lifetime_performance_df.to_dict()) 
         h2_results_aggregates['Performance By Year'] = annual_performance #double check if errors
@@ -235,6 +389,186 @@ class PEM_H2_Clusters:
         []
         return h2_results, h2_results_aggregates
         # return h2_results_aggregates
+
+    def run_lifetime(self,power_chunks):
+        """
+        Simulates the electrolyzer over its lifetime from input power supplied in chunks,
+        see `stream_lifetime`.
+
+        Returns
+        _____________
+        dict
+            performance by year, {metric: {year: value}}
+        """
+        performance_by_year = {}
+        for year,performance in self.stream_lifetime(power_chunks):
+            for k,v in performance.items():
+                performance_by_year.setdefault(k,{})[year] = v
+        return performance_by_year
+
+    def stream_lifetime(self,power_chunks):
+        """
+        Simulates the electrolyzer over its lifetime from input power supplied in chunks
+        (e.g. one year of a 20-30 year power profile at a time) and yields the performance
+        of each year as soon as it is complete.
+
+        Unlike `run`, which repeats a single simulated year, degradation is simulated
+        continuously over the whole input: the uptime and on/off degradation, the
+        on/off status and the rainflow residue of the fatigue calculation are carried
+        from chunk to chunk, and stacks are replaced whenever their degradation reaches
+        end-of-life. Only the state of the current year is kept in memory, and results
+        do not depend on how the input is split into chunks.
+
+        Parameters
+        _____________
+        iterable power_chunks
+            chunks of input power [kW] at timestep `dt`, each either 1-D (a single cluster)
+            or 2-D with one row per cluster
+
+        Yields
+        _____________
+        tuple (int, dict)
+            year index and {metric: value} for that year; values are arrays over clusters
+            for 2-D input. The final year is yielded even if it is incomplete.
+        """
+        steps_per_year = int(8760*3600/self.dt)
+        states = None
+        year = 0
+        year_totals = None
+        n_in_year = 0
+        for chunk in power_chunks:
+            chunk = np.asarray(chunk,dtype=float)
+            if states is None:
+                single_cluster = chunk.ndim == 1
+                states = [LifetimeDegradationState() for _ in range(len(np.atleast_2d(chunk)))]
+            chunk = np.atleast_2d(chunk)
+            start = 0
+            while start < np.shape(chunk)[-1]:
+                stop = min(start + steps_per_year - n_in_year,np.shape(chunk)[-1])
+                segment_totals = [self._simulate_lifetime_segment(power_kw[start:stop],state) for power_kw,state in zip(chunk,states)]
+                segment_totals = {k:np.array([totals[k] for totals in segment_totals]) for k in segment_totals[0]}
+                if year_totals is None:
+                    year_totals = segment_totals
+                else:
+                    year_totals = {k:year_totals[k] + v for k,v in segment_totals.items()}
+                n_in_year += stop - start
+                start = stop
+                if n_in_year == steps_per_year:
+                    yield year,self._lifetime_year_performance(year_totals,states,n_in_year,single_cluster)
+                    year += 1
+                    year_totals = None
+                    n_in_year = 0
+        if n_in_year > 0:
+            yield year,self._lifetime_year_performance(year_totals,states,n_in_year,single_cluster)
+
+    def _lifetime_year_performance(self,year_totals,states,n_timesteps,single_cluster):
+        _,rated_h2_pr_stack_BOL=self.rated_h2_prod()
+        rated_h2_pr_year = rated_h2_pr_stack_BOL*self.max_stacks*n_timesteps
+        h2_kg = year_totals['h2_kg']
+        energy_kWh = year_totals['energy_kWh']
+        performance = {}
+        performance['Capacity Factor [-]'] = h2_kg/rated_h2_pr_year
+        performance['Refurbishment Schedule [MW replaced/year]'] = self.max_stacks*year_totals['replacements']
+        performance['Annual H2 Production [kg/year]'] = h2_kg
+        performance['Annual Average Efficiency [kWh/kg]'] = energy_kWh/h2_kg
+        performance['Annual Average Efficiency [%-HHV]'] = self.eta_h2_hhv/(energy_kWh/h2_kg)
+        performance['Annual Energy Used [kWh/year]'] = energy_kWh
+        performance['Warm-Up Losses [kg/year]'] = year_totals['h2_kg_no_startup'] - h2_kg
+        performance['Off-Cycles [cycles/year]'] = year_totals['off_cycles']
+        performance['Uptime [hours/year]'] = year_totals['uptime_hrs']
+        performance['End of Year Degradation [V]'] = np.array([state.uptime_deg + state.onoff_deg + state.fatigue_deg for state in states])
+        if single_cluster:
+            performance = {k:v[0] for k,v in performance.items()}
+        return performance
+
+    def _simulate_lifetime_segment(self,input_external_power_kw,state):
+        """
+        Simulates a single cluster over a segment of its lifetime, continuing from
+        and updating `state`. Returns the totals of the segment.
+        """
+        startup_ratio = max(1-(600/self.dt),0)
+        input_power_kw = self.external_power_supply(input_external_power_kw)
+        cluster_status = self.system_design(input_power_kw,self.max_stacks)
+        first_status = cluster_status[0] if state.last_status is None else state.last_status
+        status_change = np.diff(cluster_status,prepend=first_status)
+        n_stacks_op = self.max_stacks*cluster_status
+        power_per_stack = np.divide(input_power_kw,n_stacks_op,out=np.zeros(len(input_power_kw)),where=n_stacks_op>0)
+        stack_current = calc_current((power_per_stack,self.T_C), *self.curve_coeff)
+        V_init = self.cell_design(self.T_C,stack_current)
+
+        #degradation, with stack replacement whenever it exceeds end-of-life
+        death_threshold = self.d_eol_curve[-1]
+        replacements = 0
+        deg_signal = np.zeros(len(cluster_status))
+        i = 0
+        replaced = False
+        while i < len(cluster_status):
+            state_before = state.copy()
+            deg = self._lifetime_degradation(V_init[i:],cluster_status[i:],status_change[i:],state)
+            is_dead = deg > death_threshold
+            if replaced:
+                #a new stack is not replaced again in its first timestep
+                is_dead[0] = False
+            if not np.any(is_dead):
+                deg_signal[i:] = deg
+                break
+            idx_dead = np.argmax(is_dead)
+            state.restore(state_before)
+            deg_signal[i:i+idx_dead] = self._lifetime_degradation(V_init[i:i+idx_dead],cluster_status[i:i+idx_dead],status_change[i:i+idx_dead],state)
+            state.replace_stacks()
+            replacements += 1
+            replaced = True
+            i += idx_dead
+
+        if self.include_deg_penalty:
+            stack_current = self.find_equivalent_input_power_4_deg(power_per_stack,V_init,deg_signal)
+        h2_kg_hr_system_init = self.h2_production_rate(stack_current,n_stacks_op)
+        h2_kg_hr_system = h2_kg_hr_system_init*np.where(status_change > 0, startup_ratio, 1)
+
+        totals = {}
+        totals['h2_kg'] = np.sum(h2_kg_hr_system)
+        totals['h2_kg_no_startup'] = np.sum(h2_kg_hr_system_init)
+        totals['energy_kWh'] = np.sum(input_power_kw*cluster_status)*self.dt/3600
+        totals['off_cycles'] = np.count_nonzero(status_change < 0)
+        totals['uptime_hrs'] = np.sum(cluster_status)*self.dt/3600
+        totals['replacements'] = replacements
+        return totals
+
+    def _lifetime_degradation(self,V_cell,cluster_status,status_change,state):
+        """
+        Cumulative degradation [V] of a single cluster over consecutive timesteps,
+        continuing from and updating `state`.
+        """
+        n = len(cluster_status)
+        if n == 0:
+            return np.zeros(0)
+        voltage_signal = V_cell*cluster_status
+        if self.use_uptime_deg:
+            V_deg_uptime = state.uptime_deg + np.cumsum(self.dt*self.steady_deg_rate*voltage_signal)
+        else:
+            V_deg_uptime = np.full(n,state.uptime_deg)
+        if self.use_onoff_deg:
+            V_deg_onoff = state.onoff_deg + np.cumsum(self.onoff_deg_rate*(status_change < 0))
+        else:
+            V_deg_onoff = np.full(n,state.onoff_deg)
+        if self.use_fatigue_deg:
+            #only count cycles while the electrolyzer is on
+            is_on = cluster_status > 0
+            V_signal = voltage_signal + V_deg_uptime + V_deg_onoff
+            time_index = state.time_index + np.arange(n)
+            cycle_times,cycle_ranges = state.rainflow.add(V_signal[is_on],time_index[is_on])
+            fatigue_per_dt = np.zeros(n)
+            np.add.at(fatigue_per_dt,cycle_times - state.time_index,cycle_ranges*self.rate_fatigue)
+            V_fatigue = state.fatigue_deg + np.cumsum(fatigue_per_dt)
+        else:
+            V_fatigue = np.full(n,state.fatigue_deg)
+
+        state.uptime_deg = V_deg_uptime[-1]
+        state.onoff_deg = V_deg_onoff[-1]
+        state.fatigue_deg = V_fatigue[-1]
+        state.last_status = cluster_status[-1]
+        state.time_index += n
+        return V_deg_uptime + V_deg_onoff + V_fatigue
    
 
     def find_eol_voltage_curve(self,eol_eff_percent_loss):
@@ -267,38 +601,40 @@ class PEM_H2_Clusters:
         if self.use_uptime_deg:
             V_deg_uptime = self.calc_uptime_degradation(voltage_signal)
         else:
-            V_deg_uptime=np.zeros(len(voltage_signal))
+            V_deg_uptime=np.zeros(np.shape(voltage_signal))
         if self.use_onoff_deg:
             V_deg_onoff = self.calc_onoff_degradation()
         else:
-            V_deg_onoff = np.zeros(len(voltage_signal))
+            V_deg_onoff = np.zeros(np.shape(voltage_signal))
         
-        V_signal = voltage_signal + np.cumsum(V_deg_uptime) + np.cumsum(V_deg_onoff)
+        V_deg_uptime_cumulative = np.cumsum(V_deg_uptime,axis=-1)
+        V_deg_onoff_cumulative = np.cumsum(V_deg_onoff,axis=-1)
+        V_signal = voltage_signal + V_deg_uptime_cumulative + V_deg_onoff_cumulative
         if self.use_fatigue_deg:
             V_fatigue=self.approx_fatigue_degradation(V_signal)
         else:
-            V_fatigue=np.zeros(len(voltage_signal))
-        deg_signal = np.cumsum(V_deg_uptime) + np.cumsum(V_deg_onoff) + V_fatigue
+            V_fatigue=np.zeros(np.shape(voltage_signal))
+        deg_signal = V_deg_uptime_cumulative + V_deg_onoff_cumulative + V_fatigue
 
         
         self.cumulative_Vdeg_per_hr_sys=deg_signal
         voltage_final=voltage_signal + deg_signal
         
-        self.output_dict['Cumulative Degradation Breakdown']=pd.DataFrame({'Uptime':np.cumsum(V_deg_uptime),'On/off':np.cumsum(V_deg_onoff),'Fatigue':V_fatigue})
+        self.output_dict['Cumulative Degradation Breakdown']={'Uptime':V_deg_uptime_cumulative,'On/off':V_deg_onoff_cumulative,'Fatigue':V_fatigue}
         return voltage_final, deg_signal
    
     
     def calc_stack_replacement_info(self,deg_signal):
         """Stack life optimistic estimate based on rated efficiency"""
         #[V] degradation at end of simulation
-        d_sim = deg_signal[-1] 
+        d_sim = deg_signal[...,-1] 
         
         #fraction of life that has been "spent" during simulation
         frac_of_life_used = d_sim/self.d_eol_curve[-1]
         #number of hours simulated
-        sim_time_dt = len(deg_signal) 
+        sim_time_dt = np.shape(deg_signal)[-1] 
         #number of hours operating
-        operational_time_dt=np.sum(self.cluster_status) 
+        operational_time_dt=np.sum(self.cluster_status,axis=-1) 
         
         #time between replacement [hrs] based on number of hours operating
         t_eod_operation_based = (1/frac_of_life_used)*operational_time_dt #[hrs]
@@ -314,65 +650,74 @@ class PEM_H2_Clusters:
     def make_yearly_performance_dict(self,power_in_kW,V_deg,V_cell,I_op,grid_connected):
         #NOTE: this is not the most accurate for cases where simulation length is not close to 8760
         #I_op only needed if grid connected, should be singular value
-        refturb_schedule = np.zeros(self.plant_life_years)
+        #time series may have leading cluster dimensions, in which case each yearly value is an array over clusters
+        n_years = int(self.plant_life_years)
+        cluster_shape = np.shape(V_deg)[:-1]
+        refturb_schedule = np.zeros(cluster_shape + (n_years,))
         # refturb_period=int(np.floor(time_between_replacements/8760))
         # refturb_schedule[refturb_period:int(self.plant_life_years):refturb_period]=1
         
-        sim_length = len(V_cell)
+        sim_length = np.shape(V_cell)[-1]
         
         death_threshold = self.d_eol_curve[-1]
         
-        cluster_cycling = [0] + list(np.diff(self.cluster_status)) #no delay at beginning of sim
-        cluster_cycling = np.array(cluster_cycling)
+        cluster_cycling = self.calc_status_change(self.cluster_status) #no delay at beginning of sim
         startup_ratio = 1-(600/3600)#TODO: don't have this hard-coded
         h2_multiplier = np.where(cluster_cycling > 0, startup_ratio, 1)
         
         _,rated_h2_pr_stack_BOL=self.rated_h2_prod()
         rated_h2_pr_sim = rated_h2_pr_stack_BOL*self.max_stacks*sim_length
 
-        kg_h2_pr_sim = np.zeros(int(self.plant_life_years))
-        capfac_per_sim = np.zeros(int(self.plant_life_years))
-        d_sim = np.zeros(int(self.plant_life_years))
-        power_pr_yr_kWh = np.zeros(int(self.plant_life_years))
-        Vdeg0 = 0
+        kg_h2_pr_sim = np.zeros(cluster_shape + (n_years,))
+        capfac_per_sim = np.zeros(cluster_shape + (n_years,))
+        d_sim = np.zeros(cluster_shape + (n_years,))
+        power_pr_yr_kWh = np.zeros(cluster_shape + (n_years,))
+        Vdeg0 = np.zeros(cluster_shape)
+        time_index = np.arange(sim_length)
         
-        for i in range(int(self.plant_life_years)): #assuming sim is close to a year
-            V_deg_pr_sim = Vdeg0 + V_deg
+        for i in range(n_years): #assuming sim is close to a year
+            V_deg_pr_sim = Vdeg0[...,np.newaxis] + V_deg
             
             # it_died = any(V_deg_pr_sim>death_threshold)
-            if np.max(V_deg_pr_sim)>death_threshold:
-                #it died
-                idx_dead = np.argwhere(V_deg_pr_sim>death_threshold)[0][0]
-                V_deg_pr_sim = np.concatenate([V_deg_pr_sim[0:idx_dead],V_deg[idx_dead:sim_length]])
+            is_dead = V_deg_pr_sim>death_threshold
+            it_died = np.any(is_dead,axis=-1)
+            if np.any(it_died):
+                #it died: degradation restarts from the replacement onwards
+                idx_dead = np.argmax(is_dead,axis=-1)
+                replaced = it_died[...,np.newaxis] & (time_index >= idx_dead[...,np.newaxis])
+                V_deg_pr_sim = np.where(replaced,V_deg,V_deg_pr_sim)
                 # i_sim_dead = i
-                refturb_schedule[i]=self.max_stacks
+                refturb_schedule[...,i]=np.where(it_died,self.max_stacks,0)
                 
             if not grid_connected:
                 stack_current = self.find_equivalent_input_power_4_deg(power_in_kW,V_cell,V_deg_pr_sim)
                 h2_kg_hr_system_init = self.h2_production_rate(stack_current,self.n_stacks_op)
                 # total_sim_input_power = self.max_stacks*np.sum(power_in_kW)
-                power_pr_yr_kWh[i] = self.max_stacks*np.sum(power_in_kW)
+                power_pr_yr_kWh[...,i] = self.max_stacks*np.sum(power_in_kW,axis=-1)
             else:
                 h2_kg_hr_system_init = self.h2_production_rate(I_op,self.n_stacks_op)
-                h2_kg_hr_system_init = h2_kg_hr_system_init*np.ones(len(power_in_kW))
+                h2_kg_hr_system_init = h2_kg_hr_system_init*np.ones(np.shape(power_in_kW))
                 annual_power_consumed_kWh = self.max_stacks*I_op*(V_cell + V_deg_pr_sim)*self.N_cells/1000
                 # total_sim_input_power = np.sum(annual_power_consumed_kWh)
-                power_pr_yr_kWh[i] = np.sum(annual_power_consumed_kWh)
+                power_pr_yr_kWh[...,i] = np.sum(annual_power_consumed_kWh,axis=-1)
 
             h2_kg_hr_system = h2_kg_hr_system_init*h2_multiplier
-            kg_h2_pr_sim[i] = np.sum(h2_kg_hr_system)
-            capfac_per_sim[i] = np.sum(h2_kg_hr_system)/rated_h2_pr_sim
-            d_sim[i] = V_deg_pr_sim[sim_length-1]
-            Vdeg0 = V_deg_pr_sim[sim_length-1]
+            kg_h2_pr_sim[...,i] = np.sum(h2_kg_hr_system,axis=-1)
+            capfac_per_sim[...,i] = np.sum(h2_kg_hr_system,axis=-1)/rated_h2_pr_sim
+            d_sim[...,i] = V_deg_pr_sim[...,sim_length-1]
+            Vdeg0 = V_deg_pr_sim[...,sim_length-1]
         performance_by_year = {}
-        year = np.arange(0,int(self.plant_life_years),1)
+        year = np.arange(0,n_years,1)
+
+        def by_year(vals):
+            return dict(zip(year,np.moveaxis(vals,-1,0)))
         
-        performance_by_year['Capacity Factor [-]'] = dict(zip(year,capfac_per_sim))
-        performance_by_year['Refurbishment Schedule [MW replaced/year]'] = dict(zip(year,refturb_schedule))
-        performance_by_year['Annual H2 Production [kg/year]'] = dict(zip(year,kg_h2_pr_sim))
-        performance_by_year['Annual Average Efficiency [kWh/kg]'] = dict(zip(year,power_pr_yr_kWh/kg_h2_pr_sim))
-        performance_by_year['Annual Average Efficiency [%-HHV]'] = dict(zip(year,self.eta_h2_hhv/(power_pr_yr_kWh/kg_h2_pr_sim)))
-        performance_by_year['Annual Energy Used [kWh/year]'] = dict(zip(year,power_pr_yr_kWh))
+        performance_by_year['Capacity Factor [-]'] = by_year(capfac_per_sim)
+        performance_by_year['Refurbishment Schedule [MW replaced/year]'] = by_year(refturb_schedule)
+        performance_by_year['Annual H2 Production [kg/year]'] = by_year(kg_h2_pr_sim)
+        performance_by_year['Annual Average Efficiency [kWh/kg]'] = by_year(power_pr_yr_kWh/kg_h2_pr_sim)
+        performance_by_year['Annual Average Efficiency [%-HHV]'] = by_year(self.eta_h2_hhv/(power_pr_yr_kWh/kg_h2_pr_sim))
+        performance_by_year['Annual Energy Used [kWh/year]'] = by_year(power_pr_yr_kWh)
 
         return performance_by_year
 
@@ -391,28 +736,47 @@ class PEM_H2_Clusters:
     def calc_uptime_degradation(self,voltage_signal):
         #steady_deg_rate = 1.12775521e-09
         steady_deg_per_hr=self.dt*self.steady_deg_rate*voltage_signal*self.cluster_status
-        cumulative_Vdeg=np.cumsum(steady_deg_per_hr)
-        self.output_dict['Total Uptime [sec]'] = np.sum(self.cluster_status * self.dt)
-        self.output_dict['Total Uptime Degradation [V]'] = cumulative_Vdeg[-1]
+        cumulative_Vdeg=np.cumsum(steady_deg_per_hr,axis=-1)
+        self.output_dict['Total Uptime [sec]'] = np.sum(self.cluster_status * self.dt,axis=-1)
+        self.output_dict['Total Uptime Degradation [V]'] = cumulative_Vdeg[...,-1]
 
         return steady_deg_per_hr
         
+    def calc_status_change(self,cluster_status):
+        """
+        Change of the on/off status from the previous timestep along the last
+        axis: 1 when turned on, -1 when turned off. Zero for the first timestep.
+        """
+        status_change = np.zeros(np.shape(cluster_status),dtype=int)
+        status_change[...,1:] = np.diff(cluster_status,axis=-1)
+        return status_change
+
     def calc_onoff_degradation(self):
         
         
-        change_stack=np.diff(self.cluster_status)
+        change_stack=self.calc_status_change(self.cluster_status)
         cycle_cnt = np.where(change_stack < 0, -1*change_stack, 0)
-        cycle_cnt = np.array([0] + list(cycle_cnt))
         self.off_cycle_cnt = cycle_cnt
         stack_off_deg_per_hr= self.onoff_deg_rate*cycle_cnt
-        self.output_dict['System Cycle Degradation [V]'] = np.cumsum(stack_off_deg_per_hr)[-1]
+        self.output_dict['System Cycle Degradation [V]'] = np.sum(stack_off_deg_per_hr,axis=-1)
         self.output_dict['Off-Cycles'] = cycle_cnt
         return stack_off_deg_per_hr
 
     def approx_fatigue_degradation(self,voltage_signal,dt_fatigue_calc_hrs=168):
         #should not use voltage values when voltage_signal = 0
         #aka - should only be counted when electrolyzer is on
-        
+        if np.ndim(voltage_signal) > 1:
+            #rainflow counting is sequential, so the clusters are counted one at a time
+            V_fatigue_ts = np.zeros(np.shape(voltage_signal))
+            fatigue_outputs = {}
+            for idx in np.ndindex(np.shape(voltage_signal)[:-1]):
+                V_fatigue_ts[idx] = self.approx_fatigue_degradation(voltage_signal[idx],dt_fatigue_calc_hrs)
+                for k in ['Approx Total Fatigue Degradation [V]','Sim End RF Track','Total Actual Fatigue Degradation [V]']:
+                    fatigue_outputs.setdefault(k,[]).append(self.output_dict.pop(k,np.nan))
+            for k,vals in fatigue_outputs.items():
+                self.output_dict[k] = np.reshape(vals,np.shape(voltage_signal)[:-1])
+            return V_fatigue_ts
+
         t_calc=np.arange(0,len(voltage_signal)+dt_fatigue_calc_hrs ,dt_fatigue_calc_hrs ) 
         v_max=np.max(voltage_signal)
         v_min=np.min(voltage_signal)
@@ -579,24 +943,20 @@ class PEM_H2_Clusters:
 
         calls cell_design() which calculates the cell voltage
         """
+        design_key = (self.T_C,self.N_cells,self.cell_active_area,self.membrane_thickness,self.stack_input_current_lower_bound,self.max_cell_current)
+        if design_key in _iv_curve_cache:
+            return _iv_curve_cache[design_key].copy()
         # current_range = np.arange(0,self.max_cell_current+10,10) 
         current_range = np.arange(self.stack_input_current_lower_bound,self.max_cell_current+10,10) 
         temp_range = np.arange(40,self.T_C+5,5)
-        idx = 0
-        powers = np.zeros(len(current_range)*len(temp_range))
-        currents = np.zeros(len(current_range)*len(temp_range))
-        temps_C = np.zeros(len(current_range)*len(temp_range))
-        for i in range(len(current_range)):
-            
-            for t in range(len(temp_range)):
-                powers[idx] = current_range[i]*self.cell_design(temp_range[t],current_range[i])*self.N_cells*(1e-3) #stack power
-                currents[idx] = current_range[i]
-                temps_C[idx] = temp_range[t]
-                idx = idx+1
+        currents = np.repeat(current_range,len(temp_range))
+        temps_C = np.tile(temp_range,len(current_range))
+        powers = currents*self.cell_design(temps_C,currents)*self.N_cells*(1e-3) #stack power
         df=pd.DataFrame({'Power':powers,'Current':currents,'Temp':temps_C}) #added
         temp_oi_idx = df.index[df['Temp']==self.T_C]      #added  
         # curve_coeff, curve_cov = scipy.optimize.curve_fit(calc_current, (powers,temps_C), currents, p0=(1.0,1.0,1.0,1.0,1.0,1.0)) #updates IV curve coeff
         curve_coeff, curve_cov = scipy.optimize.curve_fit(calc_current, (df['Power'][temp_oi_idx].values,df['Temp'][temp_oi_idx].values), df['Current'][temp_oi_idx].values, p0=(1.0,1.0,1.0,1.0,1.0,1.0))
+        _iv_curve_cache[design_key] = curve_coeff.copy()
         return curve_coeff
 
     def system_design(self,input_power_kw,cluster_size_mw):
@@ -816,7 +1176,7 @@ class PEM_H2_Clusters:
         
         water_used_kg_hr_system = h2_kg_hr * 10
         self.output_dict['water_used_kg_hr'] = water_used_kg_hr_system
-        self.output_dict['water_used_kg_annual'] = np.sum(water_used_kg_hr_system)
+        self.output_dict['water_used_kg_annual'] = np.sum(water_used_kg_hr_system,axis=-1)
         water_used_gal_hr_system = water_used_kg_hr_system/3.79
         return water_used_gal_hr_system 
 
@@ -828,8 +1188,7 @@ class PEM_H2_Clusters:
         startup_ratio = 1-(startup_time/self.dt)
         self.cluster_status = self.system_design(power_input_signal,self.max_stacks)
         self.n_stacks_op = self.max_stacks*self.cluster_status
-        cluster_cycling = [0] + list(np.diff(self.cluster_status)) #no delay at beginning of sim
-        cluster_cycling = np.array(cluster_cycling)
+        cluster_cycling = self.calc_status_change(self.cluster_status) #no delay at beginning of sim
         power_per_stack = np.where(self.n_stacks_op>0,power_input_signal/self.n_stacks_op,0)
         
         h2_multiplier = np.where(cluster_cycling > 0, startup_ratio, 1)
@@ -182,3 +182,185 @@ def optimize(
         model.AC[0].value,
         model.F_tot[0].value,
     )
+
+
+class PowerSplitOptimizer:
+    """
+    Reusable MILP that splits the available power among electrolyzer stacks over a
+    window of `T` timesteps, with the formulation of `optimize`.
+
+    The model is built once. The available power and the on/off state of the stacks
+    before the window are mutable parameters that `solve` updates in place, so the
+    in-process persistent `appsi_highs` solver (requires `highspy`) only receives the
+    changed values of each window. The variables keep the solution of the previous solve,
+    which is used to warm-start the next one. The default solver is `cbc`, as for dispatch.
+
+    If the state before the window is given, switching a stack at the first timestep
+    of the window is charged the switching cost, which couples consecutive windows.
+    """
+
+    def __init__(
+        self,
+        T=50,
+        n_stacks=3,
+        c_wp=0,
+        c_sw=12,
+        rated_power=500,
+        dt=1,
+        solver="cbc",
+        solver_options=None,
+    ):
+        self.T = T
+        self.n_stacks = n_stacks
+        self.rated_power = rated_power
+        self.dt = dt
+        self.solver = solver
+        if solver_options is None:
+            solver_options = {"mip_rel_gap": 0.001} if solver == "appsi_highs" else {"ratioGap": 0.001}
+        self.solver_options = solver_options
+        self.model = self.build_model(T, n_stacks, c_wp, c_sw, rated_power, dt)
+        self.opt = None
+
+    @staticmethod
+    def build_model(T, n_stacks, c_wp, c_sw, rated_power, dt):
+        C_INV = 1.47e6
+        LT = 90000
+        P_max = rated_power
+        P_min = 0.1 * rated_power
+
+        model = ConcreteModel()
+        model.time = RangeSet(0, T - 1)
+        model.stacks = RangeSet(0, n_stacks - 1)
+
+        model.P_wind = Param(model.time, initialize=0.0, mutable=True)
+        # on/off state before the window; with the defaults the first switch is free
+        model.I_prev_upper = Param(model.stacks, initialize=1.0, mutable=True)
+        model.I_prev_lower = Param(model.stacks, initialize=0.0, mutable=True)
+        model.eps = Param(initialize=1, mutable=True)
+
+        model.p = Var(model.time, model.stacks, bounds=(-1e-2, rated_power), initialize=0)
+        model.I = Var(model.time, model.stacks, within=Binary, initialize=0)
+        model.T = Var(model.time, model.stacks, within=Binary, initialize=0)
+        model.AC = Var(bounds=(1e-3, 1.2 * rated_power * n_stacks * T), initialize=1)
+        model.F_tot = Var(bounds=(1e-3, 8 * rated_power * n_stacks * T), initialize=1)
+
+        model.physical_constraint_AC = Constraint(
+            expr=model.AC
+            == sum(c_wp * model.p[t, s] + c_sw * model.T[t, s] for t in model.time for s in model.stacks)
+            + C_INV * n_stacks / LT
+        )
+        model.physical_constraint_F_tot = Constraint(
+            expr=model.F_tot
+            == sum(
+                (0.0145 * model.p[t, s] + 0.3874 * model.I[t, s] * rated_power / 500) * dt
+                for t in model.time
+                for s in model.stacks
+            )
+        )
+        model.power_constraint = Constraint(
+            model.time, rule=lambda m, t: sum(m.p[t, s] for s in m.stacks) <= m.P_wind[t]
+        )
+        model.safety_bounds_lower = Constraint(
+            model.time, model.stacks, rule=lambda m, t, s: P_min * m.I[t, s] <= m.p[t, s]
+        )
+        model.safety_bounds_upper = Constraint(
+            model.time, model.stacks, rule=lambda m, t, s: P_max * m.I[t, s] >= m.p[t, s]
+        )
+
+        def switching_constraint_pos(m, t, s):
+            if t == 0:
+                return m.T[t, s] >= m.I[t, s] - m.I_prev_upper[s]
+            return m.T[t, s] >= m.I[t, s] - m.I[t - 1, s]
+
+        def switching_constraint_neg(m, t, s):
+            if t == 0:
+                return m.T[t, s] >= m.I_prev_lower[s] - m.I[t, s]
+            return m.T[t, s] >= m.I[t - 1, s] - m.I[t, s]
+
+        model.switching_constraint_pos = Constraint(model.time, model.stacks, rule=switching_constraint_pos)
+        model.switching_constraint_neg = Constraint(model.time, model.stacks, rule=switching_constraint_neg)
+        model.objective = Objective(expr=model.AC - model.eps * model.F_tot, sense=minimize)
+        return model
+
+    def set_initial_values(self, P_, I_, Tr):
+        """Sets the warm-start values of the stack power, on/off and switching variables, [T x n_stacks] arrays."""
+        for var, vals in ((self.model.p, P_), (self.model.I, I_), (self.model.T, Tr)):
+            vals = np.asarray(vals)
+            for (t, s), v in var.items():
+                if t < len(vals):
+                    v.set_value(vals[t, s], skip_validation=True)
+
+    def _solve_model(self):
+        if self.opt is None:
+            self.opt = SolverFactory(self.solver)
+            if self.solver == "appsi_highs":
+                if not self.opt.available(exception_flag=False):
+                    raise ImportError(
+                        "The appsi_highs solver requires the highspy package, install it with "
+                        "`pip install highspy` or use the default cbc solver"
+                    )
+                # in-process persistent solver, only parameter values change between windows
+                self.opt.update_config.check_for_new_or_removed_constraints = False
+                self.opt.update_config.check_for_new_or_removed_vars = False
+                self.opt.update_config.check_for_new_or_removed_params = False
+                self.opt.update_config.check_for_new_objective = False
+                self.opt.update_config.update_constraints = False
+                self.opt.update_config.update_vars = False
+        results = self.opt.solve(
+            self.model, options=self.solver_options, warmstart=self.opt.warm_start_capable()
+        )
+        if results.solver.termination_condition not in (
+            TerminationCondition.optimal,
+            TerminationCondition.maxTimeLimit,
+        ):
+            raise RuntimeError(
+                "Power split optimization failed: {}".format(results.solver.termination_condition)
+            )
+        return results
+
+    def solve(self, P_wind_t, I_prev=None):
+        """
+        Optimizes the power split of one window.
+
+        Parameters
+        _____________
+        np_array P_wind_t
+            available power of each timestep of the window
+        np_array I_prev
+            on/off state of each stack at the timestep before the window, or None to
+            leave the state at the start of the window free
+
+        Returns
+        _____________
+        tuple
+            (P_tot_opt, P_, H2f, I_, Tr, P_wind_t, AC, F_tot) as returned by `optimize`
+        """
+        model = self.model
+        P_wind_t = np.asarray(P_wind_t, dtype=float)
+        model.P_wind.store_values(dict(enumerate(P_wind_t)))
+        if I_prev is None:
+            model.I_prev_upper.store_values(1.0)
+            model.I_prev_lower.store_values(0.0)
+        else:
+            I_prev = dict(enumerate(np.round(I_prev).astype(float)))
+            model.I_prev_upper.store_values(I_prev)
+            model.I_prev_lower.store_values(I_prev)
+
+        self._solve_model()
+
+        shape = (self.T, self.n_stacks)
+        P_ = np.fromiter((v.value for v in model.p.values()), dtype=float, count=len(model.p)).reshape(shape)
+        I_ = np.round(np.fromiter((v.value for v in model.I.values()), dtype=float, count=len(model.I))).reshape(shape)
+        Tr = np.round(np.fromiter((v.value for v in model.T.values()), dtype=float, count=len(model.T))).reshape(shape)
+        P_tot_opt = np.sum(P_, axis=1)
+        H2f = (0.0145 * P_ + 0.3874 * I_ * self.rated_power / 500) * self.dt
+        return (
+            P_tot_opt,
+            P_,
+            H2f,
+            I_,
+            Tr,
+            P_wind_t,
+            model.AC.value,
+            model.F_tot.value,
+        )
@@ -26,7 +26,8 @@ import matplotlib.pyplot as plt
 import pandas as pd
 
 
-from hopp.simulation.technologies.hydrogen.electrolysis.optimization_utils_linear import optimize
+from hopp.simulation.technologies.hydrogen.electrolysis.optimization_utils_linear import PowerSplitOptimizer
+from multiprocessing import Pool
 import time
 
 # from PyOMO import ipOpt !! FOR SANJANA!!
@@ -115,152 +116,158 @@ class run_PEM_clusters:
 
 
     def run(self, optimize=False):
+        """Simulates all clusters and returns the time series and aggregate results as DataFrames
+        with one column per cluster (see `run_clusters` for the columnar results)."""
+        h2_ts, h2_tot = self.run_clusters(optimize=optimize)
+        return self.cluster_results_to_dataframes(h2_ts, h2_tot)
+
+    def run_clusters(self, optimize=False):
+        """Simulates all clusters as one batched (clusters x timesteps) computation.
+
+        Returns:
+            `h2_ts`: dict of time series results, each a [num_clusters x timesteps] array
+            `h2_tot`: dict of aggregate results, each a [num_clusters] array, except for
+                'Performance By Year' which is a dict of [num_clusters x years] arrays
+        """
         # TODO: add control type as input!
-        clusters = self.create_clusters()  # initialize clusters
         if optimize:
             power_to_clusters = self.optimize_power_split()  # run Sanjana's code
         else:
             power_to_clusters = self.even_split_power()
-        h2_df_ts = pd.DataFrame()
-        h2_df_tot = pd.DataFrame()
 
-        col_names = []
         start = time.perf_counter()
-        for ci, cluster in enumerate(clusters):
-            cl_name = "Cluster #{}".format(ci)
-            col_names.append(cl_name)
-            h2_ts, h2_tot = clusters[ci].run(power_to_clusters[ci])
-            # h2_dict_ts['Cluster #{}'.format(ci)] = h2_ts
-
-            h2_ts_temp = pd.Series(h2_ts, name=cl_name)
-            h2_tot_temp = pd.Series(h2_tot, name=cl_name)
-            if len(h2_df_tot) == 0:
-                # h2_df_ts=pd.concat([h2_df_ts,h2_ts_temp],axis=0,ignore_index=False)
-                h2_df_tot = pd.concat(
-                    [h2_df_tot, h2_tot_temp], axis=0, ignore_index=False
-                )
-                h2_df_tot.columns = col_names
-
-                h2_df_ts = pd.concat([h2_df_ts, h2_ts_temp], axis=0, ignore_index=False)
-                h2_df_ts.columns = col_names
-            else:
-                # h2_df_ts = h2_df_ts.join(h2_ts_temp)
-                h2_df_tot = h2_df_tot.join(h2_tot_temp)
-                h2_df_tot.columns = col_names
-
-                h2_df_ts = h2_df_ts.join(h2_ts_temp)
-                h2_df_ts.columns = col_names
-
+        # the clusters are identical, so a single model simulates all of them with one row per cluster
+        self.cluster_model = self.create_cluster_model()
+        h2_ts, h2_tot = self.cluster_model.run(np.asarray(power_to_clusters, dtype=float))
+
+        n_clusters = np.shape(power_to_clusters)[0]
+        performance_by_year = h2_tot.pop("Performance By Year")
+        h2_tot = {
+            k: np.broadcast_to(v, (n_clusters,)) for k, v in h2_tot.items()
+        }
+        h2_tot["Performance By Year"] = {
+            k: np.column_stack(list(v.values())) for k, v in performance_by_year.items()
+        }
         end = time.perf_counter()
-        self.clusters = clusters
         print("Took {} sec to run the RUN function".format(round(end - start, 3)))
-        return h2_df_ts, h2_df_tot
-        # return h2_dict_ts, h2_df_tot
-
-    def optimize_power_split(self):
-        number_of_stacks = self.num_clusters
-        rated_power = self.cluster_cap_mw * 1000
-        tf = 96
-        n_times_to_run = int(np.ceil(self.T / tf))
-        df = pd.DataFrame({"Wind + PV Generation": self.input_power_kw})
-        P_ = None
-        I_ = None
-        Tr_ = None
-        AC = 1
-        F_tot = 1
-        diff = 0
-
-        for start_time in range(n_times_to_run):
-            print(
-                f"Optimizing {number_of_stacks} stacks tarting {start_time*tf}hr/{self.T}hr"
-            )
-            if start_time == 0:
-
-                df["Wind + PV Generation"].replace(0, np.NaN, inplace=True)
-                df = df.interpolate()
-
-            P_wind_t = df["Wind + PV Generation"][
-                (start_time * tf) : ((start_time * tf) + tf)
-            ].values
-            start = time.time()
-            if P_ is not None:
-                P_ = P_[: len(P_wind_t), :]
-                I_ = I_[: len(P_wind_t), :]
-                Tr_ = Tr_[: len(P_wind_t), :]
-            P_tot_opt, P_, H2f, I_, Tr_, P_wind_t, AC, F_tot = optimize(
-                P_wind_t,
-                T=(len(P_wind_t)),
-                n_stacks=(number_of_stacks),
-                c_wp=0,
-                c_sw=self.switching_cost,
-                rated_power=rated_power,
-                P_init=P_,
-                I_init=I_,
-                T_init=Tr_,
-                AC_init=AC,
-                F_tot_init=F_tot,
-            )
+        return h2_ts, h2_tot
+
+    @staticmethod
+    def cluster_results_to_dataframes(h2_ts, h2_tot):
+        """Converts the columnar results of `run_clusters` to DataFrames with one column per cluster,
+        indexed by result name."""
+        performance_by_year = h2_tot["Performance By Year"]
+        n_clusters = len(next(iter(h2_ts.values())))
+        n_years = np.shape(next(iter(performance_by_year.values())))[1]
+        col_names = ["Cluster #{}".format(ci) for ci in range(n_clusters)]
+        ts_data = {}
+        tot_data = {}
+        for ci, cl_name in enumerate(col_names):
+            ts_data[cl_name] = pd.Series({k: v[ci] for k, v in h2_ts.items()}, dtype=object)
+            cluster_tot = {
+                k: v[ci] for k, v in h2_tot.items() if k != "Performance By Year"
+            }
+            cluster_tot["Performance By Year"] = {
+                k: dict(zip(np.arange(n_years), v[ci]))
+                for k, v in performance_by_year.items()
+            }
+            tot_data[cl_name] = pd.Series(cluster_tot, dtype=object)
+        return pd.DataFrame(ts_data), pd.DataFrame(tot_data)
+
+    def optimize_power_split(self, window_hrs=96, n_workers=1, solver="cbc", solver_options=None):
+        """Splits the input power among the clusters by solving the power split MILP
+        (`PowerSplitOptimizer`) over consecutive windows of `window_hrs` timesteps.
+
+        With `n_workers=1` the windows are solved in order with a single reusable model per
+        window length and a warm-started solver. The on/off state at the end of each window
+        is passed to the next one, so switching a cluster at a window boundary is charged the
+        switching cost. The default solver is `cbc`; `appsi_highs` is an in-process persistent
+        solver that requires the `highspy` package.
+
+        With `n_workers>1` the windows are solved independently on a pool of processes, each
+        with its own reusable model. The boundary coupling is then approximated: the on/off
+        state before each window is left free, so switches at window boundaries are not
+        charged and the number of switches can be slightly underestimated.
+
+        Returns:
+            `power_to_clusters`: [num_clusters x timesteps] array of power to each cluster
+        """
+        start = time.perf_counter()
+        optimizer_args = {
+            "n_stacks": self.num_clusters,
+            "c_wp": 0,
+            "c_sw": self.switching_cost,
+            "rated_power": self.cluster_cap_mw * 1000,
+            "solver": solver,
+            "solver_options": solver_options,
+        }
+        # periods without power are interpolated over to avoid switching clusters off
+        available_power = (
+            pd.Series(self.input_power_kw, dtype=float).replace(0, np.nan).interpolate().fillna(0).values
+        )
+        window_starts = range(0, self.T, window_hrs)
+        windows = [available_power[t : t + window_hrs] for t in window_starts]
 
-            diff += time.time() - start
-            if type(AC).__module__ != "numpy":
-                AC = np.array(AC)
-                F_tot = np.array(F_tot)
-            if start_time == 0:
-                P_tot_opt_full = P_tot_opt
-                P_full = P_
-                P_wind_t_full = P_wind_t
-                H2f_full = H2f
-                I_full = I_
-                Tr_full = np.sum(Tr_, axis=0)
-                AC_full = AC
-                F_tot_full = F_tot
-
-            else:
-
-                P_full = np.vstack((P_full, P_))
-                H2f_full = np.vstack((H2f_full, H2f))
-                I_full = np.vstack((I_full, I_))
-                Tr_full = np.vstack((Tr_full, np.sum(Tr_, axis=0)))
-                AC_full = np.vstack((AC_full, (AC)))
-                F_tot_full = np.vstack((F_tot_full, (F_tot)))
-
-        return np.transpose(P_full)
+        if n_workers > 1:
+            with Pool(n_workers, initializer=_init_power_split_worker, initargs=(optimizer_args,)) as pool:
+                window_splits = pool.map(_optimize_power_split_window, windows)
+        else:
+            optimizers = {}
+            window_splits = []
+            I_prev = None
+            for t, P_wind_t in zip(window_starts, windows):
+                print(
+                    f"Optimizing {self.num_clusters} stacks starting {t}hr/{self.T}hr"
+                )
+                optimizer = optimizers.get(len(P_wind_t))
+                if optimizer is None:
+                    optimizer = PowerSplitOptimizer(T=len(P_wind_t), **optimizer_args)
+                    if window_splits:
+                        # warm-start a new window length from the previous window
+                        optimizer.set_initial_values(P_, I_, Tr_)
+                    optimizers[len(P_wind_t)] = optimizer
+                _, P_, _, I_, Tr_, _, _, _ = optimizer.solve(P_wind_t, I_prev=I_prev)
+                I_prev = I_[-1]
+                window_splits.append(P_)
+
+        power_to_clusters = np.zeros((self.T, self.num_clusters))
+        for t, P_ in zip(window_starts, window_splits):
+            power_to_clusters[t : t + len(P_)] = P_
+        end = time.perf_counter()
+        print(
+            "Took {} sec to run optimize_power_split function".format(
+                round(end - start, 3)
+            )
+        )
+        return np.transpose(power_to_clusters)
 
     def even_split_power(self):
         start = time.perf_counter()
+        input_power_kw = np.asarray(self.input_power_kw, dtype=float)
         # determine how much power to give each cluster
-        num_clusters_on = np.floor(self.input_power_kw / self.cluster_min_power)
+        num_clusters_on = np.floor(input_power_kw / self.cluster_min_power)
         num_clusters_on = np.where(
             num_clusters_on > self.num_clusters, self.num_clusters, num_clusters_on
         )
-        power_per_cluster = [
-            self.input_power_kw[ti] / num_clusters_on[ti]
-            if num_clusters_on[ti] > 0
-            else 0
-            for ti, pwr in enumerate(self.input_power_kw)
-        ]
-
-        power_per_to_active_clusters = np.array(power_per_cluster)
-        power_to_clusters = np.zeros((len(self.input_power_kw), self.num_clusters))
-        for i, cluster_power in enumerate(
-            power_per_to_active_clusters
-        ):  # np.arange(0,self.n_stacks,1):
-            clusters_off = self.num_clusters - int(num_clusters_on[i])
-            no_power = np.zeros(clusters_off)
-            with_power = cluster_power * np.ones(int(num_clusters_on[i]))
-            tot_power = np.concatenate((with_power, no_power))
-            power_to_clusters[i] = tot_power
-
-        # power_to_clusters = np.repeat([power_per_cluster],self.num_clusters,axis=0)
+        power_per_cluster = np.divide(
+            input_power_kw,
+            num_clusters_on,
+            out=np.zeros(len(input_power_kw)),
+            where=num_clusters_on > 0,
+        )
+
+        # the first `num_clusters_on` clusters share the power, the others are off
+        cluster_on = np.arange(self.num_clusters)[:, np.newaxis] < num_clusters_on
+        power_to_clusters = np.where(cluster_on, power_per_cluster, 0.0)
         end = time.perf_counter()
         print(
             "Took {} sec to run even_split_power function".format(
                 round(end - start, 3)
             )
         )
-        # rows are power, columns are stacks [300 x n_stacks]
+        # rows are clusters, columns are timesteps [n_clusters x 8760]
 
-        return np.transpose(power_to_clusters)
+        return power_to_clusters
 
     def max_h2_cntrl(self):
         # run as many at lower power as possible
@@ -270,6 +277,15 @@ class run_PEM_clusters:
         # run as few as possible
         []
 
+    def create_cluster_model(self):
+        return PEMClusters(
+            self.cluster_cap_mw,
+            self.plant_life_yrs,
+            *self.user_params,
+            self.use_deg_penalty,
+            self.turndown_ratio,
+        )
+
     def create_clusters(self):
         start = time.perf_counter()
         stacks = []
@@ -277,20 +293,30 @@ class run_PEM_clusters:
         # in_dict={'dt':3600}
         for i in range(self.num_clusters):
             # stacks.append(PEMClusters(cluster_size_mw = self.cluster_cap_mw))
-            stacks.append(
-                PEMClusters(
-                    self.cluster_cap_mw,
-                    self.plant_life_yrs,
-                    *self.user_params,
-                    self.use_deg_penalty,
-                    self.turndown_ratio,
-                )
-            )
+            stacks.append(self.create_cluster_model())
         end = time.perf_counter()
         print("Took {} sec to run the create clusters".format(round(end - start, 3)))
         return stacks
 
 
+_power_split_optimizers = {}
+_power_split_args = {}
+
+
+def _init_power_split_worker(optimizer_args):
+    """Pool initializer: each worker process keeps its own reusable models."""
+    _power_split_optimizers.clear()
+    _power_split_args.update(optimizer_args)
+
+
+def _optimize_power_split_window(P_wind_t):
+    optimizer = _power_split_optimizers.get(len(P_wind_t))
+    if optimizer is None:
+        optimizer = PowerSplitOptimizer(T=len(P_wind_t), **_power_split_args)
+        _power_split_optimizers[len(P_wind_t)] = optimizer
+    return optimizer.solve(P_wind_t)[1]
+
+
 if __name__ == "__main__":
 
     system_size_mw = 1000
@@ -88,3 +88,39 @@ def cycle(p, R0, thickness_init,
     return (thickness, WTAF, n_iter)
 
 
+def cycle_vectorized(p, R0, thickness_init,
+                     Syield, Sultimate,
+                     proof_factor= 3./2.,
+                     burst_factor= 2.25,
+                     max_iter= 10,
+                     WTAF_tol= 1e-6):
+    """
+    cycle for many tanks at once: inputs are broadcast against each other and
+    each element follows the same iterations as `cycle`
+    """
+
+    p, R0, thickness, Syield, Sultimate= np.broadcast_arrays(
+        *[np.asarray(x, dtype= float) for x in (p, R0, thickness_init, Syield, Sultimate)])
+    thickness= thickness.copy()
+
+    def WTAF_of(thickness):
+        Sproof, Sburst= getPeakStresses(p, R0 + thickness, R0,
+                                        proof_factor, burst_factor)
+        return np.maximum(Sproof/Syield, Sburst/Sultimate)
+
+    # compute initial WTAF
+    WTAF= WTAF_of(thickness)
+
+    # iterate the elements whose WTAF is still above one
+    n_iter= np.zeros(thickness.shape, dtype= int)
+    active= WTAF - 1.0 > WTAF_tol
+    while np.any(active) and (n_iter.max(initial= 0) < max_iter):
+        n_iter[active] += 1 # this cycle iteration number
+
+        # get the next thickness
+        WTAF_next= np.maximum(1.0, WTAF_of(thickness))
+        thickness= np.where(active, WTAF_next*thickness, thickness)
+        WTAF= np.where(active, WTAF_next, WTAF)
+        active= active & (WTAF - 1.0 > WTAF_tol) & (n_iter < max_iter)
+
+    return (thickness, WTAF, n_iter)
@@ -8,13 +8,32 @@ import pandas as pd
 import numpy as np
 from scipy.optimize import fsolve
 import os
+from functools import lru_cache
+
+from hopp.utilities.memoize import memoize
 
 bar2MPa = 0.1
 mm2in = 0.0393701
 
+@lru_cache(maxsize=None)
+def load_data_tables(data_location):
+    '''
+        Reads the steel grade, pipe schedule and steel cost tables once per data location.
+        The returned DataFrames are shared and must not be modified.
+    '''
+    #   Import mechanical props and pipe thicknesses (remove A,B ,and A25 since no costing data)
+    yield_strengths = pd.read_csv(os.path.join(data_location, 'steel_mechanical_props.csv'),index_col = None,header = 0)
+    yield_strengths = yield_strengths.loc[~yield_strengths['Grade'].isin(['A','B','A25'])].reset_index()
+    schedules_all = pd.read_csv(os.path.join(data_location, 'pipe_dimensions_metric.csv'),index_col = None,header = 0)
+    steel_costs_kg = pd.read_csv(os.path.join(data_location, 'steel_costs_per_kg.csv'),index_col = None,header = 0)
+    return yield_strengths, schedules_all, steel_costs_kg
+
+@memoize(maxsize=256)
 def run_pipe_analysis(L,m_dot,p_inlet,p_outlet,depth, risers=1, data_location=os.path.abspath(os.path.dirname(__file__)+"/data_tables")):
     '''
         This function calculates the cheapest grade, diameter, thickness, subject to ASME B31.12 and .8
+
+        Results are memoized on the inputs, see `run_pipe_analysis.cache`
     '''
     p_inlet_MPa = p_inlet*bar2MPa
     F = 0.72 # Design option B class 1 - 2011 ASME B31.12 Table  PL-3.7.1.2
@@ -24,57 +43,64 @@ def run_pipe_analysis(L,m_dot,p_inlet,p_outlet,depth, risers=1, data_location=os
     riser = True    #This is a flag for the ASMEB31.8 stress design, if not including risers, then this can be set to false
     total_L = L*(1+0.05) + risers*depth/1000 #km #Assuming 5% extra length and 1 riser. Will need two risers for turbine to central platform
 
-    #   Import mechanical props and pipe thicknesses (remove A,B ,and A25 since no costing data)
-    yield_strengths = pd.read_csv(os.path.join(data_location, 'steel_mechanical_props.csv'),index_col = None,header = 0)
-    yield_strengths = yield_strengths.loc[~yield_strengths['Grade'].isin(['A','B','A25'])].reset_index()
-    schedules_all = pd.read_csv(os.path.join(data_location, 'pipe_dimensions_metric.csv'),index_col = None,header = 0)
-    steel_costs_kg = pd.read_csv(os.path.join(data_location, 'steel_costs_per_kg.csv'),index_col = None,header = 0)
+    yield_strengths, schedules_all, steel_costs_kg = load_data_tables(data_location)
 
     #   First get the minimum diameter required to achieve the outlet pressure for given length and m_dot
     min_diam_mm = get_min_diameter_of_pipe(L,m_dot,p_inlet,p_outlet)
     #   Filter for diameters larger than min diam required
     schedules_spec = schedules_all.loc[schedules_all['DN']>=(min_diam_mm)]
 
-    #   Gather the grades, diameters, and schedules to loop thru
+    #   Gather the grades, diameters, and schedules to check
     grades = yield_strengths['Grade'].values
     diams = schedules_spec['Outer diameter [mm]'].values
     schds = schedules_spec.loc[:,~schedules_spec.columns.isin(['DN','Outer diameter [mm]'])].columns
-    viable_types = []
- 
-    #   Loop thru grades
-    for grade in grades:
-        #   Get SMYS and SMTS for the specific grade
-        SMYS = yield_strengths.loc[yield_strengths['Grade']==grade,'SMYS [Mpa]'].iat[0]
-        SMTS = yield_strengths.loc[yield_strengths['Grade']==grade,'SMTS [Mpa]'].iat[0]
-        #   Loop thru diameters
-        for diam in diams:
-            diam_row = schedules_spec.loc[schedules_spec['Outer diameter [mm]']==diam]
-            #   Loop thru scheudles (which give the thickness)
-            for schd in schds:
-                thickness = diam_row[schd].iat[0]
-
-                #Check if thickness satisfies ASME B31.12
-                mat_perf_factor = get_mat_factor(SMYS,SMTS,p_inlet*bar2MPa)
-                t_ASME = p_inlet_MPa*diam/(2*SMYS*F*E*mat_perf_factor)
-                if thickness<t_ASME:
-                    continue
-
-                #Check if satifies ASME B31.8
-                if not checkASMEB318(SMYS,diam,thickness,riser,depth,p_inlet,T_derating):
-                    continue
-
-                #Add qualified pipes to saved answers:
-                inner_diam = diam-2*thickness
-                viable_types.append([grade,diam,inner_diam,schd,thickness])
-            
-    viable_types_df = pd.DataFrame(viable_types,columns=['Grade','Outer diameter (mm)','Inner Diameter (mm)','Schedule','Thickness (mm)']).dropna()
+
+    #   Check all combinations at once, as [grade x diameter x schedule] arrays
+    SMYS = yield_strengths['SMYS [Mpa]'].values[:,np.newaxis,np.newaxis]
+    SMTS = yield_strengths['SMTS [Mpa]'].values[:,np.newaxis,np.newaxis]
+    diam = diams[np.newaxis,:,np.newaxis]
+    thickness = schedules_spec[schds].values.astype(float)[np.newaxis,:,:]
+
+    #   Check if thickness satisfies ASME B31.12
+    mat_perf_factor = np.array([get_mat_factor(smys,smts,p_inlet*bar2MPa) for smys,smts in zip(SMYS.ravel(),SMTS.ravel())])
+    t_ASME = p_inlet_MPa*diam/(2*SMYS*F*E*mat_perf_factor[:,np.newaxis,np.newaxis])
+    #   Check if satifies ASME B31.8
+    viable = ~(thickness<t_ASME) & checkASMEB318(SMYS,diam,thickness,riser,depth,p_inlet,T_derating)
+    i_grade,i_diam,i_schd = np.nonzero(viable)
+
+    #Add qualified pipes to saved answers:
+    viable_thickness = thickness[0,i_diam,i_schd]
+    viable_types = {
+        'Grade':grades[i_grade],
+        'Outer diameter (mm)':diams[i_diam],
+        'Inner Diameter (mm)':diams[i_diam]-2*viable_thickness,
+        'Schedule':schds.values[i_schd],
+        'Thickness (mm)':viable_thickness,
+    }
+    viable_types_df = pd.DataFrame(viable_types).dropna()
 
     #   Calculate material, labor, row, and misc costs
     viable_types_df = get_mat_costs(viable_types_df,total_L,steel_costs_kg)
     viable_types_df = get_anl_costs(viable_types_df,total_L)
     min_row = viable_types_df.sort_values(by='total capital cost [$]').iloc[:1].reset_index()
     return min_row
- 
+
+def run_pipe_analyses(L,m_dot,p_inlet,p_outlet,depth, risers=1, data_location=os.path.abspath(os.path.dirname(__file__)+"/data_tables")):
+    '''
+        Sizes many pipes in one call, e.g. for a design sweep.
+        Inputs are broadcast against each other and each unique design is analyzed once with `run_pipe_analysis`
+
+        Returns a DataFrame with the cheapest pipe of each design, in the broadcast (flattened) order of the inputs
+    '''
+    designs = np.broadcast_arrays(*[np.asarray(x,dtype=float) for x in (L,m_dot,p_inlet,p_outlet,depth,risers)])
+    designs = np.column_stack([x.ravel() for x in designs])
+    unique_designs, inverse = np.unique(designs,axis=0,return_inverse=True)
+
+    unique_rows = [run_pipe_analysis(*design[:5],risers=design[5],data_location=data_location)
+                   for design in unique_designs]
+    rows = pd.concat(unique_rows,ignore_index=True).drop(columns=['level_0','index'],errors='ignore')
+    return rows.iloc[np.ravel(inverse)].reset_index(drop=True)
+
 def get_mat_factor(SMYS,SMTS,design_pressure):
     '''
         Determine the material performance factor ASMEB31.12. 
@@ -97,7 +123,8 @@ def get_mat_factor(SMYS,SMTS,design_pressure):
 
 def checkASMEB318(SMYS,diam,thickness,riser,depth,p_inlet,T_derating):
     '''
-        Determine if pipe parameters satisfy hoop and longitudinal stress requirements
+        Determine if pipe parameters satisfy hoop and longitudinal stress requirements.
+        Accepts scalars or broadcastable arrays of SMYS, diam, and thickness.
     '''
     
     # Hoop Stress - 2020 ASME B31.8 Table A842.2.2-1
@@ -113,20 +140,18 @@ def checkASMEB318(SMYS,diam,thickness,riser,depth,p_inlet,T_derating):
     rho_water = 1000 #kg/m3
     p_hydrostatic = rho_water*9.81*depth*Pa2bar # bar
     dP = (p_inlet-p_hydrostatic)*bar2MPa    # MPa
-    S_h = dP*(diam-(thickness if diam/thickness>=30 else 0))/(2000*thickness)
-    if S_h>=S_h_check:
-        return False
+    with np.errstate(divide='ignore',invalid='ignore'):
+        S_h = dP*(diam-np.where(diam/thickness>=30,thickness,0))/(2000*thickness)
 
-    #   Longitudinal stress (MPa)
-    S_L_check = 0.8*SMYS #2020 ASME B31.8 Table A842.2.2-1. Same for riser and pipe
-    S_L = p_inlet*bar2MPa*(diam-2*thickness)/(4*thickness)
-    if S_L>S_L_check:
-        return False
+        #   Longitudinal stress (MPa)
+        S_L_check = 0.8*SMYS #2020 ASME B31.8 Table A842.2.2-1. Same for riser and pipe
+        S_L = p_inlet*bar2MPa*(diam-2*thickness)/(4*thickness)
 
     S_combined_check = 0.9*SMYS #2020 ASME B31.8 Table A842.2.2-1. Same for riser and pipe
     #   Torsional stress?? Under what applied torque? Not sure what to do for this.
 
-    return True
+    passed = ~(S_h>=S_h_check) & ~(S_L>S_L_check)
+    return bool(passed) if np.ndim(passed)==0 else passed
 
 def get_anl_costs(costs,total_L):
     labor_coef = [95295,0.53848,0.03070]
@@ -136,10 +161,11 @@ def get_anl_costs(costs,total_L):
 
     L_mi = total_L*0.621371
 
-    # costs['mat cost anl [$]'] = costs.apply(lambda x: (mat_coef[0]*((x['Outer diameter (mm)']*mm2in)**mat_coef[1])/L_mi**mat_coef[2])*(x['Outer diameter (mm)']*mm2in*L_mi),axis=1)
-    costs['labor cost [$]'] = costs.apply(lambda x: (labor_coef[0]/((x['Outer diameter (mm)']*mm2in)**labor_coef[1])*L_mi**labor_coef[2])*(x['Outer diameter (mm)']*mm2in*L_mi),axis=1)
-    costs['misc cost [$]'] = costs.apply(lambda x: (misc_coef[0]/((x['Outer diameter (mm)']*mm2in)**misc_coef[1])/L_mi**misc_coef[2])*(x['Outer diameter (mm)']*mm2in*L_mi),axis=1)
-    costs['ROW cost [$]'] = costs.apply(lambda x: (row_coef[0]/((x['Outer diameter (mm)']*mm2in)**row_coef[1])*L_mi**row_coef[2])*(x['Outer diameter (mm)']*mm2in*L_mi),axis=1)
+    D_in = costs['Outer diameter (mm)']*mm2in
+    # costs['mat cost anl [$]'] = (mat_coef[0]*(D_in**mat_coef[1])/L_mi**mat_coef[2])*(D_in*L_mi)
+    costs['labor cost [$]'] = (labor_coef[0]/(D_in**labor_coef[1])*L_mi**labor_coef[2])*(D_in*L_mi)
+    costs['misc cost [$]'] = (misc_coef[0]/(D_in**misc_coef[1])/L_mi**misc_coef[2])*(D_in*L_mi)
+    costs['ROW cost [$]'] = (row_coef[0]/(D_in**row_coef[1])*L_mi**row_coef[2])*(D_in*L_mi)
 
     costs['total capital cost [$]'] = costs[['mat cost [$]','labor cost [$]','misc cost [$]','ROW cost [$]']].sum(axis=1)
 
@@ -155,12 +181,16 @@ def get_mat_costs(schedules_spec,total_L,steel_costs_kg):
     mm2m = 0.001
     km2m = 1000
     L_m = total_L*km2m
-    schedules_spec['volume [m3]'] = schedules_spec.apply(lambda x: np.pi*(x['Outer diameter (mm)']**2-(x['Outer diameter (mm)']-x['Thickness (mm)']*2)**2)*mm2m**2/4*L_m,axis=1)
+    D_outer = schedules_spec['Outer diameter (mm)']
+    schedules_spec['volume [m3]'] = np.pi*(D_outer**2-(D_outer-schedules_spec['Thickness (mm)']*2)**2)*mm2m**2/4*L_m
     schedules_spec['weight [kg]'] = schedules_spec['volume [m3]']*rho_steel
-    schedules_spec['mat cost [$]'] = schedules_spec.apply(lambda x:x['weight [kg]']*steel_costs_kg.loc[steel_costs_kg['Grade']==x['Grade'],'Price [$/kg]'].iat[0],axis=1)
+    #   Price of the first listing of each grade
+    price_kg = steel_costs_kg.drop_duplicates('Grade').set_index('Grade')['Price [$/kg]']
+    schedules_spec['mat cost [$]'] = schedules_spec['weight [kg]']*schedules_spec['Grade'].map(price_kg)
 
     return schedules_spec
 
+@memoize(maxsize=1024)
 def get_min_diameter_of_pipe(L:float,m_dot:float,p_inlet:float,p_outlet:float):
     '''
     Overview:
@@ -0,0 +1,286 @@
+"""
+Library of flicker heat maps of a single turbine, so that hybrid layouts can look up a heat map rather than simulate
+the flicker of every new site.
+
+Heat maps are stored per location in a directory per set of model settings, named by a digest of the settings. A
+library can be filled ahead of time from the command line, running FlickerMismatch in parallel for a grid of locations:
+
+.. code-block::
+
+    python -m hopp.simulation.technologies.layout.flicker_library --n-procs 8 --lat-range 30 50 2 --lon-range -120 -70 5
+"""
+import argparse
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import product
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+from attrs import asdict, define, field, validators
+
+from hopp.simulation.technologies.layout import flicker_mismatch
+from hopp.simulation.technologies.layout.flicker_mismatch import FlickerMismatch
+from hopp.simulation.technologies.layout.pv_module import module_width, module_height, modules_per_string
+from hopp.utilities.log import flicker_logger as logger
+
+
+FLICKER_DATA_DIR = Path(__file__).parent / "flicker_data"
+# user cache directory rather than the package's, which may be read-only
+FLICKER_LIBRARY_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "hopp" / "flicker_library"
+
+
+@define(frozen=True)
+class FlickerHeatMapSettings:
+    """
+    Flicker model settings that a heat map depends on, besides its location
+
+    Args:
+        diameter: rotor diameter of the modeled turbine [m]
+        steps_per_hour: number of simulation steps per hour
+        angles_per_step: number of blade angles per step, or None to model the swept area
+        gridcell_width: width of the heat map cells [m]
+        gridcell_height: height of the heat map cells [m]
+        gridcells_per_string: number of cells per string of panels
+        weight: heat map weighting, one of 'poa', 'power' or 'time', see FlickerMismatch.create_heat_maps
+        tower_shadow: whether the tower's shadow is included
+        diam_mult_nwe: number of diameters the heat map extends north, west and east of the turbine
+        diam_mult_s: number of diameters the heat map extends south of the turbine
+    """
+    diameter: float = field(converter=float)
+    steps_per_hour: int = 1
+    angles_per_step: Optional[int] = None
+    gridcell_width: float = field(default=module_width, converter=float)
+    gridcell_height: float = field(default=module_height, converter=float)
+    gridcells_per_string: int = modules_per_string
+    weight: str = field(default="power", validator=validators.in_(("poa", "power", "time")))
+    tower_shadow: bool = True
+    diam_mult_nwe: int = 8
+    diam_mult_s: int = 4
+
+    @property
+    def blade_length(self) -> int:
+        return int(self.diameter // 2)
+
+    def digest(self) -> str:
+        """Content address of the settings"""
+        return hashlib.sha256(json.dumps(asdict(self), sort_keys=True).encode()).hexdigest()[:16]
+
+    def heat_map_template(self) -> tuple:
+        """(heat map grid, x coordinates, y coordinates) of heat maps with these settings"""
+        with self.model_settings():
+            bounds = FlickerMismatch.get_turb_site(self.blade_length * 2).bounds
+            _, heat_map_template = FlickerMismatch._setup_heatmap_template(bounds, self.gridcell_width,
+                                                                           self.gridcell_height)
+        return heat_map_template
+
+    def turbine_indices(self, heat_map_template: tuple) -> Tuple[int, int]:
+        """x, y indices of the turbine's cell in a heat map template with these settings"""
+        with self.model_settings():
+            return FlickerMismatch.get_turb_pos_indices(heat_map_template)
+
+    @contextmanager
+    def model_settings(self):
+        """Applies the settings that FlickerMismatch holds as class variables within the context"""
+        previous = (FlickerMismatch.steps_per_hour, FlickerMismatch.turbine_tower_shadow,
+                    FlickerMismatch.diam_mult_nwe, FlickerMismatch.diam_mult_s)
+        FlickerMismatch.steps_per_hour = self.steps_per_hour
+        FlickerMismatch.turbine_tower_shadow = self.tower_shadow
+        FlickerMismatch.diam_mult_nwe = self.diam_mult_nwe
+        FlickerMismatch.diam_mult_s = self.diam_mult_s
+        try:
+            yield
+        finally:
+            (FlickerMismatch.steps_per_hour, FlickerMismatch.turbine_tower_shadow,
+             FlickerMismatch.diam_mult_nwe, FlickerMismatch.diam_mult_s) = previous
+
+    def create_model(self, lat: float, lon: float) -> FlickerMismatch:
+        """FlickerMismatch with these settings, to be run within `model_settings`"""
+        return FlickerMismatch(lat, lon,
+                               angles_per_step=self.angles_per_step,
+                               blade_length=self.blade_length,
+                               gridcell_width=self.gridcell_width,
+                               gridcell_height=self.gridcell_height,
+                               gridcells_per_string=self.gridcells_per_string)
+
+
+# settings of the detailed heat maps distributed in `flicker_data`, named "{lat}_{lon}_{steps}_{angles}_shadow.txt"
+DISTRIBUTED_SETTINGS = FlickerHeatMapSettings(diameter=70, steps_per_hour=4, angles_per_step=12, weight="poa")
+
+
+@lru_cache(maxsize=16)
+def _load_heat_map(path: Path, modified_time: float) -> np.ndarray:
+    if path.suffix == ".npy":
+        heat_map = np.load(path)
+    else:
+        heat_map = np.loadtxt(path)
+    heat_map.flags.writeable = False
+    return heat_map
+
+
+class FlickerHeatMapLibrary:
+    """
+    Directory of flicker heat maps keyed on the model settings and the location
+
+    The heat maps distributed in `flicker_data` are included in lookups with `DISTRIBUTED_SETTINGS`. Loaded heat maps
+    are cached in memory and are read-only; copy them before modifying.
+
+    Args:
+        library_dir: directory of the library, created when a heat map is saved. Defaults to FLICKER_LIBRARY_DIR, in
+            the user's cache directory
+    """
+    def __init__(self, library_dir: Optional[Union[str, Path]] = None):
+        self.library_dir = Path(FLICKER_LIBRARY_DIR if library_dir is None else library_dir)
+
+    def settings_dir(self, settings: FlickerHeatMapSettings) -> Path:
+        return self.library_dir / settings.digest()
+
+    def path(self, lat: float, lon: float, settings: FlickerHeatMapSettings) -> Path:
+        return self.settings_dir(settings) / f"{lat:.4f}_{lon:.4f}.npy"
+
+    def save(self, lat: float, lon: float, settings: FlickerHeatMapSettings, heat_map: np.ndarray) -> Path:
+        """
+        Adds a heat map to the library, replacing any heat map of the same location and settings
+
+        :returns: path of the heat map file
+        """
+        settings_dir = self.settings_dir(settings)
+        settings_dir.mkdir(parents=True, exist_ok=True)
+        settings_file = settings_dir / "settings.json"
+        if not settings_file.exists():
+            settings_file.write_text(json.dumps(asdict(settings), indent=2, sort_keys=True))
+        path = self.path(lat, lon, settings)
+        tmp_path = path.with_suffix(".npy.tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.asarray(heat_map))
+        tmp_path.replace(path)
+        return path
+
+    def entries(self, settings: FlickerHeatMapSettings) -> List[Tuple[float, float, Path]]:
+        """(lat, lon, path) of each heat map with the settings"""
+        entries = []
+        for path in self.settings_dir(settings).glob("*.npy"):
+            lat, lon = path.stem.split("_")
+            entries.append((float(lat), float(lon), path))
+        if settings == DISTRIBUTED_SETTINGS:
+            pattern = f"*_*_{settings.steps_per_hour}_{settings.angles_per_step}_shadow.txt"
+            for path in FLICKER_DATA_DIR.glob(pattern):
+                lat, lon = path.name.split("_")[:2]
+                entries.append((float(lat), float(lon), path))
+        return entries
+
+    def lookup(self,
+               lat: float,
+               lon: float,
+               settings: FlickerHeatMapSettings,
+               max_distance: Optional[float] = None,
+               n_nearest: int = 1
+               ) -> Optional[Tuple[np.ndarray, Tuple[float, float]]]:
+        """
+        Finds the heat map nearest to a location, with distance measured in degrees of latitude and longitude
+
+        :param lat: latitude
+        :param lon: longitude
+        :param settings: model settings of the heat map
+        :param max_distance: only use heat maps within this distance [degrees], or None for any distance
+        :param n_nearest: number of nearest heat maps to interpolate between by inverse distance weighting
+        :returns: (heat map, (lat, lon) of the nearest heat map), or None if there is no heat map within max_distance
+        """
+        entries = self.entries(settings)
+        if not entries:
+            return None
+        locations = np.array([(entry_lat, entry_lon) for entry_lat, entry_lon, _ in entries])
+        distance = np.linalg.norm(locations - np.array([lat, lon]), axis=1)
+        nearest = np.argsort(distance, kind="stable")[:n_nearest]
+        if max_distance is not None:
+            nearest = nearest[distance[nearest] <= max_distance]
+        if not len(nearest):
+            return None
+
+        heat_maps = [_load_heat_map(entries[i][2], entries[i][2].stat().st_mtime) for i in nearest]
+        nearest_location = tuple(float(x) for x in locations[nearest[0]])
+        if len(heat_maps) == 1 or distance[nearest[0]] == 0:
+            return heat_maps[0], nearest_location
+        weights = 1 / distance[nearest]
+        heat_map = np.tensordot(weights / weights.sum(), np.stack(heat_maps), axes=1)
+        return heat_map, nearest_location
+
+    def build(self,
+              locations: Iterable[Tuple[float, float]],
+              settings: FlickerHeatMapSettings,
+              n_procs: int = flicker_mismatch.n_procs,
+              overwrite: bool = False
+              ) -> List[Path]:
+        """
+        Simulates and saves the heat maps of many locations, each with FlickerMismatch.run_parallel
+
+        :param locations: (lat, lon) of each heat map
+        :param settings: model settings of the heat maps
+        :param n_procs: number of processes per heat map
+        :param overwrite: if False, skip locations already in the library
+        :returns: paths of the saved heat maps
+        """
+        paths = []
+        with settings.model_settings():
+            for lat, lon in locations:
+                path = self.path(lat, lon, settings)
+                if path.exists() and not overwrite:
+                    logger.info("Flicker heat map for {}, {} already in library".format(lat, lon))
+                    continue
+                model = settings.create_model(lat, lon)
+                (heat_map,) = model.run_parallel(n_procs, (settings.weight,))
+                paths.append(self.save(lat, lon, settings, heat_map))
+                logger.info("Saved flicker heat map for {}, {} to {}".format(lat, lon, path))
+        return paths
+
+
+def main(args: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Builds a library of flicker heat maps with FlickerMismatch")
+    parser.add_argument("--library", default=str(FLICKER_LIBRARY_DIR), help="library directory")
+    parser.add_argument("--locations", nargs="*", default=[], metavar="LAT,LON",
+                        help="locations to simulate, in addition to the lat/lon ranges")
+    parser.add_argument("--lat-range", nargs=3, type=float, metavar=("START", "STOP", "STEP"),
+                        help="grid of latitudes, defaults to FlickerMismatch's lat_range if no locations are given")
+    parser.add_argument("--lon-range", nargs=3, type=float, metavar=("START", "STOP", "STEP"),
+                        help="grid of longitudes, defaults to FlickerMismatch's lon_range if no locations are given")
+    parser.add_argument("--diameter", type=float, default=DISTRIBUTED_SETTINGS.diameter, help="rotor diameter [m]")
+    parser.add_argument("--steps-per-hour", type=int, default=DISTRIBUTED_SETTINGS.steps_per_hour)
+    parser.add_argument("--angles-per-step", type=int, default=DISTRIBUTED_SETTINGS.angles_per_step,
+                        help="blade angles per step, 0 to model the swept area")
+    parser.add_argument("--gridcell-width", type=float, default=module_width)
+    parser.add_argument("--gridcell-height", type=float, default=module_height)
+    parser.add_argument("--gridcells-per-string", type=int, default=modules_per_string)
+    parser.add_argument("--weight", default=DISTRIBUTED_SETTINGS.weight, choices=("poa", "power", "time"))
+    parser.add_argument("--no-tower-shadow", action="store_true")
+    parser.add_argument("--diam-mult-nwe", type=int, default=DISTRIBUTED_SETTINGS.diam_mult_nwe,
+                        help="diameters the heat map extends north, west and east of the turbine")
+    parser.add_argument("--diam-mult-s", type=int, default=DISTRIBUTED_SETTINGS.diam_mult_s,
+                        help="diameters the heat map extends south of the turbine")
+    parser.add_argument("--n-procs", type=int, default=flicker_mismatch.n_procs)
+    parser.add_argument("--overwrite", action="store_true")
+    args = parser.parse_args(args)
+
+    locations = [tuple(float(x) for x in location.split(",")) for location in args.locations]
+    if args.lat_range or args.lon_range or not locations:
+        lats = np.arange(*args.lat_range) if args.lat_range else flicker_mismatch.lat_range
+        lons = np.arange(*args.lon_range) if args.lon_range else flicker_mismatch.lon_range
+        locations += [(float(lat), float(lon)) for lat, lon in product(lats, lons)]
+
+    settings = FlickerHeatMapSettings(diameter=args.diameter,
+                                      steps_per_hour=args.steps_per_hour,
+                                      angles_per_step=args.angles_per_step or None,
+                                      gridcell_width=args.gridcell_width,
+                                      gridcell_height=args.gridcell_height,
+                                      gridcells_per_string=args.gridcells_per_string,
+                                      weight=args.weight,
+                                      tower_shadow=not args.no_tower_shadow,
+                                      diam_mult_nwe=args.diam_mult_nwe,
+                                      diam_mult_s=args.diam_mult_s)
+    FlickerHeatMapLibrary(args.library).build(locations, settings, args.n_procs, args.overwrite)
+
+
+if __name__ == "__main__":
+    main()
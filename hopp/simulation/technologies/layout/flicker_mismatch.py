@@ -134,21 +134,31 @@ class FlickerMismatch:
         self.step_intervals = None
 
     def _create_pool(self,
-                     n_procs: int
+                     n_procs: int,
+                     steps_per_task: Optional[int] = None,
+                     initializer=None,
+                     initargs: tuple = ()
                      ) -> mp.Pool:
         """
         Initialize a multiprocessing pool where each simulation step can be partitioned (by modulo operator) to
         split up work among different FlickerMismatch instances.
         :param n_procs:
+        :param steps_per_task: number of simulation steps per task, if None, one task per process
+        :param initializer: function run once by each process
+        :param initargs: arguments of initializer
         """
         self.step_intervals = []
-        n_steps_per_process = int(self.n_steps / n_procs)
-        s = 0
-        for i in range(n_procs - 1):
-            self.step_intervals.append(range(s, s + n_steps_per_process))
-            s += n_steps_per_process
-        self.step_intervals.append(range(s, self.n_steps))
-        return mp.Pool(processes=n_procs)
+        if steps_per_task is None:
+            n_steps_per_process = int(self.n_steps / n_procs)
+            s = 0
+            for i in range(n_procs - 1):
+                self.step_intervals.append(range(s, s + n_steps_per_process))
+                s += n_steps_per_process
+            self.step_intervals.append(range(s, self.n_steps))
+        else:
+            self.step_intervals = [range(s, min(s + steps_per_task, self.n_steps))
+                                   for s in range(0, self.n_steps, steps_per_task)]
+        return mp.Pool(processes=n_procs, initializer=initializer, initargs=initargs)
 
     def _setup_wind_dir(self,
                         wind_dir_degrees):
@@ -576,43 +586,63 @@ class FlickerMismatch:
     def run_parallel(self,
                      n_procs: int,
                      weight_option: tuple,
-                     intervals: Optional[Sequence[range]] = None
+                     intervals: Optional[Sequence[range]] = None,
+                     steps_per_task: Optional[int] = None
                      ):
         """
         Runs create_heat_maps_irradiance in parallel
 
+        Each process receives this FlickerMismatch once, when the pool starts, and adds the weighted heat maps of its
+        tasks into its own slot of a shared memory accumulator, so that tasks only transfer their range of steps.
+
         :param n_procs:
         :param weight_option: tuple of selected weighting options, producing a heatmap each
             - "poa": weight by plane-of-array irradiance
             - "power": weight by power loss of pvmismatch module
             - "time": weight by number of timesteps shaded
         :param intervals: list of ranges to simulate; if none, simulate entire weather file's records
+        :param steps_per_task: if intervals is none, number of simulation steps per task; if none, one task per process.
+            Smaller tasks balance the load between processes better at the cost of more task overhead
         :return: heat_map_shadow, heat_map_flicker
         """
         logger.info("run_parallel with {} processes".format(n_procs))
-        pool = self._create_pool(n_procs)
-        if intervals is None:
-            intervals = self.step_intervals
-
         if 'power' in weight_option or 'poa' in weight_option:
             self._setup_irradiance()
 
-        results = pool.imap(functools.partial(self.create_heat_maps, weight_option=weight_option),
-                            intervals)
-
-        # aggregate results and renormalize
-        heat_maps_to_return = [copy.deepcopy(self.heat_map_template[0]) for _ in weight_option]
+        heat_map_shape = np.shape(self.heat_map_template[0])
+        accumulator_shape = (n_procs, len(weight_option)) + heat_map_shape
+        accumulator = mp.RawArray('d', int(np.prod(accumulator_shape)))
+        worker_count = mp.Value('i', 0)
+        pool = self._create_pool(n_procs, steps_per_task,
+                                 initializer=_init_heat_map_worker,
+                                 initargs=(self, weight_option, accumulator, accumulator_shape, worker_count))
+        if intervals is None:
+            intervals = self.step_intervals
 
-        if 'power' in weight_option:
+        # weight of each interval's heat maps, which are normalized within the interval
+        if 'power' in weight_option or 'poa' in weight_option:
             subhourly_poa = np.repeat(self.poa, FlickerMismatch.steps_per_hour)
             total_poa = sum([sum(subhourly_poa[i]) for i in intervals])
         total_steps = sum([len(i) for i in intervals])
-        for r, i in zip(results, intervals):
-            for j, hm in enumerate(heat_maps_to_return):
-                if weight_option[j] == 'poa':
-                    hm += r[j] * sum(self.poa[i]) / total_poa
-                elif weight_option[j] == 'power' or weight_option[j] == 'time':
-                    hm += r[j] * len(i) / total_steps
+        interval_weights = []
+        for i in intervals:
+            weights = []
+            for option in weight_option:
+                if option == 'poa':
+                    weights.append(sum(self.poa[i]) / total_poa)
+                else:
+                    weights.append(len(i) / total_steps)
+            interval_weights.append(weights)
+
+        with pool:
+            for _ in pool.imap_unordered(_run_heat_map_task, zip(intervals, interval_weights)):
+                pass
+
+        # aggregate results of each process
+        heat_maps = np.frombuffer(accumulator).reshape(accumulator_shape).sum(axis=0)
+        heat_maps_to_return = [copy.deepcopy(self.heat_map_template[0]) for _ in weight_option]
+        for hm, heat_map in zip(heat_maps_to_return, heat_maps):
+            hm += heat_map
 
         logger.info("Create_heat_map success")
 
@@ -639,3 +669,34 @@ class FlickerMismatch:
                     ys = [point.y for point in s]
                     plt.scatter(xs, ys)
         return axs
+
+
+# state of a run_parallel worker process
+_heat_map_worker = {}
+
+
+def _init_heat_map_worker(model: FlickerMismatch,
+                          weight_option: tuple,
+                          accumulator,
+                          accumulator_shape: tuple,
+                          worker_count
+                          ) -> None:
+    """
+    Stores the FlickerMismatch of run_parallel in the worker process and claims a slot of the shared accumulator
+    """
+    with worker_count.get_lock():
+        slot = worker_count.value
+        worker_count.value += 1
+    _heat_map_worker['model'] = model
+    _heat_map_worker['weight_option'] = weight_option
+    _heat_map_worker['heat_maps'] = np.frombuffer(accumulator).reshape(accumulator_shape)[slot]
+
+
+def _run_heat_map_task(task: tuple) -> None:
+    """
+    Adds the weighted heat maps of a range of steps to the worker's slot of the shared accumulator
+    """
+    steps, weights = task
+    results = _heat_map_worker['model'].create_heat_maps(steps, weight_option=_heat_map_worker['weight_option'])
+    for heat_map, result, weight in zip(_heat_map_worker['heat_maps'], results, weights):
+        heat_map += result * weight
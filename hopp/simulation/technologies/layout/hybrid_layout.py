@@ -7,7 +7,18 @@ from hopp.simulation.technologies.layout.wind_layout import WindLayout, WindBoun
 from hopp.simulation.technologies.layout.pv_layout import PVLayout, PVGridParameters
 from hopp.simulation.technologies.layout.pv_layout_tools import get_flicker_loss_multiplier
 from hopp.simulation.technologies.layout.flicker_mismatch import FlickerMismatch
+from hopp.simulation.technologies.layout.flicker_library import (
+    FlickerHeatMapLibrary,
+    FlickerHeatMapSettings,
+    DISTRIBUTED_SETTINGS,
+    FLICKER_DATA_DIR,
+)
 from hopp.simulation.technologies.sites.site_info import SiteInfo
+from hopp.utilities.log import flicker_logger as logger
+
+# low-resolution flicker heat maps of sites within this many degrees of latitude and longitude are reused
+FLICKER_LIBRARY_MAX_DISTANCE = 0.1
+
 
 class HybridLayout:
     def __init__(self,
@@ -43,7 +54,11 @@ class HybridLayout:
             `steps_per_hour` is the timestep interval of shadow calculation
             `angles_per_step` is how many different angles of the blades are calculated per timestep
 
-        If not flicker_load_nearest, generate a low-resolution flicker heat map
+        Heat maps are looked up in the FlickerHeatMapLibrary, see flicker_library.py for building it ahead of time.
+
+        If flicker_load_nearest, use the nearest detailed heat map in the library.
+        If not flicker_load_nearest, use a low-resolution flicker heat map within FLICKER_LIBRARY_MAX_DISTANCE degrees
+        of the site, or generate one and add it to the library
 
         :return: tuple:
                     (turbine diameter,
@@ -52,37 +67,38 @@ class HybridLayout:
                      x_coordinates of grid,
                      y_coordinates of grid)
         """
+        lat, lon = self.site.data['lat'], self.site.data['lon']
+        library = FlickerHeatMapLibrary()
         if flicker_load_nearest:
             # pre-processed detailed flicker heat map
-            existing_locations = [[33.209, -108.283],
-                                  [36.334, -119.769],
-                                  [39.7555, -105.2211]]
-            current_location = [self.site.data['lat'], self.site.data['lon']]
-            distance = np.array(existing_locations) - np.array(current_location)
-            distance = np.linalg.norm(distance, axis=1)
-            min_dist_location = existing_locations[int(np.argmin(distance))]
-            flicker_diam = 70  # meters, of the turbine used in flicker modeling
-            steps_per_hour = 4
-            angles_per_step = 12
-            data_path = Path(__file__).parent / "flicker_data"
-            flicker_path = data_path / "{}_{}_{}_{}_shadow.txt".format(min_dist_location[0],
-                                                                       min_dist_location[1],
-                                                                       steps_per_hour, angles_per_step)
-            flicker_heatmap = np.loadtxt(flicker_path)
-
-            bounds = FlickerMismatch.get_turb_site(flicker_diam).bounds
-            _, heatmap_template = FlickerMismatch._setup_heatmap_template(bounds)
+            settings = DISTRIBUTED_SETTINGS
+            found = library.lookup(lat, lon, settings)
+            if found is None:
+                raise FileNotFoundError("No flicker heat maps in {} or {}".format(library.library_dir,
+                                                                                 FLICKER_DATA_DIR))
+            flicker_heatmap, _ = found
         else:
-            flicker_diam = self.wind.rotor_diameter
-            flicker_no_tower = FlickerMismatch(self.site.data['lat'], self.site.data['lon'],
-                                               blade_length=flicker_diam // 2,
-                                               angles_per_step=None,
-                                               gridcell_height=90, gridcell_width=90, gridcells_per_string=1)
-
-            (flicker_heatmap,) = flicker_no_tower.create_heat_maps(range(8760), ("power",))
-            heatmap_template = flicker_no_tower.heat_map_template
+            settings = FlickerHeatMapSettings(diameter=self.wind.rotor_diameter,
+                                              angles_per_step=None,
+                                              gridcell_width=90,
+                                              gridcell_height=90,
+                                              gridcells_per_string=1,
+                                              weight="power")
+            found = library.lookup(lat, lon, settings, max_distance=FLICKER_LIBRARY_MAX_DISTANCE)
+            if found is None:
+                with settings.model_settings():
+                    flicker_no_tower = settings.create_model(lat, lon)
+                    (flicker_heatmap,) = flicker_no_tower.create_heat_maps(range(8760), ("power",))
+                try:
+                    library.save(lat, lon, settings, flicker_heatmap)
+                except OSError as e:
+                    logger.warning("Could not save flicker heat map to library {}: {}".format(library.library_dir, e))
+            else:
+                flicker_heatmap, _ = found
 
-        turb_x_ind, turb_y_ind = FlickerMismatch.get_turb_pos_indices(heatmap_template)
+        flicker_diam = settings.diameter
+        heatmap_template = settings.heat_map_template()
+        turb_x_ind, turb_y_ind = settings.turbine_indices(heatmap_template)
         self._flicker_data = flicker_diam, (turb_x_ind, turb_y_ind), flicker_heatmap, heatmap_template[1], heatmap_template[2]
 
     def calculate_flicker_loss(self):
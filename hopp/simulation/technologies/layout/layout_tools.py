@@ -5,7 +5,9 @@ from typing import (
     )
 
 import numpy as np
-from shapely.geometry import Polygon
+from shapely.geometry import Point, Polygon
+from shapely.geometry.base import BaseGeometry
+from shapely.prepared import prep
 
 
 def binary_search_float(objective: Callable[[float], any],
@@ -78,6 +80,104 @@ def make_polygon_from_bounds(sw_bound: np.ndarray,
         [ne_bound[0], sw_bound[1]]])
 
 
+def segments_intersect_bounds(segments: np.ndarray,
+                              bounds: Tuple[float, float, float, float]
+                              ) -> np.ndarray:
+    """
+    Which line segments intersect or touch a bounding box, by separating axes
+    :param segments: array of shape [n, 2, 2] of the (x, y) start and end of each segment
+    :param bounds: (min x, min y, max x, max y)
+    :return: boolean array of shape [n]
+    """
+    segments = np.asarray(segments, dtype=float).reshape(-1, 2, 2)
+    seg_min = segments.min(axis=1)
+    seg_max = segments.max(axis=1)
+    overlaps = np.all((seg_min <= bounds[2:]) & (seg_max >= bounds[:2]), axis=1)
+
+    # the corners of the box must not all be on the same side of the segment's line
+    corners = np.array([[bounds[0], bounds[1]], [bounds[0], bounds[3]], [bounds[2], bounds[1]], [bounds[2], bounds[3]]])
+    direction = segments[:, 1] - segments[:, 0]
+    side = direction[:, None, 0] * (corners[None, :, 1] - segments[:, None, 0, 1]) \
+        - direction[:, None, 1] * (corners[None, :, 0] - segments[:, None, 0, 0])
+    return overlaps & (side.min(axis=1) <= 0) & (side.max(axis=1) >= 0)
+
+
+class LayoutGeometry:
+    """
+    Site shape prepared for repeated point-in-shape tests, e.g. by the grid searches of the layout tools
+
+    Points are tested in bulk by an even-odd ray crossing test against the edges of the shape's polygons. Points that
+    are within a tolerance of an edge, where the crossing test may be ambiguous, are tested with the prepared shapely
+    geometry, so results match `shape.contains` for each point, with points on the boundary not contained.
+
+    :param shape: Polygon or MultiPolygon. Other geometries are tested with the prepared geometry only
+    """
+    max_chunk_elements = 2 ** 20
+
+    def __init__(self, shape: BaseGeometry):
+        self.shape = shape
+        self.prepared = prep(shape)
+        self.bounds = shape.bounds if not shape.is_empty else ()
+        self.edges = None
+
+        polygons = getattr(shape, "geoms", [shape])
+        if shape.is_empty or not all(isinstance(polygon, Polygon) for polygon in polygons):
+            return
+        edges = []
+        for polygon in polygons:
+            for ring in (polygon.exterior, *polygon.interiors):
+                coords = np.array(ring.coords)
+                edges.append(np.hstack((coords[:-1], coords[1:])))
+        self.edges = np.vstack(edges)
+        extent = max(self.bounds[2] - self.bounds[0], self.bounds[3] - self.bounds[1], 1.0)
+        self.tolerance = 1e-9 * extent
+
+    def contains_points(self,
+                        x: np.ndarray,
+                        y: np.ndarray
+                        ) -> np.ndarray:
+        """
+        :param x: x coordinates of points
+        :param y: y coordinates of points
+        :return: boolean array of whether each point is within the shape
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        contains = np.zeros(len(x), dtype=bool)
+        if not self.bounds:
+            return contains
+
+        candidates = np.flatnonzero((x > self.bounds[0]) & (x < self.bounds[2])
+                                    & (y > self.bounds[1]) & (y < self.bounds[3]))
+        if self.edges is None:
+            contains[candidates] = [self.prepared.contains(Point(x[i], y[i])) for i in candidates]
+            return contains
+
+        x0, y0, x1, y1 = (self.edges[:, i] for i in range(4))
+        dx, dy = x1 - x0, y1 - y0
+        length_sq = dx ** 2 + dy ** 2
+        chunk_size = max(1, self.max_chunk_elements // len(self.edges))
+        for start in range(0, len(candidates), chunk_size):
+            index = candidates[start:start + chunk_size]
+            px, py = x[index, None], y[index, None]
+
+            straddles = (y0 > py) != (y1 > py)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                x_crossing = x0 + (py - y0) * dx / dy
+            crossings = np.count_nonzero(straddles & (px < x_crossing), axis=1)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t = np.clip(((px - x0) * dx + (py - y0) * dy) / length_sq, 0, 1)
+            t = np.nan_to_num(t)
+            distance_sq = (x0 + t * dx - px) ** 2 + (y0 + t * dy - py) ** 2
+            near_edge = distance_sq.min(axis=1) <= self.tolerance ** 2
+
+            contains[index] = crossings % 2 == 1
+            for i in index[near_edge]:
+                contains[i] = self.prepared.contains(Point(x[i], y[i]))
+        return contains
+
+
 def clamp(value,
           error,
           minimum,
@@ -153,13 +153,17 @@ def place_solar_strands(max_num_modules: int,
     
     # prep_site = prep(site_shape)
     
-    grid_lines = make_grid_lines(
+    grid_lines = make_grid_line_coords(
         site_shape,
         translate(center, xoff=raw_phase_offset),
         np.pi / 2,  # N-S orientation
         interrow_spacing
         )
     
+    # only lines crossing the bounding box of the site can intersect it
+    if len(grid_lines):
+        grid_lines = grid_lines[segments_intersect_bounds(grid_lines, site_shape.bounds)]
+    
     # for segment in grid_lines:
     #     pyplot.plot([point[0] for point in segment.coords], [point[1] for point in segment.coords], 'b')
     
@@ -169,10 +173,11 @@ def place_solar_strands(max_num_modules: int,
     module_site = Polygon([(0, 0), (module_width, 0), (module_width, module_height), (0, module_height)])
     strands: list[tuple(int, float, Polygon)] = []
     num_modules_remaining: int = max_num_modules
-    for row_number, grid_line in enumerate(grid_lines):
+    for row_number, grid_line_coords in enumerate(grid_lines):
         if num_modules_remaining < min_strand_length:
             break
         
+        grid_line = LineString(grid_line_coords)
         if not prepared_site.intersects(grid_line):
             continue
         
@@ -9,6 +9,7 @@ from shapely.geometry import Point
 from shapely.geometry import Polygon, MultiPolygon, MultiPoint
 from shapely.ops import unary_union
 import timezonefinder
+from pysolar import solartime, constants
 from pysolar.solar import *
 from pvmismatch import *
 
@@ -51,14 +52,82 @@ def get_sun_pos(lat: float,
         start = datetime.datetime(2012, 1, 1, start_hr, 0, 0, 0, tzinfo=get_time_zone(lat, lon))
         date_generated = [start + datetime.timedelta(minutes=x * step_in_minutes) for x in range(n)]
 
-    azi_ang = np.zeros(len(date_generated))
-    elv_ang = np.zeros(len(date_generated))
-    for tt, date in enumerate(date_generated):
-        azi_ang[tt] = get_azimuth(lat, lon, date)
-        elv_ang[tt] = get_altitude(lat, lon, date)
+    azi_ang, elv_ang = get_sun_pos_vectorized(lat, lon, date_generated)
     return azi_ang, elv_ang, date_generated
 
 
+def get_sun_pos_vectorized(lat: float,
+                           lon: float,
+                           dates: List[datetime.datetime]
+                           ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates the sun azimuth & elevation angles for all dates at once, with the same Solar Position Algorithm
+    as pysolar's `get_azimuth` and `get_altitude`, evaluated on arrays rather than per datetime
+
+    :param lat: latitude, degrees
+    :param lon: longitude, degrees
+    :param dates: timezone-aware datetimes
+
+    :returns: array of sun azimuth, array of sun elevation
+    """
+    if not len(dates):
+        return np.zeros(0), np.zeros(0)
+
+    # leap seconds and delta t only change between days, so look them up once per UTC day
+    timestamps = np.array([date.timestamp() for date in dates])
+    days = timestamps // solartime.seconds_per_day
+    _, first_of_day, day_index = np.unique(days, return_index=True, return_inverse=True)
+    leap_seconds = np.array([solartime.get_leap_seconds(dates[i]) for i in first_of_day])[day_index]
+    delta_t = np.array([solartime.get_delta_t(dates[i]) for i in first_of_day])[day_index]
+
+    # Julian days, as in pysolar.solartime.get_julian_solar_day and get_julian_ephemeris_day
+    day_offset = solartime.gregorian_day_offset + solartime.julian_day_offset
+    jd = (timestamps + leap_seconds + solartime.tt_offset - delta_t) / solartime.seconds_per_day + day_offset
+    jde = (timestamps + leap_seconds + solartime.tt_offset) / solartime.seconds_per_day + day_offset
+    jce = solartime.get_julian_ephemeris_century(jde)
+    jme = solartime.get_julian_ephemeris_millennium(jce)
+
+    # topocentric position, as in pysolar.solar.get_topocentric_position at zero elevation
+    projected_radial_distance = get_projected_radial_distance(0, lat)
+    projected_axial_distance = get_projected_axial_distance(0, lat)
+    geocentric_latitude = get_geocentric_latitude(jme)
+    geocentric_longitude = get_geocentric_longitude(jme)
+    sun_earth_distance = get_sun_earth_distance(jme)
+    aberration_correction = get_aberration_correction(sun_earth_distance)
+    equatorial_horizontal_parallax = get_equatorial_horizontal_parallax(sun_earth_distance)
+    nutation = get_nutation(jce)
+    apparent_sidereal_time = get_apparent_sidereal_time(jd, jme, nutation)
+    true_ecliptic_obliquity = get_true_ecliptic_obliquity(jme, nutation)
+
+    apparent_sun_longitude = get_apparent_sun_longitude(geocentric_longitude, nutation, aberration_correction)
+    geocentric_sun_right_ascension = get_geocentric_sun_right_ascension(apparent_sun_longitude,
+                                                                        true_ecliptic_obliquity,
+                                                                        geocentric_latitude)
+    geocentric_sun_declination = get_geocentric_sun_declination(apparent_sun_longitude,
+                                                                true_ecliptic_obliquity,
+                                                                geocentric_latitude)
+    local_hour_angle = get_local_hour_angle(apparent_sidereal_time, lon, geocentric_sun_right_ascension)
+    parallax_sun_right_ascension = get_parallax_sun_right_ascension(projected_radial_distance,
+                                                                    equatorial_horizontal_parallax,
+                                                                    local_hour_angle,
+                                                                    geocentric_sun_declination)
+    topocentric_local_hour_angle = get_topocentric_local_hour_angle(local_hour_angle, parallax_sun_right_ascension)
+    topocentric_sun_declination = get_topocentric_sun_declination(geocentric_sun_declination,
+                                                                  projected_axial_distance,
+                                                                  equatorial_horizontal_parallax,
+                                                                  parallax_sun_right_ascension,
+                                                                  local_hour_angle)
+
+    # elevation with refraction correction at standard conditions, as in pysolar.solar.get_altitude
+    topocentric_elevation_angle = get_topocentric_elevation_angle(lat, topocentric_sun_declination,
+                                                                  topocentric_local_hour_angle)
+    refraction_correction = get_refraction_correction(constants.standard_pressure, constants.standard_temperature,
+                                                      topocentric_elevation_angle)
+    elv_ang = topocentric_elevation_angle + refraction_correction
+    azi_ang = get_topocentric_azimuth_angle(topocentric_local_hour_angle, lat, topocentric_sun_declination)
+    return np.asarray(azi_ang, dtype=float), np.asarray(elv_ang, dtype=float)
+
+
 def blade_pos_of_rotated_ellipse(radius_x: float,
                                  radius_y: float,
                                  rotation_theta: Union[float, np.ndarray],
@@ -84,68 +153,56 @@ def blade_pos_of_rotated_ellipse(radius_x: float,
     return x, y
 
 
-def get_turbine_shadow_polygons(blade_length: float,
-                                blade_angle: Optional[float],
-                                azi_ang: float,
-                                elv_ang: float,
-                                wind_dir,
-                                tower_shadow: bool = True,
+def get_turbine_shadow_vertices(blade_length: float,
+                                blade_angles: Optional[Union[list, np.ndarray]],
+                                azi_ang: Union[float, np.ndarray],
+                                elv_ang: Union[float, np.ndarray],
+                                wind_dir: Optional[Union[float, np.ndarray]] = None,
                                 tower_height: Optional[float] = None
-                                ) -> Tuple[Union[None, Polygon, MultiPolygon], float]:
+                                ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Calculates the (x, y) coordinates of a wind turbine's shadow, which depends on the sun azimuth and elevation.
-
-    The dimensions of the tower and blades are in fixed ratios to the blade_length. The blade angle is the degrees from
-    z-axis, whereas the wind direction is where the turbine is pointing towards (if None, north is assumed).
-
-    In spherical coordinates, blade angle is phi and wind direction is theta, with 0 at north, moving clockwise.
-
-    The output shadow polygon is relative to the turbine located at (0, 0).
+    Calculates the vertices of a wind turbine's tower and blade shadows for many sun positions and blade angles in one
+    call. See get_turbine_shadow_polygons for the turbine dimensions and angle conventions.
 
     :param blade_length: meters, radius in spherical coords
-    :param blade_angle: degrees from z-axis, or None to use ellipse as swept area
-    :param azi_ang: azimuth degrees, clockwise from north as 0
-    :param elv_ang: elevation degrees, from x-y plane as 0
-    :param wind_dir: degrees from north, clockwise, determines which direction rotor is facing
-    :param tower_shadow: if false, do not include the tower's shadow
-    :returns: (shadow polygon, shadow angle from north) if shadow exists, otherwise (None, None)
+    :param blade_angles: degrees from z-axis per blade angle, or None to use ellipse as swept area
+    :param azi_ang: azimuth degrees per sun position, clockwise from north as 0
+    :param elv_ang: elevation degrees per sun position, from x-y plane as 0
+    :param wind_dir: degrees from north per sun position, clockwise, determines which direction rotor is facing
+    :param tower_height: meters, defaults to 2.5 blade lengths
+    :returns: shadow angle from north [n_sun] which is nan where there is no shadow,
+              tower shadow vertices [n_sun, 4, 2],
+              blade shadow vertices [n_sun, n_angles, 3, 4, 2] or swept area vertices [n_sun, 50, 2] if blade_angles is
+              None
     """
-    # "Shadow analysis of wind turbines for dual use of land for combined wind and solar photovoltaic power generation":
-    # the average tower_height=2.5R; average tower_width=R/16; average blade_width=R/16
     blade_width = blade_length / 16
     if tower_height is None:
         tower_height = 2.5 * blade_length
     tower_width = blade_width
 
-    # get shadow info
-    sun_elv_rad = np.radians(elv_ang)
-    tan_elv_inv = np.tan(sun_elv_rad) ** -1
+    azi_ang = np.atleast_1d(np.asarray(azi_ang, dtype=float))
+    elv_ang = np.atleast_1d(np.asarray(elv_ang, dtype=float))
+    wind_dir = np.zeros_like(azi_ang) if wind_dir is None else np.broadcast_to(np.asarray(wind_dir, dtype=float),
+                                                                                azi_ang.shape)
 
-    shadow_ang = azi_ang - 180.0
-    if not wind_dir:
-        wind_dir = 0
-    if elv_ang <= 0.0:
-        shadow_ang = np.nan
-    if shadow_ang < 0.0:
-        shadow_ang += 360.0
+    # get shadow info
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tan_elv_inv = np.tan(np.radians(elv_ang)) ** -1
 
+    shadow_ang = np.mod(azi_ang - 180.0, 360.0)
     shadow_tower_length = tower_height * tan_elv_inv
-    if shadow_tower_length <= 0.0:
-        shadow_tower_length = np.nan
-
-    theta = np.radians(shadow_ang)
-    if np.isnan(shadow_tower_length) or np.isnan(theta):
-        return None, None
+    shadow_ang[(elv_ang <= 0.0) | ~(shadow_tower_length > 0.0)] = np.nan
 
     shadow_length_blade_top = (tower_height + blade_length) * tan_elv_inv
     shadow_length_blade_bottom = (tower_height - blade_length) * tan_elv_inv
     shadow_height_blade = shadow_length_blade_top - shadow_length_blade_bottom
-    shadow_width_blade = blade_length * abs(np.cos(np.radians(shadow_ang - wind_dir)))
+    shadow_width_blade = blade_length * np.abs(np.cos(np.radians(shadow_ang - wind_dir)))
 
     # calculate the tower shadow position
     tower_dx = tower_width / 2.0
     tower_dy = shadow_tower_length
 
+    theta = np.radians(shadow_ang)
     theta_left = np.radians(shadow_ang - 90)
     theta_right = np.radians(shadow_ang + 90)
     cos_theta = np.cos(theta)
@@ -155,14 +212,10 @@ def get_turbine_shadow_polygons(blade_length: float,
     base_rght_x, base_rght_y = tower_dx * np.sin(theta_right), tower_dx * np.cos(theta_right)
     top_rght_x, top_rght_y = tower_dy * sin_theta + base_rght_x, tower_dy * cos_theta + base_rght_y
     top_left_x, top_left_y = tower_dy * sin_theta + base_left_x, tower_dy * cos_theta + base_left_y
-
-    if tower_shadow:
-        turbine_shadow = Polygon(((base_left_x, base_left_y),
-                                  (base_rght_x, base_rght_y),
-                                  (top_rght_x, top_rght_y),
-                                  (top_left_x, top_left_y)))
-    else:
-        turbine_shadow = Polygon()
+    tower_vertices = np.stack((np.stack((base_left_x, base_left_y), axis=-1),
+                               np.stack((base_rght_x, base_rght_y), axis=-1),
+                               np.stack((top_rght_x, top_rght_y), axis=-1),
+                               np.stack((top_left_x, top_left_y), axis=-1)), axis=1)
 
     # calculate the blade shadows of swept area using parametric eq of general ellipse
     radius_x = shadow_width_blade
@@ -173,34 +226,100 @@ def get_turbine_shadow_polygons(blade_length: float,
     rot_ang = 360 - shadow_ang + 90
     rotation_theta = np.radians(rot_ang)
 
-    if blade_angle is None:
+    if blade_angles is None:
         degs = np.linspace(0, 2 * np.pi, 50)
-        x, y = blade_pos_of_rotated_ellipse(radius_y, radius_x, rotation_theta, degs, center_x, center_y)
-        turbine_shadow = unary_union([turbine_shadow, Polygon(zip(x, y))])
+        x, y = blade_pos_of_rotated_ellipse(radius_y[:, None], radius_x[:, None], rotation_theta[:, None], degs,
+                                            center_x[:, None], center_y[:, None])
+        return shadow_ang, tower_vertices, np.stack((x, y), axis=-1)
+
+    # [n_sun, n_angles, 3 blades]
+    turbine_blade_angles = np.asarray(blade_angles, dtype=float)[:, None] + np.array((0, 120, -120))
+    expand = (slice(None), None, None)
+    radius_x, radius_y, rotation_theta = radius_x[expand], radius_y[expand], rotation_theta[expand]
+    center_x, center_y = center_x[expand], center_y[expand]
+
+    blade_theta = np.radians(turbine_blade_angles - 90)
+    x, y = blade_pos_of_rotated_ellipse(radius_y, radius_x, rotation_theta, blade_theta, center_x, center_y)
+
+    blade_1_dr = np.radians(turbine_blade_angles + 90)
+    blade_2_dr = np.radians(turbine_blade_angles - 90)
+
+    blade_tip_left_x, blade_tip_left_y = tower_dx * np.cos(blade_1_dr) + center_x, \
+                                         tower_dx * np.sin(blade_1_dr) + center_y
+    blade_tip_rght_x, blade_tip_rght_y = tower_dx * np.cos(blade_2_dr) + center_x, \
+                                         tower_dx * np.sin(blade_2_dr) + center_y
+    blade_base_rght_x, blade_base_rght_y = tower_dx * np.cos(blade_2_dr) + x, \
+                                           tower_dx * np.sin(blade_2_dr) + y
+    blade_base_left_x, blade_base_left_y = tower_dx * np.cos(blade_1_dr) + x, \
+                                           tower_dx * np.sin(blade_1_dr) + y
+    blade_vertices = np.stack((np.stack((blade_tip_left_x, blade_tip_left_y), axis=-1),
+                               np.stack((blade_tip_rght_x, blade_tip_rght_y), axis=-1),
+                               np.stack((blade_base_rght_x, blade_base_rght_y), axis=-1),
+                               np.stack((blade_base_left_x, blade_base_left_y), axis=-1)), axis=-2)
+    return shadow_ang, tower_vertices, blade_vertices
+
+
+def turbine_shadow_from_vertices(tower_vertices: np.ndarray,
+                                 blade_vertices: np.ndarray,
+                                 tower_shadow: bool = True
+                                 ) -> Union[Polygon, MultiPolygon]:
+    """
+    Merges the tower and blade shadows of one sun position and blade angle, from get_turbine_shadow_vertices, into a
+    single shadow polygon
+
+    :param tower_vertices: [4, 2] tower shadow vertices
+    :param blade_vertices: [3, 4, 2] blade shadow vertices, or [50, 2] swept area vertices
+    :param tower_shadow: if false, do not include the tower's shadow
+    :returns: shadow polygon
+    """
+    parts = [Polygon(tower_vertices)] if tower_shadow else []
+    if blade_vertices.ndim == 2:
+        parts.append(Polygon(blade_vertices))
     else:
-        turbine_blade_angles = (blade_angle, blade_angle + 120, blade_angle - 120)
+        parts += [Polygon(blade) for blade in blade_vertices]
+    return unary_union(parts)
 
-        for blade_angle in turbine_blade_angles:
-            blade_theta = np.radians(blade_angle - 90)
-            x, y = blade_pos_of_rotated_ellipse(radius_y, radius_x, rotation_theta, blade_theta, center_x, center_y)
 
-            blade_1_dr = np.radians(blade_angle + 90)
-            blade_2_dr = np.radians(blade_angle - 90)
+def get_turbine_shadow_polygons(blade_length: float,
+                                blade_angle: Optional[float],
+                                azi_ang: float,
+                                elv_ang: float,
+                                wind_dir,
+                                tower_shadow: bool = True,
+                                tower_height: Optional[float] = None
+                                ) -> Tuple[Union[None, Polygon, MultiPolygon], float]:
+    """
+    Calculates the (x, y) coordinates of a wind turbine's shadow, which depends on the sun azimuth and elevation.
 
-            blade_tip_left_x, blade_tip_left_y = tower_dx * np.cos(blade_1_dr) + center_x, \
-                                                 tower_dx * np.sin(blade_1_dr) + center_y
-            blade_tip_rght_x, blade_tip_rght_y = tower_dx * np.cos(blade_2_dr) + center_x, \
-                                                 tower_dx * np.sin(blade_2_dr) + center_y
-            blade_base_rght_x, blade_base_rght_y = tower_dx * np.cos(blade_2_dr) + x, \
-                                                   tower_dx * np.sin(blade_2_dr) + y
-            blade_base_left_x, blade_base_left_y = tower_dx * np.cos(blade_1_dr) + x, \
-                                                   tower_dx * np.sin(blade_1_dr) + y
+    The dimensions of the tower and blades are in fixed ratios to the blade_length. The blade angle is the degrees from
+    z-axis, whereas the wind direction is where the turbine is pointing towards (if None, north is assumed).
 
-            turbine_shadow = unary_union([turbine_shadow, Polygon(((blade_tip_left_x, blade_tip_left_y),
-                                                                      (blade_tip_rght_x, blade_tip_rght_y),
-                                                                      (blade_base_rght_x, blade_base_rght_y),
-                                                                      (blade_base_left_x, blade_base_left_y)))])
-    return turbine_shadow, shadow_ang
+    In spherical coordinates, blade angle is phi and wind direction is theta, with 0 at north, moving clockwise.
+
+    The output shadow polygon is relative to the turbine located at (0, 0).
+
+    :param blade_length: meters, radius in spherical coords
+    :param blade_angle: degrees from z-axis, or None to use ellipse as swept area
+    :param azi_ang: azimuth degrees, clockwise from north as 0
+    :param elv_ang: elevation degrees, from x-y plane as 0
+    :param wind_dir: degrees from north, clockwise, determines which direction rotor is facing
+    :param tower_shadow: if false, do not include the tower's shadow
+    :returns: (shadow polygon, shadow angle from north) if shadow exists, otherwise (None, None)
+    """
+    # "Shadow analysis of wind turbines for dual use of land for combined wind and solar photovoltaic power generation":
+    # the average tower_height=2.5R; average tower_width=R/16; average blade_width=R/16
+    if not wind_dir:
+        wind_dir = 0
+    blade_angles = None if blade_angle is None else (blade_angle,)
+    shadow_ang, tower_vertices, blade_vertices = get_turbine_shadow_vertices(blade_length, blade_angles,
+                                                                             azi_ang, elv_ang, wind_dir,
+                                                                             tower_height)
+    if np.isnan(shadow_ang[0]):
+        return None, None
+
+    blade_vertices = blade_vertices[0] if blade_angle is None else blade_vertices[0, 0]
+    turbine_shadow = turbine_shadow_from_vertices(tower_vertices[0], blade_vertices, tower_shadow)
+    return turbine_shadow, shadow_ang[0]
 
 
 def get_turbine_shadows_timeseries(blade_length: float,
@@ -215,6 +334,8 @@ def get_turbine_shadows_timeseries(blade_length: float,
     Calculate turbine shadows for a number of equally-spaced blade angles per time step.
     Returns a list of turbine shadows per time step, where each entry has a shadow for each angle.
 
+    The shadow vertices of all time steps and angles are calculated at once with get_turbine_shadow_vertices.
+
     :param blade_length: meters
     :param steps: which timesteps to calculate
     :param angles_per_step: number of blade angles per timestep
@@ -228,28 +349,33 @@ def get_turbine_shadows_timeseries(blade_length: float,
     if len(steps) != len(azi_ang) or len(steps) != len(elv_ang):
         raise ValueError("Timesteps provided in 'steps' not equal in length to azimuth and elevation arrays")
 
-    turbine_shadows_per_timestep = []
     if angles_per_step is None:
-        angles_range = (None,)
+        angles_range = None
     else:
         step_to_angle = 120 / angles_per_step
         angles_range = [i * step_to_angle for i in range(angles_per_step)]
 
-    for n, step in enumerate(steps):
+    elv_ang = np.asarray(elv_ang, dtype=float)
+    wind_dir = None
+    if wind_ang is not None:
+        wind_dir = np.array([wind_ang[step] if wind_ang[step] else 0 for step in steps], dtype=float)
+    shadow_ang, tower_vertices, blade_vertices = get_turbine_shadow_vertices(blade_length, angles_range,
+                                                                             azi_ang, elv_ang, wind_dir)
+    # a shadow angle of exactly 0 (sun due south) has never been counted as a shadow
+    has_shadow = ~np.isnan(shadow_ang) & (shadow_ang != 0)
+
+    turbine_shadows_per_timestep = []
+    for n in range(len(steps)):
         if elv_ang[n] < 0:
             turbine_shadows_per_timestep.append(None)
             continue
         shadows = []
-        wind_dir = None if wind_ang is None else wind_ang[step]
-        for angle in angles_range:
-            turbine_shadow, shadow_ang = get_turbine_shadow_polygons(blade_length,
-                                                                     angle,
-                                                                     azi_ang=azi_ang[n],
-                                                                     elv_ang=elv_ang[n],
-                                                                     wind_dir=wind_dir,
-                                                                     tower_shadow=tower_shadow)
-            if turbine_shadow and shadow_ang:
-                shadows.append(turbine_shadow)
+        if has_shadow[n]:
+            if angles_range is None:
+                shadows.append(turbine_shadow_from_vertices(tower_vertices[n], blade_vertices[n], tower_shadow))
+            else:
+                for blades in blade_vertices[n]:
+                    shadows.append(turbine_shadow_from_vertices(tower_vertices[n], blades, tower_shadow))
         turbine_shadows_per_timestep.append(shadows)
     return turbine_shadows_per_timestep
 
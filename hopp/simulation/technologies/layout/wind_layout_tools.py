@@ -7,7 +7,7 @@ from shapely.geometry.base import BaseGeometry
 from shapely.prepared import prep
 from shapely.ops import unary_union
 
-from hopp.simulation.technologies.layout.layout_tools import binary_search_float
+from hopp.simulation.technologies.layout.layout_tools import binary_search_float, LayoutGeometry
 
 
 def get_evenly_spaced_points_along_border(boundary: BaseGeometry,
@@ -35,21 +35,21 @@ def get_evenly_spaced_points_along_border(boundary: BaseGeometry,
     return result
 
 
-def make_grid_lines(site_shape: BaseGeometry,
-                    center: Point,
-                    grid_angle: float,
-                    interrow_spacing: float
-                    ) -> list:
+def make_grid_line_coords(site_shape: BaseGeometry,
+                          center: Point,
+                          grid_angle: float,
+                          interrow_spacing: float
+                          ) -> np.ndarray:
     """
-    Place parallel lines inside a site
+    Coordinates of the parallel lines of `make_grid_lines`
     :param site_shape: Polygon
     :param center: where to center the grid
     :param grid_angle: in degrees where 0 is east
     :param interrow_spacing: distance between lines
-    :return: list of lines
+    :return: array of shape [n_lines, 2, 2] of the (x, y) start and end of each line
     """
     if site_shape.is_empty:
-        return []
+        return np.zeros((0, 2, 2))
     
     grid_angle = (grid_angle + np.pi) % (2 * np.pi) - np.pi  # reset grid_angle to (-pi, pi)
     bounds = site_shape.bounds
@@ -61,17 +61,29 @@ def make_grid_lines(site_shape: BaseGeometry,
     base_line = rotate(base_line, -grid_angle, use_radians=True)
     base_line = translate(base_line, center.x, center.y)
     
-    row_offset = Point(
+    row_offset = np.array([
         interrow_spacing * np.cos(-grid_angle + np.pi / 2),
-        interrow_spacing * np.sin(-grid_angle + np.pi / 2))
+        interrow_spacing * np.sin(-grid_angle + np.pi / 2)])
     
-    grid_lines: list[LineString] = []
     num_rows_per_side: int = int(np.ceil((line_length / 2) / interrow_spacing) + 1)
-    for row_number in range(-num_rows_per_side, num_rows_per_side + 1):
-        line = translate(base_line, row_number * row_offset.x, row_number * row_offset.y)
-        grid_lines.append(line)
-    
-    return grid_lines
+    row_numbers = np.arange(-num_rows_per_side, num_rows_per_side + 1)
+    return np.array(base_line.coords)[None, :, :] + (row_numbers[:, None] * row_offset)[:, None, :]
+
+
+def make_grid_lines(site_shape: BaseGeometry,
+                    center: Point,
+                    grid_angle: float,
+                    interrow_spacing: float
+                    ) -> list:
+    """
+    Place parallel lines inside a site
+    :param site_shape: Polygon
+    :param center: where to center the grid
+    :param grid_angle: in degrees where 0 is east
+    :param interrow_spacing: distance between lines
+    :return: list of lines
+    """
+    return [LineString(line) for line in make_grid_line_coords(site_shape, center, grid_angle, interrow_spacing)]
 
 
 def create_grid(site_shape: BaseGeometry,
@@ -81,6 +93,7 @@ def create_grid(site_shape: BaseGeometry,
                 interrow_spacing: float,
                 row_phase_offset: float,
                 max_sites: int = None,
+                site_geometry: Optional[LayoutGeometry] = None,
                 ) -> list:
     """
     Get a list of coordinates placed along a grid inside a site boundary
@@ -91,34 +104,39 @@ def create_grid(site_shape: BaseGeometry,
     :param interrow_spacing: distance between rows
     :param row_phase_offset: offset of turbines along row from one row to the next
     :param max_sites: max number of turbines
+    :param site_geometry: LayoutGeometry of site_shape, to reuse across calls with the same site_shape
     :return: list of coordinates
     """
-    grid_lines: list[LineString] = make_grid_lines(
+    grid_lines = make_grid_line_coords(
         site_shape,
         center,
         grid_angle,
         interrow_spacing
         )
+    if not len(grid_lines):
+        return []
+    if site_geometry is None:
+        site_geometry = LayoutGeometry(site_shape)
     phase_offset: float = row_phase_offset * intrarow_spacing
     
-    prepared_site = prep(site_shape)
-    grid_positions: list[Point] = []
-    for row_number, grid_line in enumerate(grid_lines):
-        length = grid_line.length
-        
-        # generate points along that line with the right phase offset
-        x: float = (phase_offset * row_number) % intrarow_spacing
-        while x <= length:
-            position = grid_line.interpolate(x)
-            if prepared_site.contains(position):
-                if max_sites and len(grid_positions) >= max_sites:
-                    break
-                grid_positions.append(position)
-            x += intrarow_spacing
-        if max_sites and len(grid_positions) >= max_sites:
-            break
+    # distances of the positions along each line, with the right phase offset for each row
+    start = grid_lines[:, 0]
+    direction = grid_lines[:, 1] - start
+    length = np.sqrt(direction[:, 0] ** 2 + direction[:, 1] ** 2)
+    first = (phase_offset * np.arange(len(grid_lines))) % intrarow_spacing
+    num_positions = int(np.max(np.floor((length - first) / intrarow_spacing))) + 2
+    steps = np.full((len(grid_lines), num_positions), float(intrarow_spacing))
+    steps[:, 0] = first
+    distance = np.cumsum(steps, axis=1)
+    valid = distance <= length[:, None]
     
-    return grid_positions
+    fraction = distance / length[:, None]
+    x = (start[:, None, 0] + direction[:, None, 0] * fraction)[valid]
+    y = (start[:, None, 1] + direction[:, None, 1] * fraction)[valid]
+    inside = np.flatnonzero(site_geometry.contains_points(x, y))
+    if max_sites:
+        inside = inside[:max_sites]
+    return [Point(x[i], y[i]) for i in inside]
 
 
 def get_best_grid(site_shape: BaseGeometry,
@@ -148,7 +166,7 @@ def get_best_grid(site_shape: BaseGeometry,
     best: tuple[int, float, list[Point]] = (0, max_spacing, [])
     
     if max_sites > 0:
-        prepared_site = prep(site_shape)
+        site_geometry = LayoutGeometry(site_shape)
         
         def grid_objective(intrarow_spacing: float) -> float:
             nonlocal best
@@ -161,7 +179,8 @@ def get_best_grid(site_shape: BaseGeometry,
                 intrarow_spacing,
                 interrow_spacing,
                 row_phase_offset,
-                max_sites)
+                max_sites,
+                site_geometry)
             num_sites = len(grid_sites)
             
             delta_sites = num_sites - best[0]
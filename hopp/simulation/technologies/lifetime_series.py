@@ -0,0 +1,70 @@
+from typing import Sequence, Union
+
+import numpy as np
+
+from hopp.type_dec import NDArrayFloat
+
+
+class LifetimeSeries:
+    """
+    Time series over the project life that repeats a base period of one or more whole years.
+
+    Only the base period is stored; indexing, slicing and reductions map back onto it, and the full-length
+    float64 array is built only when explicitly converted with ``np.asarray``.
+
+    Args:
+        base: profile of the repeated period
+        n_total: length of the lifetime series, a multiple of ``len(base)``
+    """
+    def __init__(self, base: Union[Sequence, NDArrayFloat], n_total: int):
+        self.base = np.array(base, dtype=float)
+        self.base.flags.writeable = False
+        if len(self.base) == 0 or n_total % len(self.base) != 0:
+            raise ValueError(f"Lifetime series of length {n_total} cannot repeat a period of length {len(self.base)}")
+        self.n_repeats = n_total // len(self.base)
+
+    @classmethod
+    def from_profile(cls, profile: Union[Sequence, NDArrayFloat, "LifetimeSeries"], n_total: int) -> "LifetimeSeries":
+        """
+        Lifetime series that repeats ``profile``, which may itself be a lifetime series.
+        """
+        if isinstance(profile, LifetimeSeries):
+            return cls(profile.base, n_total)
+        return cls(profile, n_total)
+
+    def __len__(self) -> int:
+        return len(self.base) * self.n_repeats
+
+    def __getitem__(self, item):
+        n_base = len(self.base)
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step == 1 and start // n_base == (stop - 1) // n_base:
+                offset = start // n_base * n_base
+                return self.base[start - offset:stop - offset].copy()
+            return self.base[np.arange(start, stop, step) % n_base]
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("LifetimeSeries index out of range")
+        return self.base[item % n_base]
+
+    def __array__(self, dtype=None, copy=None):
+        return np.tile(self.base, self.n_repeats).astype(dtype or float, copy=False)
+
+    def __iter__(self):
+        for _ in range(self.n_repeats):
+            yield from self.base
+
+    def sum(self) -> float:
+        return self.base.sum() * self.n_repeats
+
+    def year(self, index: int, n_timesteps: int) -> NDArrayFloat:
+        """
+        Profile of a single year of the series.
+
+        Args:
+            index: zero-based year
+            n_timesteps: number of timesteps per year
+        """
+        return self[index * n_timesteps:(index + 1) * n_timesteps]
@@ -1,7 +1,6 @@
 from typing import Iterable, Sequence, Union
 
 import numpy as np
-import pandas as pd
 import PySAM.Singleowner as Singleowner
 
 from hopp.simulation.technologies.sites.site_info import SiteInfo
@@ -10,6 +9,8 @@ from hopp.simulation.technologies.dispatch.power_sources.power_source_dispatch i
 from hopp.tools.utils import array_not_scalar, equal
 from hopp.utilities.log import hybrid_logger as logger
 from hopp.simulation.base import BaseClass
+from hopp.simulation.technologies.capacity_credit import max_feasible_generation_kwh, capacity_value_percent
+from hopp.type_dec import NDArrayFloat
 
 
 class PowerSource(BaseClass):
@@ -96,50 +97,98 @@ class PowerSource(BaseClass):
         self._financial_model.unassign("battery_total_cost_lcos")
         self._financial_model.value("cp_battery_nameplate", 0)
 
-    def value(self, var_name: str, var_value=None):
-        """
-        Gets or Sets a variable value within either the system or financial PySAM models. Method looks in system
-        model first. If unsuccessful, then it looks in the financial model.
-
-        .. note::
-
-            If system and financial models contain a variable with the same name, only the system model variable will
-            be set.
+    # Resolved location of each variable name, keyed by (PowerSource class, system model class, financial model class)
+    _value_location_cache = {}
 
-        ``value(var_name)`` Gets variable value
-
-        ``value(var_name, var_value)`` Sets variable value
+    def _resolve_value_location(self, var_name: str):
+        """
+        Finds where a variable lives: on the PowerSource itself, or within a group of the system or financial model.
 
-        :param var_name: PySAM variable name
-        :param var_value: (optional) PySAM variable value
+        Resolutions are cached per class and per model class, so replacing a model with one of another type
+        resolves names again. For models other than PySAM modules, a cached group that no longer holds the variable
+        is resolved again as well.
 
-        :returns: Variable value (when getter)
+        :param var_name: variable name, without any 'adjust:' prefix
+        :returns: tuple of ('self', None), ('system', group name) or ('financial', group name)
         """
-        var_name = var_name.replace('adjust:', '')
-        attr_obj = None
+        if var_name in getattr(self, "__dict__", ()):
+            return "self", None
+        key = (type(self), type(self._system_model), type(self._financial_model))
+        locations = PowerSource._value_location_cache.setdefault(key, {})
+        location = locations.get(var_name)
+        if location is not None:
+            model_type, group_name = location
+            if model_type == "self":
+                return location
+            model = self._system_model if model_type == "system" else self._financial_model
+            if type(model).__module__.startswith("PySAM"):
+                # groups of a PySAM module are the same for every instance
+                return location
+            try:
+                if var_name in getattr(model, group_name).__dir__():
+                    return location
+            except:
+                pass
+
+        location = None
         if var_name in self.__dir__():
-            attr_obj = self
-        if not attr_obj:
+            location = ("self", None)
+        if not location:
             for a in self._system_model.__dir__():
                 try:
                     group_obj = getattr(self._system_model, a)
                     if var_name in group_obj.__dir__():
-                        attr_obj = group_obj
+                        location = ("system", a)
                         break
                 except:
                     pass
-        if not attr_obj:
+        if not location:
             for a in self._financial_model.__dir__():
                 try:
                     group_obj = getattr(self._financial_model, a)
                     if var_name in group_obj.__dir__():
-                        attr_obj = group_obj
+                        location = ("financial", a)
                         break
                 except:
                     pass
-        if not attr_obj:
+        if not location:
             raise ValueError("Variable {} not found in technology or financial model {}".format(
                 var_name, self.__class__.__name__))
+        # instance attributes are checked directly above, so only class-wide resolutions are cached
+        if location[0] != "self" or hasattr(type(self), var_name):
+            locations[var_name] = location
+        return location
+
+    def _value_attr_obj(self, var_name: str):
+        """Returns the object holding the variable var_name"""
+        model_type, group_name = self._resolve_value_location(var_name)
+        if model_type == "self":
+            return self
+        elif model_type == "system":
+            return getattr(self._system_model, group_name)
+        return getattr(self._financial_model, group_name)
+
+    def value(self, var_name: str, var_value=None):
+        """
+        Gets or Sets a variable value within either the system or financial PySAM models. Method looks in system
+        model first. If unsuccessful, then it looks in the financial model.
+
+        .. note::
+
+            If system and financial models contain a variable with the same name, only the system model variable will
+            be set.
+
+        ``value(var_name)`` Gets variable value
+
+        ``value(var_name, var_value)`` Sets variable value
+
+        :param var_name: PySAM variable name
+        :param var_value: (optional) PySAM variable value
+
+        :returns: Variable value (when getter)
+        """
+        var_name = var_name.replace('adjust:', '')
+        attr_obj = self._value_attr_obj(var_name)
 
         if var_value is None:
             try:
@@ -160,6 +209,16 @@ class PowerSource(BaseClass):
             except Exception as e:
                 raise IOError(f"{self.__class__}'s attribute {var_name} could not be set to {var_value}: {e}")
 
+    def values(self, var_names: Iterable[str]) -> dict:
+        """
+        Gets several variable values within either the system or financial PySAM models, see `value`.
+
+        :param var_names: PySAM variable names
+
+        :returns: dictionary of variable name and value
+        """
+        return {var_name: self.value(var_name) for var_name in var_names}
+
     def assign(self, input_dict: dict):
         """
         Sets input variables in the PowerSource class or any of its subclasses (system or financial models)
@@ -167,6 +226,25 @@ class PowerSource(BaseClass):
         for k, v in input_dict.items():
             self.value(k, v)
 
+    def assign_fast(self, input_dict: dict):
+        """
+        Sets input variables in the PowerSource class or any of its subclasses (system or financial models).
+
+        Unlike `assign`, values are not compared one at a time against a custom financial model; the custom financial
+        model is instead updated once with all the assigned values it holds.
+        """
+        for k, v in input_dict.items():
+            var_name = k.replace('adjust:', '')
+            try:
+                setattr(self._value_attr_obj(var_name), var_name, v)
+            except ValueError:
+                raise
+            except Exception as e:
+                raise IOError(f"{self.__class__}'s attribute {var_name} could not be set to {v}: {e}")
+        if self._financial_model is not None and not isinstance(self._financial_model, Singleowner.Singleowner):
+            self._financial_model.assign({k.replace('adjust:', ''): v for k, v in input_dict.items()},
+                                         ignore_missing_vals=True)
+
     def calc_nominal_capacity(self, interconnect_kw: float):
         """
         Calculates the nominal AC net system capacity based on specific technology.
@@ -190,7 +268,7 @@ class PowerSource(BaseClass):
             # [kW]
         return W_ac_nom
 
-    def calc_gen_max_feasible_kwh(self, interconnect_kw: float) -> list:
+    def calc_gen_max_feasible_kwh(self, interconnect_kw: float) -> NDArrayFloat:
         """
         Calculates the maximum feasible generation profile that could have occurred (year 1)
 
@@ -200,44 +278,35 @@ class PowerSource(BaseClass):
         """
         W_ac_nom = self.calc_nominal_capacity(interconnect_kw)
         t_step = self.site.interval / 60                                                # hr
-        E_net_max_feasible = [min(x,W_ac_nom) * t_step for x in self.generation_profile[0:self.site.n_timesteps]]      # [kWh]
-        return E_net_max_feasible
+        return max_feasible_generation_kwh(self.generation_profile[0:self.site.n_timesteps], W_ac_nom, t_step)
 
     def calc_capacity_credit_percent(self, interconnect_kw: float) -> float:
         """
         Calculates the capacity credit (value) using the last simulated year's max feasible generation profile.
 
+        Capacity hours may be given per timestep or hourly, so sub-hourly simulations are supported.
+
         :param interconnect_kw: Interconnection limit [kW]
 
         :return: capacity value [%]
         """
         if self.capacity_factor_mode == "cap_hours":
-            TIMESTEPS_YEAR = 8760
-
             t_step = self.site.interval / 60  # [hr]
-            if t_step != 1 or len(self.site.capacity_hours) != TIMESTEPS_YEAR or len(self.gen_max_feasible) != TIMESTEPS_YEAR:
-                print("WARNING: Capacity credit could not be calculated. Therefore, it was set to zero for "
-                    + type(self).__name__)
-                return 0
+            if len(self.gen_max_feasible) != self.site.n_timesteps:
+                capacity_value = None
             else:
-                df = pd.DataFrame()
-                df['cap_hours'] = self.site.capacity_hours
-                df['E_net_max_feasible'] = self.gen_max_feasible  # [kWh]
-
-                sel_df = df[df['cap_hours'] == True]
-
                 if type(self).__name__ != 'Grid':
                     W_ac_nom = self.calc_nominal_capacity(interconnect_kw)
                 else:
                     W_ac_nom = np.min((self.hybrid_nominal_capacity, interconnect_kw))
 
-                if len(sel_df.index) > 0 and W_ac_nom > 0:
-                    capacity_value = sum(np.minimum(sel_df['E_net_max_feasible'].values/(W_ac_nom*t_step), 1.0)) / len(sel_df.index) * 100
-                    capacity_value = np.min((100, capacity_value))       # [%]
-                else:
-                    capacity_value = 0
-
-                return capacity_value
+                capacity_value = capacity_value_percent(self.gen_max_feasible, self.site.capacity_hours, W_ac_nom,
+                                                         t_step)
+            if capacity_value is None:
+                print("WARNING: Capacity credit could not be calculated. Therefore, it was set to zero for "
+                    + type(self).__name__)
+                return 0
+            return capacity_value
         else:
             return self.capacity_credit_percent
 
@@ -714,12 +783,12 @@ class PowerSource(BaseClass):
             return benefits / self._financial_model.value("npv_annual_costs")
 
     @property
-    def gen_max_feasible(self) -> list:
+    def gen_max_feasible(self) -> NDArrayFloat:
         """Maximum feasible generation profile that could have occurred (year 1)"""
         return self._gen_max_feasible
 
     @gen_max_feasible.setter
-    def gen_max_feasible(self, gen_max_feas: list):
+    def gen_max_feasible(self, gen_max_feas: Union[list, NDArrayFloat]):
         self._gen_max_feasible = gen_max_feas
 
     def copy(self):
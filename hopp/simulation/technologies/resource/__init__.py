@@ -3,3 +3,4 @@ from hopp.simulation.technologies.resource.wind_resource import WindResource
 from hopp.simulation.technologies.resource.wave_resource import WaveResource
 from hopp.simulation.technologies.resource.elec_prices import ElectricityPrices
 from hopp.simulation.technologies.resource.resource import Resource
+from hopp.simulation.technologies.resource.shared_resource import SharedResourceStore, attach_shared_resources
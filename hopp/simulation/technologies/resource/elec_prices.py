@@ -7,6 +7,7 @@ import numpy as np
 from hopp.utilities.keys import get_developer_nrel_gov_key
 from hopp.utilities.log import hybrid_logger as logger
 from hopp.simulation.technologies.resource.resource import Resource
+from hopp.simulation.technologies.resource.shared_resource import PRICES, get_shared_resource
 
 
 class ElectricityPrices(Resource):
@@ -47,6 +48,10 @@ class ElectricityPrices(Resource):
         raise NotImplementedError
 
     def format_data(self):
+        shared = get_shared_resource(PRICES, self.filename)
+        if shared is not None:
+            self._data = shared[1]['data']
+            return
         if not os.path.isfile(self.filename):
             raise IOError(f"ElectricityPrices error: {self.filename} does not exist.")
         try:
@@ -0,0 +1,184 @@
+"""
+Shared-memory store for resource data used by multi-process optimization workers.
+
+A :class:`SharedResourceStore` is filled once in the parent process from a loaded ``SiteInfo``, which copies the
+solar, wind, wave and electricity price arrays into ``multiprocessing.shared_memory`` blocks. Its picklable (and
+JSON-serializable) :attr:`SharedResourceStore.handle` is passed to the workers, which call
+:func:`attach_shared_resources` before building their problem. After that, the resource classes that ``SiteInfo``
+creates find their file in the registry and use read-only views of the shared arrays instead of reading and
+parsing the file again.
+"""
+import os
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from hopp.utilities.log import hybrid_logger as logger
+
+
+SOLAR = "solar"
+WIND = "wind"
+WAVE = "wave"
+PRICES = "prices"
+
+# (kind, absolute filename) -> (metadata, arrays) for resources attached in this process
+_attached: Dict[Tuple[str, str], Tuple[dict, Dict[str, np.ndarray]]] = {}
+_attached_blocks: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _key(kind: str, filename: Union[str, Path]) -> str:
+    return f"{kind}:{os.path.abspath(filename)}"
+
+
+def _attach_block(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always registers attached blocks with the resource tracker. Workers started by the parent
+        # share its tracker, for which registering an existing block is a no-op, so the parent stays the owner.
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedResourceStore:
+    """
+    Publishes resource arrays loaded in the parent process to shared memory.
+
+    The store owns the shared memory blocks; call :meth:`close` (or use it as a context manager) once all workers
+    have exited to release them.
+
+    Example:
+
+    .. code-block::
+
+        site = SiteInfo(site_data, solar_resource_file=solar_file, grid_resource_file=grid_file)
+        with SharedResourceStore.from_site(site) as store:
+            driver = OptimizationDriver(setup, n_proc=64, shared_resources=store.handle)
+            ...
+    """
+    def __init__(self):
+        self._blocks = []
+        self.handle: Dict[str, dict] = {}
+
+    @classmethod
+    def from_site(cls, site) -> "SharedResourceStore":
+        """
+        Creates a store holding every resource loaded by ``site``.
+
+        :param site: SiteInfo with its resources loaded
+        """
+        store = cls()
+        store.add_site(site)
+        return store
+
+    def add_site(self, site) -> None:
+        """
+        Adds the solar, wind, wave and electricity price data loaded by ``site``.
+
+        :param site: SiteInfo with its resources loaded
+        """
+        from hopp.simulation.technologies.resource.solar_csv import read_solar_csv
+
+        if site.solar_resource is not None:
+            header, columns = read_solar_csv(site.solar_resource.filename)
+            self.add(SOLAR, site.solar_resource.filename, columns, meta={'header': header})
+        if site.wind_resource is not None:
+            data = site.wind_resource.data
+            meta = {k: v for k, v in data.items() if k != 'data'}
+            self.add(WIND, site.wind_resource.filename, {'data': np.asarray(data['data'], dtype=float)}, meta=meta)
+        wave_resource = getattr(site, 'wave_resource', None)
+        if wave_resource is not None:
+            arrays = {k: np.asarray(v, dtype=float) for k, v in wave_resource.data.items()}
+            self.add(WAVE, wave_resource.filename, arrays)
+        if site.elec_prices is not None and len(str(site.elec_prices.filename)) > 0:
+            self.add(PRICES, site.elec_prices.filename, {'data': np.asarray(site.elec_prices._data, dtype=float)})
+
+    def add(self, kind: str, filename: Union[str, Path], arrays: Dict[str, np.ndarray], meta: Optional[dict] = None):
+        """
+        Copies ``arrays`` into shared memory and registers them under the resource ``kind`` and ``filename``.
+
+        :param kind: one of 'solar', 'wind', 'wave' or 'prices'
+        :param filename: resource file the arrays were loaded from
+        :param arrays: named arrays to share
+        :param meta: JSON-serializable metadata returned alongside the arrays
+        """
+        entry = {'meta': meta if meta is not None else {}, 'arrays': {}}
+        for name, arr in arrays.items():
+            arr = np.ascontiguousarray(arr)
+            shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+            self._blocks.append(shm)
+            entry['arrays'][name] = [shm.name, list(arr.shape), arr.dtype.str]
+        self.handle[_key(kind, filename)] = entry
+        logger.info(f"SharedResourceStore: published {kind} resource {filename}")
+
+    def close(self) -> None:
+        """
+        Releases the shared memory blocks. Workers must not access the resources afterwards.
+        """
+        for shm in self._blocks:
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._blocks = []
+        self.handle = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def attach_shared_resources(handle: Optional[Dict[str, dict]]) -> None:
+    """
+    Attaches this process to the resources published by a :class:`SharedResourceStore`.
+
+    Intended to be called once at worker start-up, before any ``SiteInfo`` is created.
+
+    :param handle: :attr:`SharedResourceStore.handle` from the parent process
+    """
+    if not handle:
+        return
+    for key, entry in handle.items():
+        kind, filename = key.split(":", 1)
+        arrays = {}
+        for name, (shm_name, shape, dtype) in entry['arrays'].items():
+            shm = _attached_blocks.get(shm_name)
+            if shm is None:
+                shm = _attach_block(shm_name)
+                _attached_blocks[shm_name] = shm
+            arr = np.ndarray(tuple(shape), dtype=np.dtype(dtype), buffer=shm.buf)
+            arr.flags.writeable = False
+            arrays[name] = arr
+        _attached[(kind, filename)] = (entry['meta'], arrays)
+
+
+def detach_shared_resources() -> None:
+    """
+    Forgets all attached resources, so that subsequent loads read from file again.
+    """
+    _attached.clear()
+    for shm in _attached_blocks.values():
+        try:
+            shm.close()
+        except BufferError:
+            # views of the block are still alive; the mapping is released once they are garbage collected
+            pass
+    _attached_blocks.clear()
+
+
+def get_shared_resource(kind: str, filename: Union[str, Path]) -> Optional[Tuple[dict, Dict[str, np.ndarray]]]:
+    """
+    Looks up an attached resource.
+
+    :param kind: one of 'solar', 'wind', 'wave' or 'prices'
+    :param filename: resource file path
+    :return: tuple of (metadata, read-only arrays) if the resource was attached in this process, else None
+    """
+    if not _attached:
+        return None
+    return _attached.get((kind, os.path.abspath(filename)))
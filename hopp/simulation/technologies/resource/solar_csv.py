@@ -0,0 +1,215 @@
+"""
+Single-pass reader for NSRDB-formatted solar resource CSV files.
+
+The file is parsed once into columnar numpy arrays, which are shared by every consumer of the
+weather data (``SolarResource``, ``Clustering``, ``CspPlant``). Parsed arrays of the most recently
+read files are memoized in-process and, optionally, written to a binary ``.npz`` cache keyed by the
+file's content hash, so later runs skip text parsing altogether. The cache is kept in a
+``.resource_cache`` directory next to the CSV unless a cache directory is set with ``set_cache_dir``
+or the ``HOPP_RESOURCE_CACHE_DIR`` environment variable, and is skipped where the directory is not
+writable.
+"""
+import csv
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from hopp.utilities.log import hybrid_logger as logger
+from hopp.simulation.technologies.resource.shared_resource import SOLAR, get_shared_resource
+
+
+CACHE_DIR_NAME = ".resource_cache"
+
+# keys passed to SAM and the column names they may appear under in resource files (NREL / NASA POWER)
+SAM_SOLAR_KEYS = {
+    'year': ['year', 'Year', 'yr'],
+    'month': ['month', 'Month', 'mo'],
+    'day': ['day', 'Day'],
+    'hour': ['hour', 'Hour', 'hr'],
+    'minute': ['minute', 'Minute', 'min'],
+    'dn': ['dn', 'DNI', 'dni', 'beam', 'direct normal', 'direct normal irradiance'],
+    'df': ['df', 'DHI', 'dhi', 'diffuse', 'diffuse horizontal', 'diffuse horizontal irradiance'],
+    'gh': ['gh', 'GHI', 'ghi', 'global', 'global horizontal', 'global horizontal irradiance'],
+    'wspd': ['wspd', 'Wind Speed', 'wind speed'],
+    'tdry': ['tdry', 'Temperature', 'dry bulb', 'dry bulb temp', 'temperature', 'ambient', 'ambient temp'],
+    'wdir': ['wdir', 'Wind Direction', 'wind direction'],
+    'pres': ['pres', 'Pressure', 'pressure'],
+    'tdew': ['tdew', 'Dew Point', 'Tdew', 'dew point', 'dew point temperature'],
+    'rhum': ['rhum', 'Relative Humidity', 'rh', 'RH', 'relative humidity', 'humidity'],
+    'alb': ['alb', 'Surface Albedo', 'albedo', 'surface albedo'],
+    'snow': ['snow', 'Snow Depth', 'snow depth', 'snow cover']
+}
+
+# maximum number of files whose parsed arrays are held in memory, the least recently read is evicted beyond it
+MEMO_MAXSIZE = 16
+
+_memo: "OrderedDict[Tuple[str, int, int], Tuple[Dict[str, str], Dict[str, np.ndarray]]]" = OrderedDict()
+_cache_dir: Optional[Path] = None
+
+
+def set_cache_dir(cache_dir: Optional[Union[str, Path]]):
+    """
+    Sets the directory of the ``.npz`` cache of all resource files. None keeps the cache in a ``.resource_cache``
+    directory next to each CSV, unless ``HOPP_RESOURCE_CACHE_DIR`` is set.
+    """
+    global _cache_dir
+    _cache_dir = None if cache_dir is None else Path(cache_dir)
+
+
+def _memo_store(key, parsed):
+    _memo[key] = parsed
+    _memo.move_to_end(key)
+    while len(_memo) > MEMO_MAXSIZE:
+        _memo.popitem(last=False)
+
+
+def _file_digest(filename: Union[str, Path]) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _cache_path(filename: Union[str, Path], digest: str) -> str:
+    directory, base = os.path.split(os.path.abspath(filename))
+    cache_dir = _cache_dir or os.environ.get("HOPP_RESOURCE_CACHE_DIR") or os.path.join(directory, CACHE_DIR_NAME)
+    return os.path.join(cache_dir, f"{os.path.splitext(base)[0]}_{digest}.npz")
+
+
+def _is_writable(directory: str) -> bool:
+    """Whether files can be written in a directory, or in the nearest existing parent that it would be created in"""
+    while not os.path.isdir(directory):
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return False
+        directory = parent
+    return os.access(directory, os.W_OK)
+
+
+def _parse_csv(filename: Union[str, Path]) -> Tuple[Dict[str, str], Dict[str, np.ndarray]]:
+    with open(filename) as file_in:
+        info = [row for _, row in zip(range(3), csv.reader(file_in))]
+        if len(info) < 3:
+            raise ValueError(f"{filename} is not a valid solar resource file.")
+        header = dict(zip(info[0], info[1]))
+        names = info[2]
+        usecols = [i for i, name in enumerate(names) if len(name) > 0]
+        values = np.loadtxt(file_in, delimiter=',', usecols=usecols, ndmin=2, dtype=float)
+    columns = {names[c]: values[:, i] for i, c in enumerate(usecols)}
+    return header, columns
+
+
+def read_solar_csv(
+    filename: Union[str, Path],
+    use_cache: bool = True
+) -> Tuple[Dict[str, str], Dict[str, np.ndarray]]:
+    """
+    Reads an NSRDB-formatted solar resource CSV into columnar arrays.
+
+    Args:
+        filename: path to the resource file
+        use_cache: read from and write to the on-disk ``.npz`` cache. Defaults to True
+
+    Returns:
+        tuple of (header metadata as strings keyed by field name, data columns keyed by column name).
+        The returned arrays are shared between callers and must not be modified in place.
+    """
+    shared = get_shared_resource(SOLAR, filename)
+    if shared is not None:
+        meta, columns = shared
+        return meta['header'], columns
+
+    if not os.path.isfile(filename):
+        raise FileNotFoundError(f"{filename} does not exist.")
+
+    stat = os.stat(filename)
+    memo_key = (os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+    if memo_key in _memo:
+        _memo.move_to_end(memo_key)
+        return _memo[memo_key]
+
+    cache_file = None
+    parsed = None
+    if use_cache:
+        cache_file = _cache_path(filename, _file_digest(filename))
+        if os.path.isfile(cache_file):
+            try:
+                with np.load(cache_file, allow_pickle=False) as npz:
+                    header = dict(zip(npz['header_keys'].tolist(), npz['header_values'].tolist()))
+                    columns = dict(zip(npz['column_names'].tolist(), npz['values'].T))
+                parsed = header, columns
+            except (OSError, KeyError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable solar resource cache {cache_file}: {e}")
+
+    if parsed is None:
+        parsed = _parse_csv(filename)
+        if cache_file is not None and _is_writable(os.path.dirname(cache_file)):
+            header, columns = parsed
+            try:
+                os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                with open(cache_file, 'wb') as f:
+                    np.savez(f,
+                             header_keys=np.array(list(header.keys()), dtype=str),
+                             header_values=np.array(list(header.values()), dtype=str),
+                             column_names=np.array(list(columns.keys()), dtype=str),
+                             values=np.column_stack(list(columns.values())))
+            except OSError as e:
+                logger.warning(f"Could not write solar resource cache {cache_file}: {e}")
+
+    for arr in parsed[1].values():
+        arr.flags.writeable = False
+    _memo_store(memo_key, parsed)
+    return parsed
+
+
+def solar_csv_to_sam_data(filename: Union[str, Path], use_cache: bool = True) -> dict:
+    """
+    Formats a solar resource CSV file as a 'solar_resource_data' dictionary for use in PySAM.
+
+    Equivalent to ``PySAM.ResourceTools.SAM_CSV_to_solar_data`` but backed by :func:`read_solar_csv`, and
+    additionally fills relative humidity ('rh') when present.
+
+    Args:
+        filename: path to the resource file
+        use_cache: read from and write to the on-disk ``.npz`` cache. Defaults to True
+
+    Returns:
+        dictionary of site metadata and time series lists
+    """
+    header, columns = read_solar_csv(filename, use_cache=use_cache)
+    if "Time Zone" not in header:
+        raise ValueError("`Time Zone` field not found in solar resource file.")
+
+    weather = {
+        'tz': float(header['Time Zone']),
+        'elev': float(header['Elevation']),
+        'lat': float(header['Latitude']),
+        'lon': float(header['Longitude']),
+    }
+    for key, list_of_keys in SAM_SOLAR_KEYS.items():
+        for good_key in list_of_keys:
+            if good_key in columns:
+                weather[key] = columns[good_key]
+                break
+
+    # handles averaged hourly data with no minute column provided by NASA POWER and removes 2/29 data for leap years
+    # this is a workaround so PySAM/SAM processes as instantaneous data (not setup to handle no minute column)
+    if header.get('Source') == 'NASA/POWER':
+        weather['minute'] = np.full(len(weather['hour']), 30.)
+        if len(weather['hour']) == 8784:
+            for key in weather.keys():
+                if key not in ['tz', 'elev', 'lat', 'lon']:
+                    weather[key] = np.delete(weather[key], np.s_[1416:1440])
+
+    if 'Dew Point' not in columns and 'RH' in columns:
+        weather['rh'] = columns['RH']
+
+    for key in weather.keys():
+        if isinstance(weather[key], np.ndarray):
+            weather[key] = weather[key].tolist()
+    return weather
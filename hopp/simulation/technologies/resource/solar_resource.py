@@ -1,14 +1,12 @@
 import os
-from collections import defaultdict
 from pathlib import Path
 from typing import Union
 import numpy as np
-import csv
-from PySAM.ResourceTools import SAM_CSV_to_solar_data
 
 from hopp.utilities.keys import get_developer_nrel_gov_key, get_developer_nrel_gov_email
 from hopp.utilities.log import hybrid_logger as logger
 from hopp.simulation.technologies.resource.resource import Resource
+from hopp.simulation.technologies.resource.solar_csv import solar_csv_to_sam_data
 from hopp import ROOT_DIR
 
 
@@ -108,26 +106,11 @@ class SolarResource(Resource):
         :key tdry: array, dry bulb temp [C]
         :key tdew: array, dew point temp [C]
         :key press: array, atmospheric pressure [mbar]
-        """
-        self._data = SAM_CSV_to_solar_data(data_dict)
-        # TODO: Update ResourceTools.py in pySAM to include pressure and dew point or relative humidity
-        with open(data_dict) as file_in:
-            wfd = defaultdict(list)
-            for i in range(2):
-                file_in.readline()
-            reader = csv.DictReader(file_in)
-            for row in reader:
-                for col, dat in row.items():
-                    if len(col) > 0:
-                        wfd[col].append(float(dat))
-
-        if 'Dew Point' in wfd:
-            self._data['tdew'] = wfd.pop('Dew Point')
-        elif 'RH' in wfd:
-            self._data['rh'] = wfd.pop('RH')
-        elif 'Pressure' in wfd:
-            self._data['pres'] = wfd.pop('Pressure')
 
+        The file is parsed once into columnar arrays by ``read_solar_csv``, which are cached so other
+        consumers of the same file do not parse it again.
+        """
+        self._data = solar_csv_to_sam_data(data_dict)
 
     def roll_timezone(self, roll_hours, timezone):
         """
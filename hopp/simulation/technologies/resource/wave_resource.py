@@ -3,6 +3,7 @@ import PySAM.WaveFileReader as wavefile
 
 from hopp.utilities.log import hybrid_logger as logger
 from hopp.simulation.technologies.resource.resource import *
+from hopp.simulation.technologies.resource.shared_resource import WAVE, get_shared_resource
 
 
 class WaveResource(Resource):
@@ -75,6 +76,11 @@ class WaveResource(Resource):
             - hour
             - minute
         """
+        shared = get_shared_resource(WAVE, data_file)
+        if shared is not None:
+            self._data = {k: v.tolist() for k, v in shared[1].items()}
+            return
+
         wavefile_model = wavefile.new()
         #Load resource file
         wavefile_model.WeatherReader.wave_resource_filename_ts = str(self.filename)
@@ -1,16 +1,63 @@
-import csv, os
+import csv
+import os
+from contextlib import ExitStack
+from itertools import zip_longest
 from pathlib import Path
-from typing import Union
-from PySAM.ResourceTools import SRW_to_wind_data
+from typing import Tuple, Union
+
+import numpy as np
 
 from hopp.utilities.keys import get_developer_nrel_gov_key, get_developer_nrel_gov_email
 from hopp.simulation.technologies.resource.resource import Resource
+from hopp.simulation.technologies.resource.shared_resource import WIND, get_shared_resource
 from hopp import ROOT_DIR
 
 
 WTK_BASE_URL = "https://developer.nrel.gov/api/wind-toolkit/v2/wind/wtk-srw-download"
 TAP_BASE_URL = "https://dw-tap.nrel.gov/v2/srw"
 
+# SAM wind field names, in order of their SAM field ids (1-4)
+WIND_FIELDS = ('temperature', 'pressure', 'speed', 'direction')
+
+
+def read_srw(filename: Union[str, Path]) -> Tuple[dict, np.ndarray]:
+    """
+    Reads a SAM wind resource (.srw) file in a single numpy pass.
+
+    Args:
+        filename: path to the resource file
+
+    Returns:
+        tuple of ('heights' and 'fields' of each column in SAM Wind format, data table of shape (time, column))
+    """
+    if not os.path.isfile(filename):
+        raise FileNotFoundError(f"{filename} does not exist.")
+
+    with open(filename) as file_in:
+        file_in.readline()
+        source = file_in.readline().strip()
+        fields = [i for i in file_in.readline().strip().split(',') if i]
+        file_in.readline()
+        heights = [float(i) for i in file_in.readline().strip().split(',') if i]
+
+        # sets appropriate field names for NASA POWER vs Wind Toolkit data
+        field_names = ('temperature', 'pres', 'speed', 'direction') if source == 'NASA/POWER' else WIND_FIELDS
+        field_ids = []
+        for field_name in fields:
+            if field_name.lower() not in field_names:
+                raise ValueError(field_name.lower() + " required for wind data")
+            field_ids.append(field_names.index(field_name.lower()) + 1)
+
+        rows_start = file_in.tell()
+        try:
+            table = np.loadtxt(file_in, delimiter=',', usecols=range(len(field_ids)), ndmin=2, dtype=float)
+        except ValueError:
+            # rows with empty entries, which SAM skips
+            file_in.seek(rows_start)
+            table = np.array([[float(i) for i in row.strip().split(',') if i] for row in file_in if row.strip()])
+
+    return {'heights': heights, 'fields': field_ids}, table
+
 
 class WindResource(Resource):
     """ Class to manage Wind Resource data
@@ -151,25 +198,19 @@ class WindResource(Resource):
         file_out: string
             File path to write combined srw file
         """
-        data = [None] * 2
-        for height, f in self.file_resource_heights.items():
-            if os.path.isfile(f):
-                with open(f) as file_in:
-                    csv_reader = csv.reader(file_in, delimiter=',')
-                    line = 0
-                    for row in csv_reader:
-                        if line < 2:
-                            data[line] = row
-                        else:
-                            if line >= len(data):
-                                data.append(row)
-                            else:
-                                data[line] += row
-                        line += 1
-
-        with open(self.filename, 'w', newline='') as fo:
+        files = [f for f in self.file_resource_heights.values() if os.path.isfile(f)]
+
+        # stream the files row by row, joining each row across heights; the two leading metadata lines are taken
+        # from the last file that has them
+        with ExitStack() as stack, open(self.filename, 'w', newline='') as fo:
+            csv_readers = [csv.reader(stack.enter_context(open(f)), delimiter=',') for f in files]
             writer = csv.writer(fo)
-            writer.writerows(data)
+            for line, rows in enumerate(zip_longest(*csv_readers)):
+                rows = [row for row in rows if row is not None]
+                if line < 2:
+                    writer.writerow(rows[-1])
+                else:
+                    writer.writerow([i for row in rows for i in row])
 
         return os.path.isfile(self.filename)
 
@@ -186,6 +227,57 @@ class WindResource(Resource):
     def data(self, data_file):
         """
         Sets the wind resource data to a dictionary in SAM Wind format (see Pysam.ResourceTools.SRW_to_wind_data)
+
+        The file is parsed once into a numpy table, from which both the SAM dictionary and the
+        (time x height x field) ``resource_array`` are built.
+        """
+        shared = get_shared_resource(WIND, data_file)
+        if shared is not None:
+            meta, arrays = shared
+            columns, table = {'heights': meta['heights'], 'fields': meta['fields']}, arrays['data']
+        else:
+            columns, table = read_srw(data_file)
+
+        self._data = dict(columns, data=table.tolist())
+        self.set_resource_array(columns['heights'], columns['fields'], table)
+
+    def set_resource_array(self, heights, fields, table: np.ndarray):
+        """
+        Arranges a SAM Wind data table into ``resource_array`` of shape (time, height, field), where heights are
+        the sorted unique heights in ``resource_heights`` and fields are ordered as in ``WIND_FIELDS``. Fields
+        missing at a height are NaN.
+
+        Args:
+            heights: height of each table column [m]
+            fields: SAM field id (1-4) of each table column
+            table: data of shape (time, column)
         """
+        heights = np.asarray(heights, dtype=float)
+        fields = np.asarray(fields, dtype=int)
+        self.resource_heights = np.unique(heights)
 
-        self._data = SRW_to_wind_data(data_file)
+        self.resource_array = np.full((len(table), len(self.resource_heights), len(WIND_FIELDS)), np.nan)
+        self.resource_array[:, np.searchsorted(self.resource_heights, heights), fields - 1] = table
+
+    def at_height(self, height: float) -> np.ndarray:
+        """
+        Resource at a given height, of shape (time, field) with fields ordered as in ``WIND_FIELDS``.
+
+        Temperature, pressure and speed are linearly interpolated between the bracketing heights and held
+        constant beyond the available range; direction is taken from the nearest height.
+
+        Args:
+            height: height above ground [m]
+        """
+        heights = self.resource_heights
+        if len(heights) == 1:
+            return self.resource_array[:, 0, :].copy()
+
+        upper = int(np.clip(np.searchsorted(heights, height), 1, len(heights) - 1))
+        lower = upper - 1
+        weight = np.clip((height - heights[lower]) / (heights[upper] - heights[lower]), 0., 1.)
+
+        values = (1 - weight) * self.resource_array[:, lower, :] + weight * self.resource_array[:, upper, :]
+        nearest = lower if weight < 0.5 else upper
+        values[:, 3] = self.resource_array[:, nearest, 3]
+        return values
@@ -1,7 +1,7 @@
 # tools to add floris to the hybrid simulation class
 from attrs import define, field
 import csv
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 import numpy as np
 
 from floris.tools import FlorisInterface
@@ -15,6 +15,96 @@ if TYPE_CHECKING:
     from hopp.simulation.technologies.wind.wind_plant import WindConfig
 
 
+@define
+class FlorisPowerTable(BaseClass):
+    """
+    Power of each turbine of a fixed wind farm layout, tabulated over wind directions and speeds, so that the power of
+    any wind resource can be interpolated from the table rather than calculated by FLORIS.
+
+    Args:
+        wind_directions: evenly spaced wind directions of the table from 0 to 360 degrees, excluding 360 [deg]
+        wind_speeds: evenly spaced wind speeds of the table from 0 [m/s]
+        turbine_powers: power of each turbine, of shape [n_directions, n_speeds, n_turbines] [W]
+    """
+    wind_directions: np.ndarray = field(converter=np.asarray)
+    wind_speeds: np.ndarray = field(converter=np.asarray)
+    turbine_powers: np.ndarray = field(converter=np.asarray)
+    farm_powers: np.ndarray = field(init=False)
+
+    def __attrs_post_init__(self):
+        self.farm_powers = self.turbine_powers.sum(axis=2)
+
+    @classmethod
+    def from_floris(cls,
+                    fi: FlorisInterface,
+                    max_wind_speed: float,
+                    wind_speed_step: float,
+                    wind_direction_step: float):
+        """
+        Calculates the table with FLORIS for the current layout of `fi`
+
+        Args:
+            fi: FLORIS model of the wind farm
+            max_wind_speed: the table's speeds extend to at least this speed [m/s]
+            wind_speed_step: spacing of the table's wind speeds [m/s]
+            wind_direction_step: spacing of the table's wind directions [deg], should divide 360
+        """
+        wind_directions = np.arange(0, 360, wind_direction_step)
+        wind_speeds = np.arange(np.ceil(max_wind_speed / wind_speed_step) + 1) * wind_speed_step
+        n_turbines = len(fi.layout_x)
+
+        # no power at zero speed, where FLORIS' wake models are undefined
+        turbine_powers = np.zeros((len(wind_directions), len(wind_speeds), n_turbines))
+        fi.reinitialize(wind_speeds=wind_speeds[1:], wind_directions=wind_directions, time_series=False)
+        fi.calculate_wake()
+        turbine_powers[:, 1:] = fi.get_turbine_powers().reshape((len(wind_directions), len(wind_speeds) - 1, n_turbines))
+        return cls(wind_directions, wind_speeds, turbine_powers)
+
+    @property
+    def max_wind_speed(self) -> float:
+        return self.wind_speeds[-1]
+
+    def _interpolate(self, table: np.ndarray, wind_speeds: np.ndarray, wind_directions: np.ndarray) -> np.ndarray:
+        """Bilinear interpolation of a table, periodic in direction and clipped to the table's speeds"""
+        direction = np.mod(wind_directions, 360) / (self.wind_directions[1] - self.wind_directions[0]) \
+            if len(self.wind_directions) > 1 else np.zeros(len(wind_directions))
+        d0 = np.floor(direction).astype(int)
+        d_frac = direction - d0
+        d0 %= len(self.wind_directions)
+        d1 = (d0 + 1) % len(self.wind_directions)
+
+        speed = np.clip(wind_speeds / self.wind_speeds[1], 0, len(self.wind_speeds) - 1)
+        s0 = np.minimum(np.floor(speed).astype(int), len(self.wind_speeds) - 2)
+        s_frac = speed - s0
+        if table.ndim > 2:
+            d_frac, s_frac = d_frac[:, None], s_frac[:, None]
+
+        return (1 - d_frac) * ((1 - s_frac) * table[d0, s0] + s_frac * table[d0, s0 + 1]) \
+            + d_frac * ((1 - s_frac) * table[d1, s0] + s_frac * table[d1, s0 + 1])
+
+    def turbine_power(self, wind_speeds: np.ndarray, wind_directions: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            wind_speeds: time series of wind speeds [m/s]
+            wind_directions: time series of wind directions [deg]
+
+        Returns:
+            power of each turbine, of shape [n_times, n_turbines] [W]
+        """
+        return self._interpolate(self.turbine_powers, np.asarray(wind_speeds), np.asarray(wind_directions))
+
+    def farm_power(self, wind_speeds: np.ndarray, wind_directions: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            wind_speeds: time series of wind speeds [m/s]
+            wind_directions: time series of wind directions [deg]
+
+        Returns:
+            power of the farm, of shape [n_times] [W]
+        """
+        return self._interpolate(self.farm_powers, np.asarray(wind_speeds), np.asarray(wind_directions))
+
+
 @define
 class Floris(BaseClass):
     site: SiteInfo = field()
@@ -71,6 +161,10 @@ class Floris(BaseClass):
         self.annual_energy = None
         self.capacity_factor = None
 
+        # power table of the current layout, if using `floris_power_table`
+        self._power_table = None
+        self._power_table_layout = None
+
         self.initialize_from_floris()
 
     def initialize_from_floris(self):
@@ -91,28 +185,37 @@ class Floris(BaseClass):
             return self.__getattribute__(name)
 
     def parse_resource_data(self):
-
-        # extract data for simulation
-        speeds = np.zeros(len(self.wind_resource_data['data']))
-        wind_dirs = np.zeros(len(self.site.wind_resource.data['data']))
-        data_rows_total = 4
-        if np.shape(self.site.wind_resource.data['data'])[1] > data_rows_total:
-            height_entries = int(np.round(np.shape(self.site.wind_resource.data['data'])[1]/data_rows_total))
-            data_entries = np.empty((height_entries))
-            for j in range(height_entries):
-                data_entries[j] = int(j*data_rows_total)
-            data_entries = data_entries.astype(int)
-            for i in range((len(self.site.wind_resource.data['data']))):
-                data_array = np.array(self.site.wind_resource.data['data'][i])
-                speeds[i] = np.mean(data_array[2+data_entries])
-                wind_dirs[i] = np.mean(data_array[3+data_entries])
-        else:
-            for i in range((len(self.site.wind_resource.data['data']))):
-                speeds[i] = self.site.wind_resource.data['data'][i][2]
-                wind_dirs[i] = self.site.wind_resource.data['data'][i][3]
+        """
+        Wind speeds and directions averaged over the resource heights, from the site's (time x height x field)
+        wind resource array.
+        """
+        resource_array = self.site.wind_resource.resource_array
+        speeds = np.nanmean(resource_array[:, :, 2], axis=1)
+        wind_dirs = np.nanmean(resource_array[:, :, 3], axis=1)
 
         return speeds, wind_dirs
 
+    def power_table(self, max_wind_speed: Optional[float] = None) -> FlorisPowerTable:
+        """
+        Power table of the current layout, which is calculated once per layout and reused while the layout is unchanged
+
+        Args:
+            max_wind_speed: the table's speeds extend to at least this speed [m/s], defaults to the site's max speed
+
+        Returns:
+            the layout's FlorisPowerTable, with the resolution of `floris_power_table_steps` of the config
+        """
+        if max_wind_speed is None:
+            max_wind_speed = np.nanmax(self.speeds)
+        layout = (tuple(self.fi.layout_x), tuple(self.fi.layout_y))
+        if self._power_table is None or self._power_table_layout != layout \
+                or self._power_table.max_wind_speed < max_wind_speed:
+            wind_speed_step, wind_direction_step = self.config.floris_power_table_steps
+            self._power_table = FlorisPowerTable.from_floris(self.fi, max_wind_speed, wind_speed_step,
+                                                             wind_direction_step)
+            self._power_table_layout = layout
+        return self._power_table
+
     def execute(self, project_life):
 
         print('Simulating wind farm output in FLORIS...')
@@ -121,11 +224,18 @@ class Floris(BaseClass):
         power_turbines = np.zeros((self.nTurbs, 8760))
         power_farm = np.zeros(8760)
 
-        self.fi.reinitialize(wind_speeds=self.speeds[self.start_idx:self.end_idx], wind_directions=self.wind_dirs[self.start_idx:self.end_idx], time_series=True)
-        self.fi.calculate_wake()
+        speeds = self.speeds[self.start_idx:self.end_idx]
+        wind_dirs = self.wind_dirs[self.start_idx:self.end_idx]
+        if self.config.floris_power_table:
+            power_table = self.power_table()
+            power_turbines[:, self.start_idx:self.end_idx] = power_table.turbine_power(speeds, wind_dirs).T
+            power_farm[self.start_idx:self.end_idx] = power_table.farm_power(speeds, wind_dirs)
+        else:
+            self.fi.reinitialize(wind_speeds=speeds, wind_directions=wind_dirs, time_series=True)
+            self.fi.calculate_wake()
 
-        power_turbines[:, self.start_idx:self.end_idx] = self.fi.get_turbine_powers().reshape((self.nTurbs, self.end_idx - self.start_idx))
-        power_farm[self.start_idx:self.end_idx] = self.fi.get_farm_power().reshape((self.end_idx - self.start_idx))
+            power_turbines[:, self.start_idx:self.end_idx] = self.fi.get_turbine_powers().reshape((self.nTurbs, self.end_idx - self.start_idx))
+            power_farm[self.start_idx:self.end_idx] = self.fi.get_farm_power().reshape((self.end_idx - self.start_idx))
 
         # Adding losses from PySAM defaults (excluding turbine and wake losses)
         self.gen = power_farm *((100 - 12.83)/100) / 1000
@@ -36,6 +36,9 @@ class WindConfig(BaseClass):
         rating_range_kw: allowable kw range of turbines, default is 1000 - 3000 kW
         floris_config: Floris configuration, only used if `model_name` == 'floris'
         timestep: Timestep (required for floris runs, otherwise optional)
+        floris_power_table: If True, floris runs interpolate the farm's power from a table of wind speeds and
+            directions, which is calculated once per layout, instead of calculating wakes for each timestep
+        floris_power_table_steps: Spacing of the wind speeds [m/s] and directions [deg] of the floris power table
         fin_model: Optional financial model. Can be any of the following:
 
             - a string representing an argument to `Singleowner.default`
@@ -56,6 +59,8 @@ class WindConfig(BaseClass):
     rating_range_kw: Tuple[int, int] = field(default=(1000, 3000))
     floris_config: Optional[Union[dict, str, Path]] = field(default=None)
     timestep: Optional[Tuple[int, int]] = field(default=None)
+    floris_power_table: bool = field(default=False)
+    floris_power_table_steps: Tuple[float, float] = field(default=(0.5, 2.0))
     fin_model: Optional[Union[dict, FinancialModelType]] = field(default=None)
 
     def __attrs_post_init__(self):
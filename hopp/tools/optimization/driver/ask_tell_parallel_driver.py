@@ -1,6 +1,7 @@
 from multiprocessing import Pool, cpu_count
 from typing import (
     Callable,
+    Optional,
     Tuple,
     )
 
@@ -13,10 +14,17 @@ from .ask_tell_parallel_driver_fns import *
 class AskTellParallelDriver(AskTellDriver):
     
     def __init__(self,
-                 nprocs: int = cpu_count()):
+                 nprocs: int = cpu_count(),
+                 shared_resources: Optional[dict] = None):
+        """
+        :param nprocs: number of worker processes
+        :param shared_resources: optional SharedResourceStore.handle, attached by each worker on start-up so that
+            simulations built in the workers use the parent's resource arrays instead of reading the files again
+        """
         self._num_evaluations: int = 0
         self._num_iterations: int = 0
         self._nprocs = nprocs
+        self._shared_resources = shared_resources
         self._pool = None
         
         # self.evaluations = []
@@ -58,7 +66,7 @@ class AskTellParallelDriver(AskTellDriver):
         :return:
         """
         self._pool = Pool(
-            initializer=make_initializer(objective),
+            initializer=make_initializer(objective, self._shared_resources),
             processes=self._nprocs)
     
     def step(self,
@@ -7,18 +7,21 @@ amount of dependencies pickled and unpickled when interacting with the parallel
 
 __objective = None
 
-def make_initializer(objective):
+def make_initializer(objective, shared_resources=None):
     """
     Wraps the objective in a function to initialize a pool
     """
-    return partial(set_objective, objective=objective)
+    return partial(set_objective, objective=objective, shared_resources=shared_resources)
 
 
-def set_objective(objective):
+def set_objective(objective, shared_resources=None):
     """
-    Sets the objective for (this process in) the pool
+    Sets the objective for (this process in) the pool, attaching any resources shared by the parent process first
     """
     global __objective
+    if shared_resources:
+        from hopp.simulation.technologies.resource.shared_resource import attach_shared_resources
+        attach_shared_resources(shared_resources)
     __objective = objective
 
 
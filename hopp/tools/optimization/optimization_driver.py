@@ -120,8 +120,12 @@ class OptimizationDriver(ConvertingOptimizationDriver):
                  method: str,
                  recorder: DataRecorder,
                  nprocs: Optional[int] = None,
+                 shared_resources: Optional[dict] = None,
                  **kwargs
                  ) -> None:
+        """
+        :param shared_resources: optional SharedResourceStore.handle passed to the parallel driver's workers
+        """
         self.problem: OptimizationProblem = problem
 
         optimizer: AskTellOptimizer
@@ -139,7 +143,7 @@ class OptimizationDriver(ConvertingOptimizationDriver):
         else:
             raise ValueError('Unknown optimizer: "' + method + '"')
 
-        driver = AskTellSerialDriver() if nprocs == 1 else AskTellParallelDriver(nprocs)
+        driver = AskTellSerialDriver() if nprocs == 1 else AskTellParallelDriver(nprocs, shared_resources)
         super().__init__(
             driver,
             optimizer,
@@ -0,0 +1,143 @@
+"""
+Memoization of deterministic sizing and costing functions that are evaluated repeatedly with the same inputs,
+e.g. pipeline or storage sizing inside a design optimization loop.
+"""
+import copy
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+
+def _freeze(value):
+    """Hashable, value-based representation of a function argument."""
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, Path):
+        return str(value)
+    hash(value)
+    return value
+
+
+class MemoCache:
+    """
+    Least-recently-used cache of the results of a function, keyed on the values of its arguments, with optional
+    persistence of the results to a directory of pickle files.
+
+    Results are copied on the way in and out of the cache, so callers may modify returned objects.
+
+    Args:
+        func: memoized function
+        maxsize: maximum number of results held in memory, the least recently used result is evicted beyond it
+        disk_dir: directory of persisted results, None to keep results in memory only
+    """
+    def __init__(self, func: Callable, maxsize: int = 128, disk_dir: Optional[Union[str, Path]] = None):
+        self.func = func
+        self.maxsize = maxsize
+        self.signature = inspect.signature(func)
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.disk_dir = None
+        self.set_disk_dir(disk_dir)
+
+    def set_disk_dir(self, disk_dir: Optional[Union[str, Path]]):
+        """
+        Sets the directory of persisted results, which is created if needed. None disables persistence.
+        """
+        self.disk_dir = None if disk_dir is None else Path(disk_dir)
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def key(self, *args, **kwargs) -> tuple:
+        """Cache key of a call, which includes the default values of omitted arguments."""
+        bound = self.signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return tuple((name, _freeze(value)) for name, value in bound.arguments.items())
+
+    def _disk_path(self, key) -> Path:
+        digest = hashlib.sha256(repr((self.func.__module__, self.func.__qualname__, key)).encode()).hexdigest()
+        return self.disk_dir / f"{self.func.__name__}_{digest}.pkl"
+
+    def _store(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def __call__(self, *args, **kwargs):
+        key = self.key(*args, **kwargs)
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return copy.deepcopy(self.entries[key])
+
+        if self.disk_dir is not None:
+            path = self._disk_path(key)
+            if path.exists():
+                with open(path, "rb") as f:
+                    value = pickle.load(f)
+                self.hits += 1
+                self._store(key, value)
+                return copy.deepcopy(value)
+
+        self.misses += 1
+        value = self.func(*args, **kwargs)
+        self._store(key, copy.deepcopy(value))
+        if self.disk_dir is not None:
+            path = self._disk_path(key)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(value, f)
+            os.replace(tmp_path, path)
+        return value
+
+    def clear(self, disk: bool = False):
+        """
+        Clears the results held in memory and the hit and miss counts.
+
+        Args:
+            disk: also delete the persisted results of this function
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        if disk and self.disk_dir is not None:
+            for path in self.disk_dir.glob(f"{self.func.__name__}_*.pkl"):
+                path.unlink()
+
+
+def memoize(maxsize: int = 128, disk_dir: Optional[Union[str, Path]] = None):
+    """
+    Decorator that memoizes a deterministic function with a :class:`MemoCache`.
+
+    The wrapper exposes the cache as ``cache``, e.g. ``func.cache.set_disk_dir(path)`` to persist results across
+    sessions, ``func.cache.clear()`` to reset it, and the undecorated function as ``__wrapped__``.
+
+    Args:
+        maxsize: maximum number of results held in memory
+        disk_dir: directory of persisted results, None to keep results in memory only
+    """
+    def decorator(func):
+        cache = MemoCache(func, maxsize, disk_dir)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return cache(*args, **kwargs)
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,52 @@
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict
+
+
+class StageTimer:
+    """
+    Accumulates the wall-clock time spent in named stages of a simulation.
+
+    Stages may be entered any number of times; the time and number of calls of each stage are summed until
+    :meth:`reset` is called. Timing only covers the current process, so work done in worker processes (e.g.
+    parallel cluster simulation) is counted in the stage that waits for it.
+
+    Example:
+
+    .. code-block::
+
+        timer = StageTimer()
+        with timer.stage("dispatch_solve"):
+            solve()
+        timer.totals  # {'dispatch_solve': 0.12}
+    """
+    def __init__(self):
+        self.totals: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Times the enclosed block and adds it to stage ``name``.
+
+        :param name: stage name
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.totals[name] = self.totals.get(name, 0.) + perf_counter() - start
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+    def reset(self) -> None:
+        """Clears all recorded stages."""
+        self.totals = {}
+        self.counts = {}
+
+    def summary(self) -> str:
+        """Table of the total time [s] and number of calls per stage."""
+        width = max([len(name) for name in self.totals] + [5])
+        lines = [f"{'stage':<{width}}  {'time [s]':>10}  {'calls':>7}"]
+        for name, total in self.totals.items():
+            lines.append(f"{name:<{width}}  {total:>10.4f}  {self.counts[name]:>7d}")
+        return "\n".join(lines)
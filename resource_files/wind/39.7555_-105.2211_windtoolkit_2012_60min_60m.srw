@@ -0,0 +1,8765 @@
+976301,city??,TX,country??,2012,35.2070121765,-101.940917969,Not Available,1,8760
+WIND Toolkit data from NREL downloaded on 2022-3-26
+Temperature,Pressure,Speed,Direction,Temperature,Pressure,Speed,Direction
+C,atm,m/s,Degrees,C,atm,m/s,Degrees
+80,80,80,80,100,100,100,100
+4.7,0.88,12.290,358.5,4.6,0.88,13.540,359.4
+3.8,0.88,12.160,2.6,3.7,0.88,13.380,5.9
+2.9,0.88,8.500,0.2,2.8,0.88,9.440,4.4
+2.5,0.88,8.670,359.6,2.3,0.88,9.740,4.2
+2.0,0.88,8.080,0.5,1.8,0.88,8.890,5.2
+1.4,0.88,8.160,6.8,1.3,0.88,8.380,11.2
+1.1,0.88,8.590,5.8,1.0,0.88,9.190,9.7
+0.6,0.88,7.710,3.9,0.5,0.88,8.270,8.2
+0.2,0.88,5.260,346.6,0.1,0.88,5.660,354.8
+0.2,0.88,3.680,333.5,0.1,0.88,3.740,341.7
+0.7,0.88,3.690,343.8,0.5,0.88,3.710,345.0
+1.6,0.88,3.430,357.9,1.4,0.88,3.450,358.2
+2.5,0.88,3.230,355.9,2.3,0.88,3.240,356.0
+3.3,0.88,2.430,358.2,3.1,0.88,2.430,358.3
+4.0,0.88,1.970,358.1,3.8,0.88,1.960,358.5
+4.5,0.88,1.330,359.9,4.2,0.88,1.310,0.4
+4.7,0.88,1.170,8.4,4.5,0.88,1.160,8.8
+4.6,0.88,1.410,18.6,4.4,0.88,1.360,17.5
+4.0,0.88,1.920,33.0,3.8,0.88,1.800,34.0
+3.4,0.88,2.450,44.7,3.3,0.88,2.380,44.6
+3.1,0.88,2.800,52.2,3.0,0.88,2.830,49.2
+2.7,0.88,2.970,60.2,2.7,0.88,3.210,59.7
+2.3,0.89,2.780,57.2,2.4,0.89,3.090,57.4
+1.8,0.89,2.640,52.3,2.0,0.89,2.970,50.2
+1.2,0.89,2.380,49.0,1.3,0.89,2.720,48.7
+0.5,0.89,2.020,39.6,0.7,0.89,2.390,42.4
+0.3,0.89,1.380,16.8,0.6,0.89,1.690,26.6
+0.2,0.89,1.600,21.4,0.5,0.89,1.910,29.0
+-0.0,0.89,1.440,358.3,0.4,0.89,1.670,12.4
+-1.1,0.89,2.180,350.4,-0.7,0.89,2.380,356.6
+-1.7,0.89,2.210,343.9,-1.3,0.89,2.480,351.8
+-1.8,0.89,2.140,336.1,-1.5,0.89,2.360,346.6
+-1.6,0.89,2.120,328.6,-1.4,0.89,2.200,337.4
+-1.2,0.89,2.070,294.3,-1.0,0.89,1.940,300.9
+-0.3,0.89,1.270,258.3,-0.4,0.89,1.430,261.1
+1.8,0.89,1.600,226.7,1.6,0.89,1.700,225.3
+3.6,0.89,3.540,217.8,3.4,0.89,3.600,218.1
+5.2,0.89,5.410,226.7,5.0,0.89,5.490,227.0
+6.4,0.88,5.730,230.2,6.2,0.88,5.820,230.6
+7.1,0.88,6.220,237.0,6.9,0.88,6.320,237.3
+7.6,0.88,5.820,235.9,7.4,0.88,5.960,236.3
+7.7,0.88,6.350,226.7,7.5,0.88,6.590,228.2
+7.5,0.88,7.910,221.1,7.4,0.88,8.350,223.5
+6.7,0.88,10.140,225.2,6.8,0.88,10.720,228.6
+6.3,0.88,11.120,235.9,6.6,0.88,11.450,237.6
+5.4,0.88,11.060,238.1,6.0,0.88,11.640,239.9
+4.8,0.88,11.700,234.9,5.4,0.88,12.430,236.1
+4.2,0.88,12.440,233.6,5.0,0.88,13.450,234.7
+3.4,0.88,12.680,230.1,4.2,0.88,14.020,232.2
+2.9,0.88,13.240,228.3,3.6,0.88,14.690,230.8
+2.8,0.88,14.090,227.5,3.5,0.88,15.570,230.2
+2.7,0.88,14.400,230.3,3.5,0.88,15.980,232.8
+2.5,0.88,14.320,230.2,3.2,0.88,15.950,232.9
+2.6,0.88,14.600,230.5,3.3,0.88,16.210,232.8
+2.9,0.88,15.080,234.4,3.6,0.88,16.680,236.8
+3.0,0.87,15.010,234.3,3.6,0.87,16.590,237.0
+2.6,0.87,13.280,234.6,3.2,0.87,14.840,237.8
+3.2,0.87,11.070,236.5,3.4,0.87,12.110,238.3
+5.6,0.87,7.780,240.6,5.5,0.87,8.710,242.3
+7.9,0.87,7.830,245.0,7.7,0.87,7.980,245.3
+10.0,0.87,7.780,255.1,9.8,0.87,7.900,255.1
+11.9,0.87,6.520,257.2,11.7,0.87,6.610,257.3
+13.2,0.87,6.150,260.6,13.0,0.87,6.220,260.6
+14.0,0.87,5.550,262.2,13.8,0.87,5.610,262.2
+14.3,0.87,4.930,266.9,14.1,0.87,5.050,267.0
+14.2,0.87,4.340,277.7,14.1,0.87,4.660,278.1
+12.6,0.87,3.390,312.7,12.8,0.87,3.870,309.3
+12.3,0.87,4.450,304.3,12.4,0.87,4.960,303.3
+11.4,0.87,7.400,318.5,11.5,0.87,7.730,320.5
+10.4,0.87,9.840,324.8,10.9,0.87,10.310,331.8
+7.6,0.87,8.500,356.3,7.9,0.87,8.410,2.5
+7.0,0.87,7.330,5.3,7.2,0.87,7.970,7.6
+7.0,0.87,8.020,10.5,7.3,0.87,9.000,12.7
+7.0,0.87,8.250,1.5,7.2,0.87,9.030,4.7
+6.4,0.88,8.960,358.8,6.2,0.88,9.850,4.7
+4.9,0.88,9.430,358.2,4.8,0.88,10.020,5.5
+3.9,0.88,9.200,5.8,3.8,0.88,10.510,12.0
+3.5,0.88,8.070,6.7,3.6,0.88,9.390,10.3
+3.6,0.88,7.360,358.8,3.6,0.88,8.230,4.4
+3.1,0.88,7.310,359.9,3.0,0.88,8.370,6.3
+2.9,0.88,7.370,357.2,2.8,0.88,7.970,1.8
+2.6,0.88,6.530,356.5,2.7,0.88,7.180,1.7
+3.3,0.88,4.960,351.1,3.2,0.88,5.260,353.7
+4.6,0.88,3.850,335.1,4.4,0.88,3.880,336.5
+6.0,0.88,3.870,329.7,5.8,0.88,3.900,330.4
+7.5,0.88,4.240,330.8,7.3,0.88,4.260,331.3
+8.6,0.88,3.980,326.8,8.4,0.88,4.000,327.0
+9.5,0.88,3.680,317.4,9.2,0.88,3.700,317.2
+10.0,0.88,3.650,310.0,9.8,0.88,3.680,309.7
+10.1,0.88,3.750,298.1,9.9,0.88,3.830,297.0
+10.2,0.88,4.230,290.7,10.1,0.88,4.420,289.1
+10.8,0.88,5.520,280.6,10.6,0.88,5.630,280.3
+11.0,0.88,6.940,276.1,10.9,0.88,6.520,279.4
+11.6,0.88,6.320,280.3,11.4,0.88,6.100,281.7
+12.0,0.88,6.660,279.9,11.9,0.88,6.420,281.4
+12.0,0.88,6.950,278.8,12.0,0.88,6.740,281.2
+12.1,0.88,7.210,274.9,12.0,0.88,7.010,277.1
+11.2,0.88,7.610,266.8,11.4,0.88,7.320,270.1
+11.0,0.88,8.690,265.5,11.1,0.88,8.310,267.9
+10.8,0.88,9.760,272.8,11.2,0.88,9.130,274.7
+11.0,0.88,8.960,276.1,11.3,0.88,8.150,277.9
+11.0,0.88,8.100,277.6,11.1,0.88,7.660,279.5
+11.2,0.88,7.250,284.9,11.4,0.88,6.770,286.9
+10.9,0.87,6.640,284.2,11.1,0.87,6.220,287.7
+10.5,0.87,6.690,291.1,10.7,0.87,6.250,293.7
+9.9,0.87,5.960,284.9,10.2,0.87,5.670,289.4
+8.6,0.87,4.620,261.8,9.7,0.87,4.970,266.3
+9.3,0.87,2.300,257.8,9.4,0.87,3.230,258.4
+12.1,0.87,3.300,256.0,11.9,0.87,3.370,255.9
+13.8,0.87,4.400,245.0,13.6,0.87,4.450,245.4
+14.6,0.87,4.950,235.8,14.4,0.87,5.010,236.1
+15.1,0.87,5.220,232.6,14.9,0.87,5.270,232.9
+14.7,0.87,5.890,218.1,14.5,0.87,5.950,218.7
+14.3,0.87,7.240,213.8,14.2,0.87,7.550,215.7
+14.1,0.87,10.360,215.3,14.0,0.87,10.710,217.0
+11.1,0.87,13.460,221.8,11.5,0.87,14.300,223.9
+9.9,0.87,13.500,228.3,10.3,0.87,14.370,229.8
+9.4,0.87,14.000,229.4,9.9,0.87,15.240,230.5
+8.3,0.87,13.820,228.6,8.9,0.87,15.280,230.7
+7.6,0.87,14.430,230.1,8.5,0.87,15.980,232.5
+6.9,0.86,14.900,229.0,7.7,0.86,16.430,231.1
+6.5,0.86,14.510,229.5,7.3,0.86,16.050,231.7
+6.4,0.86,15.320,228.6,7.1,0.86,16.790,230.2
+5.5,0.86,13.850,230.2,6.3,0.86,15.390,232.7
+5.1,0.86,13.190,242.0,5.9,0.86,14.450,245.6
+5.3,0.86,12.460,252.5,6.7,0.86,12.900,259.0
+6.2,0.86,12.100,263.4,7.9,0.86,10.910,278.1
+4.4,0.86,9.580,297.7,4.8,0.86,10.500,300.7
+4.8,0.86,11.430,315.1,5.5,0.86,11.040,323.6
+5.2,0.86,10.560,337.0,5.5,0.86,11.100,343.5
+5.7,0.86,8.890,345.8,5.5,0.86,9.350,347.7
+7.1,0.86,9.560,343.9,6.9,0.86,9.730,344.7
+8.1,0.86,9.500,353.4,7.9,0.86,9.620,353.5
+8.9,0.86,10.220,357.7,8.7,0.86,10.340,357.8
+9.7,0.86,10.340,0.1,9.5,0.86,10.470,0.2
+10.1,0.86,10.040,3.6,9.9,0.86,10.180,3.8
+10.1,0.87,9.750,7.8,9.9,0.87,9.920,7.8
+9.5,0.87,9.150,12.2,9.3,0.87,9.600,12.3
+8.7,0.87,9.540,10.5,8.6,0.87,10.130,12.1
+7.8,0.87,11.550,14.0,7.7,0.87,12.970,16.1
+6.5,0.87,10.010,15.0,6.5,0.87,11.200,18.6
+5.4,0.87,8.870,8.1,5.3,0.87,9.830,14.0
+4.5,0.87,9.690,14.0,4.5,0.87,10.690,19.1
+3.8,0.87,10.020,18.8,3.9,0.87,11.140,23.7
+3.2,0.87,9.660,22.5,3.3,0.87,10.950,26.4
+2.7,0.87,7.910,19.7,2.8,0.87,8.970,23.0
+2.3,0.87,7.620,15.8,2.4,0.87,8.800,22.0
+1.7,0.87,6.440,7.3,1.6,0.87,7.000,12.1
+1.4,0.87,6.450,9.7,1.3,0.87,6.950,17.8
+1.0,0.87,6.820,13.9,0.9,0.87,7.310,21.4
+0.8,0.87,7.000,24.8,0.7,0.87,7.500,33.0
+0.1,0.87,4.640,28.0,0.1,0.87,5.200,36.0
+-0.1,0.87,4.020,38.6,-0.1,0.87,4.120,42.9
+-0.4,0.87,2.050,26.9,-0.4,0.87,2.260,34.8
+0.1,0.87,1.200,51.8,-0.0,0.87,1.290,55.6
+1.5,0.87,1.130,93.0,1.3,0.87,1.170,96.3
+3.5,0.87,2.440,138.1,3.3,0.87,2.490,139.3
+5.0,0.87,3.030,157.0,4.8,0.87,3.090,157.6
+5.9,0.87,4.600,164.1,5.7,0.87,4.650,164.1
+6.6,0.87,5.390,165.7,6.4,0.87,5.450,165.9
+7.0,0.87,6.050,171.0,6.8,0.87,6.160,171.3
+7.0,0.87,6.480,163.6,6.8,0.87,6.770,164.3
+5.5,0.87,8.400,144.4,5.5,0.87,8.720,144.4
+4.3,0.87,9.330,142.8,4.6,0.87,9.950,145.9
+3.9,0.87,10.090,142.7,4.3,0.87,10.770,144.8
+3.4,0.87,10.510,140.1,3.7,0.87,11.290,141.0
+3.2,0.87,11.340,142.6,3.4,0.87,12.050,143.0
+3.0,0.87,11.590,142.0,3.4,0.87,12.250,142.0
+2.2,0.87,10.910,140.8,2.6,0.87,11.750,140.8
+1.4,0.87,10.860,138.6,1.6,0.87,11.770,138.5
+-0.3,0.87,5.850,109.4,-0.1,0.87,6.970,113.2
+-0.7,0.87,6.460,111.4,-0.2,0.87,7.960,111.5
+-0.4,0.87,6.460,105.1,0.2,0.87,7.650,107.4
+-0.8,0.87,4.400,82.3,-0.5,0.87,5.040,87.3
+-2.0,0.87,5.090,21.0,-1.9,0.87,4.760,42.9
+-2.8,0.87,6.690,20.7,-2.7,0.87,7.060,24.9
+-3.2,0.87,6.600,16.9,-3.3,0.87,7.300,21.2
+-3.2,0.87,6.250,17.5,-3.4,0.87,6.370,18.4
+-2.4,0.87,6.640,19.8,-2.6,0.87,6.680,20.1
+-1.3,0.87,6.540,16.8,-1.5,0.87,6.580,17.0
+0.0,0.87,6.900,21.9,-0.2,0.87,6.950,22.0
+1.0,0.87,7.260,23.9,0.8,0.87,7.320,24.1
+1.5,0.87,8.020,26.7,1.3,0.87,8.090,26.9
+1.4,0.87,8.090,27.8,1.2,0.87,8.180,27.8
+1.3,0.87,8.160,27.2,1.1,0.87,8.260,27.4
+1.3,0.87,7.580,31.5,1.1,0.87,7.950,31.8
+0.9,0.87,7.350,32.2,0.8,0.87,7.890,32.9
+0.6,0.87,8.110,31.8,0.5,0.87,9.290,33.2
+-0.1,0.87,8.420,37.0,-0.0,0.87,9.650,38.2
+-0.7,0.87,6.790,33.0,-0.5,0.87,7.960,36.7
+-1.1,0.87,6.020,25.2,-1.0,0.87,7.040,31.9
+-1.5,0.87,6.530,22.2,-1.5,0.87,7.190,25.8
+-1.8,0.87,6.540,14.2,-1.8,0.87,7.280,18.9
+-2.0,0.87,6.430,12.6,-2.0,0.87,7.170,17.3
+-2.2,0.87,6.040,11.1,-2.2,0.87,6.930,17.9
+-2.1,0.87,6.190,13.7,-2.1,0.87,6.990,19.2
+-2.4,0.87,5.700,8.8,-2.5,0.87,6.380,13.2
+-2.4,0.87,5.210,7.1,-2.5,0.87,5.630,10.4
+-2.6,0.87,4.550,10.0,-2.6,0.87,4.940,11.6
+-2.8,0.87,3.890,358.8,-2.8,0.87,4.170,0.8
+-2.6,0.87,4.710,354.4,-2.6,0.87,4.650,358.6
+-2.5,0.87,4.060,340.7,-2.5,0.87,4.190,345.8
+-1.7,0.87,3.930,342.2,-1.8,0.87,3.940,343.3
+-0.2,0.87,4.870,346.7,-0.4,0.87,4.900,347.0
+1.0,0.87,4.540,355.4,0.8,0.87,4.570,355.4
+2.0,0.87,4.650,0.6,1.8,0.87,4.670,0.8
+2.7,0.87,4.330,1.2,2.5,0.87,4.360,1.4
+3.3,0.87,3.980,359.4,3.1,0.87,4.010,359.6
+3.8,0.87,3.990,352.8,3.6,0.87,4.040,353.2
+4.0,0.87,3.800,350.6,3.9,0.87,3.920,352.2
+4.0,0.87,3.550,354.2,3.8,0.87,3.580,357.1
+3.9,0.87,4.440,354.4,3.8,0.87,4.730,355.7
+3.9,0.87,5.700,353.9,3.8,0.87,5.930,355.7
+3.8,0.87,6.750,352.9,3.7,0.87,6.860,355.3
+3.6,0.87,6.310,0.6,3.5,0.87,6.320,2.1
+2.3,0.87,4.530,6.4,2.7,0.87,5.000,6.2
+2.3,0.87,5.730,340.4,2.4,0.87,5.710,345.0
+1.5,0.87,7.170,320.7,1.8,0.87,6.890,327.0
+1.4,0.87,7.800,319.9,1.7,0.87,7.570,325.5
+1.2,0.87,8.060,322.0,1.6,0.87,7.840,329.0
+0.9,0.87,6.280,326.8,1.2,0.87,5.950,336.9
+0.9,0.87,5.690,330.5,1.0,0.87,5.390,339.5
+0.9,0.87,4.800,334.5,0.9,0.87,4.690,339.6
+1.2,0.87,5.310,324.3,1.4,0.87,5.070,332.2
+1.7,0.87,6.400,322.7,2.1,0.87,6.440,330.5
+1.4,0.87,7.190,318.3,2.0,0.87,7.200,325.8
+2.1,0.87,5.950,313.0,2.2,0.87,6.560,318.0
+3.9,0.87,6.020,319.4,3.7,0.87,6.040,319.8
+5.6,0.87,6.110,318.4,5.4,0.87,6.150,318.5
+7.1,0.87,6.430,316.9,6.9,0.87,6.480,316.9
+8.0,0.87,6.590,317.3,7.8,0.87,6.640,317.3
+8.6,0.87,5.890,319.2,8.4,0.87,5.930,319.1
+9.0,0.86,5.780,311.0,8.8,0.86,5.830,310.9
+9.2,0.86,4.350,301.8,9.0,0.86,4.590,301.0
+9.5,0.86,4.930,277.6,9.3,0.86,5.140,277.3
+9.8,0.86,7.380,259.5,9.7,0.86,7.330,261.6
+10.3,0.86,8.390,268.4,10.5,0.86,7.540,274.1
+11.3,0.86,8.000,271.8,11.3,0.86,7.460,274.8
+12.2,0.86,7.720,273.0,12.1,0.86,7.420,274.8
+12.8,0.86,7.420,261.9,12.9,0.86,7.320,264.1
+11.7,0.86,9.170,254.0,12.0,0.86,8.820,254.5
+12.2,0.86,7.430,256.0,12.6,0.86,7.010,255.8
+11.6,0.86,5.980,291.5,11.9,0.86,5.600,295.5
+8.5,0.86,5.270,310.0,9.2,0.86,5.090,309.6
+6.0,0.86,4.330,317.8,6.5,0.86,4.900,316.0
+5.3,0.86,6.740,312.2,5.9,0.86,7.630,311.7
+4.5,0.86,8.780,319.1,4.9,0.86,9.750,318.0
+3.6,0.86,11.120,321.3,4.2,0.86,11.210,330.7
+2.7,0.86,12.170,354.0,2.5,0.86,13.150,355.6
+1.5,0.86,12.790,353.7,1.3,0.86,13.520,356.3
+1.9,0.86,12.740,4.3,1.7,0.86,12.990,4.7
+2.5,0.86,13.280,6.3,2.3,0.86,13.510,6.4
+3.2,0.86,13.780,4.3,3.0,0.86,14.010,4.4
+3.5,0.86,14.170,4.8,3.2,0.86,14.410,4.8
+3.6,0.86,14.710,2.4,3.3,0.86,14.970,2.5
+3.6,0.86,14.420,1.7,3.4,0.86,14.680,1.7
+3.3,0.86,15.360,4.5,3.1,0.86,15.640,4.4
+2.5,0.87,14.690,6.0,2.3,0.87,15.070,5.9
+1.4,0.87,11.630,4.3,1.3,0.87,12.340,4.5
+0.6,0.87,13.050,358.3,0.5,0.87,13.570,358.9
+-0.2,0.87,12.620,0.9,-0.4,0.87,13.370,1.8
+-1.0,0.87,12.280,6.7,-1.2,0.87,12.990,7.3
+-1.9,0.87,12.730,12.5,-2.1,0.87,13.250,12.8
+-2.8,0.87,12.300,10.4,-3.0,0.87,12.810,10.6
+-3.2,0.87,11.050,6.1,-3.3,0.87,11.610,6.3
+-4.1,0.87,11.630,4.7,-4.3,0.87,12.140,5.0
+-4.6,0.87,8.530,1.6,-4.8,0.87,8.780,359.7
+-4.8,0.87,7.880,343.6,-4.9,0.87,8.220,344.8
+-5.0,0.87,9.060,340.6,-5.2,0.87,9.450,342.8
+-5.2,0.87,9.940,338.1,-5.3,0.87,10.580,340.2
+-5.3,0.87,8.120,332.7,-5.5,0.87,8.620,333.8
+-5.4,0.87,10.180,336.9,-5.5,0.87,11.080,338.2
+-5.4,0.87,8.140,329.1,-5.5,0.87,9.260,332.8
+-5.3,0.87,9.510,337.3,-5.4,0.87,9.930,338.6
+-4.6,0.87,7.500,340.6,-4.8,0.87,7.640,341.0
+-3.5,0.87,6.840,333.7,-3.7,0.87,6.920,333.8
+-2.3,0.87,6.700,318.0,-2.5,0.87,6.750,318.0
+-0.7,0.87,6.640,302.4,-0.9,0.87,6.710,302.2
+1.4,0.87,6.770,299.4,1.1,0.87,6.870,299.4
+2.5,0.87,6.950,299.2,2.3,0.87,7.040,299.3
+3.1,0.87,6.180,299.1,2.9,0.87,6.280,299.0
+3.2,0.87,5.270,303.3,3.0,0.87,5.450,301.7
+3.2,0.87,5.560,295.5,3.1,0.87,5.860,292.7
+3.5,0.87,8.180,274.0,3.3,0.87,8.250,273.4
+3.9,0.87,9.490,273.1,4.0,0.87,9.000,275.1
+2.9,0.87,10.900,266.1,3.1,0.87,10.230,267.9
+3.6,0.87,9.560,278.9,3.8,0.87,9.330,282.7
+1.7,0.87,6.110,287.7,2.1,0.87,6.570,290.9
+0.7,0.87,3.390,302.0,0.9,0.87,3.860,301.1
+0.6,0.87,2.310,302.8,0.7,0.87,2.690,300.7
+0.2,0.87,1.080,341.9,0.5,0.87,1.300,334.9
+0.0,0.87,1.840,322.6,0.2,0.87,2.200,320.3
+0.3,0.87,2.230,299.6,0.3,0.87,2.650,300.8
+0.2,0.87,3.190,270.2,0.3,0.87,3.570,273.0
+0.2,0.87,4.120,271.4,0.2,0.87,4.520,274.0
+0.1,0.87,3.720,290.2,0.1,0.87,4.240,289.7
+0.6,0.87,6.870,280.3,0.4,0.87,7.720,279.0
+-1.2,0.87,6.530,283.6,-1.2,0.87,7.040,286.9
+-0.6,0.87,5.200,292.6,-0.8,0.87,5.360,292.5
+1.2,0.87,4.620,301.9,1.0,0.87,4.670,301.1
+3.3,0.87,4.370,298.8,3.1,0.87,4.420,297.9
+5.3,0.87,4.230,296.4,5.1,0.87,4.290,295.6
+6.9,0.87,4.310,296.7,6.7,0.87,4.380,296.1
+7.9,0.87,4.350,291.8,7.7,0.87,4.410,291.2
+8.6,0.87,4.620,278.3,8.3,0.87,4.740,277.9
+8.4,0.87,4.310,256.9,8.3,0.87,4.540,258.3
+8.4,0.87,5.890,261.8,8.3,0.87,6.080,262.4
+8.7,0.87,6.830,251.2,8.7,0.87,7.110,253.6
+9.5,0.87,8.780,251.3,9.6,0.87,8.810,252.2
+8.8,0.87,10.160,259.3,9.2,0.87,9.410,260.2
+8.9,0.87,10.010,271.1,9.7,0.87,9.570,278.7
+10.2,0.87,7.820,283.6,10.6,0.87,7.540,288.9
+9.8,0.87,7.290,291.9,10.0,0.87,6.900,295.9
+8.2,0.87,6.340,297.2,8.8,0.87,6.100,295.6
+6.0,0.87,5.870,308.1,6.8,0.87,5.960,307.0
+5.0,0.87,9.090,303.0,5.8,0.87,9.320,303.7
+7.2,0.87,8.460,308.3,7.8,0.87,8.200,310.9
+7.0,0.87,7.580,315.2,7.5,0.87,7.190,318.4
+6.5,0.87,6.910,318.5,7.0,0.87,7.030,320.1
+4.7,0.87,5.500,332.3,5.2,0.87,6.010,329.1
+3.4,0.87,5.330,341.0,4.2,0.87,5.980,340.6
+3.5,0.87,6.160,328.4,4.4,0.87,6.710,330.8
+3.5,0.87,3.890,314.9,3.9,0.87,4.600,315.3
+4.8,0.87,2.090,348.0,4.8,0.87,2.380,335.8
+6.3,0.87,1.790,349.9,6.2,0.87,1.760,346.9
+7.5,0.87,0.730,32.6,7.4,0.87,0.630,37.0
+9.7,0.87,2.380,136.1,9.5,0.87,2.450,139.3
+11.0,0.87,4.450,164.4,10.8,0.87,4.500,164.8
+10.9,0.87,5.970,170.3,10.7,0.87,6.030,170.8
+10.9,0.87,7.880,171.0,10.8,0.87,8.220,171.3
+10.2,0.87,9.870,164.9,10.4,0.87,10.350,167.2
+8.7,0.87,10.830,165.9,9.3,0.87,11.540,168.9
+8.0,0.87,10.840,178.8,8.9,0.87,11.650,184.8
+8.5,0.87,10.480,207.2,9.2,0.87,11.070,212.9
+8.6,0.87,11.290,224.2,9.6,0.87,12.210,226.3
+7.9,0.87,12.570,232.1,9.0,0.87,13.890,235.2
+8.0,0.87,14.350,235.7,9.1,0.87,15.920,238.2
+8.0,0.87,16.110,236.2,8.9,0.87,17.470,237.4
+6.6,0.87,14.730,232.3,7.5,0.87,16.440,234.8
+6.5,0.87,15.020,233.4,7.3,0.87,16.620,235.3
+6.8,0.87,16.220,238.7,7.8,0.87,17.690,241.3
+6.7,0.87,16.860,235.9,7.6,0.87,18.180,238.3
+6.4,0.87,16.590,232.6,7.5,0.87,17.880,235.4
+6.3,0.87,16.650,232.5,7.1,0.87,17.990,235.1
+6.3,0.87,16.740,233.6,6.9,0.87,18.150,235.8
+6.9,0.87,16.190,231.7,7.2,0.87,17.210,233.6
+8.5,0.87,14.640,229.0,8.4,0.87,15.240,230.1
+10.2,0.87,13.210,228.1,10.0,0.87,13.530,228.8
+11.8,0.87,12.960,230.5,11.6,0.87,13.170,230.8
+13.0,0.87,13.810,227.7,12.7,0.87,14.020,228.1
+14.1,0.86,13.500,232.2,13.9,0.86,13.760,232.5
+15.3,0.86,13.860,234.3,15.1,0.86,14.200,234.6
+14.8,0.86,14.480,234.8,14.6,0.86,14.890,235.1
+14.2,0.86,14.400,232.8,14.1,0.86,15.300,233.7
+12.9,0.86,17.160,232.2,13.0,0.86,18.220,233.3
+12.4,0.86,15.560,231.9,12.5,0.86,16.500,233.8
+11.9,0.86,16.330,238.0,12.0,0.86,17.720,239.1
+12.3,0.86,19.200,245.7,12.4,0.86,20.410,246.3
+12.0,0.86,18.090,244.4,12.1,0.86,19.390,245.6
+11.6,0.86,17.590,249.9,11.7,0.86,18.880,251.1
+11.4,0.86,16.720,256.3,11.6,0.86,18.180,257.5
+11.2,0.86,14.660,256.9,11.4,0.86,16.320,257.6
+11.1,0.86,13.790,247.4,11.3,0.86,15.360,249.3
+10.0,0.86,13.680,241.9,10.4,0.86,14.930,244.5
+9.9,0.86,13.240,244.3,10.1,0.86,14.580,246.7
+10.4,0.86,14.010,248.4,10.6,0.86,15.510,249.3
+10.1,0.86,13.070,246.7,10.3,0.86,14.640,247.1
+9.9,0.86,13.080,254.4,10.1,0.86,14.670,254.8
+9.4,0.86,11.960,250.4,9.6,0.86,13.480,250.8
+10.7,0.86,13.420,249.1,10.7,0.86,14.440,249.7
+11.9,0.86,12.370,244.8,11.8,0.86,13.160,245.4
+12.7,0.86,12.210,239.3,12.5,0.86,12.490,239.7
+14.0,0.86,13.060,233.8,13.8,0.86,13.330,234.0
+15.0,0.86,15.160,237.9,14.8,0.86,15.470,238.0
+15.6,0.86,15.610,238.8,15.4,0.86,15.960,238.9
+15.9,0.86,16.370,239.8,15.7,0.86,16.780,239.9
+15.8,0.86,16.160,238.1,15.6,0.86,16.600,238.2
+15.5,0.86,13.970,235.7,15.4,0.86,14.680,236.0
+14.6,0.86,13.870,233.3,14.6,0.86,14.850,234.3
+13.6,0.86,14.520,240.0,13.6,0.86,15.670,240.8
+12.6,0.86,13.280,244.9,12.6,0.86,14.470,246.0
+11.7,0.86,11.240,247.6,11.7,0.86,12.290,249.2
+11.1,0.86,11.950,257.1,11.3,0.86,13.300,259.5
+10.6,0.86,13.740,262.8,10.6,0.86,15.190,264.5
+9.5,0.86,14.440,260.5,9.6,0.86,15.950,263.1
+8.6,0.87,14.750,265.1,8.8,0.87,16.370,267.4
+7.9,0.87,14.740,268.8,8.0,0.87,16.110,270.9
+7.5,0.87,13.900,273.5,7.6,0.87,15.080,275.3
+7.0,0.87,12.940,276.2,7.3,0.87,14.010,279.0
+-1.8,0.87,8.920,29.3,-2.0,0.87,9.540,29.6
+-3.6,0.87,9.590,19.8,-3.8,0.87,10.070,21.0
+-4.2,0.87,9.430,19.8,-4.4,0.87,9.870,20.4
+-4.5,0.87,7.110,16.3,-4.7,0.87,7.480,17.1
+-4.6,0.87,7.610,23.3,-4.8,0.87,7.710,23.4
+-4.0,0.87,6.460,24.8,-4.2,0.87,6.530,24.9
+-3.2,0.87,6.200,26.1,-3.4,0.87,6.240,26.3
+-2.1,0.87,5.600,26.9,-2.3,0.87,5.620,27.2
+-1.1,0.87,4.150,37.7,-1.3,0.87,4.170,38.2
+-0.1,0.87,3.150,55.9,-0.3,0.87,3.160,56.1
+0.6,0.87,2.480,61.3,0.4,0.87,2.480,62.3
+1.5,0.87,2.600,88.2,1.3,0.87,2.630,89.8
+1.7,0.87,3.990,122.1,1.5,0.87,4.010,122.1
+1.3,0.87,5.800,125.6,1.1,0.87,5.890,126.0
+0.9,0.87,6.540,126.8,0.8,0.87,7.050,127.2
+0.1,0.87,8.630,139.7,0.1,0.87,9.460,139.6
+-0.5,0.87,9.710,141.8,-0.6,0.87,10.600,141.8
+-1.1,0.87,10.660,151.4,-1.2,0.87,11.580,151.0
+-1.4,0.87,11.420,160.1,-1.4,0.87,12.250,159.5
+-1.9,0.87,12.380,169.1,-1.8,0.87,13.170,168.8
+-2.3,0.87,13.120,177.4,-2.2,0.87,13.880,177.7
+-2.4,0.87,13.770,187.2,-2.4,0.87,14.460,188.0
+-2.0,0.87,13.240,197.2,-1.8,0.87,14.150,198.7
+-2.1,0.87,11.550,199.5,-2.0,0.87,12.580,202.4
+-1.7,0.87,12.690,204.7,-1.4,0.87,13.930,207.7
+-1.4,0.87,11.770,207.1,-1.1,0.87,13.090,211.7
+-1.7,0.87,10.490,223.0,-1.3,0.87,11.910,226.9
+1.6,0.87,13.500,241.2,2.6,0.87,14.670,245.5
+3.7,0.87,9.270,256.6,4.1,0.87,10.310,259.2
+7.1,0.87,10.620,268.5,7.0,0.87,11.210,268.7
+8.9,0.87,8.990,260.8,8.7,0.87,9.110,261.0
+11.0,0.87,7.210,276.2,10.8,0.87,7.310,276.2
+12.4,0.87,7.560,275.4,12.2,0.87,7.680,275.3
+13.3,0.87,8.070,279.1,13.1,0.87,8.220,278.9
+13.5,0.87,8.670,265.8,13.3,0.87,8.810,266.0
+13.5,0.87,8.020,246.9,13.3,0.87,8.170,247.0
+13.2,0.87,6.840,246.5,13.0,0.87,7.740,248.4
+13.2,0.87,9.460,239.4,13.2,0.87,10.240,242.6
+12.2,0.87,13.780,247.7,12.4,0.87,15.350,249.4
+11.6,0.87,13.540,242.2,11.9,0.87,15.120,244.9
+10.5,0.86,13.100,242.9,10.8,0.86,14.710,247.0
+10.4,0.86,14.980,252.2,10.6,0.86,16.600,254.4
+10.1,0.86,16.060,257.8,10.2,0.86,17.560,259.5
+10.5,0.86,19.040,263.4,10.8,0.86,20.560,264.9
+10.2,0.86,16.280,271.3,10.5,0.86,17.620,272.5
+11.1,0.86,16.160,276.0,11.3,0.86,17.440,277.1
+10.7,0.86,15.300,274.7,11.0,0.86,16.680,276.3
+11.3,0.86,16.620,281.8,11.8,0.86,17.810,283.0
+10.8,0.86,13.920,286.4,11.3,0.86,15.270,287.3
+7.9,0.86,8.210,286.2,8.3,0.86,10.100,285.3
+7.5,0.86,8.520,269.4,8.2,0.86,10.550,275.6
+9.4,0.86,10.640,282.1,10.0,0.86,11.920,285.6
+9.9,0.86,10.020,291.0,10.4,0.86,11.070,293.4
+10.6,0.86,7.630,294.9,10.7,0.86,8.400,295.2
+12.1,0.86,4.210,306.2,11.9,0.86,4.320,304.9
+13.9,0.86,4.640,316.5,13.7,0.86,4.690,315.6
+15.3,0.86,2.380,319.3,15.1,0.86,2.400,317.4
+16.4,0.86,0.410,38.4,16.3,0.86,0.290,40.8
+17.7,0.86,3.700,152.7,17.4,0.86,3.770,154.3
+17.7,0.86,6.810,164.2,17.5,0.86,6.900,164.6
+17.5,0.86,7.800,161.7,17.3,0.86,8.190,162.3
+14.1,0.86,12.720,142.5,14.0,0.86,13.510,142.8
+12.5,0.86,13.600,146.5,12.5,0.86,14.480,146.6
+11.0,0.86,13.610,144.5,11.0,0.86,14.560,144.5
+9.9,0.86,13.630,151.4,9.9,0.86,14.660,151.3
+8.8,0.86,13.460,153.8,8.9,0.86,14.540,153.8
+7.9,0.86,13.260,158.3,8.1,0.86,14.170,159.0
+8.1,0.86,11.230,171.1,8.8,0.86,11.370,180.6
+11.2,0.86,10.760,219.8,12.0,0.86,12.050,232.8
+9.6,0.86,9.750,225.2,10.7,0.86,11.590,237.7
+11.3,0.86,14.010,255.6,12.7,0.86,16.780,261.4
+12.6,0.86,15.610,261.6,13.3,0.86,17.600,264.1
+13.0,0.86,16.980,263.4,13.6,0.86,18.570,265.0
+13.0,0.86,17.630,266.3,13.7,0.86,19.080,268.2
+12.4,0.86,16.220,264.9,13.0,0.86,17.950,266.9
+11.7,0.86,15.210,267.0,12.4,0.86,16.890,268.9
+12.3,0.86,13.070,269.7,12.5,0.86,14.220,270.6
+13.8,0.86,11.190,272.1,13.6,0.86,11.770,272.7
+12.0,0.86,5.060,358.3,11.9,0.86,4.970,355.6
+13.2,0.86,5.800,311.5,13.0,0.86,5.920,310.9
+15.4,0.86,7.750,303.4,15.2,0.86,7.780,303.5
+16.6,0.86,5.420,315.6,16.4,0.86,5.450,315.6
+16.8,0.86,4.400,329.3,16.6,0.86,4.440,329.7
+16.7,0.86,4.460,4.2,16.5,0.86,4.500,4.2
+15.3,0.86,8.140,42.3,15.1,0.86,8.550,42.9
+12.6,0.86,9.090,59.1,12.4,0.86,9.750,59.8
+10.3,0.87,9.130,56.5,10.3,0.87,9.590,56.7
+9.7,0.87,7.740,56.4,9.7,0.87,7.810,56.4
+8.9,0.87,8.140,55.8,8.9,0.87,8.160,52.9
+8.3,0.87,6.300,54.6,8.2,0.87,6.590,54.9
+7.5,0.87,8.020,54.6,7.4,0.87,8.250,54.6
+6.3,0.87,9.450,61.5,6.2,0.87,9.920,62.7
+5.2,0.87,7.230,68.5,5.0,0.87,7.510,69.6
+3.3,0.87,5.930,78.6,3.1,0.87,6.300,81.1
+2.1,0.87,3.520,96.7,2.0,0.87,3.780,96.8
+1.2,0.87,2.780,103.7,1.1,0.87,3.160,102.0
+0.5,0.87,1.680,122.6,0.5,0.87,1.890,118.9
+0.1,0.87,2.110,146.7,0.4,0.87,2.320,144.7
+0.2,0.87,3.960,181.6,0.5,0.87,4.010,180.6
+-0.2,0.87,5.480,190.6,0.1,0.87,5.710,190.9
+-0.3,0.87,6.250,202.1,0.3,0.87,7.080,202.7
+2.3,0.87,6.990,189.8,2.1,0.87,7.160,190.5
+5.3,0.87,8.480,194.1,5.1,0.87,8.580,194.3
+7.5,0.87,9.550,190.9,7.3,0.87,9.690,191.3
+9.6,0.86,11.020,193.5,9.4,0.86,11.200,193.7
+11.0,0.86,12.330,194.3,10.8,0.86,12.520,194.5
+12.0,0.86,12.390,197.1,11.8,0.86,12.600,197.3
+12.5,0.86,12.460,197.1,12.3,0.86,12.710,197.4
+12.3,0.86,12.430,190.5,12.1,0.86,12.940,191.1
+11.4,0.86,13.820,188.0,11.4,0.86,14.700,189.4
+10.6,0.86,14.070,191.6,10.7,0.86,15.200,193.4
+10.6,0.86,14.160,197.7,10.8,0.86,15.470,200.0
+10.8,0.86,14.470,200.9,11.0,0.86,15.670,203.3
+10.3,0.86,14.270,210.3,10.6,0.86,15.770,212.9
+10.4,0.86,13.830,216.0,10.6,0.86,15.170,218.3
+10.8,0.86,14.690,225.0,11.4,0.86,16.390,228.1
+11.4,0.86,13.450,237.1,12.0,0.86,15.370,238.4
+11.9,0.86,12.860,236.9,12.5,0.86,14.760,238.0
+11.1,0.86,12.250,240.7,11.4,0.86,13.780,242.0
+10.3,0.85,10.730,240.3,10.6,0.85,12.040,244.6
+9.3,0.85,11.710,264.3,9.6,0.85,13.750,265.4
+9.2,0.85,14.780,256.6,9.2,0.85,16.700,257.9
+7.5,0.85,16.330,252.5,7.5,0.85,17.810,253.7
+6.1,0.85,14.650,250.9,6.1,0.85,16.010,252.3
+6.7,0.85,18.610,261.0,6.5,0.85,19.410,261.4
+7.1,0.85,19.260,259.5,6.9,0.85,19.750,259.8
+8.9,0.85,19.600,271.2,8.7,0.85,19.970,271.5
+10.8,0.85,19.220,288.6,10.6,0.85,19.620,289.0
+10.3,0.86,17.630,331.0,10.0,0.86,17.920,330.9
+10.7,0.86,15.190,323.1,10.5,0.86,15.470,323.1
+10.6,0.86,16.550,322.3,10.4,0.86,16.860,322.4
+10.3,0.86,16.420,328.8,10.1,0.86,16.730,328.8
+9.7,0.86,13.200,336.3,9.5,0.86,13.560,336.4
+8.6,0.86,10.380,347.2,8.4,0.86,11.200,347.4
+8.4,0.86,8.830,346.0,8.3,0.86,9.350,346.3
+8.2,0.86,7.040,339.6,8.0,0.86,7.480,342.1
+7.5,0.86,6.910,345.6,7.2,0.86,7.580,349.6
+7.0,0.87,6.070,347.6,6.8,0.87,6.360,350.7
+6.5,0.87,6.890,11.6,6.3,0.87,7.430,14.9
+5.9,0.87,4.990,10.6,5.6,0.87,5.130,12.8
+4.5,0.87,3.680,29.8,4.6,0.87,4.150,30.8
+4.2,0.87,2.190,52.0,4.2,0.87,2.520,49.2
+3.7,0.87,1.870,110.8,3.7,0.87,2.020,102.8
+3.5,0.87,2.680,135.6,3.5,0.87,2.770,130.1
+3.1,0.87,4.580,162.8,3.1,0.87,4.480,160.5
+2.8,0.87,6.020,180.8,2.9,0.87,5.950,178.0
+2.6,0.87,7.370,189.9,2.9,0.87,7.440,187.8
+2.6,0.87,9.080,187.5,2.9,0.87,9.070,186.5
+2.2,0.87,9.380,185.5,3.0,0.87,10.160,185.7
+3.4,0.87,8.580,175.8,3.2,0.87,8.810,176.7
+5.2,0.87,9.690,175.0,5.0,0.87,9.820,175.5
+6.7,0.87,8.520,189.3,6.5,0.87,8.650,189.6
+8.6,0.87,6.200,195.5,8.4,0.87,6.320,195.7
+11.6,0.87,7.020,222.3,11.3,0.87,7.160,222.6
+12.0,0.87,6.380,213.0,11.7,0.87,6.530,213.2
+13.5,0.86,8.760,224.5,13.3,0.86,8.970,224.8
+13.2,0.86,9.030,218.0,13.0,0.86,9.520,218.8
+12.1,0.86,10.160,212.0,12.2,0.86,11.100,215.5
+11.9,0.86,11.050,209.2,12.0,0.86,12.040,212.9
+10.5,0.86,9.820,204.6,10.9,0.86,10.980,208.9
+9.6,0.86,14.490,204.5,9.9,0.86,15.530,205.5
+9.0,0.86,14.350,210.1,9.4,0.86,15.710,210.7
+8.7,0.86,14.170,215.5,9.0,0.86,15.320,216.2
+9.4,0.86,14.950,217.6,9.7,0.86,15.860,218.3
+8.6,0.86,12.330,212.6,8.7,0.86,13.120,213.8
+8.5,0.86,11.710,206.9,8.8,0.86,12.410,208.6
+8.2,0.86,10.590,208.9,8.5,0.86,11.350,211.0
+8.1,0.86,10.590,202.2,8.4,0.86,11.510,204.5
+7.1,0.86,10.770,189.5,7.5,0.86,11.700,193.7
+7.0,0.86,10.190,191.6,7.5,0.86,11.030,195.6
+6.4,0.86,9.620,194.0,7.0,0.86,10.380,199.6
+5.1,0.86,8.680,183.7,5.9,0.86,9.010,191.6
+4.7,0.86,8.370,182.1,5.6,0.86,8.840,185.5
+6.5,0.86,6.630,187.7,6.5,0.86,7.310,188.6
+8.1,0.86,5.960,181.1,7.9,0.86,6.010,181.4
+10.1,0.86,6.370,176.3,9.8,0.86,6.460,176.4
+11.5,0.86,6.240,169.9,11.3,0.86,6.340,170.0
+12.7,0.86,7.690,163.3,12.4,0.86,7.820,163.5
+11.5,0.86,8.210,137.3,11.3,0.86,8.260,138.2
+10.9,0.86,8.550,138.8,10.7,0.86,8.660,138.9
+9.9,0.86,8.100,127.3,9.7,0.86,8.270,127.5
+9.2,0.87,6.300,111.8,9.0,0.87,6.580,112.7
+9.2,0.87,3.560,82.4,9.0,0.87,3.820,84.3
+8.4,0.87,5.000,79.8,8.2,0.87,5.280,81.7
+8.2,0.87,6.720,46.9,8.2,0.87,6.970,50.3
+5.9,0.87,12.890,30.5,5.7,0.87,13.080,30.7
+4.8,0.87,11.320,27.8,4.6,0.87,11.660,28.0
+3.5,0.87,11.780,21.4,3.4,0.87,12.460,21.9
+2.9,0.87,11.430,12.5,2.7,0.87,11.950,12.9
+2.4,0.87,10.720,12.1,2.2,0.87,11.430,12.8
+1.8,0.87,11.770,15.0,1.7,0.87,12.600,15.8
+1.3,0.87,10.830,9.9,1.1,0.87,11.410,10.5
+0.3,0.87,10.690,11.3,0.2,0.87,11.390,12.3
+-0.3,0.87,10.930,5.9,-0.5,0.87,11.520,6.7
+-0.8,0.87,10.290,6.5,-1.0,0.87,10.820,7.4
+-1.2,0.87,9.800,8.4,-1.4,0.87,10.280,9.2
+-1.2,0.87,9.250,5.0,-1.4,0.87,9.470,5.4
+-0.3,0.87,8.670,4.6,-0.5,0.87,8.780,4.8
+1.2,0.87,8.700,4.9,1.0,0.87,8.790,5.0
+3.0,0.87,8.460,3.6,2.8,0.87,8.550,3.7
+4.9,0.87,8.370,2.3,4.6,0.87,8.460,2.5
+6.3,0.87,7.880,2.5,6.1,0.87,7.970,2.6
+7.4,0.87,7.970,359.7,7.2,0.87,8.050,359.8
+8.1,0.87,7.770,1.0,7.8,0.87,7.860,1.1
+8.2,0.87,7.260,1.0,8.0,0.87,7.390,1.0
+8.1,0.87,7.260,7.1,7.9,0.87,7.330,6.9
+7.8,0.87,6.830,8.3,7.6,0.87,6.910,8.2
+7.4,0.87,5.490,13.9,7.5,0.87,5.740,10.8
+6.9,0.87,3.820,5.4,7.1,0.87,4.350,4.6
+6.3,0.87,3.630,345.9,6.7,0.87,4.150,349.0
+6.3,0.87,3.660,340.6,6.5,0.87,3.910,345.3
+6.1,0.87,4.530,332.8,6.3,0.87,4.680,336.4
+5.6,0.87,7.030,316.9,6.1,0.87,6.940,323.5
+5.4,0.87,9.080,318.0,6.1,0.87,8.760,324.0
+6.1,0.87,9.520,322.8,6.7,0.87,8.960,331.4
+5.8,0.87,8.020,335.4,6.1,0.87,7.940,342.7
+5.0,0.87,9.530,340.4,5.1,0.87,10.510,350.9
+4.8,0.87,11.190,354.7,5.0,0.87,12.490,358.9
+4.2,0.87,10.890,343.5,4.3,0.87,11.760,350.4
+3.2,0.87,10.720,355.0,3.3,0.87,11.860,0.6
+2.8,0.87,7.690,354.0,2.8,0.87,8.240,357.5
+3.9,0.87,5.300,3.0,3.7,0.87,5.450,4.0
+5.3,0.87,3.560,348.7,5.1,0.87,3.630,349.3
+6.6,0.87,3.880,333.6,6.4,0.87,3.910,334.5
+7.7,0.87,3.210,324.9,7.5,0.87,3.240,325.4
+8.8,0.87,2.750,330.1,8.6,0.87,2.780,330.4
+9.6,0.87,1.870,326.7,9.3,0.87,1.880,327.3
+10.0,0.87,1.220,272.5,9.8,0.87,1.230,271.4
+10.3,0.87,2.620,220.6,10.1,0.87,2.640,221.1
+10.5,0.87,4.690,194.2,10.3,0.87,4.630,195.4
+10.3,0.87,7.070,190.7,10.2,0.87,7.020,192.7
+10.1,0.87,9.360,195.5,10.2,0.87,9.530,195.3
+9.6,0.87,10.990,192.3,10.0,0.87,11.590,192.8
+9.1,0.87,12.180,189.9,9.5,0.87,12.990,190.7
+8.7,0.87,13.070,191.8,9.1,0.87,14.180,192.7
+8.2,0.87,13.010,201.9,8.3,0.87,14.010,202.9
+7.7,0.86,13.710,197.6,7.9,0.86,14.710,199.8
+7.8,0.86,13.870,214.6,8.0,0.86,15.070,216.4
+8.0,0.86,14.630,222.0,8.3,0.86,15.890,224.0
+7.8,0.86,13.210,220.7,8.0,0.86,14.550,223.8
+7.2,0.86,13.400,228.2,7.5,0.86,14.660,231.3
+8.0,0.86,14.160,236.7,8.1,0.86,15.110,238.7
+7.7,0.86,13.220,253.8,8.0,0.86,14.570,256.9
+7.2,0.86,10.770,295.5,7.5,0.86,11.750,297.3
+8.0,0.86,11.430,323.0,8.1,0.86,11.970,325.4
+7.6,0.86,9.850,343.5,7.5,0.86,10.040,344.8
+8.2,0.87,12.730,5.7,8.0,0.87,12.940,5.8
+8.7,0.87,11.840,358.4,8.5,0.87,11.990,358.4
+8.4,0.87,11.940,5.9,8.2,0.87,12.120,5.8
+8.2,0.87,12.230,5.9,8.0,0.87,12.410,5.9
+8.2,0.87,11.990,7.7,8.0,0.87,12.180,7.5
+8.0,0.87,12.080,7.9,7.7,0.87,12.290,7.8
+7.5,0.87,11.780,9.6,7.3,0.87,12.040,9.6
+6.7,0.87,11.200,6.9,6.5,0.87,11.920,7.2
+5.8,0.87,10.740,7.4,5.7,0.87,11.560,8.5
+4.8,0.87,11.300,9.7,4.7,0.87,12.090,11.3
+3.5,0.87,10.520,12.2,3.5,0.87,11.420,14.2
+2.3,0.88,9.150,17.4,2.2,0.88,10.180,19.8
+1.2,0.88,10.790,23.9,1.2,0.88,12.130,26.8
+0.5,0.88,10.490,26.9,0.5,0.88,11.880,29.4
+-0.3,0.88,9.260,14.6,-0.4,0.88,10.050,17.7
+-1.3,0.88,8.900,17.5,-1.3,0.88,10.430,23.1
+-1.9,0.88,7.650,15.4,-2.0,0.88,8.610,20.0
+-2.4,0.88,6.240,24.9,-2.5,0.88,7.300,29.5
+-2.7,0.88,4.040,7.8,-2.8,0.88,4.390,14.6
+-2.8,0.88,4.480,21.6,-2.9,0.88,5.020,26.8
+-3.1,0.88,3.170,21.7,-3.2,0.88,3.360,26.4
+-3.1,0.88,0.480,310.1,-3.2,0.88,0.550,334.3
+-2.7,0.88,1.690,230.8,-2.8,0.88,1.550,230.1
+-1.5,0.88,2.960,224.5,-1.7,0.88,2.960,224.1
+0.3,0.88,4.140,226.9,0.1,0.88,4.180,226.8
+1.9,0.88,4.430,230.5,1.7,0.88,4.490,230.6
+3.4,0.88,4.610,233.0,3.2,0.88,4.670,233.3
+4.4,0.88,5.380,233.5,4.2,0.88,5.450,233.9
+5.3,0.88,5.620,238.4,5.1,0.88,5.700,238.7
+5.9,0.88,6.160,234.5,5.7,0.88,6.260,234.8
+6.1,0.88,5.770,231.5,5.9,0.88,5.930,231.9
+6.1,0.88,6.820,222.1,5.9,0.88,7.100,223.5
+5.9,0.88,9.210,230.2,5.7,0.88,9.530,231.0
+5.1,0.88,9.620,221.1,5.1,0.88,9.870,222.1
+4.9,0.88,10.670,214.7,5.0,0.88,11.130,216.0
+4.2,0.88,12.210,218.8,4.6,0.88,12.910,220.3
+3.5,0.88,12.820,224.2,4.1,0.88,13.720,224.3
+2.8,0.88,13.420,226.7,3.6,0.88,14.280,228.2
+2.6,0.88,13.740,231.6,3.3,0.88,14.840,233.6
+2.3,0.88,13.790,235.2,3.1,0.88,15.120,237.8
+1.7,0.88,13.470,234.5,2.5,0.88,14.940,237.3
+1.3,0.88,13.280,235.7,2.0,0.88,14.730,239.3
+0.8,0.88,12.780,239.3,1.6,0.88,14.200,243.8
+0.9,0.88,12.380,244.2,2.0,0.88,13.000,250.2
+0.7,0.88,10.580,250.0,2.1,0.88,11.090,259.9
+1.9,0.88,10.130,263.5,3.5,0.88,9.520,281.9
+2.5,0.88,5.370,285.1,2.7,0.88,5.800,290.9
+3.8,0.88,2.980,285.4,3.6,0.88,3.070,285.2
+6.0,0.88,2.660,284.6,5.9,0.88,2.710,283.3
+7.8,0.88,3.100,297.4,7.6,0.88,3.110,295.7
+9.4,0.88,2.710,305.2,9.3,0.88,2.720,303.6
+10.7,0.87,1.980,319.6,10.5,0.87,1.970,317.5
+11.6,0.87,1.230,327.1,11.4,0.87,1.180,321.9
+12.1,0.87,0.780,326.1,11.9,0.87,0.720,317.6
+12.2,0.87,0.520,45.0,12.0,0.87,0.330,85.4
+12.0,0.87,1.100,96.4,11.9,0.87,1.120,112.6
+11.4,0.87,2.780,185.0,11.6,0.87,3.200,184.6
+11.4,0.87,6.290,193.4,11.9,0.87,5.930,190.3
+11.2,0.87,7.500,221.6,11.4,0.87,6.920,220.3
+11.3,0.87,7.290,225.2,11.6,0.87,6.890,223.0
+11.8,0.87,6.830,223.4,11.9,0.87,6.540,221.1
+11.1,0.87,8.430,222.6,11.5,0.87,8.190,221.4
+10.2,0.87,10.410,229.5,10.9,0.87,10.290,228.6
+10.7,0.87,12.670,245.0,11.4,0.87,12.700,244.0
+8.4,0.87,12.390,233.8,9.9,0.87,13.210,235.8
+7.9,0.87,13.500,235.5,9.4,0.87,14.450,236.4
+7.6,0.87,14.740,241.0,8.8,0.87,15.980,242.3
+5.5,0.87,12.170,238.5,6.7,0.87,13.430,241.2
+4.7,0.87,13.460,235.1,6.2,0.87,14.600,238.9
+6.0,0.87,13.680,241.7,7.4,0.87,14.950,243.8
+6.5,0.87,12.070,238.8,6.8,0.87,12.890,240.4
+7.7,0.87,8.600,238.7,7.6,0.87,9.320,240.6
+10.4,0.87,8.140,236.1,10.2,0.87,8.260,236.7
+12.8,0.87,9.200,234.7,12.6,0.87,9.340,235.1
+14.0,0.87,10.100,229.8,13.8,0.87,10.250,230.1
+15.2,0.87,10.790,228.0,15.0,0.87,10.960,228.3
+16.4,0.87,10.830,231.0,16.2,0.87,11.030,231.2
+16.6,0.87,10.460,226.9,16.4,0.87,10.670,227.2
+15.8,0.86,10.510,219.7,15.7,0.86,11.040,220.6
+15.1,0.86,12.990,216.0,15.1,0.86,13.950,218.0
+13.8,0.86,14.790,216.0,14.0,0.86,16.010,217.7
+12.8,0.86,14.840,220.6,13.1,0.86,16.190,222.0
+11.4,0.86,15.430,223.9,11.6,0.86,16.700,225.1
+10.8,0.86,16.750,230.4,11.1,0.86,18.080,231.6
+10.7,0.86,16.620,237.8,11.1,0.86,17.900,239.3
+9.6,0.86,14.140,234.8,10.2,0.86,15.430,237.8
+9.4,0.86,13.570,238.6,9.8,0.86,14.790,241.9
+9.2,0.86,11.590,244.6,9.7,0.86,12.850,249.7
+10.0,0.86,16.680,261.0,10.7,0.86,18.340,264.2
+9.5,0.86,14.610,265.2,10.1,0.86,16.170,268.4
+8.5,0.87,11.760,273.7,9.1,0.87,13.340,276.5
+7.8,0.87,8.650,290.8,8.2,0.87,10.520,291.0
+6.8,0.87,11.990,299.3,7.3,0.87,13.300,299.6
+6.6,0.87,11.270,329.4,6.8,0.87,11.920,339.4
+5.5,0.87,9.180,351.8,5.4,0.87,9.660,355.9
+5.7,0.87,6.590,355.0,5.5,0.87,6.730,356.2
+7.3,0.87,6.650,3.6,7.1,0.87,6.780,4.3
+8.7,0.87,6.500,9.9,8.5,0.87,6.590,10.1
+9.9,0.87,6.880,15.4,9.6,0.87,6.960,15.4
+10.8,0.87,6.080,21.6,10.6,0.87,6.140,21.6
+11.4,0.87,5.120,25.2,11.2,0.87,5.160,25.3
+11.7,0.87,4.450,33.2,11.4,0.87,4.490,33.3
+11.6,0.87,3.360,40.8,11.4,0.87,3.380,41.3
+11.4,0.87,2.850,49.4,11.2,0.87,3.050,52.3
+11.0,0.87,4.490,72.0,10.9,0.87,4.640,72.5
+10.5,0.87,5.440,88.0,10.5,0.87,5.530,86.5
+10.6,0.87,6.060,85.7,10.5,0.87,5.890,85.0
+10.1,0.87,6.870,96.4,10.1,0.87,6.740,96.5
+9.4,0.87,7.500,107.5,9.5,0.87,7.670,107.8
+8.7,0.87,7.390,118.6,8.9,0.87,7.660,117.9
+8.1,0.87,7.590,128.2,8.4,0.87,7.960,127.2
+7.6,0.87,7.840,145.7,7.7,0.87,8.000,145.8
+7.3,0.87,7.520,169.6,7.6,0.87,7.770,166.6
+6.9,0.87,8.730,178.1,7.4,0.87,9.000,174.7
+7.1,0.87,9.630,189.4,7.7,0.87,9.860,187.1
+7.0,0.87,9.980,206.7,7.5,0.87,10.090,204.1
+5.4,0.87,8.650,231.9,6.2,0.87,9.340,231.8
+5.0,0.87,9.230,292.3,5.0,0.87,9.500,295.5
+3.3,0.87,6.820,303.4,3.4,0.87,7.520,304.5
+4.8,0.87,5.680,307.9,4.7,0.87,5.980,308.3
+6.3,0.87,5.660,317.9,6.1,0.87,5.720,317.6
+8.2,0.87,6.300,325.5,8.0,0.87,6.350,325.6
+10.0,0.87,5.920,340.6,9.8,0.87,5.970,340.6
+10.8,0.87,5.660,345.2,10.6,0.87,5.710,345.2
+11.9,0.87,4.800,353.2,11.7,0.87,4.860,352.9
+12.5,0.87,4.080,8.1,12.3,0.87,4.120,7.8
+12.6,0.87,2.980,22.5,12.3,0.87,3.040,21.9
+11.4,0.87,3.290,73.1,11.3,0.87,3.060,69.9
+11.2,0.87,3.080,79.0,11.1,0.87,2.920,75.6
+11.1,0.87,3.710,98.9,11.0,0.87,3.710,94.7
+10.8,0.87,5.350,123.5,10.8,0.87,5.150,124.3
+9.9,0.87,6.880,138.5,10.0,0.87,6.790,139.7
+9.2,0.87,7.520,154.3,9.3,0.87,7.730,153.7
+8.5,0.87,8.700,147.4,8.7,0.87,9.070,146.9
+8.0,0.87,9.880,145.2,8.2,0.87,10.390,144.8
+7.6,0.87,10.810,144.6,7.9,0.87,11.350,144.3
+7.1,0.87,10.450,146.4,7.4,0.87,10.980,146.2
+6.1,0.87,10.190,146.4,6.4,0.87,10.900,146.3
+5.6,0.87,10.830,149.3,6.2,0.87,11.670,149.1
+5.3,0.87,11.230,151.8,5.9,0.87,12.140,151.0
+5.4,0.87,11.760,150.3,5.9,0.87,12.600,149.8
+5.2,0.87,11.770,148.1,5.7,0.87,12.610,147.8
+4.0,0.87,10.540,144.5,4.2,0.87,11.360,144.4
+5.5,0.87,10.340,147.1,5.4,0.87,10.890,147.1
+7.1,0.87,11.880,145.2,6.9,0.87,12.100,145.2
+8.0,0.87,12.190,139.2,7.7,0.87,12.380,139.3
+8.8,0.87,12.410,138.3,8.6,0.87,12.640,138.4
+8.4,0.87,11.430,135.5,8.2,0.87,11.640,135.8
+8.7,0.86,12.610,147.1,8.4,0.86,12.840,147.4
+8.2,0.86,11.970,149.8,8.0,0.86,12.170,150.2
+8.2,0.86,9.730,144.3,8.0,0.86,10.000,144.6
+8.5,0.86,10.020,147.1,8.3,0.86,10.570,147.5
+8.8,0.86,10.730,143.6,8.7,0.86,11.200,144.2
+8.3,0.86,11.090,145.5,8.2,0.86,11.530,146.1
+7.8,0.86,15.280,138.6,7.8,0.86,15.940,139.6
+8.3,0.86,13.240,152.8,8.3,0.86,13.740,153.4
+9.7,0.86,5.240,177.0,9.7,0.86,5.580,177.5
+10.9,0.86,11.090,179.0,11.0,0.86,12.140,180.9
+10.4,0.86,7.950,188.7,10.5,0.86,8.690,191.1
+10.0,0.86,6.250,206.5,10.1,0.86,7.230,209.8
+8.3,0.86,1.910,266.4,8.4,0.86,2.600,254.7
+7.9,0.86,1.450,260.3,7.8,0.86,1.900,255.7
+6.5,0.86,1.770,307.0,6.2,0.86,2.450,299.2
+4.8,0.86,3.150,303.5,4.6,0.86,2.960,302.6
+5.4,0.86,3.710,4.0,5.2,0.86,3.950,3.9
+6.1,0.86,5.630,7.3,6.0,0.86,6.090,8.1
+5.9,0.87,6.850,4.6,5.8,0.87,7.210,5.4
+5.6,0.87,7.680,2.0,5.5,0.87,7.820,2.6
+5.4,0.87,6.330,11.2,5.2,0.87,6.430,11.2
+5.4,0.87,6.690,16.4,5.2,0.87,6.770,16.2
+4.5,0.87,10.040,339.9,4.3,0.87,10.100,339.9
+3.8,0.87,9.130,333.8,3.6,0.87,9.250,334.3
+4.1,0.87,5.900,357.9,3.9,0.87,6.020,357.3
+4.6,0.87,4.460,3.9,4.4,0.87,4.520,3.2
+4.9,0.87,2.260,25.6,4.7,0.87,2.240,23.4
+4.5,0.87,2.890,29.5,4.4,0.87,3.250,26.4
+5.5,0.87,7.880,343.3,5.4,0.87,8.410,343.8
+5.1,0.87,11.990,335.4,5.0,0.87,12.740,337.1
+3.3,0.87,10.550,336.0,3.2,0.87,11.350,336.8
+2.4,0.87,10.090,333.0,2.3,0.87,10.710,333.7
+1.4,0.87,11.010,325.9,1.4,0.87,11.770,327.9
+0.9,0.87,10.890,319.1,0.9,0.87,11.570,322.3
+0.4,0.87,10.440,317.2,0.3,0.87,11.070,319.9
+-0.1,0.87,10.870,324.0,-0.1,0.87,11.550,327.1
+-0.4,0.87,11.160,325.6,-0.5,0.87,11.810,328.6
+-0.8,0.87,11.050,328.1,-0.8,0.87,11.700,331.5
+-1.0,0.87,10.930,332.4,-1.0,0.87,11.700,336.0
+-1.2,0.87,11.680,337.8,-1.2,0.87,12.480,341.1
+-1.4,0.87,11.770,340.7,-1.4,0.87,12.530,343.6
+-1.5,0.88,11.850,344.8,-1.6,0.88,12.610,347.4
+-1.4,0.88,11.810,349.9,-1.6,0.88,12.160,350.5
+-0.6,0.88,11.960,357.8,-0.8,0.88,12.180,357.9
+0.5,0.88,13.060,359.5,0.3,0.88,13.250,359.5
+1.3,0.88,12.750,1.3,1.1,0.88,12.930,1.3
+2.2,0.88,12.610,2.5,1.9,0.88,12.800,2.5
+3.0,0.88,11.930,3.3,2.8,0.88,12.110,3.2
+3.6,0.88,11.710,4.6,3.3,0.88,11.890,4.6
+3.7,0.88,11.840,4.9,3.5,0.88,12.030,4.9
+3.5,0.88,11.350,8.0,3.3,0.88,11.560,8.0
+3.0,0.88,9.660,15.2,2.9,0.88,10.390,15.1
+2.4,0.88,8.990,15.9,2.3,0.88,9.970,16.3
+1.9,0.88,9.110,14.9,1.8,0.88,9.820,16.2
+1.1,0.88,8.610,8.7,1.1,0.88,9.610,12.2
+0.5,0.88,8.490,7.2,0.4,0.88,9.250,10.1
+-0.3,0.88,9.130,3.0,-0.4,0.88,9.980,7.8
+-1.1,0.88,7.680,4.0,-1.2,0.88,8.250,8.5
+-1.7,0.88,8.270,5.2,-1.8,0.88,9.090,9.5
+-2.2,0.88,7.270,358.1,-2.3,0.88,7.960,3.5
+-2.6,0.88,6.390,355.2,-2.6,0.88,6.880,0.7
+-2.9,0.88,5.550,351.5,-2.9,0.88,5.930,357.5
+-3.0,0.88,5.440,346.3,-3.0,0.88,5.770,353.4
+-3.1,0.88,5.810,345.0,-3.1,0.88,6.080,352.6
+-3.3,0.88,5.850,344.1,-3.3,0.88,6.110,351.7
+-3.5,0.88,5.730,342.8,-3.4,0.88,6.010,351.0
+-3.1,0.88,4.670,346.3,-3.2,0.88,4.820,349.6
+-1.8,0.88,4.960,0.4,-2.0,0.88,5.010,0.8
+-0.8,0.88,4.800,4.5,-1.0,0.88,4.840,4.9
+0.4,0.88,4.650,12.1,0.2,0.88,4.690,12.2
+1.3,0.88,4.320,16.4,1.1,0.88,4.360,16.4
+2.0,0.88,3.800,24.2,1.8,0.88,3.820,24.1
+2.5,0.88,3.320,32.0,2.3,0.88,3.330,31.9
+2.8,0.88,2.700,35.6,2.6,0.88,2.720,35.8
+2.9,0.88,2.270,52.3,2.7,0.88,2.270,52.2
+2.7,0.88,2.410,68.9,2.5,0.88,2.340,67.1
+2.6,0.88,2.080,79.1,2.4,0.88,1.990,81.6
+2.3,0.88,2.190,117.5,2.1,0.88,2.220,114.9
+1.9,0.88,3.570,115.2,1.8,0.88,3.200,117.8
+1.9,0.88,3.030,132.8,1.9,0.88,2.770,135.4
+2.0,0.88,2.890,141.8,2.0,0.88,2.630,145.7
+1.7,0.88,3.660,154.2,1.8,0.88,3.420,156.8
+1.1,0.88,4.650,162.8,1.3,0.88,4.410,162.3
+1.2,0.88,5.100,174.6,1.4,0.88,4.910,173.5
+0.8,0.88,5.970,178.1,1.1,0.88,5.980,176.8
+0.5,0.87,6.950,184.5,0.7,0.87,6.970,182.7
+0.3,0.87,7.350,191.4,0.6,0.87,7.410,188.8
+0.0,0.87,7.870,197.4,0.3,0.87,7.860,194.4
+-0.4,0.87,8.420,201.9,-0.0,0.87,8.540,198.6
+-0.5,0.87,8.330,207.6,-0.1,0.87,8.380,204.0
+-0.2,0.87,7.660,205.1,0.1,0.87,8.320,205.0
+1.6,0.87,7.590,200.4,1.5,0.87,7.670,200.5
+2.9,0.87,6.470,200.2,2.7,0.87,6.540,200.2
+4.4,0.87,5.670,196.8,4.2,0.87,5.770,196.8
+5.5,0.87,6.160,196.3,5.2,0.87,6.260,196.3
+6.3,0.87,6.370,193.3,6.1,0.87,6.490,193.5
+6.8,0.87,6.830,195.3,6.6,0.87,6.950,195.5
+7.4,0.87,6.790,196.4,7.2,0.87,6.920,196.4
+7.5,0.87,6.620,191.1,7.3,0.87,6.800,191.3
+7.0,0.87,7.090,187.6,6.9,0.87,7.590,188.1
+6.8,0.87,9.290,189.5,6.7,0.87,9.600,189.6
+6.4,0.87,9.800,183.0,6.5,0.87,10.140,184.4
+5.4,0.87,8.990,173.5,5.4,0.87,9.440,177.0
+4.2,0.87,10.390,177.0,4.4,0.87,11.460,179.5
+3.4,0.87,10.490,181.7,3.6,0.87,11.570,183.9
+3.1,0.87,11.790,183.1,3.3,0.87,12.760,184.5
+2.9,0.87,11.120,186.6,3.2,0.87,11.740,188.4
+2.8,0.87,9.110,197.5,3.2,0.87,9.660,200.0
+0.8,0.87,3.250,272.6,0.9,0.87,3.820,266.3
+2.5,0.87,4.460,322.9,2.5,0.87,4.640,326.5
+0.4,0.87,9.030,20.1,0.4,0.87,10.000,21.3
+-0.6,0.87,6.730,332.9,-0.6,0.87,7.080,334.6
+-1.2,0.87,9.770,347.6,-1.4,0.87,10.240,348.2
+-1.5,0.87,8.120,344.9,-1.7,0.87,8.680,345.9
+-1.3,0.87,8.880,351.6,-1.5,0.87,9.070,352.1
+-1.1,0.87,9.830,357.9,-1.3,0.87,9.960,357.8
+-0.6,0.88,10.640,357.4,-0.8,0.88,10.780,357.4
+-0.1,0.88,11.470,4.4,-0.3,0.88,11.620,4.4
+0.7,0.88,10.750,5.4,0.5,0.88,10.900,5.4
+1.4,0.88,10.010,10.3,1.1,0.88,10.160,10.1
+1.6,0.88,9.780,14.5,1.4,0.88,9.930,14.3
+1.7,0.88,9.610,16.4,1.4,0.88,9.770,16.1
+1.4,0.88,9.170,21.9,1.2,0.88,9.330,21.6
+0.7,0.88,8.970,27.3,0.5,0.88,9.470,27.2
+-0.1,0.88,7.900,36.0,-0.2,0.88,8.410,36.1
+-0.8,0.88,7.480,43.6,-1.0,0.88,8.110,43.8
+-1.7,0.88,7.300,47.4,-1.9,0.88,8.240,48.6
+-2.6,0.88,5.910,52.8,-2.6,0.88,6.870,51.9
+-3.1,0.88,4.130,44.3,-3.3,0.88,5.400,48.1
+-3.7,0.88,6.060,49.0,-3.8,0.88,6.830,48.3
+-4.1,0.88,4.550,47.6,-4.3,0.88,5.180,49.4
+-4.5,0.88,4.090,40.6,-4.7,0.88,4.580,44.0
+-4.8,0.88,3.750,38.4,-5.0,0.88,4.070,42.9
+-5.2,0.88,2.460,39.7,-5.4,0.88,2.630,44.1
+-5.6,0.88,1.190,44.5,-5.8,0.88,1.320,45.7
+-5.9,0.88,0.790,94.8,-6.0,0.88,0.820,91.9
+-5.9,0.88,1.170,172.1,-6.0,0.88,1.210,169.0
+-5.6,0.88,2.300,180.7,-5.6,0.88,2.150,179.3
+-5.1,0.88,2.890,192.8,-5.2,0.88,3.000,193.3
+-3.3,0.88,3.360,193.0,-3.5,0.88,3.390,193.2
+-1.0,0.88,4.190,192.8,-1.2,0.88,4.240,193.3
+1.0,0.88,5.600,198.8,0.8,0.88,5.670,199.0
+2.9,0.88,6.490,204.7,2.7,0.88,6.590,204.8
+4.3,0.88,7.210,201.3,4.1,0.88,7.330,201.5
+5.3,0.87,7.750,201.5,5.1,0.87,7.890,201.8
+6.2,0.87,7.830,200.9,6.0,0.87,7.980,201.3
+6.3,0.87,7.830,192.5,6.1,0.87,8.160,193.4
+6.2,0.87,9.860,187.1,6.1,0.87,10.180,189.0
+5.6,0.87,10.210,183.3,5.8,0.87,10.950,187.5
+5.0,0.87,11.140,182.6,5.3,0.87,11.770,186.3
+4.6,0.87,11.880,188.9,5.0,0.87,12.610,193.1
+4.1,0.87,12.680,192.9,4.4,0.87,13.450,196.3
+3.4,0.87,12.570,195.6,3.8,0.87,13.400,200.0
+3.3,0.87,12.570,200.6,3.6,0.87,13.440,204.9
+3.5,0.87,12.630,203.3,3.7,0.87,13.490,207.4
+3.5,0.87,11.780,199.1,3.6,0.87,12.590,203.6
+3.5,0.87,10.860,205.4,3.6,0.87,11.860,210.8
+3.4,0.87,10.260,206.6,3.5,0.87,11.130,212.1
+3.5,0.87,10.290,212.9,3.7,0.87,11.200,217.6
+4.0,0.87,9.640,221.2,4.2,0.87,10.450,226.1
+4.2,0.87,8.690,220.2,4.4,0.87,9.290,225.5
+3.0,0.87,4.080,300.7,2.9,0.87,4.140,298.9
+1.3,0.87,5.620,318.2,1.1,0.87,5.550,319.1
+0.3,0.87,6.300,339.6,0.1,0.87,6.270,339.7
+-0.1,0.87,5.110,350.2,-0.3,0.87,5.100,350.2
+-0.1,0.87,3.600,353.8,-0.3,0.87,3.610,353.5
+0.8,0.87,3.180,8.6,0.6,0.87,3.220,8.5
+2.3,0.87,2.790,11.7,2.1,0.87,2.840,11.7
+3.2,0.87,3.930,19.0,3.0,0.87,3.960,18.9
+3.5,0.87,5.730,18.4,3.2,0.87,5.780,18.3
+3.4,0.87,6.790,21.2,3.2,0.87,6.850,21.0
+1.7,0.87,7.800,16.6,1.5,0.87,8.010,16.5
+1.0,0.87,6.040,19.9,0.8,0.87,6.120,20.0
+0.8,0.87,4.510,22.0,0.6,0.87,4.630,21.9
+0.7,0.87,3.890,357.9,0.5,0.87,4.190,0.8
+0.7,0.87,3.700,340.6,0.6,0.87,3.920,348.5
+1.0,0.87,4.670,348.5,1.0,0.87,4.830,352.6
+1.3,0.87,5.030,335.7,1.4,0.87,5.210,341.1
+1.5,0.87,6.290,318.1,1.6,0.87,6.500,323.8
+1.8,0.87,8.620,315.8,1.9,0.87,8.860,322.1
+1.7,0.87,9.420,315.5,2.0,0.87,9.690,321.0
+1.8,0.87,8.990,317.2,2.0,0.87,8.970,324.2
+1.1,0.87,9.350,322.4,1.4,0.87,9.520,328.8
+1.7,0.87,8.270,347.1,1.5,0.87,8.570,353.4
+0.9,0.87,7.870,0.1,0.7,0.87,7.700,7.7
+0.2,0.87,6.470,354.0,0.1,0.87,6.370,3.0
+-0.0,0.87,4.840,359.4,-0.2,0.87,4.980,1.2
+0.8,0.87,3.820,349.9,0.6,0.87,3.870,350.2
+1.7,0.87,4.170,3.9,1.5,0.87,4.200,4.0
+2.9,0.87,3.070,355.4,2.6,0.87,3.090,355.4
+3.9,0.87,2.340,5.5,3.7,0.87,2.340,6.0
+4.9,0.87,0.880,8.3,4.7,0.87,0.870,11.2
+5.8,0.87,0.420,335.6,5.6,0.87,0.340,335.6
+6.5,0.87,0.890,101.7,6.3,0.87,0.900,107.3
+6.8,0.87,3.200,143.8,6.6,0.87,3.200,144.6
+6.6,0.87,5.190,126.4,6.4,0.87,5.270,128.0
+6.0,0.87,7.570,130.2,6.0,0.87,7.850,131.1
+4.1,0.87,10.270,130.6,4.0,0.87,10.960,130.8
+2.2,0.87,10.640,130.2,2.1,0.87,11.400,129.9
+1.0,0.87,9.900,129.6,0.8,0.87,10.570,129.5
+-0.7,0.87,8.150,121.1,-0.8,0.87,8.770,121.0
+-1.9,0.87,7.630,116.4,-2.1,0.87,8.270,116.3
+-2.7,0.88,6.930,114.3,-2.9,0.88,7.530,114.4
+-3.4,0.88,7.430,109.7,-3.6,0.88,7.960,110.2
+-4.3,0.88,7.690,109.2,-4.5,0.88,8.030,109.3
+-4.8,0.88,5.480,102.5,-5.0,0.88,5.680,102.3
+-5.3,0.88,5.920,98.2,-5.5,0.88,6.070,98.2
+-5.8,0.88,5.940,96.4,-6.0,0.88,6.030,96.4
+-6.6,0.88,6.300,71.9,-6.8,0.88,6.370,72.5
+-7.0,0.88,6.620,68.1,-7.2,0.88,6.660,68.6
+-7.3,0.88,6.110,74.9,-7.5,0.88,6.140,75.2
+-7.0,0.88,5.700,70.6,-7.3,0.88,5.710,70.9
+-6.3,0.88,5.080,70.9,-6.5,0.88,5.100,71.2
+-5.3,0.88,4.530,75.5,-5.5,0.88,4.550,75.8
+-4.4,0.88,4.190,86.0,-4.6,0.88,4.210,86.5
+-3.5,0.88,4.150,95.2,-3.7,0.88,4.190,95.5
+-2.9,0.88,4.640,109.6,-3.1,0.88,4.670,109.7
+-2.7,0.88,5.420,112.1,-2.9,0.88,5.470,112.2
+-2.8,0.88,5.530,113.4,-3.0,0.88,5.590,113.6
+-3.3,0.88,6.670,110.3,-3.5,0.88,6.840,110.4
+-4.0,0.88,6.290,129.3,-4.2,0.88,6.540,129.6
+-4.7,0.88,7.130,130.1,-4.9,0.88,7.300,130.6
+-5.4,0.88,7.570,141.8,-5.6,0.88,7.730,141.8
+-5.9,0.88,7.850,145.7,-6.2,0.88,8.010,145.7
+-6.4,0.88,7.780,152.0,-6.6,0.88,7.910,151.9
+-6.8,0.88,7.990,154.9,-7.0,0.88,8.140,155.1
+-6.9,0.88,8.360,161.7,-7.1,0.88,8.510,161.8
+-7.1,0.88,8.300,162.1,-7.3,0.88,8.430,162.3
+-7.1,0.88,8.450,166.4,-7.4,0.88,8.610,166.8
+-7.2,0.88,8.560,168.8,-7.4,0.88,8.770,169.1
+-7.3,0.88,8.940,174.7,-7.5,0.88,9.170,175.0
+-7.4,0.88,9.400,177.8,-7.6,0.88,9.660,178.3
+-7.4,0.88,10.070,181.9,-7.6,0.88,10.390,182.2
+-7.4,0.87,10.220,183.2,-7.6,0.87,10.470,183.5
+-6.9,0.87,9.870,184.5,-7.1,0.87,9.980,184.7
+-5.6,0.87,9.360,188.0,-5.9,0.87,9.490,188.2
+-4.2,0.87,9.630,190.8,-4.5,0.87,9.790,190.9
+-3.1,0.87,10.110,203.9,-3.4,0.87,10.290,203.9
+-5.5,0.87,9.740,193.9,-5.8,0.87,9.900,194.0
+-5.4,0.87,9.330,193.0,-5.6,0.87,9.500,193.3
+-5.2,0.87,8.490,188.6,-5.4,0.87,8.660,189.0
+-5.1,0.87,10.040,191.4,-5.3,0.87,10.230,191.8
+-4.9,0.87,10.140,186.2,-5.1,0.87,10.410,186.7
+-5.0,0.87,10.300,183.6,-5.2,0.87,10.800,184.2
+-5.0,0.87,13.200,187.8,-5.2,0.87,13.720,188.5
+-5.5,0.87,14.930,188.7,-5.6,0.87,15.580,189.2
+-5.4,0.87,15.400,192.3,-5.6,0.87,16.040,192.8
+-5.2,0.86,13.190,197.7,-5.3,0.86,13.850,198.3
+-5.2,0.86,14.790,199.3,-5.3,0.86,15.530,200.1
+-5.1,0.86,14.200,201.1,-5.2,0.86,14.990,202.3
+-5.1,0.86,15.150,200.5,-5.2,0.86,15.950,201.8
+-4.6,0.86,15.660,205.7,-4.7,0.86,16.550,206.9
+-4.1,0.86,16.340,210.1,-4.2,0.86,17.230,211.1
+-3.5,0.86,16.500,214.7,-3.6,0.86,17.480,216.0
+-2.9,0.86,15.040,223.2,-2.9,0.86,16.060,224.7
+-2.3,0.86,14.340,226.4,-2.2,0.86,15.430,228.4
+-1.4,0.86,15.420,228.7,-1.1,0.86,16.470,231.4
+1.0,0.86,15.610,236.8,1.4,0.86,16.800,239.7
+4.1,0.86,15.990,251.7,4.1,0.86,16.810,252.8
+6.5,0.86,13.490,257.5,6.4,0.86,14.340,258.2
+8.3,0.86,12.320,267.1,8.1,0.86,12.540,267.2
+9.6,0.86,11.480,282.1,9.4,0.86,11.660,282.1
+10.4,0.86,10.370,288.6,10.2,0.86,10.510,288.6
+11.0,0.86,8.200,289.3,10.8,0.86,8.340,289.2
+11.8,0.86,7.250,299.3,11.6,0.86,7.390,299.0
+11.8,0.86,5.540,319.4,11.7,0.86,5.790,318.0
+11.6,0.86,3.540,344.8,11.5,0.86,3.820,339.2
+10.2,0.86,2.250,57.3,10.2,0.86,2.350,48.2
+9.8,0.86,3.420,79.3,9.8,0.86,3.470,73.3
+9.1,0.86,4.260,111.0,9.2,0.86,3.800,110.0
+6.9,0.86,7.160,145.3,7.3,0.86,7.370,143.8
+7.4,0.86,8.050,162.2,7.8,0.86,8.300,165.8
+7.8,0.86,5.760,186.5,8.1,0.86,5.270,193.6
+6.8,0.86,4.320,198.6,7.4,0.86,4.070,211.2
+7.3,0.86,4.820,209.3,7.6,0.86,4.470,216.7
+6.9,0.86,2.620,225.8,6.7,0.86,2.670,227.9
+5.5,0.86,8.920,255.7,6.6,0.86,10.360,265.9
+7.3,0.86,8.540,285.4,7.6,0.86,9.580,287.6
+6.5,0.86,8.670,288.3,6.9,0.86,9.430,286.8
+5.4,0.86,3.530,271.6,5.7,0.86,4.230,274.8
+5.0,0.86,7.870,259.1,6.6,0.86,10.000,258.9
+5.1,0.86,6.470,249.5,6.5,0.86,7.960,252.2
+7.3,0.86,7.000,240.4,7.9,0.86,8.060,241.7
+9.8,0.86,7.450,235.9,9.8,0.86,8.130,236.5
+10.6,0.86,5.580,235.1,10.4,0.86,5.630,236.2
+12.3,0.86,5.880,238.3,12.1,0.86,5.970,238.8
+13.3,0.86,5.450,237.0,13.1,0.86,5.540,237.2
+14.6,0.86,7.150,231.4,14.4,0.86,7.320,231.4
+14.8,0.86,7.170,224.0,14.6,0.86,7.330,224.1
+14.8,0.86,6.650,201.0,14.6,0.86,6.790,201.5
+14.7,0.86,5.910,235.2,14.6,0.86,6.250,236.1
+14.1,0.86,8.480,244.5,14.0,0.86,9.030,246.5
+12.9,0.86,8.560,248.3,12.9,0.86,9.790,253.1
+11.8,0.86,8.900,246.8,12.0,0.86,9.910,252.8
+10.0,0.86,9.780,233.5,10.8,0.86,11.040,239.0
+11.0,0.86,11.030,229.9,11.4,0.86,11.670,231.2
+9.7,0.86,9.360,234.5,9.8,0.86,9.840,231.1
+10.2,0.86,12.360,229.9,10.6,0.86,12.980,233.0
+8.0,0.86,14.130,236.8,8.8,0.86,15.440,238.8
+8.1,0.86,13.540,230.3,8.5,0.86,14.830,233.2
+7.3,0.86,14.280,230.5,7.8,0.86,15.410,232.6
+6.7,0.86,14.720,237.4,7.1,0.86,15.690,238.7
+5.8,0.86,13.800,231.2,6.4,0.86,14.820,232.8
+4.7,0.86,13.060,231.7,5.0,0.86,14.390,233.0
+3.4,0.86,13.150,224.6,3.7,0.86,14.450,226.8
+1.9,0.86,11.700,220.6,2.2,0.86,13.020,224.6
+3.4,0.86,10.040,229.4,3.2,0.86,10.810,231.3
+4.6,0.86,10.780,247.3,4.4,0.86,11.010,247.6
+6.1,0.86,11.510,279.1,5.9,0.86,11.650,279.1
+6.2,0.86,10.570,302.7,6.0,0.86,10.660,302.6
+6.4,0.86,10.670,318.0,6.2,0.86,10.800,318.1
+7.0,0.86,10.980,335.4,6.8,0.86,11.120,335.4
+5.3,0.87,11.600,342.5,5.0,0.87,11.700,342.4
+4.9,0.87,8.640,341.0,4.7,0.87,8.760,341.1
+5.4,0.87,7.170,354.6,5.2,0.87,7.300,354.5
+5.2,0.87,8.800,15.4,5.0,0.87,9.160,15.0
+3.2,0.87,8.560,33.7,3.0,0.87,9.330,33.5
+2.1,0.87,7.240,43.0,2.0,0.87,8.370,43.3
+2.2,0.87,7.480,43.1,2.2,0.87,8.880,43.0
+1.7,0.87,7.820,40.6,1.8,0.87,9.190,40.7
+1.3,0.87,8.310,43.9,1.4,0.87,9.490,44.0
+0.8,0.87,7.070,44.1,0.8,0.87,8.050,44.2
+-0.5,0.87,6.510,43.6,-0.5,0.87,7.150,43.3
+-0.8,0.87,5.960,42.8,-0.8,0.87,6.800,45.6
+-1.0,0.87,6.070,43.6,-0.9,0.87,7.010,45.5
+-1.3,0.87,5.580,41.6,-1.2,0.87,6.440,43.4
+-1.4,0.87,5.460,49.3,-1.4,0.87,6.290,51.4
+-1.6,0.87,5.150,33.7,-1.6,0.87,5.820,38.1
+-1.8,0.87,4.980,19.3,-1.9,0.87,5.140,22.0
+-2.1,0.87,4.700,18.3,-2.1,0.87,4.650,19.7
+-2.2,0.87,3.400,34.0,-2.2,0.87,3.600,36.6
+-2.0,0.87,1.760,22.8,-2.1,0.87,2.180,31.5
+-1.1,0.87,0.970,36.3,-1.2,0.87,1.010,42.2
+1.0,0.87,1.420,117.8,0.8,0.87,1.510,121.2
+3.5,0.87,3.180,141.7,3.3,0.87,3.200,142.8
+5.1,0.87,4.060,156.5,4.9,0.87,4.100,157.1
+5.7,0.87,2.420,146.2,5.4,0.87,2.440,147.1
+6.1,0.87,2.780,163.4,5.9,0.87,2.790,164.3
+6.5,0.87,4.350,152.4,6.3,0.87,4.430,152.7
+6.3,0.87,4.690,148.8,6.1,0.87,4.730,149.6
+5.6,0.87,6.650,153.3,5.7,0.87,6.530,155.0
+5.5,0.87,7.770,157.1,5.7,0.87,7.500,159.4
+5.1,0.87,9.420,161.8,5.5,0.87,9.600,162.8
+4.8,0.87,10.120,162.1,5.0,0.87,10.240,163.6
+4.8,0.87,7.910,166.1,5.1,0.87,7.910,169.2
+5.0,0.87,8.710,171.0,5.6,0.87,8.750,174.0
+4.4,0.87,8.440,179.7,5.0,0.87,8.700,180.7
+2.3,0.87,4.610,198.0,2.8,0.87,5.410,194.4
+1.7,0.87,4.110,215.3,2.2,0.87,4.980,210.7
+1.9,0.87,2.060,230.5,2.1,0.87,2.530,225.3
+2.6,0.87,3.040,216.3,2.9,0.87,3.300,214.6
+2.2,0.87,3.090,239.3,2.6,0.87,3.400,236.5
+3.5,0.87,3.670,267.3,3.5,0.87,3.760,269.8
+4.9,0.87,2.660,282.2,4.9,0.87,2.800,284.6
+5.6,0.87,3.020,229.6,5.5,0.87,2.940,232.6
+3.8,0.87,5.380,216.7,4.0,0.87,5.960,219.5
+3.3,0.87,8.680,216.2,3.1,0.87,8.740,216.3
+3.0,0.87,5.320,219.2,2.8,0.87,5.330,219.2
+4.0,0.87,2.250,199.7,3.9,0.87,2.300,198.8
+5.7,0.87,2.260,184.7,5.5,0.87,2.330,184.5
+6.7,0.87,3.370,178.1,6.4,0.87,3.430,179.3
+6.6,0.87,5.350,179.8,6.4,0.87,5.420,180.0
+6.9,0.87,5.860,180.7,6.7,0.87,5.950,181.2
+6.4,0.87,5.810,179.7,6.2,0.87,6.020,180.2
+5.9,0.87,5.680,178.3,5.7,0.87,5.960,178.5
+5.3,0.87,6.690,183.9,5.1,0.87,7.000,185.2
+4.5,0.87,6.770,190.6,4.4,0.87,7.000,192.2
+3.9,0.87,6.640,185.7,4.1,0.87,6.850,189.9
+3.6,0.87,6.020,185.3,4.0,0.87,6.200,188.2
+3.1,0.87,5.070,197.0,4.1,0.87,5.120,198.1
+3.2,0.87,4.520,226.4,4.0,0.87,4.230,229.1
+3.7,0.87,2.900,302.9,3.8,0.87,3.250,312.4
+3.6,0.87,2.870,20.1,3.8,0.87,3.540,13.7
+3.0,0.87,2.960,103.6,3.2,0.87,3.110,91.9
+2.5,0.87,1.460,8.4,2.6,0.87,1.640,22.9
+2.9,0.87,2.160,18.8,3.0,0.87,2.320,26.0
+3.2,0.87,5.880,18.9,3.1,0.87,6.240,19.9
+0.4,0.87,8.620,15.3,0.2,0.87,8.810,15.6
+-0.3,0.87,7.850,15.3,-0.5,0.87,7.990,15.8
+-0.7,0.87,7.570,13.3,-0.9,0.87,7.640,13.7
+-0.8,0.87,7.700,17.3,-1.1,0.87,7.770,17.3
+-0.6,0.87,6.660,17.6,-0.8,0.87,6.720,17.8
+-0.2,0.87,6.370,19.8,-0.4,0.87,6.410,19.8
+0.2,0.87,5.540,15.5,0.0,0.87,5.580,15.6
+0.4,0.87,5.200,3.4,0.2,0.87,5.210,3.8
+0.6,0.87,4.150,11.8,0.4,0.87,4.170,11.9
+0.6,0.87,3.240,10.3,0.4,0.87,3.240,10.4
+0.4,0.87,2.540,12.9,0.2,0.87,2.550,13.2
+0.3,0.87,1.340,16.0,0.2,0.87,1.420,17.1
+0.5,0.87,0.300,327.2,0.5,0.87,0.410,343.7
+0.6,0.87,0.890,181.0,0.6,0.87,0.770,179.2
+0.9,0.87,2.340,196.6,0.9,0.87,2.240,198.1
+1.1,0.87,4.140,193.1,1.3,0.87,4.150,198.0
+0.9,0.87,5.690,190.8,1.2,0.87,5.690,195.2
+1.1,0.87,7.030,192.3,1.4,0.87,7.010,197.4
+0.8,0.87,8.400,196.1,1.2,0.87,8.510,200.3
+0.7,0.87,10.190,200.1,1.1,0.87,10.720,202.8
+-0.0,0.87,10.690,200.7,0.1,0.87,11.380,202.5
+-0.2,0.87,9.930,200.3,-0.2,0.87,10.450,202.5
+-0.1,0.87,10.000,200.4,-0.1,0.87,10.550,202.1
+-0.1,0.87,10.710,202.3,-0.1,0.87,11.280,203.8
+0.0,0.87,10.820,199.4,0.0,0.87,11.410,201.0
+0.4,0.87,12.350,199.0,0.3,0.87,13.000,200.3
+1.1,0.87,11.680,202.5,1.0,0.87,12.490,203.2
+1.6,0.87,10.170,196.1,1.5,0.87,10.530,197.1
+1.8,0.87,10.860,192.3,1.7,0.87,11.150,192.8
+2.1,0.86,12.670,195.3,1.9,0.86,12.980,195.7
+2.7,0.86,12.420,194.0,2.4,0.86,12.620,194.2
+3.7,0.86,10.550,182.1,3.5,0.86,10.700,182.3
+5.8,0.86,10.840,176.7,5.6,0.86,11.000,177.1
+5.4,0.86,9.910,171.7,5.2,0.86,10.250,172.3
+5.3,0.86,12.550,180.3,5.3,0.86,13.670,181.4
+5.4,0.86,13.150,182.0,5.5,0.86,14.100,182.3
+5.4,0.86,15.890,178.9,5.4,0.86,17.130,179.9
+3.6,0.86,12.210,173.6,3.7,0.86,12.900,176.1
+2.7,0.86,11.360,176.7,2.7,0.86,12.210,177.7
+3.4,0.86,11.370,176.3,3.2,0.86,12.000,177.4
+3.1,0.86,10.510,179.4,3.1,0.86,11.160,181.7
+3.4,0.86,10.890,181.5,3.4,0.86,11.640,183.8
+3.0,0.86,10.050,200.0,3.0,0.86,10.920,201.5
+3.1,0.86,11.870,214.9,3.1,0.86,12.710,215.8
+3.0,0.86,11.960,216.6,3.0,0.86,12.920,219.7
+4.6,0.86,13.770,235.5,4.9,0.86,14.960,237.6
+4.0,0.86,13.650,237.3,4.3,0.86,14.840,240.5
+4.2,0.86,15.630,250.7,4.5,0.86,17.200,253.1
+3.8,0.86,14.630,253.9,3.9,0.86,15.880,255.0
+4.6,0.86,15.860,262.4,4.5,0.86,16.470,262.8
+4.7,0.86,17.360,266.7,4.5,0.86,17.700,266.8
+4.9,0.86,15.980,271.0,4.7,0.86,16.270,271.0
+5.2,0.86,17.730,271.5,5.0,0.86,18.060,271.5
+5.9,0.86,16.770,283.6,5.6,0.86,17.080,283.8
+7.0,0.86,14.830,296.4,6.8,0.86,15.100,296.5
+7.0,0.86,11.960,327.7,6.7,0.86,12.120,327.5
+7.6,0.86,9.840,318.4,7.3,0.86,10.010,318.3
+7.9,0.87,8.410,320.6,7.7,0.87,8.560,320.4
+7.9,0.87,6.450,336.8,7.8,0.87,6.960,337.5
+7.5,0.87,6.090,348.9,7.4,0.87,6.370,348.4
+6.8,0.87,1.470,337.3,6.8,0.87,1.790,343.7
+5.5,0.87,3.670,209.1,5.8,0.87,2.890,212.8
+5.7,0.87,6.250,238.1,5.9,0.87,5.920,234.9
+5.4,0.87,12.430,267.8,5.9,0.87,13.330,271.8
+4.1,0.87,9.330,271.3,4.6,0.87,10.550,276.3
+4.2,0.87,10.360,270.1,5.0,0.87,11.070,275.1
+5.5,0.87,9.570,282.4,5.8,0.87,9.660,289.8
+4.3,0.87,8.040,267.6,5.1,0.87,8.100,273.4
+3.7,0.87,8.850,249.0,4.9,0.87,8.830,255.5
+4.5,0.87,8.670,248.1,5.5,0.87,8.700,252.4
+4.2,0.87,10.100,251.4,5.4,0.87,10.820,258.9
+2.7,0.87,9.330,236.2,3.1,0.87,9.790,241.8
+3.8,0.87,12.130,255.0,4.6,0.87,13.600,259.9
+5.9,0.87,11.740,262.1,5.9,0.87,12.340,263.3
+7.5,0.87,8.960,256.5,7.3,0.87,9.440,258.3
+9.4,0.87,11.600,253.6,9.2,0.87,11.760,254.2
+10.8,0.87,11.770,264.6,10.6,0.87,11.940,264.8
+12.0,0.87,10.940,272.5,11.7,0.87,11.120,272.6
+12.7,0.87,12.710,278.2,12.5,0.87,12.920,278.3
+13.1,0.87,10.720,281.8,12.9,0.87,10.900,281.7
+13.6,0.87,9.770,276.7,13.4,0.87,9.980,276.6
+13.7,0.86,9.810,270.6,13.6,0.86,10.130,270.8
+13.5,0.86,7.810,260.6,13.4,0.86,8.360,262.5
+12.7,0.86,11.960,261.1,12.8,0.86,12.940,264.0
+11.8,0.86,14.360,265.7,12.0,0.86,15.570,267.7
+10.1,0.86,15.040,267.3,10.4,0.86,16.820,269.9
+9.5,0.86,14.100,271.9,9.9,0.86,15.720,274.7
+9.0,0.86,13.080,276.7,9.4,0.86,14.650,279.6
+9.5,0.86,13.780,281.6,10.0,0.86,14.800,284.6
+9.2,0.86,13.870,281.7,9.8,0.86,14.780,286.0
+9.5,0.86,12.460,282.0,10.2,0.86,13.380,286.3
+9.2,0.86,10.910,289.3,9.6,0.86,12.010,292.1
+7.9,0.86,8.990,289.0,8.5,0.86,10.350,292.5
+8.6,0.86,11.020,294.8,9.2,0.86,12.140,297.8
+9.1,0.86,13.810,299.4,9.4,0.86,14.520,301.6
+9.3,0.86,13.830,301.8,9.6,0.86,14.280,303.6
+8.9,0.86,13.470,301.2,9.2,0.86,13.900,303.4
+9.1,0.86,11.080,299.8,9.2,0.86,11.610,301.2
+10.4,0.86,7.960,295.2,10.3,0.86,8.830,296.2
+12.8,0.86,6.690,294.2,12.6,0.86,6.760,294.0
+14.9,0.86,5.720,293.9,14.7,0.86,5.780,293.6
+16.6,0.86,5.700,283.8,16.4,0.86,5.750,283.9
+17.7,0.86,5.240,273.3,17.5,0.86,5.310,273.3
+18.7,0.86,5.880,255.8,18.5,0.86,5.960,255.7
+19.4,0.86,6.380,238.3,19.2,0.86,6.510,238.5
+19.5,0.86,7.900,232.8,19.3,0.86,8.160,233.0
+19.3,0.86,9.060,224.6,19.3,0.86,9.800,228.8
+18.1,0.86,12.820,231.4,18.3,0.86,13.440,234.7
+15.7,0.86,12.540,237.9,15.9,0.86,13.800,242.0
+13.6,0.85,13.060,236.0,13.7,0.85,14.280,240.2
+12.7,0.85,13.760,256.3,13.0,0.85,15.100,260.1
+13.3,0.85,14.760,265.9,13.6,0.85,16.200,268.4
+13.8,0.85,16.550,275.6,14.0,0.85,17.940,276.9
+13.6,0.85,17.650,278.2,13.8,0.85,19.050,279.4
+13.3,0.85,15.470,277.1,13.5,0.85,16.700,279.1
+12.3,0.85,11.410,284.7,12.6,0.85,13.100,285.1
+13.3,0.85,14.200,292.7,13.6,0.85,15.760,292.4
+11.1,0.85,7.950,302.6,11.4,0.85,9.770,299.5
+9.8,0.85,5.510,324.1,10.2,0.85,6.910,316.2
+8.6,0.86,11.350,344.7,8.8,0.86,12.190,341.1
+12.7,0.86,10.940,300.2,13.0,0.86,10.950,303.6
+11.3,0.86,10.310,290.9,11.5,0.86,10.220,293.5
+11.1,0.86,11.250,340.2,10.8,0.86,11.390,340.6
+8.6,0.86,10.420,3.4,8.3,0.86,10.540,3.5
+9.2,0.86,10.930,356.8,8.9,0.86,11.110,356.6
+9.4,0.86,10.810,2.8,9.1,0.86,10.970,2.6
+9.7,0.86,11.270,5.1,9.5,0.86,11.440,4.9
+9.4,0.86,12.080,5.7,9.2,0.86,12.250,5.6
+9.0,0.86,11.860,1.7,8.7,0.86,12.070,1.8
+8.3,0.86,12.030,5.9,8.1,0.86,12.250,5.8
+6.9,0.86,12.690,12.7,6.7,0.86,12.990,12.7
+6.1,0.86,12.440,10.3,5.9,0.86,12.760,10.2
+5.2,0.86,11.740,10.8,5.0,0.86,12.160,11.0
+4.2,0.87,11.310,4.7,4.1,0.87,12.090,5.6
+3.5,0.87,10.730,1.1,3.3,0.87,11.470,2.1
+3.0,0.87,10.520,2.3,2.9,0.87,11.270,3.3
+2.3,0.87,10.100,359.8,2.2,0.87,10.930,1.3
+1.3,0.87,9.100,350.9,1.3,0.87,10.010,352.3
+1.0,0.87,9.440,343.9,1.0,0.87,10.710,349.7
+0.4,0.87,9.220,341.1,0.4,0.87,10.310,345.7
+-0.3,0.87,8.310,334.4,-0.2,0.87,9.350,340.1
+-0.8,0.87,7.660,333.8,-0.5,0.87,8.900,341.6
+-0.6,0.87,7.320,332.4,-0.3,0.87,8.240,341.2
+-0.5,0.87,6.320,336.6,-0.5,0.87,6.790,345.2
+-0.8,0.87,4.310,327.1,-0.8,0.87,4.710,339.1
+-0.1,0.87,2.570,313.4,-0.3,0.87,2.630,314.7
+1.2,0.87,3.460,305.6,1.0,0.87,3.500,305.7
+2.5,0.87,4.320,304.5,2.3,0.87,4.380,304.3
+3.9,0.87,4.580,298.1,3.7,0.87,4.650,297.9
+4.8,0.87,5.420,309.6,4.6,0.87,5.470,309.5
+5.5,0.87,5.020,310.5,5.3,0.87,5.070,310.3
+6.0,0.87,4.310,313.9,5.8,0.87,4.350,313.3
+6.4,0.87,4.510,302.5,6.2,0.87,4.550,301.9
+6.8,0.87,3.990,275.4,6.6,0.87,4.050,275.5
+6.9,0.87,4.490,279.9,6.7,0.87,4.540,280.2
+6.9,0.87,2.500,281.4,6.7,0.87,2.550,281.5
+6.8,0.87,1.800,268.4,6.7,0.87,1.920,270.0
+7.0,0.87,1.870,223.6,6.8,0.87,1.960,219.9
+6.0,0.87,4.620,199.7,6.0,0.87,4.650,202.0
+5.8,0.87,5.890,205.6,6.0,0.87,5.990,208.2
+5.8,0.87,6.780,207.0,6.1,0.87,7.040,207.6
+5.3,0.87,10.090,202.5,5.6,0.87,10.540,202.0
+4.9,0.87,11.920,205.9,5.3,0.87,12.770,205.5
+3.9,0.87,12.890,205.5,4.3,0.87,13.900,205.7
+3.4,0.87,13.150,214.1,4.2,0.87,14.070,217.2
+3.2,0.87,13.590,217.2,3.9,0.87,14.820,219.5
+2.5,0.87,13.850,214.2,3.1,0.87,15.110,216.0
+2.0,0.87,14.950,213.1,2.6,0.87,16.390,214.1
+2.0,0.87,15.900,211.5,2.1,0.87,17.050,212.5
+3.7,0.87,14.110,210.6,3.6,0.87,15.140,211.3
+5.4,0.87,14.620,206.1,5.1,0.87,14.890,206.4
+7.3,0.87,15.090,206.7,7.1,0.87,15.370,206.9
+9.1,0.87,15.630,207.1,8.9,0.87,15.930,207.2
+10.4,0.87,16.250,206.8,10.1,0.87,16.560,207.0
+11.2,0.87,16.510,206.7,10.9,0.87,16.830,206.9
+11.9,0.87,16.310,206.6,11.7,0.87,16.650,206.8
+12.2,0.87,16.950,207.4,11.9,0.87,17.310,207.6
+12.2,0.87,16.330,205.9,12.0,0.87,16.720,206.0
+11.4,0.87,13.700,197.2,11.3,0.87,14.500,198.2
+10.0,0.87,14.530,198.7,10.1,0.87,15.720,199.9
+9.4,0.87,14.880,201.2,9.4,0.87,16.070,202.3
+9.2,0.86,16.980,207.6,9.3,0.86,18.190,208.2
+8.5,0.86,15.700,208.8,8.6,0.86,16.990,210.0
+8.4,0.86,15.530,211.9,8.5,0.86,16.850,212.7
+7.5,0.86,15.540,211.2,7.6,0.86,17.080,212.4
+6.8,0.86,15.430,218.4,7.0,0.86,16.910,219.4
+6.7,0.86,16.150,222.1,7.1,0.86,17.480,223.7
+7.0,0.86,14.990,228.2,7.7,0.86,16.420,230.4
+7.7,0.86,14.570,233.1,8.8,0.86,15.870,235.9
+9.1,0.86,14.780,239.0,10.4,0.86,15.830,241.8
+9.7,0.86,14.000,244.2,10.9,0.86,15.160,247.1
+9.0,0.86,12.600,247.8,10.5,0.86,13.730,251.7
+9.2,0.86,11.290,251.5,10.4,0.86,12.250,255.7
+6.2,0.87,5.260,350.1,6.4,0.87,5.490,344.2
+7.3,0.87,4.220,343.4,7.2,0.87,4.340,342.0
+7.9,0.87,5.600,19.0,7.7,0.87,5.560,18.9
+9.2,0.87,5.460,45.0,9.0,0.87,5.460,45.0
+10.4,0.87,5.030,52.2,10.2,0.87,5.040,52.6
+11.1,0.87,5.150,56.2,10.9,0.87,5.140,56.7
+11.8,0.87,5.690,62.7,11.6,0.87,5.690,63.4
+12.0,0.87,5.660,69.7,11.8,0.87,5.680,70.2
+11.8,0.87,6.700,69.5,11.6,0.87,6.750,69.9
+11.6,0.87,6.720,75.6,11.4,0.87,6.970,76.3
+10.6,0.87,8.590,80.2,10.4,0.87,9.030,81.0
+8.5,0.87,8.280,73.0,8.4,0.87,9.010,74.1
+7.3,0.87,10.800,70.2,7.2,0.87,11.850,70.7
+6.5,0.87,11.170,67.9,6.4,0.87,12.330,68.4
+5.8,0.87,11.130,65.6,5.8,0.87,12.340,66.2
+5.4,0.87,10.620,66.8,5.4,0.87,11.710,67.2
+5.1,0.87,11.020,64.3,5.0,0.87,12.010,64.9
+3.8,0.87,8.000,48.3,3.8,0.87,9.020,50.9
+2.3,0.87,8.210,49.2,2.3,0.87,9.320,52.0
+1.6,0.87,8.180,51.3,1.5,0.87,9.200,53.8
+1.6,0.87,10.380,65.3,1.4,0.87,11.120,66.4
+1.3,0.87,8.830,68.3,1.3,0.87,9.700,70.0
+2.4,0.87,8.370,74.9,2.3,0.87,9.090,76.1
+1.8,0.87,5.740,71.1,1.9,0.87,6.970,75.6
+1.7,0.87,6.080,78.8,1.7,0.87,6.700,81.3
+3.2,0.87,7.390,90.9,3.0,0.87,7.560,91.5
+4.1,0.87,8.100,101.0,3.9,0.87,8.240,101.3
+4.1,0.87,7.690,108.6,3.9,0.87,7.810,109.0
+3.9,0.87,7.080,113.3,3.7,0.87,7.180,113.6
+4.1,0.87,6.080,119.2,3.9,0.87,6.170,119.5
+4.3,0.87,5.470,126.4,4.1,0.87,5.560,126.6
+4.4,0.87,5.340,127.7,4.2,0.87,5.420,128.0
+4.3,0.87,4.500,135.9,4.1,0.87,4.570,136.0
+4.3,0.87,3.720,133.2,4.1,0.87,3.780,133.2
+4.3,0.87,4.640,144.6,4.2,0.87,5.200,144.7
+4.2,0.87,5.710,158.6,4.1,0.87,6.420,156.5
+4.1,0.87,6.390,149.6,4.0,0.87,6.950,148.8
+4.1,0.87,7.890,156.9,4.0,0.87,8.480,156.4
+4.2,0.87,9.200,156.8,4.3,0.87,9.970,156.3
+4.6,0.87,9.880,160.2,4.7,0.87,10.690,159.9
+5.7,0.87,12.020,162.4,5.8,0.87,12.730,161.8
+5.6,0.87,10.930,156.9,5.7,0.87,11.720,156.9
+6.6,0.87,10.950,155.2,6.6,0.87,11.590,155.8
+7.7,0.87,10.690,160.2,7.7,0.87,11.370,160.8
+8.8,0.87,11.680,164.0,8.7,0.87,12.320,164.5
+9.1,0.86,12.160,166.3,9.0,0.86,12.840,167.0
+9.8,0.86,12.930,170.4,9.7,0.86,13.480,171.0
+10.0,0.86,11.940,173.9,9.9,0.86,12.550,174.0
+10.6,0.86,11.930,182.8,10.5,0.86,12.680,183.2
+12.9,0.86,12.970,201.1,12.7,0.86,13.300,201.3
+14.0,0.86,14.550,214.0,13.8,0.86,14.870,214.1
+15.2,0.86,12.630,223.9,14.9,0.86,12.900,224.1
+16.5,0.86,14.890,234.8,16.3,0.86,15.260,234.8
+16.5,0.86,15.600,241.3,16.3,0.86,15.980,241.2
+16.0,0.86,16.140,248.6,15.8,0.86,16.510,248.4
+15.4,0.86,17.530,248.5,15.2,0.86,17.990,248.5
+15.0,0.86,15.270,253.8,14.8,0.86,15.710,254.1
+13.6,0.86,12.920,262.0,13.5,0.86,13.810,262.0
+11.3,0.86,14.420,273.7,11.2,0.86,15.660,274.0
+10.0,0.87,15.550,279.8,9.9,0.87,16.490,279.9
+8.6,0.87,13.470,270.9,8.6,0.87,14.780,272.1
+7.9,0.87,14.030,268.2,7.9,0.87,15.320,269.9
+7.3,0.87,14.810,264.8,7.4,0.87,16.090,267.1
+12.7,0.86,16.630,253.7,13.1,0.86,17.770,255.0
+11.8,0.86,13.550,256.8,12.2,0.86,15.040,259.6
+12.4,0.86,15.160,254.2,12.7,0.86,16.380,256.5
+10.7,0.86,14.630,254.0,11.2,0.86,16.330,258.0
+10.8,0.86,15.830,254.5,11.2,0.86,17.590,256.8
+10.2,0.86,15.180,253.1,10.6,0.86,16.980,254.6
+9.3,0.86,13.800,254.7,9.7,0.86,15.480,256.7
+9.7,0.86,14.350,259.5,10.1,0.86,15.800,260.6
+10.1,0.86,14.900,259.6,10.3,0.86,16.200,261.1
+10.8,0.86,14.400,266.1,10.7,0.86,15.220,266.3
+12.2,0.86,13.640,266.8,12.0,0.86,13.910,266.9
+13.5,0.86,13.860,267.1,13.3,0.86,14.140,267.2
+14.7,0.86,13.680,265.5,14.5,0.86,13.960,265.6
+15.5,0.86,15.480,261.5,15.3,0.86,15.770,261.5
+16.6,0.86,14.420,259.0,16.3,0.86,14.710,259.1
+17.0,0.86,14.480,262.3,16.8,0.86,14.780,262.2
+17.4,0.86,15.540,261.7,17.2,0.86,15.810,261.6
+17.5,0.86,13.480,269.5,17.3,0.86,13.810,269.4
+17.2,0.86,9.020,274.1,17.0,0.86,9.820,274.5
+16.5,0.86,10.740,287.4,16.5,0.86,11.700,285.2
+15.7,0.86,7.840,278.0,15.5,0.86,8.050,277.5
+14.4,0.86,12.700,281.7,14.4,0.86,13.740,285.3
+13.1,0.86,12.560,278.6,13.0,0.86,14.400,281.7
+11.0,0.86,12.120,277.1,11.1,0.86,13.840,282.3
+9.5,0.86,11.110,297.7,9.6,0.86,12.500,298.6
+8.6,0.86,14.440,295.7,8.5,0.86,15.390,297.5
+7.8,0.86,13.390,293.2,7.8,0.86,14.300,295.1
+7.1,0.86,13.030,294.6,7.2,0.86,13.930,297.2
+5.8,0.86,13.450,305.1,5.9,0.86,14.520,306.4
+2.5,0.86,11.420,340.4,2.4,0.86,12.240,347.4
+1.0,0.86,6.840,337.1,0.8,0.86,7.190,345.0
+0.5,0.86,5.330,348.2,0.3,0.86,5.580,356.8
+0.2,0.86,5.320,352.0,0.0,0.86,5.690,355.6
+0.7,0.86,5.430,1.5,0.5,0.86,5.490,2.0
+1.6,0.86,4.010,12.5,1.4,0.86,4.060,13.1
+3.0,0.86,4.190,8.6,2.7,0.86,4.220,9.1
+4.0,0.86,4.230,353.7,3.8,0.86,4.250,353.9
+5.3,0.86,4.360,354.9,5.0,0.86,4.380,355.2
+6.2,0.86,3.590,358.3,5.9,0.86,3.610,358.9
+6.9,0.86,3.260,1.3,6.7,0.86,3.270,1.4
+7.1,0.86,2.460,359.8,6.9,0.86,2.440,359.3
+6.8,0.86,3.060,301.8,6.6,0.86,2.900,303.0
+5.6,0.86,9.250,17.7,5.4,0.86,9.250,17.8
+3.4,0.86,1.890,96.5,3.2,0.86,2.160,92.7
+2.9,0.87,5.630,53.5,2.7,0.87,5.840,53.9
+3.6,0.87,5.890,62.2,3.4,0.87,6.050,60.9
+2.4,0.87,4.730,35.8,2.2,0.87,4.870,35.0
+3.0,0.87,5.600,358.6,2.9,0.87,5.890,1.9
+3.5,0.87,4.720,27.0,3.3,0.87,5.030,27.0
+3.3,0.87,4.180,344.6,3.3,0.87,4.420,349.1
+3.0,0.87,5.590,12.6,2.9,0.87,6.010,15.0
+2.4,0.87,6.180,5.8,2.3,0.87,6.490,6.0
+1.5,0.87,5.430,5.6,1.3,0.87,5.990,20.7
+1.2,0.87,5.920,329.0,1.1,0.87,5.530,344.2
+1.0,0.87,4.850,349.7,0.9,0.87,5.170,359.7
+0.9,0.87,4.830,359.4,0.7,0.87,5.180,0.3
+0.3,0.87,5.420,321.1,0.3,0.87,5.560,324.5
+1.1,0.87,5.740,320.4,0.9,0.87,5.810,320.8
+2.1,0.87,6.110,319.4,1.9,0.87,6.180,319.6
+3.3,0.87,7.010,312.3,3.1,0.87,7.100,312.1
+4.0,0.87,8.510,304.8,3.8,0.87,8.620,304.6
+4.7,0.87,8.620,303.3,4.5,0.87,8.710,303.3
+5.5,0.87,8.830,300.2,5.3,0.87,8.950,300.3
+6.3,0.87,8.630,306.7,6.0,0.87,8.750,306.8
+6.8,0.87,9.290,310.8,6.5,0.87,9.420,310.8
+7.2,0.87,8.140,315.5,7.0,0.87,8.290,315.5
+7.5,0.87,7.380,317.8,7.4,0.87,7.700,317.9
+7.6,0.87,5.240,312.6,7.4,0.87,5.580,316.4
+7.7,0.87,5.830,325.9,7.5,0.87,6.480,329.6
+7.6,0.87,4.680,328.0,7.4,0.87,4.800,329.7
+6.9,0.87,3.260,263.5,6.8,0.87,3.040,270.1
+7.4,0.87,3.320,249.5,7.2,0.87,3.120,251.6
+6.5,0.87,5.370,219.3,6.8,0.87,5.090,220.6
+6.7,0.87,7.010,218.0,6.8,0.87,6.900,216.4
+7.6,0.87,8.710,232.4,7.7,0.87,8.960,232.8
+6.3,0.87,10.640,241.3,7.4,0.87,10.580,245.9
+6.9,0.87,11.930,283.5,7.5,0.87,12.430,287.1
+6.0,0.87,10.360,293.9,6.4,0.87,11.120,296.2
+4.7,0.87,8.380,308.4,5.3,0.87,9.680,307.4
+4.5,0.87,9.110,310.6,5.1,0.87,9.340,313.9
+4.2,0.87,7.620,319.8,5.0,0.87,7.790,325.9
+4.4,0.87,4.120,318.8,4.9,0.87,5.140,322.1
+6.8,0.87,3.310,320.3,6.6,0.87,3.490,320.4
+9.3,0.87,3.520,337.0,9.2,0.87,3.540,337.1
+11.5,0.87,2.890,7.4,11.3,0.87,2.900,8.2
+12.9,0.87,3.800,45.1,12.7,0.87,3.850,45.5
+13.8,0.87,3.900,45.5,13.6,0.87,3.930,45.4
+14.2,0.87,3.570,48.8,14.0,0.87,3.600,48.7
+14.5,0.87,2.410,31.7,14.3,0.87,2.420,32.2
+14.7,0.87,1.640,81.9,14.5,0.87,1.620,81.5
+14.6,0.87,0.870,58.3,14.4,0.87,0.920,60.6
+14.7,0.87,1.400,90.8,14.5,0.87,1.460,89.7
+14.7,0.87,1.440,132.5,14.5,0.87,1.480,133.0
+13.9,0.87,4.860,120.2,13.8,0.87,4.870,120.7
+13.5,0.87,6.040,142.0,13.5,0.87,6.070,141.4
+12.8,0.87,6.540,167.9,12.8,0.87,6.760,167.7
+12.6,0.87,9.530,169.3,12.8,0.87,9.770,168.5
+12.3,0.87,10.150,186.3,12.7,0.87,10.260,184.7
+12.0,0.87,11.230,187.8,12.3,0.87,11.290,186.2
+12.2,0.87,11.400,189.7,12.6,0.87,11.650,187.9
+11.4,0.87,11.290,191.3,12.0,0.87,11.720,189.0
+11.4,0.87,11.330,193.6,12.1,0.87,11.730,191.9
+10.8,0.87,11.750,193.1,11.6,0.87,12.360,191.0
+10.5,0.87,11.920,195.7,11.3,0.87,12.580,193.3
+9.6,0.87,11.520,197.3,10.5,0.87,12.460,194.6
+9.5,0.87,9.650,193.3,9.7,0.87,10.710,192.6
+12.7,0.87,8.230,186.2,12.5,0.87,8.410,186.2
+14.9,0.87,9.680,184.6,14.7,0.87,9.880,184.8
+16.3,0.87,9.860,191.6,16.1,0.87,10.050,191.7
+17.4,0.87,9.640,196.5,17.2,0.87,9.840,196.6
+18.3,0.87,10.730,202.1,18.0,0.87,10.940,202.1
+18.8,0.87,11.160,204.6,18.5,0.87,11.390,204.8
+19.1,0.87,11.470,207.5,18.9,0.87,11.720,207.6
+19.2,0.87,11.980,204.3,18.9,0.87,12.280,204.5
+18.9,0.87,10.480,202.1,18.8,0.87,11.100,202.8
+17.8,0.87,12.610,191.7,17.9,0.87,13.470,193.1
+16.2,0.87,12.320,189.7,16.4,0.87,13.480,191.5
+15.6,0.87,14.100,200.1,15.9,0.87,15.590,200.5
+15.1,0.87,14.350,206.1,15.4,0.87,15.680,206.6
+14.4,0.87,14.520,214.2,14.8,0.87,15.990,214.6
+13.7,0.87,15.620,218.1,14.0,0.87,16.900,218.8
+12.5,0.87,17.220,219.3,12.6,0.87,18.580,219.6
+11.2,0.87,16.490,220.0,11.3,0.87,17.970,220.7
+10.1,0.87,14.740,221.1,10.3,0.87,16.290,222.7
+9.9,0.87,15.280,224.5,10.3,0.87,16.730,226.5
+10.0,0.86,14.930,225.9,10.4,0.86,15.980,228.3
+10.3,0.86,14.220,228.2,11.1,0.86,15.040,231.8
+9.7,0.86,12.490,226.0,10.7,0.86,13.330,231.2
+10.0,0.86,11.690,223.6,10.9,0.86,12.450,227.8
+11.6,0.86,9.890,220.6,12.2,0.86,10.800,223.7
+14.2,0.86,8.790,212.8,14.1,0.86,9.010,214.2
+16.8,0.86,7.850,209.0,16.6,0.86,7.940,209.5
+19.3,0.86,8.910,207.4,19.1,0.86,9.030,207.8
+20.7,0.86,8.930,203.2,20.5,0.86,9.100,203.5
+22.0,0.86,10.810,200.6,21.8,0.86,11.030,201.1
+22.2,0.86,10.920,203.3,21.9,0.86,11.160,203.5
+22.6,0.86,11.720,202.1,22.4,0.86,11.980,202.3
+22.1,0.86,13.030,193.8,21.8,0.86,13.330,193.9
+20.8,0.86,11.330,181.4,20.6,0.86,12.010,182.0
+19.2,0.86,13.420,177.7,19.2,0.86,14.360,178.5
+17.7,0.86,15.880,181.2,17.6,0.86,16.950,181.7
+16.5,0.86,13.550,171.8,16.5,0.86,14.510,172.8
+14.7,0.86,14.740,174.2,14.6,0.86,15.630,175.2
+13.3,0.86,13.600,184.6,13.2,0.86,14.750,186.7
+12.5,0.86,13.650,193.0,12.4,0.86,14.760,193.9
+11.7,0.86,13.290,192.5,11.7,0.86,14.580,193.7
+11.1,0.86,11.700,192.6,11.1,0.86,12.860,195.1
+10.8,0.86,12.510,198.1,10.8,0.86,13.690,199.7
+10.8,0.86,14.380,205.5,10.8,0.86,15.610,206.6
+10.4,0.86,13.590,200.0,10.4,0.86,14.790,202.6
+9.8,0.86,10.810,204.2,9.8,0.86,12.210,207.8
+9.5,0.86,9.580,213.5,9.4,0.86,10.440,216.9
+8.6,0.86,8.730,213.5,8.7,0.86,9.550,216.9
+10.3,0.86,7.790,201.5,10.3,0.86,8.840,206.9
+14.1,0.86,8.190,214.6,13.9,0.86,8.350,215.2
+16.8,0.86,8.600,228.3,16.6,0.86,8.740,228.6
+19.1,0.86,10.110,232.6,18.9,0.86,10.350,232.8
+20.1,0.86,10.830,237.6,19.9,0.86,11.080,237.4
+20.7,0.86,13.440,231.6,20.4,0.86,13.710,231.6
+21.1,0.86,11.350,228.0,20.9,0.86,11.590,227.9
+21.5,0.86,12.410,222.0,21.3,0.86,12.680,222.0
+21.0,0.86,12.270,226.9,20.8,0.86,12.540,227.0
+20.6,0.86,10.170,229.3,20.5,0.86,10.810,229.8
+20.4,0.86,9.110,224.3,20.4,0.86,10.220,227.2
+20.5,0.86,6.410,227.1,20.3,0.86,6.640,229.2
+19.7,0.86,5.390,220.2,19.7,0.86,5.760,221.6
+18.9,0.86,4.990,193.4,19.0,0.86,4.950,196.4
+18.9,0.86,3.390,200.4,18.7,0.86,3.240,205.7
+8.9,0.86,9.820,44.6,8.8,0.86,10.860,44.9
+7.1,0.87,9.350,20.1,6.9,0.87,10.690,23.4
+5.3,0.87,10.790,16.9,5.2,0.87,11.630,18.9
+4.2,0.87,11.600,15.0,4.1,0.87,12.390,16.8
+4.7,0.87,13.490,20.8,4.5,0.87,14.510,21.5
+4.0,0.87,15.440,24.9,3.8,0.87,15.860,25.1
+3.1,0.87,15.530,25.5,2.8,0.87,15.950,25.6
+1.4,0.87,19.010,21.8,1.1,0.87,19.490,22.1
+0.1,0.87,16.390,24.0,-0.1,0.87,16.910,24.3
+-1.7,0.87,14.310,36.6,-1.9,0.87,14.570,36.2
+-2.3,0.88,17.210,31.7,-2.5,0.88,17.570,31.6
+-1.4,0.88,14.860,27.0,-1.7,0.88,15.130,27.1
+0.6,0.88,14.870,29.1,0.3,0.88,15.160,29.1
+1.2,0.88,15.840,36.5,1.0,0.88,16.100,36.2
+2.9,0.88,14.470,25.4,2.6,0.88,14.740,25.7
+4.3,0.88,12.420,32.0,4.1,0.88,12.690,32.0
+4.6,0.88,13.000,39.9,4.4,0.88,13.270,39.7
+4.5,0.88,12.320,47.1,4.3,0.88,12.520,46.8
+4.3,0.88,11.460,50.7,4.1,0.88,11.840,50.2
+4.5,0.88,11.320,44.0,4.3,0.88,11.750,43.8
+4.3,0.88,9.900,46.6,4.2,0.88,10.570,46.1
+4.1,0.88,10.310,64.8,3.9,0.88,10.790,64.3
+-0.3,0.88,13.330,88.5,-0.5,0.88,13.410,87.6
+-0.9,0.88,11.380,66.9,-1.1,0.88,11.850,65.6
+-0.4,0.88,7.400,2.6,-0.6,0.88,7.550,3.0
+-1.2,0.88,3.890,50.9,-1.4,0.88,3.930,50.7
+-1.0,0.88,5.670,29.4,-1.2,0.88,5.760,28.9
+-1.2,0.88,7.020,23.3,-1.4,0.88,7.180,23.6
+-1.1,0.88,6.070,9.8,-1.2,0.88,6.480,13.6
+-0.4,0.88,4.860,8.3,-0.4,0.88,5.500,17.0
+0.5,0.88,5.160,14.8,0.4,0.88,5.550,18.3
+0.6,0.88,4.680,352.3,0.5,0.88,4.910,356.3
+1.1,0.88,5.030,13.1,1.1,0.88,5.540,15.8
+2.3,0.88,6.280,33.5,2.1,0.88,6.380,34.1
+3.4,0.88,6.280,57.6,3.2,0.88,6.360,57.8
+4.5,0.88,6.020,76.2,4.2,0.88,6.090,76.4
+5.3,0.88,5.590,82.1,5.1,0.88,5.660,82.4
+6.3,0.88,6.020,88.8,6.1,0.88,6.090,89.1
+7.0,0.88,6.190,97.3,6.7,0.88,6.260,97.0
+7.3,0.88,5.920,97.6,7.0,0.88,5.990,97.7
+7.5,0.88,5.800,80.0,7.3,0.88,5.850,80.7
+7.8,0.88,6.070,91.2,7.5,0.88,6.150,91.7
+7.6,0.88,5.710,102.0,7.4,0.88,5.880,102.3
+7.1,0.88,6.290,92.7,6.9,0.88,6.470,92.5
+6.6,0.88,6.460,95.4,6.5,0.88,6.970,96.4
+6.0,0.88,4.740,105.8,5.8,0.88,5.180,106.2
+5.6,0.88,6.020,129.6,5.5,0.88,6.540,129.3
+4.5,0.88,6.320,126.6,4.3,0.88,6.730,126.3
+4.6,0.88,4.960,139.7,4.5,0.88,5.650,137.0
+4.2,0.88,3.840,146.0,4.1,0.88,4.620,144.3
+3.3,0.88,4.530,161.8,3.1,0.88,4.910,160.3
+2.4,0.88,3.700,198.7,2.2,0.88,3.640,195.7
+2.0,0.88,2.570,186.0,1.9,0.88,2.980,180.3
+1.3,0.88,1.750,117.1,1.1,0.88,1.860,118.6
+0.8,0.88,0.190,89.8,0.6,0.88,0.250,109.6
+0.4,0.87,1.680,38.3,0.4,0.87,1.880,54.3
+0.8,0.87,1.910,66.7,0.6,0.87,1.900,70.4
+0.9,0.87,1.960,87.8,0.8,0.87,2.050,92.2
+1.3,0.87,2.350,115.1,1.1,0.87,2.440,116.1
+1.4,0.87,2.950,111.1,1.2,0.87,3.030,112.5
+1.6,0.87,3.350,114.2,1.4,0.87,3.410,114.6
+1.8,0.87,2.870,133.2,1.6,0.87,2.920,133.1
+1.9,0.87,3.050,127.1,1.8,0.87,3.080,127.3
+1.9,0.87,3.530,141.1,1.7,0.87,3.600,140.9
+1.9,0.87,2.960,146.9,1.7,0.87,3.030,146.9
+2.0,0.87,3.760,136.2,1.8,0.87,3.860,136.6
+1.9,0.87,4.000,148.7,1.7,0.87,4.260,148.8
+1.9,0.87,3.460,161.1,1.8,0.87,3.890,161.0
+2.0,0.87,3.400,157.1,1.9,0.87,3.780,159.1
+2.1,0.87,3.460,161.3,1.9,0.87,3.840,162.2
+2.0,0.87,4.780,169.7,1.8,0.87,5.120,171.0
+1.8,0.87,5.820,176.2,1.6,0.87,6.030,177.7
+1.6,0.87,5.970,184.5,1.4,0.87,6.350,184.8
+1.7,0.87,6.140,192.9,1.5,0.87,6.260,193.8
+1.4,0.87,7.760,202.7,1.4,0.87,8.310,203.6
+0.6,0.87,7.520,211.0,0.6,0.87,8.070,211.3
+0.2,0.87,8.540,213.0,0.3,0.87,9.240,214.5
+-0.1,0.87,8.720,212.6,-0.1,0.87,9.420,215.3
+-0.3,0.86,9.500,214.9,-0.1,0.86,10.490,217.0
+-0.3,0.86,9.830,212.4,-0.2,0.86,10.750,214.7
+-0.0,0.86,9.430,213.5,0.0,0.86,10.270,215.2
+2.0,0.86,8.850,207.3,1.8,0.86,9.050,208.1
+4.4,0.86,9.580,206.4,4.2,0.86,9.750,206.8
+6.3,0.86,10.850,218.6,6.0,0.86,11.070,218.8
+8.1,0.86,11.640,228.6,7.9,0.86,11.880,228.8
+9.3,0.86,12.010,232.6,9.1,0.86,12.230,232.7
+10.8,0.86,12.540,242.6,10.6,0.86,12.770,242.7
+12.4,0.86,11.910,242.0,12.2,0.86,12.160,242.2
+13.7,0.86,13.260,242.1,13.5,0.86,13.560,242.3
+14.5,0.86,11.490,235.8,14.3,0.86,11.810,236.0
+14.4,0.86,11.090,222.7,14.3,0.86,11.890,224.2
+13.1,0.86,12.710,224.1,13.3,0.86,13.950,226.9
+11.9,0.86,13.800,231.4,12.2,0.86,14.940,234.4
+12.0,0.86,15.150,242.7,12.4,0.86,16.450,245.8
+12.0,0.86,15.880,253.6,12.5,0.86,17.420,255.8
+11.8,0.86,16.700,259.3,12.4,0.86,18.330,261.6
+12.1,0.86,16.740,264.0,12.7,0.86,18.340,266.0
+12.0,0.86,16.640,267.0,12.7,0.86,18.090,269.1
+12.3,0.86,16.510,268.8,12.9,0.86,17.840,270.8
+12.2,0.86,15.960,270.6,13.0,0.86,17.310,272.9
+12.2,0.86,15.640,270.4,13.1,0.86,16.930,273.0
+12.1,0.86,15.410,271.3,13.1,0.86,16.550,274.1
+12.1,0.86,14.590,274.2,13.1,0.86,15.640,277.1
+12.4,0.87,14.140,276.6,13.4,0.87,14.940,280.1
+12.4,0.87,12.160,279.7,13.2,0.87,13.000,283.1
+13.3,0.87,7.830,283.6,13.2,0.87,8.380,284.4
+14.4,0.87,4.590,302.7,14.2,0.87,4.690,302.2
+16.1,0.87,5.530,301.9,15.9,0.87,5.630,301.4
+17.1,0.87,5.780,300.8,16.9,0.87,5.830,300.3
+18.2,0.87,4.070,299.0,18.0,0.87,4.100,298.4
+19.1,0.87,2.830,288.5,18.9,0.87,2.860,287.5
+19.7,0.87,3.370,267.9,19.5,0.87,3.430,267.3
+20.3,0.87,3.880,256.3,20.1,0.87,3.940,255.9
+20.6,0.87,4.720,252.4,20.4,0.87,4.830,251.8
+20.4,0.87,4.800,248.6,20.3,0.87,5.050,246.8
+19.7,0.87,8.280,225.9,19.6,0.87,8.530,227.5
+19.0,0.87,10.900,228.8,19.1,0.87,11.180,229.6
+18.2,0.87,10.800,225.3,18.2,0.87,11.370,228.4
+16.3,0.87,13.150,244.1,17.1,0.87,14.220,248.0
+17.2,0.87,13.470,258.4,17.9,0.87,14.340,261.1
+17.0,0.87,12.620,254.8,17.7,0.87,13.500,258.6
+16.0,0.87,13.150,254.6,16.6,0.87,14.230,259.7
+15.5,0.87,12.100,266.9,16.2,0.87,13.080,271.3
+14.6,0.87,10.990,276.2,15.4,0.87,12.190,279.5
+13.4,0.87,8.790,280.5,14.2,0.87,10.160,283.5
+13.6,0.87,8.150,280.9,14.2,0.87,8.800,285.4
+13.9,0.87,7.230,267.5,14.6,0.87,7.500,273.8
+14.6,0.87,5.870,267.8,15.1,0.87,5.940,273.2
+15.5,0.87,7.580,277.7,16.1,0.87,7.490,280.6
+14.4,0.87,4.230,261.6,14.9,0.87,4.910,264.5
+14.8,0.87,3.610,204.6,14.7,0.87,3.650,207.2
+17.8,0.87,4.320,208.5,17.7,0.87,4.380,209.5
+20.7,0.87,7.570,222.4,20.4,0.87,7.710,222.5
+21.9,0.87,8.870,227.3,21.7,0.87,9.010,227.3
+22.3,0.87,9.400,227.2,22.1,0.87,9.550,227.3
+22.6,0.87,9.870,226.3,22.4,0.87,10.050,226.3
+22.8,0.87,9.830,226.0,22.6,0.87,10.020,226.0
+22.9,0.87,10.400,228.3,22.7,0.87,10.630,228.3
+22.3,0.87,10.750,231.0,22.2,0.87,11.300,231.6
+21.9,0.87,11.410,231.6,21.9,0.87,11.890,232.4
+21.3,0.87,10.990,236.1,21.4,0.87,11.220,236.0
+20.8,0.87,10.470,231.2,21.2,0.87,10.790,231.8
+20.7,0.87,10.730,232.0,21.2,0.87,10.960,233.0
+19.5,0.87,12.270,210.7,19.8,0.87,12.520,210.3
+17.7,0.87,13.010,221.8,18.3,0.87,14.290,221.4
+16.0,0.87,11.310,213.7,16.2,0.87,12.340,213.9
+14.1,0.87,13.160,211.8,14.2,0.87,14.950,213.6
+13.3,0.87,15.180,216.0,13.6,0.87,16.640,217.5
+12.9,0.87,13.300,221.6,13.0,0.87,14.310,222.6
+12.1,0.87,13.450,223.4,12.0,0.87,14.210,224.0
+12.1,0.87,13.220,224.5,12.0,0.87,13.850,225.2
+12.1,0.87,12.270,226.7,12.0,0.87,12.880,227.1
+12.3,0.87,10.700,224.5,12.2,0.87,11.240,225.2
+12.5,0.87,11.090,219.5,12.3,0.87,11.570,220.4
+13.6,0.87,10.200,223.5,13.3,0.87,10.280,223.7
+16.2,0.87,8.500,231.6,16.0,0.87,8.530,231.9
+19.3,0.87,5.040,236.9,19.1,0.87,5.070,237.2
+21.6,0.87,3.690,220.4,21.4,0.87,3.720,220.9
+22.9,0.87,4.100,210.2,22.7,0.87,4.150,210.7
+23.6,0.87,4.570,211.8,23.4,0.87,4.650,212.2
+24.0,0.87,5.580,218.9,23.8,0.87,5.670,218.9
+24.0,0.87,6.700,224.6,23.8,0.87,6.820,224.7
+23.7,0.87,6.190,236.7,23.6,0.87,6.470,236.5
+23.5,0.87,9.260,218.2,23.3,0.87,9.590,218.7
+22.5,0.87,11.740,224.1,22.7,0.87,12.200,225.1
+21.2,0.87,10.540,225.1,21.7,0.87,11.050,228.0
+20.6,0.87,11.020,238.9,21.3,0.87,11.490,241.2
+21.7,0.87,11.640,246.7,22.3,0.87,11.650,246.4
+21.3,0.87,12.270,265.0,21.6,0.87,12.480,264.9
+21.1,0.87,11.040,274.7,21.3,0.87,11.020,274.2
+19.0,0.87,9.550,268.9,20.0,0.87,10.560,273.0
+15.2,0.87,6.080,226.5,15.7,0.87,6.100,237.1
+13.8,0.87,9.790,217.7,14.3,0.87,9.060,222.6
+16.4,0.87,8.720,232.1,16.5,0.87,8.270,233.0
+16.9,0.87,7.910,245.3,16.7,0.87,7.650,247.7
+15.7,0.87,7.690,255.5,16.0,0.87,7.780,264.4
+13.8,0.87,7.910,294.1,14.0,0.87,8.580,300.1
+13.5,0.87,5.140,305.2,13.6,0.87,6.140,304.4
+16.2,0.87,4.270,313.5,16.1,0.87,4.400,313.2
+18.6,0.87,3.830,323.7,18.4,0.87,3.880,323.2
+20.3,0.87,4.020,325.8,20.1,0.87,4.070,325.4
+21.5,0.87,4.130,314.2,21.3,0.87,4.160,313.4
+22.4,0.87,2.610,319.4,22.2,0.87,2.620,317.7
+23.3,0.87,3.650,300.7,23.0,0.87,3.670,299.4
+23.7,0.87,3.500,287.8,23.5,0.87,3.540,286.3
+23.9,0.87,3.830,265.5,23.7,0.87,3.870,264.8
+23.8,0.87,2.110,262.9,23.6,0.87,2.160,262.3
+23.7,0.87,0.200,277.5,23.6,0.87,0.250,285.3
+22.9,0.87,1.510,180.3,23.0,0.87,1.420,178.0
+22.1,0.87,3.360,242.3,21.9,0.87,3.670,242.4
+21.3,0.87,7.010,239.0,22.1,0.87,7.790,240.2
+20.3,0.87,8.530,219.3,20.8,0.87,8.700,220.0
+21.3,0.87,8.220,220.0,21.6,0.87,8.240,219.3
+20.4,0.87,9.640,213.5,21.0,0.87,10.010,213.4
+20.3,0.87,9.480,214.0,21.1,0.87,9.610,212.9
+19.0,0.87,9.910,198.2,19.3,0.87,10.320,199.0
+15.1,0.87,12.490,212.8,16.0,0.87,13.110,213.3
+15.2,0.87,14.350,217.0,15.9,0.87,15.620,218.1
+15.5,0.87,13.430,208.2,15.8,0.87,14.630,210.4
+14.6,0.87,13.430,210.3,15.0,0.87,14.400,213.7
+13.6,0.87,11.430,210.3,13.6,0.87,12.170,211.8
+14.0,0.87,9.900,211.0,13.8,0.87,10.260,211.9
+16.5,0.87,8.320,214.5,16.3,0.87,8.440,215.2
+19.7,0.87,7.320,214.8,19.5,0.87,7.390,215.4
+22.6,0.87,7.610,213.2,22.4,0.87,7.770,213.5
+23.7,0.87,9.950,221.7,23.4,0.87,10.160,221.7
+24.5,0.87,10.330,220.9,24.2,0.87,10.530,221.0
+24.8,0.87,9.400,218.8,24.6,0.87,9.580,218.8
+25.2,0.86,9.880,220.5,24.9,0.86,10.110,220.5
+25.3,0.86,9.620,227.0,25.1,0.86,9.860,227.0
+25.1,0.86,8.090,233.8,24.9,0.86,8.660,234.0
+19.1,0.86,13.840,184.3,19.0,0.86,14.420,184.2
+16.1,0.86,14.850,184.2,15.9,0.86,15.550,184.3
+15.0,0.86,11.280,177.8,14.9,0.86,11.870,178.8
+14.5,0.86,10.750,177.4,14.5,0.86,11.340,180.1
+14.0,0.86,10.870,171.5,14.2,0.86,11.440,174.6
+14.3,0.86,11.240,177.9,14.6,0.86,12.140,180.6
+13.8,0.86,10.400,187.7,14.0,0.86,11.160,191.5
+14.1,0.86,10.660,204.4,14.2,0.86,11.450,205.2
+13.4,0.86,11.210,202.9,13.6,0.86,12.280,204.3
+13.4,0.86,13.430,207.8,13.7,0.86,14.600,209.8
+13.0,0.86,14.000,208.6,13.4,0.86,15.490,210.3
+12.8,0.86,14.490,213.1,13.1,0.86,16.100,213.8
+11.5,0.86,13.020,206.3,11.8,0.86,14.240,208.4
+10.8,0.86,12.380,207.4,10.6,0.86,12.760,208.1
+10.6,0.86,10.320,201.5,10.4,0.86,10.500,202.1
+11.2,0.86,8.770,197.9,11.0,0.86,8.840,198.3
+15.6,0.86,9.530,201.9,15.4,0.86,9.610,201.8
+19.1,0.86,8.320,205.0,18.9,0.86,8.420,205.2
+22.4,0.86,8.060,207.5,22.2,0.86,8.250,207.7
+23.8,0.86,10.840,208.0,23.6,0.86,11.080,208.1
+24.2,0.86,11.650,208.6,23.9,0.86,11.890,208.6
+24.3,0.86,10.610,211.2,24.1,0.86,10.850,211.1
+24.7,0.86,13.000,213.4,24.5,0.86,13.340,213.5
+24.1,0.86,10.210,216.5,23.9,0.86,10.910,216.8
+23.5,0.86,10.460,209.2,23.5,0.86,11.370,211.8
+22.5,0.86,13.890,206.7,22.9,0.86,14.780,208.5
+20.9,0.86,13.180,207.8,21.6,0.86,14.650,211.0
+21.6,0.86,13.150,204.2,22.1,0.86,14.070,205.8
+18.9,0.86,11.950,192.6,19.6,0.86,13.090,195.6
+16.9,0.86,15.630,191.4,17.4,0.86,17.230,192.6
+16.6,0.86,12.710,190.1,16.7,0.86,14.070,190.8
+15.1,0.86,12.320,184.9,15.3,0.86,13.630,186.8
+14.9,0.86,13.620,190.6,15.0,0.86,14.950,192.0
+15.0,0.86,14.790,203.4,15.0,0.86,16.280,204.7
+14.1,0.86,13.500,201.6,14.2,0.86,14.910,202.1
+13.4,0.86,13.140,205.1,13.5,0.86,14.410,206.0
+13.1,0.86,12.430,207.1,13.2,0.86,13.640,207.7
+13.5,0.86,14.190,204.1,13.5,0.86,15.070,204.0
+15.2,0.86,14.340,199.4,15.0,0.86,14.660,199.4
+15.6,0.86,12.660,202.6,15.3,0.86,12.890,202.6
+18.3,0.86,11.670,194.7,18.0,0.86,11.880,194.8
+19.9,0.86,11.050,189.6,19.7,0.86,11.260,189.8
+22.0,0.86,12.880,194.0,21.8,0.86,13.200,194.1
+22.6,0.86,14.540,202.4,22.3,0.86,14.860,202.5
+23.2,0.86,13.860,203.2,22.9,0.86,14.230,203.2
+22.8,0.86,15.620,195.3,22.6,0.86,16.010,195.5
+23.2,0.86,15.180,192.3,23.0,0.86,15.640,192.4
+22.8,0.86,14.020,181.6,22.6,0.86,14.640,181.8
+22.2,0.86,11.410,182.6,22.2,0.86,11.850,185.0
+21.6,0.86,10.420,185.8,21.7,0.86,11.260,188.6
+20.9,0.86,9.640,198.6,21.1,0.86,10.590,202.7
+20.5,0.86,10.760,214.4,20.7,0.86,11.580,218.1
+18.8,0.86,11.800,182.0,18.7,0.86,12.030,182.6
+17.4,0.86,9.290,194.9,17.2,0.86,10.330,193.1
+16.5,0.86,11.640,198.9,16.5,0.86,12.830,202.5
+15.7,0.86,12.110,242.7,15.4,0.86,13.250,245.1
+14.6,0.86,6.740,226.5,14.2,0.86,7.690,232.9
+13.2,0.86,8.240,209.0,13.1,0.86,8.820,216.1
+12.4,0.86,9.310,219.2,12.3,0.86,9.520,222.3
+10.6,0.86,10.170,247.2,10.8,0.86,11.090,250.4
+10.5,0.86,8.920,273.1,10.3,0.86,9.440,275.3
+9.3,0.86,5.270,258.4,9.2,0.86,5.840,259.3
+9.8,0.86,8.370,256.2,9.6,0.86,8.520,256.3
+9.8,0.86,7.610,272.4,9.6,0.86,7.710,272.3
+9.5,0.86,7.510,255.2,9.3,0.86,7.620,255.2
+9.9,0.86,7.120,242.0,9.7,0.86,7.260,242.0
+10.4,0.86,6.170,230.9,10.1,0.86,6.270,231.1
+10.7,0.86,5.740,245.6,10.4,0.86,5.840,245.0
+11.4,0.86,6.170,221.9,11.2,0.86,6.290,222.2
+11.7,0.86,9.450,229.5,11.5,0.86,9.570,229.7
+11.8,0.86,7.390,234.3,11.6,0.86,7.550,234.3
+11.7,0.86,9.960,233.1,11.5,0.86,10.150,233.3
+11.3,0.86,10.260,238.5,11.2,0.86,10.710,238.7
+10.3,0.86,6.100,226.7,10.1,0.86,6.600,235.4
+8.8,0.86,10.340,263.3,8.7,0.86,11.030,265.3
+8.1,0.86,8.210,267.1,8.0,0.86,8.430,267.3
+8.4,0.86,8.890,262.7,8.4,0.86,9.380,263.5
+8.3,0.86,9.910,265.1,8.3,0.86,10.200,267.2
+8.1,0.86,6.610,280.4,8.1,0.86,6.880,283.7
+7.4,0.86,5.860,268.7,7.5,0.86,5.860,273.5
+7.0,0.86,4.890,255.5,7.0,0.86,4.640,258.8
+6.1,0.86,7.250,270.3,6.2,0.86,6.670,272.7
+6.0,0.86,5.140,286.7,6.0,0.86,4.830,288.8
+6.0,0.86,4.000,266.4,6.0,0.86,3.570,268.0
+5.0,0.86,2.980,305.8,5.1,0.86,2.780,315.4
+2.9,0.86,5.190,305.9,3.1,0.86,5.760,307.8
+3.6,0.86,3.430,353.4,3.5,0.86,3.440,352.5
+5.7,0.86,3.970,346.9,5.5,0.86,4.010,346.9
+7.5,0.86,3.390,28.0,7.3,0.86,3.400,28.7
+8.5,0.86,3.000,49.8,8.3,0.86,3.020,50.0
+9.2,0.86,3.620,44.5,9.0,0.86,3.650,44.6
+9.8,0.86,5.460,14.2,9.6,0.86,5.480,14.8
+10.0,0.86,4.260,26.5,9.8,0.86,4.430,26.2
+9.7,0.86,10.740,39.3,9.4,0.86,10.780,39.1
+9.9,0.86,8.430,39.7,9.7,0.86,8.540,40.0
+9.9,0.86,6.230,58.0,9.7,0.86,6.450,58.5
+9.5,0.86,8.390,10.3,9.3,0.86,8.670,10.7
+7.8,0.86,11.630,19.8,7.6,0.86,11.940,20.4
+5.3,0.86,10.610,342.5,5.1,0.86,10.800,343.5
+4.4,0.86,6.830,4.2,4.2,0.86,6.890,4.9
+3.2,0.86,10.330,17.2,3.0,0.86,10.590,17.7
+3.1,0.86,7.820,18.2,2.9,0.86,7.980,18.6
+4.0,0.86,9.440,14.3,3.8,0.86,9.720,14.7
+3.0,0.86,9.520,4.3,2.8,0.86,9.710,5.3
+3.3,0.86,9.330,351.5,3.1,0.86,10.080,352.0
+3.5,0.86,8.200,358.1,3.3,0.86,8.480,358.5
+3.3,0.86,11.130,18.4,3.1,0.86,11.440,19.0
+2.6,0.86,5.330,45.3,2.6,0.86,6.440,45.1
+3.2,0.86,5.580,2.7,3.2,0.86,7.980,5.1
+2.9,0.86,8.430,17.0,2.7,0.86,8.610,16.8
+3.4,0.86,5.630,341.8,3.2,0.86,5.800,342.6
+3.8,0.86,9.350,346.2,3.6,0.86,9.510,346.2
+4.7,0.86,9.690,353.7,4.5,0.86,9.900,353.7
+4.9,0.86,11.060,2.5,4.6,0.86,11.280,2.3
+5.1,0.86,11.580,358.1,4.9,0.86,11.810,358.1
+5.7,0.86,10.190,4.9,5.5,0.86,10.370,4.8
+4.7,0.86,9.940,20.8,4.5,0.86,10.100,20.9
+5.5,0.86,7.450,10.9,5.3,0.86,7.550,11.1
+5.1,0.86,7.220,18.1,4.9,0.86,7.230,17.8
+5.4,0.86,5.950,350.2,5.2,0.86,6.060,350.6
+5.2,0.86,6.560,327.4,5.0,0.86,6.680,327.9
+5.0,0.86,5.700,315.8,5.1,0.86,5.740,323.1
+5.6,0.86,4.700,300.9,5.6,0.86,4.870,305.6
+5.6,0.86,5.930,310.3,5.5,0.86,6.330,311.6
+5.1,0.86,7.310,330.9,4.9,0.86,7.640,332.2
+4.8,0.86,5.960,300.6,4.7,0.86,6.270,302.0
+4.8,0.86,6.050,301.8,4.7,0.86,6.500,304.2
+5.7,0.86,6.900,313.1,5.6,0.86,7.290,312.1
+6.2,0.86,9.680,307.3,6.0,0.86,10.300,307.2
+6.5,0.86,14.200,315.5,6.4,0.86,14.850,316.2
+6.4,0.86,15.640,307.2,6.2,0.86,16.240,307.5
+5.9,0.86,14.290,309.9,5.8,0.86,14.830,310.5
+6.3,0.86,15.550,310.9,6.2,0.86,16.210,311.6
+6.0,0.86,15.990,325.8,5.9,0.86,16.490,326.2
+6.0,0.86,14.500,328.6,5.8,0.86,14.770,328.8
+6.7,0.86,11.920,336.9,6.5,0.86,12.100,337.0
+7.0,0.86,8.700,356.4,6.8,0.86,8.850,356.1
+7.8,0.86,8.210,355.7,7.6,0.86,8.350,355.4
+8.8,0.86,9.410,353.7,8.6,0.86,9.570,353.6
+9.6,0.86,8.600,354.8,9.4,0.86,8.740,354.6
+10.2,0.86,7.380,355.9,10.0,0.86,7.480,355.6
+11.0,0.86,7.100,354.5,10.7,0.86,7.210,354.1
+11.1,0.87,6.400,350.3,10.9,0.87,6.470,349.9
+11.3,0.87,5.020,359.0,11.1,0.87,5.090,358.4
+10.9,0.87,4.120,25.9,10.7,0.87,4.310,25.3
+10.6,0.87,4.040,44.2,10.4,0.87,4.170,41.1
+10.2,0.87,4.830,77.6,10.0,0.87,4.810,74.8
+10.0,0.87,2.250,168.9,9.8,0.87,2.080,161.0
+9.9,0.87,2.470,137.6,9.8,0.87,2.150,140.4
+9.6,0.87,2.650,193.9,9.6,0.87,2.530,200.8
+9.3,0.87,3.710,203.7,9.3,0.87,3.540,209.1
+9.3,0.87,4.330,210.7,9.5,0.87,4.220,216.5
+9.0,0.87,5.680,221.3,9.2,0.87,5.550,226.0
+9.5,0.87,6.490,241.5,9.8,0.87,6.170,247.7
+8.9,0.87,8.600,229.2,9.3,0.87,7.660,233.6
+9.8,0.87,7.490,251.3,10.2,0.87,6.650,257.3
+10.6,0.87,5.530,261.8,10.8,0.87,5.100,266.5
+9.0,0.87,4.330,285.0,9.2,0.87,4.440,291.7
+9.5,0.87,2.000,302.6,9.3,0.87,2.020,300.1
+11.4,0.87,1.630,321.0,11.3,0.87,1.610,317.5
+13.7,0.87,1.110,310.5,13.5,0.87,1.100,304.8
+15.4,0.87,0.610,347.3,15.2,0.87,0.510,337.6
+17.4,0.87,0.570,187.8,17.2,0.87,0.690,191.9
+18.7,0.87,2.210,208.0,18.5,0.87,2.240,208.1
+19.7,0.87,2.300,203.6,19.5,0.87,2.340,204.1
+20.2,0.87,2.850,194.3,20.0,0.87,2.880,194.9
+20.6,0.87,2.750,205.6,20.4,0.87,2.800,205.2
+20.7,0.87,3.660,182.7,20.5,0.87,3.780,184.0
+20.6,0.87,4.770,174.0,20.4,0.87,4.780,173.7
+18.3,0.87,9.320,147.2,18.3,0.87,9.310,148.0
+17.3,0.87,10.370,146.3,17.4,0.87,10.470,147.3
+16.6,0.87,11.090,146.6,16.9,0.87,10.940,148.9
+16.0,0.87,10.670,154.0,16.4,0.87,10.620,156.8
+15.4,0.87,11.120,161.7,15.8,0.87,11.170,163.9
+16.2,0.87,10.070,186.6,16.6,0.87,10.080,187.3
+16.3,0.87,12.820,199.7,16.8,0.87,12.830,200.1
+15.8,0.87,12.970,199.4,16.5,0.87,13.150,199.8
+15.1,0.87,13.430,204.1,15.8,0.87,13.580,203.9
+14.3,0.87,13.320,211.9,15.0,0.87,13.810,211.7
+14.0,0.87,13.240,213.9,14.5,0.87,13.800,213.5
+13.9,0.87,13.520,215.2,14.6,0.87,14.070,215.2
+13.0,0.87,12.330,216.3,13.6,0.87,13.090,216.6
+14.0,0.87,9.670,211.9,14.2,0.87,10.670,213.5
+16.6,0.87,6.430,204.1,16.4,0.87,6.540,204.5
+19.3,0.87,5.150,200.3,19.1,0.87,5.240,200.5
+22.3,0.87,5.740,207.0,22.0,0.87,5.850,207.2
+23.9,0.87,5.640,205.4,23.7,0.87,5.740,205.6
+25.1,0.87,5.710,203.9,24.9,0.87,5.810,204.1
+25.8,0.87,6.220,197.3,25.6,0.87,6.330,197.6
+26.0,0.87,6.780,194.2,25.8,0.87,6.900,194.4
+25.9,0.87,7.510,185.6,25.7,0.87,7.670,185.9
+25.6,0.87,8.150,184.6,25.5,0.87,8.530,184.9
+25.1,0.87,9.910,172.9,25.1,0.87,10.220,174.0
+21.1,0.87,12.580,136.8,21.5,0.87,13.690,137.8
+20.7,0.87,11.340,145.1,21.0,0.87,11.900,147.1
+19.8,0.87,11.800,145.3,19.9,0.87,12.600,147.0
+18.8,0.87,12.300,146.9,19.0,0.87,13.280,148.1
+18.3,0.87,13.110,150.0,18.6,0.87,14.270,151.0
+18.0,0.87,13.820,153.9,18.3,0.87,14.930,155.5
+17.3,0.87,12.890,156.5,17.6,0.87,13.890,159.1
+16.5,0.87,12.460,159.9,16.9,0.87,13.390,163.7
+16.0,0.87,12.640,156.2,16.3,0.87,13.390,159.8
+14.7,0.87,11.870,172.6,15.0,0.87,12.400,177.1
+13.8,0.87,10.800,181.6,14.2,0.87,11.200,185.9
+13.2,0.87,11.340,191.2,13.8,0.87,12.260,197.0
+14.1,0.87,10.830,202.8,15.1,0.87,11.750,205.1
+15.6,0.87,8.550,193.3,15.7,0.87,9.590,196.2
+18.8,0.87,8.690,185.9,18.6,0.87,8.800,186.6
+21.6,0.87,9.700,185.4,21.4,0.87,9.850,185.8
+23.2,0.87,10.400,188.6,23.0,0.87,10.580,188.8
+24.3,0.87,10.300,187.8,24.0,0.87,10.500,188.0
+25.0,0.87,10.030,185.3,24.8,0.87,10.230,185.4
+25.8,0.87,9.840,185.9,25.6,0.87,10.070,186.0
+26.1,0.87,10.120,183.1,25.9,0.87,10.310,183.2
+26.1,0.87,10.900,179.5,25.9,0.87,11.100,179.6
+25.5,0.87,9.130,171.8,25.3,0.87,9.670,172.1
+24.3,0.87,11.710,162.3,24.3,0.87,12.480,162.8
+22.9,0.87,13.410,160.8,23.0,0.87,14.310,161.5
+21.7,0.87,13.590,162.9,21.9,0.87,14.670,163.7
+20.5,0.87,13.700,162.5,20.8,0.87,14.860,163.4
+19.4,0.87,13.690,167.2,19.7,0.87,14.890,168.1
+18.3,0.87,13.360,171.1,18.6,0.87,14.540,172.3
+18.1,0.87,15.820,179.1,18.3,0.87,17.280,179.6
+17.0,0.87,14.800,181.6,17.2,0.87,16.260,182.1
+16.1,0.87,16.010,186.1,16.3,0.87,17.360,186.6
+14.8,0.87,15.040,185.3,15.2,0.87,16.520,186.7
+15.6,0.87,16.290,196.5,15.8,0.87,17.460,197.2
+15.0,0.87,16.290,201.0,15.3,0.87,17.550,202.0
+14.1,0.87,15.400,210.8,14.3,0.87,16.820,212.0
+14.3,0.87,14.010,206.6,14.2,0.87,14.780,207.1
+15.9,0.87,12.180,193.8,15.8,0.87,12.470,194.2
+18.0,0.87,13.390,190.1,17.8,0.87,13.650,190.3
+19.9,0.87,13.880,183.5,19.7,0.87,14.140,183.7
+21.4,0.87,13.550,185.6,21.2,0.87,13.830,185.7
+22.6,0.87,13.080,176.8,22.3,0.87,13.340,176.9
+23.5,0.87,12.280,179.9,23.2,0.87,12.570,180.1
+23.9,0.87,12.720,181.4,23.7,0.87,12.980,181.5
+24.0,0.86,13.850,168.3,23.8,0.86,14.120,168.4
+23.9,0.86,13.840,177.3,23.7,0.86,14.180,177.5
+23.4,0.86,13.400,169.8,23.2,0.86,13.940,169.9
+22.2,0.86,11.000,167.8,22.2,0.86,11.970,167.9
+21.2,0.86,11.980,162.2,21.2,0.86,12.880,163.5
+20.2,0.86,15.410,165.0,20.2,0.86,16.340,165.8
+19.4,0.87,12.860,185.5,19.4,0.87,13.800,185.7
+19.6,0.86,15.640,181.1,19.5,0.86,16.450,181.6
+19.0,0.86,13.980,186.7,19.0,0.86,14.940,187.2
+17.5,0.86,12.820,180.9,17.6,0.86,14.020,183.6
+16.6,0.86,12.680,187.7,16.7,0.86,13.680,190.3
+15.8,0.86,11.600,201.5,15.9,0.86,12.770,205.7
+15.4,0.86,11.160,210.0,15.6,0.86,12.680,214.3
+14.3,0.86,12.520,215.4,14.6,0.86,14.160,219.4
+12.5,0.87,9.480,214.2,12.9,0.87,10.990,222.1
+13.2,0.87,10.320,239.5,14.2,0.87,11.180,247.6
+14.5,0.87,5.890,267.7,15.3,0.87,6.500,274.0
+16.7,0.87,2.420,309.3,16.5,0.87,2.520,307.7
+19.1,0.87,2.780,291.2,19.0,0.87,2.840,289.5
+20.9,0.87,3.000,331.6,20.7,0.87,3.000,330.3
+22.9,0.87,2.360,285.6,22.7,0.87,2.420,284.3
+24.8,0.87,2.890,259.0,24.5,0.87,2.970,258.1
+25.8,0.87,4.870,252.2,25.6,0.87,4.950,251.7
+26.3,0.87,5.990,237.6,26.1,0.87,6.090,237.5
+26.4,0.87,6.070,240.2,26.2,0.87,6.170,240.0
+26.4,0.87,5.100,231.6,26.2,0.87,5.220,231.4
+26.2,0.87,6.680,232.7,26.0,0.87,6.840,232.5
+25.9,0.87,8.090,235.2,25.8,0.87,8.210,235.1
+25.0,0.87,11.660,230.3,25.0,0.87,11.940,231.3
+24.5,0.87,11.260,237.8,24.7,0.87,11.450,238.1
+24.5,0.87,10.930,240.3,24.7,0.87,11.020,240.0
+24.6,0.87,10.690,237.8,24.8,0.87,10.630,237.2
+24.2,0.87,10.420,233.3,24.5,0.87,10.370,232.9
+24.0,0.87,10.590,236.5,24.3,0.87,10.710,235.4
+20.3,0.87,10.150,216.3,20.6,0.87,10.260,212.7
+20.5,0.87,8.970,224.7,20.6,0.87,8.950,221.8
+20.3,0.87,8.630,249.8,20.9,0.87,8.710,250.6
+16.6,0.87,9.250,237.2,17.6,0.87,9.930,240.9
+18.2,0.87,9.740,253.3,18.8,0.87,10.110,255.6
+16.1,0.87,8.630,289.7,16.3,0.87,8.130,298.9
+13.7,0.87,4.600,289.3,13.7,0.87,5.280,291.6
+14.8,0.87,2.670,302.3,14.7,0.87,2.830,300.5
+17.0,0.87,1.300,319.2,16.8,0.87,1.290,314.9
+19.4,0.87,0.380,328.8,19.2,0.87,0.310,310.5
+22.7,0.87,1.400,160.9,22.5,0.87,1.500,164.3
+24.9,0.87,3.380,220.5,24.7,0.87,3.480,220.2
+25.9,0.87,5.320,209.1,25.7,0.87,5.430,209.2
+26.5,0.87,6.360,207.5,26.3,0.87,6.490,207.7
+26.8,0.86,7.080,211.2,26.5,0.86,7.220,211.3
+26.7,0.86,7.530,214.6,26.5,0.86,7.690,214.6
+26.4,0.86,7.120,213.0,26.2,0.86,7.370,213.0
+26.3,0.86,9.900,211.1,26.1,0.86,9.940,211.5
+25.7,0.86,10.620,215.9,25.8,0.86,10.910,216.3
+25.3,0.86,10.950,226.9,25.5,0.86,11.230,227.4
+24.5,0.86,10.580,233.7,25.1,0.86,11.060,234.8
+21.9,0.86,14.730,195.4,22.1,0.86,15.960,195.8
+20.2,0.86,15.370,195.8,20.3,0.86,16.870,196.2
+18.6,0.86,14.690,195.3,18.7,0.86,16.120,195.8
+17.7,0.86,15.370,208.4,18.0,0.86,16.900,208.2
+17.6,0.86,13.980,211.8,17.8,0.86,15.380,211.5
+16.1,0.86,13.190,210.1,16.5,0.86,14.840,211.3
+16.8,0.86,15.080,216.4,17.3,0.86,16.490,217.6
+16.6,0.86,13.880,227.6,17.3,0.86,15.050,227.4
+16.9,0.86,13.640,230.5,17.5,0.86,14.520,231.2
+16.6,0.86,11.040,217.3,17.7,0.86,11.970,219.5
+17.7,0.86,5.800,227.1,17.6,0.86,6.100,228.5
+19.9,0.86,4.990,241.2,19.7,0.86,5.080,241.5
+22.1,0.86,3.790,257.5,21.8,0.86,3.850,257.4
+24.1,0.86,3.920,267.8,23.9,0.86,3.980,267.4
+25.4,0.86,4.070,281.8,25.2,0.86,4.120,281.1
+26.2,0.86,4.260,284.5,26.0,0.86,4.320,284.1
+26.5,0.86,4.580,272.1,26.3,0.86,4.620,272.0
+26.6,0.86,5.650,263.2,26.3,0.86,5.670,263.3
+26.6,0.86,4.890,273.9,26.4,0.86,4.970,273.7
+26.5,0.86,6.400,275.7,26.3,0.86,6.540,276.1
+26.2,0.86,6.250,291.6,26.1,0.86,6.410,292.4
+26.0,0.86,5.710,293.2,25.8,0.86,5.630,293.4
+25.3,0.86,11.240,273.8,25.3,0.86,11.340,275.2
+17.8,0.86,11.990,138.9,17.9,0.86,13.270,138.2
+16.7,0.86,12.540,141.6,16.8,0.86,13.900,141.0
+15.7,0.86,13.930,132.0,15.8,0.86,14.930,132.8
+15.2,0.86,12.900,138.6,15.7,0.86,13.350,140.9
+14.9,0.86,12.020,147.7,15.7,0.86,12.040,150.3
+13.8,0.86,8.840,157.7,14.4,0.86,9.170,163.4
+14.1,0.86,6.420,181.7,15.1,0.86,6.280,190.1
+12.2,0.86,3.150,288.7,12.4,0.86,3.200,290.4
+10.1,0.86,4.620,6.1,10.3,0.86,4.980,8.0
+10.4,0.86,6.960,30.8,11.0,0.86,7.200,28.1
+10.7,0.86,3.420,24.5,11.4,0.86,4.070,27.0
+11.8,0.86,4.490,336.4,11.6,0.86,4.470,337.2
+14.2,0.86,4.430,354.7,14.0,0.86,4.440,355.0
+16.3,0.86,4.390,7.8,16.1,0.86,4.410,8.4
+18.6,0.86,3.860,7.3,18.4,0.86,3.900,8.0
+20.3,0.86,3.860,6.6,20.0,0.86,3.880,6.7
+21.4,0.86,3.310,8.2,21.2,0.86,3.330,8.7
+22.2,0.86,2.740,12.7,22.0,0.86,2.760,13.1
+22.8,0.86,2.660,10.2,22.6,0.86,2.670,10.4
+23.1,0.86,1.870,22.9,22.8,0.86,1.870,22.7
+23.1,0.86,1.390,21.2,22.9,0.86,1.370,21.0
+22.8,0.86,1.980,44.6,22.6,0.86,1.950,44.7
+22.5,0.86,2.370,55.8,22.4,0.86,2.340,57.0
+22.2,0.86,2.840,89.5,22.1,0.86,2.710,90.0
+20.7,0.86,6.120,108.0,20.8,0.86,6.120,104.8
+19.7,0.86,8.510,146.8,19.8,0.86,8.290,147.0
+19.4,0.86,8.520,149.2,19.6,0.86,8.490,149.3
+18.8,0.86,8.890,157.3,19.0,0.86,9.090,156.5
+18.4,0.86,8.890,152.0,18.6,0.86,9.180,151.7
+17.8,0.86,8.960,155.9,18.1,0.86,9.270,155.4
+16.9,0.86,8.860,155.4,17.2,0.86,9.180,154.8
+16.5,0.86,9.210,156.9,17.0,0.86,9.540,155.9
+17.1,0.86,8.380,160.6,17.8,0.86,8.630,160.5
+16.7,0.86,7.300,167.1,17.5,0.86,7.570,165.1
+15.7,0.86,7.160,172.6,16.5,0.86,7.620,168.8
+17.1,0.86,4.490,177.5,17.2,0.86,5.180,176.1
+20.1,0.87,5.300,170.6,19.9,0.87,5.380,170.7
+22.3,0.86,6.740,171.3,22.0,0.86,6.850,171.3
+24.3,0.86,7.740,177.4,24.1,0.86,7.880,177.6
+25.6,0.86,7.640,189.3,25.4,0.86,7.780,189.5
+26.7,0.86,7.330,207.0,26.5,0.86,7.460,207.1
+27.4,0.86,7.160,204.3,27.1,0.86,7.290,204.6
+27.9,0.86,7.860,213.5,27.7,0.86,8.020,213.7
+28.2,0.86,9.850,212.6,27.9,0.86,10.080,212.9
+27.9,0.86,8.300,212.8,27.7,0.86,8.690,213.3
+27.5,0.86,8.050,208.2,27.4,0.86,8.460,211.6
+27.3,0.86,8.900,210.7,27.3,0.86,8.930,212.7
+27.4,0.86,10.080,220.7,27.5,0.86,10.260,221.7
+27.1,0.86,9.550,213.9,27.5,0.86,9.860,216.2
+24.0,0.86,10.140,210.3,25.0,0.86,10.920,213.0
+24.0,0.86,11.330,217.2,24.8,0.86,12.610,221.3
+21.1,0.86,11.580,228.6,22.4,0.86,13.400,233.8
+22.3,0.86,12.570,236.0,23.3,0.86,13.870,238.3
+22.0,0.86,13.650,236.8,23.3,0.86,14.380,239.7
+22.8,0.86,12.500,247.6,23.6,0.86,12.830,250.4
+21.8,0.86,12.340,250.2,22.6,0.86,12.250,251.6
+21.9,0.86,13.140,248.5,22.5,0.86,13.590,250.1
+19.7,0.86,13.250,235.5,20.6,0.86,14.160,238.4
+19.6,0.86,11.020,234.7,19.9,0.86,11.570,236.3
+20.3,0.86,7.870,227.1,20.2,0.86,8.390,230.2
+23.0,0.86,7.080,231.7,22.8,0.86,7.150,232.7
+25.7,0.86,6.860,248.7,25.4,0.86,6.970,248.8
+27.0,0.86,8.030,237.0,26.8,0.86,8.180,237.0
+27.5,0.86,8.810,232.8,27.3,0.86,8.980,232.8
+27.7,0.86,10.360,230.2,27.4,0.86,10.550,230.2
+27.7,0.86,11.090,228.2,27.5,0.86,11.310,228.2
+27.5,0.86,11.790,230.1,27.3,0.86,12.020,230.0
+27.1,0.86,11.730,222.2,26.9,0.86,12.000,222.4
+26.7,0.86,11.350,220.1,26.5,0.86,11.690,220.2
+26.1,0.86,11.090,226.1,26.0,0.86,12.070,227.3
+26.1,0.86,10.370,222.2,26.0,0.86,10.920,224.6
+25.8,0.85,10.860,214.8,25.9,0.85,11.280,217.5
+23.2,0.85,13.860,203.3,23.5,0.85,15.220,206.0
+21.9,0.85,15.490,208.1,22.1,0.85,16.980,209.8
+19.5,0.85,12.410,223.5,19.8,0.85,13.330,226.4
+18.8,0.85,12.290,223.6,19.3,0.85,13.280,226.3
+18.0,0.85,12.520,223.7,18.5,0.85,13.470,227.5
+18.2,0.85,13.860,230.5,18.9,0.85,15.520,235.1
+16.4,0.85,12.820,226.7,17.1,0.85,13.770,230.7
+15.6,0.85,11.640,226.6,16.4,0.85,12.660,233.2
+14.8,0.85,11.790,230.4,15.9,0.85,12.340,238.1
+14.7,0.85,10.620,233.9,16.1,0.85,10.570,241.5
+13.7,0.85,8.470,227.6,15.2,0.85,8.940,233.0
+16.5,0.86,5.670,224.3,16.7,0.86,6.420,229.5
+19.3,0.86,5.320,239.1,19.1,0.86,5.400,239.3
+20.4,0.86,5.070,222.2,20.2,0.86,5.150,222.2
+21.3,0.86,4.930,203.1,21.0,0.86,5.010,203.0
+22.0,0.85,6.310,182.4,21.7,0.85,6.420,182.3
+22.5,0.86,8.450,173.6,22.2,0.86,8.630,173.7
+22.8,0.85,11.160,179.9,22.6,0.85,11.380,179.8
+21.8,0.85,12.390,191.2,21.6,0.85,12.630,191.1
+20.5,0.86,12.010,198.0,20.2,0.86,12.240,197.9
+18.9,0.86,12.250,199.0,18.7,0.86,12.520,199.0
+17.2,0.86,11.590,211.5,17.1,0.86,12.380,211.7
+15.6,0.86,10.520,210.3,15.5,0.86,11.310,210.8
+14.8,0.86,10.980,206.8,14.7,0.86,12.530,208.8
+13.8,0.86,11.060,198.3,14.0,0.86,12.320,201.2
+13.5,0.86,11.380,197.4,13.6,0.86,12.470,201.1
+13.0,0.86,11.940,218.2,13.3,0.86,12.120,222.3
+12.9,0.86,8.400,241.0,13.0,0.86,8.090,249.7
+10.8,0.86,0.380,177.3,10.7,0.86,0.390,218.3
+8.9,0.86,5.820,4.8,8.8,0.86,5.440,5.4
+7.7,0.86,5.160,326.8,7.7,0.86,4.470,341.5
+8.0,0.86,2.400,343.8,8.2,0.86,2.410,354.7
+7.2,0.86,4.800,340.7,7.1,0.86,4.600,344.8
+5.3,0.86,3.720,344.6,5.8,0.86,3.840,353.4
+4.7,0.86,2.330,347.3,4.4,0.86,2.660,354.5
+4.7,0.86,2.150,27.6,5.7,0.86,3.210,39.7
+9.3,0.86,2.400,42.8,9.2,0.86,2.460,45.9
+13.1,0.86,2.010,37.2,12.8,0.86,2.040,40.6
+14.4,0.86,3.730,86.7,14.2,0.86,3.740,87.8
+15.0,0.86,4.580,63.7,14.8,0.86,4.610,64.8
+12.6,0.86,12.910,31.5,12.3,0.86,12.980,32.0
+12.8,0.86,10.620,26.2,12.6,0.86,10.730,26.5
+10.2,0.86,16.160,349.3,10.0,0.86,16.370,349.3
+9.1,0.86,13.150,332.7,8.9,0.86,13.310,333.1
+9.3,0.86,10.610,340.4,9.1,0.86,10.740,340.5
+8.3,0.87,11.470,345.5,8.1,0.87,11.800,345.7
+7.4,0.87,10.690,349.6,7.2,0.87,10.920,349.8
+7.1,0.87,9.780,345.4,6.9,0.87,9.970,345.5
+6.5,0.87,8.540,333.2,6.3,0.87,8.810,334.4
+6.1,0.87,8.850,333.3,5.9,0.87,9.150,334.0
+5.8,0.87,9.360,333.7,5.6,0.87,9.510,333.9
+5.4,0.87,8.490,334.0,5.2,0.87,8.610,334.2
+4.9,0.87,8.010,334.2,4.7,0.87,8.200,334.2
+4.1,0.87,6.860,328.1,3.9,0.87,7.060,328.0
+3.2,0.87,6.250,310.8,3.0,0.87,6.380,311.8
+2.7,0.87,8.470,306.7,2.6,0.87,8.920,309.4
+2.9,0.87,8.950,305.9,2.9,0.87,9.360,309.1
+3.5,0.86,8.040,309.0,3.4,0.86,8.580,309.8
+4.7,0.86,10.290,311.0,4.5,0.86,10.480,311.0
+5.4,0.87,8.490,302.7,5.1,0.87,8.620,302.9
+6.7,0.87,9.250,314.3,6.5,0.87,9.430,314.3
+8.4,0.86,9.110,309.6,8.2,0.86,9.280,309.4
+9.8,0.86,10.660,310.1,9.6,0.86,10.850,310.0
+10.9,0.86,9.800,310.5,10.6,0.86,9.950,310.4
+11.9,0.86,8.640,311.0,11.7,0.86,8.770,310.9
+12.8,0.86,8.740,316.9,12.5,0.86,8.870,316.8
+13.6,0.86,8.180,318.3,13.3,0.86,8.310,318.3
+14.0,0.86,7.550,320.8,13.8,0.86,7.690,320.7
+14.1,0.86,7.410,326.8,13.9,0.86,7.550,326.6
+13.9,0.86,6.890,337.1,13.7,0.86,7.260,336.9
+13.2,0.86,7.800,351.4,13.0,0.86,8.030,351.6
+12.1,0.86,5.110,12.4,12.0,0.86,5.560,13.0
+11.3,0.86,4.460,5.9,11.3,0.86,5.470,8.4
+9.6,0.86,7.070,44.8,9.3,0.86,7.230,48.6
+9.0,0.86,4.960,39.4,9.1,0.86,5.220,29.1
+8.5,0.86,2.740,6.1,8.7,0.86,3.260,5.3
+8.3,0.86,2.450,343.7,8.4,0.86,2.900,348.4
+7.8,0.86,2.290,354.8,8.0,0.86,2.700,357.3
+7.5,0.86,2.050,6.0,7.5,0.86,2.390,6.3
+7.4,0.86,1.430,8.7,7.4,0.86,1.720,10.6
+7.5,0.86,0.820,13.6,7.6,0.86,1.090,20.9
+7.5,0.87,1.730,16.7,7.6,0.87,2.070,19.3
+7.5,0.87,0.810,70.2,7.5,0.87,1.120,55.6
+8.9,0.87,1.710,17.0,8.7,0.87,1.700,18.2
+11.1,0.87,2.160,58.4,10.9,0.87,2.170,59.3
+13.2,0.87,2.230,42.8,13.0,0.87,2.210,43.6
+15.1,0.87,1.890,48.6,14.8,0.87,1.870,50.0
+16.9,0.87,2.010,69.5,16.7,0.87,2.000,71.2
+18.7,0.87,1.970,95.8,18.4,0.87,1.960,97.4
+19.9,0.87,2.850,117.9,19.7,0.87,2.870,118.9
+20.8,0.87,3.340,124.7,20.6,0.87,3.360,125.7
+21.2,0.86,4.170,151.1,20.9,0.86,4.200,151.5
+21.0,0.86,5.440,131.9,20.8,0.86,5.510,131.8
+19.7,0.87,8.590,133.5,19.5,0.87,8.970,133.3
+17.6,0.87,10.860,135.2,17.5,0.87,11.630,135.4
+15.9,0.87,11.400,136.4,15.8,0.87,12.200,136.1
+14.8,0.87,11.340,136.7,14.7,0.87,12.070,136.5
+14.3,0.87,11.860,139.6,14.2,0.87,12.570,139.3
+13.6,0.87,12.570,141.7,13.5,0.87,13.340,141.3
+12.4,0.87,13.690,144.4,12.3,0.87,14.460,144.2
+10.8,0.87,14.340,145.5,10.6,0.87,15.090,145.2
+9.5,0.87,14.780,147.5,9.4,0.87,15.450,147.3
+8.8,0.87,13.470,150.6,8.5,0.87,14.140,150.5
+8.6,0.87,12.770,154.0,8.4,0.87,13.290,153.8
+8.4,0.87,11.890,157.1,8.2,0.87,12.360,157.0
+8.5,0.87,11.660,155.6,8.3,0.87,12.210,155.6
+8.6,0.87,10.350,156.0,8.4,0.87,10.720,156.2
+8.7,0.87,8.960,153.9,8.5,0.87,9.190,154.1
+9.5,0.87,9.160,149.3,9.3,0.87,9.300,149.7
+12.0,0.87,8.760,150.2,11.8,0.87,8.890,150.4
+15.2,0.87,8.660,160.0,15.0,0.87,8.840,160.6
+18.0,0.87,10.080,168.9,17.7,0.87,10.290,169.1
+20.0,0.87,10.570,163.1,19.7,0.87,10.800,163.5
+21.8,0.87,11.010,167.9,21.5,0.87,11.260,168.2
+22.8,0.87,11.410,171.1,22.5,0.87,11.670,171.4
+23.3,0.87,10.450,175.6,23.1,0.87,10.740,175.9
+23.0,0.87,10.920,162.2,22.9,0.87,11.350,162.3
+22.1,0.86,10.110,146.7,22.0,0.86,10.780,147.1
+19.7,0.87,13.050,133.7,19.6,0.87,13.950,134.1
+17.8,0.87,14.800,133.1,17.6,0.87,15.480,133.1
+17.7,0.87,15.520,132.9,17.6,0.87,16.250,133.0
+16.4,0.87,14.480,135.4,16.3,0.87,15.400,135.3
+15.5,0.87,13.620,138.9,15.5,0.87,14.540,138.7
+15.1,0.87,12.650,141.1,15.1,0.87,13.470,141.3
+14.6,0.87,11.830,144.0,14.7,0.87,12.660,144.3
+14.6,0.87,11.440,151.7,14.8,0.87,12.130,153.9
+14.7,0.87,9.530,163.1,15.1,0.87,10.200,170.7
+14.4,0.87,6.280,193.0,14.8,0.87,6.140,206.6
+12.5,0.87,3.260,342.1,12.5,0.87,3.640,340.8
+11.3,0.87,8.160,339.6,11.6,0.87,8.580,341.8
+11.1,0.87,14.140,8.7,10.9,0.87,14.490,9.0
+11.1,0.87,15.350,16.2,10.9,0.87,15.640,16.4
+11.6,0.87,14.380,23.0,11.3,0.87,14.630,23.1
+12.5,0.87,13.120,24.5,12.2,0.87,13.330,24.5
+13.5,0.87,12.490,27.3,13.3,0.87,12.680,27.4
+14.6,0.88,11.900,27.3,14.4,0.88,12.080,27.4
+15.7,0.88,10.900,36.4,15.5,0.88,11.090,36.5
+16.2,0.88,10.490,39.5,16.0,0.88,10.660,39.6
+16.4,0.88,10.360,46.3,16.2,0.88,10.510,46.4
+16.5,0.88,9.680,53.2,16.2,0.88,9.860,53.2
+16.1,0.88,9.420,53.5,15.9,0.88,9.600,53.6
+15.3,0.88,8.740,61.5,15.1,0.88,9.310,62.0
+14.3,0.88,10.370,55.8,14.2,0.88,10.960,56.8
+13.4,0.88,10.340,64.6,13.4,0.88,11.430,64.2
+12.8,0.88,9.910,66.7,12.8,0.88,10.470,66.6
+12.3,0.88,9.860,77.8,12.3,0.88,10.760,77.2
+11.8,0.88,9.430,77.3,11.8,0.88,10.010,77.9
+11.3,0.88,9.160,80.9,11.3,0.88,9.710,81.7
+10.7,0.88,8.650,91.2,10.6,0.88,9.440,91.2
+10.1,0.88,8.020,96.2,10.1,0.88,8.820,96.1
+9.3,0.88,6.600,98.3,9.4,0.88,7.870,98.0
+8.8,0.88,6.650,104.7,9.0,0.88,7.810,104.6
+8.7,0.88,5.750,105.6,8.9,0.88,6.500,105.8
+8.6,0.88,4.870,102.4,9.0,0.88,5.440,103.3
+8.4,0.88,0.790,92.1,8.5,0.88,1.480,99.0
+10.3,0.88,3.160,121.9,10.1,0.88,3.190,121.8
+11.3,0.88,3.580,151.8,11.0,0.88,3.580,152.3
+12.9,0.88,3.420,158.3,12.6,0.88,3.440,159.0
+14.3,0.88,3.250,178.7,14.1,0.88,3.280,179.2
+16.2,0.88,3.120,194.9,16.0,0.88,3.180,195.4
+17.6,0.88,4.120,201.8,17.4,0.88,4.180,202.1
+19.0,0.88,4.070,206.4,18.8,0.88,4.150,206.9
+20.0,0.87,4.390,216.6,19.8,0.87,4.470,216.6
+20.5,0.87,4.530,210.0,20.3,0.87,4.620,210.4
+20.5,0.87,5.330,198.4,20.3,0.87,5.400,198.7
+20.2,0.87,5.820,171.7,20.0,0.87,6.070,172.5
+17.1,0.87,10.000,142.1,17.2,0.87,10.670,143.6
+16.4,0.87,10.090,152.3,16.6,0.87,10.560,154.6
+15.5,0.87,10.610,151.9,15.7,0.87,11.230,152.9
+14.6,0.87,10.520,152.0,14.8,0.87,11.330,153.3
+13.7,0.87,11.100,152.9,13.9,0.87,11.920,152.9
+14.2,0.87,11.900,160.0,14.6,0.87,12.680,162.6
+14.0,0.87,11.480,180.9,14.3,0.87,12.410,183.3
+13.8,0.87,11.590,187.7,14.1,0.87,12.580,189.7
+13.4,0.87,12.020,195.0,13.8,0.87,13.020,198.2
+12.8,0.87,10.980,202.9,13.3,0.87,12.000,206.8
+12.3,0.87,6.750,210.6,12.4,0.87,7.730,214.7
+12.4,0.87,8.240,200.9,12.5,0.87,9.000,205.3
+13.6,0.87,10.090,208.8,13.5,0.87,10.810,210.7
+16.1,0.87,9.210,212.3,16.0,0.87,9.340,212.9
+18.3,0.87,10.140,213.3,18.0,0.87,10.290,213.6
+20.2,0.87,7.390,212.0,20.0,0.87,7.530,212.2
+22.3,0.87,5.190,213.8,22.0,0.87,5.320,214.1
+24.0,0.87,8.600,221.1,23.8,0.87,8.740,221.3
+25.2,0.87,10.730,231.3,24.9,0.87,10.950,231.5
+15.7,0.87,13.130,251.7,15.7,0.87,13.190,251.6
+20.4,0.87,7.640,185.9,20.3,0.87,7.800,188.6
+21.0,0.87,11.360,202.2,20.8,0.87,11.650,202.5
+20.8,0.87,8.110,204.7,20.6,0.87,8.270,204.9
+17.7,0.87,8.720,89.2,17.9,0.87,8.630,89.7
+16.9,0.87,8.920,145.3,17.3,0.87,9.230,148.8
+16.3,0.87,9.750,166.5,16.4,0.87,10.270,169.1
+16.4,0.87,10.490,189.3,16.4,0.87,10.650,191.1
+15.9,0.87,10.410,201.9,16.0,0.87,10.840,204.0
+15.4,0.87,8.460,218.0,15.9,0.87,9.120,223.0
+14.4,0.87,9.790,196.4,14.7,0.87,10.330,198.6
+14.3,0.87,10.880,194.6,14.6,0.87,11.670,195.6
+14.3,0.87,11.300,200.8,14.4,0.87,12.060,201.7
+13.6,0.87,11.090,208.8,14.0,0.87,11.660,210.5
+13.1,0.87,9.720,213.5,13.5,0.87,10.540,214.9
+10.7,0.87,6.670,169.1,11.2,0.87,7.210,176.8
+11.9,0.87,8.110,190.9,12.2,0.87,8.600,193.9
+13.0,0.87,6.460,217.0,13.1,0.87,7.480,218.5
+15.6,0.87,4.220,227.8,15.4,0.87,4.290,228.2
+18.1,0.87,2.520,225.2,17.9,0.87,2.550,225.6
+19.8,0.87,2.210,199.3,19.6,0.87,2.240,199.6
+21.2,0.87,2.180,182.0,20.9,0.87,2.210,182.3
+22.2,0.87,3.890,154.1,21.9,0.87,3.920,154.7
+23.2,0.87,4.660,164.4,23.0,0.87,4.730,164.9
+24.0,0.87,6.330,168.0,23.8,0.87,6.450,168.3
+24.2,0.87,7.510,163.8,24.0,0.87,7.670,164.0
+24.4,0.87,7.230,166.3,24.2,0.87,7.390,166.6
+24.2,0.87,6.690,173.0,24.0,0.87,6.940,173.1
+18.0,0.87,10.240,152.4,17.8,0.87,10.710,152.3
+17.8,0.87,11.350,150.6,17.7,0.87,11.980,150.5
+16.2,0.87,9.840,74.9,16.1,0.87,9.950,75.5
+14.8,0.87,4.920,133.3,14.6,0.87,5.430,130.7
+14.5,0.87,1.790,61.6,14.6,0.87,1.810,76.5
+14.1,0.87,7.970,104.9,13.9,0.87,8.290,104.3
+14.4,0.87,8.560,124.0,14.4,0.87,9.190,124.2
+14.8,0.87,11.300,136.8,15.0,0.87,12.130,135.0
+15.8,0.87,11.000,147.3,16.1,0.87,11.880,146.5
+14.5,0.87,11.020,167.3,14.7,0.87,12.020,166.0
+14.9,0.87,10.650,189.2,15.4,0.87,11.330,189.3
+15.2,0.87,9.350,188.2,15.7,0.87,9.790,189.2
+13.7,0.87,4.040,186.0,13.6,0.87,4.750,187.4
+14.8,0.87,5.560,99.2,14.6,0.87,5.620,101.8
+14.2,0.87,6.820,65.9,14.1,0.87,7.090,66.5
+13.2,0.87,10.460,100.4,13.3,0.87,10.730,103.8
+13.4,0.87,8.890,60.8,13.5,0.87,9.430,62.4
+15.4,0.87,7.020,113.6,15.2,0.87,7.090,114.0
+15.6,0.87,10.010,118.0,15.4,0.87,10.190,118.2
+17.4,0.87,10.570,140.7,17.2,0.87,10.780,141.0
+17.6,0.87,10.930,134.1,17.4,0.87,11.130,134.3
+18.2,0.87,9.380,143.8,18.0,0.87,9.550,144.1
+18.3,0.87,10.670,135.6,18.1,0.87,10.910,135.4
+17.9,0.87,10.500,143.7,17.7,0.87,10.740,143.5
+16.8,0.87,11.240,137.8,16.6,0.87,11.850,137.3
+16.6,0.87,14.780,150.7,16.5,0.87,15.380,150.7
+15.7,0.87,9.020,164.0,15.6,0.87,9.520,163.2
+15.1,0.87,13.300,134.8,14.9,0.87,13.950,135.1
+14.5,0.87,13.890,149.9,14.4,0.87,14.580,149.6
+13.9,0.87,13.610,145.3,13.7,0.87,14.250,145.2
+13.3,0.87,11.730,142.9,13.1,0.87,12.450,142.8
+13.2,0.87,10.390,161.6,13.2,0.87,10.970,163.1
+13.1,0.87,11.890,172.1,13.1,0.87,12.860,173.1
+12.6,0.87,10.840,168.8,12.7,0.87,11.700,169.7
+12.4,0.87,11.470,174.8,12.4,0.87,12.140,176.0
+12.5,0.87,12.860,189.6,12.6,0.87,13.780,190.3
+12.3,0.87,11.630,190.3,12.3,0.87,12.350,190.4
+13.0,0.87,8.400,186.0,12.8,0.87,8.620,186.6
+15.0,0.87,9.610,189.6,14.8,0.87,9.820,189.9
+15.9,0.87,10.110,191.8,15.7,0.87,10.360,192.2
+16.2,0.86,10.530,190.6,15.9,0.86,10.730,190.8
+17.9,0.86,9.260,188.3,17.7,0.86,9.450,188.7
+19.9,0.86,8.860,193.2,19.7,0.86,9.040,193.6
+21.2,0.86,9.630,205.0,21.0,0.86,9.840,205.0
+22.0,0.86,10.410,208.6,21.8,0.86,10.630,208.6
+22.7,0.86,10.230,204.7,22.5,0.86,10.480,204.9
+23.6,0.86,11.600,203.3,23.3,0.86,11.900,203.6
+23.8,0.86,10.270,223.9,23.6,0.86,10.660,223.8
+23.2,0.86,8.360,233.0,23.1,0.86,8.940,233.9
+22.9,0.86,8.520,235.5,22.9,0.86,8.910,237.7
+22.5,0.86,7.790,246.4,22.6,0.86,8.250,249.6
+22.0,0.86,7.650,242.8,22.2,0.86,8.090,248.9
+20.4,0.86,9.220,285.9,20.4,0.86,10.040,288.7
+19.4,0.86,10.010,281.7,19.5,0.86,10.720,285.2
+19.0,0.86,9.130,275.3,19.1,0.86,9.610,278.8
+18.3,0.86,10.600,279.0,18.5,0.86,11.100,282.2
+16.9,0.86,10.250,283.0,17.2,0.86,10.940,286.4
+16.8,0.86,9.880,287.9,16.9,0.86,10.210,292.0
+15.9,0.86,7.410,284.8,16.1,0.86,7.770,289.3
+15.3,0.86,6.300,284.8,15.4,0.86,6.770,290.4
+15.1,0.86,5.520,289.4,15.1,0.86,5.670,293.2
+14.0,0.87,2.810,303.6,14.1,0.87,3.330,308.6
+15.0,0.87,1.250,317.6,14.8,0.87,1.300,314.3
+16.5,0.87,0.610,343.4,16.3,0.87,0.590,339.9
+17.8,0.87,0.830,354.4,17.6,0.87,0.780,353.0
+19.0,0.86,1.220,148.6,18.8,0.86,1.250,151.0
+20.3,0.86,3.810,191.3,20.1,0.86,3.880,191.6
+21.1,0.86,5.150,184.9,20.9,0.86,5.240,185.4
+21.6,0.86,6.290,178.0,21.4,0.86,6.410,178.5
+22.0,0.86,8.310,188.6,21.8,0.86,8.460,188.6
+22.5,0.86,7.730,192.2,22.3,0.86,7.930,192.2
+22.4,0.86,8.680,202.7,22.2,0.86,8.920,202.5
+22.3,0.86,7.810,200.9,22.1,0.86,8.200,201.8
+22.2,0.86,6.810,190.0,22.1,0.86,7.180,189.9
+21.9,0.86,8.000,176.3,22.0,0.86,8.360,179.6
+19.5,0.86,10.690,154.6,19.5,0.86,11.430,155.2
+18.6,0.86,12.500,165.3,18.8,0.86,13.850,166.4
+17.5,0.86,11.730,166.7,17.7,0.86,12.940,168.2
+16.9,0.86,12.100,170.9,17.1,0.86,13.330,172.7
+16.9,0.86,11.160,183.8,17.2,0.86,12.450,185.8
+17.0,0.86,10.210,173.9,17.1,0.86,11.240,175.3
+16.6,0.86,11.530,167.8,16.5,0.86,12.340,168.6
+15.4,0.86,11.430,168.5,15.4,0.86,12.480,170.0
+16.0,0.86,13.870,183.6,15.9,0.86,14.560,184.1
+16.4,0.86,11.990,192.7,16.2,0.86,12.620,193.0
+16.4,0.86,10.710,204.1,16.2,0.86,11.210,204.1
+17.7,0.86,10.100,212.4,17.4,0.86,10.290,212.5
+19.6,0.86,8.230,225.1,19.4,0.86,8.400,225.3
+20.5,0.86,8.860,224.6,20.3,0.86,9.030,224.7
+21.4,0.86,10.390,217.9,21.2,0.86,10.610,217.9
+22.3,0.86,11.370,214.4,22.1,0.86,11.650,214.5
+22.8,0.86,12.180,216.3,22.5,0.86,12.460,216.1
+23.1,0.86,12.700,211.6,22.9,0.86,13.040,211.6
+22.8,0.86,12.550,211.3,22.6,0.86,12.890,211.3
+22.8,0.86,16.080,217.8,22.6,0.86,16.510,217.8
+22.3,0.86,15.690,225.1,22.1,0.86,16.150,225.1
+21.2,0.86,11.990,229.2,21.1,0.86,12.960,229.6
+19.9,0.86,10.750,232.9,19.8,0.86,11.980,235.9
+18.5,0.86,11.500,251.7,18.5,0.86,12.530,252.5
+16.0,0.86,11.310,277.0,15.7,0.86,12.200,277.7
+13.6,0.86,9.140,268.0,13.6,0.86,10.310,268.6
+12.6,0.86,13.040,266.5,12.4,0.86,14.310,268.1
+10.6,0.86,8.590,252.6,10.6,0.86,9.610,254.2
+9.3,0.86,9.740,247.0,9.3,0.86,10.700,251.1
+8.0,0.86,12.020,258.7,8.0,0.86,13.270,259.8
+7.3,0.86,16.040,264.2,7.2,0.86,17.010,264.6
+6.5,0.86,15.880,260.6,6.4,0.86,16.870,261.1
+5.9,0.86,15.600,258.1,5.8,0.86,16.630,258.6
+5.6,0.86,17.620,249.7,5.5,0.86,18.460,250.4
+6.5,0.86,16.560,250.2,6.3,0.86,16.970,250.5
+7.7,0.86,16.780,248.9,7.4,0.86,17.150,249.1
+9.7,0.86,15.050,254.7,9.4,0.86,15.380,254.8
+11.3,0.86,13.220,277.9,11.1,0.86,13.500,277.9
+12.2,0.86,10.770,287.5,12.0,0.86,10.970,287.5
+13.6,0.86,10.890,288.4,13.4,0.86,11.110,288.4
+14.7,0.86,10.810,292.5,14.5,0.86,11.020,292.6
+15.2,0.86,11.440,316.1,15.0,0.86,11.630,315.8
+15.1,0.86,10.160,307.6,14.8,0.86,10.340,307.5
+15.7,0.86,7.100,304.0,15.4,0.86,7.220,303.9
+15.9,0.86,6.020,313.4,15.7,0.86,6.150,313.9
+14.0,0.86,9.650,254.1,13.8,0.86,10.080,253.5
+13.6,0.86,6.250,298.7,13.5,0.86,6.450,299.1
+13.5,0.86,6.250,343.9,13.3,0.86,6.690,343.5
+13.5,0.87,5.280,349.1,13.4,0.87,5.920,347.3
+13.9,0.87,6.110,354.0,13.8,0.87,7.090,353.3
+12.2,0.87,8.310,342.1,12.2,0.87,8.220,348.2
+11.7,0.87,7.200,353.3,11.6,0.87,6.970,356.9
+11.1,0.87,4.460,11.0,11.1,0.87,4.950,11.4
+10.1,0.87,4.190,37.0,10.0,0.87,4.890,39.5
+9.4,0.87,6.680,54.1,9.2,0.87,7.450,54.6
+8.6,0.87,7.710,56.6,8.4,0.87,8.410,54.8
+8.2,0.87,7.700,61.9,8.3,0.87,7.960,59.3
+7.4,0.87,5.620,52.6,7.4,0.87,6.060,52.7
+7.3,0.87,2.510,74.2,7.3,0.87,2.870,74.2
+9.8,0.87,3.520,118.0,9.6,0.87,3.570,118.4
+11.4,0.87,3.590,148.2,11.2,0.87,3.640,148.7
+12.8,0.87,4.580,161.7,12.6,0.87,4.640,162.1
+13.8,0.87,5.630,162.6,13.6,0.87,5.700,163.2
+14.5,0.87,6.550,158.5,14.2,0.87,6.660,159.2
+14.8,0.87,6.430,166.4,14.5,0.87,6.590,167.2
+14.8,0.87,6.850,168.7,14.6,0.87,6.980,168.5
+10.4,0.87,10.330,330.2,10.3,0.87,10.460,329.3
+13.0,0.87,4.520,90.7,12.8,0.87,4.410,92.1
+13.3,0.87,4.970,86.4,13.1,0.87,4.910,86.7
+13.1,0.87,9.100,138.6,13.0,0.87,9.340,137.6
+12.3,0.87,9.410,110.9,12.6,0.87,9.230,113.8
+12.3,0.87,10.880,128.8,12.8,0.87,11.670,129.1
+11.7,0.87,11.920,135.2,11.9,0.87,12.910,135.8
+11.2,0.87,12.470,145.5,11.4,0.87,13.360,145.3
+11.0,0.87,12.580,155.7,11.2,0.87,13.560,154.7
+11.2,0.87,14.090,157.5,11.4,0.87,15.290,156.9
+11.1,0.87,14.030,168.0,11.2,0.87,15.230,168.2
+10.7,0.87,14.130,172.5,11.0,0.87,15.410,172.2
+10.3,0.87,13.840,179.9,10.6,0.87,15.260,179.7
+9.8,0.87,12.950,185.7,10.1,0.87,14.260,186.0
+9.6,0.87,12.710,192.4,10.0,0.87,14.020,192.8
+9.3,0.87,11.870,198.3,9.7,0.87,13.050,199.6
+9.5,0.87,9.220,193.0,9.5,0.87,10.250,195.2
+12.2,0.87,9.440,190.5,12.0,0.87,9.580,190.8
+14.6,0.87,9.860,197.5,14.4,0.87,10.030,197.7
+16.6,0.87,9.780,203.4,16.4,0.87,9.970,203.5
+18.3,0.87,9.080,206.9,18.1,0.87,9.250,207.0
+19.5,0.87,8.190,210.9,19.3,0.87,8.350,211.1
+20.3,0.87,8.330,209.4,20.0,0.87,8.500,209.6
+20.9,0.87,8.630,207.5,20.7,0.87,8.800,207.6
+21.4,0.87,8.920,205.8,21.1,0.87,9.110,206.1
+21.7,0.87,8.800,200.8,21.4,0.87,9.000,201.1
+21.7,0.87,8.760,203.5,21.5,0.87,9.010,203.6
+21.4,0.87,10.620,198.3,21.3,0.87,11.280,199.0
+20.3,0.87,11.420,186.1,20.4,0.87,12.160,187.6
+19.3,0.87,12.650,185.7,19.6,0.87,13.740,187.3
+18.1,0.87,12.680,184.8,18.4,0.87,13.920,185.9
+17.9,0.87,14.230,191.1,18.3,0.87,15.580,191.7
+17.3,0.87,13.120,189.8,17.5,0.87,14.230,190.7
+16.0,0.87,13.450,187.5,16.2,0.87,14.590,188.5
+15.4,0.87,14.600,195.9,15.6,0.87,15.930,196.5
+14.7,0.87,13.900,197.7,15.0,0.87,15.240,199.1
+14.1,0.87,14.300,203.7,14.4,0.87,15.770,204.5
+13.5,0.87,13.140,207.3,13.8,0.87,14.530,208.5
+13.0,0.87,13.000,212.7,13.3,0.87,14.470,213.8
+12.7,0.87,13.260,212.6,13.0,0.87,14.550,213.8
+14.7,0.87,12.290,212.5,14.5,0.87,12.790,212.8
+16.4,0.87,12.360,211.0,16.2,0.87,12.600,211.2
+18.4,0.87,11.780,212.3,18.2,0.87,12.010,212.5
+20.6,0.87,9.500,221.0,20.3,0.87,9.720,221.0
+22.2,0.87,9.500,226.2,22.0,0.87,9.690,226.3
+23.5,0.87,9.280,225.8,23.3,0.87,9.460,225.9
+24.6,0.87,8.450,223.2,24.4,0.87,8.610,223.4
+25.5,0.87,8.570,220.3,25.2,0.87,8.750,220.6
+26.0,0.87,8.830,221.3,25.8,0.87,9.020,221.5
+26.7,0.87,9.530,228.6,26.4,0.87,9.780,228.7
+26.6,0.86,10.370,224.1,26.4,0.86,10.650,224.3
+26.4,0.86,9.990,222.4,26.3,0.86,10.700,223.9
+24.9,0.86,9.010,191.3,24.9,0.86,9.240,192.6
+23.5,0.86,11.910,188.0,23.8,0.86,13.180,188.5
+21.8,0.86,12.880,188.1,22.1,0.86,14.110,189.2
+20.8,0.86,13.620,194.9,21.0,0.86,14.990,196.1
+19.9,0.86,12.500,194.5,20.2,0.86,13.710,196.1
+18.9,0.86,13.310,197.0,19.1,0.86,14.660,198.6
+17.8,0.86,13.530,203.9,17.9,0.86,14.790,205.4
+16.8,0.86,12.830,206.6,17.0,0.86,14.230,208.4
+15.8,0.86,13.990,215.4,15.9,0.86,15.210,216.0
+14.8,0.86,13.560,224.3,15.1,0.86,14.600,226.1
+15.9,0.86,11.090,246.9,18.4,0.86,11.610,259.7
+19.8,0.86,10.170,286.6,20.3,0.86,10.790,291.1
+20.3,0.86,9.060,285.3,20.3,0.86,9.550,287.1
+19.7,0.86,7.400,342.6,19.6,0.86,7.470,341.5
+21.5,0.86,6.500,325.7,21.3,0.86,6.590,325.6
+22.1,0.86,7.040,329.4,21.9,0.86,7.140,329.4
+23.1,0.86,6.580,334.9,22.8,0.86,6.680,334.9
+23.4,0.86,6.430,341.7,23.1,0.86,6.510,341.5
+23.6,0.86,5.590,343.7,23.4,0.86,5.640,343.4
+23.8,0.86,4.980,2.9,23.5,0.86,5.000,2.4
+23.9,0.86,3.990,15.3,23.7,0.86,4.000,14.9
+23.7,0.86,4.030,32.3,23.5,0.86,3.990,31.8
+16.8,0.86,17.040,316.2,16.6,0.86,17.590,316.6
+17.2,0.86,6.830,27.2,17.0,0.86,7.150,27.2
+15.5,0.86,6.810,43.5,15.3,0.86,7.240,43.5
+12.7,0.86,10.630,11.0,12.6,0.86,11.240,10.3
+12.7,0.86,8.930,46.5,12.6,0.86,9.620,46.9
+12.2,0.87,6.850,346.0,12.0,0.87,7.140,348.0
+12.3,0.87,5.480,13.3,12.3,0.87,5.850,15.1
+11.3,0.87,9.610,11.8,11.2,0.87,10.070,13.8
+11.0,0.87,6.510,355.3,10.8,0.87,6.460,0.6
+10.7,0.87,7.590,340.9,10.6,0.87,7.880,345.4
+10.3,0.87,7.370,344.3,10.3,0.87,7.680,352.4
+10.8,0.87,5.960,11.5,10.7,0.87,6.120,15.8
+10.1,0.87,7.060,340.9,10.2,0.87,7.270,348.9
+10.3,0.87,5.740,16.3,10.4,0.87,6.460,18.3
+10.0,0.87,6.010,27.0,9.8,0.87,6.090,27.6
+10.7,0.87,6.230,28.6,10.4,0.87,6.310,28.7
+11.5,0.87,7.390,21.6,11.3,0.87,7.480,21.7
+12.2,0.87,6.620,13.1,12.0,0.87,6.710,13.0
+13.4,0.87,6.470,11.4,13.2,0.87,6.570,11.1
+14.9,0.87,7.250,10.4,14.7,0.87,7.360,10.2
+15.9,0.87,7.270,8.3,15.7,0.87,7.380,8.1
+16.7,0.87,6.930,6.4,16.4,0.87,7.030,6.0
+17.4,0.87,7.090,357.1,17.2,0.87,7.200,356.8
+17.9,0.87,7.630,354.0,17.6,0.87,7.740,354.0
+17.9,0.87,6.930,356.6,17.7,0.87,7.030,356.5
+17.7,0.87,5.720,12.6,17.5,0.87,5.900,11.5
+17.1,0.87,5.490,61.5,16.9,0.87,5.400,60.0
+16.7,0.87,4.330,83.7,16.4,0.87,4.210,81.9
+15.6,0.87,4.760,119.6,15.6,0.87,4.550,119.3
+14.4,0.87,7.030,139.4,14.4,0.87,6.780,138.0
+14.0,0.87,7.960,134.7,14.0,0.87,7.670,134.3
+13.5,0.87,8.080,145.6,13.5,0.87,7.890,143.8
+12.5,0.87,8.610,161.1,12.7,0.87,8.860,159.6
+11.5,0.87,10.550,171.1,11.7,0.87,10.660,169.4
+11.1,0.87,10.550,177.3,11.4,0.87,10.520,175.2
+10.7,0.87,11.350,191.4,11.1,0.87,11.410,189.4
+10.1,0.87,11.610,201.1,10.5,0.87,12.210,200.2
+10.0,0.87,10.790,210.7,10.3,0.87,11.450,210.8
+11.3,0.87,9.610,215.0,11.4,0.87,10.540,216.3
+14.3,0.87,8.810,220.4,14.1,0.87,8.890,220.6
+17.0,0.87,7.780,225.8,16.8,0.87,7.880,226.1
+19.1,0.87,6.270,242.1,18.9,0.87,6.360,242.4
+20.8,0.87,4.510,252.8,20.5,0.87,4.570,252.9
+22.1,0.87,3.270,289.3,21.9,0.87,3.300,289.4
+23.2,0.87,3.200,345.8,22.9,0.87,3.230,345.6
+23.6,0.87,4.060,13.1,23.4,0.87,4.080,12.9
+23.8,0.87,4.000,19.8,23.6,0.87,4.020,19.5
+23.9,0.87,2.470,25.1,23.7,0.87,2.490,24.2
+24.0,0.87,2.920,19.5,23.8,0.87,2.980,18.9
+24.0,0.87,1.490,31.9,23.8,0.87,1.580,27.6
+23.8,0.87,2.670,72.1,23.6,0.87,2.750,71.5
+22.4,0.87,5.620,61.2,22.2,0.87,7.020,63.2
+20.2,0.87,9.040,73.0,20.3,0.87,10.570,71.4
+18.9,0.87,10.360,85.3,19.0,0.87,11.690,84.7
+17.9,0.87,10.280,89.4,18.0,0.87,11.540,89.0
+17.2,0.87,10.140,95.7,17.3,0.87,11.300,95.3
+16.7,0.87,9.750,101.0,17.0,0.87,10.900,100.6
+17.0,0.87,9.490,95.6,17.1,0.87,10.420,95.8
+16.3,0.87,8.180,89.9,16.5,0.87,9.120,90.5
+15.1,0.87,5.490,87.8,15.4,0.87,6.670,88.7
+14.1,0.87,5.150,67.5,14.4,0.87,6.030,72.6
+12.1,0.87,6.320,43.2,12.6,0.87,7.200,45.7
+12.2,0.87,4.680,26.1,12.1,0.87,4.850,27.7
+14.2,0.87,4.870,33.1,14.0,0.87,4.920,33.9
+16.1,0.87,4.950,53.1,15.9,0.87,5.020,53.7
+17.9,0.87,5.190,73.6,17.6,0.87,5.240,74.1
+19.0,0.87,5.150,82.2,18.7,0.87,5.200,82.5
+19.9,0.87,4.720,92.5,19.6,0.87,4.770,93.0
+20.6,0.87,4.060,103.9,20.3,0.87,4.100,104.3
+21.3,0.87,3.470,119.8,21.0,0.87,3.480,120.2
+21.5,0.87,3.890,113.6,21.3,0.87,3.910,114.2
+21.8,0.87,4.510,124.6,21.6,0.87,4.570,125.1
+21.6,0.87,4.580,133.0,21.4,0.87,4.620,133.5
+20.7,0.87,7.320,129.2,20.5,0.87,7.580,129.4
+19.5,0.87,8.600,132.0,19.4,0.87,9.030,132.1
+17.8,0.87,8.860,113.2,17.7,0.87,9.540,112.9
+16.3,0.87,9.340,113.5,16.2,0.87,10.180,113.0
+15.1,0.87,10.090,122.3,15.1,0.87,10.950,121.9
+14.3,0.87,10.000,130.2,14.3,0.87,10.910,130.3
+13.4,0.87,9.540,139.8,13.4,0.87,10.400,139.1
+12.5,0.87,10.260,144.0,12.5,0.87,11.150,143.2
+11.6,0.87,9.500,154.1,11.6,0.87,10.310,153.1
+11.3,0.88,8.640,172.0,11.3,0.88,9.500,169.6
+11.1,0.88,5.430,199.2,11.0,0.88,5.750,195.4
+10.9,0.87,10.720,173.8,10.8,0.87,11.120,173.8
+10.8,0.87,9.230,163.6,10.6,0.87,9.690,164.1
+11.7,0.87,7.950,190.9,11.5,0.87,8.060,190.8
+13.4,0.87,6.100,170.6,13.2,0.87,6.200,170.8
+15.2,0.87,4.890,179.5,15.0,0.87,4.970,179.9
+17.0,0.87,4.600,178.3,16.8,0.87,4.690,178.9
+18.2,0.87,6.360,188.3,18.0,0.87,6.460,188.4
+19.6,0.87,7.340,197.4,19.4,0.87,7.470,197.8
+21.0,0.87,7.640,210.7,20.8,0.87,7.770,210.8
+22.2,0.87,7.050,200.7,21.9,0.87,7.170,201.0
+23.0,0.87,7.310,199.8,22.8,0.87,7.450,200.1
+23.4,0.87,8.430,205.8,23.1,0.87,8.570,205.9
+23.4,0.87,7.550,206.5,23.2,0.87,7.700,206.9
+23.2,0.87,7.400,192.2,23.1,0.87,7.760,193.8
+22.4,0.87,10.100,191.6,22.3,0.87,10.540,192.8
+21.5,0.87,10.970,187.1,21.6,0.87,11.560,187.9
+21.0,0.87,11.830,189.3,21.3,0.87,12.640,190.3
+19.8,0.87,11.970,188.4,20.2,0.87,12.910,189.7
+18.4,0.87,10.910,188.5,18.9,0.87,11.830,191.9
+17.5,0.87,12.700,198.5,17.9,0.87,13.810,200.0
+17.1,0.87,12.900,206.2,17.5,0.87,13.900,207.9
+17.0,0.87,12.990,212.5,17.5,0.87,14.110,214.0
+17.3,0.87,13.720,221.4,17.9,0.87,14.880,221.7
+17.2,0.87,13.850,227.4,17.8,0.87,14.910,227.8
+17.3,0.87,13.810,231.8,18.1,0.87,14.940,233.5
+17.2,0.87,12.580,227.9,17.7,0.87,13.470,229.0
+17.7,0.87,10.300,223.4,17.8,0.87,11.240,224.9
+20.5,0.87,9.460,217.7,20.3,0.87,9.610,218.3
+23.2,0.87,9.630,217.8,23.0,0.87,9.790,218.1
+25.2,0.87,9.500,223.4,24.9,0.87,9.670,223.5
+27.3,0.87,7.320,224.6,27.1,0.87,7.440,224.8
+28.8,0.87,6.750,228.6,28.5,0.87,6.880,228.8
+30.0,0.86,6.180,236.0,29.8,0.86,6.310,236.2
+31.2,0.86,6.900,239.3,30.9,0.86,7.020,239.8
+31.6,0.86,7.440,275.6,31.4,0.86,7.550,275.1
+28.4,0.86,14.170,196.8,28.2,0.86,14.430,197.1
+27.4,0.86,8.810,200.2,27.3,0.86,9.200,200.8
+28.3,0.86,0.670,313.2,28.2,0.86,0.980,312.6
+25.5,0.86,8.090,151.9,26.3,0.86,7.260,157.6
+25.5,0.86,12.390,232.1,25.4,0.86,12.930,233.4
+24.7,0.86,11.380,233.3,24.8,0.86,12.220,232.4
+23.4,0.86,9.850,219.0,23.7,0.86,10.380,225.4
+22.6,0.86,14.280,191.8,22.9,0.86,15.000,191.9
+22.6,0.86,12.450,210.6,23.4,0.86,12.930,212.5
+20.1,0.86,11.400,204.4,20.5,0.86,12.760,204.2
+21.2,0.86,12.390,228.5,22.4,0.86,13.210,233.1
+20.2,0.86,10.670,232.4,21.1,0.86,11.820,240.1
+22.0,0.86,10.230,266.9,23.7,0.86,10.950,281.3
+20.9,0.86,5.660,291.5,21.3,0.86,5.940,298.7
+20.3,0.86,6.270,273.1,21.0,0.86,6.640,282.0
+23.0,0.86,4.680,292.5,23.0,0.86,5.600,291.9
+26.0,0.86,4.860,306.4,25.8,0.86,4.990,305.4
+27.8,0.86,7.110,310.6,27.6,0.86,7.190,310.2
+29.7,0.86,6.750,309.2,29.4,0.86,6.850,309.2
+31.4,0.86,6.950,311.4,31.1,0.86,7.040,311.2
+31.9,0.86,6.620,305.3,31.6,0.86,6.710,305.0
+32.4,0.86,6.470,287.1,32.1,0.86,6.560,287.3
+32.7,0.86,7.930,299.0,32.4,0.86,8.010,298.9
+32.9,0.86,5.790,277.8,32.6,0.86,5.870,278.3
+32.9,0.86,4.670,276.0,32.7,0.86,4.730,276.1
+33.0,0.86,4.490,275.9,32.8,0.86,4.640,276.0
+32.9,0.86,6.350,281.3,32.6,0.86,6.160,281.4
+30.6,0.86,2.840,338.9,30.8,0.86,3.010,352.7
+31.3,0.86,4.930,60.8,31.2,0.86,5.370,57.3
+29.8,0.86,8.610,89.2,29.9,0.86,9.250,87.4
+29.0,0.86,9.740,88.6,29.1,0.86,10.230,87.3
+28.4,0.86,7.410,85.8,28.5,0.86,8.010,83.8
+24.8,0.86,2.840,62.5,25.1,0.86,3.510,71.2
+25.8,0.86,6.790,82.3,26.1,0.86,7.680,84.5
+23.5,0.86,1.550,50.5,23.7,0.86,1.860,67.7
+22.1,0.86,2.810,7.4,22.2,0.86,2.730,15.1
+19.2,0.86,5.040,11.7,19.5,0.86,5.330,12.3
+19.7,0.87,2.840,30.9,20.2,0.87,3.370,39.5
+19.4,0.87,4.420,71.6,19.6,0.87,5.080,75.9
+19.9,0.87,4.270,88.3,19.7,0.87,4.530,90.4
+21.8,0.87,4.880,92.8,21.6,0.87,4.990,93.2
+23.9,0.87,5.110,103.4,23.7,0.87,5.200,103.6
+25.5,0.87,6.610,108.3,25.3,0.87,6.710,108.4
+26.7,0.87,6.410,120.8,26.5,0.87,6.510,120.9
+27.9,0.87,6.260,124.5,27.7,0.87,6.370,124.8
+29.0,0.86,7.260,137.5,28.8,0.86,7.380,137.5
+29.4,0.86,7.600,146.0,29.2,0.86,7.720,146.1
+29.3,0.86,8.680,141.8,29.1,0.86,8.910,142.0
+19.4,0.86,9.990,49.2,19.6,0.86,10.720,51.2
+22.5,0.86,11.180,93.1,22.4,0.86,11.430,93.9
+20.9,0.86,11.770,100.3,20.9,0.86,12.550,100.3
+19.3,0.86,15.270,102.4,19.2,0.86,16.100,102.1
+19.6,0.86,13.950,115.7,19.4,0.86,14.670,115.4
+22.4,0.86,14.670,119.0,22.4,0.86,15.220,118.9
+21.0,0.86,12.880,142.4,20.9,0.86,13.620,142.5
+21.5,0.86,16.670,138.3,21.4,0.86,17.400,138.0
+20.8,0.86,10.840,150.3,20.6,0.86,11.520,149.5
+19.7,0.86,10.740,167.4,19.6,0.86,11.960,164.0
+18.9,0.86,7.390,224.4,18.8,0.86,7.650,219.1
+18.9,0.86,11.840,264.6,19.0,0.86,12.830,265.9
+16.6,0.86,13.030,259.1,16.7,0.86,14.840,262.8
+15.7,0.86,11.640,260.8,15.7,0.86,13.080,263.8
+15.4,0.86,14.770,262.4,15.3,0.86,15.620,263.5
+16.9,0.86,13.700,265.0,16.7,0.86,14.050,265.3
+18.3,0.86,13.760,265.8,18.1,0.86,14.060,266.0
+19.9,0.86,13.190,264.8,19.6,0.86,13.450,265.0
+21.2,0.86,12.100,270.6,20.9,0.86,12.340,270.8
+22.4,0.86,11.960,278.0,22.2,0.86,12.190,277.9
+23.4,0.86,9.970,283.9,23.2,0.86,10.150,283.7
+24.6,0.86,9.060,278.7,24.3,0.86,9.210,278.4
+25.6,0.86,8.280,260.9,25.4,0.86,8.450,261.2
+26.3,0.86,9.680,264.0,26.0,0.86,9.810,263.7
+26.9,0.86,8.750,261.2,26.7,0.86,8.920,260.8
+26.9,0.86,9.920,258.5,26.7,0.86,10.150,258.4
+26.5,0.86,8.160,254.3,26.4,0.86,8.710,254.8
+25.6,0.86,10.000,232.2,25.7,0.86,10.690,235.4
+24.3,0.86,12.050,245.0,24.6,0.86,13.150,248.5
+23.2,0.86,13.050,253.1,23.5,0.86,14.290,256.7
+22.9,0.86,13.230,269.7,23.2,0.86,14.180,272.7
+22.1,0.86,13.090,279.1,22.3,0.86,14.310,282.0
+21.0,0.86,13.790,283.4,21.2,0.86,14.980,286.2
+17.3,0.86,12.010,305.1,17.3,0.86,12.210,307.9
+14.6,0.86,9.460,359.0,14.5,0.86,10.470,4.5
+13.7,0.86,9.320,26.3,13.7,0.86,10.300,30.3
+12.9,0.86,9.030,13.7,12.9,0.86,9.900,19.0
+12.0,0.86,9.740,20.6,12.0,0.86,11.020,26.2
+11.1,0.86,9.390,33.8,11.0,0.86,10.160,35.0
+11.8,0.87,11.980,35.3,11.6,0.87,12.240,35.5
+12.6,0.87,11.210,36.2,12.4,0.87,11.420,36.3
+13.7,0.87,9.680,37.8,13.5,0.87,9.830,37.9
+14.9,0.87,8.570,42.7,14.7,0.87,8.690,42.8
+16.0,0.87,7.580,47.6,15.8,0.87,7.670,47.8
+17.1,0.87,6.260,54.1,16.9,0.87,6.320,54.4
+18.1,0.87,6.150,49.6,17.9,0.87,6.210,50.1
+19.2,0.86,5.310,60.3,19.0,0.86,5.350,61.0
+20.0,0.86,4.650,70.6,19.7,0.86,4.690,71.1
+20.6,0.86,4.500,89.0,20.4,0.86,4.570,89.9
+20.8,0.86,5.010,111.4,20.6,0.86,5.070,111.3
+20.7,0.86,5.910,97.9,20.5,0.86,6.210,98.7
+19.7,0.86,7.220,91.1,19.5,0.86,7.690,92.0
+18.6,0.86,8.530,79.0,18.5,0.86,9.180,79.8
+17.7,0.86,8.620,92.0,17.6,0.86,9.380,92.3
+16.9,0.86,8.620,93.7,16.8,0.86,9.750,93.6
+16.2,0.86,9.470,97.6,16.1,0.86,10.070,97.6
+14.9,0.86,7.900,91.5,14.8,0.86,8.790,92.4
+14.3,0.86,6.210,80.3,14.2,0.86,6.780,81.9
+13.8,0.87,6.400,11.3,13.7,0.87,6.550,12.3
+11.5,0.87,8.640,33.5,11.3,0.87,8.810,34.3
+10.6,0.87,6.430,46.9,10.5,0.87,6.790,48.6
+10.9,0.87,5.840,45.6,10.7,0.87,6.200,46.6
+11.1,0.87,6.280,43.5,10.9,0.87,6.410,44.0
+11.1,0.87,6.180,35.3,10.9,0.87,6.280,35.8
+11.1,0.87,6.570,33.4,10.9,0.87,6.660,33.8
+11.6,0.87,6.050,45.4,11.4,0.87,6.150,45.9
+12.3,0.87,6.150,52.9,12.1,0.87,6.240,53.3
+13.3,0.87,5.620,58.5,13.1,0.87,5.700,59.1
+14.6,0.87,4.710,81.2,14.4,0.87,4.780,81.4
+15.6,0.87,3.970,107.3,15.4,0.87,4.030,107.5
+17.8,0.87,4.240,133.8,17.5,0.87,4.300,133.8
+19.3,0.87,4.770,153.8,19.0,0.87,4.830,154.3
+20.2,0.87,4.220,158.9,19.9,0.87,4.300,159.0
+20.1,0.87,5.850,146.3,19.9,0.87,5.940,146.7
+19.5,0.87,7.270,141.0,19.3,0.87,7.550,141.0
+19.2,0.87,8.110,143.0,19.1,0.87,8.500,142.5
+19.1,0.87,8.590,134.5,19.1,0.87,9.070,134.6
+17.4,0.87,9.650,143.0,17.4,0.87,10.400,143.5
+16.8,0.87,9.310,154.0,16.9,0.87,10.370,153.4
+16.3,0.87,9.910,148.1,16.5,0.87,10.500,151.1
+15.8,0.87,7.960,129.1,15.8,0.87,8.530,132.2
+15.2,0.87,8.080,136.0,15.1,0.87,8.330,136.7
+14.7,0.87,6.800,141.9,15.0,0.87,7.050,149.9
+14.9,0.87,12.280,166.7,14.9,0.87,13.180,165.5
+14.2,0.87,13.880,158.9,14.4,0.87,14.810,158.3
+14.7,0.87,14.680,158.3,14.8,0.87,15.680,157.8
+15.7,0.87,2.940,158.3,15.6,0.87,4.110,159.7
+16.6,0.87,5.900,142.0,16.4,0.87,6.350,142.4
+17.4,0.87,8.540,134.3,17.2,0.87,8.740,134.6
+17.9,0.87,8.530,135.5,17.7,0.87,8.690,135.8
+19.0,0.87,8.210,149.9,18.8,0.87,8.340,150.2
+20.6,0.87,7.070,153.6,20.3,0.87,7.170,154.0
+21.8,0.87,7.600,148.6,21.6,0.87,7.720,149.3
+23.4,0.87,7.190,155.2,23.1,0.87,7.320,155.9
+20.5,0.87,14.470,150.5,20.3,0.87,14.690,150.5
+21.4,0.86,10.120,129.2,21.2,0.86,10.380,129.5
+21.7,0.86,6.810,73.5,21.5,0.86,6.790,73.9
+21.3,0.86,7.860,89.5,21.1,0.86,8.000,89.7
+20.7,0.86,8.340,116.9,20.5,0.86,8.700,116.3
+18.9,0.86,9.930,131.6,18.8,0.86,10.770,131.0
+17.9,0.86,11.870,124.7,18.3,0.86,12.670,125.3
+17.2,0.86,11.850,137.7,17.8,0.86,12.250,139.9
+15.7,0.86,11.130,138.8,15.8,0.86,12.270,138.4
+16.1,0.86,11.130,148.2,16.7,0.86,12.100,149.6
+15.5,0.86,12.520,164.3,15.9,0.86,13.390,167.0
+16.2,0.86,11.930,166.5,16.8,0.86,12.900,169.3
+18.3,0.86,13.980,180.8,18.8,0.86,15.080,183.4
+17.6,0.86,11.090,180.2,17.9,0.86,12.120,184.7
+16.5,0.86,11.450,180.6,16.8,0.86,12.200,183.8
+15.1,0.86,12.410,187.4,15.4,0.86,13.020,192.5
+14.8,0.86,11.400,191.8,15.1,0.86,11.740,194.6
+15.8,0.86,5.390,230.0,15.9,0.86,6.110,232.7
+19.6,0.86,3.600,218.6,19.4,0.86,3.600,220.3
+23.7,0.86,4.350,219.1,23.5,0.86,4.420,220.0
+27.3,0.86,6.170,230.9,27.1,0.86,6.300,231.4
+28.4,0.86,6.550,231.5,28.2,0.86,6.670,231.9
+29.2,0.86,7.550,244.9,29.0,0.86,7.690,244.8
+29.7,0.86,8.420,241.8,29.5,0.86,8.560,241.9
+30.2,0.86,9.510,244.6,29.9,0.86,9.780,244.3
+30.2,0.86,11.640,250.1,30.0,0.86,11.850,250.0
+30.1,0.86,11.600,234.2,29.9,0.86,11.840,234.3
+29.6,0.86,10.620,226.4,29.4,0.86,10.960,226.7
+29.1,0.86,9.060,233.0,29.1,0.86,9.800,234.3
+28.4,0.86,10.870,227.6,28.6,0.86,11.710,230.4
+27.4,0.86,10.380,225.6,28.0,0.86,11.390,230.8
+26.0,0.86,9.630,225.8,26.7,0.86,10.100,231.7
+28.0,0.86,10.610,228.2,27.8,0.86,10.400,228.1
+27.9,0.86,7.330,230.7,27.7,0.86,7.210,230.1
+26.2,0.86,9.030,233.1,26.5,0.86,8.850,235.8
+25.6,0.86,10.040,238.5,26.0,0.86,9.770,239.3
+22.0,0.86,10.910,216.9,22.6,0.86,10.760,221.6
+21.1,0.86,13.480,224.8,22.1,0.86,14.000,226.1
+20.3,0.86,13.160,225.2,21.2,0.86,13.610,226.9
+18.5,0.86,13.040,223.0,19.3,0.86,13.330,226.1
+17.1,0.86,9.680,227.4,18.6,0.86,9.590,232.8
+18.2,0.86,2.410,255.1,18.3,0.86,2.850,262.5
+22.2,0.86,4.190,245.3,22.1,0.86,4.220,248.1
+25.3,0.86,3.070,265.3,25.1,0.86,3.120,265.6
+27.1,0.86,3.400,285.5,26.8,0.86,3.450,284.8
+28.6,0.86,3.790,244.4,28.4,0.86,3.900,244.2
+29.5,0.86,6.320,239.7,29.3,0.86,6.450,239.5
+30.3,0.86,9.120,235.9,30.1,0.86,9.290,236.0
+30.8,0.86,9.500,229.7,30.6,0.86,9.730,229.8
+30.8,0.86,10.830,229.6,30.6,0.86,11.080,229.6
+30.4,0.86,11.030,229.5,30.2,0.86,11.280,229.5
+30.1,0.86,10.480,235.4,29.9,0.86,10.750,235.3
+29.7,0.86,7.610,239.2,29.6,0.86,8.140,239.7
+29.4,0.86,11.800,236.9,29.4,0.86,12.300,237.2
+29.0,0.86,11.140,244.3,29.2,0.86,11.710,243.8
+29.1,0.86,10.550,240.2,29.2,0.86,10.920,240.0
+26.6,0.86,11.750,236.7,27.0,0.86,13.030,238.7
+21.5,0.86,13.540,163.9,21.7,0.86,14.120,165.5
+20.1,0.86,12.170,164.5,20.4,0.86,12.060,168.4
+20.3,0.86,12.730,189.9,20.9,0.86,12.610,197.7
+19.5,0.86,11.740,200.0,20.2,0.86,12.020,208.8
+18.7,0.86,10.870,219.5,19.8,0.86,12.000,227.5
+18.9,0.86,7.080,247.8,19.4,0.86,7.720,255.0
+21.4,0.86,10.580,251.6,22.4,0.86,10.470,259.2
+17.0,0.86,6.480,281.8,17.4,0.86,7.130,282.6
+18.5,0.87,4.180,294.8,18.3,0.87,4.260,294.5
+19.1,0.87,2.690,329.8,18.9,0.87,2.700,329.7
+21.4,0.87,3.090,311.2,21.2,0.87,3.090,310.4
+23.3,0.87,1.510,326.7,23.1,0.87,1.490,324.3
+25.8,0.87,1.630,270.9,25.6,0.87,1.710,266.7
+27.5,0.87,7.040,231.7,27.3,0.87,7.170,231.7
+28.4,0.87,7.150,231.5,28.1,0.87,7.300,231.5
+29.7,0.86,6.770,226.8,29.5,0.86,6.980,226.4
+30.2,0.86,9.360,231.5,30.0,0.86,9.570,231.4
+30.1,0.86,11.560,232.0,29.8,0.86,11.830,232.0
+29.7,0.86,11.630,230.0,29.5,0.86,11.940,230.2
+29.1,0.86,8.940,230.2,29.0,0.86,9.530,229.6
+29.0,0.86,10.360,219.0,29.0,0.86,11.070,220.3
+29.4,0.86,11.420,239.2,29.4,0.86,11.580,239.7
+28.9,0.86,9.100,232.3,28.9,0.86,9.010,233.7
+27.7,0.86,10.660,214.9,28.1,0.86,11.080,218.3
+26.5,0.86,11.700,214.1,26.3,0.86,12.880,215.7
+19.8,0.86,8.030,188.8,20.1,0.86,8.810,201.0
+20.0,0.86,9.950,204.4,21.1,0.86,10.750,220.6
+21.8,0.86,12.110,238.3,23.0,0.86,13.230,245.0
+20.3,0.86,11.300,236.7,21.7,0.86,12.640,245.0
+20.4,0.86,11.320,238.3,22.2,0.86,12.510,248.0
+19.5,0.86,10.910,235.2,21.3,0.86,11.560,244.3
+19.2,0.87,11.490,224.9,20.4,0.87,11.990,229.0
+20.8,0.87,10.120,224.8,20.8,0.87,10.820,226.7
+23.0,0.87,9.100,219.5,22.8,0.87,9.210,220.3
+25.3,0.87,7.060,232.5,25.0,0.87,7.150,232.5
+27.1,0.87,6.420,227.7,26.9,0.87,6.500,227.8
+28.9,0.87,6.120,232.0,28.7,0.87,6.230,232.2
+30.0,0.87,6.860,244.4,29.8,0.87,6.980,244.6
+30.5,0.86,7.260,260.1,30.3,0.86,7.340,259.9
+31.0,0.86,6.570,265.9,30.8,0.86,6.670,265.2
+31.0,0.86,7.570,246.1,30.8,0.86,7.680,246.2
+31.0,0.86,9.380,240.7,30.8,0.86,9.560,240.9
+30.6,0.86,9.300,228.9,30.4,0.86,9.500,229.2
+30.3,0.86,8.310,210.7,30.1,0.86,8.800,212.1
+29.6,0.86,9.370,207.8,29.6,0.86,9.980,210.0
+29.3,0.86,11.140,212.7,29.5,0.86,11.500,216.0
+28.6,0.86,12.690,219.6,29.2,0.86,13.270,222.1
+26.5,0.86,12.360,231.3,27.8,0.86,13.220,236.0
+27.7,0.86,12.920,243.8,28.5,0.86,13.620,246.5
+27.9,0.86,12.590,255.1,28.6,0.86,13.080,256.0
+25.7,0.86,12.100,245.8,27.0,0.86,12.950,250.1
+24.9,0.86,12.300,255.1,26.3,0.86,13.370,260.5
+24.9,0.86,13.110,259.7,26.2,0.86,13.890,264.4
+24.8,0.86,12.590,258.8,26.4,0.86,13.330,264.9
+24.4,0.86,12.280,249.0,25.8,0.86,12.310,254.1
+24.4,0.86,10.040,242.1,25.7,0.86,10.160,246.1
+22.5,0.86,6.470,238.1,23.2,0.86,7.340,241.1
+24.9,0.86,2.660,265.1,24.7,0.86,2.720,264.7
+27.5,0.86,2.030,239.2,27.3,0.86,2.070,239.8
+29.2,0.86,1.220,281.0,29.0,0.86,1.230,278.7
+30.5,0.86,3.480,259.9,30.3,0.86,3.550,259.4
+31.2,0.86,4.800,233.5,31.0,0.86,4.900,233.8
+31.6,0.86,5.720,259.1,31.4,0.86,5.860,257.8
+31.9,0.86,5.780,242.9,31.7,0.86,5.900,242.9
+31.8,0.86,10.640,226.8,31.5,0.86,10.840,226.8
+31.2,0.86,10.460,226.6,31.0,0.86,10.680,226.7
+31.0,0.86,10.420,225.9,30.8,0.86,10.700,226.3
+30.4,0.86,8.070,223.0,30.3,0.86,8.660,223.2
+30.1,0.86,8.970,236.5,30.1,0.86,9.530,240.6
+29.8,0.86,8.520,234.6,29.7,0.86,9.160,237.7
+29.4,0.86,9.400,245.9,29.6,0.86,9.900,249.7
+28.0,0.86,12.600,199.7,28.2,0.86,12.730,200.8
+27.9,0.86,9.290,225.0,27.8,0.86,9.300,224.8
+26.4,0.86,9.960,228.4,26.2,0.86,10.370,235.2
+24.1,0.86,11.610,237.2,25.1,0.86,11.820,248.4
+23.6,0.86,10.440,258.1,25.1,0.86,11.090,267.5
+24.1,0.86,11.460,284.5,24.7,0.86,12.380,288.6
+24.8,0.86,11.570,287.3,25.2,0.86,12.370,290.9
+21.4,0.86,13.230,305.0,21.3,0.86,14.400,307.0
+17.8,0.86,13.810,332.2,17.6,0.86,14.380,333.2
+17.8,0.86,10.950,335.3,17.6,0.86,11.170,335.7
+19.1,0.87,12.980,349.6,18.9,0.87,13.210,349.6
+19.3,0.87,12.870,359.2,19.1,0.87,13.100,359.1
+19.7,0.87,11.430,1.5,19.4,0.87,11.600,1.5
+19.9,0.87,11.130,2.2,19.6,0.87,11.290,2.1
+20.2,0.87,11.640,7.3,20.0,0.87,11.810,7.3
+19.8,0.87,10.670,6.5,19.6,0.87,10.810,6.5
+19.3,0.87,10.300,13.9,19.0,0.87,10.430,13.8
+19.0,0.87,9.620,14.4,18.7,0.87,9.760,14.4
+19.2,0.87,9.120,16.5,18.9,0.87,9.250,16.5
+18.6,0.87,8.870,20.0,18.4,0.87,9.020,20.0
+17.4,0.87,7.720,22.8,17.2,0.87,7.840,22.9
+16.7,0.87,7.440,13.9,16.5,0.87,7.780,14.5
+15.9,0.87,8.470,21.2,15.7,0.87,8.880,21.4
+15.2,0.87,10.320,11.4,15.0,0.87,10.810,11.9
+14.8,0.87,9.280,13.9,14.7,0.87,9.940,14.8
+15.2,0.87,10.720,351.4,15.0,0.87,11.230,351.9
+15.0,0.87,9.570,22.9,14.9,0.87,10.280,22.7
+14.9,0.87,8.930,37.7,14.9,0.87,9.910,37.4
+14.7,0.87,9.000,37.1,14.6,0.87,10.160,37.9
+14.2,0.87,7.760,43.9,14.2,0.87,9.030,45.4
+13.3,0.87,7.940,47.1,13.2,0.87,8.500,47.2
+13.5,0.87,7.820,24.9,13.3,0.87,8.100,25.7
+13.0,0.87,10.210,35.8,12.8,0.87,10.510,36.2
+12.3,0.87,9.600,31.9,12.1,0.87,9.820,32.2
+12.4,0.87,9.850,33.7,12.2,0.87,10.020,33.8
+12.4,0.87,7.560,31.3,12.2,0.87,7.700,31.4
+12.8,0.87,8.270,32.2,12.6,0.87,8.420,32.4
+12.8,0.87,8.200,32.6,12.6,0.87,8.340,32.8
+12.9,0.87,8.000,32.2,12.6,0.87,8.110,32.4
+13.1,0.87,7.090,33.1,12.9,0.87,7.200,33.3
+13.3,0.87,7.700,32.0,13.1,0.87,7.820,32.0
+13.4,0.87,7.150,33.6,13.2,0.87,7.290,33.8
+13.3,0.87,7.730,38.2,13.1,0.87,7.860,38.1
+13.2,0.87,7.070,25.6,13.0,0.87,7.210,25.7
+13.2,0.87,6.200,18.9,13.0,0.87,6.410,19.2
+13.0,0.87,6.410,25.9,12.8,0.87,6.700,25.8
+12.9,0.87,5.990,36.5,12.8,0.87,6.360,37.0
+12.7,0.87,7.180,51.8,12.7,0.87,7.480,52.6
+12.4,0.87,5.080,45.1,12.3,0.87,5.680,46.7
+12.6,0.87,6.180,36.4,12.6,0.87,6.980,39.3
+11.9,0.87,4.640,26.1,12.0,0.87,5.580,32.9
+11.7,0.87,4.450,33.3,11.9,0.87,5.340,39.5
+11.6,0.87,5.160,39.8,11.7,0.87,5.850,43.1
+11.4,0.87,5.870,24.8,11.4,0.87,6.300,30.1
+10.8,0.87,5.590,20.7,10.9,0.87,6.110,27.7
+10.0,0.87,6.750,25.1,10.1,0.87,7.280,28.5
+9.3,0.87,5.160,35.9,9.3,0.87,5.670,38.8
+10.0,0.87,4.690,47.5,9.8,0.87,4.810,48.4
+11.8,0.87,5.630,38.3,11.6,0.87,5.700,38.7
+13.2,0.87,5.980,37.0,12.9,0.87,6.050,37.3
+14.3,0.87,6.250,32.9,14.0,0.87,6.310,33.2
+15.2,0.87,6.670,27.7,15.0,0.87,6.740,27.9
+16.2,0.87,5.290,30.7,16.0,0.87,5.340,30.9
+17.2,0.87,4.120,34.3,16.9,0.87,4.150,34.6
+17.9,0.87,4.130,27.2,17.7,0.87,4.150,27.4
+18.5,0.87,3.680,22.6,18.2,0.87,3.700,23.1
+18.9,0.87,3.460,52.0,18.6,0.87,3.480,51.6
+19.0,0.87,4.040,38.9,18.8,0.87,4.050,39.2
+18.9,0.87,3.070,35.0,18.7,0.87,3.100,35.5
+18.6,0.87,2.310,31.5,18.4,0.87,2.320,34.6
+18.2,0.87,3.570,62.7,18.0,0.87,3.670,63.4
+17.3,0.87,3.160,95.6,17.2,0.87,3.610,92.7
+16.8,0.87,5.780,140.7,16.6,0.87,5.860,142.5
+15.9,0.87,6.440,149.7,15.7,0.87,6.400,150.5
+15.5,0.87,5.430,154.1,15.4,0.87,5.510,154.0
+15.0,0.87,5.340,162.8,15.0,0.87,5.500,160.9
+14.3,0.87,5.790,160.7,14.3,0.87,5.990,158.7
+13.9,0.87,6.180,166.5,13.9,0.87,6.390,166.2
+13.5,0.87,7.020,167.5,13.5,0.87,7.150,168.8
+13.0,0.87,7.170,181.1,13.1,0.87,7.180,180.8
+13.1,0.87,5.810,200.0,13.3,0.87,5.920,198.4
+13.9,0.87,4.370,208.6,13.7,0.87,4.430,208.6
+15.8,0.87,3.890,205.3,15.6,0.87,3.910,205.3
+17.1,0.87,1.590,186.9,16.9,0.87,1.600,186.9
+18.1,0.87,1.300,159.4,17.9,0.87,1.310,160.4
+19.1,0.87,0.990,136.8,18.8,0.87,1.000,138.7
+19.9,0.87,1.730,123.5,19.7,0.87,1.730,124.5
+20.8,0.87,1.730,164.4,20.6,0.87,1.750,164.9
+21.2,0.87,2.460,169.8,20.9,0.87,2.460,169.8
+21.8,0.87,3.560,156.6,21.6,0.87,3.570,157.4
+22.1,0.87,3.800,156.8,21.8,0.87,3.850,157.4
+22.1,0.87,4.150,163.8,21.9,0.87,4.210,164.2
+21.6,0.87,6.100,153.9,21.4,0.87,6.270,154.2
+20.3,0.87,9.350,148.2,20.1,0.87,9.700,148.0
+19.1,0.87,10.630,148.7,19.1,0.87,11.420,148.4
+18.2,0.87,10.940,150.5,18.2,0.87,11.850,150.7
+17.5,0.87,11.800,162.2,17.6,0.87,12.840,162.2
+17.0,0.87,11.940,166.6,17.2,0.87,12.960,166.8
+16.1,0.87,11.850,170.9,16.3,0.87,12.970,171.1
+15.6,0.87,11.540,179.2,15.7,0.87,12.640,179.8
+15.3,0.87,11.930,182.3,15.5,0.87,13.140,182.4
+14.8,0.87,11.670,184.2,15.0,0.87,12.840,184.5
+14.6,0.87,11.270,189.7,14.9,0.87,12.360,190.1
+14.6,0.87,11.480,194.1,14.9,0.87,12.450,194.6
+14.0,0.87,9.970,195.7,14.2,0.87,10.820,196.5
+15.6,0.87,7.330,198.3,15.4,0.87,7.510,198.7
+17.4,0.87,6.860,199.5,17.2,0.87,6.970,199.6
+18.8,0.87,4.900,191.1,18.5,0.87,4.980,191.0
+19.7,0.87,5.410,165.7,19.4,0.87,5.470,166.0
+20.5,0.87,5.490,162.8,20.3,0.87,5.580,162.9
+21.2,0.86,5.850,147.7,21.0,0.86,5.930,147.8
+21.7,0.86,7.320,137.9,21.5,0.86,7.420,138.2
+22.0,0.86,7.770,141.0,21.8,0.86,7.890,141.1
+22.1,0.86,7.850,140.6,21.8,0.86,7.990,140.6
+19.3,0.86,12.390,192.8,19.0,0.86,12.540,192.7
+19.4,0.86,8.450,186.6,19.2,0.86,8.600,186.5
+18.6,0.86,8.740,189.3,18.4,0.86,8.910,189.2
+17.6,0.86,6.800,203.5,17.4,0.86,6.970,203.4
+17.1,0.86,6.190,200.1,16.9,0.86,6.410,200.2
+16.5,0.86,6.410,195.5,16.3,0.86,6.720,196.0
+15.9,0.86,5.530,208.8,15.7,0.86,5.890,208.9
+15.0,0.86,7.060,180.3,14.8,0.86,7.290,180.4
+13.5,0.86,6.830,168.1,13.3,0.86,6.920,167.7
+12.4,0.86,4.820,161.9,12.2,0.86,4.990,161.3
+12.4,0.86,4.100,173.1,12.2,0.86,4.220,171.6
+12.4,0.86,1.250,144.0,12.2,0.86,1.370,142.8
+12.3,0.86,1.440,62.9,12.1,0.86,1.450,66.4
+12.2,0.87,3.510,36.1,12.0,0.87,3.650,39.1
+12.2,0.87,4.140,45.1,12.0,0.87,4.210,45.8
+12.1,0.87,4.260,67.3,11.9,0.87,4.290,67.7
+12.4,0.87,5.740,45.7,12.2,0.87,5.790,46.2
+12.2,0.87,7.760,72.4,12.0,0.87,7.860,72.6
+11.8,0.87,7.140,88.2,11.6,0.87,7.330,88.9
+13.7,0.87,7.740,86.2,13.5,0.87,7.890,85.5
+14.6,0.87,7.290,84.9,14.4,0.87,7.330,84.6
+14.9,0.87,5.700,49.5,14.7,0.87,5.760,50.4
+16.5,0.87,6.920,75.9,16.3,0.87,7.090,76.5
+17.2,0.87,9.350,85.9,16.9,0.87,9.500,85.8
+16.4,0.87,9.160,86.0,16.2,0.87,9.300,86.0
+16.0,0.87,9.760,90.1,15.7,0.87,9.930,90.0
+14.4,0.87,7.120,88.5,14.2,0.87,7.270,88.6
+13.5,0.87,5.920,83.9,13.3,0.87,6.210,84.3
+12.7,0.87,4.540,80.4,12.6,0.87,4.630,81.1
+12.2,0.87,3.440,73.8,12.0,0.87,3.830,73.4
+11.6,0.87,4.950,56.3,11.4,0.87,5.310,58.6
+10.6,0.87,5.810,77.5,10.4,0.87,6.040,78.5
+10.4,0.87,3.000,78.8,10.4,0.87,3.590,81.4
+10.4,0.87,2.500,52.1,10.4,0.87,2.820,57.6
+10.1,0.87,3.680,8.3,10.1,0.87,3.720,12.6
+10.2,0.87,3.910,26.9,10.3,0.87,4.310,28.0
+10.3,0.87,3.610,21.0,10.4,0.87,4.120,23.9
+8.6,0.87,5.750,5.6,8.7,0.87,6.050,8.0
+8.7,0.88,4.810,2.7,8.6,0.88,5.350,5.5
+9.6,0.88,5.360,11.3,9.4,0.88,5.400,11.6
+11.3,0.88,5.560,25.3,11.1,0.88,5.610,25.5
+13.1,0.88,5.440,26.8,12.9,0.88,5.490,27.1
+14.4,0.88,4.910,43.8,14.1,0.88,4.960,44.1
+15.7,0.88,4.610,30.0,15.4,0.88,4.640,30.4
+16.7,0.88,4.420,34.4,16.5,0.88,4.440,34.8
+17.7,0.88,3.930,37.8,17.5,0.88,3.950,38.0
+18.4,0.87,3.580,33.2,18.2,0.87,3.590,33.5
+18.6,0.87,4.330,33.1,18.4,0.87,4.350,33.0
+18.7,0.87,4.850,52.7,18.4,0.87,4.890,53.1
+18.1,0.87,4.790,92.4,17.9,0.87,4.870,92.1
+17.6,0.87,6.830,99.8,17.4,0.87,6.950,99.5
+16.9,0.87,6.130,82.8,16.7,0.87,6.420,83.5
+16.3,0.88,6.260,103.7,16.1,0.88,6.680,104.2
+16.1,0.88,6.770,106.5,16.1,0.88,6.810,106.4
+15.3,0.88,8.540,117.9,15.3,0.88,9.100,118.2
+14.6,0.88,8.220,111.4,14.6,0.88,8.910,110.6
+13.5,0.88,7.460,103.1,13.3,0.88,8.150,102.8
+12.8,0.88,5.740,117.4,12.7,0.88,6.260,117.7
+12.4,0.88,3.740,106.8,12.3,0.88,4.110,108.7
+12.1,0.88,2.800,111.5,11.9,0.88,3.010,113.3
+11.8,0.88,3.150,116.0,11.6,0.88,3.440,119.0
+11.5,0.88,3.610,123.3,11.4,0.88,3.910,124.0
+11.3,0.88,2.030,162.8,11.2,0.88,2.510,162.1
+11.3,0.88,1.770,150.6,11.3,0.88,2.070,157.2
+11.7,0.88,4.320,135.2,11.5,0.88,4.390,135.9
+13.4,0.88,4.620,151.9,13.2,0.88,4.710,152.2
+12.4,0.88,4.550,163.1,12.2,0.88,4.590,162.9
+13.8,0.88,5.320,132.3,13.6,0.88,5.350,132.2
+15.1,0.88,4.260,124.7,14.8,0.88,4.320,125.0
+14.7,0.88,2.230,131.3,14.5,0.88,2.380,132.4
+13.0,0.88,2.620,34.8,12.8,0.88,2.540,36.2
+14.0,0.87,4.130,73.5,13.8,0.87,4.150,73.9
+14.9,0.87,3.590,103.2,14.7,0.87,3.650,103.8
+14.5,0.87,3.540,124.0,14.3,0.87,3.600,123.6
+13.4,0.87,4.990,152.1,13.3,0.87,5.170,153.6
+13.0,0.87,4.120,152.8,12.8,0.87,4.370,153.3
+13.2,0.87,2.430,135.3,13.2,0.87,2.740,137.3
+13.4,0.87,2.280,144.2,13.3,0.87,2.400,144.8
+13.0,0.87,1.410,88.5,12.9,0.87,1.670,96.7
+12.6,0.87,0.840,53.8,12.5,0.87,0.930,68.9
+12.3,0.87,0.820,21.1,12.3,0.87,0.720,41.5
+11.9,0.87,2.250,317.9,11.9,0.87,2.170,319.1
+11.9,0.87,2.870,324.0,11.9,0.87,2.890,326.6
+11.8,0.87,3.900,23.3,11.9,0.87,3.930,15.9
+11.5,0.87,2.120,15.6,11.6,0.87,2.410,11.8
+11.2,0.87,1.930,18.4,11.2,0.87,2.230,19.8
+11.0,0.87,3.660,47.2,11.0,0.87,4.060,46.3
+11.9,0.87,3.980,34.1,11.7,0.87,4.000,34.7
+13.1,0.87,3.550,36.4,12.9,0.87,3.590,37.2
+13.7,0.87,3.660,43.7,13.5,0.87,3.720,44.6
+14.7,0.87,3.390,32.1,14.5,0.87,3.470,33.5
+14.7,0.87,2.110,266.1,14.5,0.87,2.040,268.3
+12.5,0.87,6.880,148.0,12.4,0.87,6.830,146.3
+13.1,0.87,1.350,139.1,13.1,0.87,1.560,124.6
+15.2,0.87,3.090,136.0,15.0,0.87,3.140,134.8
+16.7,0.87,3.330,105.7,16.5,0.87,3.350,105.7
+16.1,0.87,3.820,194.0,15.9,0.87,3.750,194.2
+16.8,0.87,1.440,236.8,16.6,0.87,1.420,236.1
+17.0,0.87,2.250,239.5,16.8,0.87,2.260,240.2
+16.9,0.87,2.310,228.0,16.7,0.87,2.260,231.1
+16.8,0.87,1.790,238.2,16.7,0.87,1.660,234.4
+16.6,0.87,3.100,203.2,16.6,0.87,3.140,200.7
+16.2,0.87,4.270,205.8,16.2,0.87,4.290,204.7
+16.0,0.87,5.580,208.8,16.0,0.87,5.560,208.3
+15.9,0.87,5.680,219.0,16.1,0.87,5.550,217.8
+16.2,0.87,5.160,228.1,16.4,0.87,4.920,225.7
+15.9,0.87,5.640,236.5,16.1,0.87,5.280,235.5
+16.1,0.87,5.400,239.7,16.2,0.87,5.090,238.7
+16.2,0.87,5.380,247.5,16.3,0.87,5.110,246.7
+14.9,0.87,5.700,263.5,15.3,0.87,5.730,261.7
+14.4,0.87,5.120,261.9,15.0,0.87,5.380,261.1
+15.6,0.87,2.570,272.9,15.5,0.87,2.730,271.9
+17.5,0.87,3.500,284.8,17.3,0.87,3.550,284.0
+18.7,0.87,3.120,287.7,18.5,0.87,3.160,287.1
+19.7,0.87,2.700,306.4,19.5,0.87,2.710,305.8
+20.6,0.87,1.580,319.7,20.4,0.87,1.590,319.5
+21.4,0.87,1.260,315.1,21.2,0.87,1.270,315.2
+22.2,0.87,1.240,318.5,21.9,0.87,1.260,318.6
+22.8,0.87,0.970,17.8,22.6,0.87,0.970,16.5
+23.4,0.87,1.510,32.7,23.2,0.87,1.510,31.1
+23.7,0.87,1.360,17.5,23.5,0.87,1.350,16.3
+23.8,0.87,1.300,35.1,23.6,0.87,1.300,33.7
+23.8,0.87,0.520,74.1,23.6,0.87,0.500,70.2
+23.6,0.87,0.550,98.2,23.4,0.87,0.440,112.4
+23.1,0.87,1.790,219.5,23.0,0.87,1.790,219.3
+22.9,0.87,2.100,192.1,22.8,0.87,2.060,195.2
+21.2,0.87,4.660,211.5,21.4,0.87,4.350,208.1
+21.6,0.87,4.660,240.4,21.8,0.87,4.350,239.2
+21.5,0.87,6.670,247.3,21.5,0.87,6.120,245.1
+21.3,0.87,7.510,253.5,21.4,0.87,6.760,251.1
+21.4,0.87,6.310,252.9,21.4,0.87,5.810,251.9
+19.9,0.87,6.950,281.6,20.2,0.87,6.680,281.7
+19.1,0.87,5.480,298.6,19.0,0.87,5.450,302.1
+17.6,0.87,4.000,308.7,17.7,0.87,4.040,305.4
+17.4,0.87,4.650,296.3,17.8,0.87,5.020,297.4
+17.9,0.87,3.310,299.3,17.8,0.87,3.760,298.6
+20.0,0.87,2.880,301.5,19.8,0.87,2.890,299.9
+22.1,0.87,2.550,309.6,21.9,0.87,2.530,308.0
+23.6,0.87,0.730,351.0,23.4,0.87,0.670,349.9
+24.4,0.87,1.430,156.5,24.2,0.87,1.470,157.6
+25.0,0.87,3.320,167.9,24.8,0.87,3.360,168.0
+25.5,0.87,4.600,166.6,25.3,0.87,4.660,167.0
+25.9,0.87,3.970,177.2,25.7,0.87,4.040,177.6
+26.1,0.87,5.460,173.8,25.9,0.87,5.540,174.1
+26.2,0.87,5.090,194.5,26.0,0.87,5.170,194.2
+26.0,0.87,5.350,194.8,25.8,0.87,5.440,194.6
+25.7,0.87,6.610,188.3,25.6,0.87,6.880,188.3
+25.1,0.87,7.140,179.1,25.1,0.87,7.230,178.4
+25.1,0.87,8.260,199.9,25.1,0.87,8.240,201.0
+24.6,0.87,9.090,188.4,24.5,0.87,9.020,189.7
+23.0,0.87,8.010,180.8,23.5,0.87,8.800,183.9
+21.2,0.87,9.930,167.0,21.3,0.87,9.920,169.5
+20.5,0.87,8.520,194.6,20.7,0.87,9.370,201.5
+18.9,0.87,8.510,213.4,19.3,0.87,9.540,218.1
+19.4,0.87,11.500,227.8,19.9,0.87,12.820,228.5
+18.9,0.87,12.320,226.9,19.6,0.87,13.660,228.0
+18.2,0.87,13.210,224.5,19.0,0.87,14.600,226.3
+18.8,0.87,13.990,219.6,19.4,0.87,14.800,219.9
+17.9,0.87,12.540,216.0,18.2,0.87,13.260,216.2
+18.3,0.87,10.680,214.1,18.2,0.87,11.180,214.7
+20.3,0.87,10.660,203.6,20.1,0.87,10.830,203.9
+22.4,0.87,12.080,204.1,22.2,0.87,12.320,204.2
+23.7,0.87,11.580,204.9,23.5,0.87,11.820,205.0
+24.8,0.87,12.020,204.8,24.6,0.87,12.250,204.9
+25.7,0.87,11.680,200.7,25.5,0.87,11.930,200.8
+26.6,0.87,11.770,195.5,26.3,0.87,12.020,195.8
+27.3,0.86,11.840,196.6,27.0,0.86,12.110,196.9
+27.5,0.86,12.220,198.5,27.2,0.86,12.500,198.8
+27.4,0.86,12.870,196.2,27.2,0.86,13.170,196.4
+27.0,0.86,13.040,189.9,26.8,0.86,13.420,190.2
+20.6,0.87,14.360,341.5,20.8,0.87,14.550,342.8
+24.1,0.86,9.670,133.2,24.3,0.86,10.040,135.8
+23.8,0.86,11.440,140.6,23.8,0.86,12.070,140.5
+23.4,0.86,12.410,153.2,23.5,0.86,13.240,155.7
+22.1,0.86,13.780,158.8,22.1,0.86,14.580,160.4
+21.0,0.86,15.180,168.9,21.2,0.86,16.220,170.0
+19.9,0.86,14.820,166.5,20.0,0.86,15.810,168.2
+18.6,0.86,14.290,174.5,18.7,0.86,15.270,176.5
+17.7,0.86,13.720,185.0,17.8,0.86,14.750,187.4
+17.1,0.86,13.730,188.0,17.2,0.86,14.700,190.8
+16.6,0.86,13.250,194.6,16.8,0.86,14.340,197.5
+16.5,0.86,14.760,198.4,16.7,0.86,15.910,201.0
+16.9,0.86,15.770,206.3,16.9,0.86,16.490,207.5
+17.9,0.86,12.110,202.3,17.7,0.86,12.390,203.4
+20.4,0.86,6.260,193.9,20.2,0.86,6.430,194.6
+23.8,0.86,8.050,207.1,23.6,0.86,8.140,207.6
+26.8,0.86,7.470,211.3,26.6,0.86,7.610,211.7
+29.6,0.86,7.470,209.1,29.4,0.86,7.620,209.5
+30.7,0.86,9.240,215.2,30.5,0.86,9.430,215.4
+31.3,0.86,11.200,216.5,31.1,0.86,11.420,216.7
+31.8,0.86,11.730,221.3,31.5,0.86,12.010,221.4
+31.9,0.86,11.730,224.3,31.7,0.86,11.970,224.3
+32.0,0.86,11.320,225.2,31.8,0.86,11.580,225.2
+31.8,0.86,12.400,225.9,31.6,0.86,12.700,225.8
+31.1,0.86,8.160,216.8,31.0,0.86,8.730,217.2
+30.5,0.86,11.020,201.3,30.5,0.86,12.080,203.4
+29.1,0.86,12.400,203.2,29.3,0.86,13.730,206.0
+28.2,0.86,13.300,201.0,28.5,0.86,14.670,203.0
+26.4,0.86,13.000,189.1,26.5,0.86,13.790,190.0
+24.1,0.86,10.080,161.9,24.1,0.86,10.190,165.5
+23.2,0.86,14.630,196.7,23.2,0.86,15.820,197.6
+21.4,0.86,14.110,201.6,21.4,0.86,15.390,202.4
+20.4,0.86,13.910,209.0,20.4,0.86,15.260,209.8
+19.5,0.86,13.250,209.8,19.5,0.86,14.490,211.6
+18.5,0.86,12.380,209.7,18.7,0.86,13.700,212.2
+18.2,0.86,12.230,218.7,18.5,0.86,13.840,219.9
+18.4,0.86,10.200,235.2,18.8,0.86,10.710,238.7
+21.0,0.86,6.010,247.3,20.9,0.86,6.280,250.0
+24.3,0.86,5.980,286.0,24.1,0.86,6.100,286.3
+25.9,0.86,5.560,285.2,25.7,0.86,5.640,285.0
+27.0,0.86,5.960,275.6,26.8,0.86,6.050,275.2
+27.7,0.86,7.290,258.8,27.4,0.86,7.410,258.8
+27.9,0.86,7.510,265.0,27.7,0.86,7.610,264.5
+28.4,0.86,7.150,252.9,28.2,0.86,7.260,252.9
+28.6,0.86,8.000,251.2,28.3,0.86,8.090,251.2
+28.9,0.86,5.840,260.8,28.6,0.86,5.920,260.4
+29.3,0.86,5.240,252.8,29.1,0.86,5.330,252.2
+29.4,0.86,5.390,250.6,29.2,0.86,5.530,250.1
+29.1,0.86,5.350,237.9,29.0,0.86,5.650,239.5
+28.9,0.86,4.980,233.1,28.7,0.86,4.990,234.3
+28.5,0.87,4.080,226.6,28.3,0.87,3.860,226.6
+19.0,0.87,9.050,41.5,18.9,0.87,10.110,42.1
+18.3,0.87,8.070,37.1,18.2,0.87,9.200,38.7
+17.2,0.87,9.390,42.3,17.1,0.87,10.660,44.1
+16.3,0.87,8.320,32.9,16.2,0.87,9.260,36.4
+15.6,0.87,7.930,20.2,15.5,0.87,8.700,24.2
+14.8,0.87,9.350,27.9,14.7,0.87,10.330,30.4
+14.1,0.87,9.520,35.9,14.0,0.87,10.430,37.8
+13.2,0.87,8.640,35.6,13.1,0.87,9.510,37.6
+13.1,0.87,8.470,40.1,12.8,0.87,8.870,40.9
+12.6,0.87,8.080,32.9,12.4,0.87,8.340,33.6
+12.7,0.87,7.860,32.2,12.5,0.87,8.020,32.7
+12.9,0.87,7.780,30.5,12.7,0.87,7.920,30.9
+13.3,0.87,6.840,40.7,13.1,0.87,6.980,40.9
+13.9,0.87,6.280,43.8,13.7,0.87,6.390,43.8
+15.1,0.87,6.440,53.3,14.9,0.87,6.530,53.4
+16.0,0.87,5.310,62.3,15.8,0.87,5.420,62.5
+16.6,0.87,5.670,92.4,16.4,0.87,5.700,91.8
+16.9,0.87,4.240,94.6,16.6,0.87,4.310,95.2
+18.2,0.87,4.600,117.9,18.0,0.87,4.640,118.0
+19.2,0.87,3.280,115.7,18.9,0.87,3.320,115.6
+19.7,0.87,2.690,129.3,19.5,0.87,2.720,129.3
+19.7,0.87,2.790,121.8,19.5,0.87,2.810,122.0
+19.4,0.87,3.690,121.5,19.2,0.87,3.670,121.9
+18.8,0.87,5.130,117.8,18.6,0.87,5.250,117.4
+17.8,0.87,6.280,129.7,17.8,0.87,6.690,129.5
+17.3,0.87,5.950,132.6,17.2,0.87,6.510,132.1
+17.3,0.87,5.960,124.0,17.5,0.87,6.090,126.6
+17.4,0.87,6.120,134.2,17.6,0.87,6.490,134.2
+16.9,0.87,6.380,142.2,17.0,0.87,6.680,142.5
+17.4,0.87,5.930,156.6,17.5,0.87,6.160,154.1
+16.9,0.87,6.650,145.8,17.0,0.87,6.840,145.8
+16.4,0.87,6.000,144.9,16.5,0.87,6.330,145.5
+15.8,0.87,5.330,144.9,15.9,0.87,5.890,145.2
+15.5,0.88,2.470,151.5,15.5,0.88,3.090,150.7
+16.3,0.88,5.020,143.5,16.1,0.88,5.130,143.4
+17.4,0.88,6.160,145.6,17.1,0.88,6.240,145.8
+18.7,0.88,5.830,152.3,18.5,0.88,5.910,152.4
+20.0,0.88,5.650,146.3,19.8,0.88,5.720,146.7
+21.4,0.87,5.550,159.7,21.2,0.87,5.630,159.9
+21.9,0.87,6.820,156.4,21.7,0.87,6.940,156.8
+22.3,0.87,6.170,169.3,22.1,0.87,6.320,169.3
+24.2,0.87,5.260,176.4,24.0,0.87,5.370,176.8
+23.2,0.87,8.640,195.9,23.0,0.87,8.710,195.6
+20.5,0.87,6.630,128.4,20.3,0.87,6.720,128.6
+19.1,0.87,11.510,131.0,18.9,0.87,11.710,131.2
+18.2,0.87,10.110,139.6,18.0,0.87,10.290,139.6
+17.9,0.87,11.280,321.0,17.8,0.87,11.770,321.5
+15.7,0.87,8.280,218.8,15.6,0.87,7.980,217.5
+15.4,0.87,10.380,190.5,15.5,0.87,10.780,188.3
+16.8,0.87,4.710,179.5,16.7,0.87,5.280,178.3
+17.1,0.87,8.080,210.6,17.4,0.87,8.730,206.1
+17.0,0.87,8.200,204.5,17.1,0.87,9.030,204.1
+17.6,0.87,9.220,188.8,18.0,0.87,9.700,187.2
+16.8,0.87,10.720,198.2,17.1,0.87,11.350,198.5
+16.9,0.87,11.730,196.0,17.1,0.87,12.650,196.2
+16.1,0.87,11.270,206.2,16.2,0.87,12.220,208.0
+16.2,0.87,12.220,214.2,16.7,0.87,13.140,215.0
+16.0,0.87,11.330,215.9,16.0,0.87,12.040,216.5
+17.6,0.87,8.140,199.6,17.4,0.87,8.280,200.2
+19.9,0.87,7.580,194.4,19.7,0.87,7.730,194.7
+22.3,0.87,9.390,194.2,22.1,0.87,9.570,194.5
+24.3,0.87,10.840,201.2,24.1,0.87,11.080,201.4
+25.1,0.87,11.880,198.0,24.9,0.87,12.130,198.2
+26.3,0.87,11.370,193.8,26.0,0.87,11.600,194.0
+27.5,0.87,9.890,197.6,27.3,0.87,10.090,197.8
+28.6,0.86,9.670,203.3,28.4,0.86,9.880,203.6
+29.5,0.86,10.460,205.7,29.3,0.86,10.690,206.0
+29.7,0.86,11.700,195.1,29.5,0.86,11.960,195.4
+29.2,0.86,12.720,188.4,29.0,0.86,13.030,188.7
+26.6,0.86,16.580,210.1,26.4,0.86,17.280,210.1
+26.9,0.86,17.670,196.3,26.8,0.86,18.580,197.2
+24.1,0.86,12.680,188.1,24.2,0.86,13.890,190.3
+24.6,0.86,9.950,194.9,25.4,0.86,12.040,197.1
+24.4,0.86,9.130,191.2,24.6,0.86,9.610,199.4
+25.0,0.86,11.480,189.7,25.3,0.86,12.710,194.7
+23.9,0.86,13.220,190.6,24.2,0.86,14.250,191.6
+23.6,0.86,15.390,197.6,23.9,0.86,16.750,197.8
+22.8,0.86,14.470,201.3,22.9,0.86,15.780,201.9
+21.2,0.86,13.720,207.2,21.4,0.86,15.040,208.8
+20.2,0.86,15.540,217.3,20.5,0.86,16.800,218.5
+19.3,0.86,15.050,225.1,19.9,0.86,16.510,227.8
+20.5,0.86,11.720,233.3,20.8,0.86,12.470,235.8
+22.4,0.86,9.340,238.1,22.4,0.86,10.110,241.2
+26.1,0.86,7.980,242.7,25.9,0.86,8.100,243.6
+29.8,0.86,9.410,268.6,29.6,0.86,9.600,268.9
+30.7,0.86,8.610,249.2,30.5,0.86,8.760,249.3
+31.3,0.86,8.440,244.0,31.1,0.86,8.600,244.0
+32.1,0.86,9.890,245.6,31.8,0.86,10.080,245.7
+32.5,0.86,11.120,248.8,32.3,0.86,11.340,248.9
+33.0,0.85,11.340,248.1,32.7,0.85,11.590,248.0
+33.5,0.85,12.610,243.4,33.3,0.85,12.910,243.6
+33.5,0.85,13.660,248.5,33.3,0.85,14.010,248.4
+33.4,0.85,14.150,240.0,33.2,0.85,14.580,240.2
+32.9,0.85,12.350,232.8,32.8,0.85,13.170,233.5
+31.6,0.85,13.360,226.8,31.9,0.85,15.150,229.8
+31.1,0.85,13.820,223.8,31.8,0.85,15.310,227.1
+29.6,0.85,13.680,216.5,30.3,0.85,14.990,218.1
+28.3,0.85,16.580,224.2,28.8,0.85,18.220,226.1
+27.2,0.85,15.120,236.6,27.6,0.85,16.560,237.7
+26.0,0.85,15.790,238.8,26.4,0.85,17.110,240.3
+25.2,0.85,15.590,248.6,25.6,0.85,16.800,251.2
+23.8,0.85,14.750,244.2,24.2,0.85,16.010,247.9
+23.1,0.85,14.760,252.8,23.6,0.85,16.240,257.3
+15.9,0.86,8.010,9.2,15.7,0.86,9.130,9.6
+15.5,0.86,5.150,344.9,15.3,0.86,5.390,341.6
+14.7,0.86,7.910,3.0,14.5,0.86,8.050,3.0
+15.3,0.86,5.480,3.8,15.1,0.86,5.510,3.1
+16.4,0.86,4.690,1.1,16.2,0.86,4.720,1.0
+18.5,0.86,4.350,358.3,18.3,0.86,4.380,358.1
+20.5,0.86,2.050,6.4,20.3,0.86,2.030,5.7
+22.8,0.86,0.380,5.0,22.6,0.86,0.300,359.9
+25.6,0.86,1.770,221.6,25.3,0.86,1.910,221.0
+27.7,0.86,3.570,198.3,27.5,0.86,3.680,199.3
+29.7,0.86,5.920,228.9,29.5,0.86,6.070,229.1
+30.5,0.86,9.890,223.4,30.3,0.86,10.110,223.6
+30.7,0.86,9.340,210.4,30.5,0.86,9.560,210.6
+30.8,0.86,9.000,207.5,30.6,0.86,9.250,207.9
+30.5,0.86,9.190,207.7,30.4,0.86,9.780,208.5
+29.9,0.86,11.170,189.9,29.9,0.86,11.680,191.3
+29.4,0.86,10.310,188.3,29.6,0.86,11.040,191.0
+28.9,0.86,11.230,184.7,29.5,0.86,11.890,186.9
+29.0,0.86,11.070,177.3,29.5,0.86,11.330,179.5
+27.3,0.86,11.680,172.8,28.0,0.86,12.460,175.5
+24.4,0.86,10.400,175.1,24.5,0.86,11.020,178.9
+23.9,0.86,11.620,226.4,25.0,0.86,13.040,231.7
+25.6,0.86,14.290,235.7,26.3,0.86,15.700,239.7
+23.5,0.86,12.820,234.9,24.4,0.86,14.200,240.4
+24.1,0.86,13.750,238.9,24.9,0.86,15.100,243.1
+24.1,0.86,13.870,249.4,24.9,0.86,15.030,253.7
+21.6,0.86,9.500,234.9,22.0,0.86,10.300,239.9
+22.0,0.86,7.880,212.8,22.1,0.86,8.520,217.9
+24.6,0.86,6.670,212.6,24.5,0.86,6.700,213.5
+27.5,0.86,4.850,234.3,27.3,0.86,4.920,234.5
+29.8,0.86,5.590,231.7,29.6,0.86,5.680,231.8
+31.1,0.86,6.880,220.4,30.8,0.86,7.020,220.4
+32.0,0.86,8.310,213.4,31.8,0.86,8.490,213.3
+32.5,0.86,8.810,206.1,32.3,0.86,9.000,206.2
+33.0,0.86,10.290,205.9,32.8,0.86,10.510,206.0
+33.1,0.86,9.700,202.8,32.9,0.86,9.930,202.8
+33.3,0.86,11.810,196.8,33.1,0.86,12.120,197.0
+32.9,0.86,13.320,199.9,32.7,0.86,13.670,199.9
+31.5,0.86,12.190,182.3,31.3,0.86,12.780,182.5
+30.6,0.86,11.840,186.4,30.7,0.86,13.060,187.8
+30.0,0.86,11.090,204.9,30.3,0.86,12.350,207.3
+28.5,0.86,14.640,173.8,28.6,0.86,15.860,174.1
+25.5,0.86,16.370,152.6,25.4,0.86,17.370,153.7
+23.2,0.86,11.920,157.2,23.1,0.86,12.500,158.4
+22.2,0.86,10.260,172.3,22.2,0.86,10.740,174.1
+21.7,0.86,10.810,170.0,21.7,0.86,11.330,172.2
+21.1,0.87,11.840,170.8,21.3,0.87,12.510,172.4
+21.3,0.87,13.560,176.3,21.4,0.87,14.460,177.8
+20.6,0.87,12.640,168.6,20.7,0.87,13.350,169.8
+21.3,0.87,13.780,185.3,21.5,0.87,14.980,186.5
+20.8,0.87,13.450,170.6,20.6,0.87,13.840,171.1
+22.4,0.87,13.850,175.0,22.2,0.87,14.170,175.3
+23.9,0.87,15.070,188.3,23.7,0.87,15.390,188.5
+25.4,0.87,16.260,191.0,25.2,0.87,16.620,191.1
+26.5,0.87,16.550,192.0,26.3,0.87,16.920,192.1
+27.1,0.87,15.410,186.8,26.9,0.87,15.770,186.9
+28.4,0.87,14.000,189.3,28.2,0.87,14.340,189.3
+29.5,0.86,14.690,189.0,29.2,0.86,15.050,189.0
+29.9,0.86,14.820,179.6,29.6,0.86,15.200,179.8
+30.0,0.86,16.840,175.7,29.8,0.86,17.220,175.8
+29.7,0.86,16.290,169.3,29.5,0.86,16.750,169.4
+18.6,0.87,11.480,178.0,18.5,0.87,12.120,176.4
+16.6,0.87,19.340,190.3,16.4,0.87,20.210,191.1
+20.8,0.86,13.890,165.5,20.6,0.86,14.450,166.1
+20.9,0.86,13.440,171.2,20.8,0.86,14.290,171.6
+21.1,0.86,15.610,171.8,21.0,0.86,16.580,171.4
+20.6,0.86,14.320,176.4,20.6,0.86,15.200,176.6
+20.9,0.86,13.150,167.5,20.9,0.86,14.120,167.5
+20.6,0.86,12.470,167.8,20.6,0.86,13.440,167.9
+20.1,0.86,11.500,170.6,20.2,0.86,12.510,171.7
+19.8,0.86,10.610,173.9,19.9,0.86,11.550,175.6
+19.4,0.86,10.640,183.6,19.5,0.86,11.640,185.6
+18.6,0.86,10.650,188.3,18.6,0.86,11.700,191.4
+18.5,0.86,11.830,200.3,18.5,0.86,12.840,201.9
+18.6,0.86,9.170,200.7,18.5,0.86,9.830,201.8
+19.9,0.86,8.680,198.6,19.7,0.86,8.880,199.1
+21.2,0.86,9.780,204.1,20.9,0.86,9.990,204.3
+22.4,0.86,7.890,206.7,22.1,0.86,8.070,206.9
+24.0,0.86,8.480,210.2,23.7,0.86,8.630,210.3
+25.6,0.86,8.440,214.2,25.4,0.86,8.610,214.3
+27.3,0.86,9.970,221.6,27.1,0.86,10.170,221.6
+28.2,0.86,10.480,216.6,28.0,0.86,10.730,216.8
+29.6,0.86,9.660,215.9,29.4,0.86,9.930,216.0
+30.1,0.86,12.650,225.9,29.9,0.86,12.940,225.8
+30.4,0.86,12.650,219.5,30.2,0.86,12.940,219.6
+30.3,0.86,11.430,225.6,30.1,0.86,11.710,225.8
+29.9,0.86,7.560,240.3,29.8,0.86,8.110,241.7
+29.0,0.86,6.030,246.7,29.1,0.86,6.330,252.6
+26.8,0.86,11.340,296.4,26.8,0.86,12.560,299.1
+25.2,0.86,11.630,300.8,25.4,0.86,12.810,302.0
+24.3,0.86,7.310,300.6,24.5,0.86,8.370,306.2
+24.1,0.86,6.970,302.7,24.0,0.86,7.330,308.1
+22.5,0.86,6.890,322.7,22.5,0.86,6.910,329.6
+21.3,0.87,7.440,332.5,21.2,0.87,7.460,334.8
+20.6,0.87,8.100,339.1,20.4,0.87,8.320,340.9
+19.4,0.87,8.670,334.0,19.2,0.87,9.520,336.8
+18.0,0.87,8.630,341.1,17.9,0.87,9.330,348.3
+16.9,0.87,7.300,1.9,16.8,0.87,7.220,9.5
+16.1,0.87,5.310,0.5,16.1,0.87,5.730,5.6
+16.8,0.87,5.320,2.5,16.6,0.87,5.450,3.5
+17.8,0.87,4.900,23.4,17.5,0.87,4.970,23.7
+19.4,0.87,4.540,21.8,19.2,0.87,4.600,22.0
+21.1,0.87,4.400,26.9,20.9,0.87,4.450,27.1
+22.7,0.87,2.950,29.9,22.4,0.87,2.960,30.4
+24.0,0.87,1.030,35.7,23.8,0.87,0.990,37.2
+25.3,0.87,0.970,227.9,25.1,0.87,1.030,225.0
+26.3,0.87,2.430,215.8,26.1,0.87,2.500,215.3
+26.9,0.87,4.270,219.4,26.7,0.87,4.360,219.3
+27.2,0.87,4.510,217.0,27.0,0.87,4.600,217.1
+27.4,0.87,3.930,213.2,27.2,0.87,4.010,213.2
+27.3,0.87,4.410,215.5,27.2,0.87,4.480,215.3
+27.2,0.87,3.930,166.2,27.0,0.87,3.940,168.0
+27.2,0.87,6.170,165.8,27.1,0.87,6.260,168.7
+26.9,0.87,7.600,183.5,27.1,0.87,7.930,187.9
+27.3,0.86,8.020,181.2,27.4,0.86,7.910,181.9
+25.6,0.87,7.930,155.7,26.1,0.87,7.640,159.6
+24.9,0.87,9.910,161.3,25.3,0.87,10.500,159.5
+22.1,0.87,11.330,171.0,22.4,0.87,11.790,172.3
+21.0,0.87,10.620,202.3,21.5,0.87,11.320,199.5
+21.4,0.87,11.340,216.4,21.9,0.87,11.810,213.0
+21.9,0.87,7.510,270.1,22.2,0.87,7.570,275.8
+20.5,0.87,8.280,301.2,21.1,0.87,8.740,305.7
+20.5,0.87,8.550,309.2,20.8,0.87,9.160,311.2
+20.7,0.87,7.110,316.1,20.5,0.87,7.410,316.1
+21.6,0.87,6.220,319.5,21.4,0.87,6.270,319.7
+23.1,0.87,5.820,323.5,22.9,0.87,5.870,323.6
+24.4,0.87,5.240,333.9,24.2,0.87,5.300,333.8
+26.2,0.87,4.150,327.7,25.9,0.87,4.210,327.5
+27.4,0.87,4.300,328.6,27.2,0.87,4.340,328.3
+28.4,0.87,4.480,316.8,28.2,0.87,4.540,316.6
+29.0,0.87,4.150,311.7,28.8,0.87,4.190,311.4
+29.3,0.87,4.080,310.0,29.1,0.87,4.110,309.6
+29.4,0.87,2.910,328.1,29.2,0.87,2.920,327.4
+29.4,0.87,3.000,351.5,29.2,0.87,3.000,350.9
+29.2,0.87,3.420,21.8,29.0,0.87,3.470,21.4
+28.8,0.87,5.090,35.8,28.7,0.87,5.100,34.5
+28.5,0.87,4.560,49.1,28.3,0.87,4.470,49.5
+27.9,0.87,7.870,67.0,27.7,0.87,7.580,66.8
+27.2,0.86,7.620,76.4,27.1,0.86,7.440,76.3
+26.1,0.86,8.370,91.3,26.2,0.86,8.770,91.1
+25.6,0.86,8.490,98.2,25.8,0.86,8.950,98.4
+24.9,0.86,8.880,114.7,25.4,0.86,9.430,115.0
+21.4,0.86,8.580,106.5,21.8,0.86,9.480,106.6
+21.8,0.86,9.560,114.1,22.6,0.86,10.200,117.2
+20.0,0.86,8.600,120.3,20.8,0.86,9.300,124.0
+18.5,0.86,8.430,119.4,19.2,0.86,9.240,121.5
+17.2,0.86,5.480,125.0,17.2,0.86,6.250,126.4
+18.1,0.86,1.820,54.2,17.9,0.86,1.800,57.9
+20.3,0.86,3.460,57.6,20.1,0.86,3.480,58.9
+22.4,0.86,3.050,64.7,22.2,0.86,3.090,65.7
+24.7,0.86,3.100,73.5,24.4,0.86,3.120,73.8
+26.3,0.86,2.830,60.7,26.1,0.86,2.840,61.5
+27.8,0.86,2.430,70.0,27.6,0.86,2.450,70.8
+28.9,0.86,1.360,71.1,28.6,0.86,1.360,73.9
+29.6,0.86,1.320,35.0,29.4,0.86,1.270,37.2
+30.0,0.86,2.270,357.9,29.8,0.86,2.240,358.9
+30.5,0.86,2.340,344.9,30.3,0.86,2.350,343.6
+30.4,0.86,5.160,329.2,30.2,0.86,5.210,329.0
+30.1,0.86,5.730,330.5,29.9,0.86,5.890,330.6
+29.6,0.86,5.240,335.4,29.5,0.86,5.380,336.1
+29.1,0.86,4.950,348.9,28.9,0.86,4.960,348.1
+27.8,0.86,4.980,32.0,27.9,0.86,5.300,29.4
+20.1,0.86,11.420,132.3,20.0,0.86,12.360,132.5
+18.8,0.86,10.370,133.4,18.7,0.86,11.270,133.5
+18.2,0.86,9.590,148.7,18.3,0.86,10.340,148.5
+17.8,0.86,8.670,142.1,17.7,0.86,9.310,141.7
+17.1,0.86,2.110,140.3,17.0,0.86,2.640,143.0
+16.6,0.87,4.650,60.3,16.5,0.87,4.550,66.2
+16.1,0.87,6.440,62.5,16.0,0.87,6.480,65.4
+14.9,0.87,8.860,65.8,14.9,0.87,9.850,66.7
+15.7,0.87,6.370,56.2,15.5,0.87,6.670,56.9
+16.9,0.87,9.490,33.9,16.6,0.87,9.610,34.1
+17.4,0.87,9.100,27.4,17.2,0.87,9.230,27.6
+18.4,0.87,8.900,33.2,18.2,0.87,9.030,33.3
+19.1,0.87,8.960,39.5,18.9,0.87,9.090,39.5
+19.8,0.87,8.790,47.5,19.6,0.87,8.890,47.5
+20.4,0.87,7.920,53.0,20.1,0.87,8.010,53.2
+21.5,0.87,6.460,58.3,21.2,0.87,6.530,58.8
+22.5,0.87,5.210,67.2,22.2,0.87,5.260,67.6
+23.3,0.87,4.470,68.9,23.0,0.87,4.520,69.8
+23.7,0.87,3.640,92.8,23.5,0.87,3.710,94.0
+23.8,0.87,4.300,122.6,23.5,0.87,4.350,122.6
+23.1,0.87,5.550,151.3,22.9,0.87,5.640,151.1
+22.6,0.87,6.570,143.5,22.4,0.87,6.830,143.9
+21.4,0.87,7.960,139.5,21.3,0.87,8.410,139.5
+20.3,0.87,9.070,137.2,20.2,0.87,9.650,137.3
+19.4,0.87,10.560,139.8,19.3,0.87,11.320,139.5
+18.1,0.87,11.430,140.2,17.9,0.87,12.060,140.2
+17.3,0.87,11.800,147.5,17.1,0.87,12.410,147.3
+16.4,0.87,11.920,141.2,16.3,0.87,12.500,141.0
+15.8,0.87,13.030,155.0,15.6,0.87,13.620,154.9
+15.8,0.87,9.280,180.4,15.7,0.87,9.780,180.6
+15.4,0.87,11.450,156.0,15.3,0.87,12.060,156.7
+14.8,0.87,12.650,152.8,14.7,0.87,13.440,153.0
+15.3,0.87,10.220,174.9,15.1,0.87,10.530,175.0
+16.6,0.87,9.920,179.4,16.4,0.87,10.100,179.7
+18.0,0.87,10.350,187.8,17.8,0.87,10.540,188.0
+20.1,0.87,10.810,198.6,19.8,0.87,11.000,198.8
+21.9,0.87,10.960,203.4,21.7,0.87,11.170,203.6
+23.8,0.87,11.260,211.6,23.6,0.87,11.490,211.7
+25.4,0.87,10.720,219.1,25.1,0.87,10.940,219.2
+26.6,0.87,10.600,221.0,26.4,0.87,10.820,221.1
+27.5,0.87,10.580,224.8,27.2,0.87,10.800,224.9
+28.5,0.86,10.710,223.1,28.3,0.86,10.940,223.2
+29.5,0.86,10.180,225.9,29.3,0.86,10.420,226.1
+30.0,0.86,9.000,229.3,29.8,0.86,9.210,229.4
+29.6,0.86,8.490,253.1,29.4,0.86,8.700,252.5
+27.8,0.86,5.510,276.1,27.7,0.86,6.090,280.0
+25.3,0.87,12.120,352.6,25.0,0.87,12.450,352.1
+21.1,0.86,9.970,161.3,21.5,0.86,10.360,161.2
+20.8,0.86,10.380,145.6,20.7,0.86,10.980,145.7
+20.2,0.87,5.880,140.0,20.2,0.87,6.530,140.6
+21.3,0.87,9.020,61.5,22.0,0.87,8.940,59.4
+23.5,0.86,9.820,134.8,24.2,0.86,9.630,133.9
+26.4,0.87,10.360,158.1,26.7,0.87,10.870,158.9
+25.4,0.87,11.130,180.5,25.6,0.87,11.710,181.3
+23.2,0.87,12.030,184.8,23.9,0.87,12.840,184.0
+21.7,0.87,12.160,189.7,21.8,0.87,13.060,189.6
+21.3,0.87,8.860,199.7,21.2,0.87,9.350,200.6
+22.3,0.87,8.650,211.6,22.1,0.87,8.780,211.8
+24.2,0.87,8.090,213.3,24.0,0.87,8.210,213.5
+26.4,0.87,7.360,204.3,26.1,0.87,7.490,204.4
+28.0,0.87,7.820,205.3,27.8,0.87,7.980,205.4
+29.4,0.87,7.790,203.0,29.1,0.87,7.940,203.0
+30.7,0.87,7.880,201.7,30.4,0.87,8.040,201.9
+31.8,0.86,8.250,201.7,31.5,0.86,8.410,201.8
+32.3,0.86,8.630,199.7,32.1,0.86,8.790,199.8
+32.7,0.86,8.080,193.7,32.4,0.86,8.240,194.0
+32.9,0.86,10.500,191.4,32.6,0.86,10.700,191.6
+32.9,0.86,9.520,183.3,32.7,0.86,9.970,183.6
+19.9,0.86,16.580,328.5,19.8,0.86,17.010,328.9
+19.4,0.87,10.280,279.2,19.3,0.87,11.030,280.2
+21.5,0.86,10.120,173.7,22.2,0.86,10.720,177.8
+24.4,0.87,5.400,46.7,24.9,0.87,4.950,50.0
+23.1,0.86,11.440,191.3,23.3,0.86,11.960,193.9
+25.3,0.86,9.350,170.1,26.2,0.86,9.610,174.2
+21.1,0.86,9.650,138.5,21.1,0.86,10.260,139.2
+19.6,0.86,6.640,172.3,19.8,0.86,7.650,169.4
+22.6,0.86,10.710,174.4,22.9,0.86,11.340,173.7
+20.8,0.86,11.610,170.2,21.0,0.86,12.560,171.8
+20.8,0.86,11.020,156.5,21.0,0.86,11.810,158.7
+19.5,0.86,11.210,165.0,19.9,0.86,12.100,167.2
+21.0,0.87,8.450,197.8,21.4,0.87,9.100,202.2
+22.9,0.86,5.280,202.7,22.8,0.86,5.530,205.8
+24.4,0.86,5.450,215.5,24.2,0.86,5.560,216.0
+26.7,0.86,4.680,208.7,26.5,0.86,4.790,208.9
+28.2,0.86,6.930,194.5,27.9,0.86,7.090,194.8
+30.4,0.86,8.410,209.7,30.2,0.86,8.600,209.7
+31.3,0.86,8.660,207.7,31.1,0.86,8.830,207.7
+32.1,0.86,6.890,210.2,31.9,0.86,7.030,210.3
+32.9,0.86,5.440,216.7,32.7,0.86,5.550,216.7
+33.7,0.86,4.800,229.4,33.5,0.86,4.880,229.2
+34.0,0.86,6.720,241.1,33.7,0.86,6.810,240.9
+34.0,0.86,6.740,229.7,33.8,0.86,6.890,230.0
+29.8,0.86,14.670,333.5,29.6,0.86,14.710,333.9
+30.9,0.86,7.500,187.3,30.9,0.86,8.690,194.7
+23.8,0.86,12.270,138.0,23.8,0.86,12.550,137.2
+24.9,0.86,7.300,148.7,25.5,0.86,7.850,152.0
+23.2,0.86,8.870,152.4,23.0,0.86,9.430,151.5
+21.9,0.86,10.410,156.3,21.9,0.86,10.850,157.0
+23.9,0.86,9.100,189.4,24.1,0.86,9.570,193.6
+21.7,0.87,10.990,149.1,22.1,0.87,11.370,150.5
+23.6,0.87,9.320,172.1,23.9,0.87,9.070,176.3
+24.0,0.87,8.750,184.7,24.2,0.87,8.530,185.7
+22.5,0.87,5.270,184.4,22.7,0.87,6.220,183.0
+22.4,0.87,7.620,186.2,22.6,0.87,7.960,188.4
+22.5,0.87,6.710,181.6,22.7,0.87,6.690,185.4
+22.6,0.87,5.930,154.8,22.4,0.87,5.940,155.1
+24.0,0.87,4.280,160.6,23.8,0.87,4.290,160.6
+25.6,0.87,2.790,140.0,25.4,0.87,2.820,139.9
+26.9,0.87,3.420,93.1,26.7,0.87,3.460,93.5
+27.9,0.87,5.440,119.8,27.6,0.87,5.530,119.9
+28.6,0.87,6.140,132.9,28.3,0.87,6.230,132.9
+28.5,0.87,6.850,128.2,28.3,0.87,6.960,128.6
+29.3,0.87,5.930,127.4,29.1,0.87,6.020,127.7
+24.4,0.87,12.240,331.8,24.3,0.87,12.580,332.5
+17.9,0.87,15.080,284.4,18.0,0.87,15.160,284.9
+23.7,0.87,9.250,46.9,23.6,0.87,9.620,49.3
+24.2,0.87,7.530,88.9,24.3,0.87,8.210,88.3
+20.3,0.87,11.600,238.0,20.3,0.87,12.280,238.4
+19.7,0.87,8.560,234.9,19.4,0.87,9.030,234.8
+18.9,0.87,3.790,33.5,18.8,0.87,3.560,33.2
+19.3,0.87,1.000,355.5,19.3,0.87,1.150,14.6
+19.1,0.87,3.580,119.6,19.0,0.87,3.910,119.6
+19.3,0.87,6.470,18.5,19.6,0.87,6.550,18.3
+17.9,0.87,3.780,290.9,17.9,0.87,3.840,294.2
+18.8,0.87,5.370,290.0,19.0,0.87,5.020,292.8
+18.4,0.87,2.590,285.3,18.5,0.87,2.390,290.4
+17.8,0.87,4.990,277.8,18.0,0.87,4.710,278.8
+17.9,0.87,1.750,302.9,18.2,0.87,2.050,304.8
+17.6,0.87,1.210,332.9,17.7,0.87,1.480,328.8
+18.9,0.87,2.440,245.3,18.7,0.87,2.490,244.4
+19.8,0.87,4.760,282.2,19.6,0.87,4.760,282.4
+20.9,0.87,3.720,310.9,20.7,0.87,3.720,310.8
+21.9,0.87,2.240,331.4,21.7,0.87,2.230,331.2
+23.0,0.87,2.730,9.9,22.8,0.87,2.740,10.4
+20.0,0.87,10.190,177.7,19.8,0.87,10.230,176.8
+19.1,0.87,6.100,50.3,18.9,0.87,6.080,51.4
+21.0,0.87,2.780,5.3,20.8,0.87,2.700,7.2
+23.0,0.86,3.310,357.1,22.8,0.86,3.220,358.0
+23.9,0.87,5.660,48.2,23.7,0.87,5.700,48.6
+20.0,0.87,6.800,82.2,19.8,0.87,6.850,82.3
+20.8,0.86,5.160,134.4,20.6,0.86,5.200,134.2
+20.4,0.86,2.460,84.1,20.2,0.86,2.430,85.3
+19.8,0.86,4.060,60.9,19.7,0.86,3.830,61.5
+19.6,0.87,3.190,9.7,19.5,0.87,3.130,9.1
+18.8,0.86,3.650,61.1,18.7,0.86,3.780,58.4
+18.6,0.86,1.870,64.3,18.4,0.86,1.940,69.5
+18.3,0.87,0.350,87.4,18.2,0.87,0.620,110.6
+17.9,0.87,2.230,77.8,17.9,0.87,2.440,83.1
+17.5,0.87,3.040,124.3,17.4,0.87,3.430,125.0
+17.3,0.86,2.350,148.9,17.3,0.86,2.660,147.6
+17.0,0.87,1.250,113.4,17.2,0.87,1.550,124.4
+17.3,0.87,1.770,180.4,17.6,0.87,2.150,175.7
+17.1,0.87,2.420,150.9,17.0,0.87,2.680,152.5
+18.5,0.87,2.430,187.6,18.3,0.87,2.490,187.7
+20.5,0.87,1.840,157.0,20.3,0.87,1.870,158.2
+22.2,0.87,3.780,185.0,22.0,0.87,3.830,185.2
+23.4,0.87,2.880,211.3,23.2,0.87,2.910,211.3
+24.9,0.87,2.910,192.1,24.6,0.87,2.950,192.5
+26.1,0.87,3.500,204.6,25.9,0.87,3.560,204.7
+27.1,0.86,4.330,227.2,26.9,0.86,4.380,226.9
+27.8,0.86,4.180,235.4,27.6,0.86,4.240,235.1
+28.5,0.86,3.770,227.3,28.3,0.86,3.800,227.6
+29.0,0.86,2.860,242.6,28.8,0.86,2.870,242.7
+23.6,0.86,10.900,99.3,23.4,0.86,11.070,98.9
+23.0,0.86,9.280,122.8,22.8,0.86,9.390,122.9
+21.5,0.86,8.440,125.5,21.3,0.86,8.650,125.9
+20.5,0.87,8.140,126.4,20.3,0.87,8.390,126.5
+18.5,0.87,8.540,123.7,18.3,0.87,8.840,124.0
+17.7,0.87,9.360,121.3,17.5,0.87,9.650,121.4
+17.8,0.87,9.520,126.8,17.6,0.87,9.740,126.9
+18.4,0.87,7.800,135.0,18.2,0.87,8.000,135.1
+18.1,0.87,7.500,142.4,17.9,0.87,7.740,142.0
+17.9,0.87,5.310,132.6,17.7,0.87,5.610,131.7
+18.2,0.87,5.270,121.4,18.0,0.87,5.370,121.7
+17.9,0.87,6.020,145.6,17.7,0.87,6.140,145.2
+17.7,0.87,4.710,123.9,17.4,0.87,4.800,124.1
+17.5,0.87,4.580,119.2,17.3,0.87,4.630,119.7
+17.3,0.87,4.950,115.1,17.1,0.87,4.980,115.5
+17.5,0.87,4.860,118.5,17.3,0.87,4.940,118.7
+18.5,0.87,4.440,146.9,18.3,0.87,4.540,147.3
+20.1,0.87,4.690,132.0,19.9,0.87,4.760,132.5
+22.2,0.87,5.300,141.2,21.9,0.87,5.380,141.2
+22.5,0.87,6.430,134.6,22.3,0.87,6.510,134.9
+23.1,0.87,7.700,120.0,22.9,0.87,7.810,120.9
+23.3,0.87,8.610,133.9,23.1,0.87,8.780,134.1
+22.7,0.87,9.460,133.5,22.4,0.87,9.620,133.5
+22.5,0.87,9.630,138.7,22.3,0.87,9.790,138.8
+22.3,0.87,9.830,142.1,22.1,0.87,10.030,142.1
+20.9,0.87,10.960,140.7,20.7,0.87,11.130,140.8
+20.2,0.87,9.720,140.5,20.0,0.87,10.040,140.4
+19.1,0.87,11.020,140.6,18.9,0.87,11.480,140.7
+18.4,0.87,10.980,143.0,18.2,0.87,11.450,142.9
+17.7,0.87,10.890,142.7,17.6,0.87,11.370,142.5
+17.8,0.87,11.380,148.9,17.6,0.87,11.670,148.7
+17.3,0.87,10.770,146.7,17.1,0.87,11.040,146.8
+16.4,0.87,10.410,148.3,16.2,0.87,10.720,148.6
+15.8,0.87,10.210,147.9,15.5,0.87,10.530,148.2
+15.5,0.87,8.690,148.5,15.3,0.87,8.950,148.9
+15.6,0.87,7.520,148.6,15.4,0.87,7.750,149.4
+15.6,0.87,5.850,140.4,15.4,0.87,5.940,141.3
+15.3,0.87,5.890,146.9,15.1,0.87,6.030,147.8
+15.5,0.87,6.030,148.9,15.3,0.87,6.160,149.6
+15.9,0.87,5.850,154.4,15.7,0.87,5.930,155.0
+16.4,0.87,4.510,157.4,16.1,0.87,4.560,158.2
+17.3,0.87,6.190,163.4,17.0,0.87,6.280,163.7
+18.7,0.87,5.910,168.2,18.5,0.87,6.000,168.8
+20.8,0.87,6.720,175.0,20.6,0.87,6.830,175.2
+22.5,0.87,6.360,175.3,22.3,0.87,6.470,175.5
+23.8,0.87,7.860,166.0,23.6,0.87,7.990,166.3
+24.9,0.87,8.320,173.1,24.7,0.87,8.460,173.5
+25.5,0.87,8.270,170.5,25.2,0.87,8.450,171.0
+25.7,0.87,9.310,169.8,25.5,0.87,9.510,170.1
+25.4,0.87,10.240,172.1,25.3,0.87,10.480,172.5
+24.2,0.87,10.130,159.7,24.1,0.87,10.740,160.0
+22.6,0.86,10.390,151.0,22.5,0.86,10.960,151.8
+21.5,0.86,12.430,160.2,21.4,0.86,13.090,160.7
+20.9,0.86,12.760,163.2,20.7,0.86,13.450,163.6
+20.0,0.86,14.220,166.5,19.9,0.86,14.880,166.7
+19.6,0.86,14.710,168.2,19.4,0.86,15.440,168.3
+19.1,0.86,15.350,171.7,18.9,0.86,16.100,171.9
+18.7,0.86,15.350,176.8,18.6,0.86,16.110,177.1
+18.2,0.86,15.060,179.8,18.1,0.86,15.820,180.2
+17.9,0.86,15.360,182.7,17.8,0.86,16.150,183.2
+17.6,0.86,14.070,182.9,17.6,0.86,14.850,183.7
+18.4,0.86,13.190,194.5,18.3,0.86,14.180,195.2
+20.1,0.86,12.120,187.4,19.9,0.86,12.350,187.7
+21.8,0.86,12.160,193.8,21.6,0.86,12.340,194.1
+23.7,0.86,10.850,191.8,23.4,0.86,11.030,192.0
+25.5,0.86,9.500,198.6,25.3,0.86,9.660,198.7
+27.6,0.86,8.590,204.0,27.4,0.86,8.740,204.2
+29.9,0.86,7.410,207.7,29.6,0.86,7.550,208.1
+31.7,0.86,8.000,203.7,31.4,0.86,8.140,204.1
+33.1,0.86,8.800,211.6,32.9,0.86,8.960,211.9
+34.2,0.86,8.150,216.9,34.0,0.86,8.330,217.4
+34.4,0.86,9.940,227.3,34.2,0.86,10.130,227.6
+34.3,0.86,9.230,218.8,34.1,0.86,9.430,219.0
+34.2,0.86,8.710,214.2,34.1,0.86,9.100,214.6
+32.9,0.86,12.030,191.6,32.9,0.86,12.660,192.8
+31.9,0.86,12.680,183.8,32.3,0.86,13.550,184.8
+32.0,0.86,12.290,180.0,32.4,0.86,12.880,181.0
+26.7,0.86,12.240,160.8,27.1,0.86,13.250,164.2
+25.0,0.86,12.530,163.5,25.1,0.86,13.420,164.8
+23.8,0.86,12.770,162.8,23.8,0.86,13.640,164.8
+22.8,0.86,12.390,171.7,22.9,0.86,13.290,174.4
+23.2,0.86,10.220,190.0,24.0,0.86,10.670,201.2
+20.7,0.86,9.760,217.2,21.8,0.86,10.740,228.9
+25.7,0.86,12.780,281.1,26.9,0.86,13.480,289.4
+24.8,0.86,12.330,273.1,26.1,0.86,12.660,281.4
+24.4,0.86,9.600,271.1,24.9,0.86,10.360,275.3
+26.1,0.86,6.400,277.3,26.0,0.86,6.650,278.5
+28.0,0.86,8.130,288.3,27.8,0.86,8.310,288.4
+29.4,0.86,8.670,288.3,29.2,0.86,8.820,288.4
+30.7,0.86,8.320,281.6,30.5,0.86,8.470,281.4
+31.8,0.86,8.240,284.8,31.5,0.86,8.380,284.6
+32.3,0.86,7.580,272.3,32.1,0.86,7.700,272.0
+33.0,0.86,8.330,256.0,32.8,0.86,8.470,256.3
+33.4,0.86,9.130,260.2,33.2,0.86,9.240,260.1
+33.5,0.86,9.860,254.1,33.3,0.86,9.990,254.2
+33.6,0.86,9.200,246.1,33.3,0.86,9.330,246.3
+33.7,0.86,7.110,246.0,33.5,0.86,7.280,245.7
+33.4,0.86,8.730,227.1,33.2,0.86,9.180,227.5
+33.1,0.86,10.310,218.0,33.1,0.86,10.590,220.0
+32.4,0.86,9.980,215.5,32.5,0.86,10.230,218.7
+31.4,0.86,9.850,236.2,32.0,0.86,10.390,240.3
+31.3,0.86,9.170,250.1,31.8,0.86,9.610,253.9
+27.2,0.86,4.200,84.2,27.4,0.86,4.120,80.5
+25.2,0.86,9.380,121.9,25.8,0.86,8.760,123.3
+21.7,0.86,9.200,35.2,21.7,0.86,10.090,36.7
+19.7,0.87,6.360,45.3,19.6,0.87,7.730,46.3
+18.5,0.87,7.450,16.3,18.4,0.87,8.240,21.0
+17.6,0.87,8.340,13.6,17.5,0.87,9.280,18.9
+17.0,0.87,8.140,13.1,17.0,0.87,9.070,19.7
+17.3,0.87,8.270,13.1,17.1,0.87,8.670,14.6
+18.7,0.87,8.800,19.4,18.4,0.87,8.940,19.8
+20.4,0.87,8.640,26.6,20.2,0.87,8.790,26.7
+21.9,0.87,7.660,34.1,21.7,0.87,7.780,34.5
+23.8,0.87,8.730,44.5,23.5,0.87,8.870,44.6
+24.9,0.87,9.100,46.9,24.7,0.87,9.240,46.9
+26.0,0.87,8.980,48.1,25.8,0.87,9.110,48.1
+26.8,0.87,8.490,53.2,26.6,0.87,8.600,53.3
+27.4,0.87,7.810,53.4,27.2,0.87,7.900,53.5
+28.0,0.87,7.640,58.5,27.8,0.87,7.740,58.9
+28.2,0.87,7.740,74.9,27.9,0.87,7.840,75.0
+27.9,0.87,8.430,82.5,27.7,0.87,8.590,82.6
+27.3,0.87,7.850,78.8,27.1,0.87,8.050,79.2
+26.3,0.87,6.740,83.2,26.2,0.87,7.280,83.6
+25.1,0.87,8.010,90.8,24.9,0.87,8.690,91.8
+24.0,0.87,9.120,95.2,23.8,0.87,9.950,95.3
+23.1,0.87,9.540,93.0,23.0,0.87,10.550,93.2
+22.7,0.87,10.110,99.8,22.5,0.87,10.650,99.8
+21.7,0.87,13.600,119.9,21.5,0.87,14.300,119.4
+21.6,0.87,6.950,108.9,21.4,0.87,7.530,108.0
+20.9,0.87,8.310,117.0,20.8,0.87,9.110,115.8
+17.9,0.87,13.480,5.0,17.7,0.87,13.980,5.3
+16.8,0.87,10.680,88.3,16.9,0.87,11.360,89.3
+17.7,0.87,9.140,78.5,17.6,0.87,9.840,79.6
+18.7,0.87,4.580,103.1,18.7,0.87,5.340,101.9
+19.8,0.87,3.190,114.0,19.6,0.87,3.250,114.4
+16.0,0.88,13.380,2.5,15.9,0.88,13.990,3.0
+18.6,0.87,10.700,61.3,18.4,0.87,10.830,61.4
+21.1,0.87,9.850,98.3,20.8,0.87,10.050,98.3
+22.8,0.87,9.820,121.1,22.6,0.87,10.010,121.2
+24.0,0.87,9.010,138.3,23.8,0.87,9.200,138.3
+23.8,0.87,9.850,141.9,23.5,0.87,10.020,142.0
+24.2,0.87,9.620,147.0,24.0,0.87,9.820,147.2
+25.0,0.87,9.790,154.3,24.8,0.87,10.010,154.5
+25.1,0.87,10.680,145.6,24.8,0.87,10.920,145.9
+24.5,0.87,12.550,135.4,24.3,0.87,12.840,135.8
+24.2,0.87,13.610,136.6,24.0,0.87,13.960,136.9
+22.8,0.87,9.720,245.2,22.6,0.87,9.680,243.9
+17.0,0.87,9.370,80.4,16.9,0.87,9.440,81.2
+18.1,0.87,6.930,120.2,18.1,0.87,7.340,118.4
+17.2,0.87,11.990,162.4,17.2,0.87,12.640,162.5
+17.2,0.87,11.030,176.7,17.2,0.87,11.480,176.2
+17.3,0.87,7.430,142.2,17.3,0.87,8.000,143.0
+16.5,0.87,7.800,137.1,16.3,0.87,8.200,137.1
+16.1,0.87,10.820,152.5,16.0,0.87,11.400,152.3
+16.5,0.87,9.790,161.2,16.9,0.87,10.500,161.7
+16.9,0.87,9.470,166.8,17.3,0.87,10.320,167.8
+16.7,0.87,7.760,161.0,16.9,0.87,8.730,162.2
+16.7,0.87,7.590,167.6,16.6,0.87,8.370,168.4
+18.2,0.87,8.900,167.9,18.0,0.87,9.100,168.2
+20.1,0.87,8.580,175.9,19.9,0.87,8.730,176.1
+21.9,0.87,8.160,179.1,21.7,0.87,8.320,179.3
+23.4,0.87,8.210,176.2,23.2,0.87,8.380,176.4
+24.7,0.87,9.020,176.6,24.5,0.87,9.180,176.8
+26.0,0.87,8.440,176.7,25.8,0.87,8.630,177.0
+27.0,0.87,8.970,172.6,26.8,0.87,9.130,173.1
+28.0,0.87,9.430,177.1,27.8,0.87,9.570,177.3
+28.5,0.87,9.060,174.7,28.3,0.87,9.220,174.8
+28.9,0.87,10.080,174.9,28.7,0.87,10.250,175.1
+29.0,0.87,10.120,170.1,28.8,0.87,10.380,170.4
+28.8,0.86,10.460,166.4,28.6,0.86,10.740,166.5
+25.9,0.86,12.100,142.8,25.8,0.86,12.510,142.9
+24.6,0.86,12.580,143.7,24.4,0.86,13.190,143.7
+23.7,0.86,13.610,145.5,23.5,0.86,14.260,145.5
+22.9,0.86,14.030,148.3,22.8,0.86,14.750,148.2
+22.4,0.86,14.380,154.4,22.2,0.86,15.090,154.5
+21.8,0.86,13.660,156.9,21.7,0.86,14.310,157.2
+21.1,0.87,5.510,126.3,20.9,0.87,6.280,130.7
+20.4,0.87,8.010,115.0,20.2,0.87,8.580,116.0
+19.4,0.86,11.300,130.5,19.3,0.86,11.940,130.2
+19.6,0.86,11.950,146.8,19.6,0.86,12.610,148.0
+18.6,0.86,12.780,132.3,18.6,0.86,13.340,133.1
+20.1,0.86,11.570,159.0,20.0,0.86,12.250,159.4
+20.6,0.86,11.450,142.2,20.4,0.86,11.620,142.5
+21.9,0.86,11.920,145.9,21.7,0.86,12.100,146.2
+23.4,0.87,10.500,163.7,23.2,0.87,10.690,164.0
+27.3,0.86,10.910,170.6,27.0,0.86,11.130,170.8
+29.2,0.86,11.200,171.6,28.9,0.86,11.420,171.8
+30.6,0.86,10.180,170.5,30.3,0.86,10.400,170.8
+31.4,0.86,11.020,169.5,31.1,0.86,11.240,169.7
+32.1,0.86,11.080,172.0,31.9,0.86,11.270,172.2
+32.7,0.86,11.070,168.7,32.4,0.86,11.290,168.9
+32.9,0.86,10.510,169.6,32.7,0.86,10.770,169.8
+32.7,0.86,12.610,169.8,32.5,0.86,12.920,170.0
+32.2,0.86,13.390,167.2,32.0,0.86,13.860,167.3
+29.5,0.86,14.280,142.2,29.4,0.86,15.030,142.5
+28.1,0.86,15.850,138.2,27.9,0.86,16.660,138.4
+18.8,0.87,15.500,58.9,18.7,0.87,16.260,58.7
+19.4,0.87,11.560,91.6,19.3,0.87,12.310,91.1
+20.7,0.87,10.400,41.6,20.5,0.87,10.840,42.3
+19.4,0.87,7.360,57.9,19.3,0.87,7.810,60.1
+20.8,0.87,14.160,49.9,20.6,0.87,14.780,49.8
+18.4,0.87,12.600,79.5,18.4,0.87,13.160,79.4
+17.5,0.87,9.820,89.6,17.3,0.87,10.540,89.7
+18.3,0.87,10.010,100.0,18.2,0.87,10.940,99.1
+19.9,0.87,12.530,109.1,19.9,0.87,13.540,109.1
+20.4,0.87,8.380,95.9,20.2,0.87,8.800,95.7
+22.5,0.87,9.860,104.5,22.3,0.87,10.190,104.4
+23.2,0.87,10.240,104.8,23.0,0.87,10.480,105.1
+24.3,0.87,10.960,113.3,24.1,0.87,11.180,113.5
+25.1,0.87,9.490,132.2,24.8,0.87,9.670,132.3
+26.2,0.87,8.230,139.3,25.9,0.87,8.380,139.5
+27.3,0.87,9.040,145.8,27.0,0.87,9.210,146.1
+27.9,0.87,8.950,152.2,27.6,0.87,9.130,152.3
+28.8,0.87,8.570,159.8,28.5,0.87,8.750,159.9
+29.3,0.87,9.710,153.1,29.0,0.87,9.920,153.3
+29.8,0.87,9.930,157.1,29.5,0.87,10.150,157.4
+30.1,0.87,9.100,161.0,29.9,0.87,9.300,161.0
+30.2,0.87,8.780,165.9,30.0,0.87,9.030,166.0
+29.6,0.87,9.170,149.0,29.5,0.87,9.880,149.5
+27.6,0.87,11.060,138.1,27.5,0.87,11.800,138.5
+27.0,0.87,10.910,139.0,27.0,0.87,11.750,139.5
+26.5,0.87,12.500,142.7,26.5,0.87,13.310,142.9
+25.7,0.87,4.600,193.1,25.4,0.87,4.850,202.2
+17.5,0.87,14.440,320.8,17.3,0.87,15.250,320.9
+19.1,0.87,5.680,351.5,19.1,0.87,6.540,349.1
+20.2,0.87,3.510,327.7,20.1,0.87,3.860,329.3
+20.8,0.87,2.450,198.0,21.2,0.87,2.540,202.4
+21.6,0.87,8.310,191.6,22.1,0.87,8.510,193.4
+20.1,0.87,6.840,177.9,20.5,0.87,7.440,178.7
+20.4,0.87,5.590,187.2,20.8,0.87,6.330,188.5
+22.6,0.87,6.470,183.4,22.5,0.87,6.610,184.5
+24.5,0.87,6.880,186.0,24.3,0.87,7.010,186.2
+26.3,0.87,5.840,196.5,26.1,0.87,5.920,196.6
+27.9,0.87,3.970,204.3,27.7,0.87,4.030,204.6
+29.1,0.87,2.340,210.8,28.9,0.87,2.370,210.9
+30.1,0.87,0.750,145.2,29.9,0.87,0.760,146.6
+30.8,0.87,3.380,149.0,30.5,0.87,3.390,149.5
+31.2,0.87,4.110,151.0,30.9,0.87,4.140,151.3
+31.6,0.87,4.280,168.4,31.4,0.87,4.330,168.4
+31.9,0.87,3.530,183.1,31.7,0.87,3.590,183.4
+32.1,0.87,2.630,170.4,31.9,0.87,2.650,170.6
+22.2,0.87,15.640,141.1,22.0,0.87,16.040,141.5
+22.3,0.87,13.010,170.3,22.1,0.87,13.490,170.2
+21.4,0.87,12.790,185.0,21.2,0.87,13.130,184.8
+22.9,0.87,8.080,222.8,23.0,0.87,8.220,227.1
+23.0,0.87,9.910,287.1,22.9,0.87,10.430,288.2
+22.3,0.87,11.380,188.4,22.2,0.87,11.690,188.7
+22.0,0.87,10.970,201.3,21.8,0.87,11.530,201.7
+21.5,0.87,4.340,259.0,21.4,0.87,5.160,256.1
+21.3,0.87,1.660,299.6,21.2,0.87,2.030,290.6
+21.2,0.87,4.700,196.1,21.2,0.87,5.010,201.3
+21.1,0.87,6.560,225.9,21.0,0.87,7.660,230.7
+20.6,0.87,9.190,231.2,20.6,0.87,9.770,234.0
+21.1,0.87,7.790,239.5,20.9,0.87,8.150,240.3
+22.6,0.87,7.870,228.6,22.4,0.87,8.020,228.9
+24.4,0.87,7.280,220.8,24.2,0.87,7.430,221.2
+25.6,0.87,7.440,218.3,25.4,0.87,7.580,218.5
+27.1,0.87,7.710,223.7,26.9,0.87,7.850,223.8
+28.4,0.87,8.500,223.1,28.2,0.87,8.650,223.3
+29.6,0.87,8.650,217.3,29.3,0.87,8.810,217.6
+30.4,0.87,8.720,218.2,30.2,0.87,8.880,218.4
+31.1,0.86,8.830,218.1,30.9,0.86,8.990,218.3
+31.7,0.86,8.780,217.5,31.4,0.86,8.940,217.8
+32.0,0.86,9.000,212.9,31.8,0.86,9.170,213.1
+32.0,0.86,9.620,210.7,31.8,0.86,9.820,210.8
+31.6,0.86,10.680,197.7,31.4,0.86,10.970,198.0
+30.7,0.86,9.930,192.8,30.6,0.86,10.580,193.7
+29.5,0.86,12.380,189.3,29.5,0.86,13.320,190.3
+28.4,0.86,13.260,186.5,28.4,0.86,14.200,187.5
+27.9,0.86,13.850,191.6,27.9,0.86,14.850,192.8
+27.3,0.86,14.840,198.6,27.3,0.86,15.940,199.3
+26.7,0.86,15.220,201.5,26.8,0.86,16.360,202.2
+26.1,0.86,14.450,205.3,26.1,0.86,15.540,206.3
+25.4,0.86,15.070,206.0,25.4,0.86,16.250,206.7
+24.3,0.86,14.830,213.0,24.4,0.86,16.060,214.1
+23.4,0.86,14.980,214.8,23.5,0.86,16.210,216.3
+22.8,0.86,14.420,215.2,22.9,0.86,15.650,217.0
+23.2,0.86,13.550,219.6,23.1,0.86,13.890,220.0
+24.7,0.86,9.500,218.6,24.5,0.86,9.630,219.2
+27.0,0.86,6.790,208.3,26.8,0.86,6.840,208.6
+29.3,0.86,5.800,206.1,29.1,0.86,5.850,206.3
+31.3,0.86,6.140,197.6,31.1,0.86,6.210,197.7
+33.1,0.86,6.140,188.1,32.9,0.86,6.210,188.4
+34.4,0.86,5.810,186.7,34.1,0.86,5.890,186.8
+35.0,0.86,6.920,175.4,34.8,0.86,7.030,175.8
+35.5,0.86,7.710,173.1,35.3,0.86,7.830,173.3
+35.9,0.86,8.110,178.8,35.7,0.86,8.240,179.0
+36.0,0.86,8.950,176.0,35.8,0.86,9.140,176.3
+35.7,0.86,10.530,174.8,35.5,0.86,10.760,174.9
+35.1,0.86,11.540,166.6,34.9,0.86,11.950,166.8
+33.5,0.86,12.080,156.4,33.4,0.86,12.870,156.7
+31.4,0.86,14.010,149.4,31.3,0.86,14.840,149.8
+29.6,0.86,14.740,154.0,29.5,0.86,15.610,154.4
+28.4,0.86,14.660,159.3,28.3,0.86,15.500,159.9
+27.4,0.86,13.900,164.9,27.4,0.86,14.750,165.6
+26.7,0.86,14.360,171.3,26.6,0.86,15.240,172.0
+26.0,0.86,14.490,179.5,25.9,0.86,15.350,180.4
+25.2,0.86,14.290,182.0,25.1,0.86,15.100,183.1
+24.0,0.86,14.050,184.9,24.0,0.86,14.880,186.0
+23.2,0.86,14.670,186.4,23.1,0.86,15.490,187.3
+22.3,0.86,15.110,187.0,22.2,0.86,15.950,188.0
+22.1,0.86,14.120,191.4,22.0,0.86,14.840,192.1
+23.3,0.86,14.870,195.2,23.1,0.86,15.140,195.4
+24.6,0.86,13.800,193.9,24.4,0.86,14.040,194.1
+25.8,0.86,12.500,185.8,25.6,0.86,12.740,186.1
+27.3,0.86,11.930,181.5,27.1,0.86,12.160,181.6
+28.8,0.86,12.040,181.1,28.6,0.86,12.270,181.2
+30.3,0.86,12.000,180.9,30.0,0.86,12.240,181.0
+31.2,0.86,12.760,180.5,30.9,0.86,12.980,180.6
+31.7,0.86,13.060,180.7,31.4,0.86,13.280,180.8
+32.1,0.86,13.150,179.9,31.9,0.86,13.380,180.1
+32.3,0.86,12.430,178.4,32.1,0.86,12.740,178.6
+32.0,0.86,15.110,175.8,31.8,0.86,15.400,175.9
+31.6,0.86,14.420,169.9,31.4,0.86,14.810,170.1
+30.3,0.86,14.720,163.6,30.2,0.86,15.470,163.7
+29.0,0.86,14.470,159.4,28.9,0.86,15.190,159.6
+27.8,0.86,14.950,161.6,27.7,0.86,15.700,161.8
+27.0,0.86,14.880,167.7,26.9,0.86,15.650,167.8
+26.2,0.86,15.870,171.0,26.0,0.86,16.700,171.3
+25.2,0.86,15.330,178.6,25.1,0.86,16.150,178.8
+24.4,0.86,14.490,184.1,24.3,0.86,15.270,184.4
+23.7,0.86,15.090,182.8,23.5,0.86,15.900,183.4
+22.7,0.86,15.560,181.1,22.5,0.86,16.340,181.6
+21.7,0.86,15.880,179.5,21.6,0.86,16.620,179.9
+20.9,0.86,15.750,181.8,20.8,0.86,16.440,182.2
+20.8,0.86,16.810,183.6,20.6,0.86,17.260,183.9
+21.3,0.86,15.350,187.6,21.0,0.86,15.670,187.8
+22.5,0.86,11.380,186.8,22.3,0.86,11.610,187.0
+24.2,0.86,10.510,187.1,24.0,0.86,10.720,187.2
+26.1,0.86,9.930,184.3,25.9,0.86,10.120,184.4
+27.7,0.86,10.280,179.5,27.4,0.86,10.460,179.7
+29.2,0.86,9.300,179.2,28.9,0.86,9.480,179.3
+30.2,0.86,8.540,176.5,29.9,0.86,8.670,176.6
+30.9,0.86,8.770,173.6,30.6,0.86,8.890,173.8
+31.2,0.86,8.660,170.9,31.0,0.86,8.780,171.1
+31.3,0.86,8.830,167.7,31.1,0.86,8.970,167.9
+31.3,0.86,9.200,165.8,31.1,0.86,9.380,166.1
+30.8,0.86,9.500,163.2,30.6,0.86,9.720,163.5
+30.1,0.86,8.420,160.9,29.9,0.86,8.940,161.3
+28.9,0.87,7.740,148.3,28.8,0.87,8.280,149.4
+27.8,0.87,11.520,144.7,27.7,0.87,12.190,145.3
+26.5,0.87,11.390,133.3,26.4,0.87,11.980,133.7
+18.7,0.87,16.660,296.8,18.6,0.87,16.980,296.5
+26.8,0.87,14.360,252.5,27.2,0.87,14.080,254.3
+23.1,0.87,11.870,13.8,23.1,0.87,12.170,13.8
+21.1,0.87,9.210,347.0,20.9,0.87,9.480,349.5
+19.4,0.87,7.810,12.1,19.2,0.87,8.100,14.5
+18.1,0.87,7.840,15.8,17.9,0.87,8.170,17.0
+17.0,0.87,8.200,31.2,16.8,0.87,8.390,31.7
+16.8,0.87,8.210,35.9,16.6,0.87,8.340,36.1
+16.7,0.87,8.120,35.1,16.5,0.87,8.230,35.4
+16.9,0.87,6.710,34.9,16.6,0.87,6.790,35.1
+17.5,0.87,6.800,33.4,17.3,0.87,6.870,33.8
+18.6,0.87,6.130,39.1,18.4,0.87,6.200,39.5
+20.2,0.87,4.840,35.7,20.0,0.87,4.880,36.4
+22.1,0.87,5.050,23.1,21.9,0.87,5.070,23.8
+23.4,0.87,4.760,26.1,23.2,0.87,4.770,26.8
+24.3,0.87,4.580,23.1,24.1,0.87,4.580,23.8
+25.0,0.87,4.550,16.6,24.8,0.87,4.550,17.3
+25.4,0.87,4.470,19.8,25.2,0.87,4.470,20.4
+25.6,0.87,4.400,20.2,25.3,0.87,4.410,20.7
+25.2,0.87,5.030,25.6,25.0,0.87,5.050,25.9
+24.6,0.87,5.650,23.2,24.4,0.87,5.840,24.2
+24.4,0.87,5.190,49.9,24.3,0.87,5.670,53.3
+24.3,0.87,3.930,92.6,24.3,0.87,4.250,100.0
+23.9,0.87,5.830,151.9,23.8,0.87,6.460,152.4
+23.1,0.87,7.160,138.7,23.0,0.87,7.690,138.4
+22.1,0.87,9.540,138.1,22.0,0.87,10.120,137.8
+21.3,0.87,9.820,141.3,21.1,0.87,10.390,141.2
+20.7,0.87,10.160,142.9,20.5,0.87,10.770,142.7
+20.2,0.87,10.430,148.2,20.1,0.87,11.080,148.1
+19.9,0.87,10.670,150.9,19.8,0.87,11.270,151.0
+19.8,0.87,10.960,150.1,19.7,0.87,11.500,150.4
+20.4,0.87,10.130,156.8,20.2,0.87,10.400,157.0
+21.6,0.87,9.250,162.9,21.4,0.87,9.420,163.3
+23.6,0.87,8.880,170.2,23.4,0.87,9.040,170.4
+25.4,0.87,8.180,178.5,25.2,0.87,8.330,178.8
+27.2,0.87,7.970,187.7,27.0,0.87,8.120,187.9
+28.7,0.87,7.690,190.3,28.4,0.87,7.840,190.5
+29.6,0.87,7.770,188.1,29.3,0.87,7.900,188.3
+30.5,0.87,7.850,187.6,30.3,0.87,7.990,187.7
+31.2,0.87,7.880,188.4,30.9,0.87,8.020,188.5
+31.7,0.87,7.710,185.9,31.4,0.87,7.880,186.0
+31.9,0.87,7.790,181.5,31.7,0.87,7.980,181.7
+31.8,0.87,8.490,191.1,31.6,0.87,8.680,191.0
+31.4,0.87,8.430,192.9,31.3,0.87,8.660,192.8
+30.6,0.87,8.690,190.1,30.6,0.87,9.160,190.7
+29.8,0.87,9.930,182.9,29.9,0.87,10.780,185.5
+28.6,0.87,9.870,177.9,28.5,0.87,10.610,178.9
+27.5,0.87,11.580,177.8,27.4,0.87,12.420,178.4
+26.7,0.87,11.920,179.3,26.6,0.87,12.800,179.9
+25.7,0.87,11.960,180.3,25.7,0.87,12.840,181.1
+25.2,0.87,11.700,188.6,25.2,0.87,12.650,189.5
+24.6,0.87,11.820,190.4,24.6,0.87,12.840,191.4
+24.3,0.87,12.940,196.2,24.4,0.87,14.000,197.4
+23.8,0.87,13.380,202.6,23.8,0.87,14.440,203.5
+23.3,0.87,13.310,210.5,23.4,0.87,14.380,211.4
+23.7,0.87,12.910,212.9,23.6,0.87,13.750,213.5
+25.0,0.87,12.370,212.1,24.8,0.87,12.630,212.4
+26.6,0.87,12.020,213.6,26.3,0.87,12.260,213.8
+28.3,0.87,11.300,213.0,28.0,0.87,11.520,213.1
+29.5,0.87,9.830,211.5,29.3,0.87,10.020,211.6
+30.6,0.87,8.950,206.9,30.4,0.87,9.100,207.0
+31.5,0.87,8.540,202.7,31.3,0.87,8.690,202.8
+32.3,0.87,7.730,200.7,32.1,0.87,7.860,200.7
+32.9,0.87,8.240,196.7,32.6,0.87,8.400,196.7
+33.1,0.87,8.600,195.1,32.9,0.87,8.760,195.2
+33.2,0.87,8.950,195.1,33.0,0.87,9.120,195.0
+33.1,0.87,9.010,194.8,32.9,0.87,9.220,194.8
+32.6,0.87,8.970,195.1,32.4,0.87,9.190,195.2
+31.5,0.87,8.700,194.8,31.4,0.87,9.280,194.9
+30.7,0.87,10.960,192.4,30.7,0.87,11.640,192.9
+29.8,0.87,11.300,190.5,29.9,0.87,12.250,191.2
+28.3,0.87,11.980,187.3,28.4,0.87,13.020,188.1
+27.4,0.87,12.480,191.0,27.5,0.87,13.630,191.8
+26.6,0.87,12.930,194.3,26.7,0.87,14.150,195.1
+26.0,0.87,13.380,201.5,26.2,0.87,14.580,202.2
+25.2,0.87,13.310,204.9,25.5,0.87,14.590,205.9
+24.8,0.87,13.860,209.3,25.1,0.87,15.110,210.0
+23.9,0.87,12.760,215.8,24.4,0.87,13.830,217.1
+23.6,0.87,12.130,220.7,24.1,0.87,13.150,221.9
+23.5,0.87,10.620,224.3,23.5,0.87,11.300,225.2
+25.3,0.87,8.520,217.3,25.1,0.87,8.700,218.2
+27.3,0.87,9.120,221.0,27.0,0.87,9.260,221.2
+28.9,0.87,8.000,219.6,28.7,0.87,8.120,219.6
+30.3,0.87,6.490,217.5,30.1,0.87,6.590,217.5
+31.4,0.87,5.880,206.6,31.1,0.87,5.970,206.6
+32.4,0.87,5.400,197.4,32.2,0.87,5.500,197.2
+33.2,0.87,5.750,189.5,33.0,0.87,5.870,189.3
+33.8,0.87,6.040,179.3,33.6,0.87,6.160,179.5
+34.0,0.87,6.040,183.5,33.7,0.87,6.140,183.5
+34.1,0.87,6.540,174.8,33.8,0.87,6.620,175.3
+34.1,0.87,6.940,174.7,33.9,0.87,7.080,174.9
+33.6,0.87,7.010,176.0,33.4,0.87,7.150,176.3
+33.1,0.87,8.710,183.8,33.0,0.87,8.740,183.7
+31.7,0.87,7.690,191.4,31.8,0.87,8.270,194.3
+31.3,0.87,8.030,186.6,31.4,0.87,8.200,187.9
+30.1,0.87,9.390,191.0,30.3,0.87,9.950,192.0
+28.9,0.87,8.940,193.2,29.4,0.87,10.070,193.0
+28.1,0.87,9.380,195.3,28.5,0.87,10.640,196.2
+27.6,0.87,11.010,202.8,28.1,0.87,12.250,203.0
+27.2,0.87,10.680,216.0,27.6,0.87,11.740,215.5
+26.7,0.87,11.240,222.2,27.2,0.87,12.190,221.2
+26.9,0.87,11.110,231.4,27.3,0.87,11.600,230.7
+26.5,0.87,11.180,234.7,26.8,0.87,11.520,234.7
+26.4,0.87,8.900,232.3,26.8,0.87,9.430,233.0
+26.7,0.87,5.650,238.9,26.5,0.87,5.780,239.0
+28.8,0.87,4.470,254.6,28.6,0.87,4.540,254.4
+30.4,0.87,3.790,247.8,30.2,0.87,3.830,247.4
+31.7,0.87,2.980,230.2,31.4,0.87,3.020,229.8
+32.7,0.87,2.850,205.5,32.5,0.87,2.890,205.0
+33.6,0.87,3.780,183.1,33.4,0.87,3.850,183.0
+34.3,0.87,4.480,175.2,34.1,0.87,4.560,175.3
+34.7,0.87,6.040,162.9,34.5,0.87,6.120,163.5
+35.0,0.87,5.400,173.3,34.8,0.87,5.460,173.4
+35.2,0.87,5.640,163.2,35.0,0.87,5.730,164.0
+35.2,0.87,5.800,170.8,35.0,0.87,5.930,170.9
+34.9,0.87,6.120,170.0,34.7,0.87,6.310,170.6
+34.2,0.87,5.890,171.6,34.1,0.87,6.290,171.5
+32.9,0.87,9.010,157.8,33.0,0.87,9.480,159.0
+30.7,0.87,8.800,161.7,30.8,0.87,9.690,161.6
+29.9,0.87,9.690,169.3,30.1,0.87,10.730,170.3
+29.0,0.87,10.280,174.4,29.3,0.87,11.620,174.8
+28.5,0.87,10.970,181.0,28.8,0.87,12.280,181.3
+27.9,0.87,12.500,187.1,28.3,0.87,13.960,187.1
+27.5,0.87,12.210,197.6,27.9,0.87,13.640,197.4
+27.5,0.87,12.920,201.8,27.9,0.87,14.500,201.6
+27.1,0.87,12.740,206.3,27.6,0.87,14.150,205.8
+26.4,0.87,12.700,216.1,27.0,0.87,13.900,215.8
+25.6,0.87,10.260,226.1,26.1,0.87,11.130,226.8
+27.5,0.87,7.310,222.9,27.4,0.87,7.620,223.8
+29.8,0.87,7.440,224.8,29.6,0.87,7.570,225.1
+31.8,0.87,7.230,230.4,31.6,0.87,7.360,230.4
+33.2,0.87,6.550,226.5,33.0,0.87,6.670,226.4
+34.2,0.87,6.610,223.2,34.0,0.87,6.720,223.1
+35.3,0.87,7.000,214.6,35.0,0.87,7.130,214.5
+35.8,0.87,8.220,210.2,35.6,0.87,8.340,210.1
+36.2,0.87,8.430,192.9,36.0,0.87,8.550,193.4
+36.3,0.87,7.650,226.5,36.1,0.87,7.760,226.0
+36.5,0.87,8.820,197.6,36.3,0.87,9.020,197.7
+36.2,0.87,7.380,212.3,36.0,0.87,7.530,212.1
+36.0,0.86,6.960,201.9,35.8,0.86,7.220,201.4
+35.4,0.86,9.860,201.9,35.4,0.86,10.230,202.7
+34.8,0.87,9.570,199.1,34.9,0.87,10.120,199.2
+34.2,0.87,9.800,192.7,34.5,0.87,10.340,194.0
+32.6,0.87,12.370,180.5,32.8,0.87,13.530,180.3
+30.5,0.87,11.280,175.6,30.7,0.87,12.640,175.7
+29.7,0.87,11.160,179.2,30.0,0.87,12.640,178.7
+28.9,0.87,10.860,182.8,29.1,0.87,12.170,182.3
+28.7,0.87,12.840,186.5,29.0,0.87,14.180,187.5
+28.9,0.87,11.690,191.8,29.4,0.87,12.910,193.8
+27.3,0.87,10.940,188.6,27.7,0.87,12.030,191.6
+27.7,0.87,11.830,199.7,28.1,0.87,13.030,201.0
+26.7,0.87,10.750,209.1,26.9,0.87,11.590,210.0
+28.7,0.87,8.760,208.5,28.5,0.87,8.960,208.8
+30.9,0.87,8.390,200.6,30.7,0.87,8.540,200.8
+32.5,0.87,7.540,205.8,32.3,0.87,7.670,205.9
+34.0,0.87,6.390,203.8,33.7,0.87,6.500,204.0
+35.0,0.87,5.940,193.7,34.8,0.87,6.040,193.8
+35.7,0.87,6.400,174.5,35.5,0.87,6.500,174.9
+36.0,0.87,6.690,169.7,35.8,0.87,6.760,169.9
+36.4,0.87,6.840,163.2,36.2,0.87,6.990,163.4
+36.6,0.87,7.760,155.2,36.4,0.87,7.930,155.3
+35.0,0.87,1.880,268.9,34.9,0.87,1.890,253.3
+35.4,0.87,11.920,141.8,35.2,0.87,12.000,142.2
+35.4,0.87,9.850,167.3,35.3,0.87,10.050,166.9
+33.9,0.87,10.740,143.5,33.8,0.87,11.400,143.8
+32.6,0.87,12.270,146.8,32.5,0.87,13.230,147.0
+31.4,0.87,11.890,149.2,31.4,0.87,12.810,149.4
+30.5,0.87,12.520,154.3,30.6,0.87,13.510,154.5
+29.5,0.87,12.890,158.0,29.5,0.87,14.050,158.4
+28.4,0.87,12.290,160.3,28.5,0.87,13.490,161.0
+27.7,0.87,12.530,163.1,27.9,0.87,13.780,164.9
+27.1,0.87,12.320,166.4,27.4,0.87,13.390,168.5
+26.2,0.87,10.300,181.7,26.6,0.87,11.410,183.8
+26.4,0.87,10.910,182.9,26.8,0.87,11.910,186.5
+26.3,0.87,10.620,192.5,27.0,0.87,11.150,198.7
+25.7,0.87,8.050,209.0,26.0,0.87,8.680,211.2
+27.2,0.87,2.600,232.2,27.0,0.87,2.780,233.0
+29.7,0.87,3.860,224.8,29.5,0.87,3.930,225.0
+31.8,0.87,4.890,221.5,31.5,0.87,4.980,221.7
+33.0,0.87,4.560,209.1,32.8,0.87,4.630,209.2
+34.3,0.87,4.190,196.8,34.0,0.87,4.260,196.6
+35.2,0.87,4.240,174.3,35.0,0.87,4.320,174.2
+35.7,0.87,5.430,160.4,35.4,0.87,5.500,160.3
+35.9,0.87,6.260,143.0,35.7,0.87,6.320,143.3
+36.0,0.87,7.380,136.1,35.8,0.87,7.460,136.4
+36.1,0.87,8.130,151.3,35.8,0.87,8.290,151.5
+35.8,0.87,8.140,139.5,35.6,0.87,8.320,140.0
+35.1,0.87,10.560,147.1,34.9,0.87,10.800,147.1
+33.4,0.87,8.300,166.0,33.3,0.87,8.770,166.1
+32.8,0.87,8.800,163.4,32.6,0.87,9.130,163.2
+32.0,0.87,7.460,163.1,31.9,0.87,7.780,165.3
+31.6,0.87,4.600,287.9,31.6,0.87,4.770,284.8
+31.2,0.87,5.200,196.9,31.1,0.87,5.550,199.3
+30.3,0.87,6.840,165.9,30.2,0.87,7.250,169.3
+29.0,0.87,7.310,159.7,29.0,0.87,7.730,165.1
+27.7,0.87,5.340,263.8,27.7,0.87,5.560,258.0
+27.5,0.87,4.590,282.0,27.6,0.87,5.670,280.1
+27.6,0.87,10.010,241.1,27.8,0.87,10.510,240.2
+25.7,0.87,6.820,195.2,26.1,0.87,7.310,200.6
+25.8,0.87,8.260,179.6,26.0,0.87,8.880,181.3
+27.0,0.87,10.230,204.6,26.8,0.87,10.400,205.1
+29.2,0.87,9.050,234.6,29.0,0.87,9.210,234.6
+30.8,0.87,3.930,231.1,30.6,0.87,4.020,230.9
+31.8,0.87,2.840,217.0,31.5,0.87,2.860,216.4
+33.0,0.87,5.820,204.9,32.8,0.87,5.910,205.0
+33.9,0.87,4.590,201.6,33.6,0.87,4.660,201.7
+34.5,0.87,7.130,170.1,34.2,0.87,7.230,170.4
+34.5,0.87,6.010,152.7,34.3,0.87,6.080,153.2
+34.8,0.87,7.030,163.5,34.6,0.87,7.110,163.6
+35.0,0.87,6.060,198.1,34.8,0.87,6.140,197.7
+34.6,0.87,8.480,186.4,34.4,0.87,8.630,186.6
+34.0,0.87,9.310,189.0,33.8,0.87,9.520,189.3
+30.6,0.87,8.670,255.4,30.4,0.87,9.040,255.7
+31.1,0.87,4.130,261.8,31.4,0.87,4.600,257.8
+30.7,0.87,12.090,126.3,30.6,0.87,12.070,126.7
+29.0,0.87,7.550,117.0,28.8,0.87,7.910,118.3
+28.3,0.87,10.850,169.0,28.2,0.87,11.370,168.2
+27.9,0.87,10.180,174.1,27.8,0.87,10.640,175.6
+26.8,0.87,8.980,189.5,26.8,0.87,9.560,192.8
+25.8,0.87,4.680,192.6,25.8,0.87,5.470,201.0
+25.0,0.87,6.290,105.2,24.9,0.87,6.400,103.2
+24.3,0.87,11.690,194.3,24.5,0.87,12.350,193.3
+27.0,0.87,8.770,209.7,27.1,0.87,9.700,208.7
+26.5,0.87,8.320,222.3,26.4,0.87,8.920,223.9
+28.2,0.87,6.080,208.1,28.0,0.87,6.180,208.7
+28.9,0.87,4.000,194.3,28.7,0.87,4.040,195.7
+30.3,0.87,3.830,194.1,30.1,0.87,3.870,194.8
+31.8,0.87,3.750,191.9,31.6,0.87,3.800,192.1
+32.7,0.87,4.780,170.8,32.5,0.87,4.840,171.2
+33.4,0.87,4.930,156.1,33.2,0.87,4.960,156.3
+33.9,0.87,5.890,162.4,33.7,0.87,5.970,162.4
+34.0,0.86,7.540,154.2,33.8,0.86,7.670,154.5
+33.9,0.86,7.480,168.6,33.7,0.86,7.650,168.5
+29.6,0.86,11.270,211.3,29.5,0.86,11.620,210.8
+28.7,0.86,11.710,151.9,28.6,0.86,11.860,152.0
+28.4,0.87,12.900,199.4,28.3,0.87,13.480,198.6
+25.3,0.87,12.100,236.8,25.3,0.87,12.810,236.9
+26.9,0.87,6.750,227.7,26.8,0.87,7.310,229.4
+25.8,0.87,3.570,169.6,25.8,0.87,3.600,180.1
+25.9,0.87,4.040,131.2,25.9,0.87,4.300,133.8
+26.0,0.87,5.890,85.7,26.0,0.87,6.400,88.3
+25.0,0.87,4.820,54.9,24.8,0.87,5.320,58.3
+25.4,0.87,9.660,138.6,25.7,0.87,10.140,142.1
+24.0,0.87,7.930,140.0,24.1,0.87,8.710,142.8
+23.6,0.87,10.080,157.2,23.9,0.87,10.640,160.8
+23.1,0.87,11.620,183.2,23.4,0.87,12.570,185.2
+21.9,0.87,12.250,194.1,22.0,0.87,13.160,195.4
+22.0,0.87,9.990,198.1,21.9,0.87,10.480,198.7
+23.6,0.87,9.430,190.8,23.4,0.87,9.570,191.0
+24.9,0.87,9.140,187.6,24.7,0.87,9.280,187.8
+26.6,0.87,8.970,187.0,26.3,0.87,9.130,187.1
+28.1,0.87,7.980,181.8,27.9,0.87,8.110,181.9
+28.9,0.87,7.750,175.1,28.6,0.87,7.860,175.2
+29.6,0.87,6.830,171.3,29.4,0.87,6.970,171.5
+30.3,0.87,7.490,168.3,30.0,0.87,7.640,168.6
+30.6,0.87,7.460,166.1,30.4,0.87,7.540,166.1
+31.0,0.87,8.700,160.2,30.8,0.87,8.890,160.3
+31.1,0.87,9.130,158.1,30.8,0.87,9.320,158.3
+30.8,0.87,8.640,162.9,30.6,0.87,8.820,163.0
+30.3,0.87,9.380,155.9,30.1,0.87,9.620,156.2
+29.1,0.87,10.330,149.4,29.0,0.87,10.900,149.7
+27.8,0.87,10.970,152.3,27.7,0.87,11.520,152.6
+26.8,0.87,9.910,159.3,26.7,0.87,10.580,159.8
+25.8,0.87,9.850,165.3,25.8,0.87,10.560,165.9
+25.1,0.87,10.330,175.0,25.1,0.87,11.180,175.5
+24.6,0.87,11.130,176.7,24.6,0.87,11.990,177.4
+23.9,0.87,10.950,185.9,23.8,0.87,11.840,187.0
+23.0,0.87,11.380,190.3,22.9,0.87,12.300,191.6
+22.4,0.87,12.420,199.4,22.3,0.87,13.340,200.3
+22.0,0.87,12.220,207.5,22.0,0.87,13.150,208.5
+21.5,0.87,12.090,208.4,21.5,0.87,12.960,209.3
+22.1,0.87,10.950,213.8,21.9,0.87,11.300,214.4
+23.3,0.87,10.790,208.8,23.1,0.87,10.990,209.1
+24.5,0.87,10.240,208.1,24.3,0.87,10.410,208.2
+25.6,0.87,9.190,207.0,25.4,0.87,9.330,207.0
+26.9,0.87,7.610,194.2,26.7,0.87,7.740,194.3
+27.8,0.87,7.840,184.4,27.5,0.87,7.960,184.5
+28.5,0.87,7.950,181.7,28.3,0.87,8.090,181.8
+29.1,0.87,8.230,181.7,28.8,0.87,8.370,181.8
+29.5,0.87,8.840,185.5,29.2,0.87,8.980,185.6
+29.8,0.87,8.650,185.4,29.5,0.87,8.780,185.4
+30.1,0.87,8.410,189.3,29.8,0.87,8.600,189.3
+29.8,0.87,9.190,179.5,29.6,0.87,9.350,179.8
+29.5,0.87,9.730,191.3,29.3,0.87,9.980,191.5
+28.7,0.87,7.510,184.4,28.5,0.87,7.960,185.6
+27.9,0.87,10.040,190.7,27.8,0.87,10.710,191.1
+27.1,0.87,8.420,176.9,26.9,0.87,9.080,177.7
+26.3,0.87,10.220,187.2,26.2,0.87,10.910,188.0
+25.8,0.87,10.050,187.9,25.7,0.87,10.850,189.0
+25.2,0.87,10.670,188.0,25.1,0.87,11.570,189.2
+24.5,0.87,12.120,190.9,24.5,0.87,13.000,191.7
+23.9,0.87,12.470,195.3,23.8,0.87,13.480,196.4
+23.2,0.87,12.070,204.1,23.2,0.87,13.080,205.0
+22.8,0.87,12.770,204.3,22.9,0.87,13.890,205.1
+22.1,0.87,13.370,202.0,22.2,0.87,14.510,202.8
+22.5,0.87,12.590,208.7,22.4,0.87,13.330,209.0
+23.2,0.87,12.180,207.9,23.0,0.87,12.410,208.0
+24.3,0.87,10.980,207.8,24.1,0.87,11.150,207.8
+25.6,0.87,9.120,207.8,25.4,0.87,9.270,207.8
+26.9,0.87,8.860,193.5,26.7,0.87,9.020,193.5
+27.7,0.87,8.030,189.7,27.5,0.87,8.160,189.8
+28.6,0.87,8.080,186.8,28.3,0.87,8.210,186.9
+29.3,0.87,8.310,185.7,29.0,0.87,8.460,185.8
+29.8,0.87,8.380,188.8,29.6,0.87,8.540,188.7
+30.2,0.87,8.810,179.7,29.9,0.87,8.970,180.0
+30.4,0.87,8.590,184.4,30.2,0.87,8.730,184.3
+30.4,0.87,8.440,185.2,30.2,0.87,8.630,185.3
+30.0,0.87,8.890,180.8,29.8,0.87,9.080,181.2
+29.5,0.87,9.620,182.5,29.4,0.87,10.100,182.8
+28.4,0.87,8.620,171.4,28.4,0.87,9.180,172.3
+27.5,0.87,9.720,174.8,27.4,0.87,10.580,175.5
+26.8,0.87,11.860,180.5,26.7,0.87,12.630,180.9
+26.1,0.87,12.980,180.9,26.0,0.87,13.840,181.6
+25.4,0.87,12.680,182.2,25.4,0.87,13.540,183.0
+24.9,0.87,13.150,189.2,24.9,0.87,14.020,190.1
+24.5,0.87,13.510,198.0,24.4,0.87,14.390,199.0
+24.0,0.87,14.160,201.3,23.9,0.87,15.030,202.3
+23.4,0.87,13.250,205.6,23.4,0.87,14.130,206.3
+22.8,0.87,12.800,204.9,22.7,0.87,13.630,205.3
+22.9,0.87,11.840,202.8,22.8,0.87,12.270,203.3
+23.9,0.87,10.680,204.3,23.7,0.87,10.880,204.5
+25.1,0.87,10.180,206.3,24.8,0.87,10.370,206.4
+26.6,0.87,9.030,197.3,26.4,0.87,9.190,197.4
+27.9,0.87,8.540,190.2,27.7,0.87,8.700,190.3
+28.8,0.87,9.110,182.0,28.6,0.87,9.270,182.1
+29.6,0.87,8.860,179.8,29.3,0.87,9.020,180.0
+30.3,0.87,9.530,175.9,30.0,0.87,9.680,176.1
+30.9,0.87,9.820,178.5,30.6,0.87,9.980,178.7
+31.4,0.87,9.610,182.1,31.2,0.87,9.800,182.2
+31.6,0.87,9.460,182.8,31.4,0.87,9.670,182.7
+31.5,0.87,9.750,183.8,31.3,0.87,9.940,183.9
+31.2,0.87,10.240,180.9,31.0,0.87,10.530,181.1
+30.4,0.87,10.400,172.8,30.3,0.87,10.970,173.1
+29.4,0.87,10.400,168.5,29.3,0.87,11.130,168.9
+28.3,0.87,11.050,165.8,28.2,0.87,11.830,166.4
+27.3,0.87,12.170,166.7,27.3,0.87,13.040,167.4
+26.6,0.87,11.940,170.8,26.6,0.87,12.860,171.7
+26.0,0.87,11.800,175.3,25.9,0.87,12.610,175.8
+25.3,0.87,12.210,178.1,25.2,0.87,13.120,179.3
+24.6,0.87,12.780,185.2,24.6,0.87,13.750,186.7
+24.1,0.87,12.450,190.9,24.1,0.87,13.510,192.7
+23.4,0.87,11.370,195.3,23.4,0.87,12.430,197.0
+22.9,0.87,11.500,194.6,22.9,0.87,12.680,196.6
+23.0,0.87,10.790,199.5,22.8,0.87,11.700,200.2
+24.2,0.87,10.670,202.0,24.0,0.87,10.870,202.3
+25.4,0.87,9.820,197.6,25.1,0.87,9.990,197.8
+26.9,0.87,9.000,191.7,26.7,0.87,9.170,191.8
+28.1,0.87,8.620,184.9,27.9,0.87,8.780,185.0
+29.1,0.87,8.780,176.6,28.8,0.87,8.950,176.7
+29.8,0.87,9.580,169.8,29.5,0.87,9.750,170.0
+30.6,0.87,9.310,173.0,30.3,0.87,9.510,173.1
+31.0,0.87,9.430,177.7,30.7,0.87,9.610,177.5
+31.2,0.87,10.030,166.5,31.0,0.87,10.240,166.8
+31.2,0.87,10.390,171.0,31.0,0.87,10.550,171.1
+31.1,0.87,10.540,170.7,30.9,0.87,10.780,170.9
+30.8,0.87,10.860,169.1,30.6,0.87,11.150,169.5
+29.9,0.87,9.980,169.6,29.8,0.87,10.520,170.2
+28.9,0.87,10.800,167.8,28.9,0.87,11.690,168.1
+27.9,0.87,10.510,167.3,27.9,0.87,11.610,168.3
+27.2,0.87,10.030,175.3,27.2,0.87,10.900,175.6
+26.4,0.87,11.180,172.3,26.5,0.87,12.200,173.4
+26.0,0.87,11.760,169.8,26.1,0.87,12.800,171.0
+24.9,0.87,10.130,170.7,25.0,0.87,11.340,172.6
+24.4,0.87,11.380,181.8,24.5,0.87,12.310,183.9
+23.7,0.87,9.150,197.4,23.8,0.87,9.930,202.4
+23.4,0.87,9.030,195.9,23.6,0.87,9.060,200.8
+23.0,0.87,7.960,205.2,23.1,0.87,8.250,207.2
+22.5,0.87,5.990,204.8,22.4,0.87,6.580,205.7
+23.8,0.87,7.230,209.3,23.6,0.87,7.360,209.4
+25.0,0.87,7.380,199.2,24.8,0.87,7.520,199.2
+26.0,0.87,7.380,194.0,25.7,0.87,7.510,194.0
+27.0,0.87,7.740,190.5,26.7,0.87,7.880,190.5
+28.0,0.87,7.860,188.4,27.7,0.87,8.000,188.4
+29.0,0.87,8.530,184.0,28.7,0.87,8.680,184.1
+29.8,0.87,8.390,178.8,29.6,0.87,8.550,178.9
+30.5,0.87,8.290,174.8,30.3,0.87,8.470,174.9
+30.9,0.87,8.270,172.5,30.7,0.87,8.450,172.6
+30.9,0.87,8.540,179.3,30.7,0.87,8.670,179.4
+31.0,0.87,7.660,177.1,30.8,0.87,7.830,177.5
+30.8,0.87,7.510,172.0,30.6,0.87,7.730,171.9
+30.1,0.87,7.350,174.6,30.0,0.87,7.800,174.2
+29.5,0.87,9.030,168.1,29.5,0.87,9.500,169.3
+28.5,0.87,10.120,170.1,28.5,0.87,11.160,170.3
+26.7,0.87,9.130,159.5,26.7,0.87,10.250,160.8
+25.9,0.87,9.610,174.8,25.9,0.87,10.770,175.9
+25.5,0.87,8.580,179.4,25.6,0.87,9.740,181.2
+25.2,0.87,8.810,183.4,25.4,0.87,10.080,183.8
+24.7,0.87,8.480,185.8,24.9,0.87,9.490,185.2
+24.2,0.87,7.230,218.9,24.2,0.87,7.550,216.5
+24.8,0.87,7.620,220.0,24.8,0.87,7.750,220.7
+23.8,0.87,5.120,243.1,24.1,0.87,5.180,242.7
+23.6,0.87,3.210,305.1,23.7,0.87,3.470,310.4
+25.0,0.87,1.950,329.2,24.8,0.87,1.940,328.6
+26.5,0.87,1.440,330.6,26.3,0.87,1.430,329.4
+27.8,0.87,1.900,336.8,27.6,0.87,1.880,336.1
+28.8,0.87,1.140,29.1,28.6,0.87,1.120,30.8
+29.8,0.87,1.010,42.2,29.6,0.87,0.970,45.4
+27.6,0.87,11.970,81.0,27.6,0.87,11.610,81.6
+28.6,0.87,5.080,103.6,28.4,0.87,5.190,104.1
+29.8,0.87,7.270,152.6,29.5,0.87,7.370,152.8
+29.6,0.87,4.680,197.8,29.4,0.87,4.710,197.5
+30.1,0.87,1.790,188.7,29.9,0.87,1.820,185.1
+30.3,0.87,2.650,145.5,30.1,0.87,2.690,145.8
+30.6,0.87,2.870,146.1,30.4,0.87,2.920,147.0
+29.6,0.87,2.970,198.9,29.5,0.87,3.270,199.7
+29.7,0.87,3.130,182.9,29.5,0.87,3.340,181.9
+28.0,0.87,5.810,249.1,28.0,0.87,5.560,250.1
+28.4,0.87,2.520,266.1,28.4,0.87,1.990,262.2
+28.5,0.87,0.910,342.6,28.3,0.87,0.830,350.2
+27.1,0.87,2.390,42.1,27.2,0.87,2.510,41.9
+26.4,0.87,1.470,46.3,26.5,0.87,1.520,53.9
+25.9,0.87,1.450,121.3,26.1,0.87,1.710,125.4
+25.7,0.87,1.840,159.0,25.9,0.87,1.990,158.9
+25.8,0.87,1.540,206.8,25.9,0.87,1.630,204.8
+24.4,0.87,2.680,346.0,24.6,0.87,2.590,343.4
+24.0,0.87,2.140,358.2,24.3,0.87,2.250,358.9
+24.4,0.87,2.130,332.7,24.2,0.87,2.140,331.7
+26.3,0.87,3.530,324.3,26.1,0.87,3.530,324.4
+28.3,0.87,2.840,353.1,28.0,0.87,2.850,353.2
+29.9,0.87,2.290,36.2,29.6,0.87,2.290,37.1
+30.8,0.87,2.720,47.8,30.5,0.87,2.720,48.2
+31.4,0.87,2.770,34.4,31.1,0.87,2.760,35.3
+31.2,0.87,9.690,83.5,31.0,0.87,9.630,83.8
+31.9,0.87,4.300,62.3,31.7,0.87,4.330,62.7
+31.1,0.87,7.080,112.2,30.9,0.87,7.140,112.0
+31.1,0.87,7.440,119.7,30.8,0.87,7.520,119.9
+30.4,0.87,5.930,108.6,30.2,0.87,5.950,108.8
+30.4,0.87,3.680,124.3,30.2,0.87,3.700,124.7
+29.7,0.87,5.150,110.0,29.5,0.87,5.240,109.8
+29.1,0.87,5.460,112.6,29.0,0.87,5.380,112.0
+28.7,0.87,4.760,112.6,28.6,0.87,4.720,112.3
+28.4,0.87,3.850,102.5,28.2,0.87,3.700,102.7
+27.7,0.87,4.620,104.0,27.5,0.87,4.850,105.0
+25.7,0.87,6.200,64.6,25.7,0.87,6.710,66.6
+23.9,0.87,10.450,61.6,23.6,0.87,11.570,59.5
+22.1,0.87,6.910,47.9,22.0,0.87,7.900,48.7
+21.2,0.87,5.480,25.5,21.1,0.87,6.160,30.1
+20.1,0.87,6.700,25.2,20.0,0.87,7.280,29.4
+19.3,0.87,5.490,21.9,19.1,0.87,6.080,27.6
+19.1,0.87,4.740,24.8,18.9,0.87,4.780,25.3
+20.3,0.87,4.510,23.9,20.1,0.87,4.550,24.2
+22.0,0.87,4.120,24.4,21.8,0.87,4.150,24.8
+23.3,0.87,3.590,17.6,23.1,0.87,3.610,18.0
+24.6,0.87,4.470,16.1,24.3,0.87,4.480,16.1
+25.1,0.87,2.810,45.8,24.9,0.87,2.830,44.8
+26.4,0.87,3.870,26.6,26.2,0.87,3.900,26.2
+27.4,0.87,2.870,6.0,27.2,0.87,2.880,6.1
+27.9,0.87,4.300,358.8,27.7,0.87,4.320,359.2
+27.1,0.87,5.270,15.6,26.9,0.87,5.330,15.3
+27.5,0.87,7.840,43.7,27.2,0.87,7.890,43.6
+26.2,0.87,6.280,72.2,26.0,0.87,6.230,71.9
+23.6,0.87,5.990,345.8,23.6,0.87,6.060,347.1
+22.8,0.87,8.240,41.5,22.6,0.87,8.310,41.4
+22.2,0.87,3.680,103.0,22.0,0.87,3.700,102.6
+22.0,0.87,4.840,77.8,21.8,0.87,4.920,77.0
+20.9,0.87,6.740,78.4,20.7,0.87,6.830,78.9
+19.0,0.87,6.080,39.9,18.8,0.87,6.110,40.3
+18.7,0.87,3.670,70.7,18.6,0.87,3.790,72.1
+18.8,0.87,1.610,47.3,18.6,0.87,1.620,49.3
+18.5,0.87,1.730,4.8,18.5,0.87,2.050,14.6
+18.3,0.87,4.120,353.3,18.2,0.87,4.140,353.4
+18.3,0.87,3.960,6.0,18.1,0.87,4.170,6.8
+18.2,0.87,5.620,23.9,18.2,0.87,6.460,26.0
+18.6,0.87,4.850,23.5,18.5,0.87,5.430,25.1
+19.3,0.87,8.240,18.7,19.1,0.87,8.390,18.8
+19.2,0.87,6.520,46.1,19.0,0.87,6.620,46.1
+20.0,0.87,6.920,47.8,19.8,0.87,7.020,47.7
+21.3,0.87,5.250,62.2,21.1,0.87,5.280,61.7
+21.6,0.87,5.740,61.0,21.3,0.87,5.750,60.6
+22.9,0.87,6.900,42.7,22.7,0.87,6.940,42.9
+21.9,0.87,9.110,54.1,21.7,0.87,9.150,53.1
+23.9,0.87,5.860,35.9,23.7,0.87,5.960,36.1
+24.2,0.87,4.690,73.2,24.0,0.87,4.820,72.3
+22.9,0.87,9.470,56.8,22.7,0.87,9.550,57.0
+23.2,0.87,6.530,76.5,23.0,0.87,6.640,76.7
+22.7,0.87,7.160,77.4,22.5,0.87,7.260,77.6
+21.4,0.87,5.570,103.0,21.2,0.87,5.710,102.9
+21.2,0.87,3.960,94.8,21.0,0.87,4.100,95.0
+21.0,0.87,3.460,116.2,20.8,0.87,3.560,115.0
+20.7,0.87,1.380,90.4,20.5,0.87,1.600,91.0
+20.4,0.87,1.400,25.9,20.4,0.87,1.440,37.0
+20.1,0.87,2.680,58.7,20.0,0.87,2.550,66.6
+19.9,0.87,2.390,49.1,19.8,0.87,2.380,56.9
+19.7,0.87,2.080,6.5,19.8,0.87,2.050,15.2
+19.3,0.87,2.760,8.8,19.4,0.87,2.870,13.5
+18.9,0.87,2.730,4.4,19.0,0.87,2.880,9.4
+18.7,0.87,2.900,358.9,18.8,0.87,3.130,4.3
+18.8,0.87,2.350,4.2,18.9,0.87,2.780,8.6
+20.3,0.87,2.650,16.6,20.1,0.87,2.670,17.1
+21.8,0.87,3.390,32.2,21.6,0.87,3.410,32.8
+23.3,0.87,2.970,49.5,23.1,0.87,3.000,50.1
+24.5,0.87,3.790,50.5,24.3,0.87,3.810,50.9
+25.4,0.87,4.210,84.9,25.2,0.87,4.250,84.2
+26.3,0.87,3.600,51.1,26.0,0.87,3.610,51.8
+26.4,0.87,3.570,112.7,26.2,0.87,3.500,112.3
+25.7,0.87,5.060,133.1,25.5,0.87,5.030,132.1
+26.4,0.87,5.810,116.0,26.2,0.87,5.880,116.1
+26.2,0.87,7.960,125.6,26.0,0.87,8.000,125.7
+26.1,0.87,5.900,148.5,25.9,0.87,6.000,147.8
+26.8,0.87,6.220,141.7,26.6,0.87,6.320,141.2
+25.9,0.87,5.870,157.4,25.7,0.87,6.180,156.8
+25.6,0.87,6.210,154.5,25.5,0.87,6.630,153.8
+24.0,0.87,6.770,189.8,23.9,0.87,7.080,188.6
+23.7,0.87,6.030,192.5,23.8,0.87,6.020,187.0
+23.5,0.87,6.610,195.4,23.5,0.87,6.720,190.5
+23.4,0.87,5.420,194.4,23.4,0.87,5.410,188.7
+23.4,0.87,4.790,188.0,23.5,0.87,4.830,184.3
+22.9,0.87,4.110,187.2,23.0,0.87,4.160,183.6
+21.9,0.87,4.070,194.1,22.0,0.87,4.100,190.4
+21.8,0.87,3.480,189.1,21.9,0.87,3.560,186.1
+21.7,0.87,3.230,190.9,21.9,0.87,3.300,189.3
+21.1,0.87,3.800,213.3,21.3,0.87,3.930,214.2
+22.6,0.87,2.850,242.6,22.4,0.87,2.890,243.6
+24.3,0.87,2.490,235.2,24.1,0.87,2.510,235.6
+25.7,0.87,2.470,207.7,25.5,0.87,2.500,208.0
+27.0,0.87,1.460,199.3,26.8,0.87,1.470,199.8
+27.9,0.87,1.750,137.8,27.7,0.87,1.760,138.0
+28.7,0.87,2.650,97.4,28.4,0.87,2.630,97.7
+29.4,0.87,3.070,108.3,29.1,0.87,3.050,108.1
+29.9,0.87,3.530,118.1,29.6,0.87,3.520,118.2
+30.2,0.87,4.230,116.1,30.0,0.87,4.240,116.3
+30.1,0.87,4.980,129.6,29.9,0.87,5.000,129.9
+29.9,0.87,5.870,131.6,29.7,0.87,5.950,131.8
+29.5,0.87,6.870,134.8,29.3,0.87,6.980,134.9
+28.7,0.87,7.950,138.8,28.5,0.87,8.310,138.7
+27.9,0.87,9.400,141.9,27.8,0.87,10.020,141.8
+26.8,0.87,9.730,146.2,26.9,0.87,10.570,145.2
+26.7,0.87,10.580,146.9,26.8,0.87,11.310,146.5
+26.1,0.87,9.570,159.2,26.3,0.87,10.320,158.9
+25.1,0.87,9.450,153.2,25.1,0.87,10.030,152.1
+23.8,0.87,12.170,167.3,23.8,0.87,13.440,168.5
+23.3,0.87,9.420,178.4,23.4,0.87,10.460,179.2
+23.4,0.87,11.880,186.0,23.5,0.87,12.800,186.2
+23.0,0.87,9.790,188.3,23.1,0.87,10.690,189.3
+22.3,0.87,8.200,200.4,22.5,0.87,9.130,202.7
+22.1,0.87,7.190,197.6,22.2,0.87,7.890,199.7
+23.6,0.87,7.310,200.0,23.4,0.87,7.440,200.6
+25.7,0.87,6.850,208.5,25.5,0.87,6.950,208.7
+27.4,0.87,5.670,212.0,27.2,0.87,5.750,212.2
+28.6,0.87,4.410,210.3,28.4,0.87,4.460,210.4
+29.6,0.87,3.350,199.3,29.4,0.87,3.380,199.3
+30.4,0.87,3.050,177.6,30.2,0.87,3.070,177.7
+31.0,0.87,3.070,158.0,30.8,0.87,3.100,157.8
+31.3,0.87,3.090,163.8,31.0,0.87,3.110,163.7
+31.5,0.87,4.880,146.8,31.3,0.87,4.930,146.8
+31.6,0.87,5.320,155.8,31.4,0.87,5.380,155.6
+31.3,0.87,7.290,156.5,31.1,0.87,7.400,156.6
+27.9,0.87,7.550,1.0,27.7,0.87,8.050,0.9
+29.2,0.87,5.160,132.6,29.1,0.87,5.290,132.0
+28.8,0.87,9.790,146.0,28.7,0.87,10.360,146.1
+27.9,0.87,10.060,158.3,27.9,0.87,10.830,158.3
+27.2,0.87,10.390,163.4,27.2,0.87,11.260,163.8
+26.4,0.87,10.220,168.3,26.4,0.87,11.090,169.4
+25.6,0.87,10.100,178.8,25.7,0.87,10.920,179.4
+25.3,0.87,11.270,186.1,25.4,0.87,12.300,186.6
+24.8,0.87,11.090,184.3,24.9,0.87,12.200,185.1
+24.6,0.87,11.220,189.7,24.8,0.87,12.260,190.1
+23.8,0.87,10.560,195.3,24.0,0.87,11.680,196.3
+23.3,0.87,10.640,198.5,23.6,0.87,11.770,199.4
+23.2,0.87,9.490,198.5,23.1,0.87,9.990,199.1
+24.7,0.87,8.140,178.9,24.5,0.87,8.260,179.4
+26.4,0.87,9.030,184.9,26.1,0.87,9.170,185.1
+28.1,0.87,8.310,179.3,27.9,0.87,8.480,179.6
+27.8,0.87,9.370,171.8,27.6,0.87,9.500,172.1
+29.3,0.87,6.410,164.2,29.1,0.87,6.510,164.2
+30.1,0.87,6.380,154.1,29.9,0.87,6.470,154.2
+30.7,0.87,6.560,152.0,30.4,0.87,6.680,152.3
+31.3,0.87,6.520,160.6,31.0,0.87,6.640,160.9
+31.6,0.87,7.480,156.1,31.3,0.87,7.600,156.3
+31.6,0.87,7.630,165.6,31.4,0.87,7.780,165.6
+31.2,0.87,7.200,184.7,30.9,0.87,7.330,184.6
+30.6,0.87,8.370,194.7,30.4,0.87,8.540,194.7
+30.2,0.87,7.900,193.0,30.1,0.87,8.310,193.1
+29.8,0.87,8.610,182.8,29.8,0.87,9.010,183.7
+28.5,0.87,9.800,161.6,28.5,0.87,10.210,163.0
+27.2,0.87,10.360,165.1,27.3,0.87,11.220,165.9
+26.4,0.87,10.630,176.7,26.6,0.87,11.670,177.0
+25.8,0.87,10.600,182.4,25.9,0.87,11.760,183.0
+25.3,0.87,11.850,179.7,25.5,0.87,13.080,180.2
+24.4,0.87,11.330,192.2,24.5,0.87,12.500,192.7
+24.1,0.87,11.730,192.8,24.3,0.87,12.990,193.5
+23.7,0.87,11.690,199.7,23.9,0.87,12.980,200.3
+23.2,0.87,10.930,207.1,23.3,0.87,12.330,206.9
+22.5,0.87,9.560,214.8,22.6,0.87,10.400,214.8
+24.0,0.87,7.430,219.2,23.8,0.87,7.560,219.2
+25.9,0.87,7.870,218.4,25.7,0.87,7.980,218.4
+27.7,0.87,7.960,207.2,27.4,0.87,8.090,207.3
+28.9,0.87,6.290,210.8,28.6,0.87,6.390,210.8
+29.8,0.87,5.530,202.7,29.6,0.87,5.610,202.7
+30.4,0.87,4.370,201.7,30.2,0.87,4.420,201.5
+30.9,0.87,4.100,177.4,30.7,0.87,4.170,177.1
+29.8,0.87,8.640,300.1,29.6,0.87,8.620,299.8
+26.9,0.87,6.940,242.3,26.7,0.87,6.850,241.9
+28.3,0.87,9.650,235.2,28.1,0.87,9.740,234.9
+29.0,0.87,7.790,237.5,28.8,0.87,7.910,237.3
+29.0,0.87,7.330,235.3,28.8,0.87,7.600,235.2
+28.6,0.87,5.480,223.8,28.7,0.87,6.170,225.9
+28.2,0.87,4.980,179.0,28.1,0.87,5.200,188.9
+27.7,0.87,11.200,134.1,27.6,0.87,12.070,134.4
+25.8,0.87,12.440,157.9,25.7,0.87,13.140,158.5
+24.4,0.87,11.720,173.9,24.2,0.87,12.500,174.7
+23.3,0.87,10.860,176.4,23.3,0.87,11.700,177.4
+22.7,0.87,10.800,178.0,22.7,0.87,11.710,179.3
+22.6,0.87,12.270,195.3,22.6,0.87,12.850,195.9
+22.1,0.87,8.640,204.2,22.0,0.87,9.360,205.0
+22.0,0.87,7.310,204.4,21.9,0.87,7.720,208.2
+21.7,0.87,10.070,199.5,21.8,0.87,10.810,203.5
+21.7,0.87,9.830,202.6,21.5,0.87,10.290,203.8
+23.1,0.87,8.810,201.3,22.9,0.87,8.920,201.6
+25.3,0.87,7.620,196.6,25.1,0.87,7.740,196.8
+27.4,0.87,6.980,199.4,27.2,0.87,7.100,199.4
+29.0,0.87,7.100,197.1,28.7,0.87,7.210,197.2
+29.9,0.87,6.420,206.5,29.6,0.87,6.520,206.5
+30.6,0.87,6.320,203.7,30.3,0.87,6.420,203.9
+31.1,0.87,5.820,193.0,30.8,0.87,5.900,193.2
+28.2,0.87,13.130,266.5,28.1,0.87,13.410,266.3
+28.6,0.87,0.410,155.9,28.4,0.87,0.460,178.0
+29.7,0.87,9.920,170.6,29.4,0.87,10.070,171.1
+30.2,0.87,7.850,174.6,30.0,0.87,7.990,175.0
+29.4,0.87,10.190,168.0,29.2,0.87,10.460,168.0
+27.4,0.87,10.910,165.8,27.3,0.87,11.540,166.2
+26.0,0.87,9.550,170.7,26.0,0.87,10.240,170.9
+24.1,0.87,10.860,163.1,24.0,0.87,11.560,163.1
+23.3,0.87,11.520,186.2,23.1,0.87,12.170,186.4
+23.5,0.87,12.540,194.2,23.4,0.87,13.290,194.6
+23.7,0.87,13.720,201.1,23.6,0.87,14.550,201.3
+23.4,0.87,12.830,200.5,23.4,0.87,13.790,201.3
+22.9,0.87,12.470,207.5,22.9,0.87,13.480,208.6
+22.7,0.87,12.300,209.5,22.8,0.87,13.290,210.4
+22.5,0.87,12.660,209.0,22.7,0.87,13.690,210.7
+22.2,0.87,12.540,200.4,22.3,0.87,13.420,202.5
+22.5,0.87,12.560,208.0,22.4,0.87,13.010,208.2
+23.9,0.87,12.000,210.7,23.7,0.87,12.240,211.0
+25.3,0.87,11.230,210.4,25.0,0.87,11.410,210.6
+27.0,0.87,10.100,206.7,26.8,0.87,10.280,206.8
+28.5,0.87,9.110,200.9,28.2,0.87,9.270,201.0
+29.6,0.87,8.060,197.0,29.3,0.87,8.200,197.0
+30.4,0.87,7.730,190.7,30.2,0.87,7.860,190.8
+31.1,0.87,7.840,187.9,30.8,0.87,7.970,188.1
+31.5,0.87,8.790,186.4,31.3,0.87,8.950,186.6
+31.7,0.87,8.790,187.8,31.5,0.87,8.950,187.7
+31.8,0.87,8.460,180.4,31.6,0.87,8.630,180.6
+31.7,0.87,8.970,175.6,31.5,0.87,9.190,175.8
+31.4,0.87,8.880,188.2,31.2,0.87,9.090,188.4
+24.1,0.87,7.870,300.6,23.9,0.87,8.000,300.3
+23.6,0.87,2.530,298.0,23.7,0.87,2.680,299.6
+25.1,0.87,4.120,228.1,25.5,0.87,4.040,230.1
+25.8,0.87,7.370,187.8,26.1,0.87,7.630,189.5
+26.9,0.87,8.900,170.7,27.0,0.87,9.640,172.8
+26.4,0.87,9.120,176.4,26.5,0.87,9.890,177.3
+24.7,0.87,6.870,202.7,24.8,0.87,7.530,199.7
+23.8,0.87,3.840,239.8,24.1,0.87,4.760,216.7
+23.7,0.87,6.200,199.1,23.9,0.87,7.580,199.7
+24.1,0.87,10.540,203.8,24.2,0.87,11.640,205.7
+23.5,0.87,11.690,208.6,23.5,0.87,12.720,210.1
+23.4,0.87,11.880,216.3,23.2,0.87,12.560,216.6
+24.3,0.87,11.130,216.6,24.1,0.87,11.320,216.8
+25.7,0.87,9.770,217.3,25.5,0.87,9.930,217.3
+27.1,0.87,8.250,217.0,26.9,0.87,8.380,217.0
+28.5,0.87,5.940,213.4,28.3,0.87,6.030,213.4
+29.5,0.87,5.150,200.6,29.3,0.87,5.220,200.5
+30.3,0.87,5.250,184.7,30.1,0.87,5.340,184.7
+30.8,0.87,5.320,165.9,30.6,0.87,5.370,166.0
+31.4,0.87,5.690,170.2,31.2,0.87,5.790,169.9
+31.6,0.87,5.980,174.5,31.4,0.87,6.040,174.3
+31.9,0.87,5.820,171.4,31.7,0.87,5.930,171.6
+31.7,0.87,7.380,173.3,31.5,0.87,7.540,173.5
+31.3,0.87,7.080,191.9,31.1,0.87,7.200,191.8
+30.7,0.87,5.540,197.8,30.6,0.87,6.030,196.0
+25.2,0.87,4.880,289.9,25.1,0.87,5.260,290.5
+27.5,0.87,1.340,285.3,27.8,0.87,1.040,283.3
+28.4,0.87,5.800,176.0,28.4,0.87,6.150,178.1
+27.7,0.87,8.140,201.8,27.7,0.87,8.680,204.3
+27.1,0.87,9.080,206.6,27.0,0.87,10.050,205.8
+26.3,0.87,10.830,209.8,26.4,0.87,11.740,210.1
+26.0,0.87,11.380,211.3,26.3,0.87,12.520,212.3
+25.5,0.87,12.380,218.1,25.8,0.87,13.580,219.8
+24.5,0.87,12.350,226.8,24.9,0.87,13.480,228.5
+24.0,0.87,12.020,227.8,24.4,0.87,13.050,230.0
+23.7,0.87,9.680,232.0,23.8,0.87,10.360,233.3
+25.1,0.87,8.060,231.5,24.9,0.87,8.220,232.2
+26.9,0.87,6.290,234.4,26.7,0.87,6.390,234.7
+28.4,0.87,5.270,229.6,28.2,0.87,5.320,229.8
+29.5,0.87,4.220,210.1,29.3,0.87,4.260,210.1
+30.4,0.87,3.550,193.1,30.1,0.87,3.580,193.2
+31.2,0.87,4.410,180.9,30.9,0.87,4.470,181.3
+31.8,0.87,4.840,176.1,31.6,0.87,4.910,176.4
+32.2,0.87,5.220,167.4,31.9,0.87,5.270,167.9
+32.4,0.87,4.210,181.6,32.2,0.87,4.240,181.8
+32.7,0.87,4.720,180.3,32.5,0.87,4.790,180.3
+32.5,0.87,4.160,168.9,32.3,0.87,4.190,168.8
+32.3,0.87,4.800,174.1,32.0,0.87,4.890,174.1
+31.4,0.87,7.790,185.3,31.3,0.87,7.960,185.5
+30.4,0.87,8.990,198.1,30.3,0.87,9.610,198.6
+29.5,0.87,9.940,205.8,29.5,0.87,10.650,206.1
+28.7,0.87,10.640,208.1,28.8,0.87,11.470,208.2
+27.7,0.87,10.930,210.8,28.0,0.87,11.830,211.4
+27.1,0.87,11.050,217.3,27.4,0.87,11.960,217.4
+26.4,0.87,11.110,218.8,26.6,0.87,11.930,219.2
+25.8,0.87,11.150,223.6,26.1,0.87,12.030,224.0
+25.4,0.87,10.950,228.1,25.8,0.87,11.810,228.3
+24.6,0.87,11.050,235.0,25.0,0.87,12.190,236.1
+24.4,0.87,10.560,246.0,24.8,0.87,11.610,246.7
+24.2,0.87,8.240,251.4,24.2,0.87,8.890,252.6
+25.6,0.87,7.020,250.7,25.4,0.87,7.140,251.1
+27.2,0.87,5.870,251.2,27.0,0.87,5.940,251.3
+28.4,0.87,3.880,256.9,28.2,0.87,3.920,256.8
+29.6,0.87,2.830,226.0,29.4,0.87,2.850,225.8
+30.5,0.87,2.960,198.2,30.3,0.87,2.990,197.9
+31.3,0.87,3.680,186.0,31.0,0.87,3.740,185.9
+31.9,0.87,3.310,185.4,31.7,0.87,3.360,184.8
+32.3,0.87,3.630,160.0,32.1,0.87,3.670,160.2
+32.6,0.87,4.290,167.7,32.4,0.87,4.300,167.5
+32.8,0.87,4.250,170.8,32.6,0.87,4.300,170.4
+32.8,0.87,3.970,172.8,32.6,0.87,4.040,172.6
+32.5,0.87,5.030,167.4,32.4,0.87,5.140,167.4
+31.9,0.87,6.020,181.4,31.8,0.87,6.250,181.4
+31.3,0.87,7.370,188.8,31.3,0.87,7.840,190.4
+30.3,0.87,6.940,200.3,30.4,0.87,7.550,201.5
+29.8,0.87,8.490,207.4,30.1,0.87,9.010,207.7
+28.9,0.87,8.460,208.0,29.2,0.87,9.150,209.2
+28.3,0.87,11.230,225.4,28.8,0.87,12.070,225.6
+28.1,0.87,10.980,230.9,28.5,0.87,11.610,230.4
+27.9,0.87,10.700,236.3,28.3,0.87,11.130,235.7
+27.8,0.87,10.380,241.6,28.2,0.87,10.570,240.3
+28.0,0.87,10.010,247.5,28.2,0.87,9.860,245.8
+25.9,0.87,6.080,280.6,26.4,0.87,7.180,277.1
+26.5,0.87,5.840,284.7,26.8,0.87,6.440,286.3
+27.9,0.87,3.120,295.0,27.7,0.87,3.220,293.9
+29.7,0.87,4.130,292.2,29.5,0.87,4.190,291.9
+30.9,0.87,2.920,311.2,30.7,0.87,2.930,310.7
+31.8,0.87,1.140,8.6,31.6,0.87,1.110,8.9
+32.7,0.87,1.680,98.7,32.5,0.87,1.710,99.6
+33.4,0.87,2.770,139.2,33.1,0.87,2.800,139.0
+34.0,0.87,3.260,150.9,33.7,0.87,3.380,150.8
+34.3,0.87,5.450,151.1,34.1,0.87,5.530,150.7
+34.4,0.87,4.460,149.2,34.2,0.87,4.500,148.9
+34.4,0.87,4.750,134.7,34.2,0.87,4.830,134.9
+34.3,0.87,5.420,142.0,34.0,0.87,5.490,142.1
+34.0,0.87,6.520,133.0,33.8,0.87,6.660,133.1
+32.7,0.87,8.380,131.0,32.6,0.87,9.050,130.9
+32.0,0.87,8.580,139.9,32.1,0.87,9.390,139.7
+31.5,0.87,8.350,147.1,31.5,0.87,8.820,146.9
+30.3,0.87,10.050,121.5,30.4,0.87,11.000,120.7
+28.4,0.87,9.500,141.5,28.3,0.87,10.540,139.0
+27.6,0.87,11.570,134.3,27.5,0.87,12.610,134.3
+26.7,0.87,11.510,132.9,26.7,0.87,12.680,132.9
+26.1,0.87,11.150,136.0,26.2,0.87,12.190,136.4
+25.6,0.87,10.970,136.9,25.6,0.87,11.620,137.8
+24.9,0.87,10.600,135.5,25.1,0.87,11.090,136.4
+24.6,0.87,9.850,139.7,25.0,0.87,10.020,140.7
+24.1,0.87,6.820,146.5,24.6,0.87,7.440,145.8
+25.8,0.87,4.910,156.8,25.7,0.87,5.040,156.2
+27.9,0.87,5.270,148.3,27.7,0.87,5.310,148.5
+29.6,0.87,4.810,143.1,29.4,0.87,4.850,143.2
+30.7,0.87,4.310,128.2,30.5,0.87,4.330,128.2
+31.6,0.87,5.110,130.2,31.3,0.87,5.160,130.1
+32.2,0.87,5.050,133.2,31.9,0.87,5.090,133.1
+32.3,0.87,5.480,126.0,32.0,0.87,5.540,126.4
+32.5,0.87,7.260,126.3,32.2,0.87,7.320,126.2
+32.9,0.87,5.580,133.4,32.7,0.87,5.630,133.6
+32.7,0.87,7.010,113.1,32.5,0.87,7.070,113.6
+32.8,0.87,7.000,120.0,32.6,0.87,7.100,120.4
+32.6,0.87,7.470,126.0,32.4,0.87,7.630,126.2
+31.6,0.87,9.380,119.4,31.4,0.87,10.010,119.4
+30.5,0.87,10.550,119.9,30.4,0.87,11.200,119.7
+29.5,0.87,10.850,124.5,29.4,0.87,11.740,124.5
+28.4,0.87,11.540,128.2,28.3,0.87,12.540,128.2
+27.5,0.87,11.600,137.0,27.5,0.87,12.780,136.5
+26.6,0.87,10.940,140.4,26.6,0.87,11.870,140.4
+26.0,0.87,11.060,143.1,26.0,0.87,12.020,142.9
+25.3,0.87,10.290,141.7,25.4,0.87,11.220,141.7
+25.2,0.87,10.800,145.2,25.4,0.87,11.670,145.5
+24.9,0.87,9.960,139.3,25.4,0.87,10.630,141.6
+24.1,0.87,10.150,150.2,24.4,0.87,10.760,151.6
+23.8,0.87,7.560,158.4,24.1,0.87,8.130,159.5
+25.2,0.87,5.710,158.7,25.1,0.87,5.740,159.5
+27.5,0.87,2.640,180.2,27.3,0.87,2.650,181.5
+30.1,0.87,2.570,212.5,29.9,0.87,2.590,213.2
+31.8,0.87,1.280,219.9,31.6,0.87,1.320,220.0
+32.7,0.87,2.300,187.4,32.5,0.87,2.310,188.1
+33.3,0.87,1.770,213.6,33.0,0.87,1.750,211.5
+33.5,0.87,5.130,151.9,33.3,0.87,5.100,151.8
+34.3,0.87,3.430,171.1,34.1,0.87,3.490,170.8
+34.3,0.87,2.520,243.1,34.0,0.87,2.520,241.4
+34.1,0.87,4.380,255.3,33.9,0.87,4.310,253.8
+33.8,0.87,5.660,210.8,33.6,0.87,5.800,210.3
+33.4,0.87,7.550,202.0,33.2,0.87,7.730,202.1
+31.2,0.87,10.730,212.2,31.1,0.87,11.430,212.2
+31.2,0.87,10.190,201.0,31.2,0.87,10.850,201.0
+30.3,0.87,11.260,203.8,30.3,0.87,12.050,205.4
+29.4,0.87,10.890,196.2,29.5,0.87,11.810,197.8
+29.0,0.87,12.070,187.5,29.1,0.87,12.880,188.8
+27.4,0.87,12.280,186.8,27.4,0.87,13.220,188.7
+26.6,0.87,12.380,196.4,26.6,0.87,13.370,197.5
+26.0,0.87,12.690,205.3,26.0,0.87,13.830,206.9
+25.1,0.87,14.040,201.8,25.1,0.87,15.000,203.2
+24.5,0.87,14.390,210.5,24.4,0.87,15.380,211.5
+24.1,0.87,14.700,213.9,23.9,0.87,15.510,214.5
+23.8,0.87,15.620,218.7,23.6,0.87,16.260,218.9
+24.5,0.87,12.850,214.9,24.3,0.87,13.080,215.1
+26.1,0.87,11.860,208.9,25.9,0.87,12.050,209.1
+27.9,0.87,10.970,210.9,27.7,0.87,11.170,211.1
+29.5,0.87,10.720,207.0,29.2,0.87,10.920,207.0
+30.6,0.87,9.870,202.5,30.3,0.87,10.050,202.6
+31.5,0.87,8.920,196.8,31.3,0.87,9.090,196.8
+32.2,0.87,8.940,195.1,31.9,0.87,9.110,195.3
+32.6,0.87,9.230,194.4,32.4,0.87,9.410,194.5
+33.0,0.87,8.640,199.8,32.7,0.87,8.820,199.8
+33.0,0.87,8.800,200.5,32.8,0.87,8.960,200.4
+32.9,0.87,8.770,200.1,32.7,0.87,8.940,200.0
+32.6,0.87,8.890,191.5,32.4,0.87,9.150,191.6
+31.4,0.87,10.590,177.9,31.3,0.87,11.300,178.6
+30.4,0.87,11.450,177.0,30.3,0.87,12.280,177.6
+29.6,0.87,11.700,183.7,29.5,0.87,12.540,184.3
+28.8,0.87,12.460,186.9,28.8,0.87,13.410,187.6
+27.9,0.87,12.010,188.4,27.9,0.87,12.970,189.3
+27.1,0.87,12.650,193.5,27.1,0.87,13.660,194.7
+26.3,0.87,13.660,200.7,26.3,0.87,14.700,201.6
+25.4,0.87,14.570,205.7,25.4,0.87,15.650,206.5
+24.6,0.87,14.260,210.4,24.6,0.87,15.300,211.1
+24.0,0.87,15.670,213.2,24.0,0.87,16.770,213.8
+23.5,0.87,15.010,212.4,23.5,0.87,16.080,212.9
+23.6,0.87,14.220,211.0,23.4,0.87,14.570,211.3
+24.8,0.87,13.020,209.9,24.6,0.87,13.270,210.2
+26.4,0.87,12.760,207.8,26.2,0.87,12.950,208.0
+28.4,0.87,10.890,207.0,28.2,0.87,11.050,207.2
+30.3,0.87,9.480,212.3,30.1,0.87,9.630,212.4
+32.1,0.87,7.760,221.3,31.9,0.87,7.900,221.4
+33.3,0.86,7.120,215.2,33.1,0.86,7.240,215.3
+33.9,0.86,7.380,204.7,33.7,0.86,7.490,204.9
+34.4,0.86,7.910,190.1,34.2,0.86,8.050,190.7
+34.8,0.86,7.670,197.2,34.5,0.86,7.810,197.5
+34.7,0.86,8.990,185.7,34.5,0.86,9.140,186.0
+34.9,0.86,7.910,194.7,34.7,0.86,8.090,195.0
+34.6,0.86,8.680,188.7,34.4,0.86,8.990,188.9
+33.9,0.86,8.220,189.0,33.8,0.86,8.620,190.5
+27.2,0.86,5.570,337.0,27.1,0.86,6.050,336.6
+28.2,0.86,4.240,304.2,28.0,0.86,4.820,308.6
+28.0,0.86,5.720,338.4,27.8,0.86,6.080,337.0
+27.6,0.86,1.810,283.5,27.5,0.86,2.280,287.7
+27.9,0.86,0.370,358.8,28.0,0.86,0.570,318.8
+26.2,0.87,7.770,52.6,26.0,0.87,8.960,54.5
+25.8,0.87,5.940,60.1,26.1,0.87,5.830,52.7
+25.1,0.87,5.820,84.0,25.4,0.87,5.400,78.5
+24.8,0.87,4.020,99.7,25.1,0.87,4.300,95.7
+25.6,0.87,3.150,82.6,26.0,0.87,3.450,81.2
+23.7,0.87,2.320,13.1,24.1,0.87,2.360,27.1
+24.9,0.87,3.470,355.3,24.8,0.87,3.480,355.9
+25.0,0.87,4.590,9.3,24.8,0.87,4.620,9.5
+26.8,0.87,5.190,25.8,26.6,0.87,5.220,26.0
+28.4,0.87,4.230,36.9,28.2,0.87,4.300,37.3
+30.6,0.87,4.950,55.5,30.3,0.87,5.010,55.6
+31.6,0.87,5.420,56.2,31.4,0.87,5.490,56.4
+32.2,0.87,6.580,52.5,32.0,0.87,6.640,52.5
+32.7,0.87,7.620,45.1,32.4,0.87,7.710,45.4
+31.7,0.87,8.670,130.2,31.5,0.87,8.750,129.9
+32.0,0.87,6.810,127.0,31.7,0.87,6.920,126.9
+32.1,0.87,5.230,131.9,31.9,0.87,5.300,131.3
+31.2,0.87,7.440,115.0,31.0,0.87,7.460,114.6
+30.9,0.87,6.490,103.6,30.8,0.87,6.970,105.4
+30.0,0.87,6.310,92.9,29.8,0.87,6.830,92.9
+29.8,0.87,6.920,94.4,29.8,0.87,7.200,95.9
+29.0,0.87,8.260,109.8,29.0,0.87,8.770,110.6
+27.4,0.87,9.460,136.4,27.4,0.87,10.250,136.5
+26.5,0.87,4.020,154.3,26.5,0.87,5.310,150.1
+27.0,0.87,6.940,157.8,27.1,0.87,7.280,163.0
+26.5,0.87,7.140,188.8,26.4,0.87,7.210,192.6
+25.6,0.87,6.440,198.0,25.6,0.87,6.690,198.5
+25.2,0.87,5.410,194.5,25.2,0.87,5.660,196.9
+24.8,0.87,6.180,187.1,24.7,0.87,6.250,191.4
+23.6,0.87,4.950,178.5,23.8,0.87,5.240,180.2
+24.6,0.87,3.140,177.5,24.4,0.87,3.180,177.3
+26.2,0.87,2.650,170.2,26.0,0.87,2.670,170.3
+27.5,0.87,1.670,142.2,27.3,0.87,1.680,142.5
+28.5,0.87,2.630,118.4,28.3,0.87,2.670,118.4
+29.5,0.87,3.680,117.2,29.3,0.87,3.730,117.4
+30.3,0.87,4.240,131.3,30.1,0.87,4.300,131.2
+30.6,0.87,5.560,143.5,30.4,0.87,5.640,143.3
+30.8,0.87,6.760,141.7,30.6,0.87,6.840,141.7
+31.2,0.87,5.310,139.7,30.9,0.87,5.370,140.1
+31.4,0.87,4.980,139.1,31.2,0.87,5.100,139.5
+31.4,0.87,7.520,145.5,31.2,0.87,7.680,145.5
+31.3,0.87,7.440,150.0,31.1,0.87,7.620,150.1
+30.9,0.87,9.860,131.8,30.7,0.87,10.380,131.8
+29.9,0.87,8.900,158.3,29.9,0.87,9.470,159.4
+28.9,0.87,10.310,174.1,28.9,0.87,11.220,174.5
+28.2,0.87,9.820,180.7,28.3,0.87,10.430,182.2
+27.0,0.87,10.840,186.2,27.1,0.87,11.960,186.2
+26.1,0.87,9.380,189.8,26.2,0.87,10.160,189.4
+25.8,0.87,10.100,191.5,26.1,0.87,10.950,191.9
+25.4,0.87,10.140,193.1,25.6,0.87,10.890,193.9
+24.9,0.87,10.070,203.7,25.2,0.87,10.770,205.0
+24.5,0.87,9.790,209.8,24.7,0.87,10.370,211.2
+24.1,0.87,9.520,208.8,24.3,0.87,9.910,209.0
+23.0,0.87,8.430,216.8,23.1,0.87,9.130,217.8
+24.2,0.87,7.310,221.6,24.0,0.87,7.480,221.8
+25.7,0.87,5.720,220.3,25.5,0.87,5.810,220.3
+27.0,0.87,5.650,213.3,26.8,0.87,5.740,213.2
+28.3,0.87,5.190,204.6,28.1,0.87,5.270,204.5
+29.5,0.87,5.510,200.4,29.3,0.87,5.600,200.3
+30.5,0.87,5.540,201.3,30.2,0.87,5.640,201.1
+31.2,0.87,6.310,189.5,31.0,0.87,6.410,189.6
+31.8,0.87,6.930,187.6,31.5,0.87,7.040,187.7
+32.1,0.87,7.550,185.7,31.9,0.87,7.690,186.1
+32.4,0.87,6.990,197.8,32.1,0.87,7.150,198.0
+32.1,0.87,7.890,193.1,31.9,0.87,8.060,193.5
+31.7,0.87,8.340,204.4,31.5,0.87,8.550,204.5
+31.1,0.87,9.670,191.9,31.1,0.87,10.060,191.9
+30.4,0.87,8.540,201.6,30.5,0.87,9.270,203.2
+29.0,0.87,10.180,192.3,29.2,0.87,11.050,192.3
+28.5,0.87,9.610,193.0,28.7,0.87,10.510,193.8
+28.4,0.87,10.870,199.2,28.6,0.87,11.860,200.4
+27.7,0.87,11.200,207.2,28.1,0.87,12.290,207.7
+26.8,0.87,10.070,208.8,27.2,0.87,11.080,210.5
+26.9,0.87,10.510,217.4,27.3,0.87,11.230,218.5
+25.9,0.87,11.200,222.3,26.4,0.87,12.020,223.8
+25.1,0.87,12.570,229.6,25.6,0.87,13.970,231.0
+24.4,0.87,13.380,233.5,24.9,0.87,14.820,234.4
+24.6,0.87,11.790,235.6,24.5,0.87,12.330,235.9
+25.5,0.87,8.520,233.9,25.4,0.87,8.720,234.3
+27.2,0.87,8.890,233.3,27.0,0.87,9.070,233.5
+28.7,0.87,8.370,229.7,28.5,0.87,8.520,229.8
+29.9,0.87,8.400,221.7,29.7,0.87,8.550,221.8
+31.1,0.87,7.750,219.3,30.8,0.87,7.880,219.4
+32.0,0.87,7.150,220.8,31.8,0.87,7.270,220.8
+32.9,0.87,7.150,216.0,32.6,0.87,7.290,216.0
+33.5,0.87,7.260,209.0,33.3,0.87,7.390,209.3
+33.7,0.87,7.800,207.7,33.4,0.87,7.920,207.7
+33.8,0.87,7.330,215.4,33.6,0.87,7.440,215.2
+33.7,0.87,8.200,198.4,33.5,0.87,8.340,198.6
+33.3,0.87,8.420,194.3,33.1,0.87,8.780,194.6
+32.6,0.87,10.110,196.5,32.5,0.87,10.770,197.9
+31.2,0.87,11.090,186.9,31.3,0.87,11.950,187.6
+30.1,0.87,11.750,190.5,30.3,0.87,12.800,191.2
+29.2,0.87,12.030,198.1,29.4,0.87,13.230,198.8
+28.5,0.87,12.260,202.6,28.8,0.87,13.480,203.1
+28.1,0.87,12.700,207.7,28.5,0.87,13.930,208.2
+27.7,0.87,12.800,211.5,28.1,0.87,13.980,212.0
+26.8,0.87,12.500,213.1,27.3,0.87,13.600,213.7
+25.9,0.87,12.040,222.5,26.5,0.87,13.030,222.7
+25.5,0.87,11.640,231.4,26.2,0.87,12.610,232.6
+25.1,0.87,12.450,234.8,25.8,0.87,13.670,237.3
+25.7,0.87,11.490,237.0,25.7,0.87,12.100,237.6
+27.0,0.87,8.090,230.1,26.8,0.87,8.390,231.2
+29.2,0.87,7.880,234.5,28.9,0.87,8.020,234.8
+30.8,0.87,7.140,231.0,30.6,0.87,7.250,231.2
+32.0,0.87,5.800,223.7,31.7,0.87,5.870,223.8
+32.9,0.87,4.140,214.3,32.7,0.87,4.180,214.4
+33.7,0.87,3.430,201.2,33.5,0.87,3.460,201.4
+34.3,0.87,2.820,207.2,34.1,0.87,2.850,206.5
+34.8,0.87,4.520,171.4,34.5,0.87,4.530,171.7
+35.3,0.87,3.610,194.1,35.1,0.87,3.650,193.7
+35.1,0.87,5.970,164.2,34.9,0.87,6.040,165.0
+35.1,0.87,5.700,168.8,34.9,0.87,5.780,169.4
+34.7,0.87,7.060,168.8,34.5,0.87,7.250,169.1
+34.2,0.87,8.560,179.9,34.1,0.87,8.720,180.8
+32.5,0.87,10.530,190.5,32.5,0.87,11.360,191.3
+31.2,0.87,11.740,191.8,31.4,0.87,12.750,192.5
+30.2,0.87,11.780,198.2,30.4,0.87,12.890,198.3
+29.4,0.87,11.990,202.5,29.8,0.87,13.120,203.5
+28.4,0.87,11.610,207.0,28.7,0.87,12.690,208.0
+27.9,0.87,12.360,215.9,28.3,0.87,13.450,216.3
+27.6,0.87,12.240,223.1,28.0,0.87,13.220,222.7
+27.2,0.87,12.220,230.8,27.7,0.87,13.200,230.6
+27.8,0.87,11.440,240.0,28.3,0.87,12.340,239.1
+25.4,0.87,7.240,277.3,25.7,0.87,8.080,272.8
+27.0,0.87,6.590,279.9,27.3,0.87,7.310,282.8
+28.8,0.87,6.210,261.3,28.6,0.87,6.570,262.8
+31.0,0.87,6.580,269.3,30.8,0.87,6.690,269.5
+32.1,0.87,3.990,275.1,31.9,0.87,4.040,274.7
+33.0,0.87,2.400,293.3,32.8,0.87,2.410,292.2
+33.8,0.87,1.430,339.7,33.5,0.87,1.380,338.2
+34.5,0.87,0.910,28.3,34.3,0.87,0.800,32.1
+35.0,0.87,2.620,154.5,34.8,0.87,2.620,154.2
+35.3,0.87,4.760,157.7,35.0,0.87,4.790,157.4
+35.4,0.87,4.910,162.5,35.2,0.87,4.940,162.6
+35.5,0.87,3.480,165.5,35.3,0.87,3.550,165.6
+35.3,0.87,6.230,153.2,35.1,0.87,6.300,153.3
+35.0,0.87,7.320,142.9,34.8,0.87,7.560,143.3
+33.8,0.87,7.510,154.8,33.9,0.87,7.950,155.6
+32.9,0.87,8.680,187.5,33.1,0.87,9.450,190.6
+31.4,0.87,9.160,204.9,31.8,0.87,10.410,206.3
+31.3,0.87,11.450,205.6,31.6,0.87,12.280,205.3
+29.9,0.87,12.070,212.7,30.3,0.87,13.170,212.4
+29.6,0.87,12.100,218.5,30.2,0.87,13.080,218.0
+29.2,0.87,12.270,221.8,29.8,0.87,13.160,221.1
+28.7,0.87,12.090,222.7,29.3,0.87,12.970,221.8
+28.2,0.87,11.810,228.2,28.8,0.87,12.400,227.3
+27.5,0.87,11.860,232.3,28.1,0.87,12.450,231.1
+26.9,0.87,11.150,232.9,27.5,0.87,11.640,231.4
+26.6,0.87,9.400,239.3,26.8,0.87,9.890,239.7
+27.6,0.87,6.210,244.9,27.4,0.87,6.670,246.0
+30.2,0.87,6.110,273.3,30.0,0.87,6.210,273.1
+31.8,0.87,5.200,272.2,31.6,0.87,5.270,271.9
+32.9,0.87,3.210,254.9,32.6,0.87,3.240,254.5
+33.8,0.87,3.710,216.9,33.6,0.87,3.740,217.0
+34.6,0.87,4.400,197.3,34.3,0.87,4.430,197.6
+35.0,0.87,4.020,209.3,34.8,0.87,4.060,209.3
+35.4,0.87,6.080,204.5,35.1,0.87,6.110,204.4
+36.0,0.87,4.950,201.7,35.8,0.87,5.090,201.2
+36.1,0.87,4.340,198.8,35.9,0.87,4.440,199.7
+35.3,0.87,7.000,187.9,35.1,0.87,7.110,188.3
+34.8,0.87,6.550,195.5,34.6,0.87,6.750,195.7
+34.2,0.87,8.870,192.1,34.1,0.87,9.290,193.7
+33.2,0.87,10.440,186.4,33.4,0.87,11.030,187.0
+32.1,0.87,11.130,189.4,32.3,0.87,12.080,190.4
+30.8,0.87,12.260,200.1,31.0,0.87,13.530,200.7
+30.5,0.87,13.170,205.3,30.8,0.87,14.340,205.6
+29.9,0.87,13.680,205.9,30.2,0.87,14.850,206.4
+29.2,0.87,13.700,206.2,29.4,0.87,14.850,206.6
+28.1,0.87,12.900,213.0,28.3,0.87,14.160,213.3
+27.0,0.87,13.430,214.3,27.2,0.87,14.760,215.7
+26.4,0.87,12.750,224.2,26.7,0.87,14.070,225.7
+26.2,0.87,11.990,231.3,26.6,0.87,13.140,233.6
+26.5,0.87,10.470,248.3,26.4,0.87,11.020,249.7
+27.6,0.87,6.780,261.0,27.4,0.87,6.860,261.4
+28.8,0.87,3.580,291.5,28.6,0.87,3.620,290.9
+30.2,0.87,2.310,287.1,30.0,0.87,2.330,285.8
+31.8,0.87,3.020,302.5,31.6,0.87,3.030,301.4
+33.1,0.87,2.710,306.6,32.9,0.87,2.710,305.4
+34.5,0.87,1.770,300.6,34.3,0.87,1.750,298.1
+35.7,0.87,2.770,314.2,35.5,0.87,2.730,312.4
+36.5,0.87,3.280,303.5,36.3,0.87,3.270,302.5
+37.0,0.86,2.020,284.2,36.8,0.86,2.050,282.1
+36.8,0.86,5.530,233.0,36.6,0.86,5.560,233.3
+37.0,0.86,2.940,200.8,36.8,0.86,2.970,201.5
+36.9,0.86,2.150,222.0,36.7,0.86,2.370,223.5
+36.3,0.86,8.110,209.6,36.1,0.86,8.590,209.1
+35.1,0.86,11.450,204.9,35.1,0.86,12.320,204.9
+32.2,0.86,3.940,60.7,32.3,0.86,4.950,53.1
+32.5,0.86,4.940,75.1,32.7,0.86,4.580,73.1
+32.6,0.86,2.630,151.9,32.6,0.86,2.380,157.7
+30.6,0.87,3.760,13.1,30.4,0.87,3.890,14.2
+26.6,0.87,6.520,42.1,26.5,0.87,7.030,41.0
+26.9,0.87,3.150,75.8,27.2,0.87,3.440,78.3
+26.4,0.87,3.630,52.4,26.5,0.87,3.580,56.6
+25.6,0.87,3.330,49.8,25.7,0.87,3.650,51.5
+24.0,0.87,4.210,62.5,23.9,0.87,4.580,62.1
+23.9,0.87,2.960,143.3,24.0,0.87,3.320,146.1
+26.9,0.87,4.980,208.2,26.8,0.87,5.170,209.7
+30.2,0.87,6.670,227.7,30.0,0.87,6.800,228.3
+32.5,0.87,6.950,231.8,32.3,0.87,7.070,231.8
+33.7,0.87,7.060,224.9,33.5,0.87,7.190,224.9
+34.8,0.87,6.580,220.9,34.5,0.87,6.690,220.9
+35.6,0.87,6.590,221.1,35.3,0.87,6.700,221.0
+36.2,0.86,7.330,207.5,35.9,0.86,7.440,207.8
+36.5,0.86,7.410,211.0,36.3,0.86,7.550,211.0
+36.5,0.86,7.830,203.8,36.3,0.86,7.960,203.9
+36.6,0.86,8.960,193.1,36.3,0.86,9.130,193.5
+36.3,0.86,8.490,200.9,36.1,0.86,8.670,200.8
+35.5,0.86,10.070,196.0,35.4,0.86,10.570,196.2
+34.2,0.86,9.660,203.7,34.2,0.86,10.570,203.4
+32.9,0.86,5.410,238.0,32.5,0.86,5.870,229.2
+31.9,0.86,8.370,205.0,31.7,0.86,9.650,202.8
+31.1,0.86,11.060,206.3,31.3,0.86,12.480,205.1
+30.4,0.87,12.170,202.6,30.6,0.87,13.390,202.1
+29.1,0.87,12.540,199.4,29.4,0.87,14.140,200.8
+28.2,0.87,13.480,204.1,28.4,0.87,14.850,206.0
+27.2,0.87,14.030,213.6,27.3,0.87,15.570,214.5
+25.8,0.87,13.700,218.7,25.9,0.87,15.060,219.6
+25.2,0.87,15.130,219.0,25.3,0.87,16.390,219.6
+24.6,0.87,15.060,216.0,24.7,0.87,16.400,216.8
+24.6,0.87,14.650,215.0,24.5,0.87,15.360,215.3
+25.5,0.87,11.710,217.0,25.3,0.87,11.920,217.2
+27.4,0.87,8.520,220.1,27.2,0.87,8.690,220.3
+29.3,0.87,6.110,218.2,29.1,0.87,6.220,218.3
+31.0,0.87,4.910,225.3,30.8,0.87,4.980,225.3
+32.4,0.87,3.780,216.5,32.2,0.87,3.840,216.6
+33.6,0.87,3.270,201.7,33.3,0.87,3.320,201.9
+34.6,0.87,4.300,190.4,34.4,0.87,4.360,190.8
+35.1,0.87,5.260,182.5,34.9,0.87,5.290,182.7
+35.6,0.87,4.820,187.9,35.4,0.87,4.910,187.7
+35.6,0.87,6.110,167.1,35.4,0.87,6.220,167.5
+35.5,0.87,4.760,184.4,35.3,0.87,4.840,184.3
+35.2,0.87,5.860,173.4,35.1,0.87,6.040,174.6
+29.8,0.87,6.500,4.9,29.6,0.87,6.850,6.1
+27.7,0.87,10.200,29.3,27.5,0.87,10.750,30.2
+26.5,0.87,11.610,19.4,26.3,0.87,11.970,20.1
+22.0,0.87,10.400,18.3,21.8,0.87,10.640,19.0
+21.6,0.87,7.690,16.5,21.4,0.87,8.070,17.7
+22.0,0.87,7.670,40.7,21.8,0.87,8.040,41.5
+21.6,0.87,6.520,45.8,21.5,0.87,7.010,47.1
+21.4,0.87,5.420,45.4,21.2,0.87,6.050,48.5
+21.0,0.88,5.890,12.9,20.9,0.88,6.180,16.9
+20.4,0.88,7.020,20.5,20.2,0.88,7.570,23.1
+19.9,0.88,6.210,33.8,19.8,0.88,6.780,35.2
+19.5,0.88,6.540,45.3,19.3,0.88,6.720,45.8
+20.6,0.88,6.960,67.0,20.4,0.88,7.080,67.4
+22.4,0.88,6.220,77.8,22.2,0.88,6.310,78.1
+24.1,0.88,5.610,81.3,23.9,0.88,5.680,81.5
+25.6,0.88,5.780,91.5,25.4,0.88,5.860,91.7
+27.1,0.88,4.770,87.5,26.8,0.88,4.830,88.1
+28.3,0.88,4.850,113.8,28.1,0.88,4.910,113.9
+29.2,0.88,5.170,120.5,29.0,0.88,5.230,120.8
+29.9,0.87,5.360,138.4,29.7,0.87,5.430,138.5
+30.6,0.87,4.550,143.9,30.3,0.87,4.610,144.1
+30.7,0.87,5.810,151.5,30.5,0.87,5.890,151.6
+30.4,0.87,6.550,149.8,30.2,0.87,6.660,150.0
+29.8,0.87,7.300,148.8,29.6,0.87,7.450,148.8
+29.2,0.87,8.360,139.8,29.0,0.87,8.700,139.7
+28.4,0.87,8.860,145.2,28.3,0.87,9.460,145.2
+27.9,0.87,9.390,147.0,27.9,0.87,10.150,146.6
+27.4,0.87,9.800,149.8,27.4,0.87,10.600,149.3
+26.8,0.87,10.170,151.8,27.0,0.87,11.020,151.0
+26.3,0.87,10.370,152.7,26.4,0.87,11.210,152.3
+25.9,0.87,10.780,159.8,26.1,0.87,11.680,159.6
+25.4,0.87,10.530,165.5,25.6,0.87,11.340,166.0
+25.3,0.87,10.180,169.4,25.6,0.87,11.140,169.1
+24.4,0.87,10.260,186.9,24.7,0.87,11.220,191.4
+24.6,0.87,11.300,212.9,25.0,0.87,12.310,214.5
+24.4,0.87,11.050,221.9,24.6,0.87,11.910,223.0
+25.9,0.87,9.410,223.2,25.7,0.87,9.580,223.6
+27.9,0.87,8.600,228.1,27.7,0.87,8.740,228.4
+29.7,0.87,7.990,229.7,29.4,0.87,8.130,229.8
+30.9,0.87,6.940,229.4,30.6,0.87,7.050,229.5
+31.9,0.87,6.060,226.0,31.7,0.87,6.150,226.1
+32.8,0.87,6.450,220.8,32.5,0.87,6.550,221.0
+33.3,0.87,6.880,212.9,33.0,0.87,6.970,213.3
+33.7,0.87,7.240,212.1,33.4,0.87,7.330,212.3
+34.2,0.87,6.030,232.9,34.0,0.87,6.130,232.7
+34.5,0.87,6.350,219.9,34.2,0.87,6.470,220.1
+34.2,0.87,7.320,210.3,34.0,0.87,7.440,210.5
+33.8,0.87,8.410,210.2,33.6,0.87,8.680,210.2
+32.9,0.87,10.610,193.0,32.8,0.87,11.310,193.5
+31.8,0.87,11.560,188.5,31.9,0.87,12.510,189.2
+31.0,0.87,11.780,191.1,31.1,0.87,12.730,191.8
+29.8,0.87,11.810,193.7,29.9,0.87,12.810,194.7
+28.7,0.87,10.800,198.1,29.0,0.87,11.900,199.8
+27.5,0.87,9.940,190.9,27.7,0.87,10.700,194.0
+27.6,0.87,10.810,207.2,27.9,0.87,11.810,208.8
+26.9,0.87,11.430,212.8,27.4,0.87,12.530,214.0
+26.5,0.87,11.740,229.7,26.9,0.87,12.800,229.8
+26.4,0.87,11.740,237.7,26.8,0.87,12.800,237.9
+26.0,0.87,9.540,239.7,26.6,0.87,10.640,242.1
+24.4,0.87,4.160,228.0,24.7,0.87,4.550,235.9
+26.3,0.87,4.560,231.1,26.4,0.87,5.140,237.7
+28.8,0.87,5.230,243.2,28.6,0.87,5.330,243.8
+30.6,0.87,5.650,245.2,30.3,0.87,5.760,245.5
+32.2,0.87,5.460,240.5,31.9,0.87,5.540,240.6
+33.4,0.87,4.610,220.3,33.1,0.87,4.680,220.5
+34.6,0.87,4.790,212.2,34.3,0.87,4.870,212.5
+35.1,0.87,5.630,216.1,34.9,0.87,5.700,216.3
+33.7,0.87,10.950,296.5,33.4,0.87,11.020,296.5
+28.4,0.87,10.320,176.5,28.6,0.87,10.520,178.4
+28.7,0.87,11.390,168.0,28.5,0.87,11.950,168.6
+31.8,0.87,6.080,151.3,32.0,0.87,6.070,151.4
+25.8,0.87,10.410,312.9,25.6,0.87,10.770,313.3
+26.5,0.87,7.290,200.7,26.4,0.87,7.660,198.8
+26.2,0.87,6.490,227.6,26.1,0.87,6.670,226.5
+25.6,0.87,5.810,205.8,25.6,0.87,6.380,209.6
+23.6,0.87,6.830,13.5,23.8,0.87,7.050,11.4
+22.8,0.87,6.600,65.0,23.2,0.87,6.790,61.0
+24.2,0.87,4.910,114.3,24.1,0.87,5.230,110.6
+23.5,0.87,5.830,149.5,23.9,0.87,6.250,142.1
+23.3,0.87,7.460,188.0,23.8,0.87,7.680,182.6
+24.4,0.87,8.850,205.9,24.6,0.87,9.340,206.8
+24.4,0.87,7.540,217.0,24.7,0.87,8.050,219.7
+22.7,0.87,2.460,5.4,22.7,0.87,2.120,352.7
+22.7,0.87,0.670,329.0,22.8,0.87,0.850,309.2
+23.8,0.87,1.410,248.3,23.6,0.87,1.510,247.3
+26.1,0.87,3.540,272.9,25.9,0.87,3.590,272.4
+27.2,0.87,3.900,310.2,27.0,0.87,3.920,309.9
+28.7,0.87,3.410,343.3,28.5,0.87,3.430,343.3
+29.9,0.87,3.630,4.0,29.7,0.87,3.650,4.0
+31.1,0.87,5.560,25.9,30.9,0.87,5.610,26.1
+31.7,0.87,4.870,42.8,31.4,0.87,4.910,42.6
+31.4,0.87,4.930,307.3,31.2,0.87,4.810,309.2
+30.4,0.87,7.570,254.9,30.2,0.87,7.570,255.1
+28.5,0.87,9.030,268.9,28.4,0.87,8.920,269.0
+30.9,0.87,1.190,210.4,30.7,0.87,1.150,208.8
+31.2,0.87,0.640,12.2,31.0,0.87,0.660,14.0
+31.0,0.87,1.650,11.5,30.8,0.87,1.800,20.2
+30.3,0.87,3.720,161.0,30.2,0.87,3.630,159.1
+29.7,0.87,5.010,143.9,29.5,0.87,5.340,144.2
+29.1,0.87,5.770,148.8,29.0,0.87,5.980,150.8
+28.5,0.87,5.550,172.8,28.4,0.87,5.800,172.6
+27.7,0.87,5.580,190.4,27.7,0.87,5.740,187.9
+27.3,0.87,5.600,203.7,27.4,0.87,5.550,200.7
+26.5,0.87,6.280,213.6,26.6,0.87,6.040,209.9
+26.3,0.87,6.310,217.4,26.5,0.87,5.960,213.8
+26.5,0.87,5.060,231.3,26.7,0.87,4.650,227.3
+26.1,0.87,6.330,243.0,26.3,0.87,5.950,241.5
+24.6,0.87,4.840,271.7,25.1,0.87,5.210,269.5
+24.8,0.87,2.660,306.8,24.8,0.87,2.870,302.5
+27.6,0.87,3.710,306.5,27.4,0.87,3.770,305.6
+29.0,0.87,4.390,312.2,28.8,0.87,4.410,311.6
+30.3,0.87,3.960,321.5,30.0,0.87,3.980,321.1
+31.3,0.87,3.720,335.3,31.1,0.87,3.730,334.9
+32.1,0.87,4.010,354.5,31.9,0.87,4.020,354.2
+32.9,0.87,4.020,12.3,32.6,0.87,4.040,11.8
+33.4,0.87,4.550,26.0,33.2,0.87,4.620,26.2
+33.7,0.87,4.990,41.5,33.4,0.87,5.030,41.5
+33.7,0.87,5.200,41.2,33.5,0.87,5.240,41.3
+33.5,0.87,5.820,48.2,33.3,0.87,5.890,48.3
+33.0,0.87,7.060,59.9,32.8,0.87,7.310,59.9
+32.1,0.87,8.450,70.0,32.0,0.87,8.650,70.0
+30.5,0.87,8.940,89.1,30.3,0.87,9.570,89.4
+28.7,0.87,9.660,105.0,28.6,0.87,10.510,104.3
+27.3,0.87,9.860,116.4,27.3,0.87,10.910,114.0
+26.2,0.87,9.930,120.7,26.2,0.87,10.940,118.3
+25.4,0.87,10.570,136.0,25.2,0.87,11.380,132.7
+24.6,0.87,9.170,130.0,24.4,0.87,10.000,129.3
+23.1,0.87,10.110,121.5,22.9,0.87,10.970,122.1
+22.2,0.87,8.070,127.5,22.0,0.87,8.620,127.3
+21.1,0.87,7.910,117.9,20.9,0.87,8.670,117.7
+20.1,0.87,8.060,115.9,19.9,0.87,8.710,116.1
+19.5,0.87,4.910,111.2,19.3,0.87,5.140,111.6
+20.2,0.87,3.570,128.3,20.0,0.87,3.620,128.3
+21.7,0.87,3.810,126.9,21.5,0.87,3.850,127.1
+23.8,0.87,3.620,122.4,23.6,0.87,3.650,122.6
+25.8,0.87,3.090,110.6,25.6,0.87,3.110,111.0
+27.4,0.87,3.440,133.9,27.1,0.87,3.470,134.3
+28.7,0.87,3.010,138.9,28.4,0.87,3.020,139.3
+29.7,0.87,3.390,126.8,29.5,0.87,3.410,127.1
+30.4,0.87,3.390,132.1,30.2,0.87,3.400,132.5
+30.9,0.87,3.970,127.6,30.7,0.87,4.000,127.9
+31.1,0.87,5.510,139.5,30.8,0.87,5.570,139.8
+30.5,0.87,7.450,143.6,30.3,0.87,7.550,143.8
+29.1,0.87,9.670,142.3,28.9,0.87,9.900,142.4
+27.8,0.87,10.500,138.0,27.6,0.87,10.960,137.9
+27.0,0.87,10.780,142.3,26.8,0.87,11.270,142.4
+26.4,0.87,10.360,138.3,26.3,0.87,10.800,138.3
+25.7,0.87,10.120,142.4,25.5,0.87,10.620,142.2
+24.9,0.87,10.750,148.1,24.8,0.87,11.450,147.7
+24.1,0.87,5.740,108.3,23.9,0.87,6.210,112.1
+23.6,0.87,8.510,110.5,23.4,0.87,8.960,110.5
+22.6,0.87,11.550,134.8,22.4,0.87,12.150,134.6
+22.0,0.87,9.650,140.0,21.9,0.87,10.200,139.4
+21.6,0.87,8.450,140.8,21.4,0.87,8.970,140.6
+20.9,0.87,10.040,147.7,20.8,0.87,10.730,147.0
+21.0,0.87,8.180,171.6,20.8,0.87,8.600,170.7
+22.8,0.87,9.270,183.8,22.6,0.87,9.440,183.6
+24.7,0.87,9.470,182.6,24.4,0.87,9.670,182.6
+26.6,0.87,9.570,177.9,26.3,0.87,9.760,178.1
+28.2,0.87,10.670,187.3,27.9,0.87,10.860,187.5
+30.1,0.87,11.180,199.0,29.8,0.87,11.400,199.2
+31.5,0.87,10.300,211.7,31.3,0.87,10.510,211.9
+32.7,0.87,9.100,218.4,32.5,0.87,9.280,218.6
+34.0,0.87,8.430,218.8,33.7,0.87,8.590,219.1
+34.9,0.87,8.670,214.6,34.7,0.87,8.840,214.9
+35.5,0.87,9.160,212.6,35.3,0.87,9.350,213.0
+35.8,0.87,9.930,214.8,35.6,0.87,10.160,215.2
+35.2,0.87,11.310,209.5,35.1,0.87,11.930,209.9
+34.1,0.87,12.660,211.8,34.1,0.87,13.620,212.6
+31.8,0.87,11.500,196.8,31.9,0.87,12.640,197.4
+30.8,0.87,11.810,205.7,30.8,0.87,12.920,206.2
+29.9,0.87,11.040,207.9,29.9,0.87,12.080,208.5
+29.5,0.87,5.720,199.8,29.4,0.87,6.670,207.6
+28.8,0.87,5.260,256.5,28.8,0.87,6.300,255.0
+30.4,0.87,7.460,259.1,30.5,0.87,7.830,266.5
+27.3,0.87,1.920,251.7,27.8,0.87,2.000,258.9
+29.7,0.87,4.760,213.7,30.0,0.87,4.270,218.0
+25.7,0.87,6.470,305.9,25.9,0.87,6.750,306.4
+27.0,0.87,2.560,308.8,27.3,0.87,2.640,312.9
+25.5,0.87,6.900,334.7,26.1,0.87,7.420,340.5
+25.4,0.87,6.920,340.1,25.2,0.87,7.070,340.9
+25.3,0.87,8.290,3.0,25.1,0.87,8.390,3.0
+25.9,0.87,7.950,12.4,25.6,0.87,8.070,12.6
+27.9,0.87,9.210,26.8,27.6,0.87,9.350,26.8
+28.6,0.87,10.220,28.3,28.4,0.87,10.360,28.3
+29.7,0.87,9.360,30.9,29.4,0.87,9.490,30.9
+30.6,0.87,8.780,34.2,30.4,0.87,8.920,34.3
+31.2,0.87,8.430,43.9,31.0,0.87,8.560,43.9
+31.7,0.87,7.840,42.2,31.4,0.87,7.950,42.4
+31.8,0.87,7.850,50.9,31.5,0.87,7.950,50.9
+31.6,0.87,7.940,47.3,31.4,0.87,8.060,47.4
+31.0,0.87,7.690,55.8,30.9,0.87,8.050,56.0
+30.2,0.87,8.500,52.7,30.1,0.87,9.200,53.0
+29.2,0.87,9.240,49.9,29.1,0.87,10.190,50.7
+27.9,0.87,8.170,66.1,27.8,0.87,9.150,65.3
+26.8,0.87,5.540,76.5,26.8,0.87,7.190,74.9
+24.4,0.87,9.860,230.8,24.3,0.87,10.380,230.1
+21.0,0.87,9.510,227.8,20.9,0.87,10.140,228.2
+20.6,0.87,8.490,239.8,21.1,0.87,8.580,238.8
+23.1,0.87,3.190,237.3,23.5,0.87,2.520,235.4
+23.5,0.87,0.810,255.0,23.6,0.87,0.460,294.7
+23.0,0.87,0.590,343.8,23.0,0.87,0.530,0.9
+21.8,0.87,2.190,24.7,22.1,0.87,2.060,30.9
+20.3,0.87,1.550,198.7,20.4,0.87,1.190,184.4
+22.2,0.87,0.530,266.3,22.0,0.87,0.580,256.3
+24.1,0.87,1.030,88.8,23.9,0.87,1.010,94.5
+26.2,0.87,3.540,161.8,25.9,0.87,3.600,162.3
+27.3,0.87,4.230,166.2,27.0,0.87,4.290,166.4
+28.7,0.87,4.660,170.7,28.4,0.87,4.730,171.0
+29.8,0.87,4.980,167.8,29.5,0.87,5.060,168.0
+30.7,0.87,5.570,164.4,30.4,0.87,5.650,164.7
+31.3,0.87,6.880,161.7,31.1,0.87,7.000,162.0
+31.7,0.87,7.840,163.1,31.4,0.87,7.960,163.3
+31.8,0.87,8.900,162.9,31.6,0.87,9.070,163.1
+31.6,0.87,9.540,168.6,31.4,0.87,9.770,168.7
+30.9,0.87,10.320,163.9,30.8,0.87,10.820,164.0
+29.5,0.87,10.270,158.3,29.4,0.87,11.050,158.8
+28.4,0.87,10.400,163.3,28.4,0.87,11.220,164.2
+27.4,0.87,12.090,169.8,27.5,0.87,13.140,170.3
+26.8,0.87,11.720,170.4,26.9,0.87,12.790,170.5
+26.1,0.87,11.730,175.3,26.2,0.87,12.840,175.0
+21.4,0.87,12.690,332.9,21.2,0.87,13.050,332.5
+21.0,0.87,7.770,327.3,20.9,0.87,8.410,326.8
+24.3,0.87,5.490,108.6,24.7,0.87,5.610,112.8
+22.7,0.87,2.370,111.2,23.0,0.87,3.080,111.1
+22.5,0.87,3.380,137.1,22.6,0.87,3.870,136.3
+22.3,0.87,5.460,166.3,22.6,0.87,6.000,168.5
+22.2,0.87,7.460,189.0,22.5,0.87,7.830,192.4
+23.6,0.87,6.310,195.0,23.4,0.87,6.390,195.8
+25.5,0.87,7.420,211.2,25.3,0.87,7.550,211.5
+27.4,0.87,7.610,222.2,27.2,0.87,7.790,222.5
+29.5,0.87,8.140,231.8,29.3,0.87,8.300,231.9
+31.0,0.87,5.970,238.6,30.7,0.87,6.080,238.7
+32.0,0.87,5.700,241.7,31.8,0.87,5.790,241.8
+32.7,0.87,6.750,257.2,32.5,0.87,6.830,257.1
+33.0,0.87,8.000,284.9,32.8,0.87,8.080,284.5
+33.3,0.86,1.350,278.0,33.1,0.86,1.520,273.6
+33.5,0.86,4.210,275.9,33.3,0.86,4.310,275.3
+25.4,0.86,17.440,330.1,25.7,0.86,17.780,329.7
+24.5,0.87,2.610,110.5,24.5,0.87,1.910,91.2
+22.2,0.87,8.450,187.7,22.4,0.87,9.030,186.9
+23.4,0.87,8.850,204.8,23.3,0.87,9.290,203.7
+21.8,0.87,8.510,167.9,21.7,0.87,8.960,168.5
+22.0,0.87,5.900,174.5,21.9,0.87,6.520,176.7
+21.6,0.87,6.910,194.2,21.5,0.87,7.740,193.9
+21.1,0.87,8.420,178.8,21.1,0.87,9.250,180.3
+20.9,0.87,10.140,181.4,20.8,0.87,10.770,181.9
+20.4,0.87,10.710,177.4,20.3,0.87,11.510,177.6
+20.1,0.87,9.560,183.1,20.1,0.87,9.980,185.6
+20.8,0.87,9.680,192.6,20.9,0.87,10.370,194.7
+20.1,0.87,10.190,181.6,20.2,0.87,10.750,183.8
+19.9,0.87,9.300,181.5,20.0,0.87,9.880,183.6
+21.3,0.87,8.270,188.0,21.1,0.87,8.390,188.5
+23.4,0.87,8.200,189.6,23.2,0.87,8.280,189.9
+25.8,0.87,8.100,191.2,25.5,0.87,8.210,191.4
+28.1,0.87,6.730,200.3,27.9,0.87,6.830,200.5
+29.9,0.87,5.040,189.4,29.7,0.87,5.120,189.6
+31.2,0.87,4.300,179.1,30.9,0.87,4.370,179.5
+31.8,0.87,5.530,162.6,31.6,0.87,5.590,163.0
+32.3,0.86,6.030,160.2,32.1,0.86,6.120,160.3
+32.5,0.86,6.290,150.6,32.3,0.86,6.390,150.7
+32.4,0.86,4.850,163.2,32.2,0.86,5.070,163.0
+22.3,0.87,11.610,272.8,22.4,0.87,10.830,272.5
+23.1,0.87,10.020,186.4,23.3,0.87,10.730,185.3
+27.6,0.87,3.080,242.0,27.6,0.87,2.960,245.2
+27.7,0.86,10.780,146.7,27.7,0.86,11.020,145.9
+23.3,0.87,14.250,158.9,23.2,0.87,15.160,158.0
+21.8,0.87,12.420,167.8,21.6,0.87,13.080,167.7
+21.7,0.87,9.320,152.9,21.6,0.87,9.960,153.1
+21.6,0.87,8.760,166.8,21.7,0.87,9.450,167.3
+21.4,0.87,6.930,204.5,21.6,0.87,7.580,201.6
+22.1,0.87,8.070,216.4,22.3,0.87,8.650,213.8
+23.5,0.87,8.830,230.6,24.1,0.87,9.240,233.3
+23.1,0.87,11.110,259.1,23.4,0.87,12.010,261.6
+22.8,0.87,7.840,279.8,23.1,0.87,8.640,280.5
+23.4,0.87,8.150,282.2,23.8,0.87,9.300,286.6
+22.8,0.87,6.730,310.7,22.6,0.87,6.830,311.0
+23.4,0.87,5.700,348.6,23.2,0.87,5.750,348.5
+24.4,0.87,5.940,351.6,24.2,0.87,5.980,352.0
+25.4,0.87,3.380,338.3,25.2,0.87,3.430,339.2
+26.5,0.87,4.520,2.5,26.2,0.87,4.540,2.5
+27.7,0.87,5.730,351.4,27.5,0.87,5.790,351.9
+28.4,0.87,6.080,22.6,28.2,0.87,6.140,22.7
+26.9,0.87,9.400,109.9,26.7,0.87,9.570,110.2
+27.8,0.87,5.630,94.8,27.5,0.87,5.700,94.5
+28.2,0.87,5.130,74.0,27.9,0.87,5.180,74.4
+25.8,0.87,9.560,191.6,25.7,0.87,9.730,191.7
+26.1,0.87,3.430,188.5,25.9,0.87,3.500,188.7
+25.4,0.87,4.050,251.6,25.3,0.87,4.320,251.3
+25.5,0.87,3.430,125.1,25.3,0.87,3.570,124.4
+25.1,0.87,4.230,131.6,24.9,0.87,4.580,130.2
+24.6,0.87,4.660,96.6,24.4,0.87,4.910,96.9
+23.9,0.87,4.340,342.4,23.8,0.87,4.290,342.7
+23.2,0.87,4.190,68.3,23.0,0.87,4.230,68.5
+22.3,0.87,4.040,85.3,22.1,0.87,4.170,85.8
+21.0,0.87,6.100,55.2,20.8,0.87,6.340,56.5
+19.7,0.87,3.570,81.6,19.5,0.87,3.650,83.2
+19.2,0.87,4.510,151.1,18.9,0.87,4.790,147.3
+19.0,0.87,4.820,174.6,18.8,0.87,5.120,174.8
+18.1,0.87,5.520,128.5,17.9,0.87,5.620,129.3
+18.7,0.87,5.250,143.1,18.5,0.87,5.320,143.3
+20.7,0.87,5.110,153.4,20.5,0.87,5.170,153.6
+22.4,0.87,5.830,176.8,22.2,0.87,5.890,176.8
+23.8,0.87,5.480,187.9,23.6,0.87,5.560,188.0
+24.7,0.87,5.780,194.2,24.5,0.87,5.830,194.2
+25.8,0.87,4.740,186.3,25.6,0.87,4.800,186.5
+26.8,0.87,5.320,169.6,26.6,0.87,5.380,169.9
+27.3,0.87,6.650,155.4,27.0,0.87,6.750,156.2
+27.7,0.87,7.290,152.6,27.5,0.87,7.400,153.4
+27.8,0.87,7.550,145.0,27.6,0.87,7.660,146.2
+28.0,0.87,7.690,145.6,27.8,0.87,7.820,146.6
+26.9,0.87,8.950,147.9,26.7,0.87,9.170,148.0
+25.9,0.87,9.700,143.1,25.7,0.87,10.210,143.2
+25.3,0.87,9.920,154.4,25.1,0.87,10.330,154.6
+24.9,0.87,8.270,251.7,24.6,0.87,8.540,252.6
+22.7,0.87,7.810,321.8,22.4,0.87,8.010,321.6
+18.4,0.87,7.880,5.1,18.2,0.87,8.050,4.4
+18.1,0.87,5.570,351.5,18.1,0.87,6.280,352.2
+18.0,0.87,2.090,110.8,18.1,0.87,1.910,97.3
+18.4,0.87,5.090,184.6,18.6,0.87,5.160,184.9
+20.3,0.87,6.090,184.7,20.4,0.87,6.260,189.3
+20.5,0.87,8.500,190.6,20.4,0.87,8.860,191.9
+21.9,0.87,9.380,196.2,22.1,0.87,10.040,198.4
+22.0,0.87,9.410,198.8,22.1,0.87,9.870,200.2
+22.1,0.87,5.080,209.1,21.9,0.87,5.210,209.4
+23.2,0.87,4.210,204.7,23.0,0.87,4.290,205.4
+24.9,0.87,5.490,226.4,24.7,0.87,5.580,226.9
+27.2,0.87,4.030,236.1,26.9,0.87,4.090,236.8
+28.4,0.87,3.340,243.3,28.2,0.87,3.380,243.5
+28.9,0.87,4.320,244.2,28.7,0.87,4.360,244.3
+28.9,0.87,5.930,288.2,28.7,0.87,5.900,286.6
+17.7,0.87,14.750,67.5,17.6,0.87,15.410,67.2
+19.9,0.87,12.580,106.3,19.7,0.87,12.810,106.0
+23.3,0.87,8.800,128.1,23.1,0.87,8.840,128.1
+24.1,0.87,6.160,143.1,24.0,0.87,6.210,142.7
+23.8,0.87,6.600,173.0,23.8,0.87,7.010,170.8
+23.1,0.87,0.590,66.7,22.9,0.87,0.650,93.5
+23.3,0.87,1.120,43.2,23.2,0.87,0.890,28.9
+22.5,0.87,5.820,111.0,22.5,0.87,5.470,110.6
+22.0,0.87,7.040,108.5,22.0,0.87,7.400,108.5
+20.5,0.87,7.220,122.5,20.4,0.87,7.800,123.6
+19.8,0.87,6.750,142.6,19.9,0.87,7.330,143.6
+18.9,0.87,6.680,150.4,18.9,0.87,7.070,151.0
+18.5,0.87,3.430,149.1,18.6,0.87,3.820,148.1
+18.0,0.87,1.980,247.4,18.1,0.87,2.000,244.7
+18.5,0.87,2.580,182.1,18.7,0.87,2.620,178.7
+18.1,0.87,2.850,319.4,18.2,0.87,2.510,316.5
+18.8,0.87,1.080,16.9,18.9,0.87,0.940,25.9
+18.6,0.87,2.580,31.5,18.5,0.87,2.590,31.7
+20.2,0.87,1.880,339.1,20.0,0.87,1.880,340.0
+21.6,0.87,1.580,25.7,21.4,0.87,1.560,27.2
+23.0,0.87,1.140,62.1,22.8,0.87,1.140,65.8
+24.3,0.87,2.290,126.7,24.1,0.87,2.310,127.1
+24.5,0.87,3.000,111.5,24.3,0.87,3.020,112.8
+25.1,0.87,1.090,172.5,24.9,0.87,1.160,173.1
+25.8,0.87,1.900,147.1,25.5,0.87,1.940,147.5
+21.6,0.87,10.150,97.4,21.4,0.87,10.170,97.6
+23.7,0.87,6.260,114.2,23.5,0.87,6.340,113.5
+23.4,0.87,6.830,149.2,23.2,0.87,6.900,148.7
+22.9,0.87,6.540,162.4,22.7,0.87,6.790,162.2
+22.8,0.87,5.390,162.7,22.7,0.87,5.770,162.0
+22.3,0.87,6.480,175.9,22.2,0.87,6.630,174.6
+22.5,0.87,5.500,162.7,22.6,0.87,5.870,160.4
+21.7,0.87,8.150,143.9,21.5,0.87,8.690,143.4
+20.7,0.87,8.540,142.1,20.6,0.87,9.270,140.1
+20.2,0.87,7.850,149.1,20.1,0.87,8.650,146.1
+19.7,0.87,8.280,139.5,19.6,0.87,9.050,138.6
+19.1,0.87,8.480,142.1,19.1,0.87,9.190,141.4
+18.4,0.87,8.740,144.2,18.4,0.87,9.430,143.7
+17.9,0.87,8.430,147.6,18.0,0.87,9.120,147.0
+17.6,0.87,9.050,150.2,17.7,0.87,9.780,150.0
+17.5,0.87,8.760,157.4,17.5,0.87,9.320,157.2
+18.3,0.87,7.660,160.1,18.1,0.87,7.830,160.3
+20.1,0.87,8.600,162.2,19.9,0.87,8.720,162.5
+21.5,0.87,8.620,173.8,21.3,0.87,8.770,174.0
+23.1,0.87,9.230,176.3,22.9,0.87,9.400,176.5
+24.3,0.87,9.460,187.8,24.1,0.87,9.650,188.0
+25.6,0.87,6.990,189.9,25.4,0.87,7.130,190.4
+19.0,0.87,10.210,282.9,18.9,0.87,10.250,281.8
+18.6,0.87,7.160,175.2,18.5,0.87,7.300,173.0
+20.9,0.87,13.510,154.9,20.9,0.87,14.070,154.6
+21.6,0.87,11.430,163.5,21.4,0.87,11.770,163.9
+21.2,0.87,7.260,173.3,21.1,0.87,7.620,173.0
+20.5,0.87,10.350,159.9,20.4,0.87,10.720,160.4
+19.9,0.87,11.550,151.5,19.7,0.87,12.050,151.9
+19.7,0.87,9.500,146.9,19.6,0.87,9.980,147.8
+19.0,0.87,11.700,148.0,18.8,0.87,12.170,148.1
+18.9,0.87,11.310,155.8,18.7,0.87,11.780,155.8
+18.5,0.87,8.350,155.5,18.3,0.87,8.730,156.1
+17.3,0.87,4.710,79.0,17.3,0.87,4.870,83.1
+16.7,0.87,8.320,106.8,16.5,0.87,8.770,106.8
+16.5,0.87,12.360,129.9,16.5,0.87,12.830,130.5
+16.9,0.87,10.800,148.2,16.7,0.87,11.360,148.2
+17.1,0.87,7.740,153.7,16.9,0.87,8.080,154.3
+17.0,0.87,6.230,153.9,16.8,0.87,6.560,155.3
+16.7,0.87,7.300,143.8,16.6,0.87,7.640,144.2
+16.8,0.87,7.480,140.5,16.6,0.87,7.690,141.3
+17.3,0.87,6.960,144.0,17.1,0.87,7.090,144.2
+18.1,0.87,8.460,167.4,17.9,0.87,8.650,167.4
+18.8,0.87,6.680,160.2,18.5,0.87,6.810,160.4
+18.7,0.87,6.270,147.8,18.5,0.87,6.360,148.4
+20.5,0.87,5.800,142.3,20.3,0.87,5.850,142.7
+20.3,0.87,7.030,147.6,20.1,0.87,7.140,147.6
+20.3,0.87,7.210,133.0,20.1,0.87,7.290,133.4
+20.2,0.87,7.260,144.3,20.0,0.87,7.370,144.6
+19.6,0.87,7.500,140.3,19.3,0.87,7.590,140.4
+19.1,0.87,7.750,146.2,18.9,0.87,7.840,146.2
+18.5,0.87,7.330,149.6,18.3,0.87,7.480,149.7
+17.7,0.87,6.340,156.9,17.5,0.87,6.640,157.2
+17.3,0.87,6.900,151.5,17.1,0.87,7.230,151.7
+16.9,0.87,7.120,151.5,16.8,0.87,7.580,152.0
+16.7,0.87,7.700,162.3,16.6,0.87,8.210,162.5
+16.3,0.87,7.860,162.9,16.2,0.87,8.290,163.2
+16.3,0.87,7.430,167.7,16.1,0.87,7.590,167.5
+16.2,0.87,7.550,175.2,16.0,0.87,7.730,175.3
+16.2,0.87,7.770,178.8,16.0,0.87,7.980,179.0
+16.1,0.87,6.950,185.3,15.9,0.87,7.080,185.0
+15.7,0.87,7.360,177.5,15.5,0.87,7.500,178.7
+15.8,0.87,6.170,177.0,15.6,0.87,6.300,177.4
+15.8,0.87,5.390,181.0,15.6,0.87,5.540,182.0
+15.9,0.87,6.500,182.1,15.7,0.87,6.580,182.9
+16.3,0.87,7.060,188.1,16.1,0.87,7.190,188.6
+17.8,0.87,7.260,191.0,17.5,0.87,7.350,191.2
+19.8,0.87,7.200,189.2,19.5,0.87,7.310,189.4
+21.6,0.87,7.620,186.8,21.4,0.87,7.730,187.1
+22.9,0.87,7.720,186.0,22.7,0.87,7.830,186.3
+24.0,0.87,8.130,182.7,23.8,0.87,8.270,182.9
+25.2,0.87,8.270,179.8,24.9,0.87,8.420,179.9
+26.0,0.87,8.700,179.1,25.8,0.87,8.860,179.2
+26.7,0.87,8.670,179.1,26.4,0.87,8.890,179.4
+26.9,0.87,8.560,181.7,26.7,0.87,8.800,181.8
+26.6,0.87,8.450,180.9,26.5,0.87,9.040,181.8
+25.4,0.87,9.160,165.6,25.4,0.87,9.900,166.1
+24.3,0.87,10.190,158.6,24.2,0.87,10.910,159.4
+23.3,0.87,10.560,160.0,23.2,0.87,11.200,160.6
+22.0,0.87,12.260,162.5,21.8,0.87,12.820,162.7
+21.5,0.87,12.860,172.4,21.3,0.87,13.410,172.6
+21.3,0.87,12.730,173.9,21.1,0.87,13.370,174.3
+20.8,0.87,12.220,179.4,20.7,0.87,12.900,179.8
+20.4,0.87,11.930,181.7,20.4,0.87,12.620,182.7
+20.2,0.87,12.030,191.1,20.1,0.87,12.800,192.2
+20.0,0.87,11.220,195.2,20.0,0.87,12.040,196.8
+20.1,0.87,11.540,191.4,20.1,0.87,12.290,193.1
+20.8,0.87,12.360,196.9,20.8,0.87,13.040,198.1
+21.5,0.87,10.710,197.4,21.4,0.87,11.200,198.3
+22.9,0.87,11.390,200.2,22.7,0.87,11.610,200.5
+24.4,0.87,11.020,205.2,24.2,0.87,11.230,205.4
+25.5,0.87,9.940,201.3,25.3,0.87,10.120,201.6
+26.6,0.87,10.630,208.5,26.3,0.87,10.820,208.5
+27.9,0.87,8.850,195.0,27.7,0.87,9.050,195.2
+28.9,0.87,9.540,193.6,28.6,0.87,9.740,193.8
+29.5,0.87,10.330,192.3,29.3,0.87,10.560,192.5
+29.7,0.87,10.860,189.7,29.5,0.87,11.110,190.0
+30.0,0.87,11.160,197.6,29.8,0.87,11.490,197.7
+29.3,0.87,11.970,182.2,29.1,0.87,12.280,182.3
+27.3,0.87,7.300,223.8,27.2,0.87,7.470,221.9
+26.1,0.87,5.290,171.2,25.9,0.87,5.290,177.1
+22.9,0.87,12.700,151.1,22.8,0.87,13.260,151.7
+22.2,0.87,13.840,154.1,22.0,0.87,14.460,154.3
+22.0,0.87,11.110,168.9,21.8,0.87,11.700,168.6
+22.7,0.87,5.860,192.5,22.5,0.87,6.360,192.4
+22.0,0.87,9.630,176.2,21.9,0.87,10.250,177.8
+21.2,0.87,10.460,182.9,21.2,0.87,11.130,184.8
+20.8,0.87,11.600,186.4,20.7,0.87,12.250,188.0
+20.3,0.87,11.560,182.8,20.3,0.87,12.160,184.3
+20.0,0.87,11.600,184.4,20.0,0.87,12.230,185.8
+19.9,0.87,11.840,191.0,19.9,0.87,12.540,192.6
+19.9,0.87,11.210,195.9,19.8,0.87,11.780,197.1
+20.7,0.87,9.570,195.4,20.6,0.87,9.760,196.0
+22.4,0.87,10.150,194.2,22.2,0.87,10.290,194.6
+24.3,0.86,9.380,204.0,24.1,0.86,9.510,204.3
+26.5,0.86,7.830,207.6,26.3,0.86,7.950,208.0
+28.4,0.86,7.260,217.6,28.2,0.86,7.400,218.0
+29.6,0.86,7.070,217.0,29.4,0.86,7.190,217.2
+30.3,0.86,7.250,206.9,30.1,0.86,7.380,207.3
+31.0,0.86,8.000,222.5,30.8,0.86,8.160,222.4
+31.2,0.86,8.600,215.4,31.0,0.86,8.760,215.4
+31.3,0.86,7.780,225.5,31.1,0.86,7.970,225.2
+31.1,0.86,7.490,232.3,30.9,0.86,7.690,232.5
+30.6,0.86,6.240,210.7,30.5,0.86,6.610,213.8
+26.3,0.86,10.480,151.8,26.1,0.86,10.970,152.5
+24.6,0.86,10.590,152.8,24.5,0.86,11.310,153.2
+23.3,0.86,11.300,153.5,23.2,0.86,12.000,153.5
+22.4,0.86,11.360,161.0,22.4,0.86,12.150,161.3
+22.3,0.86,11.560,160.5,22.3,0.86,12.310,161.5
+22.3,0.86,10.940,164.8,22.3,0.86,11.800,166.2
+21.8,0.86,9.890,168.4,21.9,0.86,10.670,171.0
+21.4,0.86,9.240,175.6,21.5,0.86,9.950,179.9
+20.6,0.86,8.610,179.0,20.8,0.86,9.110,185.0
+20.6,0.86,8.700,190.5,20.8,0.86,9.430,196.5
+20.9,0.86,8.400,205.1,21.3,0.86,9.070,211.5
+19.6,0.86,4.480,226.4,19.8,0.86,5.330,226.1
+20.8,0.86,1.990,224.8,20.6,0.86,2.020,229.3
+23.0,0.86,2.390,323.4,22.8,0.86,2.420,322.7
+24.8,0.86,2.880,344.9,24.6,0.86,2.900,344.4
+26.6,0.86,2.210,346.9,26.4,0.86,2.210,346.3
+27.8,0.86,2.450,346.6,27.6,0.86,2.440,346.4
+28.7,0.86,2.380,13.2,28.5,0.86,2.370,13.4
+29.5,0.86,2.780,8.1,29.2,0.86,2.780,8.4
+30.0,0.86,2.930,21.7,29.8,0.86,2.930,21.6
+30.4,0.86,3.620,15.6,30.2,0.86,3.650,15.7
+30.7,0.86,4.440,34.0,30.4,0.86,4.470,34.0
+28.2,0.87,9.060,117.2,28.0,0.87,9.140,117.0
+25.5,0.87,7.030,155.7,25.4,0.87,7.370,153.6
+26.0,0.87,5.990,137.0,26.2,0.87,6.540,136.6
+26.7,0.87,5.030,127.4,26.9,0.87,5.310,125.9
+26.9,0.87,4.490,131.8,26.9,0.87,4.500,130.2
+24.8,0.87,3.980,16.3,24.7,0.87,3.540,14.3
+23.9,0.87,2.510,81.1,24.0,0.87,2.070,90.3
+23.4,0.87,2.150,127.4,23.2,0.87,2.350,128.1
+22.7,0.87,3.210,122.1,22.6,0.87,3.500,121.4
+21.9,0.87,2.290,139.3,21.9,0.87,2.570,142.5
+21.6,0.87,2.010,148.8,21.8,0.87,2.330,151.8
+21.0,0.87,0.340,189.8,21.2,0.87,0.510,169.7
+20.8,0.87,0.810,93.1,20.9,0.87,0.890,108.8
+20.7,0.87,1.000,129.2,20.8,0.87,1.160,135.2
+20.6,0.87,1.350,136.7,20.5,0.87,1.430,136.7
+22.2,0.87,0.370,5.3,22.0,0.87,0.310,6.4
+23.7,0.87,1.570,58.8,23.5,0.87,1.570,60.5
+24.9,0.87,2.190,41.8,24.7,0.87,2.170,43.1
+26.4,0.87,2.630,62.0,26.1,0.87,2.650,63.3
+27.6,0.87,3.730,94.6,27.4,0.87,3.780,95.1
+28.4,0.87,4.380,107.8,28.2,0.87,4.440,107.8
+29.1,0.87,4.810,111.6,28.9,0.87,4.870,111.5
+29.4,0.87,5.540,117.1,29.1,0.87,5.610,117.0
+29.4,0.87,5.960,120.6,29.2,0.87,6.050,120.6
+29.0,0.87,6.180,126.8,28.8,0.87,6.310,126.8
+27.9,0.87,7.150,145.3,27.7,0.87,7.450,144.9
+27.1,0.87,6.830,149.8,26.9,0.87,7.160,149.4
+26.4,0.87,7.460,139.7,26.4,0.87,7.900,138.7
+26.1,0.87,7.040,138.3,26.0,0.87,7.040,138.3
+25.6,0.87,7.210,135.9,25.4,0.87,7.230,135.7
+24.8,0.87,7.140,144.2,24.7,0.87,7.130,143.4
+24.1,0.87,6.650,147.4,24.1,0.87,6.730,146.7
+23.6,0.87,6.370,147.2,23.6,0.87,6.590,146.0
+22.8,0.87,6.200,159.4,22.9,0.87,6.350,157.5
+22.3,0.87,4.950,171.5,22.3,0.87,5.160,171.3
+22.0,0.87,4.510,209.5,22.1,0.87,4.620,214.0
+21.5,0.87,5.680,208.4,21.7,0.87,5.750,210.6
+22.2,0.87,5.100,227.5,22.4,0.87,4.960,228.5
+22.7,0.87,3.800,237.0,22.9,0.87,3.710,239.4
+23.6,0.87,1.940,219.1,23.4,0.87,1.950,219.1
+25.1,0.87,0.930,340.2,24.9,0.87,0.880,339.1
+26.3,0.87,1.580,42.8,26.1,0.87,1.560,44.7
+27.3,0.87,2.300,57.6,27.1,0.87,2.300,59.0
+28.3,0.87,2.600,73.9,28.1,0.87,2.640,75.5
+29.2,0.87,3.900,105.5,28.9,0.87,3.950,105.7
+29.5,0.87,3.950,111.7,29.3,0.87,4.010,111.7
+29.8,0.87,4.480,106.2,29.6,0.87,4.530,106.2
+29.9,0.87,4.830,110.9,29.7,0.87,4.910,110.9
+29.4,0.87,5.630,121.4,29.3,0.87,5.720,121.3
+28.8,0.87,6.300,123.2,28.6,0.87,6.440,123.4
+27.8,0.87,6.700,136.6,27.8,0.87,7.200,136.3
+27.5,0.87,6.470,136.4,27.4,0.87,6.510,135.1
+26.6,0.87,6.250,140.6,26.5,0.87,6.440,137.6
+26.1,0.87,5.490,136.7,26.0,0.87,5.620,134.7
+25.2,0.87,7.880,120.9,25.1,0.87,8.600,120.8
+24.0,0.87,9.770,136.3,23.9,0.87,10.220,135.3
+23.3,0.87,8.700,137.6,23.2,0.87,9.200,135.5
+22.7,0.87,7.950,136.7,22.6,0.87,8.350,134.7
+22.1,0.87,6.790,133.6,22.1,0.87,7.140,131.9
+21.3,0.87,6.180,139.1,21.4,0.87,6.500,136.5
+21.0,0.87,4.530,140.8,21.2,0.87,4.890,136.6
+20.5,0.87,4.140,139.8,20.6,0.87,4.450,136.6
+20.4,0.87,1.900,116.8,20.4,0.87,2.450,118.0
+22.1,0.87,2.790,121.7,21.9,0.87,2.840,121.8
+23.4,0.87,2.550,117.4,23.1,0.87,2.570,117.2
+24.8,0.87,3.020,84.2,24.6,0.87,3.050,84.4
+26.0,0.87,3.310,86.1,25.8,0.87,3.350,86.3
+27.2,0.87,4.000,85.3,27.0,0.87,4.050,85.8
+28.2,0.87,4.690,78.4,27.9,0.87,4.760,79.2
+28.5,0.87,5.830,79.7,28.3,0.87,5.870,79.9
+28.6,0.87,5.490,91.0,28.4,0.87,5.540,91.0
+28.6,0.87,5.520,89.3,28.4,0.87,5.620,89.4
+28.2,0.87,5.780,101.6,28.0,0.87,5.860,101.5
+27.7,0.87,6.150,102.4,27.5,0.87,6.260,100.9
+26.9,0.87,5.280,103.1,26.7,0.87,5.510,104.2
+26.2,0.87,5.670,110.4,26.1,0.87,6.180,109.2
+26.1,0.87,7.300,113.7,26.0,0.87,7.460,113.0
+25.5,0.87,7.770,122.1,25.4,0.87,7.800,122.0
+24.2,0.87,9.770,125.5,24.2,0.87,10.440,124.3
+22.8,0.87,9.630,131.1,22.8,0.87,10.410,128.8
+22.9,0.87,9.860,131.8,23.0,0.87,10.440,129.9
+22.8,0.87,9.100,137.5,22.9,0.87,9.470,135.8
+22.3,0.87,6.690,145.1,22.4,0.87,6.920,143.3
+22.1,0.87,5.490,148.8,22.3,0.87,5.710,147.5
+21.9,0.87,5.290,152.3,22.1,0.87,5.500,150.1
+21.7,0.87,3.650,163.5,21.9,0.87,3.800,159.5
+20.7,0.87,1.510,175.2,21.1,0.87,1.830,166.7
+21.3,0.87,0.340,340.2,21.1,0.87,0.140,306.3
+23.3,0.87,0.830,46.3,23.1,0.87,0.780,53.4
+24.6,0.87,1.330,64.9,24.4,0.87,1.330,66.5
+25.6,0.87,1.530,87.6,25.4,0.87,1.560,88.5
+26.7,0.87,2.940,90.1,26.5,0.87,2.970,90.8
+27.5,0.87,4.300,108.5,27.2,0.87,4.350,108.6
+28.0,0.87,4.060,115.5,27.8,0.87,4.110,115.4
+28.3,0.87,4.970,118.3,28.1,0.87,5.020,118.2
+28.3,0.87,5.250,123.6,28.1,0.87,5.320,123.4
+28.0,0.87,5.170,122.8,27.8,0.87,5.240,122.8
+27.4,0.87,5.850,116.2,27.2,0.87,5.850,116.4
+26.3,0.87,5.490,132.5,26.3,0.87,5.820,132.0
+25.6,0.87,5.630,140.3,25.6,0.87,5.960,137.2
+25.5,0.87,5.680,133.5,25.5,0.87,5.790,130.7
+25.1,0.87,5.610,141.2,25.1,0.87,5.880,140.0
+24.2,0.87,7.250,134.7,24.2,0.87,7.650,133.8
+23.7,0.87,7.600,135.6,23.7,0.87,7.750,135.4
+23.2,0.87,6.760,143.1,23.3,0.87,7.040,141.9
+23.0,0.87,6.180,146.1,23.2,0.87,6.440,144.7
+22.9,0.87,5.640,151.1,23.0,0.87,5.860,149.6
+22.7,0.87,5.050,157.0,22.8,0.87,5.230,154.4
+22.4,0.87,4.020,165.8,22.6,0.87,4.150,161.1
+22.3,0.87,2.120,169.0,22.4,0.87,2.190,160.6
+19.8,0.87,1.050,339.5,20.4,0.87,0.600,338.8
+21.1,0.87,0.700,312.7,21.1,0.87,0.610,293.2
+23.6,0.87,1.080,49.5,23.4,0.87,1.030,54.5
+25.1,0.87,1.360,49.4,24.9,0.87,1.330,52.3
+26.6,0.87,1.720,64.5,26.4,0.87,1.730,66.7
+27.7,0.87,2.490,72.6,27.5,0.87,2.530,73.9
+28.8,0.87,3.480,97.5,28.5,0.87,3.530,97.8
+29.3,0.87,3.900,100.5,29.1,0.87,3.970,100.8
+29.5,0.87,4.740,111.4,29.3,0.87,4.800,111.1
+29.6,0.87,4.950,109.4,29.3,0.87,5.020,109.3
+29.3,0.87,5.840,114.4,29.1,0.87,5.960,114.1
+28.7,0.87,5.870,114.9,28.5,0.87,6.080,114.3
+27.9,0.87,6.020,119.0,27.8,0.87,6.340,118.5
+27.2,0.87,7.910,123.3,27.2,0.87,8.180,124.0
+26.7,0.87,7.290,126.6,26.8,0.87,7.280,126.2
+26.1,0.87,6.650,138.6,26.1,0.87,6.740,137.6
+24.9,0.87,6.090,132.6,25.0,0.87,6.130,132.3
+24.4,0.87,7.650,135.5,24.4,0.87,7.820,135.1
+23.7,0.87,7.010,141.9,23.7,0.87,7.220,140.0
+23.2,0.87,6.010,153.0,23.4,0.87,6.250,152.0
+22.7,0.87,3.770,177.9,22.9,0.87,3.950,174.5
+22.1,0.87,1.760,203.0,22.3,0.87,1.850,196.1
+22.4,0.87,1.050,237.1,22.4,0.87,1.060,229.2
+21.2,0.87,1.370,315.8,21.6,0.87,1.170,304.0
+20.4,0.87,2.730,314.2,20.9,0.87,2.780,314.8
+22.3,0.87,2.150,314.1,22.2,0.87,2.130,311.2
+24.5,0.87,1.800,328.1,24.3,0.87,1.770,326.1
+26.2,0.87,2.300,337.4,25.9,0.87,2.290,336.5
+27.0,0.87,1.980,358.2,26.8,0.87,1.960,357.9
+27.8,0.87,1.820,10.3,27.6,0.87,1.790,10.5
+28.4,0.87,1.470,23.1,28.2,0.87,1.440,22.9
+29.0,0.87,1.540,27.1,28.8,0.87,1.520,28.0
+29.4,0.87,1.200,100.5,29.2,0.87,1.220,102.8
+29.5,0.87,2.080,133.5,29.3,0.87,2.080,133.7
+29.4,0.87,2.620,172.8,29.2,0.87,2.700,172.6
+29.2,0.87,5.240,183.0,29.0,0.87,5.310,183.2
+28.9,0.87,5.600,191.6,28.7,0.87,5.500,193.0
+28.5,0.87,4.550,171.9,28.3,0.87,4.510,172.2
+28.0,0.87,5.400,154.0,27.9,0.87,5.310,155.3
+27.2,0.87,7.560,148.1,27.3,0.87,7.750,148.3
+27.7,0.87,7.490,150.2,27.8,0.87,7.670,151.4
+25.8,0.87,6.120,166.7,26.1,0.87,6.500,162.8
+26.3,0.87,6.970,154.6,26.5,0.87,7.190,154.3
+25.5,0.87,6.790,158.7,25.9,0.87,7.190,157.4
+25.3,0.87,8.020,157.9,25.5,0.87,8.310,156.8
+24.4,0.87,7.370,167.8,24.6,0.87,7.620,167.1
+23.6,0.87,6.960,173.6,23.9,0.87,7.280,171.0
+23.5,0.87,6.140,186.4,23.9,0.87,6.330,182.7
+24.1,0.87,5.400,195.4,24.5,0.87,5.390,191.2
+24.9,0.87,1.790,206.0,24.8,0.87,1.870,203.7
+27.0,0.87,0.970,174.0,26.8,0.87,1.020,176.1
+28.6,0.87,3.850,201.4,28.4,0.87,3.910,201.4
+29.2,0.87,4.640,187.6,28.9,0.87,4.690,187.7
+29.8,0.87,3.890,191.8,29.6,0.87,3.950,191.7
+30.4,0.87,4.900,190.2,30.1,0.87,4.940,190.3
+30.8,0.87,5.230,181.3,30.6,0.87,5.270,181.4
+31.1,0.87,5.400,175.2,30.9,0.87,5.470,175.6
+31.2,0.87,3.710,198.3,31.0,0.87,3.780,198.0
+31.3,0.87,6.150,178.8,31.1,0.87,6.280,179.3
+30.9,0.87,6.340,180.0,30.8,0.87,6.550,181.1
+30.4,0.87,9.100,185.7,30.4,0.87,9.100,186.6
+30.5,0.87,7.940,193.9,30.6,0.87,7.640,196.1
+29.6,0.87,9.130,192.9,30.0,0.87,9.400,195.9
+27.2,0.87,11.220,204.1,27.8,0.87,12.500,206.8
+25.6,0.87,10.500,184.6,25.9,0.87,11.140,187.0
+25.4,0.87,12.400,206.6,25.9,0.87,13.610,207.2
+24.7,0.87,11.450,214.6,25.3,0.87,12.830,215.1
+24.4,0.87,12.220,214.5,24.8,0.87,13.400,214.3
+24.2,0.87,12.400,216.5,24.7,0.87,13.690,217.2
+23.1,0.87,13.100,225.8,23.5,0.87,14.360,227.6
+23.2,0.87,13.490,232.1,23.6,0.87,14.830,233.6
+22.6,0.87,12.480,229.3,23.0,0.87,13.550,230.9
+22.9,0.87,9.930,227.1,22.8,0.87,10.690,228.4
+24.9,0.87,8.850,219.8,24.7,0.87,8.980,220.3
+27.3,0.87,8.230,217.6,27.1,0.87,8.370,217.8
+29.0,0.87,8.320,213.0,28.8,0.87,8.480,213.1
+30.2,0.87,8.210,210.7,29.9,0.87,8.360,210.7
+31.0,0.87,7.840,204.4,30.8,0.87,7.970,204.5
+31.6,0.87,7.730,202.6,31.4,0.87,7.860,202.7
+32.0,0.87,7.640,205.0,31.8,0.87,7.770,204.9
+32.2,0.87,7.040,203.1,32.0,0.87,7.180,202.9
+32.1,0.87,7.010,200.0,31.9,0.87,7.110,200.0
+31.8,0.87,7.570,194.9,31.6,0.87,7.760,195.0
+31.1,0.87,9.000,196.6,31.0,0.87,9.390,196.8
+30.1,0.87,10.440,191.5,30.1,0.87,11.160,192.1
+28.8,0.87,10.620,188.9,28.9,0.87,11.420,190.1
+28.1,0.87,11.730,193.0,28.3,0.87,12.640,193.9
+27.3,0.87,12.150,198.7,27.5,0.87,13.230,199.1
+26.9,0.87,12.260,199.5,27.2,0.87,13.300,199.6
+26.3,0.87,11.950,200.0,26.6,0.87,13.030,199.8
+25.7,0.87,12.170,200.0,26.1,0.87,13.230,200.0
+25.5,0.87,11.810,202.9,25.9,0.87,12.760,202.7
+23.9,0.87,12.290,215.9,24.2,0.87,13.550,217.5
+23.7,0.87,11.010,221.4,24.0,0.87,12.210,224.4
+22.9,0.87,11.510,226.6,23.1,0.87,12.690,228.9
+22.1,0.87,10.900,230.6,22.4,0.87,11.890,231.9
+22.8,0.87,8.280,222.1,22.8,0.87,9.100,223.7
+24.8,0.87,7.080,219.2,24.7,0.87,7.200,219.4
+27.2,0.87,6.770,206.3,27.0,0.87,6.880,206.4
+29.0,0.87,6.010,194.8,28.8,0.87,6.100,194.8
+30.2,0.87,4.410,185.7,30.0,0.87,4.470,185.7
+31.1,0.87,4.700,163.2,30.9,0.87,4.760,163.6
+31.8,0.87,4.370,159.9,31.6,0.87,4.420,159.8
+32.2,0.87,4.610,160.9,32.0,0.87,4.670,161.0
+32.5,0.87,5.000,161.0,32.3,0.87,5.090,160.9
+32.6,0.87,5.220,163.9,32.4,0.87,5.290,164.0
+32.4,0.87,5.200,164.8,32.2,0.87,5.290,164.9
+31.9,0.87,5.870,161.9,31.8,0.87,5.970,162.3
+30.9,0.87,7.560,162.4,30.9,0.87,7.930,165.0
+30.8,0.87,8.230,167.1,30.9,0.87,8.380,167.5
+26.7,0.87,8.470,38.8,27.0,0.87,8.280,37.4
+27.3,0.87,3.750,104.4,27.7,0.87,3.550,114.4
+27.5,0.87,7.400,181.6,27.4,0.87,7.760,183.9
+26.0,0.87,9.160,185.1,26.0,0.87,10.250,185.4
+25.2,0.87,9.090,195.3,25.6,0.87,10.530,193.5
+25.3,0.87,9.500,202.8,25.8,0.87,10.480,199.3
+24.1,0.87,6.780,211.8,25.0,0.87,8.300,206.6
+23.1,0.87,4.090,239.2,23.3,0.87,4.860,236.3
+23.7,0.87,3.360,244.3,24.0,0.87,3.710,243.9
+24.6,0.87,2.700,225.4,24.6,0.87,2.820,226.7
+24.4,0.87,4.100,195.9,24.8,0.87,4.520,200.1
+26.1,0.87,2.480,209.3,25.9,0.87,2.530,210.1
+28.4,0.87,2.330,184.3,28.2,0.87,2.360,184.6
+30.2,0.87,3.220,158.3,30.0,0.87,3.260,158.7
+31.3,0.87,3.750,151.2,31.1,0.87,3.790,151.4
+32.2,0.87,4.470,156.5,31.9,0.87,4.530,156.7
+32.8,0.87,4.680,151.1,32.6,0.87,4.740,151.4
+33.3,0.87,5.590,151.3,33.0,0.87,5.670,151.6
+33.5,0.87,5.980,154.3,33.3,0.87,6.090,154.7
+33.6,0.87,5.890,162.1,33.4,0.87,6.010,162.3
+33.3,0.87,6.350,170.5,33.1,0.87,6.450,170.7
+20.6,0.87,16.480,331.2,20.4,0.87,17.100,330.1
+23.4,0.87,9.900,316.7,23.3,0.87,10.370,317.0
+26.2,0.87,2.380,8.7,26.1,0.87,2.320,4.4
+27.5,0.87,3.440,157.4,27.6,0.87,3.490,164.4
+24.9,0.87,5.140,144.7,24.6,0.87,5.520,150.0
+25.1,0.87,4.600,179.2,25.2,0.87,5.050,188.5
+26.5,0.87,7.230,185.3,26.4,0.87,7.300,186.2
+26.2,0.87,2.870,184.7,26.3,0.87,2.830,178.5
+25.7,0.87,2.920,237.0,25.8,0.87,2.590,231.3
+24.7,0.87,2.760,277.0,24.8,0.87,2.600,269.1
+24.3,0.87,5.810,272.0,24.5,0.87,5.290,270.6
+25.6,0.87,4.340,220.9,25.6,0.87,3.950,216.2
+25.7,0.87,1.630,266.6,25.6,0.87,1.400,272.2
+22.8,0.87,3.250,320.7,22.9,0.87,3.800,321.9
+24.7,0.87,1.010,270.4,24.5,0.87,1.040,272.5
+26.6,0.87,2.010,61.0,26.4,0.87,2.020,61.7
+28.6,0.87,2.840,33.1,28.4,0.87,2.870,33.6
+28.8,0.87,8.520,345.8,28.6,0.87,8.570,346.0
+25.3,0.87,7.310,49.2,25.1,0.87,7.400,49.0
+25.3,0.87,11.630,85.0,25.1,0.87,11.730,84.8
+24.4,0.87,5.470,30.3,24.2,0.87,5.490,32.5
+20.5,0.87,11.050,100.5,20.4,0.87,11.240,100.2
+21.4,0.87,11.130,109.6,21.2,0.87,11.480,109.2
+22.5,0.87,9.110,152.2,22.4,0.87,9.450,150.3
+23.6,0.87,7.110,168.1,23.4,0.87,7.430,169.0
+22.3,0.87,7.130,172.7,22.3,0.87,7.630,170.1
+22.0,0.87,6.050,156.3,21.9,0.87,6.530,154.1
+22.1,0.87,5.550,171.6,22.4,0.87,6.130,168.2
+21.9,0.87,4.380,202.0,22.2,0.87,4.560,193.1
+21.2,0.87,6.860,247.6,21.3,0.87,6.480,241.2
+21.6,0.87,3.550,231.4,21.4,0.87,3.380,227.8
+21.3,0.87,2.060,236.0,21.3,0.87,2.070,233.1
+21.7,0.87,3.520,221.8,21.9,0.87,3.790,224.9
+21.9,0.87,4.830,233.0,22.1,0.87,4.780,231.9
+21.5,0.87,6.050,249.6,21.8,0.87,5.910,247.5
+21.6,0.87,6.560,259.9,21.9,0.87,6.530,258.4
+21.8,0.87,6.590,264.5,22.1,0.87,6.640,264.0
+22.0,0.87,3.170,260.4,22.3,0.87,4.020,263.1
+24.2,0.87,2.030,227.5,24.0,0.87,2.100,228.5
+25.6,0.87,3.400,191.9,25.4,0.87,3.470,192.7
+27.0,0.87,4.450,193.9,26.8,0.87,4.540,194.4
+28.2,0.87,4.580,198.0,28.0,0.87,4.650,198.4
+29.5,0.87,5.190,204.8,29.2,0.87,5.280,205.1
+30.4,0.87,5.920,200.1,30.2,0.87,6.010,200.2
+31.0,0.87,6.690,200.7,30.8,0.87,6.800,200.9
+31.3,0.87,7.470,201.1,31.1,0.87,7.610,201.1
+31.4,0.87,7.720,198.5,31.2,0.87,7.890,198.5
+31.1,0.87,8.960,190.7,30.9,0.87,9.160,190.9
+30.7,0.87,8.040,208.9,30.6,0.87,8.520,208.4
+29.9,0.87,9.910,195.6,30.0,0.87,10.680,197.1
+29.3,0.87,10.300,192.2,29.4,0.87,11.150,192.7
+28.0,0.87,8.440,206.2,28.0,0.87,9.200,205.7
+28.2,0.87,8.500,216.0,28.1,0.87,9.230,216.9
+27.4,0.87,9.940,212.4,27.4,0.87,10.710,212.2
+26.5,0.87,10.680,200.0,26.7,0.87,11.810,200.7
+26.2,0.87,11.970,203.1,26.6,0.87,13.020,204.6
+25.6,0.87,11.840,214.8,26.0,0.87,13.010,216.9
+24.9,0.87,13.010,225.5,25.3,0.87,14.270,227.1
+25.5,0.87,13.990,232.9,25.8,0.87,15.240,234.4
+25.7,0.87,14.120,231.8,26.0,0.87,15.390,233.2
+24.3,0.87,12.080,235.9,24.5,0.87,13.020,237.7
+25.0,0.87,7.980,236.8,24.9,0.87,8.760,238.5
+27.1,0.87,6.510,249.1,26.9,0.87,6.640,249.5
+29.0,0.87,7.310,284.5,28.7,0.87,7.450,284.4
+28.9,0.87,7.910,325.4,28.7,0.87,8.020,325.4
+27.8,0.87,10.280,357.6,27.6,0.87,10.440,357.6
+26.1,0.87,11.890,8.4,25.9,0.87,12.060,8.4
+25.8,0.87,12.220,13.4,25.5,0.87,12.430,13.5
+25.0,0.87,11.490,19.1,24.8,0.87,11.750,19.1
+24.8,0.87,12.870,27.3,24.6,0.87,13.080,27.3
+24.0,0.87,13.770,29.8,23.8,0.87,14.050,29.9
+21.9,0.87,14.970,26.0,21.6,0.87,15.310,26.3
+20.3,0.87,11.710,34.5,20.1,0.87,12.070,34.6
+18.9,0.87,11.450,29.8,18.7,0.87,11.780,30.0
+18.5,0.87,8.810,24.8,18.3,0.87,9.060,24.9
+17.4,0.87,9.100,22.4,17.2,0.87,9.460,22.7
+16.7,0.88,7.310,27.4,16.5,0.88,7.760,27.6
+16.0,0.88,8.230,22.0,15.8,0.88,8.660,22.8
+15.5,0.88,8.140,26.8,15.3,0.88,8.740,28.1
+15.2,0.88,7.480,27.5,15.0,0.88,7.940,28.0
+15.1,0.88,6.680,21.2,14.9,0.88,6.870,21.8
+15.5,0.88,5.300,20.8,15.3,0.88,5.520,21.3
+15.6,0.88,5.860,22.3,15.4,0.88,6.100,22.7
+15.3,0.88,5.660,19.6,15.1,0.88,6.030,20.7
+14.5,0.88,5.950,20.7,14.4,0.88,6.480,23.0
+14.5,0.88,4.130,22.7,14.3,0.88,4.240,23.4
+15.5,0.88,3.500,31.2,15.3,0.88,3.540,31.8
+17.0,0.88,4.680,44.1,16.8,0.88,4.750,44.3
+18.1,0.88,4.300,34.2,17.9,0.88,4.360,34.2
+19.2,0.88,4.220,25.5,18.9,0.88,4.260,25.7
+20.1,0.88,3.810,30.5,19.9,0.88,3.850,30.2
+21.1,0.88,3.530,27.9,20.8,0.88,3.560,27.6
+21.8,0.88,2.690,16.1,21.6,0.88,2.710,15.8
+22.3,0.88,2.330,21.5,22.1,0.88,2.360,21.2
+22.6,0.87,2.450,43.1,22.4,0.87,2.450,42.2
+22.6,0.87,2.480,63.1,22.4,0.87,2.460,62.0
+22.4,0.87,3.520,80.3,22.2,0.87,3.430,80.2
+22.2,0.87,1.980,83.6,21.9,0.87,1.810,84.0
+21.6,0.87,1.790,122.0,21.5,0.87,1.770,114.8
+21.3,0.87,2.960,132.0,21.2,0.87,2.850,131.6
+20.7,0.87,4.230,163.8,20.7,0.87,3.980,163.9
+20.0,0.87,5.080,183.9,20.1,0.87,5.020,182.2
+18.6,0.87,6.510,208.3,18.9,0.87,6.320,204.0
+19.2,0.87,6.220,218.0,19.3,0.87,6.070,215.7
+19.3,0.88,5.950,231.4,19.5,0.88,5.750,230.1
+19.2,0.87,5.520,251.8,19.4,0.87,5.200,249.1
+18.6,0.87,5.680,282.3,18.8,0.87,5.360,278.3
+18.1,0.88,5.240,298.1,18.2,0.88,4.900,295.4
+17.9,0.88,4.860,299.2,18.0,0.88,4.510,297.1
+17.3,0.88,3.390,306.3,17.5,0.88,3.620,307.9
+19.0,0.88,1.870,311.8,18.9,0.88,1.860,309.4
+21.3,0.88,0.940,322.8,21.1,0.88,0.880,320.7
+22.2,0.88,1.470,80.4,22.0,0.88,1.460,81.7
+23.1,0.88,1.750,103.1,22.9,0.88,1.760,103.5
+24.0,0.87,2.560,119.8,23.8,0.87,2.600,120.7
+24.7,0.87,2.340,118.5,24.4,0.87,2.330,118.2
+25.2,0.87,2.560,103.0,25.0,0.87,2.560,104.0
+25.7,0.87,2.970,132.6,25.4,0.87,3.020,133.3
+25.7,0.87,4.140,141.5,25.5,0.87,4.200,141.8
+25.7,0.87,3.330,148.3,25.5,0.87,3.400,148.4
+25.1,0.87,5.890,139.9,24.9,0.87,5.930,140.3
+23.9,0.87,8.710,141.3,23.9,0.87,9.170,141.3
+23.0,0.87,9.500,154.6,23.1,0.87,9.930,154.1
+22.3,0.87,9.220,156.1,22.5,0.87,9.860,155.7
+21.9,0.87,9.710,157.1,22.2,0.87,10.300,156.8
+20.7,0.87,9.350,170.3,21.0,0.87,10.510,170.3
+21.2,0.87,12.030,175.2,21.5,0.87,12.540,176.0
+20.7,0.87,12.010,189.8,21.0,0.87,12.600,190.1
+20.3,0.87,11.690,200.8,20.8,0.87,12.440,200.3
+19.9,0.87,12.360,200.4,20.3,0.87,13.110,200.8
+19.2,0.87,12.060,201.7,19.7,0.87,12.950,202.8
+19.0,0.87,11.650,209.4,19.5,0.87,12.200,210.8
+18.5,0.87,11.020,207.4,19.1,0.87,11.690,208.5
+17.5,0.87,8.170,208.4,17.9,0.87,9.070,209.8
+20.3,0.87,6.970,203.3,20.1,0.87,7.110,204.0
+22.5,0.87,7.080,204.6,22.3,0.87,7.210,204.9
+23.9,0.87,7.020,208.4,23.7,0.87,7.150,208.5
+25.0,0.87,7.430,204.3,24.8,0.87,7.560,204.4
+25.7,0.87,7.960,201.2,25.5,0.87,8.100,201.3
+26.4,0.87,7.870,199.4,26.1,0.87,8.020,199.5
+26.9,0.87,8.010,199.8,26.7,0.87,8.160,199.9
+27.3,0.87,8.070,198.3,27.1,0.87,8.230,198.4
+27.3,0.87,8.830,192.0,27.1,0.87,9.030,192.2
+27.1,0.87,9.190,189.5,26.9,0.87,9.420,189.7
+26.6,0.87,9.980,186.1,26.5,0.87,10.640,187.4
+25.7,0.87,10.500,176.4,25.8,0.87,11.210,177.4
+24.9,0.87,11.460,178.9,25.1,0.87,12.460,180.0
+24.1,0.87,12.250,181.5,24.3,0.87,13.370,182.4
+22.8,0.87,12.250,177.1,22.9,0.87,13.280,178.0
+22.1,0.87,13.340,182.2,22.3,0.87,14.470,183.0
+21.4,0.87,12.940,184.9,21.6,0.87,14.090,186.0
+21.5,0.87,13.640,190.1,21.6,0.87,14.610,191.1
+20.9,0.87,14.110,190.5,20.9,0.87,15.220,191.4
+20.6,0.87,12.490,198.1,20.6,0.87,13.400,199.8
+20.0,0.87,12.940,204.6,20.2,0.87,14.090,206.9
+19.8,0.87,14.040,208.9,20.0,0.87,15.250,211.2
+19.7,0.87,14.270,211.4,19.9,0.87,15.520,213.2
+20.9,0.87,13.290,213.6,20.8,0.87,13.680,214.1
+22.5,0.87,11.720,208.5,22.3,0.87,11.920,208.9
+24.4,0.87,11.550,206.2,24.2,0.87,11.720,206.5
+26.4,0.87,10.860,204.5,26.2,0.87,11.030,204.7
+28.2,0.87,10.080,207.3,28.0,0.87,10.270,207.6
+29.6,0.87,9.890,210.7,29.4,0.87,10.090,210.9
+30.5,0.87,9.370,219.5,30.3,0.87,9.550,219.6
+31.0,0.87,9.500,211.9,30.8,0.87,9.690,212.0
+31.2,0.87,9.840,205.0,31.0,0.87,10.050,205.2
+31.2,0.87,10.290,204.3,31.0,0.87,10.540,204.4
+30.8,0.87,10.320,193.7,30.6,0.87,10.650,193.9
+29.8,0.87,11.910,189.6,29.8,0.87,12.740,190.3
+28.2,0.87,12.570,179.0,28.3,0.87,13.780,180.1
+26.8,0.87,12.770,181.8,26.9,0.87,13.950,182.5
+25.7,0.87,12.880,179.3,25.8,0.87,14.090,180.0
+24.3,0.87,12.780,181.3,24.4,0.87,14.010,182.4
+23.4,0.87,10.620,209.3,23.5,0.87,11.460,209.6
+23.4,0.87,11.560,210.6,23.4,0.87,12.440,211.6
+22.5,0.87,12.400,197.1,22.8,0.87,13.730,200.1
+21.9,0.87,11.720,204.9,22.3,0.87,13.200,208.0
+21.5,0.87,12.720,210.9,21.8,0.87,14.110,212.9
+21.3,0.87,13.420,219.4,21.6,0.87,14.920,221.1
+20.7,0.87,12.520,218.0,21.0,0.87,13.780,219.9
+20.3,0.87,11.610,221.6,20.7,0.87,12.790,224.0
+20.4,0.87,8.450,217.6,20.5,0.87,9.140,220.0
+22.6,0.87,6.880,212.6,22.4,0.87,6.940,213.7
+25.2,0.87,3.750,260.6,25.0,0.87,3.810,260.9
+26.8,0.87,2.140,294.3,26.6,0.87,2.150,292.6
+27.9,0.87,1.010,33.1,27.7,0.87,0.910,35.1
+29.1,0.87,4.040,195.0,28.8,0.87,4.100,195.2
+29.7,0.87,6.460,186.8,29.4,0.87,6.570,186.8
+22.4,0.87,13.040,325.5,22.2,0.87,13.190,325.7
+21.7,0.87,10.480,323.4,21.5,0.87,10.580,323.6
+21.4,0.87,8.990,355.0,21.2,0.87,9.090,354.9
+20.6,0.87,9.920,92.6,20.4,0.87,10.010,92.4
+19.6,0.87,7.650,67.0,19.5,0.87,8.100,66.4
+20.0,0.87,1.180,182.7,19.8,0.87,1.260,181.1
+19.0,0.87,6.840,4.5,18.8,0.87,6.850,5.6
+17.5,0.87,8.330,39.6,17.4,0.87,8.480,39.7
+16.9,0.87,7.670,43.9,16.7,0.87,7.860,44.2
+16.4,0.87,8.140,39.1,16.2,0.87,8.310,39.2
+15.8,0.87,5.850,26.0,15.6,0.87,5.960,26.6
+14.8,0.87,6.810,12.2,14.7,0.87,6.920,12.6
+13.9,0.87,7.710,9.1,13.7,0.87,7.830,9.6
+13.3,0.87,7.950,22.2,13.1,0.87,8.080,22.4
+12.7,0.88,8.090,24.3,12.5,0.88,8.270,24.6
+12.5,0.88,9.230,24.4,12.3,0.88,9.470,24.9
+12.1,0.88,9.680,18.6,11.9,0.88,9.970,19.1
+11.8,0.88,10.570,15.9,11.6,0.88,10.870,16.5
+11.4,0.88,8.280,20.6,11.2,0.88,8.490,20.4
+11.2,0.88,8.220,22.1,11.0,0.88,8.370,22.0
+11.3,0.88,11.320,29.8,11.1,0.88,11.720,30.1
+11.2,0.88,9.590,20.4,11.0,0.88,9.800,20.6
+11.1,0.88,9.020,24.9,10.9,0.88,9.170,24.8
+11.4,0.88,8.770,23.9,11.2,0.88,8.960,23.9
+11.9,0.88,9.770,29.4,11.7,0.88,9.990,29.5
+12.1,0.88,7.030,32.3,11.9,0.88,7.170,32.4
+12.5,0.88,6.680,45.0,12.3,0.88,6.840,44.5
+12.8,0.88,6.660,31.1,12.6,0.88,6.820,31.2
+12.6,0.88,7.820,37.6,12.4,0.88,8.340,37.3
+12.4,0.88,6.640,36.7,12.2,0.88,7.000,36.7
+12.0,0.88,6.500,43.2,11.8,0.88,7.100,44.2
+11.6,0.88,4.950,46.7,11.4,0.88,5.460,47.0
+11.0,0.88,6.290,41.2,10.9,0.88,6.890,42.7
+10.7,0.88,7.190,33.7,10.6,0.88,7.790,34.7
+10.5,0.88,7.230,22.1,10.4,0.88,7.730,24.1
+10.4,0.88,6.390,11.5,10.2,0.88,7.150,13.6
+10.4,0.88,6.660,7.2,10.3,0.88,6.900,8.7
+10.2,0.88,6.640,7.7,10.1,0.88,7.030,9.5
+10.3,0.88,6.680,353.2,10.1,0.88,6.940,354.3
+9.6,0.88,6.940,358.8,9.4,0.88,7.490,0.8
+9.1,0.88,6.480,0.2,9.0,0.88,7.180,2.8
+9.0,0.88,7.710,0.7,8.9,0.88,8.270,2.3
+9.0,0.88,7.200,2.3,8.8,0.88,7.460,3.4
+9.5,0.88,6.930,6.5,9.3,0.88,7.050,6.9
+10.2,0.88,6.540,12.4,10.0,0.88,6.650,12.5
+11.3,0.88,5.460,16.4,11.0,0.88,5.570,16.3
+12.1,0.88,4.540,26.3,11.9,0.88,4.630,25.8
+12.6,0.88,2.160,32.2,12.4,0.88,2.320,32.5
+12.8,0.88,1.220,96.4,12.7,0.88,1.470,86.4
+13.3,0.88,3.250,75.8,13.2,0.88,3.630,72.4
+13.7,0.88,2.900,88.8,13.6,0.88,3.280,83.6
+13.8,0.88,2.840,87.7,13.7,0.88,3.670,80.1
+13.9,0.88,2.980,86.2,13.8,0.88,3.850,82.6
+13.4,0.88,1.700,107.1,13.3,0.88,2.230,99.1
+13.3,0.88,3.520,83.5,13.3,0.88,4.330,78.8
+13.1,0.88,2.160,81.6,13.0,0.88,2.720,80.8
+12.9,0.88,1.450,52.0,12.8,0.88,1.690,57.1
+12.7,0.88,1.370,54.5,12.6,0.88,1.450,60.8
+12.6,0.88,1.430,25.7,12.5,0.88,1.480,30.1
+12.5,0.88,0.930,328.3,12.3,0.88,0.910,335.4
+12.5,0.88,1.410,297.2,12.3,0.88,1.430,303.6
+12.6,0.88,1.610,272.4,12.5,0.88,1.540,280.4
+12.6,0.88,3.500,312.9,12.6,0.88,3.690,316.9
+12.1,0.88,3.940,317.3,12.1,0.88,4.130,317.9
+12.0,0.88,5.620,304.3,12.0,0.88,5.840,305.8
+11.8,0.88,3.900,306.9,11.7,0.88,4.380,307.9
+13.5,0.88,3.390,328.6,13.3,0.88,3.390,328.0
+14.8,0.88,2.990,344.7,14.6,0.88,2.990,344.5
+16.2,0.88,2.980,341.3,16.0,0.88,2.990,341.1
+17.5,0.87,2.560,342.3,17.2,0.87,2.560,342.1
+18.6,0.87,2.060,339.6,18.4,0.87,2.060,339.4
+19.7,0.87,1.430,352.1,19.4,0.87,1.420,351.6
+20.5,0.87,1.890,353.0,20.3,0.87,1.880,352.5
+21.1,0.87,1.570,14.7,20.9,0.87,1.550,13.5
+21.4,0.87,1.600,20.8,21.2,0.87,1.560,19.1
+21.4,0.87,1.330,24.8,21.2,0.87,1.260,23.3
+21.0,0.87,1.630,12.0,20.8,0.87,1.400,5.3
+20.5,0.87,0.870,11.0,20.4,0.87,0.840,0.6
+19.9,0.87,1.330,121.2,19.8,0.87,1.280,125.2
+18.7,0.87,4.150,159.5,18.6,0.87,4.090,161.5
+17.9,0.87,6.460,174.5,17.9,0.87,6.610,176.1
+17.3,0.87,7.700,181.4,17.3,0.87,7.720,183.3
+16.4,0.87,7.640,190.1,16.5,0.87,7.580,191.6
+16.6,0.87,5.370,210.4,16.9,0.87,5.210,215.1
+16.3,0.87,5.710,217.6,16.6,0.87,5.740,222.1
+15.7,0.87,6.600,224.5,16.2,0.87,6.680,228.0
+16.1,0.87,7.120,232.1,16.7,0.87,6.950,235.7
+16.2,0.87,6.110,246.1,16.6,0.87,5.810,250.2
+16.4,0.87,4.680,254.9,16.6,0.87,4.350,260.0
+16.8,0.87,3.730,274.3,16.8,0.87,3.720,278.4
+16.8,0.87,1.250,265.1,16.6,0.87,1.300,262.8
+18.9,0.87,1.080,291.4,18.7,0.87,1.080,286.6
+20.6,0.87,0.980,325.3,20.4,0.87,0.940,321.4
+21.8,0.87,1.010,8.2,21.6,0.87,0.950,7.6
+22.9,0.87,1.230,41.1,22.7,0.87,1.190,42.3
+23.9,0.87,1.440,34.8,23.7,0.87,1.400,36.5
+24.6,0.87,1.620,35.8,24.4,0.87,1.590,36.6
+25.1,0.87,1.440,56.0,24.9,0.87,1.410,58.0
+25.3,0.87,1.780,148.5,25.1,0.87,1.800,149.3
+25.0,0.87,4.070,156.3,24.8,0.87,4.110,156.9
+23.8,0.87,7.500,143.6,23.6,0.87,7.640,144.2
+22.3,0.87,9.460,150.4,22.4,0.87,9.270,151.0
+21.3,0.87,10.080,154.0,21.4,0.87,10.310,154.0
+20.3,0.87,10.410,155.8,20.4,0.87,11.000,155.8
+19.5,0.87,10.430,157.9,19.8,0.87,11.100,157.6
+19.1,0.87,10.700,161.7,19.4,0.87,11.270,162.1
+18.8,0.87,9.510,168.3,19.2,0.87,9.560,168.8
+18.8,0.87,8.200,181.3,19.5,0.87,8.050,182.0
+18.6,0.87,9.140,214.2,19.5,0.87,9.120,213.8
+19.6,0.87,9.830,218.9,20.2,0.87,10.050,218.3
+20.1,0.87,8.930,223.6,21.0,0.87,9.020,223.0
+20.4,0.87,9.640,234.0,21.4,0.87,9.580,233.5
+17.2,0.87,7.760,242.5,18.2,0.87,8.670,243.0
+17.7,0.87,4.750,258.9,18.5,0.87,5.450,261.1
+18.7,0.87,2.290,323.9,18.6,0.87,2.240,321.1
+19.0,0.87,4.080,329.4,18.8,0.87,4.040,329.0
+21.1,0.87,4.340,338.1,20.9,0.87,4.370,337.8
+22.9,0.87,4.630,343.4,22.7,0.87,4.660,343.4
+23.1,0.87,6.050,13.8,22.8,0.87,6.090,13.9
+22.8,0.87,9.570,24.0,22.6,0.87,9.670,24.2
+22.4,0.87,9.100,19.8,22.1,0.87,9.210,20.0
+22.5,0.87,8.210,19.9,22.2,0.87,8.320,20.0
+22.3,0.87,8.340,24.7,22.1,0.87,8.470,24.7
+21.6,0.87,9.970,24.5,21.4,0.87,10.200,24.6
+20.6,0.87,10.130,16.5,20.4,0.87,10.690,17.2
+19.2,0.87,10.920,20.9,19.0,0.87,11.540,21.5
+18.4,0.87,9.400,22.1,18.2,0.87,9.920,22.6
+17.8,0.87,8.310,29.0,17.6,0.87,8.810,29.5
+17.0,0.87,7.950,22.5,16.9,0.87,8.580,23.8
+16.1,0.87,7.950,23.4,16.0,0.87,8.690,25.2
+15.0,0.87,7.150,24.3,14.8,0.87,7.660,25.7
+14.1,0.87,5.390,31.1,13.9,0.87,5.930,31.8
+13.2,0.87,6.150,31.9,13.1,0.87,6.860,35.9
+13.0,0.87,7.460,38.1,12.8,0.87,7.870,38.9
+12.4,0.87,4.290,20.7,12.2,0.87,4.940,28.5
+11.7,0.87,3.580,25.0,11.6,0.87,4.000,33.2
+11.3,0.87,3.010,30.4,11.2,0.87,3.130,35.6
+11.3,0.87,1.350,36.2,11.2,0.87,1.570,44.5
+12.8,0.87,1.120,102.6,12.6,0.87,1.150,105.5
+14.8,0.87,2.350,153.5,14.5,0.87,2.370,153.9
+16.5,0.87,2.050,176.9,16.3,0.87,2.080,177.5
+18.2,0.87,2.660,192.6,18.0,0.87,2.700,193.2
+19.7,0.87,3.500,212.9,19.4,0.87,3.550,213.3
+21.0,0.87,4.130,224.7,20.8,0.87,4.190,225.1
+22.2,0.87,4.530,242.1,21.9,0.87,4.610,242.3
+22.9,0.87,5.180,237.3,22.7,0.87,5.270,237.7
+23.4,0.87,5.660,239.6,23.1,0.87,5.760,239.9
+23.4,0.87,5.570,230.1,23.3,0.87,5.700,230.4
+23.2,0.87,7.000,206.5,23.1,0.87,7.130,208.1
+22.5,0.87,8.820,207.3,22.6,0.87,9.210,209.3
+21.0,0.87,8.890,204.0,21.3,0.87,9.750,207.7
+20.3,0.87,9.060,208.4,20.6,0.87,9.880,211.1
+19.8,0.87,9.860,213.0,20.2,0.87,10.810,213.6
+19.1,0.87,10.250,209.8,19.5,0.87,11.290,212.2
+18.6,0.87,12.780,219.4,19.1,0.87,14.040,220.9
+18.5,0.87,13.450,225.3,19.0,0.87,14.660,226.1
+18.4,0.87,13.750,229.2,19.0,0.87,14.890,229.8
+18.4,0.87,13.200,233.4,19.2,0.87,14.210,234.2
+17.9,0.87,13.010,229.8,18.7,0.87,14.150,231.5
+17.9,0.87,13.330,231.0,18.6,0.87,14.480,232.8
+17.0,0.87,13.060,223.8,17.6,0.87,14.300,226.6
+16.9,0.87,12.180,224.5,17.1,0.87,13.030,225.7
+18.9,0.87,10.500,222.4,18.7,0.87,10.730,223.1
+21.6,0.87,8.480,227.4,21.4,0.87,8.620,227.7
+23.8,0.87,7.010,235.9,23.6,0.87,7.140,236.1
+25.7,0.87,5.370,233.8,25.4,0.87,5.460,234.0
+27.2,0.87,4.610,233.8,27.0,0.87,4.680,234.0
+28.4,0.87,3.930,231.9,28.1,0.87,3.990,232.1
+29.1,0.87,3.700,230.6,28.9,0.87,3.750,230.9
+29.6,0.87,2.970,226.8,29.4,0.87,3.010,227.4
+29.9,0.87,2.550,243.0,29.7,0.87,2.590,242.8
+29.8,0.87,3.500,214.7,29.6,0.87,3.580,215.4
+29.5,0.87,5.170,206.7,29.4,0.87,5.220,208.6
+27.6,0.87,7.200,215.0,27.9,0.87,7.930,216.0
+25.9,0.87,2.850,248.8,26.0,0.87,3.970,228.6
+25.9,0.87,6.090,225.7,26.2,0.87,6.280,227.8
+24.6,0.87,10.480,210.8,24.6,0.87,11.220,212.2
+23.8,0.87,13.200,224.9,24.4,0.87,14.000,225.3
+23.1,0.87,11.020,223.7,23.7,0.87,11.760,226.8
+24.9,0.87,8.290,243.0,25.1,0.87,8.760,244.3
+22.8,0.87,8.520,230.0,23.1,0.87,9.620,234.1
+22.5,0.87,12.300,227.2,23.1,0.87,13.570,228.0
+22.4,0.87,12.300,230.8,22.8,0.87,12.680,231.6
+21.9,0.87,9.850,229.0,22.5,0.87,9.540,231.3
+20.3,0.87,9.110,222.6,21.0,0.87,8.940,225.5
+19.6,0.87,7.540,221.6,20.3,0.87,7.810,224.3
+20.8,0.87,3.230,244.2,20.9,0.87,3.750,245.0
+22.6,0.87,1.420,327.2,22.4,0.87,1.320,324.1
+23.7,0.87,1.590,19.9,23.5,0.87,1.480,21.7
+25.6,0.87,2.110,39.1,25.4,0.87,2.040,42.5
+28.2,0.87,3.280,154.2,28.0,0.87,3.360,154.8
+29.1,0.87,4.610,164.4,28.9,0.87,4.690,164.7
+29.7,0.87,4.280,177.8,29.5,0.87,4.320,178.0
+30.1,0.87,4.640,193.8,29.9,0.87,4.690,193.7
+30.1,0.87,4.820,191.5,29.9,0.87,4.900,191.8
+29.8,0.87,4.760,195.9,29.7,0.87,4.900,196.5
+26.6,0.87,7.310,30.0,26.4,0.87,8.420,34.6
+24.9,0.87,10.600,59.7,24.8,0.87,11.900,57.9
+22.9,0.87,6.960,56.9,23.0,0.87,8.450,58.5
+22.4,0.87,1.800,60.9,22.9,0.87,1.680,90.1
+21.9,0.87,2.730,352.1,22.4,0.87,2.200,326.8
+19.6,0.87,4.150,22.1,20.0,0.87,4.130,27.5
+21.3,0.87,1.630,72.6,22.1,0.87,1.110,87.4
+21.8,0.87,4.460,208.6,22.3,0.87,5.050,211.2
+21.1,0.87,2.850,264.9,21.7,0.87,3.410,255.6
+19.6,0.87,2.990,280.0,20.3,0.87,3.620,268.6
+19.3,0.87,2.320,317.9,20.0,0.87,2.500,304.5
+16.8,0.87,4.730,355.5,17.1,0.87,5.070,357.0
+16.8,0.87,5.620,353.2,17.0,0.87,5.700,357.4
+16.6,0.87,5.090,354.5,16.6,0.87,5.380,358.6
+17.9,0.87,4.190,359.7,17.8,0.87,4.240,0.7
+20.3,0.87,4.660,9.8,20.2,0.87,4.660,10.3
+22.9,0.87,4.840,28.8,22.7,0.87,4.880,29.4
+24.8,0.87,4.950,46.1,24.6,0.87,5.020,46.7
+26.5,0.87,5.510,50.5,26.2,0.87,5.570,51.0
+27.6,0.87,5.430,58.9,27.4,0.87,5.490,59.4
+28.3,0.87,5.050,62.6,28.1,0.87,5.100,62.9
+28.7,0.87,4.840,67.9,28.5,0.87,4.910,68.5
+28.7,0.87,4.540,75.9,28.5,0.87,4.630,76.3
+28.3,0.87,5.520,108.3,28.1,0.87,5.690,108.4
+27.2,0.87,7.760,120.8,27.1,0.87,8.180,120.4
+26.4,0.87,8.370,117.7,26.4,0.87,8.660,117.4
+25.6,0.87,8.370,118.5,25.7,0.87,8.810,118.7
+25.2,0.87,8.340,112.7,25.4,0.87,8.440,114.6
+24.2,0.87,8.530,107.7,24.4,0.87,8.940,108.1
+23.3,0.87,9.280,112.8,23.7,0.87,9.720,114.2
+22.8,0.87,10.050,116.1,23.2,0.87,10.400,117.5
+21.4,0.87,11.140,123.4,21.8,0.87,11.930,123.4
+21.3,0.87,10.440,120.9,21.8,0.87,10.930,122.5
+21.4,0.87,10.140,120.6,21.8,0.87,10.420,123.0
+20.7,0.87,9.280,119.8,21.2,0.87,9.800,121.8
+21.0,0.87,9.410,121.0,21.4,0.87,9.170,123.1
+20.7,0.87,8.050,120.6,21.1,0.87,7.720,122.6
+18.5,0.87,2.390,84.7,18.5,0.87,2.970,93.0
+20.2,0.87,4.220,121.5,20.1,0.87,4.600,121.4
+22.1,0.87,2.210,32.3,21.9,0.87,2.190,34.5
+23.4,0.87,4.350,41.5,23.2,0.87,4.380,43.8
+24.5,0.87,5.530,54.9,24.3,0.87,5.550,56.0
+27.4,0.87,7.110,105.7,27.1,0.87,7.240,105.9
+28.3,0.87,6.920,116.1,28.1,0.87,7.040,116.4
+28.8,0.87,7.060,136.4,28.6,0.87,7.180,136.4
+29.1,0.87,6.250,139.6,28.9,0.87,6.360,140.1
+29.1,0.87,6.390,139.5,28.9,0.87,6.500,139.8
+28.5,0.87,8.680,130.7,28.3,0.87,9.000,130.9
+27.0,0.87,9.860,118.1,26.9,0.87,10.550,118.4
+24.9,0.87,11.570,119.3,24.9,0.87,12.450,119.5
+23.0,0.87,12.640,120.3,22.9,0.87,13.490,119.5
+21.2,0.87,14.000,126.5,21.1,0.87,14.850,125.6
+19.9,0.87,11.490,122.9,19.7,0.87,12.440,122.5
+18.6,0.87,12.220,123.2,18.4,0.87,13.210,122.5
+17.6,0.87,13.030,129.3,17.5,0.87,14.050,128.5
+16.9,0.87,13.060,131.4,16.8,0.87,13.980,131.0
+16.0,0.87,12.930,134.0,15.9,0.87,13.660,133.8
+15.3,0.87,11.890,142.2,15.4,0.87,12.680,142.8
+15.1,0.87,10.410,144.2,15.6,0.87,11.010,147.9
+15.1,0.87,9.640,151.6,16.2,0.87,9.910,162.9
+13.1,0.87,4.730,82.8,13.6,0.87,4.380,103.8
+13.5,0.87,6.300,140.4,14.3,0.87,6.500,146.7
+16.7,0.87,6.440,165.6,17.3,0.87,6.870,174.4
+19.9,0.87,6.520,175.1,19.7,0.87,6.520,176.9
+23.8,0.87,7.530,200.0,23.6,0.87,7.640,200.8
+26.8,0.87,9.370,213.5,26.6,0.87,9.550,213.8
+28.8,0.87,9.840,217.8,28.6,0.87,10.060,218.1
+29.6,0.87,10.040,220.7,29.4,0.87,10.250,220.9
+29.8,0.87,10.110,217.9,29.6,0.87,10.320,218.1
+29.9,0.87,9.910,217.6,29.7,0.87,10.120,217.7
+29.9,0.87,10.220,212.9,29.7,0.87,10.480,213.1
+29.3,0.87,9.340,208.4,29.1,0.87,9.900,208.8
+27.9,0.87,12.140,199.8,28.0,0.87,13.190,200.8
+26.5,0.87,13.460,201.1,26.7,0.87,14.610,201.6
+25.2,0.87,14.300,203.3,25.4,0.87,15.540,203.4
+24.4,0.87,14.710,206.5,24.6,0.87,15.910,206.5
+23.8,0.87,14.890,205.8,24.1,0.87,16.070,205.8
+23.2,0.87,15.200,207.0,23.4,0.87,16.340,207.0
+22.6,0.87,16.060,208.8,22.8,0.87,17.200,209.0
+21.9,0.87,16.530,213.2,22.0,0.87,17.670,213.6
+21.0,0.87,15.970,218.3,21.1,0.87,17.120,218.7
+20.2,0.87,15.480,221.8,20.4,0.87,16.650,222.1
+19.9,0.87,14.900,223.0,20.0,0.87,16.020,223.5
+19.1,0.87,12.490,223.2,19.2,0.87,13.710,224.1
+18.1,0.87,11.100,228.9,18.2,0.87,12.540,229.7
+18.9,0.87,12.830,228.7,18.8,0.87,13.620,229.2
+20.4,0.87,10.300,226.6,20.2,0.87,10.570,227.0
+22.7,0.87,10.050,215.5,22.5,0.87,10.230,215.8
+24.9,0.87,10.160,221.7,24.7,0.87,10.350,221.9
+26.3,0.87,9.700,223.0,26.1,0.87,9.870,223.1
+27.5,0.87,8.640,220.1,27.2,0.87,8.800,220.3
+28.3,0.87,8.040,216.2,28.1,0.87,8.180,216.4
+28.8,0.87,7.350,218.5,28.6,0.87,7.480,218.7
+29.1,0.87,7.570,211.8,28.8,0.87,7.710,212.1
+28.9,0.87,8.590,202.9,28.7,0.87,8.780,203.2
+28.2,0.87,9.290,198.7,28.1,0.87,9.730,199.1
+27.3,0.87,10.760,191.8,27.3,0.87,11.570,193.7
+25.8,0.87,11.720,188.0,25.9,0.87,12.820,189.8
+24.0,0.87,6.480,212.5,24.2,0.87,7.290,208.7
+22.3,0.87,8.920,299.5,22.2,0.87,9.210,300.6
+21.9,0.87,5.710,14.5,21.9,0.87,6.320,19.8
+21.4,0.87,9.640,47.4,21.4,0.87,9.310,46.4
+22.2,0.87,4.760,116.9,22.5,0.87,4.660,126.8
+22.0,0.87,3.890,172.2,22.2,0.87,4.930,175.3
+20.3,0.87,5.620,327.4,20.2,0.87,5.850,330.9
+20.1,0.87,2.630,41.2,20.2,0.87,2.710,33.6
+21.2,0.87,3.100,111.0,21.4,0.87,2.730,107.3
+20.2,0.87,5.270,152.7,20.6,0.87,4.800,150.3
+21.4,0.87,4.310,246.5,21.7,0.87,4.030,250.2
+22.3,0.87,4.220,260.8,22.5,0.87,4.060,266.8
+22.4,0.87,3.900,263.4,22.4,0.87,4.300,265.0
+23.7,0.87,4.460,276.7,23.5,0.87,4.500,276.5
+24.7,0.87,3.680,279.0,24.5,0.87,3.730,278.3
+26.8,0.87,5.150,247.9,26.6,0.87,5.280,247.8
+27.9,0.86,6.890,264.9,27.7,0.86,7.030,264.8
+28.6,0.86,8.580,262.3,28.4,0.86,8.740,262.0
+28.8,0.86,9.540,256.7,28.6,0.86,9.690,256.7
+28.8,0.86,9.410,262.8,28.6,0.86,9.540,262.5
+28.8,0.86,6.930,265.9,28.6,0.86,7.080,265.4
+28.5,0.86,9.070,270.0,28.4,0.86,9.470,270.1
+28.2,0.86,9.240,271.3,28.1,0.86,9.470,271.8
+27.1,0.86,9.830,261.6,27.4,0.86,10.620,263.4
+27.2,0.86,10.240,265.2,27.4,0.86,10.680,266.8
+26.7,0.86,9.590,266.9,27.0,0.86,10.200,270.9
+25.1,0.86,10.620,264.0,25.7,0.86,11.760,270.9
+24.5,0.87,10.540,277.5,25.0,0.87,11.490,284.4
+20.4,0.87,6.760,353.2,20.2,0.87,7.170,3.4
+18.8,0.87,2.750,21.4,18.6,0.87,2.920,21.8
+16.8,0.87,6.710,13.9,16.6,0.87,6.560,17.5
+16.1,0.87,1.030,281.7,16.1,0.87,0.800,276.0
+17.9,0.87,3.270,1.1,18.3,0.87,3.410,353.0
+17.3,0.87,6.320,347.8,17.4,0.87,6.660,346.7
+15.2,0.87,5.980,354.5,15.4,0.87,6.530,355.2
+15.1,0.87,2.080,335.2,15.2,0.87,2.510,344.0
+16.8,0.87,1.060,235.0,16.7,0.87,1.020,232.0
+19.1,0.87,2.360,353.9,18.9,0.87,2.350,353.9
+21.3,0.87,2.540,9.4,21.1,0.87,2.520,9.2
+23.2,0.87,3.100,22.5,23.0,0.87,3.100,23.0
+24.8,0.87,2.770,36.8,24.6,0.87,2.760,37.5
+25.8,0.87,2.500,46.7,25.6,0.87,2.480,48.0
+26.7,0.87,2.660,48.2,26.5,0.87,2.620,49.8
+27.0,0.87,3.320,35.1,26.8,0.87,3.290,35.7
+20.3,0.87,15.530,179.2,20.2,0.87,16.460,178.8
+18.8,0.87,4.840,213.7,18.8,0.87,5.140,210.1
+22.7,0.87,3.810,180.5,23.0,0.87,4.050,178.8
+18.8,0.87,9.290,162.3,18.7,0.87,9.730,162.6
+19.3,0.87,11.060,176.2,19.1,0.87,11.570,175.7
+18.0,0.87,7.200,156.5,17.9,0.87,7.500,158.4
+17.1,0.87,8.910,142.9,17.2,0.87,9.260,143.4
+16.4,0.87,7.570,151.3,16.3,0.87,8.310,151.2
+16.1,0.87,5.170,135.5,15.8,0.87,5.590,135.5
+15.3,0.87,4.670,138.4,15.1,0.87,4.980,139.4
+16.1,0.87,6.800,152.4,16.3,0.87,7.300,158.4
+16.8,0.87,6.450,170.9,16.9,0.87,6.660,175.2
+16.2,0.87,6.190,160.7,16.3,0.87,6.380,163.8
+16.2,0.87,6.820,158.3,16.3,0.87,6.960,159.5
+15.3,0.87,7.730,155.9,15.4,0.87,8.290,155.3
+15.6,0.87,7.480,163.6,15.5,0.87,8.020,163.0
+16.5,0.87,8.520,161.0,16.3,0.87,8.670,161.1
+17.5,0.87,8.310,154.5,17.3,0.87,8.470,154.6
+18.2,0.87,6.830,153.2,18.0,0.87,6.940,153.3
+19.6,0.87,5.420,164.7,19.4,0.87,5.500,164.8
+20.8,0.87,4.910,153.8,20.5,0.87,4.970,154.1
+21.7,0.87,4.900,160.2,21.4,0.87,4.950,160.6
+22.4,0.87,4.870,155.8,22.2,0.87,4.940,156.0
+23.1,0.87,5.860,147.8,22.8,0.87,5.960,148.4
+22.3,0.87,7.700,142.9,22.1,0.87,7.840,143.3
+21.8,0.87,7.500,136.9,21.7,0.87,7.730,137.5
+21.7,0.87,5.830,154.2,21.6,0.87,6.140,154.6
+21.2,0.87,7.060,173.7,21.1,0.87,7.710,175.4
+20.6,0.87,4.420,213.8,20.5,0.87,5.110,212.5
+15.1,0.87,9.330,62.3,15.1,0.87,9.360,61.7
+16.5,0.87,7.170,125.4,16.7,0.87,7.580,127.2
+16.3,0.87,6.310,139.0,16.3,0.87,6.840,139.8
+16.5,0.87,5.200,137.3,16.4,0.87,5.750,142.6
+16.1,0.87,7.310,136.6,16.1,0.87,7.710,139.7
+15.9,0.87,6.790,140.2,15.9,0.87,7.240,142.4
+15.4,0.87,7.090,152.1,15.4,0.87,7.650,153.7
+15.2,0.87,6.020,157.1,15.1,0.87,6.490,157.4
+15.1,0.87,4.790,165.4,15.2,0.87,5.140,169.4
+15.5,0.87,3.020,174.8,15.5,0.87,3.170,181.7
+14.6,0.87,5.900,5.9,14.5,0.87,6.110,6.5
+15.2,0.87,3.640,89.9,15.4,0.87,3.200,83.9
+17.0,0.87,4.570,148.2,16.8,0.87,4.540,148.5
+18.4,0.87,4.580,165.7,18.2,0.87,4.630,165.7
+19.7,0.87,3.640,169.8,19.4,0.87,3.640,170.0
+20.4,0.87,3.560,161.9,20.1,0.87,3.590,161.9
+21.1,0.87,4.660,146.2,20.8,0.87,4.710,146.2
+21.6,0.87,4.960,140.4,21.3,0.87,5.010,140.4
+18.9,0.87,3.430,40.5,18.7,0.87,3.400,42.4
+20.0,0.87,3.990,68.5,19.8,0.87,4.060,69.3
+20.2,0.87,5.560,150.7,20.0,0.87,5.770,150.7
+19.3,0.87,5.190,149.7,19.1,0.87,5.350,149.9
+18.6,0.87,5.270,145.6,18.4,0.87,5.440,145.5
+18.3,0.87,5.040,149.6,18.1,0.87,5.240,149.2
+17.9,0.87,5.210,159.5,17.7,0.87,5.440,159.3
+17.7,0.87,3.970,158.5,17.5,0.87,4.140,157.9
+17.4,0.87,4.320,155.4,17.2,0.87,4.500,155.1
+17.1,0.87,3.350,161.9,16.9,0.87,3.540,161.4
+16.9,0.87,2.500,178.5,16.8,0.87,2.650,178.9
+16.8,0.87,0.880,189.3,16.6,0.87,0.880,187.1
+16.3,0.87,1.060,272.1,16.1,0.87,1.040,264.1
+16.0,0.87,1.450,333.4,15.9,0.87,1.420,326.4
+15.6,0.87,2.630,339.3,15.4,0.87,2.650,339.1
+15.4,0.87,2.710,329.8,15.3,0.87,2.750,329.0
+15.2,0.87,3.640,333.5,15.1,0.87,3.750,333.3
+15.3,0.87,2.210,333.2,15.2,0.87,2.480,335.1
+15.2,0.87,1.230,29.0,15.1,0.87,1.300,28.1
+14.5,0.87,0.370,30.5,14.4,0.87,0.400,32.7
+16.4,0.87,2.390,243.3,16.2,0.87,2.330,243.6
+17.4,0.87,3.490,332.6,17.2,0.87,3.500,333.1
+18.1,0.87,2.710,323.8,17.9,0.87,2.680,324.9
+18.2,0.87,2.660,359.5,18.0,0.87,2.690,358.7
+17.6,0.87,2.120,17.2,17.4,0.87,2.200,18.9
+17.9,0.87,0.470,14.0,17.7,0.87,0.540,23.8
+17.2,0.87,1.070,31.6,17.1,0.87,1.090,32.5
+17.1,0.87,3.600,54.3,16.9,0.87,3.730,53.3
+16.6,0.87,2.920,35.2,16.6,0.87,3.280,40.8
+16.8,0.87,3.300,26.2,16.6,0.87,3.600,29.4
+16.3,0.87,2.940,7.4,16.2,0.87,3.350,14.7
+16.0,0.87,4.440,23.9,15.8,0.87,4.420,31.5
+15.2,0.87,4.440,25.7,15.2,0.87,4.580,31.4
+14.8,0.87,3.630,41.0,14.7,0.87,3.620,42.6
+14.0,0.87,2.280,37.5,14.0,0.87,2.760,38.3
+14.1,0.87,2.380,17.6,14.0,0.87,2.880,23.2
+14.2,0.87,2.530,6.2,14.0,0.87,2.560,6.7
+14.4,0.87,3.650,338.4,14.3,0.87,3.740,341.7
+14.1,0.87,2.520,338.3,14.0,0.87,2.530,341.8
+13.9,0.87,2.510,320.3,13.8,0.87,2.720,323.7
+13.8,0.87,2.990,333.7,13.6,0.87,3.180,333.5
+14.4,0.87,3.870,345.5,14.2,0.87,3.880,345.3
+15.0,0.87,3.560,339.1,14.8,0.87,3.600,339.2
+15.3,0.87,3.240,327.8,15.1,0.87,3.240,328.1
+16.7,0.87,3.080,338.5,16.5,0.87,3.120,338.2
+18.4,0.87,3.650,347.5,18.2,0.87,3.680,347.4
+19.7,0.87,3.250,354.6,19.4,0.87,3.270,354.5
+20.6,0.87,3.440,6.6,20.3,0.87,3.460,6.3
+21.2,0.87,3.270,13.7,21.0,0.87,3.300,13.5
+21.4,0.87,2.350,24.7,21.2,0.87,2.370,24.0
+21.2,0.87,2.000,5.6,21.0,0.87,2.040,4.5
+21.1,0.87,2.270,319.1,21.0,0.87,2.490,318.5
+17.2,0.87,12.990,337.2,17.0,0.87,13.530,337.9
+15.5,0.87,5.540,40.7,15.6,0.87,6.050,37.8
+16.9,0.87,3.720,356.8,17.1,0.87,4.510,359.1
+17.0,0.87,7.200,282.5,17.1,0.87,7.650,285.0
+15.4,0.87,5.200,353.1,15.6,0.87,5.880,344.7
+15.4,0.87,5.660,326.7,15.5,0.87,6.530,318.6
+15.9,0.87,8.270,310.3,16.1,0.87,8.900,312.4
+16.0,0.87,10.030,316.9,16.1,0.87,10.680,319.9
+16.1,0.87,10.180,321.1,16.2,0.87,10.470,327.6
+15.4,0.87,8.350,314.9,15.4,0.87,9.050,316.8
+13.7,0.87,7.390,345.3,13.6,0.87,7.960,347.0
+13.8,0.87,5.900,316.4,14.0,0.87,4.930,327.2
+13.7,0.87,6.880,317.7,13.8,0.87,7.220,322.9
+14.5,0.87,8.310,338.1,14.3,0.87,8.530,339.4
+16.4,0.87,6.060,354.0,16.2,0.87,6.140,354.8
+18.1,0.87,8.580,9.5,17.9,0.87,8.740,9.3
+19.1,0.87,12.380,7.1,18.8,0.87,12.630,7.1
+19.5,0.87,11.990,11.3,19.3,0.87,12.230,11.3
+20.0,0.87,11.820,10.1,19.7,0.87,12.050,10.0
+19.6,0.87,12.010,347.9,19.4,0.87,12.190,348.5
+18.8,0.87,11.330,351.9,18.6,0.87,11.560,352.2
+19.3,0.87,12.490,3.6,19.1,0.87,12.780,3.7
+18.7,0.87,10.260,15.1,18.5,0.87,10.720,14.9
+18.4,0.87,9.080,359.0,18.4,0.87,10.140,359.8
+18.0,0.87,9.160,9.6,18.0,0.87,9.970,12.2
+17.1,0.87,8.230,27.8,17.1,0.87,9.410,30.3
+16.3,0.87,7.970,21.2,16.3,0.87,9.140,24.3
+15.2,0.87,9.140,25.9,15.1,0.87,10.780,30.6
+14.5,0.87,9.010,23.9,14.5,0.87,10.010,27.9
+13.7,0.87,9.040,24.8,13.8,0.87,10.170,29.2
+12.1,0.87,4.840,4.0,12.4,0.87,6.150,14.8
+12.1,0.87,4.060,12.2,12.2,0.87,4.620,20.4
+11.3,0.87,2.210,346.1,11.3,0.87,2.390,356.9
+11.1,0.87,2.990,323.5,11.1,0.87,2.910,330.9
+11.1,0.87,4.050,314.3,11.0,0.87,3.860,314.9
+11.3,0.87,3.250,325.3,11.4,0.87,3.060,323.5
+11.3,0.87,2.420,316.8,11.5,0.87,2.300,322.2
+12.2,0.87,2.280,292.8,12.1,0.87,2.270,291.5
+14.3,0.87,1.760,293.4,14.1,0.87,1.770,291.8
+15.8,0.87,2.130,278.7,15.5,0.87,2.160,277.7
+17.2,0.87,1.500,267.3,17.0,0.87,1.540,266.2
+18.7,0.87,2.770,253.0,18.4,0.87,2.820,252.8
+19.8,0.87,3.200,232.2,19.6,0.87,3.250,232.5
+20.7,0.87,3.830,220.1,20.5,0.87,3.880,220.6
+21.3,0.87,4.090,215.4,21.1,0.87,4.140,216.1
+21.8,0.87,4.150,200.9,21.6,0.87,4.220,201.7
+21.6,0.87,5.980,176.8,21.4,0.87,6.120,177.4
+20.1,0.87,8.520,152.5,20.0,0.87,8.850,154.0
+18.0,0.87,10.680,148.4,18.2,0.87,11.040,151.3
+17.0,0.87,10.870,152.0,17.2,0.87,11.460,153.9
+16.6,0.87,10.660,161.3,16.9,0.87,11.320,164.6
+16.0,0.87,10.760,167.8,16.2,0.87,11.490,171.3
+15.6,0.87,11.190,177.2,15.8,0.87,12.130,180.3
+15.2,0.87,12.230,181.6,15.4,0.87,13.280,183.7
+14.8,0.87,12.940,192.8,15.0,0.87,14.030,194.5
+14.6,0.87,12.560,193.3,14.8,0.87,13.710,195.6
+14.4,0.86,13.410,196.9,14.7,0.86,14.580,199.0
+14.2,0.86,13.950,199.8,14.5,0.86,15.170,201.7
+14.2,0.86,14.270,202.7,14.6,0.86,15.430,204.5
+14.0,0.86,14.180,203.1,14.3,0.86,15.320,205.0
+14.0,0.86,13.580,203.6,14.2,0.86,14.430,204.8
+15.3,0.86,10.980,200.9,15.2,0.86,11.290,201.6
+17.6,0.86,9.340,195.2,17.4,0.86,9.440,195.5
+19.9,0.86,7.470,194.4,19.6,0.86,7.570,194.6
+21.9,0.86,6.520,189.5,21.7,0.86,6.610,189.6
+23.6,0.86,6.400,183.8,23.4,0.86,6.500,183.9
+24.8,0.86,7.090,176.6,24.6,0.86,7.220,176.9
+25.5,0.86,8.200,173.3,25.3,0.86,8.340,173.7
+25.9,0.86,8.260,174.6,25.7,0.86,8.430,175.0
+25.9,0.86,8.850,176.7,25.7,0.86,9.070,177.0
+25.2,0.86,8.420,173.2,25.1,0.86,8.890,173.9
+23.9,0.86,10.770,163.0,23.9,0.86,11.410,164.2
+22.5,0.87,12.180,162.9,22.6,0.87,13.100,163.7
+21.3,0.87,12.280,160.3,21.4,0.87,13.150,161.8
+20.5,0.87,12.680,165.0,20.7,0.87,13.760,167.0
+19.9,0.87,13.160,165.0,20.1,0.87,14.230,167.2
+19.2,0.87,13.280,167.5,19.5,0.87,14.390,170.4
+18.6,0.87,12.870,171.4,18.7,0.87,13.820,175.0
+17.0,0.87,11.450,178.4,17.2,0.87,11.880,184.5
+19.1,0.87,7.110,262.5,19.3,0.87,7.320,279.6
+15.2,0.87,6.920,322.9,15.4,0.87,8.120,321.0
+14.6,0.87,14.930,348.2,14.5,0.87,15.650,350.0
+11.1,0.87,16.650,13.2,10.9,0.87,17.400,13.7
+10.0,0.87,15.510,15.1,9.8,0.87,16.260,15.7
+9.6,0.87,12.130,15.6,9.3,0.87,12.410,15.6
+9.3,0.87,11.970,19.0,9.1,0.87,12.200,19.1
+9.9,0.87,11.130,22.3,9.7,0.87,11.340,22.3
+10.9,0.87,10.460,23.6,10.7,0.87,10.620,23.6
+12.0,0.87,9.060,26.7,11.8,0.87,9.180,26.7
+13.2,0.87,7.560,29.7,13.0,0.87,7.650,29.7
+14.2,0.87,6.340,31.6,14.0,0.87,6.400,31.8
+15.1,0.87,5.250,32.8,14.9,0.87,5.310,33.3
+15.4,0.87,3.950,52.9,15.2,0.87,3.970,53.0
+15.7,0.87,3.770,57.6,15.5,0.87,3.820,58.6
+15.8,0.87,3.200,93.9,15.7,0.87,3.290,95.4
+15.3,0.87,4.120,97.7,15.2,0.87,4.280,98.8
+14.4,0.87,6.510,109.2,14.3,0.87,6.840,109.2
+12.8,0.87,7.910,117.4,12.6,0.87,8.450,117.8
+11.9,0.87,6.860,129.0,11.8,0.87,7.330,129.3
+11.4,0.87,7.360,127.5,11.3,0.87,8.010,126.1
+10.9,0.87,6.350,117.2,10.8,0.87,6.940,116.2
+10.6,0.87,5.820,115.4,10.4,0.87,6.180,115.2
+10.1,0.87,5.060,99.7,9.9,0.87,5.580,99.8
+9.8,0.87,4.440,96.1,9.6,0.87,4.880,97.4
+9.0,0.87,4.230,96.5,8.8,0.87,4.550,98.2
+8.5,0.87,4.240,95.3,8.3,0.87,4.540,96.2
+7.8,0.87,3.970,86.4,7.7,0.87,4.220,89.3
+6.6,0.87,4.650,71.6,6.5,0.87,4.990,75.9
+6.1,0.87,3.360,66.0,6.0,0.87,3.780,72.7
+6.9,0.87,3.380,80.9,6.7,0.87,3.400,83.6
+7.9,0.87,3.320,90.1,7.7,0.87,3.370,91.1
+8.6,0.87,3.160,83.4,8.3,0.87,3.180,84.4
+9.1,0.87,3.120,81.7,8.9,0.87,3.150,82.4
+9.2,0.87,4.200,78.2,9.0,0.87,4.220,79.0
+9.2,0.87,4.940,76.9,9.0,0.87,4.980,77.7
+9.2,0.87,5.140,68.9,9.0,0.87,5.180,69.6
+9.2,0.87,5.840,73.7,9.0,0.87,5.890,74.4
+8.8,0.87,6.700,73.7,8.6,0.87,6.800,74.2
+8.3,0.87,7.450,77.9,8.0,0.87,7.590,78.4
+7.4,0.87,8.170,74.9,7.2,0.87,8.320,75.4
+7.0,0.87,7.960,76.0,6.8,0.87,8.110,76.3
+6.6,0.87,7.650,67.5,6.4,0.87,7.770,68.0
+6.2,0.87,7.660,62.6,6.0,0.87,7.800,62.9
+5.9,0.87,7.370,62.0,5.7,0.87,7.510,62.3
+5.6,0.87,7.650,62.5,5.4,0.87,7.790,62.7
+5.4,0.87,6.920,63.4,5.2,0.87,7.040,63.6
+4.9,0.87,6.540,56.5,4.7,0.87,6.630,57.0
+4.6,0.87,6.160,54.8,4.4,0.87,6.260,55.1
+4.5,0.87,6.150,60.7,4.3,0.87,6.250,61.1
+4.4,0.87,5.490,68.0,4.2,0.87,5.570,68.2
+4.2,0.87,5.470,71.8,4.0,0.87,5.550,72.3
+4.1,0.87,5.630,83.3,3.9,0.87,5.710,83.5
+3.9,0.87,4.710,86.4,3.7,0.87,4.790,86.8
+3.6,0.87,4.790,84.8,3.4,0.87,4.850,85.4
+3.4,0.87,4.370,77.3,3.2,0.87,4.420,78.1
+3.5,0.87,4.110,80.9,3.2,0.87,4.170,81.5
+3.4,0.87,4.020,74.2,3.2,0.87,4.060,75.0
+3.4,0.87,3.930,67.8,3.2,0.87,3.960,68.5
+3.3,0.87,4.490,66.6,3.1,0.87,4.520,67.1
+3.4,0.87,4.580,70.5,3.2,0.87,4.630,70.8
+3.3,0.87,5.530,65.8,3.1,0.87,5.580,66.0
+3.1,0.87,5.520,68.7,2.9,0.87,5.560,68.8
+2.8,0.87,5.320,68.5,2.6,0.87,5.380,68.5
+2.7,0.87,5.490,65.7,2.5,0.87,5.550,65.7
+2.4,0.87,5.980,61.2,2.2,0.87,6.050,61.4
+2.2,0.87,5.840,56.9,2.0,0.87,5.900,57.1
+1.5,0.88,5.090,56.4,1.3,0.88,5.310,58.3
+1.0,0.88,4.680,76.7,0.8,0.88,4.750,76.9
+1.0,0.88,2.490,41.2,0.8,0.88,2.490,44.6
+0.9,0.88,2.820,52.7,0.7,0.88,3.340,58.6
+0.9,0.88,3.490,68.5,0.7,0.88,3.750,69.9
+0.6,0.88,2.000,36.2,0.5,0.88,2.050,38.8
+0.3,0.88,1.930,36.3,0.1,0.88,1.970,40.2
+0.4,0.88,1.830,72.0,0.2,0.88,1.840,73.2
+0.7,0.88,2.140,99.1,0.5,0.88,2.210,99.3
+0.5,0.88,2.380,120.5,0.3,0.88,2.380,119.1
+0.2,0.88,3.160,131.1,0.1,0.88,3.320,128.5
+0.3,0.88,3.030,138.7,0.1,0.88,3.100,137.9
+0.5,0.88,2.810,143.1,0.3,0.88,2.860,142.8
+0.9,0.87,2.250,156.0,0.7,0.87,2.270,155.6
+1.5,0.87,2.000,175.9,1.3,0.87,2.020,176.1
+2.2,0.87,1.790,203.5,1.9,0.87,1.800,203.6
+2.4,0.87,2.790,213.1,2.1,0.87,2.820,213.2
+2.8,0.87,2.040,215.7,2.6,0.87,2.060,216.3
+3.3,0.87,2.720,189.8,3.1,0.87,2.740,190.2
+3.8,0.87,3.870,198.9,3.6,0.87,3.890,199.0
+3.8,0.87,4.530,188.2,3.6,0.87,4.590,188.9
+3.5,0.87,6.100,186.9,3.4,0.87,6.110,189.4
+3.1,0.87,7.410,179.4,3.2,0.87,7.090,182.6
+2.9,0.87,7.700,187.9,3.2,0.87,7.210,189.3
+3.4,0.87,7.910,190.0,3.7,0.87,7.330,189.1
+3.5,0.87,8.300,193.4,4.0,0.87,7.850,193.0
+3.1,0.87,8.890,207.1,3.7,0.87,8.340,204.2
+3.0,0.87,9.310,214.8,3.6,0.87,9.240,210.7
+3.1,0.87,10.420,225.4,3.8,0.87,10.380,223.0
+4.2,0.87,9.650,228.1,4.9,0.87,9.440,226.0
+4.3,0.87,9.910,228.1,5.0,0.87,9.550,225.8
+3.8,0.87,10.780,227.2,4.6,0.87,10.650,225.5
+4.1,0.87,11.080,227.0,5.0,0.87,11.120,225.8
+4.4,0.87,11.090,229.3,5.3,0.87,11.220,228.2
+4.3,0.87,9.360,231.3,4.9,0.87,10.030,232.3
+5.6,0.87,5.750,219.9,6.1,0.87,7.010,223.5
+8.3,0.87,5.420,204.9,8.1,0.87,5.510,206.0
+10.8,0.87,7.190,202.5,10.6,0.87,7.310,202.9
+12.5,0.87,7.720,204.7,12.2,0.87,7.850,204.9
+14.5,0.87,8.020,200.5,14.3,0.87,8.160,200.8
+16.0,0.87,8.040,205.1,15.8,0.87,8.200,205.3
+17.3,0.87,8.150,211.2,17.1,0.87,8.320,211.5
+18.3,0.87,8.040,210.3,18.1,0.87,8.200,210.6
+18.4,0.87,8.170,199.0,18.2,0.87,8.340,199.4
+17.9,0.87,9.710,184.5,17.8,0.87,10.260,185.7
+16.8,0.87,12.170,181.4,16.9,0.87,12.970,182.9
+15.5,0.87,13.140,182.4,15.7,0.87,14.110,184.3
+14.2,0.86,13.570,191.2,14.5,0.86,14.710,192.9
+13.8,0.86,14.130,206.0,14.1,0.86,15.380,208.2
+13.2,0.86,12.250,203.4,13.7,0.86,13.510,208.0
+13.6,0.86,12.500,215.2,14.4,0.86,13.600,219.9
+14.8,0.86,14.290,230.9,15.6,0.86,15.680,234.9
+14.6,0.86,13.680,239.3,15.7,0.86,15.030,244.7
+16.5,0.86,12.790,253.5,18.8,0.86,13.970,262.3
+17.1,0.86,12.450,259.8,19.0,0.86,13.240,266.8
+16.6,0.86,11.470,267.5,18.0,0.86,12.570,273.4
+17.6,0.86,11.620,272.1,18.8,0.86,12.650,276.3
+17.7,0.86,11.490,285.4,18.3,0.86,12.640,286.2
+16.6,0.86,11.030,294.3,17.1,0.86,12.390,295.0
+17.7,0.87,10.450,297.0,17.9,0.87,11.330,296.8
+19.4,0.87,8.380,308.0,19.3,0.87,8.600,307.3
+21.1,0.87,8.090,313.7,20.9,0.87,8.190,313.5
+22.6,0.87,6.820,322.2,22.4,0.87,6.900,322.1
+22.9,0.87,5.720,348.4,22.7,0.87,5.780,348.0
+23.2,0.87,3.230,5.8,23.0,0.87,3.250,5.3
+23.8,0.87,2.440,27.5,23.5,0.87,2.450,27.1
+24.0,0.87,3.830,54.1,23.8,0.87,3.810,54.1
+23.4,0.87,6.990,61.0,23.2,0.87,7.060,61.1
+21.6,0.87,8.310,67.9,21.5,0.87,8.730,68.0
+19.1,0.87,9.720,69.9,19.0,0.87,10.650,70.0
+17.0,0.87,9.350,71.6,16.9,0.87,10.300,72.1
+15.1,0.87,9.290,76.4,15.0,0.87,10.380,76.8
+13.3,0.87,8.540,71.6,13.2,0.87,9.830,72.6
+11.8,0.87,7.800,63.5,11.8,0.87,9.050,65.4
+10.7,0.87,6.080,58.8,10.6,0.87,7.180,61.3
+9.7,0.87,6.680,62.6,9.6,0.87,8.190,65.9
+8.8,0.87,6.390,65.1,8.7,0.87,7.840,68.0
+8.0,0.87,6.390,68.7,8.0,0.87,7.820,71.0
+7.4,0.87,5.710,63.3,7.4,0.87,7.420,67.9
+6.8,0.87,4.330,50.4,6.7,0.87,5.740,59.3
+6.4,0.87,4.400,62.4,6.4,0.87,5.920,69.5
+6.1,0.87,4.770,78.5,6.0,0.87,6.130,82.1
+5.9,0.87,5.730,87.9,5.8,0.87,6.390,88.6
+7.0,0.87,3.850,93.5,6.8,0.87,3.950,94.5
+8.7,0.87,3.680,103.0,8.5,0.87,3.730,103.2
+10.6,0.87,3.410,125.0,10.4,0.87,3.460,125.3
+12.5,0.87,2.900,134.8,12.2,0.87,2.940,135.3
+14.0,0.87,4.380,159.1,13.8,0.87,4.440,159.2
+14.9,0.87,5.100,167.5,14.7,0.87,5.160,167.6
+15.8,0.87,5.560,165.0,15.6,0.87,5.660,165.6
+16.6,0.87,6.290,177.1,16.4,0.87,6.380,177.2
+16.7,0.87,6.660,167.5,16.5,0.87,6.760,168.1
+14.8,0.87,8.750,167.2,14.6,0.87,9.090,167.5
+12.1,0.87,9.280,165.7,12.0,0.87,9.860,166.6
+11.1,0.87,10.010,170.6,10.9,0.87,10.670,171.1
+11.2,0.87,9.850,170.7,11.1,0.87,10.490,171.5
+11.3,0.87,9.430,178.1,11.3,0.87,10.180,178.8
+11.0,0.87,10.190,180.3,11.0,0.87,11.050,181.8
+11.0,0.87,9.840,185.0,11.0,0.87,10.850,186.7
+11.0,0.87,9.810,191.0,11.0,0.87,10.760,193.2
+10.7,0.87,8.870,199.1,10.6,0.87,9.870,201.1
+11.4,0.87,12.970,213.3,11.4,0.87,13.890,214.0
+13.2,0.87,14.520,214.0,13.1,0.87,15.150,214.4
+14.1,0.87,13.740,217.1,14.0,0.87,14.380,217.6
+14.5,0.87,11.210,218.7,14.3,0.87,12.050,219.4
+15.0,0.87,7.200,218.1,14.9,0.87,8.300,219.3
+15.4,0.87,6.490,215.2,15.2,0.87,7.350,216.1
+16.3,0.87,9.460,226.0,16.1,0.87,9.950,226.2
+17.1,0.87,8.790,219.4,16.9,0.87,9.010,219.7
+18.9,0.87,8.110,216.4,18.7,0.87,8.270,216.5
+20.6,0.87,7.800,212.6,20.4,0.87,7.950,212.9
+21.4,0.87,7.760,206.3,21.2,0.87,7.900,206.5
+22.6,0.87,7.980,209.7,22.3,0.87,8.120,209.8
+23.3,0.87,8.130,208.6,23.1,0.87,8.290,208.7
+23.7,0.87,7.980,200.1,23.5,0.87,8.150,200.3
+23.9,0.87,8.940,199.4,23.7,0.87,9.150,199.5
+23.2,0.87,7.810,191.0,23.1,0.87,8.370,191.9
+22.5,0.87,8.470,177.0,22.5,0.87,9.280,179.4
+21.8,0.87,9.740,178.2,21.9,0.87,10.770,179.6
+20.9,0.87,10.240,175.7,20.9,0.87,11.170,176.9
+20.5,0.87,10.310,177.6,20.5,0.87,11.300,179.3
+20.2,0.87,9.520,173.7,20.3,0.87,10.510,176.3
+20.0,0.87,10.160,181.6,20.1,0.87,11.210,184.7
+19.6,0.87,11.930,192.2,19.7,0.87,13.070,194.8
+19.2,0.87,12.420,204.3,19.4,0.87,13.660,205.8
+19.0,0.87,12.620,213.0,19.2,0.87,13.940,214.2
+18.8,0.87,12.500,217.6,19.0,0.87,13.810,218.4
+17.6,0.87,3.960,253.6,17.6,0.87,6.430,231.7
+16.8,0.87,2.860,249.8,16.8,0.87,3.680,246.3
+17.4,0.87,3.520,280.4,17.4,0.87,4.020,274.6
+17.1,0.87,2.030,295.2,17.2,0.87,2.530,291.2
+17.5,0.87,0.330,289.6,17.3,0.87,0.400,280.4
+18.9,0.87,2.280,200.9,18.7,0.87,2.340,201.2
+20.1,0.87,2.960,172.5,19.9,0.87,3.020,172.7
+21.3,0.87,6.240,187.6,21.1,0.87,6.380,187.7
+19.5,0.87,7.840,129.2,19.3,0.87,7.920,129.7
+22.8,0.87,10.710,162.3,22.6,0.87,10.960,162.5
+22.5,0.87,10.740,169.1,22.3,0.87,10.990,168.9
+21.7,0.87,10.420,159.4,21.5,0.87,10.640,159.5
+22.6,0.87,11.690,159.1,22.4,0.87,12.020,159.3
+22.6,0.87,10.840,158.1,22.4,0.87,11.410,158.4
+22.1,0.87,12.350,159.3,22.0,0.87,13.210,159.5
+21.5,0.87,13.870,157.2,21.4,0.87,14.800,157.3
+20.7,0.87,13.150,156.2,20.7,0.87,14.030,156.8
+19.9,0.87,13.530,155.9,19.9,0.87,14.460,156.7
+19.4,0.87,12.840,162.2,19.3,0.87,13.710,163.0
+19.2,0.87,14.120,168.1,19.1,0.87,15.050,168.6
+18.8,0.87,14.610,179.3,18.6,0.87,15.340,179.7
+18.5,0.87,15.010,186.3,18.3,0.87,15.650,186.6
+18.8,0.87,13.590,193.8,18.7,0.87,14.320,194.1
+19.2,0.87,12.820,196.9,19.0,0.87,13.370,197.2
+19.2,0.87,14.890,195.6,19.1,0.87,15.590,196.1
+18.9,0.87,13.180,211.3,18.9,0.87,13.940,212.0
+18.2,0.87,10.010,237.7,18.2,0.87,10.890,237.7
+17.2,0.87,10.310,248.7,17.2,0.87,11.070,251.0
+16.9,0.87,8.660,259.1,16.7,0.87,8.820,259.4
+18.0,0.87,8.070,257.4,17.8,0.87,8.230,257.7
+19.2,0.86,9.880,259.6,19.0,0.86,10.060,259.4
+19.4,0.86,10.680,264.8,19.2,0.86,10.860,264.6
+19.5,0.86,11.390,260.7,19.3,0.86,11.590,260.6
+19.7,0.86,11.600,270.9,19.5,0.86,11.790,270.9
+19.8,0.86,10.540,277.4,19.5,0.86,10.750,277.2
+20.0,0.86,9.880,272.1,19.8,0.86,10.130,272.0
+20.3,0.86,11.200,279.1,20.1,0.86,11.490,279.0
+19.8,0.86,8.980,281.7,19.7,0.86,9.850,281.5
+19.8,0.86,10.270,272.2,19.8,0.86,10.920,273.5
+19.1,0.86,11.670,267.2,19.4,0.86,12.540,269.5
+18.3,0.87,12.910,294.0,18.4,0.87,14.140,300.5
+16.7,0.87,10.580,309.4,16.7,0.87,11.360,313.0
+14.8,0.87,11.290,316.6,14.8,0.87,12.450,319.8
+14.7,0.87,12.400,323.2,14.6,0.87,13.370,324.3
+13.6,0.87,13.640,320.0,13.6,0.87,14.430,321.6
+13.3,0.87,13.450,315.5,13.3,0.87,14.330,317.4
+13.1,0.87,13.710,315.5,13.1,0.87,14.540,317.4
+13.0,0.87,12.740,311.0,13.1,0.87,13.680,313.9
+12.8,0.87,11.640,310.6,13.0,0.87,12.560,314.6
+12.6,0.87,11.330,313.4,12.8,0.87,12.190,318.5
+12.2,0.87,10.780,318.4,12.4,0.87,11.510,324.9
+11.4,0.87,9.850,324.6,11.6,0.87,10.520,329.9
+12.2,0.87,4.550,339.2,12.0,0.87,4.690,340.4
+13.8,0.87,4.380,351.9,13.7,0.87,4.450,352.4
+15.5,0.87,4.830,2.2,15.3,0.87,4.910,2.5
+17.1,0.87,5.730,4.1,16.8,0.87,5.820,4.1
+18.1,0.87,6.430,358.5,17.9,0.87,6.520,358.5
+18.9,0.87,5.410,4.0,18.7,0.87,5.470,3.7
+19.4,0.87,4.360,8.4,19.2,0.87,4.400,8.3
+19.7,0.87,3.250,11.7,19.5,0.87,3.270,11.5
+19.8,0.87,2.500,26.2,19.6,0.87,2.510,25.6
+19.6,0.87,2.390,52.8,19.4,0.87,2.380,52.1
+19.3,0.87,2.540,60.8,19.2,0.87,2.490,59.3
+19.1,0.87,1.940,104.9,19.0,0.87,1.910,103.1
+19.0,0.87,2.470,136.8,18.8,0.87,2.380,137.3
+18.7,0.87,3.460,156.3,18.6,0.87,3.390,158.5
+18.0,0.87,4.620,166.8,18.1,0.87,4.600,166.6
+17.4,0.87,5.830,187.9,17.7,0.87,5.960,185.1
+17.2,0.87,7.150,195.1,17.6,0.87,7.320,193.2
+17.0,0.87,7.930,197.2,17.4,0.87,8.160,196.9
+16.3,0.87,8.990,206.6,16.9,0.87,9.200,206.1
+15.6,0.87,10.130,215.8,16.3,0.87,10.370,214.5
+15.5,0.87,11.410,221.8,16.2,0.87,11.800,220.9
+15.0,0.87,12.250,228.4,15.8,0.87,12.870,228.0
+14.5,0.87,13.170,229.1,15.4,0.87,14.150,229.3
+14.2,0.87,12.890,233.7,14.8,0.87,13.960,234.0
+15.0,0.87,9.970,229.4,15.0,0.87,10.840,230.5
+17.4,0.87,9.090,226.2,17.2,0.87,9.280,226.8
+19.7,0.87,9.450,227.6,19.5,0.87,9.650,227.9
+21.2,0.87,9.590,227.6,20.9,0.87,9.770,227.8
+22.1,0.87,9.230,228.1,21.9,0.87,9.410,228.3
+22.8,0.87,9.310,224.7,22.6,0.87,9.490,224.9
+23.1,0.87,9.530,221.6,22.9,0.87,9.720,221.8
+23.2,0.87,9.110,217.7,23.0,0.87,9.320,217.9
+23.0,0.87,10.000,212.7,22.8,0.87,10.240,213.0
+22.5,0.87,9.340,206.2,22.4,0.87,9.980,207.6
+21.6,0.87,10.650,197.6,21.7,0.87,11.340,199.6
+20.1,0.87,12.580,195.5,20.4,0.87,13.700,197.1
+19.1,0.87,13.780,200.9,19.4,0.87,15.110,202.2
+18.3,0.87,13.950,205.9,18.7,0.87,15.390,206.8
+18.0,0.86,14.350,208.6,18.3,0.86,15.750,209.5
+17.4,0.86,14.380,211.5,17.8,0.86,15.790,212.2
+17.0,0.86,14.660,213.6,17.4,0.86,16.090,215.1
+16.3,0.86,14.240,216.8,16.6,0.86,15.640,218.6
+15.8,0.86,14.430,224.1,16.2,0.86,15.770,225.8
+15.3,0.86,14.770,227.8,15.8,0.86,16.090,229.6
+14.4,0.86,12.830,238.1,14.9,0.86,14.160,240.6
+14.1,0.86,11.880,244.4,15.0,0.86,12.620,251.7
+14.8,0.86,9.230,282.2,15.4,0.86,9.910,293.7
+13.8,0.86,8.680,302.4,14.3,0.86,9.570,306.7
+14.3,0.86,7.530,317.5,14.6,0.86,8.360,319.4
+16.1,0.86,6.320,332.7,15.9,0.86,6.330,333.1
+18.4,0.86,5.250,334.5,18.2,0.86,5.250,334.8
+20.4,0.86,4.460,347.5,20.2,0.86,4.490,347.8
+21.9,0.86,3.240,353.5,21.7,0.86,3.260,353.6
+22.9,0.86,2.680,343.4,22.7,0.86,2.690,343.0
+23.8,0.86,1.790,315.5,23.6,0.86,1.800,314.4
+24.4,0.86,2.520,275.4,24.2,0.86,2.560,274.3
+24.7,0.86,3.070,256.9,24.5,0.86,3.170,256.0
+24.7,0.86,3.490,241.5,24.5,0.86,3.670,241.7
+24.6,0.86,6.380,235.0,24.5,0.86,6.620,237.5
+24.6,0.86,6.640,246.6,24.4,0.86,6.670,247.4
+22.8,0.86,9.110,218.2,23.4,0.86,9.340,221.9
+22.0,0.86,13.020,228.8,22.9,0.86,14.170,230.0
+20.8,0.86,14.310,254.7,21.1,0.86,15.690,258.2
+22.1,0.86,12.860,274.9,22.4,0.86,14.160,277.6
+21.9,0.86,17.150,276.9,22.1,0.86,18.470,278.5
+21.9,0.86,16.070,287.3,22.0,0.86,17.430,288.2
+21.1,0.86,15.350,289.2,21.3,0.86,16.630,290.6
+20.5,0.86,15.050,299.7,20.7,0.86,15.980,301.3
+18.8,0.86,13.540,318.7,19.0,0.86,14.310,320.2
+18.1,0.86,11.730,336.5,18.0,0.86,12.630,341.4
+17.3,0.86,11.840,337.2,17.2,0.86,12.900,342.0
+16.1,0.86,12.990,347.2,16.0,0.86,14.970,352.9
+15.5,0.86,9.550,348.2,15.3,0.86,9.870,349.3
+15.2,0.86,11.470,5.6,15.0,0.86,11.710,5.6
+15.4,0.86,10.760,5.9,15.2,0.86,10.950,5.9
+15.8,0.86,9.560,7.3,15.6,0.86,9.730,7.2
+16.0,0.86,10.150,6.3,15.8,0.86,10.300,6.3
+16.5,0.86,7.750,7.6,16.3,0.86,7.880,7.4
+17.2,0.86,6.280,6.4,16.9,0.86,6.390,6.1
+17.8,0.86,7.170,5.7,17.6,0.86,7.280,5.6
+17.1,0.86,6.570,28.7,16.9,0.86,6.660,28.4
+16.2,0.86,6.900,38.4,16.0,0.86,7.190,37.7
+15.1,0.86,8.810,42.2,14.9,0.86,9.230,41.4
+14.2,0.86,9.330,52.9,14.1,0.86,9.570,49.9
+13.2,0.86,10.590,53.1,13.2,0.86,11.260,52.0
+12.6,0.87,8.610,62.3,12.6,0.87,9.160,60.8
+11.6,0.87,10.100,57.4,11.7,0.87,11.270,55.6
+10.8,0.87,8.810,55.5,11.0,0.87,10.160,55.2
+10.1,0.87,7.310,61.4,10.4,0.87,8.590,62.2
+9.9,0.87,6.390,67.6,10.3,0.87,7.260,69.3
+9.5,0.87,3.040,77.4,9.8,0.87,3.630,78.7
+8.9,0.87,1.980,48.9,9.1,0.87,2.280,54.9
+7.0,0.87,3.090,17.3,7.3,0.87,3.280,23.2
+6.6,0.87,2.630,354.3,7.1,0.87,2.700,4.8
+6.0,0.87,3.370,351.0,6.5,0.87,3.330,358.0
+5.2,0.87,3.490,6.6,5.5,0.87,3.920,11.4
+5.3,0.87,4.120,55.6,5.6,0.87,5.110,56.5
+7.6,0.87,5.070,40.5,7.4,0.87,5.130,40.6
+9.0,0.87,3.970,38.1,8.8,0.87,4.000,38.5
+10.5,0.87,2.250,34.9,10.3,0.87,2.240,35.5
+11.9,0.87,1.080,5.1,11.7,0.87,1.040,5.4
+13.1,0.87,1.490,296.3,12.9,0.87,1.490,293.8
+14.2,0.87,1.670,297.1,14.0,0.87,1.670,294.1
+15.1,0.87,1.220,317.4,14.9,0.87,1.220,312.9
+15.5,0.87,1.450,342.1,15.3,0.87,1.420,337.9
+15.0,0.87,1.870,38.6,14.9,0.87,1.620,34.5
+14.8,0.87,1.360,46.6,14.7,0.87,1.160,49.7
+14.3,0.87,1.750,59.0,14.3,0.87,1.650,61.5
+14.1,0.87,1.730,76.6,14.2,0.87,1.570,77.7
+14.3,0.87,1.390,88.0,14.4,0.87,1.210,93.8
+14.1,0.87,1.340,92.8,14.3,0.87,1.130,97.9
+14.1,0.87,1.080,115.7,14.2,0.87,0.900,107.1
+14.2,0.87,1.850,92.5,14.2,0.87,1.850,85.1
+13.9,0.87,1.970,78.2,14.0,0.87,2.170,71.1
+13.5,0.87,1.780,80.8,13.7,0.87,2.000,74.5
+12.6,0.87,0.970,95.2,12.8,0.87,1.300,80.9
+10.1,0.87,1.610,24.9,10.6,0.87,1.720,36.2
+8.9,0.87,1.910,356.0,9.6,0.87,1.910,8.5
+9.0,0.87,0.980,273.9,9.6,0.87,0.660,243.7
+10.1,0.87,0.360,219.4,10.5,0.87,0.560,201.3
+10.7,0.87,0.510,222.1,11.2,0.87,0.840,206.9
+12.0,0.87,0.800,246.3,11.8,0.87,0.960,236.9
+15.2,0.87,1.850,210.3,15.0,0.87,1.990,209.8
+17.3,0.87,4.490,219.9,17.0,0.87,4.570,220.2
+18.8,0.87,5.460,228.5,18.6,0.87,5.550,228.8
+19.9,0.87,5.950,227.5,19.7,0.87,6.050,227.8
+20.8,0.87,6.020,233.2,20.6,0.87,6.130,233.3
+21.5,0.87,6.070,228.1,21.3,0.87,6.180,228.3
+21.7,0.87,6.170,219.3,21.5,0.87,6.310,219.6
+21.2,0.86,7.800,205.9,21.0,0.86,8.060,208.6
+20.8,0.86,8.200,197.5,20.7,0.86,8.280,199.1
+20.6,0.86,9.470,194.3,20.7,0.86,9.820,197.1
+19.1,0.86,10.830,196.1,19.5,0.86,11.680,199.1
+18.2,0.86,12.950,210.4,18.8,0.86,14.160,212.1
+17.7,0.86,12.490,219.9,18.5,0.86,12.890,222.6
+17.4,0.86,11.470,219.4,18.1,0.86,11.630,223.2
+17.8,0.86,12.120,223.6,18.7,0.86,12.870,227.3
+16.9,0.86,12.400,227.1,18.0,0.86,12.850,234.5
+15.2,0.86,10.890,242.6,16.8,0.86,11.280,256.9
+12.9,0.86,8.180,258.5,14.3,0.86,9.090,274.1
+14.5,0.86,6.840,284.5,15.6,0.86,7.610,291.7
+13.9,0.86,5.950,307.3,14.6,0.86,6.990,309.2
+15.9,0.86,11.230,307.9,16.3,0.86,11.620,310.5
+15.2,0.86,10.900,313.9,15.4,0.86,11.120,316.3
+14.8,0.86,7.830,314.4,15.1,0.86,8.560,315.2
+16.5,0.86,6.720,318.1,16.4,0.86,6.810,317.9
+18.3,0.86,6.100,319.1,18.1,0.86,6.140,318.8
+20.4,0.86,5.340,325.0,20.2,0.86,5.380,324.6
+22.0,0.86,4.050,334.2,21.8,0.86,4.070,333.6
+23.4,0.86,3.210,337.8,23.2,0.86,3.210,336.9
+24.4,0.86,1.650,338.4,24.2,0.86,1.630,336.3
+25.2,0.86,0.200,35.0,25.0,0.86,0.080,34.6
+25.6,0.86,1.050,77.2,25.4,0.86,0.970,84.2
+25.4,0.86,2.230,109.0,25.3,0.86,2.270,115.8
+24.9,0.86,3.360,182.9,25.2,0.86,3.480,189.2
+23.8,0.86,8.440,166.6,24.2,0.86,8.110,172.1
+23.1,0.86,8.420,196.1,23.9,0.86,9.260,202.9
+24.8,0.86,9.810,211.8,25.3,0.86,9.940,212.8
+23.0,0.86,12.150,222.0,24.0,0.86,13.150,225.0
+23.4,0.86,12.200,227.1,24.2,0.86,13.190,229.3
+20.5,0.86,13.260,229.6,21.6,0.86,14.500,235.0
+21.7,0.86,13.720,243.4,22.9,0.86,14.580,248.6
+21.7,0.86,12.900,248.7,23.0,0.86,13.930,253.7
+22.6,0.86,12.990,252.3,23.8,0.86,13.840,255.8
+23.3,0.86,13.660,251.1,23.9,0.86,14.110,252.2
+21.2,0.86,13.090,242.8,22.1,0.86,13.870,246.4
+20.4,0.86,13.300,246.9,21.6,0.86,13.520,249.8
+19.9,0.86,12.920,249.4,21.3,0.86,13.490,252.5
+19.9,0.86,8.160,255.2,20.0,0.86,9.010,256.8
+23.5,0.86,6.920,260.3,23.3,0.86,7.190,260.6
+25.1,0.86,9.410,254.3,24.9,0.86,9.610,254.8
+26.4,0.86,10.140,247.6,26.2,0.86,10.370,247.6
+26.8,0.86,11.520,242.4,26.6,0.86,11.760,242.4
+26.9,0.86,12.050,236.3,26.7,0.86,12.310,236.5
+26.7,0.86,12.790,235.3,26.5,0.86,13.080,235.4
+26.6,0.86,13.390,236.7,26.4,0.86,13.700,236.8
+26.1,0.86,11.380,226.3,25.9,0.86,11.740,226.5
+25.5,0.86,10.870,229.3,25.6,0.86,11.970,231.8
+23.7,0.86,12.220,223.5,24.0,0.86,13.200,226.8
+22.7,0.86,13.730,227.3,23.2,0.86,14.840,229.8
+21.3,0.86,13.190,236.2,21.9,0.86,14.370,238.9
+21.5,0.86,12.510,246.0,22.1,0.86,13.750,249.2
+21.2,0.86,12.380,243.8,21.9,0.86,13.440,249.2
+21.5,0.86,12.430,246.1,22.4,0.86,13.310,251.3
+22.2,0.86,11.610,259.2,22.6,0.86,12.240,260.7
+21.5,0.86,10.870,244.0,21.9,0.86,11.220,246.1
+21.0,0.86,11.350,237.8,21.3,0.86,11.910,240.0
+20.4,0.86,13.000,246.4,20.5,0.86,14.560,247.7
+19.1,0.86,12.630,237.5,19.2,0.86,13.840,238.0
+18.2,0.86,13.750,232.1,18.4,0.86,15.310,233.9
+17.7,0.86,13.860,243.7,18.3,0.86,14.900,244.6
+17.8,0.86,12.340,243.8,18.3,0.86,13.170,245.0
+17.2,0.86,7.760,220.2,17.1,0.86,8.350,222.8
+18.6,0.86,7.820,218.7,18.4,0.86,7.900,219.5
+20.1,0.86,7.040,216.7,19.9,0.86,7.150,217.1
+22.4,0.86,7.660,229.7,22.2,0.86,7.840,229.5
+23.8,0.86,8.890,234.8,23.6,0.86,9.080,234.7
+24.7,0.86,8.750,232.2,24.5,0.86,8.930,232.4
+25.2,0.86,8.230,227.4,24.9,0.86,8.400,227.7
+25.2,0.86,8.480,222.7,25.0,0.86,8.650,223.0
+25.1,0.86,9.430,224.3,24.9,0.86,9.660,224.5
+24.6,0.86,9.520,221.8,24.5,0.86,10.040,223.1
+23.5,0.86,11.980,220.8,23.6,0.86,12.760,222.0
+22.7,0.86,11.510,217.5,23.2,0.86,12.560,218.7
+22.3,0.86,12.100,217.8,22.8,0.86,13.040,219.2
+21.0,0.86,12.110,223.4,21.8,0.86,13.370,224.1
+19.8,0.86,11.980,230.3,20.4,0.86,13.150,229.4
+19.7,0.86,13.200,234.4,20.2,0.86,14.340,235.2
+20.3,0.86,13.460,237.2,21.0,0.86,14.630,239.3
+18.9,0.86,13.000,239.8,19.8,0.86,14.040,243.4
+20.4,0.86,14.810,253.7,21.1,0.86,15.760,254.9
+19.3,0.86,13.480,251.7,20.0,0.86,14.740,254.3
+16.5,0.86,10.670,230.5,17.6,0.86,12.020,239.6
+17.8,0.86,13.030,242.4,18.9,0.86,14.840,249.0
+17.0,0.86,12.960,235.2,18.3,0.86,14.270,241.3
+18.1,0.86,12.720,232.6,18.8,0.86,13.370,237.6
+16.9,0.86,9.460,227.2,17.1,0.86,10.210,231.9
+19.0,0.86,4.640,204.6,18.9,0.86,4.710,207.8
+23.2,0.86,5.690,247.8,23.0,0.86,5.850,248.4
+25.3,0.86,7.580,255.3,25.1,0.86,7.730,255.6
+26.3,0.86,7.510,248.3,26.1,0.86,7.650,248.5
+27.0,0.86,7.220,246.2,26.8,0.86,7.370,246.2
+27.7,0.86,6.280,230.1,27.5,0.86,6.430,230.5
+27.8,0.86,7.860,220.5,27.5,0.86,8.020,220.9
+27.2,0.86,7.320,191.6,27.0,0.86,7.570,192.1
+26.5,0.86,12.410,204.1,26.4,0.86,13.130,204.8
+25.8,0.86,12.870,198.3,26.1,0.86,13.630,199.0
+23.3,0.86,14.080,196.3,23.6,0.86,15.210,196.7
+22.2,0.86,13.920,197.5,22.5,0.86,15.170,197.7
+21.4,0.86,13.500,202.0,21.8,0.86,14.960,202.1
+20.9,0.86,13.400,206.5,21.3,0.86,14.810,207.0
+20.5,0.86,12.090,209.6,21.0,0.86,13.620,210.4
+19.8,0.86,12.820,212.5,20.5,0.86,14.490,212.6
+18.5,0.86,12.960,209.1,18.9,0.86,14.380,209.7
+17.2,0.86,13.230,216.0,17.5,0.86,14.620,216.9
+16.5,0.86,12.640,221.7,16.7,0.86,13.690,223.6
+15.9,0.86,12.060,220.2,16.2,0.86,13.050,222.7
+14.8,0.86,11.630,206.1,14.9,0.86,12.520,207.2
+15.5,0.86,11.560,209.0,15.4,0.86,12.090,209.9
+15.2,0.86,11.700,209.8,15.1,0.86,12.260,210.4
+15.7,0.86,10.720,212.2,15.5,0.86,11.110,212.6
+17.2,0.86,9.370,210.8,17.0,0.86,9.460,211.1
+19.0,0.86,9.910,203.3,18.8,0.86,10.020,203.4
+20.8,0.86,9.180,203.2,20.6,0.86,9.310,203.4
+22.7,0.86,8.300,200.8,22.5,0.86,8.450,201.1
+24.9,0.86,8.300,202.4,24.7,0.86,8.480,202.6
+26.3,0.86,9.140,205.6,26.1,0.86,9.360,205.8
+26.9,0.86,10.750,214.4,26.7,0.86,11.010,214.5
+26.4,0.86,10.360,188.0,26.2,0.86,10.680,188.3
+25.9,0.86,9.810,184.7,25.8,0.86,10.580,186.2
+24.6,0.86,10.070,192.5,24.7,0.86,11.300,193.8
+23.9,0.86,10.940,196.5,24.0,0.86,12.050,198.2
+22.8,0.86,11.220,189.1,23.0,0.86,12.170,191.9
+21.6,0.86,12.480,183.2,21.7,0.86,13.500,185.8
+20.4,0.86,10.530,212.2,20.6,0.86,11.700,216.7
+19.2,0.86,11.070,210.2,19.4,0.86,11.700,215.1
+18.8,0.86,8.760,224.5,19.3,0.86,9.140,235.4
+19.9,0.86,12.290,285.2,20.3,0.86,14.390,290.3
+14.1,0.86,12.980,354.1,13.5,0.86,13.720,359.2
+8.8,0.86,9.100,3.8,8.6,0.86,9.720,4.0
+7.7,0.87,10.070,355.2,7.5,0.87,10.780,356.3
+7.4,0.87,8.510,348.8,7.2,0.87,8.860,351.4
+6.9,0.87,10.510,354.3,6.8,0.87,11.540,358.1
+6.3,0.87,14.790,2.6,6.1,0.87,15.280,2.8
+5.9,0.87,13.000,0.1,5.7,0.87,13.220,0.5
+4.8,0.87,12.110,13.8,4.6,0.87,12.270,13.6
+5.1,0.87,10.690,6.3,4.9,0.87,10.850,6.3
+5.8,0.87,10.640,8.9,5.5,0.87,10.800,8.9
+6.9,0.87,9.540,12.5,6.6,0.87,9.680,12.5
+7.8,0.87,9.210,16.3,7.5,0.87,9.350,16.2
+8.3,0.87,8.540,23.5,8.1,0.87,8.660,23.4
+8.6,0.87,8.150,24.2,8.4,0.87,8.270,24.2
+8.5,0.87,7.630,36.1,8.3,0.87,7.750,35.9
+8.0,0.87,7.010,31.4,7.8,0.87,7.340,31.8
+7.4,0.87,6.590,46.1,7.2,0.87,7.230,47.4
+6.6,0.87,8.610,42.4,6.5,0.87,9.130,42.6
+5.9,0.87,8.100,44.4,5.9,0.87,8.740,46.0
+5.4,0.87,8.160,53.5,5.3,0.87,8.940,54.8
+4.8,0.87,7.550,55.5,4.8,0.87,8.400,57.8
+4.2,0.87,6.290,61.5,4.1,0.87,7.290,63.8
+3.4,0.87,5.060,54.0,3.4,0.87,6.020,56.9
+2.8,0.88,6.570,62.0,2.7,0.88,7.910,65.4
+2.2,0.88,6.090,60.3,2.2,0.88,7.460,64.0
+1.6,0.88,5.270,48.1,1.6,0.88,6.570,54.6
+0.8,0.88,5.140,44.8,0.8,0.88,6.180,50.5
+0.2,0.88,6.370,45.2,0.2,0.88,7.260,48.8
+-0.6,0.88,6.650,45.4,-0.6,0.88,7.740,50.0
+-1.2,0.88,7.170,40.6,-1.3,0.88,8.020,46.0
+-1.0,0.88,5.840,49.0,-1.2,0.88,5.950,49.3
+0.2,0.88,5.590,40.1,-0.0,0.88,5.670,40.2
+1.2,0.88,6.090,34.8,1.0,0.88,6.150,35.0
+2.3,0.88,6.070,27.1,2.0,0.88,6.130,27.3
+3.2,0.88,5.820,28.3,3.0,0.88,5.880,28.4
+4.2,0.88,5.420,24.9,4.0,0.88,5.470,25.1
+4.9,0.88,5.350,26.3,4.7,0.88,5.400,26.4
+5.3,0.88,4.900,30.3,5.1,0.88,4.950,30.3
+5.4,0.88,4.770,29.1,5.2,0.88,4.830,29.3
+5.2,0.88,4.820,33.6,5.0,0.88,4.980,34.5
+4.6,0.88,4.840,62.8,4.5,0.88,5.170,62.9
+4.5,0.88,5.220,75.0,4.3,0.88,4.980,72.8
+4.1,0.88,4.770,74.3,3.9,0.88,4.850,73.6
+3.8,0.88,3.900,79.0,3.6,0.88,3.950,78.5
+3.3,0.88,2.710,102.6,3.1,0.88,2.850,100.8
+2.5,0.88,2.690,123.9,2.5,0.88,2.870,119.7
+2.1,0.88,3.350,148.8,2.1,0.88,3.590,146.0
+1.9,0.88,4.000,153.6,1.9,0.88,4.110,151.2
+1.1,0.88,4.790,171.0,1.2,0.88,4.970,167.5
+0.8,0.88,5.350,177.1,1.0,0.88,5.500,174.5
+0.3,0.88,6.380,187.2,0.5,0.88,6.530,184.2
+0.4,0.88,6.370,182.8,0.7,0.88,6.590,181.0
+-0.5,0.88,6.840,187.5,-0.1,0.88,7.060,186.8
+0.0,0.87,7.500,191.5,0.3,0.87,7.660,191.0
+-0.3,0.87,7.300,191.9,0.1,0.87,8.230,191.6
+2.3,0.87,7.680,196.4,2.1,0.87,7.800,196.7
+4.4,0.87,6.750,203.1,4.1,0.87,6.860,203.6
+6.5,0.87,5.900,208.3,6.3,0.87,6.000,208.5
+7.8,0.87,5.620,208.2,7.6,0.87,5.710,208.5
+8.9,0.87,5.500,209.9,8.7,0.87,5.600,210.2
+10.0,0.87,5.630,212.5,9.8,0.87,5.740,212.8
+10.4,0.87,4.880,213.8,10.2,0.87,4.950,213.9
+10.6,0.87,4.890,192.3,10.4,0.87,4.980,192.9
+10.4,0.87,6.570,178.6,10.2,0.87,6.590,179.1
+6.6,0.87,10.710,140.4,6.7,0.87,11.160,141.5
+5.1,0.87,11.350,139.1,5.2,0.87,12.130,140.4
+5.3,0.87,11.470,151.0,5.9,0.87,11.850,153.3
+4.7,0.87,11.460,155.5,5.1,0.87,12.110,156.9
+4.4,0.87,11.070,158.4,4.8,0.87,11.650,161.9
+4.0,0.87,10.240,166.0,4.4,0.87,10.680,170.8
+4.0,0.87,10.040,180.4,4.5,0.87,10.520,183.8
+4.3,0.87,10.590,190.1,4.8,0.87,11.100,191.7
+4.1,0.87,11.010,197.1,4.6,0.87,11.560,197.8
+4.2,0.87,10.480,204.2,4.8,0.87,10.840,203.2
+4.1,0.87,10.330,205.8,4.6,0.87,10.680,204.6
+4.2,0.87,10.860,208.1,4.7,0.87,11.160,207.0
+4.3,0.87,11.010,210.5,4.8,0.87,11.050,208.6
+4.2,0.87,10.170,214.3,4.8,0.87,10.260,212.0
+4.2,0.87,7.220,213.6,4.5,0.87,8.310,213.3
+7.2,0.87,5.950,203.3,7.0,0.87,6.060,203.5
+9.5,0.87,5.810,195.5,9.3,0.87,5.920,195.6
+11.0,0.87,6.630,193.5,10.8,0.87,6.750,193.5
+12.3,0.87,6.850,195.2,12.1,0.87,6.970,195.3
+13.1,0.87,7.070,193.5,12.9,0.87,7.190,193.7
+13.7,0.87,7.220,195.3,13.5,0.87,7.360,195.5
+14.1,0.87,7.010,196.2,13.9,0.87,7.140,196.4
+14.1,0.87,7.350,190.0,13.9,0.87,7.510,190.4
+13.6,0.87,8.590,178.6,13.5,0.87,8.870,180.2
+12.8,0.87,9.550,174.7,12.8,0.87,9.970,176.5
+11.8,0.87,10.540,173.1,12.0,0.87,11.290,176.0
+10.2,0.87,12.460,175.4,10.4,0.87,13.500,176.8
+8.7,0.87,11.850,176.0,9.0,0.87,13.010,177.8
+8.0,0.87,12.590,183.1,8.2,0.87,13.760,184.2
+7.4,0.87,12.480,185.8,7.7,0.87,13.670,187.0
+7.2,0.87,12.680,191.6,7.6,0.87,13.870,192.5
+6.7,0.87,13.210,193.6,7.0,0.87,14.360,194.1
+6.7,0.87,13.850,197.7,7.2,0.87,14.990,198.1
+6.9,0.87,14.060,203.4,7.4,0.87,15.100,204.1
+6.9,0.87,13.610,205.6,7.4,0.87,14.660,207.0
+6.5,0.87,13.310,208.9,7.1,0.87,14.310,210.7
+6.0,0.87,13.420,209.8,6.7,0.87,14.390,211.3
+6.0,0.87,13.200,212.5,6.6,0.87,13.980,213.6
+6.8,0.87,10.830,212.9,7.4,0.87,11.880,214.1
+9.5,0.87,8.720,206.5,9.4,0.87,9.060,207.6
+12.0,0.87,7.870,202.3,11.8,0.87,7.990,202.7
+14.2,0.87,6.500,202.3,14.0,0.87,6.610,202.5
+15.8,0.87,6.180,200.5,15.6,0.87,6.280,200.7
+17.0,0.87,5.780,199.4,16.7,0.87,5.870,199.6
+17.8,0.87,5.530,195.1,17.5,0.87,5.620,195.3
+18.0,0.87,5.430,190.8,17.8,0.87,5.520,191.1
+17.9,0.87,5.950,182.5,17.7,0.87,6.060,182.9
+17.3,0.87,7.370,168.0,17.1,0.87,7.540,169.8
+14.7,0.87,9.230,147.7,14.8,0.87,9.030,152.1
+15.0,0.87,8.660,152.5,15.4,0.87,8.260,161.1
+15.1,0.87,7.390,167.3,15.4,0.87,7.170,172.0
+14.0,0.87,8.490,185.3,14.4,0.87,8.980,188.8
+13.5,0.87,8.930,191.7,14.0,0.87,9.060,194.2
+13.4,0.87,9.620,200.7,14.0,0.87,9.950,202.3
+13.2,0.87,10.120,201.3,13.8,0.87,10.010,202.4
+13.2,0.87,9.140,203.8,13.7,0.87,9.170,203.8
+13.6,0.87,8.120,210.4,14.2,0.87,8.100,209.5
+11.6,0.87,4.200,227.1,12.5,0.87,4.400,224.0
+12.4,0.87,2.780,253.2,13.2,0.87,2.700,251.0
+11.2,0.87,3.230,336.3,11.7,0.87,3.010,339.3
+9.8,0.87,3.410,343.5,10.3,0.87,3.220,346.9
+10.5,0.87,3.220,339.5,11.3,0.87,2.970,342.7
+11.0,0.87,3.680,321.6,11.8,0.87,3.590,328.7
+12.4,0.87,2.870,321.8,12.4,0.87,3.040,321.4
+15.2,0.87,2.620,325.6,15.1,0.87,2.600,324.3
+17.8,0.87,2.880,341.1,17.6,0.87,2.850,340.5
+19.4,0.87,3.290,353.6,19.2,0.87,3.270,353.3
+20.6,0.87,3.180,3.6,20.4,0.87,3.170,3.5
+21.3,0.87,2.520,8.3,21.1,0.87,2.500,8.3
+21.6,0.87,2.110,18.0,21.4,0.87,2.100,18.1
+21.6,0.87,2.200,21.0,21.4,0.87,2.200,21.3
+21.3,0.87,2.720,43.9,21.2,0.87,2.740,43.6
+21.1,0.87,2.260,62.4,21.1,0.87,2.180,60.9
+21.2,0.87,0.930,65.4,21.2,0.87,0.950,58.0
+21.4,0.87,0.890,132.0,21.3,0.87,0.820,129.6
+20.7,0.87,1.690,57.8,20.7,0.87,1.740,57.7
+18.5,0.87,2.940,59.1,18.9,0.87,3.450,58.8
+17.7,0.87,2.390,89.5,18.0,0.87,2.840,84.5
+17.2,0.87,3.700,126.3,17.4,0.87,4.040,119.6
+16.7,0.87,3.790,105.5,16.8,0.87,4.080,102.5
+15.7,0.87,3.360,113.5,15.8,0.87,3.670,109.9
+15.7,0.87,4.080,131.8,15.9,0.87,4.490,129.9
+15.5,0.87,3.570,134.3,16.1,0.87,4.020,133.7
+14.7,0.87,3.600,149.8,15.3,0.87,4.030,146.2
+13.9,0.87,2.150,169.2,14.5,0.87,2.510,161.9
+13.9,0.87,2.230,194.9,14.4,0.87,2.420,186.4
+14.6,0.87,2.750,204.2,15.1,0.87,2.960,197.1
+15.8,0.87,2.830,210.5,15.8,0.87,3.480,205.5
+18.7,0.87,2.760,186.9,18.5,0.87,2.830,187.7
+20.6,0.87,3.440,197.3,20.3,0.87,3.500,197.8
+21.7,0.87,4.310,209.1,21.5,0.87,4.400,209.4
+22.4,0.87,4.960,212.9,22.2,0.87,5.040,213.1
+22.8,0.87,4.840,216.8,22.6,0.87,4.930,216.8
+23.0,0.87,5.260,215.0,22.8,0.87,5.340,215.3
+23.0,0.87,5.510,210.2,22.8,0.87,5.690,210.6
+22.6,0.87,7.110,201.3,22.4,0.87,7.180,202.4
+22.0,0.87,8.800,204.1,21.9,0.87,8.760,205.5
+21.7,0.87,8.820,205.4,21.7,0.87,8.860,206.0
+21.4,0.87,9.080,211.0,21.4,0.87,9.050,211.8
+20.6,0.87,10.820,215.4,20.9,0.87,11.050,216.3
+19.3,0.87,11.320,221.7,19.8,0.87,11.910,220.7
+18.6,0.87,12.830,224.8,19.2,0.87,13.530,224.0
+17.9,0.87,12.930,231.0,18.6,0.87,13.740,230.0
+17.4,0.87,13.470,234.0,18.0,0.87,14.330,233.0
+17.3,0.87,12.910,238.3,17.9,0.87,13.690,237.6
+16.5,0.87,12.270,251.1,17.3,0.87,13.230,251.1
+13.8,0.87,7.040,276.5,14.6,0.87,8.590,274.7
+14.6,0.87,7.330,273.9,15.4,0.87,8.890,270.7
+15.5,0.87,7.910,272.3,16.1,0.87,8.640,272.6
+15.7,0.87,8.230,267.3,16.2,0.87,8.650,268.9
+14.8,0.87,5.410,262.8,15.4,0.87,6.130,265.9
+16.7,0.87,2.930,257.4,16.5,0.87,3.010,258.7
+19.2,0.87,3.220,250.3,19.0,0.87,3.310,250.4
+21.1,0.87,5.030,239.3,20.9,0.87,5.120,239.3
+22.4,0.87,5.650,229.0,22.1,0.87,5.740,229.1
+22.9,0.87,6.470,222.6,22.7,0.87,6.570,222.7
+23.5,0.87,6.100,218.9,23.3,0.87,6.220,219.0
+23.7,0.87,6.950,214.9,23.5,0.87,7.100,215.1
+23.3,0.87,7.430,206.6,23.1,0.87,7.720,207.0
+22.8,0.87,9.140,201.3,22.6,0.87,9.360,202.8
+22.2,0.87,10.580,199.0,22.2,0.87,10.850,200.5
+20.9,0.87,11.810,200.9,21.3,0.87,12.450,202.2
+19.7,0.87,13.880,205.9,20.3,0.87,15.040,206.6
+18.6,0.87,14.210,209.6,19.3,0.87,15.570,209.9
+17.6,0.87,14.490,216.7,18.2,0.87,15.810,216.7
+16.9,0.87,14.540,221.2,17.7,0.87,15.870,221.6
+16.2,0.87,14.670,224.7,16.9,0.87,16.000,225.8
+16.3,0.87,14.630,224.1,17.0,0.87,15.880,225.0
+15.6,0.87,14.250,225.7,16.4,0.87,15.480,226.6
+15.5,0.87,14.840,228.5,16.1,0.87,15.980,229.1
+14.2,0.87,14.200,237.4,14.9,0.87,15.500,239.2
+14.8,0.87,14.190,236.7,15.6,0.87,15.320,238.8
+14.4,0.87,14.280,236.7,15.5,0.87,15.470,238.8
+13.7,0.87,13.130,234.0,15.8,0.87,13.910,240.2
+12.3,0.87,5.530,248.3,12.5,0.87,6.400,250.3
+15.4,0.87,3.060,261.4,15.3,0.87,3.270,261.9
+19.6,0.87,4.630,267.1,19.4,0.87,4.730,267.3
+21.6,0.87,4.270,281.7,21.4,0.87,4.340,281.2
+23.1,0.87,3.480,288.3,22.9,0.87,3.550,287.3
+23.9,0.87,4.900,304.5,23.7,0.87,4.940,303.6
+23.6,0.87,6.100,314.5,23.4,0.87,6.160,314.1
+23.5,0.87,5.600,315.2,23.3,0.87,5.660,314.9
+23.0,0.87,5.050,336.8,22.8,0.87,5.160,336.2
+22.4,0.87,5.400,332.8,22.3,0.87,5.460,331.6
+20.8,0.87,8.410,6.0,20.9,0.87,9.170,12.5
+18.1,0.87,11.020,47.8,18.3,0.87,12.480,47.3
+16.5,0.87,10.300,46.3,16.8,0.87,12.120,47.4
+15.2,0.87,9.580,48.3,15.3,0.87,11.280,49.6
+13.8,0.87,8.330,49.2,13.9,0.87,9.980,51.1
+12.8,0.87,10.570,41.5,12.7,0.87,12.350,43.8
+10.8,0.87,8.890,38.6,10.9,0.87,10.380,42.6
+10.0,0.87,8.920,38.9,10.0,0.87,10.190,42.5
+8.7,0.87,8.620,44.8,8.7,0.87,10.040,47.7
+7.7,0.87,7.150,22.0,7.7,0.87,8.170,30.1
+6.8,0.87,7.870,13.3,6.7,0.87,8.530,21.4
+6.1,0.87,8.340,20.8,6.1,0.87,9.200,27.6
+5.5,0.87,7.370,16.1,5.4,0.87,7.980,21.1
+4.8,0.87,7.670,15.2,4.7,0.87,8.200,21.4
+4.9,0.87,5.540,17.4,4.8,0.87,5.670,18.9
+6.3,0.87,5.270,24.9,6.0,0.87,5.310,25.4
+7.9,0.87,4.680,32.6,7.7,0.87,4.720,33.3
+9.8,0.87,3.710,34.4,9.6,0.87,3.740,35.3
+11.5,0.87,3.920,52.4,11.3,0.87,3.940,53.2
+13.4,0.87,3.840,64.3,13.2,0.87,3.890,65.7
+14.5,0.87,2.490,118.2,14.3,0.87,2.520,118.5
+14.8,0.87,2.340,89.2,14.6,0.87,2.390,89.4
+15.2,0.87,3.790,100.5,15.0,0.87,3.860,100.9
+14.5,0.87,5.900,126.9,14.3,0.87,6.000,127.1
+13.3,0.87,6.000,143.8,13.2,0.87,6.310,143.7
+12.7,0.87,5.810,132.7,12.5,0.87,6.250,132.4
+12.0,0.87,5.270,130.1,11.9,0.87,5.700,129.7
+11.6,0.87,6.800,124.9,11.5,0.87,7.250,124.5
+10.9,0.87,8.800,130.2,11.0,0.87,8.850,130.9
+10.4,0.87,8.290,139.7,10.6,0.87,8.480,139.9
+9.9,0.87,8.280,148.5,9.9,0.87,8.640,147.7
+9.5,0.87,7.760,150.5,9.5,0.87,7.970,150.4
+9.0,0.87,7.910,158.3,9.2,0.87,8.040,158.9
+8.5,0.87,8.130,176.3,8.8,0.87,8.290,175.7
+8.9,0.87,8.140,189.6,9.4,0.87,8.110,190.1
+9.0,0.87,8.090,191.1,9.5,0.87,7.830,192.9
+9.7,0.87,7.800,211.7,10.2,0.87,7.730,211.3
+8.7,0.87,7.660,219.3,9.6,0.87,7.840,217.6
+11.2,0.87,7.550,227.6,12.0,0.87,7.910,228.1
+12.0,0.87,5.800,227.0,11.8,0.87,6.050,228.6
+14.2,0.87,5.290,233.2,14.0,0.87,5.350,233.6
+15.9,0.87,4.280,241.9,15.7,0.87,4.340,242.3
+17.3,0.87,4.050,245.7,17.1,0.87,4.110,245.8
+18.4,0.87,4.080,247.2,18.2,0.87,4.150,247.6
+19.3,0.87,3.970,257.1,19.1,0.87,4.030,257.2
+19.8,0.87,3.840,256.3,19.6,0.87,3.910,256.6
+20.1,0.87,3.100,264.9,19.9,0.87,3.190,265.4
+19.0,0.87,2.330,4.4,18.9,0.87,2.560,0.3
+18.0,0.87,1.880,30.4,18.1,0.87,2.170,25.6
+17.2,0.87,1.810,51.7,17.4,0.87,2.000,39.3
+17.1,0.87,3.240,30.9,17.1,0.87,3.510,29.4
+16.6,0.87,3.110,1.8,16.7,0.87,3.510,3.4
+15.1,0.87,3.470,8.0,15.3,0.87,3.830,11.9
+14.4,0.87,4.190,9.6,14.6,0.87,4.700,13.4
+12.4,0.87,6.900,2.7,12.7,0.87,7.600,5.0
+12.3,0.87,7.730,7.4,12.6,0.87,9.330,10.5
+10.8,0.87,8.810,21.1,11.0,0.87,9.670,25.2
+10.3,0.87,8.810,21.4,10.4,0.87,9.640,23.6
+9.7,0.87,9.050,17.5,10.0,0.87,9.970,21.4
+9.1,0.87,8.940,14.0,9.4,0.87,9.850,16.6
+9.1,0.87,8.230,7.8,9.3,0.87,9.240,10.6
+8.7,0.87,7.630,7.8,8.9,0.87,8.330,8.9
+8.7,0.88,6.550,6.5,8.8,0.88,7.180,9.3
+9.8,0.88,6.610,359.6,9.6,0.88,6.700,0.2
+11.3,0.88,7.420,5.4,11.1,0.88,7.510,5.6
+12.4,0.87,6.760,2.1,12.2,0.87,6.840,2.1
+13.5,0.87,6.250,358.2,13.3,0.87,6.330,358.0
+14.4,0.87,5.290,357.8,14.2,0.87,5.360,357.6
+15.3,0.87,5.220,348.4,15.1,0.87,5.300,348.2
+15.8,0.87,4.620,340.5,15.6,0.87,4.690,340.2
+16.0,0.87,3.910,326.4,15.7,0.87,3.980,326.3
+15.7,0.87,4.240,304.7,15.5,0.87,4.270,305.8
+15.7,0.87,2.280,310.4,15.6,0.87,2.340,314.8
+15.7,0.87,2.470,278.5,15.6,0.87,2.600,283.1
+16.0,0.87,2.100,260.8,15.9,0.87,2.100,262.6
+15.7,0.87,3.750,246.1,15.7,0.87,3.700,250.3
+15.1,0.87,5.080,231.4,15.2,0.87,4.940,234.5
+14.5,0.87,7.160,227.6,14.8,0.87,6.980,228.5
+15.1,0.87,7.820,232.3,15.4,0.87,7.940,234.4
+15.3,0.87,9.130,251.1,15.8,0.87,9.330,254.3
+14.5,0.87,9.230,265.9,15.3,0.87,9.470,270.7
+13.0,0.87,7.170,292.8,13.2,0.87,7.380,296.3
+11.8,0.87,5.750,309.2,12.2,0.87,6.790,307.4
+11.8,0.87,8.100,300.5,12.2,0.87,9.210,301.8
+12.2,0.87,7.250,306.1,12.7,0.87,7.300,311.4
+12.7,0.87,6.740,312.9,13.3,0.87,6.870,316.2
+13.5,0.87,5.520,317.7,14.3,0.87,6.030,320.1
+14.0,0.87,3.290,329.3,14.2,0.87,4.000,328.1
+16.1,0.87,3.420,347.1,15.9,0.87,3.420,346.2
+16.3,0.87,4.540,8.3,16.1,0.87,4.520,7.9
+17.6,0.87,3.610,20.3,17.4,0.87,3.630,20.8
+19.0,0.87,3.710,31.5,18.8,0.87,3.740,31.7
+19.8,0.87,2.960,29.4,19.6,0.87,3.000,29.3
+20.0,0.87,3.660,36.8,19.8,0.87,3.660,36.4
+19.7,0.87,4.180,47.4,19.5,0.87,4.260,47.3
+19.1,0.87,5.200,59.3,18.9,0.87,5.280,59.6
+18.0,0.87,6.680,80.9,17.9,0.87,6.840,80.1
+17.6,0.87,6.920,87.2,17.6,0.87,6.840,86.5
+17.3,0.87,7.200,92.7,17.4,0.87,7.130,92.6
+16.0,0.87,8.420,117.1,16.1,0.87,8.560,116.7
+15.2,0.87,10.130,134.9,15.3,0.87,10.100,135.0
+14.7,0.87,8.730,148.0,14.7,0.87,9.090,146.4
+13.6,0.87,8.560,163.7,13.8,0.87,8.920,161.2
+13.1,0.87,10.230,163.4,13.4,0.87,10.610,162.1
+12.5,0.87,11.210,168.3,12.8,0.87,11.600,167.1
+12.8,0.87,11.530,174.5,13.3,0.87,11.850,173.1
+12.6,0.87,12.250,179.3,13.3,0.87,12.560,178.5
+11.9,0.87,12.810,189.4,12.7,0.87,13.280,188.8
+11.5,0.87,12.790,196.6,12.3,0.87,13.510,195.9
+11.4,0.87,12.800,201.1,12.2,0.87,13.540,199.8
+10.5,0.87,10.790,206.2,11.4,0.87,11.820,205.9
+12.7,0.87,8.650,203.8,12.7,0.87,9.360,205.0
+15.5,0.87,8.130,202.4,15.3,0.87,8.250,202.8
+18.2,0.87,8.210,204.3,18.0,0.87,8.340,204.6
+20.1,0.87,8.370,205.8,19.9,0.87,8.520,206.0
+21.3,0.87,8.850,205.8,21.1,0.87,9.020,206.1
+22.0,0.87,9.160,204.0,21.8,0.87,9.330,204.2
+22.1,0.87,9.380,200.7,21.9,0.87,9.570,201.0
+21.8,0.87,9.240,194.8,21.6,0.87,9.650,195.2
+21.2,0.87,11.750,186.6,21.2,0.87,12.350,188.1
+20.0,0.87,12.720,186.0,20.3,0.87,13.620,187.7
+18.7,0.87,13.400,185.5,19.0,0.87,14.580,187.0
+17.2,0.87,13.030,186.7,17.6,0.87,14.430,188.7
+16.9,0.87,13.090,191.7,17.3,0.87,14.390,193.6
+16.4,0.87,13.170,197.3,16.9,0.87,14.590,199.5
+15.8,0.87,13.380,207.0,16.3,0.87,14.850,208.8
+15.5,0.87,14.800,216.3,16.0,0.87,16.130,217.4
+15.0,0.87,14.920,216.8,15.6,0.87,16.400,218.5
+14.4,0.87,13.980,218.5,15.1,0.87,15.310,221.3
+14.3,0.87,13.950,228.1,15.6,0.87,15.310,231.5
+15.4,0.87,14.490,238.0,16.4,0.87,15.600,241.4
+15.4,0.87,13.830,237.4,16.6,0.87,14.760,242.3
+15.0,0.87,14.220,237.4,16.2,0.87,15.130,241.8
+14.5,0.87,13.870,237.0,15.7,0.87,14.690,242.0
+15.5,0.87,12.550,239.6,16.4,0.87,13.390,243.0
+17.4,0.87,5.190,256.0,17.2,0.87,5.350,256.5
+20.3,0.87,5.380,254.9,20.1,0.87,5.470,255.6
+23.4,0.87,6.550,267.6,23.2,0.87,6.730,267.5
+24.4,0.86,8.240,259.1,24.2,0.86,8.400,259.3
+25.7,0.86,8.940,253.6,25.4,0.86,9.140,253.7
+26.0,0.86,9.360,251.0,25.8,0.86,9.560,251.0
+25.9,0.86,9.320,243.2,25.7,0.86,9.560,243.2
+25.3,0.86,8.490,233.3,25.1,0.86,8.990,233.7
+24.1,0.86,10.220,215.3,24.1,0.86,10.880,216.8
+23.0,0.86,11.070,220.2,23.3,0.86,11.930,222.1
+23.1,0.86,9.660,222.2,23.4,0.86,10.320,224.2
+22.1,0.86,9.820,214.5,22.7,0.86,10.700,215.9
+21.4,0.86,11.750,212.3,21.9,0.86,13.080,213.5
+20.6,0.86,11.750,212.9,20.7,0.86,13.000,214.0
+19.9,0.86,12.460,211.9,20.1,0.86,13.660,212.4
+18.9,0.86,12.210,207.3,18.9,0.86,13.480,208.4
+17.3,0.86,12.670,210.2,17.3,0.86,14.460,212.2
+15.2,0.86,12.790,216.8,15.5,0.86,14.500,219.1
+15.9,0.86,13.270,225.7,16.9,0.86,14.320,227.5
+15.5,0.86,13.100,224.6,16.5,0.86,14.130,227.4
+15.2,0.86,13.290,224.6,16.3,0.86,14.490,227.8
+14.3,0.86,13.540,229.4,15.2,0.86,14.480,233.3
+13.5,0.86,12.350,232.3,14.4,0.86,13.220,238.0
+14.1,0.86,10.740,237.3,14.5,0.86,11.560,240.4
+18.0,0.86,9.680,243.4,17.8,0.86,9.910,244.2
+19.5,0.86,8.130,243.8,19.3,0.86,8.290,244.1
+21.0,0.86,8.670,241.0,20.8,0.86,8.880,241.3
+21.4,0.86,10.170,246.8,21.2,0.86,10.390,246.8
+21.9,0.86,10.380,238.8,21.6,0.86,10.600,238.9
+22.2,0.86,11.130,234.7,22.0,0.86,11.380,234.8
+22.4,0.86,12.100,229.4,22.2,0.86,12.420,229.6
+22.1,0.86,10.070,225.4,21.9,0.86,10.480,225.6
+21.8,0.86,9.770,195.6,21.7,0.86,10.200,197.2
+20.9,0.86,12.080,212.1,21.3,0.86,13.270,213.6
+20.4,0.86,12.340,207.5,20.7,0.86,13.500,209.7
+19.9,0.86,12.830,210.5,20.3,0.86,13.770,212.9
+18.4,0.86,11.540,207.4,18.6,0.86,12.120,211.5
+18.4,0.86,12.560,209.2,18.7,0.86,13.570,210.1
+17.6,0.86,14.190,204.0,18.0,0.86,16.000,205.1
+16.5,0.86,15.430,206.2,16.6,0.86,17.000,206.7
+15.0,0.86,13.320,201.8,15.1,0.86,14.960,203.1
+14.2,0.86,13.770,204.7,14.2,0.86,15.040,205.2
+13.5,0.86,12.060,209.7,13.6,0.86,13.310,210.4
+13.1,0.86,12.830,204.4,13.2,0.86,14.100,205.2
+12.8,0.86,13.740,210.4,12.9,0.86,15.060,210.8
+12.8,0.86,14.310,213.7,13.1,0.86,15.600,213.9
+12.2,0.86,13.190,207.3,12.5,0.86,14.440,208.1
+13.7,0.86,13.440,205.9,13.8,0.86,14.390,206.8
+16.6,0.86,11.380,208.0,16.4,0.86,11.660,208.3
+17.8,0.86,11.440,204.1,17.6,0.86,11.680,204.4
+19.7,0.86,13.350,215.0,19.5,0.86,13.690,215.1
+21.0,0.86,15.520,219.7,20.7,0.86,15.960,219.8
+21.4,0.86,17.290,220.9,21.2,0.86,17.750,221.0
+21.5,0.86,17.200,213.6,21.3,0.86,17.760,213.7
+21.0,0.86,15.940,223.3,20.8,0.86,16.400,223.3
+16.5,0.86,10.440,245.5,16.5,0.86,11.250,245.4
+16.1,0.86,18.330,255.5,16.0,0.86,18.890,255.4
+14.3,0.86,12.720,238.3,14.2,0.86,13.370,239.2
+15.6,0.86,13.060,261.7,15.3,0.86,14.070,261.6
+15.0,0.86,10.680,252.2,15.0,0.86,11.790,254.4
+10.8,0.86,7.620,285.3,10.6,0.86,9.400,284.7
+11.2,0.86,4.810,250.6,11.0,0.86,5.530,251.6
+10.2,0.86,4.550,222.2,9.9,0.86,5.000,234.0
+9.7,0.86,4.740,234.0,9.5,0.86,4.990,241.6
+8.6,0.86,6.200,278.6,8.3,0.86,6.130,287.2
+8.0,0.86,8.340,290.0,8.0,0.86,8.490,292.5
+6.9,0.86,9.010,284.0,7.0,0.86,9.350,287.4
+6.3,0.86,10.290,285.3,6.5,0.86,10.900,289.4
+5.6,0.86,9.900,283.1,5.7,0.86,10.740,286.2
+4.6,0.86,11.480,277.6,5.1,0.86,12.500,281.1
+4.1,0.86,10.710,280.0,4.5,0.86,11.670,283.0
+4.1,0.86,9.520,288.7,4.1,0.86,10.250,290.5
+4.4,0.87,8.940,340.4,4.2,0.87,9.070,340.0
+3.6,0.87,6.450,342.5,3.4,0.87,6.540,342.1
+2.9,0.87,6.380,1.3,2.6,0.87,6.390,1.0
+3.4,0.87,6.590,356.8,3.2,0.87,6.620,356.4
+4.6,0.87,6.590,336.1,4.4,0.87,6.680,335.8
+4.9,0.87,6.120,339.4,4.7,0.87,6.220,339.1
+5.2,0.87,4.960,0.3,5.0,0.87,5.020,359.7
+5.1,0.87,4.950,17.0,4.9,0.87,5.000,16.7
+4.3,0.87,6.520,41.4,4.1,0.87,6.630,41.0
+3.7,0.87,7.250,53.2,3.5,0.87,7.240,51.4
+3.1,0.87,7.660,61.3,2.9,0.87,7.700,59.6
+2.8,0.87,6.530,81.8,2.7,0.87,6.450,78.9
+2.4,0.87,5.890,74.0,2.3,0.87,5.520,68.8
+2.1,0.87,3.270,144.5,2.1,0.87,2.980,144.1
+1.1,0.87,4.050,141.0,1.2,0.87,3.820,140.8
+0.4,0.87,2.200,149.8,0.5,0.87,2.420,144.3
+0.5,0.88,2.420,169.0,0.6,0.88,2.370,166.3
+0.7,0.88,4.170,202.0,0.8,0.88,4.000,203.0
+0.6,0.88,4.340,221.5,0.8,0.88,4.340,223.6
+0.6,0.88,4.540,213.3,0.9,0.88,4.260,219.4
+0.9,0.88,4.380,244.7,1.0,0.88,4.150,251.7
+1.4,0.88,2.670,276.2,1.5,0.88,2.690,290.0
+1.7,0.88,3.090,342.5,1.7,0.88,3.490,345.4
+0.3,0.88,3.620,340.2,0.5,0.88,3.610,342.8
+1.6,0.88,3.030,311.6,1.5,0.88,3.110,311.0
+3.7,0.88,3.570,314.4,3.5,0.88,3.620,313.6
+4.9,0.88,3.880,323.3,4.7,0.88,3.930,322.9
+5.7,0.88,3.230,324.5,5.5,0.88,3.260,324.0
+6.5,0.88,1.960,331.2,6.3,0.88,1.970,330.2
+7.0,0.88,1.640,319.9,6.8,0.88,1.650,318.3
+7.4,0.88,1.130,303.9,7.2,0.88,1.150,300.9
+7.6,0.88,0.230,249.6,7.4,0.88,0.320,235.5
+7.5,0.88,0.370,136.3,7.3,0.88,0.480,155.5
+7.4,0.88,2.470,140.0,7.3,0.88,2.600,141.3
+6.9,0.88,6.560,153.2,6.9,0.88,6.570,154.3
+6.0,0.88,7.650,174.5,6.1,0.88,7.550,176.8
+5.2,0.88,6.820,203.3,5.4,0.88,7.080,204.6
+4.8,0.88,8.000,205.8,5.2,0.88,8.400,206.9
+4.8,0.88,9.470,203.7,5.2,0.88,9.820,203.1
+3.8,0.88,11.720,200.0,4.3,0.88,12.520,199.5
+3.5,0.88,12.510,202.0,4.0,0.88,13.150,202.0
+2.9,0.88,12.590,204.3,3.5,0.88,13.310,204.3
+2.3,0.88,12.530,207.3,2.9,0.88,13.440,207.2
+1.4,0.88,11.960,207.7,2.1,0.88,13.050,207.8
+0.7,0.88,11.540,205.8,1.3,0.88,12.610,206.5
+1.0,0.88,12.090,210.1,1.6,0.88,13.010,210.3
+1.0,0.88,12.730,215.8,1.7,0.88,13.620,215.8
+0.8,0.88,10.450,212.3,0.9,0.88,11.370,213.1
+2.9,0.88,9.510,205.6,2.8,0.88,9.830,206.2
+5.3,0.88,10.440,202.1,5.1,0.88,10.590,202.3
+7.4,0.87,11.320,205.0,7.2,0.87,11.510,205.1
+8.5,0.87,10.770,204.3,8.3,0.87,10.980,204.5
+9.7,0.87,9.210,205.1,9.4,0.87,9.400,205.3
+10.3,0.87,8.570,211.2,10.0,0.87,8.740,211.4
+10.7,0.87,8.010,208.5,10.5,0.87,8.190,208.9
+10.5,0.87,6.920,205.7,10.3,0.87,7.230,206.3
+10.0,0.87,8.100,192.2,9.9,0.87,8.410,195.4
+9.3,0.87,10.370,193.5,9.4,0.87,10.560,195.6
+8.9,0.87,11.380,199.7,9.1,0.87,11.400,202.1
+8.1,0.87,11.290,202.2,8.5,0.87,11.620,204.8
+7.2,0.87,11.520,207.7,7.7,0.87,12.040,208.9
+6.7,0.87,11.510,214.0,7.3,0.87,12.080,214.6
+6.5,0.87,11.550,222.3,7.1,0.87,11.940,222.6
+6.4,0.88,11.520,230.6,7.2,0.88,11.700,230.9
+7.7,0.88,8.930,254.1,8.1,0.88,8.370,258.1
+7.2,0.88,6.420,287.5,7.3,0.88,6.080,288.0
+5.4,0.88,6.080,303.9,5.8,0.88,5.660,301.4
+4.9,0.88,4.610,347.2,5.2,0.88,4.520,352.4
+4.4,0.88,4.530,358.6,4.7,0.88,4.620,359.5
+3.4,0.88,4.190,359.0,3.6,0.88,4.250,2.9
+3.6,0.88,3.990,344.9,3.7,0.88,3.920,350.0
+3.7,0.88,3.180,337.3,3.9,0.88,3.130,345.0
+4.4,0.88,1.910,319.3,4.4,0.88,1.950,319.5
+6.7,0.88,1.330,328.9,6.6,0.88,1.250,325.4
+9.2,0.88,0.320,302.2,9.1,0.88,0.320,276.8
+12.2,0.88,1.380,191.4,12.0,0.88,1.540,192.5
+14.0,0.87,4.860,203.3,13.7,0.87,4.940,203.5
+14.7,0.87,6.390,204.7,14.5,0.87,6.500,204.7
+15.0,0.87,6.870,198.4,14.8,0.87,7.010,198.5
+14.9,0.87,7.190,196.1,14.7,0.87,7.570,196.4
+14.0,0.87,10.360,188.1,13.9,0.87,10.650,189.9
+12.7,0.87,10.870,190.5,13.0,0.87,11.650,192.4
+11.9,0.87,12.520,192.0,12.3,0.87,13.320,192.8
+10.7,0.87,13.320,199.6,11.3,0.87,14.410,201.3
+9.9,0.87,12.770,200.5,10.4,0.87,14.090,202.4
+8.6,0.87,13.110,210.7,9.2,0.87,14.500,211.4
+8.0,0.87,14.600,215.5,8.5,0.87,15.780,217.1
+7.5,0.87,14.840,219.8,8.1,0.87,15.890,221.6
+7.6,0.87,14.050,224.0,8.3,0.87,14.920,226.1
+7.0,0.87,13.990,229.6,7.9,0.87,14.990,232.8
+5.9,0.87,12.640,228.9,7.2,0.87,13.880,234.5
+4.7,0.87,9.240,242.0,5.8,0.87,10.630,246.0
+7.2,0.87,10.840,262.9,8.3,0.87,11.650,267.8
+8.0,0.87,9.820,273.5,8.8,0.87,10.250,279.9
+3.7,0.87,7.760,330.5,4.0,0.87,8.360,328.2
+5.6,0.87,8.620,342.4,5.9,0.87,9.210,346.3
+5.7,0.87,7.560,351.4,5.5,0.87,7.670,352.1
+7.0,0.87,7.190,357.8,6.8,0.87,7.260,358.0
+8.8,0.87,7.090,358.5,8.6,0.87,7.200,358.7
+10.8,0.87,8.260,3.2,10.5,0.87,8.380,3.2
+11.9,0.87,8.100,7.2,11.7,0.87,8.230,7.2
+12.7,0.87,7.840,17.5,12.4,0.87,7.980,17.5
+12.8,0.87,8.160,22.3,12.6,0.87,8.310,22.1
+12.5,0.88,7.840,26.4,12.3,0.88,8.190,26.3
+11.8,0.88,8.240,34.2,11.6,0.88,8.750,34.5
+11.1,0.88,8.240,40.3,10.9,0.88,8.980,41.6
+10.0,0.88,8.680,47.7,10.0,0.88,9.610,46.8
+9.2,0.88,8.390,46.7,9.3,0.88,9.520,45.5
+7.9,0.88,5.780,35.4,8.0,0.88,6.740,40.9
+6.9,0.88,5.630,30.6,7.2,0.88,6.280,37.0
+5.7,0.88,4.220,28.5,6.0,0.88,4.670,32.5
+5.0,0.88,3.380,19.9,5.3,0.88,3.830,24.8
+4.6,0.88,3.780,10.5,4.8,0.88,4.180,14.2
+4.0,0.88,3.910,1.0,4.3,0.88,4.280,6.2
+3.3,0.88,4.030,3.8,3.5,0.88,4.320,6.5
+2.8,0.88,3.630,355.9,3.2,0.88,3.930,2.1
+2.2,0.88,4.020,1.5,2.7,0.88,4.320,7.5
+2.0,0.88,3.590,5.5,2.5,0.88,3.900,12.9
+2.2,0.88,3.010,0.9,2.8,0.88,3.110,11.6
+2.3,0.88,2.320,2.5,2.9,0.88,2.350,15.9
+3.1,0.88,0.760,16.2,3.5,0.88,0.980,43.9
+5.5,0.88,0.800,91.7,5.4,0.88,0.850,103.4
+8.8,0.88,3.380,158.3,8.6,0.88,3.470,159.2
+10.4,0.88,4.770,169.3,10.2,0.88,4.850,169.7
+11.6,0.88,5.130,174.5,11.3,0.88,5.230,174.7
+12.5,0.88,6.360,175.8,12.3,0.88,6.480,176.0
+12.8,0.88,7.430,177.5,12.6,0.88,7.550,177.7
+12.8,0.87,7.690,171.2,12.6,0.87,7.980,171.6
+9.7,0.87,10.820,145.7,9.6,0.87,11.480,145.8
+8.8,0.87,11.360,145.8,8.9,0.87,12.260,145.7
+8.5,0.87,11.640,154.3,8.7,0.87,12.790,154.5
+8.7,0.87,12.010,170.6,9.0,0.87,13.130,172.0
+8.4,0.87,12.380,177.4,8.6,0.87,13.550,177.8
+8.1,0.87,13.180,182.7,8.2,0.87,14.360,182.6
+7.8,0.87,13.800,183.4,8.0,0.87,14.950,183.7
+7.2,0.87,13.680,187.4,7.5,0.87,14.960,187.6
+6.5,0.87,12.600,189.4,6.9,0.87,13.880,191.0
+6.3,0.87,12.520,192.0,6.6,0.87,13.880,193.5
+7.0,0.87,14.950,198.1,7.2,0.87,16.150,198.8
+6.8,0.87,14.520,199.7,7.0,0.87,15.690,200.5
+6.6,0.87,14.170,200.6,6.9,0.87,15.160,201.5
+6.2,0.87,13.540,203.0,6.5,0.87,14.360,204.6
+5.5,0.87,12.540,211.1,5.7,0.87,13.400,211.9
+7.0,0.87,11.240,202.6,6.9,0.87,11.970,203.6
+7.9,0.87,11.810,201.7,7.7,0.87,12.350,202.3
+8.6,0.87,11.370,202.3,8.4,0.87,11.610,202.7
+9.6,0.87,10.120,206.0,9.4,0.87,10.300,206.0
+11.3,0.87,8.940,199.0,11.1,0.87,9.090,199.4
+12.8,0.87,8.980,200.3,12.6,0.87,9.140,200.5
+13.5,0.87,9.330,200.1,13.3,0.87,9.490,200.1
+13.5,0.87,9.260,196.6,13.3,0.87,9.420,196.6
+13.0,0.87,9.030,193.0,12.8,0.87,9.320,193.1
+11.5,0.87,11.310,182.1,11.4,0.87,11.960,183.3
+10.4,0.87,12.050,189.0,10.4,0.87,12.740,189.5
+9.8,0.87,11.980,188.3,9.8,0.87,12.740,188.7
+9.0,0.87,10.560,188.6,9.0,0.87,11.600,190.4
+9.1,0.87,10.940,190.8,9.1,0.87,11.860,192.4
+8.9,0.87,11.530,193.7,8.9,0.87,12.390,195.1
+8.8,0.87,12.770,197.6,8.9,0.87,13.730,198.9
+8.7,0.87,13.080,199.6,9.0,0.87,14.310,201.1
+8.5,0.87,13.310,203.5,8.9,0.87,14.640,205.4
+8.7,0.87,13.760,207.5,9.1,0.87,14.970,209.2
+8.7,0.87,13.130,208.1,9.0,0.87,14.150,209.5
+8.3,0.87,11.660,202.1,8.5,0.87,12.610,204.6
+8.2,0.87,10.840,204.6,8.4,0.87,11.810,207.5
+8.1,0.87,10.440,197.8,8.2,0.87,11.350,201.3
+8.2,0.87,10.440,204.4,8.4,0.87,11.410,207.9
+8.6,0.87,10.600,209.8,8.9,0.87,11.220,212.8
+9.8,0.87,8.460,209.3,9.9,0.87,9.300,214.2
+11.8,0.87,7.480,212.0,11.7,0.87,7.630,213.8
+14.3,0.87,5.930,208.1,14.1,0.87,5.980,208.8
+16.0,0.87,6.200,214.3,15.8,0.87,6.280,214.9
+16.8,0.87,6.740,212.9,16.6,0.87,6.840,213.3
+18.3,0.87,8.030,210.3,18.1,0.87,8.240,211.0
+18.8,0.87,9.710,215.0,18.6,0.87,9.920,215.3
+18.4,0.87,9.490,215.3,18.2,0.87,10.010,216.0
+17.6,0.87,10.980,215.6,17.6,0.87,11.780,218.0
+15.6,0.87,10.480,203.8,16.0,0.87,11.360,208.0
+14.4,0.87,11.590,209.0,15.0,0.87,12.610,211.9
+13.6,0.87,12.280,211.3,14.1,0.87,13.260,213.5
+12.9,0.87,11.590,222.4,13.4,0.87,12.630,223.8
+12.5,0.87,13.130,235.9,13.1,0.87,14.460,237.8
+12.2,0.87,13.450,239.1,12.7,0.87,14.720,241.5
+11.3,0.87,13.860,240.9,11.9,0.87,15.280,244.2
+11.3,0.87,13.150,244.0,12.1,0.87,14.270,248.2
+10.9,0.87,11.270,250.8,11.5,0.87,12.460,254.4
+11.1,0.87,12.220,255.6,12.2,0.87,12.690,261.2
+11.1,0.87,10.240,268.9,12.4,0.87,9.890,282.6
+9.1,0.87,5.190,298.8,9.5,0.87,5.460,302.3
+10.0,0.87,8.420,295.5,10.4,0.87,8.980,299.0
+10.3,0.87,9.300,303.2,10.8,0.87,9.430,307.3
+8.8,0.87,7.680,305.6,9.5,0.87,8.300,307.6
+9.3,0.87,4.720,313.7,9.6,0.87,5.770,314.2
+12.2,0.87,4.300,324.0,12.1,0.87,4.360,324.2
+14.2,0.87,4.750,334.5,14.0,0.87,4.760,334.7
+15.4,0.87,5.050,351.7,15.2,0.87,5.080,351.7
+16.4,0.87,4.450,356.6,16.2,0.87,4.500,356.6
+17.3,0.87,3.780,354.1,17.1,0.87,3.810,354.1
+17.7,0.87,3.460,359.4,17.4,0.87,3.500,359.4
+17.7,0.87,2.590,351.2,17.5,0.87,2.610,351.1
+17.4,0.87,2.330,1.2,17.3,0.87,2.420,2.3
+16.9,0.87,1.640,22.0,16.9,0.87,1.970,24.2
+16.0,0.87,2.490,106.6,16.0,0.87,2.900,103.8
+16.0,0.87,2.250,111.9,16.2,0.87,2.670,104.4
+16.3,0.87,1.400,128.4,16.4,0.87,1.700,118.9
+16.0,0.87,1.120,154.2,16.0,0.87,1.340,146.4
+16.0,0.87,0.710,180.1,16.0,0.87,0.760,168.7
+13.7,0.87,1.910,339.9,14.2,0.87,1.530,335.6
+12.2,0.87,2.690,328.4,12.8,0.87,2.520,331.1
+11.8,0.87,3.760,333.1,12.3,0.87,3.740,333.7
+11.5,0.87,4.030,329.6,12.0,0.87,4.080,330.3
+11.1,0.87,4.590,312.3,11.9,0.87,4.540,314.0
+9.8,0.87,6.250,309.6,10.6,0.87,5.950,311.0
+8.6,0.87,6.570,315.7,9.5,0.87,6.190,318.3
+8.4,0.88,5.890,320.6,9.3,0.88,5.750,323.2
+8.5,0.88,5.050,317.6,9.6,0.88,5.000,321.3
+9.0,0.88,3.810,312.6,10.2,0.88,4.160,318.6
+10.8,0.88,2.330,330.4,10.8,0.88,2.450,329.2
+13.3,0.88,1.610,346.4,13.1,0.88,1.550,345.0
+15.3,0.88,0.870,359.4,15.2,0.88,0.770,1.6
+17.1,0.87,1.070,104.3,16.9,0.87,1.100,110.9
+18.4,0.87,3.760,167.0,18.2,0.87,3.810,167.3
+18.4,0.87,4.410,172.3,18.2,0.87,4.500,172.3
+18.1,0.87,5.500,150.6,17.9,0.87,5.690,151.0
+16.6,0.87,8.420,143.4,16.5,0.87,8.440,143.6
+15.0,0.87,10.830,147.1,15.2,0.87,11.020,148.7
+14.5,0.87,10.570,152.1,14.8,0.87,10.950,155.0
+13.5,0.87,10.760,162.2,13.9,0.87,11.510,163.3
+14.0,0.87,12.790,181.7,14.5,0.87,13.290,182.8
+12.9,0.87,12.750,195.1,13.7,0.87,13.550,195.0
+12.8,0.87,12.710,200.6,13.6,0.87,13.440,199.5
+12.4,0.87,13.170,202.8,13.1,0.87,13.900,202.1
+11.3,0.87,12.560,211.4,12.2,0.87,13.360,210.0
+10.4,0.87,12.540,215.1,11.6,0.87,13.480,213.3
+11.2,0.87,13.010,214.6,12.3,0.87,13.670,212.6
+10.5,0.87,13.090,214.7,11.7,0.87,13.740,213.0
+9.8,0.87,12.570,218.6,11.1,0.87,13.320,217.1
+10.1,0.87,13.020,222.3,11.2,0.87,13.620,221.0
+9.7,0.87,13.040,222.7,11.1,0.87,13.670,221.6
+10.4,0.87,11.750,219.8,11.0,0.87,12.410,219.7
+11.3,0.87,10.280,214.8,12.0,0.87,11.400,215.6
+12.9,0.87,8.110,207.5,12.8,0.87,8.420,208.4
+15.5,0.87,9.570,205.2,15.3,0.87,9.740,205.5
+17.3,0.87,10.020,200.4,17.1,0.87,10.210,200.6
+18.2,0.87,11.270,201.6,18.0,0.87,11.510,201.8
+18.6,0.87,11.320,199.5,18.3,0.87,11.590,199.7
+18.6,0.87,12.220,199.2,18.3,0.87,12.530,199.4
+18.4,0.87,11.650,198.1,18.3,0.87,12.160,198.4
+17.8,0.87,12.680,192.5,17.8,0.87,13.540,193.6
+15.1,0.87,13.610,203.5,15.0,0.87,14.520,204.3
+14.1,0.87,11.560,203.0,14.2,0.87,12.580,204.5
+14.4,0.87,11.220,203.2,14.5,0.87,12.380,205.7
+14.3,0.87,13.640,212.4,14.2,0.87,14.700,213.2
+13.3,0.87,13.330,215.5,13.3,0.87,14.430,216.0
+13.4,0.87,12.540,215.6,13.5,0.87,13.670,216.6
+12.8,0.87,13.480,213.0,12.8,0.87,14.460,214.0
+12.7,0.87,12.950,217.6,12.7,0.87,14.020,218.8
+12.7,0.87,12.600,220.7,12.7,0.87,13.740,222.0
+12.2,0.87,13.940,229.4,12.3,0.87,15.130,230.5
+11.4,0.87,13.310,227.4,11.5,0.87,14.570,229.3
+10.9,0.87,12.290,227.4,11.0,0.87,13.430,229.3
+10.0,0.87,12.260,225.4,10.2,0.87,13.280,228.0
+9.9,0.87,11.140,240.2,10.0,0.87,12.210,241.0
+10.8,0.87,9.740,253.0,10.8,0.87,10.370,254.6
+12.5,0.87,6.180,293.0,12.3,0.87,6.350,293.0
+14.0,0.87,6.890,310.2,13.8,0.87,6.970,310.4
+14.8,0.87,9.140,349.9,14.6,0.87,9.280,350.1
+15.9,0.87,9.340,1.3,15.7,0.87,9.490,1.3
+16.6,0.87,9.100,4.2,16.4,0.87,9.250,4.3
+17.1,0.87,8.850,12.6,16.9,0.87,9.000,12.6
+17.1,0.87,8.720,18.2,16.9,0.87,8.890,18.2
+16.7,0.87,8.010,19.3,16.5,0.87,8.420,19.5
+16.1,0.87,9.380,13.9,16.0,0.87,10.260,16.1
+13.9,0.87,10.570,21.1,13.9,0.87,11.520,22.8
+12.4,0.87,10.600,26.4,12.4,0.87,11.950,28.3
+10.8,0.87,11.130,30.9,10.8,0.87,12.550,32.8
+9.3,0.88,9.970,27.0,9.3,0.88,11.200,29.1
+8.1,0.88,10.960,28.1,8.1,0.88,12.400,30.7
+7.0,0.88,10.550,29.9,6.9,0.88,11.940,32.1
+6.0,0.88,9.290,24.7,6.0,0.88,10.600,28.3
+5.3,0.88,9.020,20.4,5.3,0.88,10.050,24.4
+4.4,0.88,9.280,14.0,4.4,0.88,10.330,18.4
+3.5,0.88,8.820,13.9,3.4,0.88,9.810,19.8
+2.8,0.88,9.000,17.9,2.8,0.88,10.040,21.8
+2.3,0.88,8.370,17.8,2.2,0.88,9.460,22.2
+1.9,0.88,8.630,16.7,1.9,0.88,9.660,21.1
+1.3,0.88,8.100,16.9,1.2,0.88,9.180,21.5
+0.8,0.88,6.510,21.4,0.8,0.88,7.260,23.9
+1.8,0.88,4.880,20.5,1.6,0.88,4.980,21.1
+3.3,0.88,5.180,24.9,3.1,0.88,5.250,25.4
+4.6,0.88,4.390,32.4,4.4,0.88,4.440,32.9
+5.7,0.88,3.520,34.4,5.5,0.88,3.550,35.0
+6.6,0.88,2.760,27.5,6.4,0.88,2.770,28.2
+7.2,0.88,2.380,23.4,7.0,0.88,2.380,24.4
+7.6,0.88,1.650,28.0,7.4,0.88,1.640,29.4
+7.6,0.88,1.410,23.9,7.4,0.88,1.380,25.4
+7.3,0.88,1.150,41.5,7.2,0.88,1.120,45.6
+7.2,0.88,1.000,95.3,7.1,0.88,1.040,102.6
+7.2,0.88,2.270,165.7,7.2,0.88,2.520,166.6
+7.3,0.88,4.110,178.1,7.3,0.88,4.300,180.7
+7.0,0.88,6.260,181.2,7.2,0.88,6.500,182.2
+6.6,0.88,7.620,190.7,6.9,0.88,7.830,190.9
+6.1,0.88,9.420,207.8,6.6,0.88,9.680,207.7
+5.3,0.88,11.150,213.0,6.0,0.88,11.690,212.8
+5.1,0.88,11.850,220.0,5.9,0.88,12.520,219.6
+4.3,0.88,12.880,223.2,5.2,0.88,14.030,223.3
+3.8,0.88,13.550,223.8,4.6,0.88,14.880,224.1
+3.6,0.88,13.910,226.3,4.3,0.88,15.360,226.9
+3.5,0.88,14.220,226.3,4.2,0.88,15.700,227.6
+3.4,0.88,14.340,228.5,4.1,0.88,15.800,229.9
+3.1,0.87,14.510,227.0,3.7,0.87,16.000,228.8
+4.9,0.87,13.870,228.4,4.9,0.87,14.550,229.2
+6.2,0.87,10.960,223.7,6.0,0.87,11.300,224.7
+8.7,0.87,10.040,223.8,8.5,0.87,10.200,224.3
+10.9,0.87,10.130,225.1,10.7,0.87,10.310,225.3
+12.7,0.87,9.890,230.2,12.5,0.87,10.080,230.4
+13.9,0.87,9.370,232.8,13.7,0.87,9.550,232.9
+14.9,0.87,8.860,230.7,14.7,0.87,9.030,230.9
+15.4,0.87,8.590,231.0,15.2,0.87,8.770,231.3
+15.2,0.87,8.160,222.9,15.0,0.87,8.650,224.5
+14.5,0.87,10.500,214.7,14.5,0.87,10.890,217.4
+13.7,0.87,12.860,219.7,14.0,0.87,13.650,221.3
+13.1,0.87,14.610,225.9,13.6,0.87,15.720,227.1
+11.6,0.87,14.120,226.3,12.2,0.87,15.320,227.7
+10.2,0.87,14.530,229.5,10.8,0.87,15.820,232.4
+9.6,0.86,14.220,238.3,11.1,0.86,14.570,244.0
+9.4,0.86,12.550,245.2,12.4,0.86,10.550,263.1
+12.8,0.86,8.510,282.2,13.6,0.86,8.560,289.1
+11.3,0.86,8.490,294.6,11.8,0.86,8.690,299.7
+12.0,0.86,8.660,303.5,12.7,0.86,9.030,306.7
+9.7,0.86,9.100,313.1,10.1,0.86,9.630,314.4
+10.2,0.86,9.910,313.8,10.7,0.86,9.920,317.2
+9.8,0.86,9.320,326.9,10.4,0.86,9.120,336.4
+9.3,0.86,8.860,331.2,9.9,0.86,8.720,339.2
+9.4,0.86,9.090,331.3,10.1,0.86,8.890,340.2
+7.8,0.86,8.450,330.0,8.7,0.86,8.780,339.4
+7.7,0.86,6.380,338.2,8.0,0.86,7.120,342.6
+9.1,0.86,5.250,347.7,8.9,0.86,5.270,347.9
+11.0,0.86,4.960,345.6,10.8,0.86,4.970,345.7
+12.4,0.86,4.370,350.7,12.2,0.86,4.370,350.7
+13.6,0.86,3.520,1.5,13.4,0.86,3.520,1.1
+14.3,0.86,2.350,7.8,14.1,0.86,2.330,7.6
+14.6,0.86,1.290,36.9,14.4,0.86,1.270,37.6
+14.5,0.86,1.200,82.7,14.3,0.86,1.200,87.4
+14.4,0.86,2.350,124.5,14.3,0.86,2.400,126.2
+15.1,0.86,3.920,139.4,15.1,0.86,4.080,142.3
+15.1,0.86,5.320,137.1,15.1,0.86,5.370,140.4
+13.3,0.86,7.810,145.4,13.8,0.86,7.400,148.2
+12.4,0.86,8.290,152.5,13.1,0.86,8.280,154.6
+12.4,0.86,8.690,158.4,13.2,0.86,8.760,162.0
+10.7,0.86,8.680,168.3,11.6,0.86,8.870,170.0
+9.5,0.86,5.180,160.7,10.3,0.86,5.310,164.1
+7.4,0.86,2.050,164.2,8.2,0.86,2.220,172.1
+5.0,0.86,2.800,9.9,5.4,0.86,2.820,15.9
+2.8,0.87,6.920,29.4,3.1,0.87,6.850,30.4
+0.3,0.87,8.660,22.3,0.4,0.87,9.340,26.0
+-0.8,0.87,8.860,9.8,-0.9,0.87,9.800,13.8
+-1.7,0.87,9.260,2.0,-1.9,0.87,9.840,7.1
+-2.3,0.87,8.450,8.7,-2.6,0.87,9.300,13.8
+-2.5,0.87,8.870,9.4,-2.7,0.87,9.210,10.2
+-1.6,0.87,8.730,9.9,-1.9,0.87,8.840,10.1
+-0.1,0.87,8.510,9.8,-0.3,0.87,8.610,10.0
+1.6,0.87,10.150,14.5,1.4,0.87,10.290,14.5
+2.7,0.87,10.790,14.4,2.4,0.87,10.940,14.4
+3.4,0.87,10.510,18.6,3.2,0.87,10.670,18.6
+3.8,0.87,10.690,18.5,3.6,0.87,10.860,18.5
+4.1,0.87,10.390,19.7,3.9,0.87,10.570,19.6
+3.9,0.88,9.720,19.4,3.7,0.88,9.920,19.6
+3.1,0.88,8.460,20.4,3.0,0.88,8.960,22.0
+2.2,0.88,11.000,21.9,2.1,0.88,11.870,22.5
+1.4,0.88,8.780,28.0,1.4,0.88,9.360,29.1
+1.1,0.88,8.240,33.5,0.9,0.88,9.210,35.6
+0.3,0.88,7.360,30.4,0.2,0.88,8.160,34.7
+-0.3,0.88,7.260,40.4,-0.3,0.88,8.240,45.3
+-1.0,0.88,6.360,36.0,-1.0,0.88,7.310,42.2
+-1.6,0.88,4.780,40.6,-1.6,0.88,5.410,46.6
+-2.4,0.88,2.330,30.7,-2.3,0.88,2.680,36.2
+-2.4,0.88,1.460,358.9,-2.3,0.88,1.630,10.6
+-2.5,0.88,1.680,312.1,-2.4,0.88,1.560,322.5
+-2.3,0.88,1.690,248.0,-2.3,0.88,1.580,247.7
+-2.0,0.88,3.430,228.7,-1.9,0.88,3.150,228.4
+-1.6,0.88,5.740,231.4,-1.4,0.88,5.550,231.6
+-0.9,0.88,7.190,241.2,-0.5,0.88,6.910,241.3
+-1.1,0.88,7.410,233.3,-0.1,0.88,7.990,234.6
+0.4,0.88,5.780,225.9,0.4,0.88,6.820,229.1
+3.5,0.88,6.030,226.8,3.3,0.88,6.080,227.5
+5.8,0.88,5.780,221.8,5.6,0.88,5.850,222.1
+7.6,0.88,6.520,219.2,7.3,0.88,6.620,219.5
+9.4,0.87,7.050,218.7,9.2,0.87,7.170,218.9
+10.7,0.87,7.100,219.1,10.5,0.87,7.220,219.3
+11.2,0.87,7.120,217.8,11.0,0.87,7.250,218.1
+11.2,0.87,7.510,213.3,11.0,0.87,7.850,214.3
+10.8,0.87,9.540,208.8,10.8,0.87,9.850,211.3
+10.0,0.87,11.500,214.3,10.2,0.87,12.210,216.9
+9.4,0.87,13.320,222.8,10.0,0.87,14.350,224.7
+8.9,0.87,14.290,228.8,9.8,0.87,15.250,230.7
+8.3,0.87,14.400,235.0,9.3,0.87,15.390,236.6
+8.6,0.87,14.530,242.8,10.0,0.87,15.530,245.8
+8.3,0.87,13.810,243.3,9.9,0.87,14.600,247.8
+9.0,0.87,13.120,252.0,10.6,0.87,13.460,257.0
+8.5,0.87,12.630,256.4,10.1,0.87,12.710,261.2
+8.2,0.87,11.680,258.9,9.8,0.87,11.120,264.2
+8.4,0.87,10.700,265.4,9.7,0.87,9.770,270.7
+9.4,0.87,7.470,275.5,10.1,0.87,6.950,280.0
+4.8,0.87,6.970,306.1,4.9,0.87,6.930,309.6
+2.8,0.87,4.370,306.3,3.6,0.87,4.800,305.6
+3.4,0.87,5.560,299.2,3.9,0.87,6.200,298.1
+3.1,0.87,6.800,291.7,3.7,0.87,7.800,293.7
+4.5,0.87,3.630,285.6,4.4,0.87,3.960,284.9
+6.8,0.87,3.100,285.6,6.6,0.87,3.140,283.1
+9.5,0.87,2.820,283.0,9.3,0.87,2.880,279.5
+12.6,0.87,3.350,252.0,12.4,0.87,3.440,251.2
+14.2,0.87,4.220,237.4,14.0,0.87,4.290,237.4
+15.4,0.87,5.030,229.7,15.2,0.87,5.130,229.7
+17.1,0.87,5.410,220.9,16.9,0.87,5.570,220.9
+17.9,0.87,5.490,211.4,17.9,0.87,5.960,213.0
+17.3,0.87,9.570,202.9,17.4,0.87,10.350,205.7
+16.4,0.87,11.940,210.8,16.8,0.87,12.570,213.0
+14.6,0.87,12.420,204.8,14.9,0.87,12.900,206.1
+14.4,0.87,13.420,217.0,15.4,0.87,14.490,217.6
+13.6,0.87,14.350,213.9,14.4,0.87,15.540,213.4
+12.1,0.87,14.590,225.2,12.9,0.87,15.890,226.3
+11.3,0.87,14.330,227.1,12.0,0.87,15.790,228.0
+11.1,0.87,14.020,230.0,11.9,0.87,15.400,232.2
+10.6,0.87,13.800,230.4,11.4,0.87,15.100,233.8
+11.3,0.87,15.570,235.0,12.0,0.87,17.040,236.7
+10.7,0.87,14.490,234.2,11.6,0.87,15.590,237.3
+10.4,0.87,13.800,234.2,11.4,0.87,15.090,237.9
+10.1,0.87,13.910,238.7,11.1,0.87,15.120,242.9
+9.7,0.87,13.900,245.5,10.8,0.87,15.380,250.7
+8.9,0.87,9.860,252.6,10.0,0.87,11.280,257.4
+10.3,0.87,11.190,255.5,11.0,0.87,12.420,260.4
+11.8,0.87,6.430,247.3,11.7,0.87,7.440,251.1
+13.9,0.87,4.890,268.1,13.7,0.87,4.950,268.4
+15.8,0.87,5.150,265.5,15.6,0.87,5.250,265.3
+17.3,0.87,5.070,274.0,17.1,0.87,5.170,273.8
+18.3,0.87,6.680,279.7,18.1,0.87,6.790,279.4
+18.8,0.87,6.540,284.0,18.6,0.87,6.640,283.7
+18.9,0.87,6.270,288.4,18.7,0.87,6.380,288.0
+18.5,0.87,5.370,302.6,18.3,0.87,5.630,301.5
+18.5,0.87,3.920,281.1,18.4,0.87,4.140,283.7
+18.7,0.87,4.750,277.4,18.5,0.87,4.870,277.5
+18.9,0.87,5.210,273.9,18.8,0.87,5.290,275.6
+19.5,0.87,4.360,274.1,19.3,0.87,4.370,274.8
+18.4,0.87,5.930,256.3,18.5,0.87,5.680,258.8
+17.1,0.87,6.810,253.3,17.4,0.87,6.500,257.0
+17.9,0.87,4.740,277.4,18.0,0.87,4.410,282.2
+16.2,0.87,4.140,303.8,16.4,0.87,4.030,305.8
+13.1,0.87,4.700,318.3,13.4,0.87,4.380,318.3
+10.8,0.87,3.560,333.2,11.4,0.87,3.830,329.3
+10.7,0.87,3.990,306.9,11.1,0.87,4.540,305.1
+10.1,0.87,3.860,306.3,10.6,0.87,4.350,306.0
+9.7,0.87,4.500,305.6,10.0,0.87,4.920,304.7
+9.2,0.87,5.080,299.8,9.6,0.87,5.580,299.0
+9.0,0.87,6.780,302.6,9.5,0.87,7.360,302.0
+9.3,0.87,6.870,296.1,9.8,0.87,7.540,295.5
+10.1,0.87,3.090,294.7,10.2,0.87,4.080,292.8
+12.6,0.87,3.560,294.9,12.4,0.87,3.690,293.6
+14.0,0.87,3.250,320.3,13.8,0.87,3.260,318.8
+15.3,0.87,2.850,293.7,15.2,0.87,2.880,291.6
+18.0,0.87,3.030,241.9,17.8,0.87,3.120,241.3
+19.4,0.87,4.560,225.1,19.2,0.87,4.650,225.2
+19.5,0.87,5.330,212.6,19.3,0.87,5.410,213.2
+19.1,0.87,6.550,192.8,19.0,0.87,6.650,194.6
+19.4,0.87,8.220,200.0,19.2,0.87,8.390,201.2
+17.6,0.87,13.980,222.2,18.0,0.87,14.770,224.0
+17.1,0.87,13.340,227.5,17.9,0.87,13.900,229.8
+17.4,0.87,12.110,226.3,18.1,0.87,12.470,228.8
+16.5,0.87,14.610,220.9,17.2,0.87,15.640,223.7
+13.5,0.87,12.760,230.9,13.9,0.87,14.200,234.1
+14.5,0.87,16.350,253.1,14.9,0.87,17.860,255.9
+13.1,0.87,12.920,251.8,14.0,0.87,14.940,257.1
+13.1,0.87,13.900,255.4,14.2,0.87,16.110,259.5
+14.5,0.87,16.200,254.1,15.0,0.87,17.760,256.7
+13.2,0.86,15.140,248.0,13.7,0.86,16.670,252.0
+11.9,0.86,14.440,249.0,12.8,0.86,15.950,254.4
+13.3,0.86,14.800,260.5,14.0,0.86,16.520,264.3
+13.6,0.87,14.470,261.9,14.3,0.87,16.250,265.7
+13.2,0.87,14.680,261.5,14.2,0.87,16.350,265.4
+12.2,0.87,11.490,260.8,12.7,0.87,12.580,264.3
+16.4,0.87,8.550,270.1,16.3,0.87,9.260,271.4
+17.7,0.87,7.060,272.9,17.5,0.87,7.240,273.4
+18.8,0.87,9.260,284.5,18.5,0.87,9.440,284.6
+19.5,0.87,9.680,289.8,19.3,0.87,9.850,289.8
+20.3,0.87,9.280,294.2,20.1,0.87,9.440,294.3
+20.5,0.87,7.810,295.0,20.3,0.87,7.920,295.0
+20.5,0.87,6.770,298.4,20.3,0.87,6.880,298.4
+20.3,0.87,6.100,295.4,20.1,0.87,6.340,295.2
+20.1,0.87,5.560,297.3,20.0,0.87,5.770,296.6
+20.2,0.87,5.890,290.3,20.1,0.87,5.740,290.6
+20.1,0.87,5.630,277.7,19.8,0.87,5.360,279.1
+20.4,0.87,4.390,286.5,20.3,0.87,4.350,286.8
+19.1,0.87,3.010,307.8,19.4,0.87,3.050,315.4
+15.3,0.87,2.880,337.3,15.5,0.87,3.080,342.3
+14.5,0.87,2.650,343.3,14.8,0.87,2.710,343.9
+13.6,0.87,2.940,348.7,14.4,0.87,3.030,348.1
+12.8,0.87,0.650,55.1,13.4,0.87,0.890,67.7
+13.2,0.87,0.990,84.6,13.8,0.87,1.510,83.6
+12.8,0.87,0.320,66.1,13.4,0.87,0.560,87.0
+11.8,0.87,0.660,237.6,12.4,0.87,0.760,213.8
+10.9,0.87,1.220,239.9,11.4,0.87,1.280,224.7
+11.3,0.87,1.780,239.4,12.0,0.87,2.120,228.1
+11.3,0.87,2.660,215.7,11.8,0.87,2.870,213.1
+10.0,0.87,4.470,231.4,10.9,0.87,5.000,231.7
+8.8,0.87,3.940,229.7,8.9,0.87,4.770,236.9
+11.1,0.87,3.930,269.8,11.0,0.87,4.000,269.2
+14.3,0.87,4.770,243.8,14.1,0.87,4.860,244.0
+17.4,0.87,6.690,240.6,17.2,0.87,6.820,240.9
+19.6,0.87,7.460,226.7,19.4,0.87,7.620,226.9
+21.1,0.87,10.750,224.7,20.9,0.87,10.990,224.9
+21.0,0.87,11.490,220.0,20.8,0.87,11.760,220.2
+20.1,0.87,12.040,215.5,20.0,0.87,12.830,216.3
+19.0,0.87,12.650,213.9,19.3,0.87,13.810,216.5
+17.7,0.87,13.580,220.2,18.2,0.87,14.700,222.9
+16.5,0.86,14.040,221.1,17.1,0.86,15.340,222.8
+16.5,0.86,15.920,227.1,16.9,0.86,17.170,227.8
+15.8,0.86,15.300,236.0,16.3,0.86,16.650,236.8
+15.5,0.86,15.210,238.6,16.1,0.86,16.680,239.9
+15.2,0.86,14.790,241.1,15.9,0.86,16.460,243.2
+15.1,0.86,14.800,241.2,15.7,0.86,16.270,243.6
+13.9,0.86,15.090,242.9,14.6,0.86,16.620,246.3
+13.4,0.86,15.000,243.5,13.9,0.86,16.500,246.2
+14.1,0.86,16.430,247.9,14.7,0.86,17.830,249.9
+14.2,0.86,16.290,248.3,14.7,0.86,17.720,250.5
+14.1,0.86,15.880,249.0,14.4,0.86,17.360,251.2
+13.3,0.86,15.390,249.2,13.7,0.86,16.730,252.3
+12.1,0.86,14.230,250.1,12.6,0.86,15.970,254.5
+12.8,0.86,13.610,260.8,13.0,0.86,14.470,263.0
+15.7,0.87,10.610,270.4,15.6,0.87,11.230,271.6
+17.1,0.87,7.900,294.1,16.8,0.87,8.050,294.2
+17.7,0.87,8.170,305.9,17.4,0.87,8.300,305.8
+18.1,0.87,6.770,306.8,17.9,0.87,6.850,306.8
+18.1,0.87,4.870,342.6,17.8,0.87,4.920,342.6
+17.9,0.87,6.000,10.9,17.7,0.87,6.060,10.9
+17.8,0.87,6.240,31.4,17.5,0.87,6.340,31.6
+16.4,0.87,8.430,26.4,16.3,0.87,8.800,26.6
+15.8,0.87,10.130,26.9,15.6,0.87,10.680,27.0
+14.3,0.87,10.560,21.2,14.4,0.87,11.410,21.9
+13.3,0.87,11.700,31.6,13.3,0.87,13.210,33.4
+11.8,0.87,10.170,41.6,11.8,0.87,11.750,42.5
+10.5,0.87,9.780,42.2,10.5,0.87,11.520,43.3
+9.4,0.87,9.310,43.2,9.5,0.87,10.870,44.4
+8.8,0.87,8.980,40.7,8.8,0.87,10.390,42.2
+8.1,0.87,9.520,35.7,8.1,0.87,10.870,38.9
+7.2,0.87,8.300,32.1,7.2,0.87,9.790,36.6
+6.5,0.87,7.650,25.4,6.5,0.87,8.600,30.1
+5.9,0.87,7.290,23.2,5.8,0.87,8.260,30.1
+5.2,0.88,7.050,9.4,5.1,0.88,7.530,17.9
+4.8,0.88,7.100,4.1,4.8,0.88,7.560,14.3
+4.4,0.88,7.080,13.6,4.4,0.88,7.540,20.2
+4.2,0.88,5.020,14.2,4.3,0.88,5.250,16.9
+4.0,0.88,3.940,2.8,4.2,0.88,4.190,8.1
+4.6,0.88,2.870,346.4,4.6,0.88,3.070,351.6
+6.4,0.88,3.320,350.9,6.2,0.88,3.330,351.6
+7.9,0.88,3.250,355.3,7.7,0.88,3.250,355.5
+9.1,0.88,2.910,358.1,8.9,0.88,2.890,358.1
+10.2,0.88,2.150,353.9,10.0,0.88,2.130,353.8
+11.0,0.88,1.230,9.2,10.8,0.88,1.200,9.4
+11.4,0.88,0.390,30.2,11.2,0.88,0.350,31.2
+11.4,0.88,0.650,73.5,11.2,0.88,0.550,83.9
+11.4,0.88,2.210,137.8,11.3,0.88,2.340,141.2
+11.4,0.88,3.930,152.4,11.4,0.88,4.080,155.1
+11.5,0.88,5.860,162.3,11.5,0.88,5.960,163.8
+11.0,0.88,6.730,170.3,11.1,0.88,6.880,170.2
+10.2,0.88,7.860,171.6,10.5,0.88,8.050,171.2
+9.7,0.88,8.760,177.9,10.2,0.88,8.940,177.0
+9.0,0.88,9.370,179.5,9.6,0.88,9.700,178.0
+8.8,0.88,9.420,186.6,9.5,0.88,9.750,185.0
+8.6,0.88,9.980,192.6,9.3,0.88,10.320,191.3
+8.1,0.88,10.380,192.3,8.8,0.88,10.750,191.8
+8.2,0.88,10.660,201.8,9.0,0.88,11.140,200.4
+7.6,0.88,11.050,199.7,8.4,0.88,11.670,199.2
+7.1,0.87,11.050,207.0,8.1,0.87,11.880,206.7
+6.4,0.87,11.310,207.3,7.5,0.87,12.190,207.3
+6.8,0.87,11.540,209.8,7.7,0.87,12.230,210.0
+6.0,0.87,10.430,206.0,6.7,0.87,11.250,207.1
+7.3,0.87,9.010,201.5,7.4,0.87,10.010,202.9
+10.1,0.87,8.160,197.8,9.9,0.87,8.380,198.4
+12.1,0.87,9.190,196.1,11.8,0.87,9.360,196.4
+13.5,0.87,10.080,198.9,13.3,0.87,10.270,199.2
+14.6,0.87,10.130,199.8,14.3,0.87,10.340,199.9
+15.1,0.87,9.500,210.5,14.9,0.87,9.690,210.6
+15.3,0.87,9.140,206.3,15.1,0.87,9.350,206.6
+15.1,0.87,8.630,196.1,15.0,0.87,9.120,197.0
+14.5,0.87,11.560,185.4,14.6,0.87,12.140,187.9
+13.3,0.87,12.010,185.1,13.7,0.87,12.870,187.7
+12.1,0.87,12.620,188.0,12.5,0.87,13.760,190.7
+11.6,0.87,13.340,194.4,12.0,0.87,14.500,197.0
+10.3,0.87,12.550,197.7,10.7,0.87,13.690,201.9
+11.0,0.86,14.950,213.1,11.6,0.86,16.220,215.3
+10.8,0.86,15.510,221.7,11.3,0.86,16.940,223.4
+10.2,0.86,14.250,222.0,10.6,0.86,15.550,223.5
+9.0,0.86,13.070,229.1,9.7,0.86,14.100,232.1
+9.6,0.86,11.840,242.0,10.8,0.86,13.300,248.5
+10.3,0.86,9.070,262.4,11.1,0.86,10.590,268.9
+11.1,0.86,5.410,288.8,11.8,0.86,6.210,294.3
+11.1,0.86,5.560,299.2,11.4,0.86,6.530,301.8
+10.7,0.86,10.940,302.0,11.1,0.86,11.980,306.0
+10.8,0.86,11.240,319.5,10.7,0.86,11.190,326.9
+8.7,0.86,9.160,335.8,8.7,0.86,9.440,343.2
+9.2,0.86,7.250,336.7,9.2,0.86,8.150,341.7
+10.5,0.86,8.400,336.9,10.3,0.86,8.500,337.4
+11.6,0.86,9.630,341.9,11.3,0.86,9.730,341.9
+12.6,0.86,9.690,351.6,12.3,0.86,9.830,351.5
+12.7,0.86,9.770,356.6,12.4,0.86,9.900,356.4
+12.5,0.86,9.460,3.8,12.3,0.86,9.580,3.6
+12.1,0.86,7.930,8.5,11.9,0.86,8.050,8.5
+11.4,0.86,7.300,13.9,11.2,0.86,7.560,14.0
+10.3,0.86,8.780,22.7,10.2,0.86,9.310,22.6
+9.3,0.87,9.870,28.8,9.2,0.87,10.580,29.3
+8.3,0.87,8.850,30.6,8.2,0.87,9.840,31.4
+7.3,0.87,9.660,34.7,7.3,0.87,10.500,35.8
+6.3,0.87,7.660,34.8,6.2,0.87,8.810,37.4
+5.5,0.87,7.380,37.9,5.5,0.87,8.550,41.5
+4.8,0.86,7.130,39.0,4.8,0.86,8.400,43.3
+4.2,0.86,6.870,37.0,4.1,0.86,8.030,41.9
+3.5,0.87,6.510,37.6,3.5,0.87,7.490,42.4
+3.0,0.86,5.980,20.4,3.0,0.86,6.790,28.7
+2.5,0.86,5.760,26.4,2.6,0.86,6.550,33.2
+2.2,0.86,4.930,24.2,2.2,0.86,5.340,28.9
+2.0,0.86,5.310,40.9,1.9,0.86,5.900,45.0
+1.7,0.86,5.520,36.2,1.6,0.86,6.010,39.7
+1.4,0.86,4.800,34.3,1.4,0.86,5.010,36.8
+1.4,0.86,3.580,23.8,1.4,0.86,3.840,24.9
+2.3,0.86,2.010,6.5,2.1,0.86,2.030,6.8
+4.0,0.86,1.120,344.6,3.8,0.86,1.100,344.7
+6.0,0.86,0.530,299.0,5.8,0.86,0.520,291.0
+8.1,0.86,1.340,338.5,7.9,0.86,1.260,335.3
+9.6,0.86,1.070,347.7,9.4,0.86,0.960,344.3
+10.7,0.86,1.140,36.6,10.5,0.86,1.040,39.6
+11.3,0.86,2.200,47.1,11.2,0.86,2.150,49.0
+11.1,0.86,2.700,28.3,10.9,0.86,2.590,31.4
+10.4,0.86,3.580,34.2,10.5,0.86,3.360,35.8
+10.3,0.86,3.170,51.0,10.5,0.86,2.990,47.5
+10.9,0.86,4.260,66.2,10.9,0.86,4.170,64.5
+9.5,0.86,6.870,96.1,9.7,0.86,6.520,92.7
+8.8,0.86,7.550,112.0,9.1,0.86,7.120,111.0
+5.8,0.86,6.130,100.6,6.2,0.86,7.090,102.8
+5.4,0.86,6.030,96.5,5.8,0.86,7.160,96.7
+4.7,0.86,7.450,92.0,5.1,0.86,8.040,94.5
+3.6,0.86,6.660,89.9,4.0,0.86,7.750,91.8
+3.0,0.86,5.160,83.5,3.3,0.86,6.160,86.5
+1.9,0.86,5.660,74.2,2.3,0.86,6.720,77.5
+1.8,0.86,6.370,85.2,2.2,0.86,7.440,86.8
+2.0,0.86,5.840,92.5,2.3,0.86,6.880,94.0
+1.2,0.86,4.130,94.9,1.3,0.86,4.860,96.8
+0.8,0.86,4.190,106.4,0.9,0.86,4.980,107.1
+0.6,0.86,4.360,123.4,0.9,0.86,4.980,125.1
+1.6,0.86,3.030,155.7,1.5,0.86,3.160,156.3
+3.2,0.86,3.990,181.1,3.0,0.86,4.060,181.3
+5.1,0.86,5.260,204.0,4.9,0.86,5.350,203.9
+5.5,0.86,7.250,211.0,5.3,0.86,7.250,210.2
+6.1,0.86,6.440,207.7,5.9,0.86,6.500,208.2
+9.0,0.86,5.170,210.0,8.8,0.86,5.270,210.5
+10.7,0.86,5.210,200.2,10.5,0.86,5.270,200.6
+11.7,0.86,6.930,194.9,11.6,0.86,7.290,196.2
+13.6,0.86,10.970,203.1,13.8,0.86,11.500,207.6
+12.3,0.86,10.780,203.0,12.7,0.86,11.720,207.0
+11.2,0.86,11.800,208.3,12.1,0.86,13.200,211.5
+9.8,0.86,11.390,223.0,10.5,0.86,12.560,227.5
+10.6,0.86,13.470,234.6,11.3,0.86,14.710,238.1
+10.5,0.86,13.420,249.4,11.0,0.86,14.620,253.1
+10.8,0.86,13.890,267.0,11.4,0.86,15.390,270.6
+11.3,0.86,13.710,274.3,12.0,0.86,14.570,277.7
+12.0,0.86,12.780,295.5,12.4,0.86,13.340,299.7
+6.6,0.86,9.550,329.6,6.0,0.86,9.850,339.6
+3.3,0.86,6.640,348.4,3.0,0.86,6.460,358.1
+1.7,0.86,6.930,344.9,1.4,0.86,7.060,350.9
+0.2,0.86,7.850,353.7,-0.1,0.86,8.980,2.0
+-0.6,0.87,10.670,2.8,-0.8,0.87,11.400,6.8
+-1.4,0.87,10.110,7.6,-1.5,0.87,10.940,11.7
+-1.9,0.87,9.850,11.4,-2.1,0.87,10.400,12.8
+-1.6,0.87,10.840,20.2,-1.9,0.87,11.050,20.4
+-1.0,0.87,11.130,18.5,-1.2,0.87,11.320,18.6
+-0.2,0.87,10.580,17.2,-0.4,0.87,10.750,17.2
+0.6,0.87,10.430,16.0,0.4,0.87,10.590,15.9
+1.1,0.87,10.150,13.6,0.9,0.87,10.320,13.5
+1.1,0.87,10.800,10.6,0.8,0.87,10.980,10.7
+0.3,0.87,11.490,9.5,0.1,0.87,11.670,9.5
+-1.1,0.87,12.450,5.9,-1.3,0.87,12.670,6.0
+-2.4,0.87,11.520,359.7,-2.6,0.87,11.740,359.9
+-4.2,0.87,10.080,355.2,-4.4,0.87,10.220,355.4
+-4.2,0.87,11.390,353.9,-4.4,0.87,11.570,354.2
+-4.1,0.87,11.920,2.0,-4.4,0.87,12.110,2.0
+-3.2,0.87,12.090,350.3,-3.4,0.87,12.300,350.7
+-3.3,0.87,11.960,3.0,-3.5,0.87,12.200,2.8
+-4.0,0.87,10.640,8.2,-4.2,0.87,11.050,8.1
+-5.4,0.87,12.810,4.3,-5.6,0.87,13.400,4.7
+-6.3,0.87,7.760,351.9,-6.4,0.87,8.090,354.4
+-6.9,0.87,7.790,343.7,-7.0,0.87,7.870,346.6
+-7.1,0.87,7.140,350.0,-7.3,0.87,7.440,353.6
+-7.3,0.87,6.360,345.0,-7.5,0.87,6.740,348.8
+-7.3,0.87,6.620,331.6,-7.4,0.87,6.930,333.9
+-7.2,0.87,5.730,319.9,-7.3,0.87,5.740,322.4
+-7.0,0.87,6.260,312.8,-7.0,0.87,6.280,316.5
+-6.9,0.87,4.510,300.8,-6.9,0.87,4.860,305.7
+-5.5,0.87,3.830,297.9,-5.7,0.87,3.940,297.7
+-3.8,0.87,4.670,294.8,-4.0,0.87,4.750,294.5
+-2.0,0.87,5.040,292.7,-2.2,0.87,5.110,292.4
+-0.5,0.87,5.000,284.8,-0.7,0.87,5.070,284.6
+0.6,0.87,4.630,273.2,0.4,0.87,4.690,272.8
+1.5,0.87,4.920,268.4,1.3,0.87,5.000,268.4
+2.1,0.87,4.640,269.3,1.9,0.87,4.730,269.4
+2.3,0.87,4.080,264.3,2.1,0.87,4.320,264.9
+2.1,0.87,4.200,263.8,2.1,0.87,4.430,265.9
+2.0,0.87,3.070,249.8,1.9,0.87,3.220,253.6
+1.7,0.87,2.890,231.8,1.6,0.87,2.880,237.3
+1.9,0.87,3.070,227.1,1.9,0.87,3.110,232.7
+1.8,0.87,2.900,217.6,1.9,0.87,2.540,223.7
+1.1,0.87,3.600,206.5,1.4,0.87,3.160,210.0
+0.1,0.87,4.810,184.9,0.6,0.87,4.310,187.5
+0.3,0.87,5.980,202.3,0.5,0.87,5.760,199.7
+1.2,0.87,4.790,193.0,1.5,0.87,4.710,193.6
+1.3,0.87,3.900,190.1,1.6,0.87,3.690,189.6
+1.2,0.87,3.040,197.5,1.5,0.87,2.630,193.8
+-2.0,0.87,2.140,328.5,-1.5,0.87,1.870,330.5
+0.1,0.87,0.640,248.1,0.6,0.87,0.790,229.3
+-1.5,0.87,2.080,6.0,-0.8,0.87,1.810,3.7
+-3.9,0.87,5.610,337.3,-3.6,0.87,5.760,336.3
+-3.2,0.87,5.040,322.2,-2.7,0.87,5.120,329.2
+-2.5,0.87,2.800,324.4,-2.3,0.87,3.370,331.2
+-0.6,0.87,2.210,332.0,-0.7,0.87,2.180,332.4
+1.2,0.87,1.800,347.1,1.0,0.87,1.770,347.8
+2.6,0.87,0.990,24.5,2.4,0.87,0.940,28.0
+3.6,0.87,0.880,44.9,3.3,0.87,0.840,51.0
+4.3,0.87,0.660,41.3,4.1,0.87,0.610,50.3
+4.8,0.87,1.220,189.6,4.5,0.87,1.310,189.1
+4.5,0.87,4.300,177.2,4.4,0.87,4.340,178.5
+4.3,0.87,6.390,183.6,4.0,0.87,6.290,185.1
+3.5,0.87,6.820,183.1,3.3,0.87,6.670,184.3
+2.6,0.87,7.110,185.2,2.6,0.87,7.090,186.9
+1.9,0.87,8.480,193.1,2.0,0.87,8.490,193.9
+1.7,0.87,9.080,200.8,1.9,0.87,9.110,200.4
+0.6,0.87,10.310,207.2,1.2,0.87,10.310,207.2
+1.0,0.87,9.930,210.0,1.7,0.87,9.910,209.9
+0.5,0.87,10.360,212.3,1.5,0.87,10.300,211.3
+0.1,0.87,11.190,209.3,1.1,0.87,11.440,208.8
+-1.1,0.87,12.780,214.2,0.1,0.87,13.470,213.2
+-0.6,0.87,13.660,212.0,0.5,0.87,14.600,213.0
+0.0,0.87,14.630,212.3,1.3,0.87,15.940,214.0
+-0.5,0.87,15.130,207.7,0.1,0.87,16.550,211.2
+-1.0,0.87,14.350,216.3,-0.3,0.87,15.950,219.0
+0.4,0.87,17.480,224.1,1.0,0.87,18.730,225.5
+1.5,0.87,16.800,226.7,1.7,0.87,17.730,227.7
+3.0,0.87,12.030,226.0,2.9,0.87,12.540,226.7
+5.0,0.87,9.780,228.1,4.8,0.87,9.980,228.5
+6.9,0.87,7.790,230.6,6.7,0.87,7.950,230.9
+8.8,0.87,8.430,230.8,8.6,0.87,8.560,231.1
+10.2,0.87,8.200,228.0,10.0,0.87,8.330,228.3
+11.1,0.87,8.540,225.8,10.9,0.87,8.670,226.0
+11.4,0.87,9.010,222.2,11.2,0.87,9.190,222.4
+11.0,0.87,9.530,217.9,10.9,0.87,10.220,220.1
+9.5,0.87,11.020,217.9,9.8,0.87,12.280,220.7
+9.1,0.87,14.380,219.7,9.4,0.87,15.290,221.2
+8.1,0.87,13.730,218.6,8.5,0.87,14.820,219.9
+7.2,0.87,14.780,224.0,7.8,0.87,16.150,225.0
+7.4,0.87,15.080,224.1,8.0,0.87,16.370,225.3
+7.3,0.87,14.840,225.7,7.9,0.87,15.950,227.7
+7.0,0.87,14.740,229.5,7.7,0.87,16.130,231.8
+7.6,0.87,15.570,239.6,8.6,0.87,17.140,241.0
+7.6,0.87,14.580,240.2,8.8,0.87,16.200,242.5
+7.8,0.87,14.050,241.7,9.0,0.87,15.670,244.3
+6.9,0.87,12.630,241.0,8.4,0.87,14.250,245.2
+6.5,0.87,12.660,243.1,8.6,0.87,14.100,248.7
+7.2,0.87,12.360,246.4,9.2,0.87,13.430,252.2
+7.2,0.87,11.700,244.1,9.1,0.87,12.070,248.5
+7.5,0.87,12.420,244.3,9.1,0.87,12.630,247.6
+6.6,0.87,10.990,245.0,8.5,0.87,12.010,247.9
+8.4,0.87,6.950,248.1,9.1,0.87,8.040,249.4
+10.4,0.87,5.450,236.6,10.4,0.87,6.420,240.2
+12.6,0.87,5.850,222.8,12.4,0.87,5.930,223.5
+13.8,0.87,6.740,220.3,13.6,0.87,6.800,220.8
+14.2,0.87,6.840,218.2,14.0,0.87,6.900,218.6
+14.6,0.87,6.380,211.3,14.4,0.87,6.470,211.6
+14.9,0.87,5.870,198.2,14.7,0.87,5.990,198.5
+14.6,0.87,7.870,195.5,14.4,0.87,8.020,196.9
+13.5,0.87,10.140,188.7,13.6,0.87,10.540,191.1
+12.3,0.87,11.460,196.9,12.5,0.87,11.810,198.9
+11.5,0.87,12.570,199.5,11.8,0.87,12.930,200.1
+9.8,0.87,12.490,200.0,10.1,0.87,13.220,201.0
+8.8,0.87,13.600,206.8,9.4,0.87,14.780,206.7
+9.1,0.87,13.730,209.3,9.9,0.87,14.860,208.8
+8.8,0.87,13.060,207.1,9.5,0.87,14.180,205.7
+7.5,0.87,13.420,206.5,8.0,0.87,14.490,207.5
+7.3,0.87,13.690,216.6,8.0,0.87,14.550,218.3
+6.3,0.87,12.460,215.6,6.8,0.87,13.240,217.8
+4.7,0.87,13.090,206.9,5.1,0.87,14.160,210.0
+1.7,0.87,11.150,203.7,1.7,0.87,11.800,204.5
+3.3,0.87,11.740,199.8,3.3,0.87,12.490,200.3
+4.4,0.86,9.670,192.9,4.3,0.86,10.070,192.9
+5.0,0.86,8.790,181.3,5.0,0.86,9.230,181.5
+5.8,0.86,11.510,178.1,5.7,0.86,12.070,178.6
+6.5,0.86,13.080,172.4,6.4,0.86,13.710,173.0
+7.0,0.86,11.800,174.3,6.9,0.86,12.340,174.5
+7.7,0.86,11.130,170.7,7.6,0.86,11.700,170.9
+8.5,0.86,11.210,176.3,8.4,0.86,11.700,176.7
+9.6,0.86,9.290,192.9,9.4,0.86,9.740,194.1
+9.7,0.86,11.190,186.5,9.6,0.86,11.830,188.4
+11.2,0.86,9.250,182.6,11.1,0.86,9.770,183.5
+10.9,0.86,9.140,269.1,10.8,0.86,9.530,266.8
+10.8,0.86,15.230,232.3,10.7,0.86,16.050,232.9
+9.3,0.86,12.670,240.7,9.4,0.86,13.760,241.4
+8.1,0.86,15.390,234.1,8.2,0.86,16.730,235.4
+7.7,0.86,13.110,238.0,7.7,0.86,14.340,238.9
+6.9,0.86,15.310,237.8,7.0,0.86,16.500,239.0
+6.3,0.86,16.800,237.1,6.4,0.86,18.060,238.9
+6.0,0.86,17.440,248.2,6.0,0.86,18.690,249.1
+5.6,0.86,17.490,249.9,5.6,0.86,18.690,251.0
+5.2,0.86,18.380,253.0,5.3,0.86,19.690,254.3
+5.0,0.86,17.050,256.5,5.1,0.86,18.480,257.7
+5.0,0.86,17.120,261.3,5.1,0.86,18.610,262.3
+4.5,0.86,14.670,256.7,4.7,0.86,16.360,258.9
+4.0,0.86,13.640,252.9,4.3,0.86,15.350,255.7
+4.7,0.86,16.600,258.4,5.0,0.86,17.990,260.5
+4.0,0.86,14.960,255.7,4.4,0.86,16.600,258.3
+4.2,0.86,12.430,257.4,4.3,0.86,13.590,258.5
+6.0,0.86,11.400,254.1,5.8,0.86,12.330,255.3
+8.1,0.86,11.690,258.1,7.9,0.86,11.940,258.2
+9.7,0.86,14.210,250.5,9.5,0.86,14.490,250.7
+10.2,0.86,13.900,247.6,10.0,0.86,14.200,247.7
+10.9,0.86,14.410,244.4,10.6,0.86,14.730,244.5
+11.4,0.86,14.820,247.1,11.2,0.86,15.160,247.2
+11.4,0.86,14.770,247.8,11.2,0.86,15.130,247.9
+11.0,0.86,13.060,244.3,10.9,0.86,13.790,244.8
+10.1,0.86,12.910,241.2,10.1,0.86,13.750,242.9
+9.1,0.86,15.160,243.5,9.2,0.86,16.240,244.3
+8.5,0.86,15.030,245.4,8.7,0.86,16.140,246.2
+8.0,0.86,15.540,247.7,8.1,0.86,16.710,248.7
+7.2,0.86,14.370,245.5,7.4,0.86,15.580,246.9
+6.3,0.86,10.330,246.1,6.5,0.86,11.820,249.3
+6.4,0.86,13.480,253.6,6.6,0.86,14.820,255.4
+6.3,0.86,14.180,254.4,6.4,0.86,15.540,256.1
+6.3,0.86,13.550,258.5,6.4,0.86,15.000,259.4
+6.5,0.86,12.850,250.5,6.6,0.86,14.290,251.7
+6.0,0.86,13.490,253.7,6.1,0.86,14.850,254.8
+5.4,0.86,16.020,259.0,5.5,0.86,17.430,260.7
+5.1,0.86,15.640,255.4,5.2,0.86,16.920,256.6
+4.6,0.86,14.560,260.1,4.7,0.86,15.710,260.6
+4.3,0.86,14.890,258.9,4.4,0.86,16.270,260.1
+4.7,0.86,16.700,264.6,4.7,0.86,17.540,265.2
+5.8,0.86,13.800,264.0,5.6,0.86,14.230,264.4
+7.1,0.86,12.290,268.3,6.9,0.86,12.480,268.5
+8.5,0.86,11.310,277.9,8.2,0.86,11.530,278.0
+9.3,0.86,10.910,280.6,9.1,0.86,11.090,280.7
+9.8,0.86,10.270,282.1,9.6,0.86,10.450,282.2
+10.1,0.86,9.930,283.9,9.9,0.86,10.120,283.9
+10.1,0.86,9.950,281.4,9.9,0.86,10.150,281.3
+9.9,0.86,7.690,284.9,9.8,0.86,8.180,284.9
+9.3,0.86,8.850,262.7,9.2,0.86,9.260,264.2
+7.5,0.86,12.400,261.6,7.6,0.86,13.940,265.4
+6.5,0.86,13.030,265.6,6.7,0.86,14.450,268.1
+6.0,0.86,13.980,276.6,6.2,0.86,15.230,279.1
+6.3,0.86,13.120,284.1,6.4,0.86,14.090,286.3
+4.1,0.86,8.040,313.1,4.2,0.86,8.730,308.4
+3.2,0.86,5.960,344.5,3.1,0.86,5.610,350.5
+2.8,0.86,9.380,316.2,2.9,0.86,9.620,316.2
+2.8,0.86,9.320,297.4,2.9,0.86,9.030,302.8
+3.8,0.86,8.340,297.0,3.9,0.86,8.270,301.8
+4.0,0.86,8.240,292.7,4.3,0.86,7.820,297.5
+3.8,0.86,9.980,285.3,4.2,0.86,10.180,292.2
+3.8,0.86,9.970,283.2,4.2,0.86,9.680,292.2
+3.6,0.86,9.240,291.7,3.9,0.86,9.010,298.2
+4.1,0.86,9.180,286.3,4.4,0.86,8.240,292.0
+3.5,0.86,8.960,282.4,4.0,0.86,9.020,286.8
+4.2,0.86,5.890,278.7,4.2,0.86,6.790,281.1
+6.0,0.86,5.350,278.1,5.8,0.86,5.440,278.3
+7.5,0.86,5.750,274.9,7.3,0.86,5.850,274.8
+8.7,0.86,7.040,274.7,8.5,0.86,7.190,274.7
+10.2,0.86,9.310,273.0,10.0,0.86,9.480,273.1
+11.6,0.86,9.340,278.9,11.4,0.86,9.540,278.9
+12.2,0.86,9.530,279.5,12.0,0.86,9.740,279.6
+11.9,0.86,8.530,264.6,11.8,0.86,9.280,265.2
+11.5,0.86,11.890,250.6,11.6,0.86,12.830,252.4
+10.3,0.86,14.280,255.2,10.5,0.86,15.490,257.5
+9.5,0.86,14.850,267.1,9.9,0.86,16.120,269.7
+10.0,0.86,14.930,272.9,10.4,0.86,16.230,275.8
+9.7,0.86,13.240,277.1,10.3,0.86,14.870,281.1
+7.8,0.86,11.450,262.5,8.5,0.86,12.840,266.4
+7.6,0.86,11.340,262.0,8.2,0.86,12.580,266.9
+7.1,0.86,11.990,263.2,7.7,0.86,13.050,266.8
+7.3,0.86,11.650,259.8,8.0,0.86,12.610,264.0
+6.7,0.86,12.480,259.8,7.8,0.86,12.960,266.0
+6.8,0.86,11.790,260.8,8.0,0.86,12.200,267.0
+6.2,0.86,11.940,256.2,7.7,0.86,11.770,261.4
+7.1,0.86,11.380,260.1,8.4,0.86,10.520,265.8
+7.3,0.86,11.020,262.4,8.5,0.86,9.960,268.0
+7.9,0.86,10.410,263.0,8.9,0.86,9.110,267.3
+8.7,0.86,8.900,262.2,9.6,0.86,8.040,267.9
+9.0,0.86,7.830,255.1,9.7,0.86,7.720,258.4
+10.0,0.86,3.540,270.7,9.8,0.86,3.620,270.5
+11.4,0.86,2.620,297.1,11.2,0.86,2.650,295.8
+12.5,0.86,2.410,256.4,12.3,0.86,2.440,255.8
+13.4,0.86,2.880,212.8,13.2,0.86,2.910,212.9
+13.9,0.86,4.190,200.3,13.7,0.86,4.250,200.5
+13.9,0.86,5.000,206.9,13.7,0.86,5.100,206.9
+14.2,0.86,6.070,210.7,14.1,0.86,6.580,213.0
+13.8,0.86,9.550,204.3,13.8,0.86,9.940,206.7
+13.0,0.86,9.840,208.4,13.2,0.86,10.580,211.6
+11.7,0.86,11.620,206.5,12.2,0.86,12.520,207.2
+13.1,0.86,11.050,210.6,13.6,0.86,11.600,210.5
+13.2,0.86,11.120,201.5,13.7,0.86,11.800,200.6
+12.1,0.86,10.570,199.7,12.3,0.86,11.100,200.8
+11.0,0.86,8.240,209.9,11.4,0.86,9.370,211.4
+10.2,0.86,9.300,214.1,10.6,0.86,10.710,217.3
+9.8,0.86,10.720,226.8,10.6,0.86,12.060,229.6
+10.5,0.86,11.230,231.1,11.3,0.86,12.380,232.8
+10.4,0.86,10.760,228.8,10.8,0.86,11.840,231.5
+10.9,0.86,11.520,231.8,11.3,0.86,12.820,233.8
+11.7,0.86,13.800,233.7,12.0,0.86,15.390,234.7
+12.1,0.86,12.440,232.5,12.3,0.86,13.730,233.3
+11.5,0.86,12.320,221.7,11.7,0.86,13.610,223.8
+11.0,0.86,12.250,225.8,11.1,0.86,13.280,227.4
+12.8,0.86,11.820,235.9,12.7,0.86,12.860,237.3
+13.8,0.85,12.350,247.7,13.5,0.85,12.650,247.9
+14.2,0.85,13.030,244.8,14.0,0.85,13.390,244.9
+14.1,0.85,14.480,242.9,13.8,0.85,14.840,242.9
+13.0,0.85,15.930,255.8,12.8,0.85,16.280,255.8
+11.8,0.86,14.540,261.9,11.6,0.86,14.880,262.0
+11.1,0.86,16.020,266.5,10.8,0.86,16.400,266.5
+5.6,0.86,13.090,337.7,5.4,0.86,13.380,337.9
+3.7,0.86,11.940,341.5,3.4,0.86,12.370,341.4
+0.7,0.86,15.360,341.9,0.5,0.86,15.720,342.0
+-0.3,0.86,16.170,335.1,-0.5,0.86,16.580,335.4
+-1.6,0.87,15.430,341.2,-1.8,0.87,15.940,341.3
+-2.3,0.87,15.140,336.1,-2.5,0.87,15.660,336.4
+-2.8,0.87,13.550,334.9,-3.0,0.87,14.130,335.1
+-2.9,0.87,13.010,329.2,-3.1,0.87,13.670,329.6
+-2.9,0.87,13.050,321.5,-3.0,0.87,13.760,322.6
+-3.1,0.87,12.770,321.2,-3.2,0.87,13.500,322.7
+-3.4,0.87,12.430,319.8,-3.5,0.87,13.150,321.3
+-3.7,0.87,13.110,324.3,-3.8,0.87,13.940,325.7
+-3.7,0.87,12.320,320.5,-3.7,0.87,13.100,322.2
+-3.5,0.87,11.820,317.0,-3.5,0.87,12.540,319.3
+-3.5,0.87,11.510,316.1,-3.5,0.87,12.260,318.2
+-3.2,0.88,11.850,315.2,-3.2,0.88,12.490,317.8
+-2.7,0.88,11.620,320.7,-2.8,0.88,12.150,322.3
+-2.1,0.88,8.340,311.7,-2.3,0.88,8.520,312.6
+-0.3,0.88,7.660,308.8,-0.5,0.88,7.750,308.9
+1.2,0.88,8.240,308.6,0.9,0.88,8.340,308.6
+2.9,0.88,7.380,300.0,2.7,0.88,7.490,299.9
+4.1,0.88,6.960,298.7,3.9,0.88,7.060,298.7
+5.0,0.88,5.810,293.5,4.8,0.88,5.890,293.4
+5.7,0.88,5.390,285.0,5.5,0.88,5.470,284.9
+5.8,0.88,5.320,263.4,5.6,0.88,5.510,263.7
+5.7,0.88,7.010,257.1,5.6,0.88,7.220,257.7
+5.9,0.88,8.610,250.1,5.7,0.88,8.620,250.6
+6.1,0.88,9.150,246.4,6.1,0.88,9.170,245.4
+5.5,0.88,11.350,248.4,5.8,0.88,10.870,247.6
+4.2,0.88,11.540,242.1,5.3,0.88,11.480,242.9
+4.6,0.88,12.350,251.6,5.7,0.88,12.440,251.9
+3.5,0.88,11.980,253.8,4.8,0.88,12.670,255.8
+2.7,0.88,12.430,250.4,4.0,0.88,13.630,253.3
+2.3,0.88,12.180,256.4,3.4,0.88,13.550,259.5
+3.4,0.88,13.500,257.2,4.5,0.88,14.600,260.1
+3.8,0.88,13.370,255.8,4.9,0.88,14.430,259.4
+3.6,0.88,12.820,254.2,5.0,0.88,13.840,258.1
+1.6,0.88,10.530,251.3,3.1,0.88,11.990,256.8
+1.1,0.88,9.890,249.4,2.6,0.88,11.490,254.7
+1.2,0.88,9.150,250.7,2.7,0.88,10.670,255.2
+0.6,0.88,6.940,248.8,1.6,0.88,8.340,251.8
+3.6,0.88,4.470,256.1,3.7,0.88,5.820,256.3
+7.0,0.88,4.050,246.8,6.8,0.88,4.180,247.4
+9.5,0.87,4.660,242.0,9.3,0.87,4.730,242.3
+10.9,0.87,5.070,228.2,10.7,0.87,5.130,228.9
+12.4,0.87,6.720,226.0,12.2,0.87,6.810,226.5
+13.0,0.87,6.920,224.3,12.8,0.87,7.030,224.6
+12.8,0.87,7.040,219.6,12.6,0.87,7.280,220.1
+12.2,0.87,7.670,211.2,12.1,0.87,8.270,214.0
+10.5,0.87,12.050,215.4,10.5,0.87,12.580,217.3
+8.9,0.87,12.360,218.6,9.3,0.87,13.220,221.2
+7.3,0.87,12.210,224.9,7.9,0.87,13.420,227.5
+5.9,0.87,12.990,225.8,6.7,0.87,14.310,228.4
+6.0,0.87,13.530,228.8,7.0,0.87,14.990,230.7
+5.7,0.87,11.890,229.9,6.6,0.87,13.500,232.5
+6.2,0.87,13.110,234.2,6.8,0.87,14.570,236.2
+5.9,0.87,13.120,233.8,6.6,0.87,14.660,236.2
+5.5,0.87,12.390,239.3,6.0,0.87,13.910,241.3
+5.1,0.87,13.350,242.9,5.9,0.87,14.990,244.7
+4.6,0.87,13.550,238.9,5.6,0.87,15.290,241.8
+4.7,0.87,13.520,238.2,5.6,0.87,15.170,240.5
+5.3,0.87,15.210,236.8,6.4,0.87,16.410,238.1
+5.4,0.87,15.560,236.1,6.6,0.87,16.730,237.9
+5.0,0.87,15.270,237.2,6.0,0.87,16.500,239.2
+4.5,0.87,11.080,242.9,4.9,0.87,12.100,244.0
+5.6,0.87,6.240,253.2,5.4,0.87,6.810,252.8
+7.8,0.87,4.880,251.5,7.6,0.87,4.970,251.8
+9.9,0.87,5.140,250.7,9.7,0.87,5.220,250.8
+11.7,0.87,5.760,248.8,11.5,0.87,5.860,249.0
+13.2,0.87,6.040,251.7,13.0,0.87,6.130,251.7
+14.0,0.87,5.990,256.9,13.8,0.87,6.080,256.9
+14.4,0.87,4.940,258.7,14.2,0.87,5.050,259.0
+14.5,0.87,3.650,271.0,14.4,0.87,3.970,271.1
+12.5,0.87,1.690,313.1,12.6,0.87,2.160,305.0
+11.8,0.87,1.420,232.8,11.8,0.87,1.510,243.8
+12.2,0.87,3.580,258.0,12.2,0.87,3.140,259.1
+12.0,0.87,4.610,263.6,12.1,0.87,4.120,268.7
+10.1,0.87,5.230,320.6,10.2,0.87,5.090,321.8
+7.8,0.87,7.200,319.9,8.0,0.87,7.220,321.4
+7.7,0.87,7.510,325.1,8.3,0.87,7.170,333.7
+6.5,0.87,6.540,327.4,7.0,0.87,6.060,335.7
+5.8,0.87,5.740,330.6,6.1,0.87,5.530,335.4
+4.9,0.87,7.470,323.6,5.3,0.87,7.010,327.1
+4.2,0.87,7.180,323.2,4.7,0.87,6.780,327.6
+3.9,0.87,6.430,318.9,4.5,0.87,5.920,323.7
+3.6,0.87,5.960,315.9,4.4,0.87,5.440,318.5
+5.3,0.87,4.980,309.7,5.9,0.87,4.600,312.7
+6.7,0.87,5.090,298.6,7.1,0.87,5.140,297.8
+6.5,0.87,6.610,299.6,7.3,0.87,6.880,298.2
+7.3,0.87,5.560,282.4,7.6,0.87,6.090,285.4
+9.7,0.86,5.080,281.9,9.6,0.86,5.690,281.7
+12.3,0.86,5.750,268.1,12.1,0.86,5.890,268.7
+13.8,0.86,6.350,310.9,13.6,0.86,6.460,310.0
+12.5,0.86,5.170,334.1,12.3,0.86,5.200,332.7
+12.9,0.86,6.160,338.6,12.7,0.86,6.190,338.1
+12.6,0.86,5.820,337.5,12.4,0.86,5.900,336.6
+12.6,0.86,5.430,314.1,12.5,0.86,5.970,313.9
+12.9,0.87,5.870,314.5,12.9,0.87,6.100,317.0
+12.9,0.87,7.370,322.8,13.0,0.87,7.420,328.9
+9.5,0.87,9.460,0.9,9.4,0.87,9.350,11.7
+8.2,0.87,6.230,39.4,8.4,0.87,6.710,36.8
+6.1,0.87,5.650,42.8,6.1,0.87,6.350,42.1
+4.9,0.87,4.970,36.5,5.1,0.87,5.310,35.6
+3.9,0.87,3.310,32.6,4.0,0.87,3.740,34.0
+3.3,0.87,1.770,17.1,3.5,0.87,2.230,20.2
+3.2,0.87,2.600,1.7,3.3,0.87,2.970,5.5
+2.6,0.87,2.850,350.8,2.8,0.87,3.050,356.8
+2.2,0.87,2.290,16.7,2.5,0.87,2.470,26.6
+1.9,0.87,2.650,53.8,2.4,0.87,2.970,61.5
+2.3,0.87,3.270,97.2,2.7,0.87,3.790,97.8
+1.7,0.87,3.200,131.6,2.0,0.87,3.710,128.3
+1.3,0.87,5.330,132.8,1.7,0.87,5.820,133.3
+1.2,0.86,6.800,142.8,1.7,0.86,7.280,142.6
+1.9,0.86,5.640,155.2,1.8,0.86,5.990,155.4
+3.5,0.86,7.560,162.3,3.3,0.86,7.660,162.4
+5.2,0.86,7.780,167.0,5.0,0.86,7.870,167.3
+6.6,0.86,8.950,164.8,6.4,0.86,9.070,165.2
+7.9,0.86,9.800,168.5,7.7,0.86,9.930,168.8
+8.5,0.86,9.730,167.9,8.3,0.86,9.860,168.2
+8.4,0.86,10.030,162.2,8.2,0.86,10.200,162.5
+5.9,0.86,9.400,150.9,5.8,0.86,9.750,152.8
+4.0,0.86,11.250,153.4,3.9,0.86,11.750,154.4
+3.5,0.86,12.060,156.3,3.5,0.86,12.560,157.2
+2.7,0.86,12.510,154.1,2.7,0.86,12.940,154.6
+2.1,0.86,12.510,153.6,2.0,0.86,12.990,153.8
+0.4,0.86,13.430,149.9,0.5,0.86,14.010,150.2
+-0.8,0.86,13.980,145.5,-0.7,0.86,14.570,145.6
+-1.5,0.86,13.310,140.7,-1.6,0.86,13.970,140.6
+-2.5,0.86,7.920,116.9,-2.6,0.86,9.130,117.6
+-3.2,0.86,6.660,98.5,-3.4,0.86,6.860,99.2
+-4.2,0.86,7.440,63.7,-4.4,0.86,7.510,64.3
+-5.2,0.86,9.090,42.0,-5.4,0.86,9.200,42.2
+-6.6,0.86,10.120,29.6,-6.8,0.86,10.460,29.9
+-7.8,0.86,11.540,24.0,-8.0,0.86,11.780,24.2
+-8.3,0.86,12.760,17.7,-8.5,0.86,13.000,17.8
+-8.6,0.86,13.420,13.8,-8.8,0.86,13.660,13.8
+-9.4,0.87,13.110,10.0,-9.6,0.87,13.330,10.1
+-9.5,0.87,12.700,6.6,-9.7,0.87,12.920,6.7
+-9.2,0.87,13.900,5.2,-9.5,0.87,14.090,5.3
+-9.2,0.87,13.770,359.8,-9.5,0.87,13.950,0.0
+-8.5,0.87,12.930,3.0,-8.7,0.87,13.110,3.0
+-7.6,0.87,13.270,358.0,-7.8,0.87,13.460,358.1
+-7.2,0.87,13.140,358.4,-7.4,0.87,13.330,358.4
+-6.9,0.87,12.430,359.6,-7.1,0.87,12.640,359.6
+-7.0,0.87,11.330,4.9,-7.2,0.87,11.570,4.8
+-7.6,0.87,9.460,6.6,-7.8,0.87,9.960,6.6
+-7.8,0.87,9.000,357.1,-7.9,0.87,9.520,358.5
+-8.2,0.87,7.350,351.9,-8.3,0.87,7.590,353.7
+-8.8,0.87,9.020,1.4,-9.0,0.87,9.510,3.3
+-9.3,0.87,8.180,3.7,-9.5,0.87,8.750,5.3
+-9.8,0.87,8.420,6.9,-10.0,0.87,9.000,8.9
+-10.2,0.87,7.970,8.2,-10.3,0.87,8.550,10.5
+-10.5,0.87,6.960,2.5,-10.7,0.87,7.440,5.9
+-10.8,0.87,6.380,351.3,-11.0,0.87,6.870,356.4
+-11.2,0.87,5.620,337.0,-11.3,0.87,5.820,342.8
+-11.6,0.87,5.630,341.3,-11.7,0.87,5.750,346.3
+-11.9,0.87,4.130,356.8,-12.0,0.87,4.400,1.3
+-12.1,0.87,3.570,353.9,-12.1,0.87,3.750,358.0
+-12.0,0.87,1.840,331.9,-12.1,0.87,2.080,339.1
+-11.8,0.87,0.650,307.9,-11.7,0.87,0.810,319.4
+-11.0,0.87,1.100,225.6,-10.9,0.87,1.170,233.7
+-8.9,0.87,2.470,192.3,-9.1,0.87,2.490,192.6
+-6.2,0.87,4.110,188.5,-6.4,0.87,4.150,188.7
+-3.9,0.87,5.540,190.7,-4.1,0.87,5.610,190.9
+-1.7,0.87,6.590,190.9,-1.9,0.87,6.680,191.1
+-0.0,0.87,8.130,184.8,-0.2,0.87,8.250,185.2
+0.9,0.87,9.190,183.5,0.7,0.87,9.350,183.8
+1.4,0.86,9.790,182.1,1.2,0.86,9.980,182.4
+0.8,0.86,10.740,181.5,0.7,0.86,11.350,182.2
+-0.3,0.86,11.570,176.0,-0.3,0.86,12.310,177.2
+-1.0,0.86,13.870,177.3,-1.0,0.86,14.660,178.0
+-1.8,0.86,13.120,178.4,-1.7,0.86,13.990,179.5
+-2.4,0.86,14.150,182.4,-2.3,0.86,15.040,183.7
+-2.9,0.86,14.930,183.2,-2.8,0.86,15.710,184.8
+-3.3,0.86,14.230,187.4,-3.1,0.86,14.990,189.9
+-3.9,0.86,12.410,186.5,-3.6,0.86,13.480,189.6
+-4.2,0.86,11.970,186.3,-4.0,0.86,12.930,188.5
+-4.3,0.86,12.640,188.6,-4.3,0.86,13.440,190.8
+-4.4,0.86,12.000,190.4,-4.3,0.86,12.790,193.9
+-3.7,0.86,11.610,198.4,-3.5,0.86,12.680,203.0
+-3.3,0.86,12.350,209.6,-2.9,0.86,13.710,213.4
+-3.1,0.86,13.250,216.3,-2.4,0.86,14.450,220.2
+-3.0,0.86,12.310,221.8,-1.9,0.86,13.480,228.1
+-1.5,0.86,12.010,233.9,0.1,0.86,13.240,241.8
+0.8,0.86,11.780,245.6,1.4,0.86,12.960,249.9
+3.8,0.86,10.830,247.4,3.7,0.86,11.750,249.9
+5.4,0.86,9.280,250.2,5.2,0.86,9.430,250.6
+6.3,0.86,8.410,268.3,6.1,0.86,8.540,268.1
+6.9,0.86,8.200,267.9,6.7,0.86,8.320,267.8
+7.3,0.86,6.350,275.6,7.1,0.86,6.440,275.7
+7.5,0.86,5.180,280.9,7.3,0.86,5.250,280.6
+7.5,0.86,4.190,279.8,7.2,0.86,4.240,279.3
+7.2,0.86,3.910,295.3,7.0,0.86,3.930,294.4
+6.7,0.86,3.090,312.2,6.6,0.86,3.160,310.7
+1.5,0.86,9.320,71.8,1.1,0.86,10.270,73.7
+-1.3,0.86,7.760,60.3,-1.5,0.86,8.780,59.9
+-3.5,0.86,7.860,45.9,-3.6,0.86,8.800,48.3
+-4.7,0.86,6.760,42.4,-4.9,0.86,7.660,44.4
+-5.6,0.86,6.620,38.1,-5.8,0.86,7.400,40.7
+-6.3,0.86,6.350,33.0,-6.5,0.86,7.010,35.5
+-7.1,0.86,7.070,23.5,-7.3,0.86,7.400,24.6
+-7.8,0.86,8.110,12.6,-8.0,0.86,8.210,13.0
+-8.6,0.86,8.410,8.3,-8.8,0.86,8.500,8.8
+-9.5,0.86,8.690,10.5,-9.7,0.86,8.890,11.1
+-9.9,0.86,8.490,5.2,-10.1,0.86,8.850,6.2
+-9.9,0.87,7.640,3.7,-10.1,0.87,8.050,4.2
+-10.0,0.87,7.150,344.9,-10.1,0.87,7.450,347.0
+-10.0,0.87,7.430,346.8,-10.1,0.87,7.860,350.1
+-9.7,0.87,6.460,350.0,-9.8,0.87,6.720,352.0
+-8.5,0.87,6.320,348.8,-8.7,0.87,6.390,349.2
+-7.0,0.87,5.720,342.1,-7.3,0.87,5.780,342.4
+-5.4,0.87,5.560,344.1,-5.6,0.87,5.620,344.4
+-4.0,0.87,5.420,345.2,-4.3,0.87,5.480,345.5
+-2.5,0.87,5.330,347.2,-2.7,0.87,5.390,347.4
+-1.7,0.87,5.120,343.7,-1.9,0.87,5.170,343.9
+-1.3,0.87,5.050,340.1,-1.5,0.87,5.120,340.2
+-1.2,0.87,3.890,332.3,-1.4,0.87,3.970,332.4
+-1.3,0.87,3.160,302.8,-1.4,0.87,3.200,305.0
+-1.2,0.87,4.550,274.7,-1.4,0.87,4.350,277.0
+-0.8,0.87,4.790,280.9,-1.0,0.87,4.640,283.4
+-0.6,0.87,5.160,299.7,-0.7,0.87,5.100,300.7
+-0.7,0.87,5.310,309.4,-0.7,0.87,5.360,311.3
+-1.2,0.87,5.090,314.2,-1.1,0.87,5.240,314.5
+-1.8,0.87,4.390,315.4,-1.5,0.87,4.710,316.2
+-2.5,0.87,4.310,322.8,-2.2,0.87,4.660,321.9
+-3.0,0.87,4.490,323.9,-2.6,0.87,4.800,325.1
+-3.0,0.87,4.170,310.1,-2.7,0.87,4.540,311.9
+-2.7,0.87,5.130,309.6,-2.4,0.87,5.490,310.5
+-2.3,0.87,5.710,305.1,-2.0,0.87,5.680,306.9
+-2.4,0.87,5.930,306.1,-1.9,0.87,5.700,307.9
+-2.5,0.87,5.800,305.4,-2.0,0.87,5.570,307.2
+-3.1,0.87,5.320,304.5,-2.6,0.87,5.200,305.6
+-2.9,0.88,4.940,306.2,-2.4,0.88,5.030,307.3
+-2.2,0.88,2.340,303.1,-2.1,0.88,3.120,301.1
+-0.3,0.88,2.100,305.0,-0.5,0.88,2.130,301.4
+1.5,0.88,1.950,301.2,1.3,0.88,1.970,297.4
+3.1,0.88,1.510,272.1,2.9,0.88,1.580,268.2
+4.1,0.88,2.800,224.3,3.9,0.88,2.850,224.1
+4.6,0.87,4.210,207.0,4.4,0.87,4.270,207.1
+4.8,0.87,4.790,205.3,4.5,0.87,4.890,205.3
+4.8,0.87,4.990,200.9,4.6,0.87,5.110,200.5
+3.9,0.87,7.450,200.2,3.9,0.87,7.730,203.0
+3.8,0.87,10.040,202.4,3.6,0.87,9.960,202.5
+3.2,0.87,10.930,196.3,3.3,0.87,10.960,196.8
+2.8,0.87,11.330,193.4,3.0,0.87,11.730,193.6
+1.5,0.87,13.140,201.1,2.0,0.87,14.130,201.6
+0.8,0.87,11.580,200.6,1.2,0.87,12.890,201.0
+-1.2,0.87,10.790,191.6,-0.7,0.87,12.190,194.9
+-1.2,0.87,12.370,195.7,-0.8,0.87,13.840,196.6
+-0.4,0.87,15.820,199.9,-0.1,0.87,16.980,199.9
+-0.7,0.87,15.700,200.9,-0.3,0.87,17.120,201.1
+-1.1,0.87,14.490,203.1,-1.0,0.87,15.820,203.3
+-0.8,0.87,17.030,203.8,-0.6,0.87,18.180,204.1
+-1.3,0.87,13.650,203.8,-1.1,0.87,14.830,204.6
+-1.5,0.87,13.320,203.8,-1.2,0.87,14.530,204.4
+-1.8,0.87,12.230,199.2,-1.5,0.87,13.480,200.8
+-1.7,0.87,12.420,197.3,-1.6,0.87,13.310,198.7
+-0.0,0.87,9.900,194.0,-0.1,0.87,10.640,195.0
+2.0,0.87,11.520,197.0,1.8,0.87,11.750,197.1
+3.2,0.87,10.650,196.2,2.9,0.87,10.850,196.3
+4.0,0.87,9.690,195.6,3.8,0.87,9.870,195.7
+4.7,0.87,8.920,194.4,4.5,0.87,9.090,194.5
+5.2,0.87,8.560,193.8,5.0,0.87,8.730,193.9
+5.1,0.87,8.480,190.2,4.9,0.87,8.680,190.4
+4.4,0.87,8.490,187.3,4.2,0.87,8.990,188.0
+3.8,0.87,8.910,186.7,3.7,0.87,9.540,187.1
+3.5,0.87,9.720,179.5,3.3,0.87,10.340,180.2
+2.7,0.87,10.550,184.5,2.5,0.87,11.040,185.1
+1.5,0.87,12.290,190.2,1.3,0.87,12.760,190.5
+0.5,0.87,11.540,194.8,0.3,0.87,12.370,195.0
+0.4,0.87,9.650,189.8,0.4,0.87,10.410,191.7
+0.6,0.87,10.260,188.6,0.4,0.87,10.520,188.9
+0.8,0.87,8.680,191.4,0.8,0.87,9.280,192.8
+1.4,0.87,7.920,198.5,1.6,0.87,8.540,200.8
+1.1,0.87,7.710,192.2,1.0,0.87,8.220,193.6
+1.3,0.86,7.420,196.6,1.2,0.86,7.840,198.7
+1.1,0.86,7.750,194.2,0.9,0.86,8.150,195.0
+0.7,0.86,6.400,197.6,0.6,0.86,6.900,200.1
+0.2,0.86,3.940,208.9,0.2,0.86,4.480,212.8
+0.2,0.86,3.190,206.0,0.3,0.86,3.740,212.2
+-0.0,0.86,1.990,277.2,-0.0,0.86,2.230,268.0
+-0.1,0.86,2.680,309.1,-0.1,0.86,3.040,307.2
+-0.2,0.86,3.280,338.6,-0.3,0.86,3.530,336.7
+-0.3,0.87,5.170,348.6,-0.5,0.87,5.130,348.8
+-2.1,0.87,4.590,345.3,-2.3,0.87,4.560,345.6
+-2.1,0.87,4.770,337.1,-2.3,0.87,4.780,337.0
+-2.1,0.87,5.420,348.1,-2.3,0.87,5.450,348.0
+-2.0,0.87,5.230,353.6,-2.2,0.87,5.270,353.4
+-1.9,0.87,4.690,359.5,-2.1,0.87,4.750,359.5
+13.2,0.87,13.590,357.5,13.1,0.87,15.150,357.0
+10.4,0.87,10.780,351.5,10.2,0.87,11.930,353.1
+8.3,0.87,10.770,352.6,8.3,0.87,12.200,355.7
+7.2,0.87,14.320,3.8,7.2,0.87,15.250,3.9
+6.3,0.88,12.920,7.1,6.3,0.88,14.140,8.5
+5.3,0.88,10.550,349.6,5.5,0.88,12.070,352.8
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+from pytest import approx
+
+from hopp.simulation.technologies.capacity_credit import (
+    capacity_value_percent,
+    expand_capacity_hours,
+    max_feasible_generation_kwh,
+    storage_max_feasible_generation_kwh
+)
+
+
+rng = np.random.default_rng(0)
+capacity_kw = 5e3
+capacity_kwh = 20e3
+
+
+def test_max_feasible_generation():
+    gen = rng.uniform(0, 2 * capacity_kw, 8760)
+    expected = [min(x, capacity_kw) * 0.5 for x in gen]
+    assert max_feasible_generation_kwh(gen, capacity_kw, 0.5) == approx(expected)
+
+
+def test_storage_max_feasible_generation(subtests):
+    power = rng.uniform(-capacity_kw, capacity_kw, 8760)
+    soc = rng.uniform(10, 90, 8760)
+    nominal_kw = 0.8 * capacity_kw
+
+    # reference row-wise implementation
+    df = pd.DataFrame()
+    df['E_delivered'] = [max(0, x) for x in power]
+    df['E_stored'] = soc / 100 * capacity_kwh
+
+    with subtests.test("with available storage"):
+        expected = df.apply(lambda row: min(capacity_kw, row.E_delivered + row.E_stored), axis=1)
+        expected = np.minimum(expected, nominal_kw)
+        result = storage_max_feasible_generation_kwh(power, soc, capacity_kwh, capacity_kw, nominal_kw, 1.)
+        assert result == approx(expected.values)
+
+    with subtests.test("with dispatched generation only"):
+        expected = np.minimum(df['E_delivered'], nominal_kw)
+        result = storage_max_feasible_generation_kwh(power, soc, capacity_kwh, capacity_kw, nominal_kw, 1., False)
+        assert result == approx(expected.values)
+
+
+def test_capacity_value(subtests):
+    capacity_hours = np.zeros(8760, dtype=bool)
+    capacity_hours[4000:4100] = True
+
+    with subtests.test("hourly"):
+        gen = np.full(8760, capacity_kw / 2)
+        assert capacity_value_percent(gen, capacity_hours, capacity_kw, 1.) == approx(50)
+
+    with subtests.test("sub-hourly with hourly capacity hours"):
+        gen = np.full(8760 * 4, capacity_kw / 4 * 0.25)
+        assert len(expand_capacity_hours(capacity_hours, len(gen))) == len(gen)
+        assert capacity_value_percent(gen, capacity_hours, capacity_kw, 0.25) == approx(25)
+
+    with subtests.test("capped at 100"):
+        gen = np.full(8760, 2 * capacity_kw)
+        assert capacity_value_percent(gen, capacity_hours, capacity_kw, 1.) == approx(100)
+
+    with subtests.test("no capacity hours"):
+        assert capacity_value_percent(np.ones(8760), np.zeros(8760, dtype=bool), capacity_kw, 1.) == 0
+
+    with subtests.test("mismatched capacity hours"):
+        assert capacity_value_percent(np.ones(8760), np.ones(100, dtype=bool), capacity_kw, 1.) is None
@@ -1,11 +1,17 @@
 import pytest
 import datetime
+from types import SimpleNamespace
 
+import numpy as np
+import pandas as pd
 
 from hopp.simulation import HoppInterface
 from hopp.simulation.technologies.dispatch.power_sources.csp_dispatch import CspDispatch
 from hopp.simulation.technologies.csp.tower_plant import TowerPlant, TowerConfig
 from hopp.simulation.technologies.csp.trough_plant import TroughPlant, TroughConfig
+from hopp.simulation.technologies.csp.pySSC_daotk.ssc_wrap import PysscWrap
+from hopp.simulation.technologies.csp.csp_plant import CspOutputs, CspPlant, REQUIRED_SSC_TIME_SERIES
+from hopp.simulation.technologies.csp.field_cache import FieldCache, field_key
 from tests.hopp.utils import create_default_site_info
 
 
@@ -144,6 +150,216 @@ def test_pySSC_trough_increment_simulation(site):
     assert increments_annual_energy == pytest.approx(wo_increments_annual_energy, 1e-5)
 
 
+def test_pySSC_persistent_data(site):
+    """Testing that re-executing with the persistent ssc data matches executing with new ssc data"""
+    trough_config = {'cycle_capacity_kw': 100 * 1000,
+                     'solar_multiple': 1.5,
+                     'tes_hours': 5.0}
+
+    config = TroughConfig.from_dict(trough_config)
+    csp = TroughPlant(site, config=config)
+
+    start_datetime, end_datetime = CspDispatch.get_start_end_datetime(293*24, 48)
+    csp.ssc.set({'time_start': CspDispatch.seconds_since_newyear(start_datetime)})
+    csp.ssc.set({'time_stop': CspDispatch.seconds_since_newyear(end_datetime)})
+    csp.ssc.execute()
+
+    start_datetime, end_datetime = CspDispatch.get_start_end_datetime(100*24, 24)
+    csp.ssc.set({'time_start': CspDispatch.seconds_since_newyear(start_datetime)})
+    csp.ssc.set({'time_stop': CspDispatch.seconds_since_newyear(end_datetime)})
+    csp.ssc.set({'tshours': 8.0, 'sf_adjust:hourly': [10] * 8760})
+    outputs = ['annual_energy', 'gen', 'T_tes_hot']
+    tech_outputs = csp.ssc.execute(outputs)
+
+    fresh_ssc = PysscWrap(csp.ssc.tech_name, csp.ssc.financial_name, csp.ssc.params)
+    fresh_outputs = fresh_ssc.execute()
+
+    assert tech_outputs['cmod_success'] == 1
+    assert set(tech_outputs.keys()) == set(outputs) | {'tech_model', 'financial_model', 'cmod_success'}
+    for name in outputs:
+        assert tech_outputs[name] == pytest.approx(fresh_outputs[name])
+
+
+def test_csp_outputs_update_window():
+    """Testing that stored outputs are updated in the simulated window only"""
+    def ssc_outputs(start_hr, n_hrs, value):
+        return {'time_steps_per_hour': 1, 'time_start': start_hr * 3600, 'time_stop': (start_hr + n_hrs) * 3600,
+                'gen': [value] * n_hrs + [0.0] * (8760 - n_hrs),
+                'e_ch_tes': np.full(8760, value),
+                'q_pb': [value] * 8760,
+                'annual_energy': value}
+
+    outputs = CspOutputs(['gen', 'e_ch_tes', 'annual_energy'])
+    outputs.update_from_ssc_output(ssc_outputs(0, 48, 1.0))
+    outputs.update_from_ssc_output(ssc_outputs(24, 48, 2.0), skip_hr_start=2, skip_hr_end=6)
+
+    assert set(outputs.ssc_time_series.keys()) == {'gen', 'e_ch_tes'}
+    for name, series in outputs.ssc_time_series.items():
+        assert isinstance(series, np.ndarray) and len(series) == 8760
+        assert np.all(series[:26] == 1.0)
+        assert np.all(series[26:66] == 2.0)
+        assert np.all(series[66:] == 0.0)
+
+    outputs = CspOutputs()
+    outputs.update_from_ssc_output(ssc_outputs(0, 24, 1.0))
+    assert set(outputs.ssc_time_series.keys()) == {'gen', 'e_ch_tes', 'q_pb'}
+
+
+def test_ssc_time_series_outputs_required():
+    """Testing that the SSC outputs read by HOPP are always stored"""
+    config = TroughConfig.from_dict({'cycle_capacity_kw': 100 * 1000, 'solar_multiple': 1.5, 'tes_hours': 5.0,
+                                     'ssc_time_series_outputs': ['gen', 'T_tes_hot']})
+    assert config.ssc_time_series_outputs[:2] == ['gen', 'T_tes_hot']
+    assert set(REQUIRED_SSC_TIME_SERIES) <= set(config.ssc_time_series_outputs)
+    assert len(config.ssc_time_series_outputs) == len(REQUIRED_SSC_TIME_SERIES) + 1
+    assert TroughConfig.from_dict({'cycle_capacity_kw': 100 * 1000, 'solar_multiple': 1.5,
+                                   'tes_hours': 5.0}).ssc_time_series_outputs is None
+
+
+def test_resample_weather():
+    """Testing that weather is held constant within its time steps when resampled to sub-hourly steps"""
+    index = pd.date_range('2012-01-01 00:30', periods=8760, freq='h', name='datetime')
+    weather_df = pd.DataFrame({'DNI': np.arange(8760.), 'Temperature': np.full(8760, 20.)}, index=index)
+    weather_df.attrs.update({'latitude': 35.2, 'timezone': -7})
+
+    assert CspPlant.resample_weather(weather_df, 1) is weather_df
+    resampled = CspPlant.resample_weather(weather_df, 4)
+    assert len(resampled) == 4 * 8760
+    assert resampled.attrs == weather_df.attrs
+    assert list(resampled.index[:5].minute) == [30, 45, 0, 15, 30]
+    assert (resampled.index[1] - resampled.index[0]).total_seconds() == 900
+    assert np.array_equal(resampled['DNI'].values[:8], [0., 0., 0., 0., 1., 1., 1., 1.])
+
+
+class FakeSsc:
+    """Stands in for the PySSC wrapper, storing the values that are set"""
+    def __init__(self, values):
+        self.values = dict(values)
+
+    def get(self, name):
+        return self.values[name]
+
+    def set(self, values):
+        self.values.update(values)
+
+
+def fake_csp(ssc_time_steps_per_hour, site_time_steps_per_hour, **attributes):
+    """CspPlant stand-in with the state read by its time resolution methods, so no SSC simulation is needed"""
+    csp = SimpleNamespace(site=SimpleNamespace(n_timesteps=8760 * site_time_steps_per_hour),
+                          ssc=FakeSsc({'time_steps_per_hour': ssc_time_steps_per_hour}),
+                          **attributes)
+    csp.dispatch_time_steps_per_hour = CspPlant.dispatch_time_steps_per_hour.fget(csp)
+    csp.ssc_time_steps_per_dispatch_period = CspPlant.ssc_time_steps_per_dispatch_period.fget(csp)
+    csp.to_dispatch_resolution = lambda values: CspPlant.to_dispatch_resolution(csp, values)
+    return csp
+
+
+def test_to_dispatch_resolution():
+    """Testing that SSC time series are averaged over each dispatch period"""
+    csp = fake_csp(4, 1)
+    assert csp.dispatch_time_steps_per_hour == 1
+    assert csp.ssc_time_steps_per_dispatch_period == 4
+    assert np.array_equal(csp.to_dispatch_resolution([1., 2., 3., 4., 0., 0., 8., 8.]), [2.5, 4.])
+
+    csp = fake_csp(12, 4)
+    assert csp.dispatch_time_steps_per_hour == 4
+    assert csp.ssc_time_steps_per_dispatch_period == 3
+    assert np.array_equal(csp.to_dispatch_resolution([3., 6., 9.]), [6.])
+
+    csp = fake_csp(4, 4)
+    assert csp.ssc_time_steps_per_dispatch_period == 1
+    assert np.array_equal(csp.to_dispatch_resolution([1., 2.]), [1., 2.])
+
+
+def test_set_dispatch_targets_sub_hourly():
+    """Testing that the target of each dispatch period is held for each of its SSC time steps"""
+    dispatch = SimpleNamespace(is_field_generating=[1, 0], is_field_starting=[0, 0],
+                               is_cycle_generating=[0, 1], is_cycle_starting=[1, 0],
+                               allowable_cycle_startup_power=50., cycle_thermal_power=[0., 200.],
+                               maximum_cycle_thermal_power=180.)
+    csp = fake_csp(4, 1, dispatch=dispatch)
+    CspPlant.set_dispatch_targets(csp, 2)
+
+    targets = csp.ssc.values
+    assert targets['is_dispatch_targets'] == 1
+    assert targets['is_rec_su_allowed_in'] == [1, 1, 1, 1, 0, 0, 0, 0]
+    assert targets['is_pc_su_allowed_in'] == [1] * 8
+    assert targets['is_rec_sb_allowed_in'] == [0] * 8
+    assert targets['q_pc_target_su_in'] == [50.] * 4 + [0.] * 4
+    assert targets['q_pc_target_on_in'] == [0.] * 4 + [200.] * 4
+    assert targets['q_pc_max_in'] == [50.] * 4 + [180.] * 4
+
+    csp = fake_csp(1, 1, dispatch=dispatch)
+    CspPlant.set_dispatch_targets(csp, 2)
+    assert csp.ssc.values['q_pc_target_on_in'] == [0., 200.]
+
+
+def test_annual_energy_sub_hourly():
+    """Testing that annual energy integrates generation over SSC time steps shorter than an hour"""
+    outputs = SimpleNamespace(ssc_time_series={'gen': [1000.] * 4 * 8760})
+    csp = fake_csp(4, 1, system_capacity_kw=1000., outputs=outputs)
+    assert CspPlant.annual_energy_kwh.fget(csp) == pytest.approx(1000. * 8760)
+    assert CspPlant.generation_profile.fget(csp) == [1000.] * 8760
+
+
+def test_gen_max_feasible_sub_hourly():
+    """Testing that the max feasible generation of SSC time steps is summed over each site time step"""
+    n_steps = 4 * 8760
+    zeros = [0.] * n_steps
+    outputs = SimpleNamespace(ssc_time_series={'q_dot_pc_startup': zeros, 'q_pc_startup': zeros, 'P_cycle': zeros,
+                                               'e_ch_tes': zeros, 'eta': zeros, 'q_pb': zeros,
+                                               'P_out_net': [0.1 if i % 2 else 0.06 for i in range(n_steps)]})
+    params = {'time_steps_per_hour': 4, 'startup_time': 0.5}
+    csp = fake_csp(4, 1, outputs=outputs, value=lambda name: params[name],
+                   calc_nominal_capacity=lambda interconnect_kw: 80.)
+
+    gen_max_feasible = CspPlant.calc_gen_max_feasible_kwh(csp, interconnect_kw=1000.)
+    assert len(gen_max_feasible) == 8760
+    # 60 and 100 kW net output alternate, each 15 minute step is limited to the nominal capacity of 80 kW
+    assert gen_max_feasible[0] == pytest.approx(2 * 0.25 * 80. + 2 * 0.25 * 60.)
+
+
+def test_time_steps_per_hour_not_multiple_of_site():
+    """Testing that the SSC time steps must divide evenly into those of the site"""
+    site = SimpleNamespace(n_timesteps=8760 * 4, elec_prices=SimpleNamespace(data=[1.] * 8760))
+    csp = SimpleNamespace(site=site, ssc=FakeSsc({}), config=SimpleNamespace(time_steps_per_hour=6),
+                          set_params_from_files=lambda: None, dispatch_time_steps_per_hour=4)
+    with pytest.raises(ValueError, match='multiple'):
+        CspPlant.initialize_params(csp)
+
+    csp.config.time_steps_per_hour = 8
+    CspPlant.initialize_params(csp)
+    assert csp.ssc.get('time_steps_per_hour') == 8
+    assert len(csp.ssc.get('sf_adjust:hourly')) == 8 * 8760
+    assert csp.ssc.get('dispatch_factors_ts')[:9] == [1.] * 9
+
+
+def test_field_cache(tmp_path):
+    params = {'helio_width': 12.2, 'helio_height': 12.2, 'solar_resource_data': {'lat': 35.2, 'dn': [0., 800.]},
+              'time_start': 0}
+    key = field_key(params)
+    assert field_key({**params, 'time_start': 3600, 'dispatch_series': [1.0]}) == key
+    assert field_key({**params, 'helio_width': 10.0}) != key
+    assert field_key({**params, 'solar_resource_data': {'lat': 35.3, 'dn': [0., 800.]}}) != key
+
+    field_and_flux_maps = {'eta_map': [[0.0, 90.0, 0.6]], 'flux_maps': np.ones((2, 3)), 'N_hel': 8790.0,
+                           'helio_positions': [[1.5, 2.5]]}
+    cache = FieldCache(tmp_path)
+    assert cache.load(key) is None
+    cache.save(key, field_and_flux_maps)
+
+    persisted = FieldCache(tmp_path)
+    loaded = persisted.load(key)
+    assert loaded['flux_maps'] == [[1.0] * 3] * 2
+    assert loaded['eta_map'] == field_and_flux_maps['eta_map']
+    loaded['helio_positions'].append([0.0, 0.0])
+    assert persisted.load(key)['helio_positions'] == [[1.5, 2.5]]
+    assert (persisted.hits, cache.misses) == (2, 1)
+
+    cache.clear(disk=True)
+    assert FieldCache(tmp_path).load(key) is None
+
+
 def test_value_csp_call(site):
     """Testing csp override of PowerSource value()"""
     trough_config = {'cycle_capacity_kw': 100 * 1000,
@@ -1,9 +1,11 @@
+from copy import deepcopy
 from pathlib import Path
 import pytest
 import pyomo.environ as pyomo
 from pyomo.environ import units as u
 from pyomo.opt import TerminationCondition
 from pyomo.util.check_units import assert_units_consistent
+from numpy.testing import assert_allclose
 
 from hopp.simulation import HoppInterface
 from hopp.simulation.technologies.sites import SiteInfo, flatirons_site
@@ -210,6 +212,18 @@ def test_csp_dispatch_model(site):
     assert pyomo.value(model.test_objective) == pytest.approx(expected_objective, 1e-5)
 
 
+def test_csp_dispatch_ambient_corrections():
+    Tpts = [-10.0, 0.0, 10.0, 20.0, 30.0]
+    etapts = [0.43, 0.42, 0.41, 0.39, 0.36]
+    wcondfpts = [0.005, 0.01, 0.015, 0.025, 0.04]
+    Tdb = [-20.0, -10.0, 4.0, 15.5, 30.0, 35.0]
+
+    eta, wcond = CspDispatch.calc_cycle_ambient_corrections(Tdb, Tpts, etapts, wcondfpts)
+    # linear interpolation within the table, extrapolation of the first and last segments beyond it
+    assert eta == pytest.approx([0.44, 0.43, 0.416, 0.399, 0.36, 0.345])
+    assert wcond == pytest.approx([0.0, 0.005, 0.012, 0.0205, 0.04, 0.0475])
+
+
 def test_tower_dispatch(site):
     """Tests setting up tower dispatch using system model and running simulation with dispatch"""
     expected_objective = 99485.378
@@ -764,6 +778,94 @@ def test_hybrid_dispatch_heuristic(site):
     assert sum(hybrid_plant.battery.dispatch.discharge_power) > 0.0
 
 
+def test_hybrid_dispatch_appsi_highs_persistent(site):
+    pytest.importorskip("highspy")
+    dispatch_options = {'solver': 'appsi_highs',
+                        'is_test_start_year': True,
+                        'grid_charging': False}
+
+    solar_battery_technologies = {key: technologies[key] for key in ('pv', 'battery', 'grid')}
+    hopp_config = {
+        "site": site,
+        "technologies": solar_battery_technologies,
+        "config": {
+            "dispatch_options": dispatch_options
+        }
+    }
+    hi = HoppInterface(hopp_config)
+    hybrid_plant = hi.system
+
+    hi.simulate(1)
+
+    # One persistent solver instance is reused for every rolling-horizon window
+    problem_state = hybrid_plant.dispatch_builder.problem_state
+    assert len(problem_state.termination_condition) == 5
+    assert all(condition == 'optimal' for condition in problem_state.termination_condition)
+    assert hybrid_plant.dispatch_builder.opt is not None
+
+    # Objective changes between windows, so updated parameters reached the solver
+    assert len(set(round(obj, 2) for obj in problem_state.objective)) > 1
+    assert max(hybrid_plant.battery.outputs.P[:5 * 24]) > 0.0
+
+
+def test_hybrid_dispatch_parallel_clusters(site, subtests):
+    pytest.importorskip("highspy")
+    n_clusters = 4
+
+    def simulate_clusters(n_cluster_processes):
+        dispatch_options = {'solver': 'appsi_highs',
+                            'grid_charging': False,
+                            'use_clustering': True,
+                            'n_clusters': n_clusters,
+                            'n_cluster_processes': n_cluster_processes}
+        solar_battery_technologies = {key: deepcopy(technologies[key]) for key in ('pv', 'battery', 'grid')}
+        hopp_config = {
+            "site": create_default_site_info(),
+            "technologies": solar_battery_technologies,
+            "config": {
+                "dispatch_options": dispatch_options
+            }
+        }
+        hi = HoppInterface(hopp_config)
+        hi.simulate(1)
+        return hi.system
+
+    serial = simulate_clusters(1)
+    hybrid_plant = simulate_clusters(2)
+
+    # Solve metrics of every exemplar window are collected from the worker processes
+    builder = hybrid_plant.dispatch_builder
+    problem_state = builder.problem_state
+    serial_state = serial.dispatch_builder.problem_state
+    n_windows = builder.clustering.ndays + 1
+    assert len(problem_state.termination_condition) == n_clusters * n_windows
+    assert problem_state.n_non_optimal_solves == serial_state.n_non_optimal_solves == 0
+    assert problem_state.start_time == serial_state.start_time
+
+    # The first cluster starts from the same default states in series and in parallel, whereas later clusters of
+    # a batch estimate their initial states without the clusters simulated alongside them
+    first = next(j for j in range(n_clusters)
+                 if builder.clustering.get_sim_start_end_times(j)[0] == problem_state.start_time[0])
+    with subtests.test("first cluster matches serial"):
+        time_start, time_stop = builder.clustering.get_soln_start_end_times(first)
+        assert_allclose(hybrid_plant.battery.outputs.gen[time_start:time_stop],
+                        serial.battery.outputs.gen[time_start:time_stop], rtol=1e-6, atol=1e-6)
+        assert_allclose(hybrid_plant.battery.outputs.P[time_start:time_stop],
+                        serial.battery.outputs.P[time_start:time_stop], rtol=1e-6, atol=1e-6)
+        assert_allclose(problem_state.objective[:n_windows], serial_state.objective[:n_windows], rtol=1e-6)
+
+    with subtests.test("clusters close to serial"):
+        assert_allclose(problem_state.objective, serial_state.objective, rtol=0.05)
+        assert sum(hybrid_plant.battery.outputs.gen) == pytest.approx(sum(serial.battery.outputs.gen), rel=0.05)
+        assert sum(hybrid_plant.battery.outputs.P) == pytest.approx(sum(serial.battery.outputs.P), rel=0.05)
+
+    # Exemplar outputs are merged back into the annual battery outputs
+    for j in range(n_clusters):
+        time_start, time_stop = builder.clustering.get_soln_start_end_times(j)
+        assert any(soc > 0 for soc in hybrid_plant.battery.outputs.dispatch_SOC[time_start:time_stop])
+    assert len(hybrid_plant.battery.outputs.gen) == site.n_timesteps
+
+
 def test_hybrid_dispatch_one_cycle_heuristic(site):
     dispatch_options = {'battery_dispatch': 'one_cycle_heuristic', 'grid_charging': False}
 
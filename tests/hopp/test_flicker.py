@@ -149,3 +149,28 @@ def test_swept_area():
     expected_bounds = (-63.34583, -19.71403, 0.1617619, 0.6037036)
     for b in range(4):
         assert shadow.bounds[b] == approx(expected_bounds[b])
+
+
+def test_get_sun_pos_vectorized():
+    lat = 39.7555
+    lon = -105.2211
+    azi_ang, elv_ang, dates = get_sun_pos(lat, lon, step_in_minutes=15, steps=range(0, 8760 * 4, 97))
+    for i, date in enumerate(dates):
+        assert azi_ang[i] == approx(get_azimuth(lat, lon, date), abs=1e-5)
+        assert elv_ang[i] == approx(get_altitude(lat, lon, date), abs=1e-5)
+
+
+def test_get_turbine_shadows_timeseries():
+    steps = range(24)
+    azi_ang, elv_ang, _ = get_sun_pos(39.7555, -105.2211, n=len(steps), start_hr=0)
+    wind_ang = np.linspace(0, 345, len(steps))
+    shadows = get_turbine_shadows_timeseries(35, steps, 4, azi_ang, elv_ang, wind_ang)
+
+    for n in steps:
+        if elv_ang[n] < 0:
+            assert shadows[n] is None
+            continue
+        assert len(shadows[n]) == 4
+        for i, angle in enumerate((0, 30, 60, 90)):
+            shadow, _ = get_turbine_shadow_polygons(35, angle, azi_ang[n], elv_ang[n], wind_ang[n])
+            assert shadows[n][i].symmetric_difference(shadow).area == approx(0, abs=1e-6)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from hopp.simulation.technologies.layout import flicker_library
+from hopp.simulation.technologies.layout.flicker_library import (
+    FlickerHeatMapLibrary,
+    FlickerHeatMapSettings,
+    DISTRIBUTED_SETTINGS,
+)
+from hopp.simulation.technologies.layout.flicker_mismatch import FlickerMismatch
+
+
+@pytest.fixture
+def settings():
+    return FlickerHeatMapSettings(diameter=70, gridcell_width=90, gridcell_height=90, gridcells_per_string=1)
+
+
+def test_settings_digest(settings):
+    assert settings.digest() == FlickerHeatMapSettings(diameter=70.0, gridcell_width=90, gridcell_height=90,
+                                                       gridcells_per_string=1).digest()
+    assert settings.digest() != FlickerHeatMapSettings(diameter=80, gridcell_width=90, gridcell_height=90,
+                                                       gridcells_per_string=1).digest()
+    assert settings.heat_map_template()[0].shape == (9, 12)
+
+
+def test_settings_heat_map_extent(settings, monkeypatch):
+    monkeypatch.setattr(FlickerMismatch, "diam_mult_nwe", 3)
+    monkeypatch.setattr(FlickerMismatch, "diam_mult_s", 1)
+    assert settings.heat_map_template()[0].shape == (9, 12)
+    assert settings.turbine_indices(settings.heat_map_template()) == (6, 3)
+    assert (FlickerMismatch.diam_mult_nwe, FlickerMismatch.diam_mult_s) == (3, 1)
+
+    smaller = FlickerHeatMapSettings(diameter=70, gridcell_width=90, gridcell_height=90, gridcells_per_string=1,
+                                     diam_mult_nwe=3, diam_mult_s=1)
+    assert smaller.digest() != settings.digest()
+    assert smaller.heat_map_template()[0].shape != settings.heat_map_template()[0].shape
+
+
+def test_library_lookup(tmp_path, settings, subtests):
+    library = FlickerHeatMapLibrary(tmp_path)
+    shape = settings.heat_map_template()[0].shape
+    library.save(30, -100, settings, np.full(shape, 1.))
+    library.save(32, -100, settings, np.full(shape, 3.))
+
+    with subtests.test("nearest"):
+        heat_map, location = library.lookup(30.5, -100.2, settings)
+        assert location == (30, -100)
+        assert_allclose(heat_map, 1.)
+        assert not heat_map.flags.writeable
+
+    with subtests.test("max distance"):
+        assert library.lookup(31, -100, settings, max_distance=0.5) is None
+
+    with subtests.test("interpolation"):
+        heat_map, _ = library.lookup(30.5, -100, settings, n_nearest=2)
+        assert_allclose(heat_map, 1.5)
+
+    with subtests.test("other settings"):
+        assert library.lookup(30, -100, DISTRIBUTED_SETTINGS) is None
+
+
+def test_library_distributed_heat_maps(tmp_path, monkeypatch):
+    monkeypatch.setattr(flicker_library, "FLICKER_DATA_DIR", tmp_path)
+    np.savetxt(tmp_path / "33.209_-108.283_4_12_shadow.txt", np.ones((2, 3)))
+    library = FlickerHeatMapLibrary(tmp_path / "library")
+
+    heat_map, location = library.lookup(39.7555, -105.2211, DISTRIBUTED_SETTINGS)
+    assert location == (33.209, -108.283)
+    assert_allclose(heat_map, 1.)
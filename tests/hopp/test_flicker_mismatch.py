@@ -171,6 +171,20 @@ def test_grid(subtests):
         assert(np.count_nonzero(loss_p) == approx(1364, 1e-4))
 
 
+def test_run_parallel_steps_per_task():
+    flicker = FlickerMismatch(lat, lon, angles_per_step=None, gridcell_width=5, gridcell_height=5,
+                              gridcells_per_string=1)
+    (time_serial,) = flicker.create_heat_maps(range(3184, 3188), ("time",))
+
+    (time_parallel,) = flicker.run_parallel(2, ("time",), intervals=(range(3184, 3186), range(3186, 3188)))
+    assert np.max(time_parallel) > 0
+    assert np.allclose(time_parallel, time_serial, rtol=0, atol=1e-12)
+
+    flicker.n_steps = 8
+    flicker.run_parallel(2, ("time",), steps_per_task=3)
+    assert flicker.step_intervals == [range(0, 3), range(3, 6), range(6, 8)]
+
+
 def test_plot():
     data_path = Path(__file__).parent.parent.parent / "hopp" / "simulation" / "technologies" / "layout" / "flicker_data"
     print(data_path)
@@ -128,3 +128,30 @@ def test_simulate_grid_connection(mock_simulate_power, site, subtests):
 
         assert_array_equal(grid.schedule_curtailed, np.repeat([2000], timesteps)) 
         assert_approx_equal(grid.schedule_curtailed_percentage, 2/3)
+
+        # public series are arrays that support arithmetic and ufuncs
+        assert isinstance(grid.missed_load, np.ndarray)
+        assert isinstance(grid.schedule_curtailed, np.ndarray)
+        assert_array_equal(np.maximum(grid.schedule_curtailed * 0.5, 0.), np.repeat([1000], timesteps))
+
+
+def test_lifetime_series(subtests):
+    from hopp.simulation.technologies.lifetime_series import LifetimeSeries
+
+    base = np.arange(8760, dtype=float)
+    series = LifetimeSeries(base, 8760 * 3)
+
+    with subtests.test("repeats lazily"):
+        assert len(series) == 8760 * 3
+        assert_array_equal(np.asarray(series), np.tile(base, 3))
+        assert series.sum() == base.sum() * 3
+
+    with subtests.test("indexing"):
+        assert series[8760 + 5] == 5.
+        assert series[-1] == 8759.
+        assert_array_equal(series.year(2, 8760), base)
+        assert_array_equal(series[8750:8770], np.tile(base, 2)[8750:8770])
+
+    with subtests.test("invalid length"):
+        with pytest.raises(ValueError):
+            LifetimeSeries(base, 8760 * 3 + 1)
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+import rainflow
+from numpy.testing import assert_allclose
+
+from hopp.simulation.technologies.hydrogen.electrolysis import PEM_H2_LT_electrolyzer_Clusters
+from hopp.simulation.technologies.hydrogen.electrolysis.PEM_H2_LT_electrolyzer_Clusters import (
+    PEM_H2_Clusters,
+    RainflowCounter,
+    calc_current,
+)
+
+
+n_years = 4
+
+
+@pytest.fixture
+def cluster():
+    return PEM_H2_Clusters(20, n_years, True, 13)
+
+
+@pytest.fixture
+def power_kw():
+    rng = np.random.default_rng(0)
+    power_kw = rng.uniform(0, 22000, 8760 * n_years)
+    power_kw[rng.random(len(power_kw)) < 0.1] = 0
+    return power_kw
+
+
+def test_iv_curve_cache(monkeypatch):
+    monkeypatch.setattr(PEM_H2_LT_electrolyzer_Clusters, "_iv_curve_cache", {})
+    fitted = PEM_H2_Clusters(10, n_years, True, 13)
+    cached = PEM_H2_Clusters(40, n_years, True, 13)
+
+    assert len(PEM_H2_LT_electrolyzer_Clusters._iv_curve_cache) == 1
+    assert_allclose(cached.curve_coeff, fitted.curve_coeff, rtol=0)
+    assert cached.curve_coeff is not fitted.curve_coeff
+
+    stack_current = np.linspace(0.2, 1, 5) * fitted.max_cell_current
+    stack_power_kw = stack_current * fitted.cell_design(fitted.T_C, stack_current) * fitted.N_cells / 1000
+    assert_allclose(calc_current((stack_power_kw, fitted.T_C), *fitted.curve_coeff), stack_current, rtol=1e-2)
+
+    monkeypatch.setattr(fitted, "membrane_thickness", 0.02)
+    assert not np.allclose(fitted.iv_curve(), cached.curve_coeff)
+    assert len(PEM_H2_LT_electrolyzer_Clusters._iv_curve_cache) == 2
+
+
+def test_rainflow_counter_matches_rainflow():
+    rng = np.random.default_rng(1)
+    for _ in range(50):
+        signal = np.round(rng.normal(size=rng.integers(3, 100)), 1)
+        expected = sum(cycle_range * count for cycle_range, _, count, _, _ in rainflow.extract_cycles(signal))
+
+        counter = RainflowCounter()
+        total = 0
+        for times in np.array_split(np.arange(len(signal)), 4):
+            _, cycle_ranges = counter.add(signal[times], times)
+            total += np.sum(cycle_ranges)
+        assert total + counter.residue_ranges() == pytest.approx(expected)
+
+
+def test_run_lifetime_independent_of_chunks(cluster, power_kw, subtests):
+    by_year = cluster.run_lifetime(np.split(power_kw, n_years))
+    by_week = cluster.run_lifetime(np.array_split(power_kw, len(power_kw) // 168))
+
+    assert list(by_year["Capacity Factor [-]"].keys()) == list(range(n_years))
+    for k, v in by_year.items():
+        with subtests.test(k):
+            assert_allclose(list(by_week[k].values()), list(v.values()), rtol=1e-10)
+
+
+def test_run_lifetime_clusters(cluster, power_kw):
+    power_to_clusters = np.vstack([power_kw, power_kw[::-1]])
+    clusters = cluster.run_lifetime(np.array_split(power_to_clusters, 7, axis=1))
+
+    for ci in range(2):
+        single = cluster.run_lifetime([power_to_clusters[ci]])
+        for k, v in single.items():
+            assert_allclose([vals[ci] for vals in clusters[k].values()], list(v.values()), rtol=1e-10)
+
+
+def test_run_lifetime_replaces_stacks(cluster, power_kw):
+    performance = cluster.run_lifetime([power_kw] * 5)
+
+    assert len(performance["Annual H2 Production [kg/year]"]) == 5 * n_years
+    replacements = np.array(list(performance["Refurbishment Schedule [MW replaced/year]"].values()))
+    assert np.all(replacements % cluster.max_stacks == 0)
+    assert replacements.sum() > 0
+    end_deg = np.array(list(performance["End of Year Degradation [V]"].values()))
+    assert np.all(end_deg <= cluster.d_eol_curve[-1])
+    efficiency = np.array(list(performance["Annual Average Efficiency [kWh/kg]"].values()))
+    assert efficiency[np.argmax(end_deg)] > efficiency[0]
@@ -1,4 +1,4 @@
-from hopp.simulation.technologies.hydrogen.h2_transport.h2_export_pipe import run_pipe_analysis
+from hopp.simulation.technologies.hydrogen.h2_transport.h2_export_pipe import run_pipe_analysis, run_pipe_analyses
 from pytest import approx
 
 # test that we the results we got when the code was recieved
@@ -57,6 +57,23 @@ class TestExportPipeline():
     def test_annual_opex(self):
         assert self.costs["annual operating cost [$]"][0] == 0.0117*self.costs["total capital cost [$]"][0]
 
+    def test_cached_result_is_copy(self):
+        costs = run_pipe_analysis(self.L,self.m_dot,self.p_inlet,self.p_outlet,self.depth)
+        costs["Grade"] = "modified"
+        costs = run_pipe_analysis(self.L,self.m_dot,self.p_inlet,self.p_outlet,self.depth)
+        assert costs["Grade"][0] == "X42"
+        assert run_pipe_analysis.cache.hits > 0
+
+    def test_run_pipe_analyses(self):
+        lengths = [self.L, 2*self.L, self.L]
+        costs = run_pipe_analyses(lengths,self.m_dot,self.p_inlet,self.p_outlet,self.depth)
+
+        assert len(costs) == 3
+        assert costs["total capital cost [$]"][0] == 2311900.705531385
+        assert costs["total capital cost [$]"][2] == costs["total capital cost [$]"][0]
+        single = run_pipe_analysis(2*self.L,self.m_dot,self.p_inlet,self.p_outlet,self.depth)
+        assert costs["total capital cost [$]"][1] == single["total capital cost [$]"][0]
+
 if __name__ == "__main__":
     test_set = TestExportPipeline()
     
\ No newline at end of file
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from pyomo.contrib.appsi.solvers import Highs
+
+from hopp.simulation.technologies.hydrogen.electrolysis.optimization_utils_linear import PowerSplitOptimizer
+from hopp.simulation.technologies.hydrogen.electrolysis.run_PEM_master import run_PEM_clusters
+
+
+electrolyzer_params = {
+    "Modify BOL Eff": False,
+    "BOL Eff [kWh/kg-H2]": [],
+    "Modify EOL Degradation Value": True,
+    "EOL Rated Efficiency Drop": 13,
+}
+
+
+@pytest.fixture
+def pem():
+    rng = np.random.default_rng(0)
+    power_kw = rng.uniform(0, 120000, 24 * 21)
+    power_kw[rng.random(len(power_kw)) < 0.1] = 0
+    return run_PEM_clusters(power_kw, 100, 5, 1300, 10, electrolyzer_params, True, 0.1)
+
+
+def test_even_split_power(pem):
+    power_to_clusters = pem.even_split_power()
+
+    assert power_to_clusters.shape == (pem.num_clusters, len(pem.input_power_kw))
+    n_on = np.minimum(np.floor(pem.input_power_kw / pem.cluster_min_power), pem.num_clusters)
+    assert_allclose(power_to_clusters.sum(axis=0), np.where(n_on > 0, pem.input_power_kw, 0))
+    assert_allclose(np.count_nonzero(power_to_clusters, axis=0), n_on)
+
+
+def test_run_clusters_matches_single_clusters(pem, subtests):
+    h2_ts, h2_tot = pem.run_clusters()
+    power_to_clusters = pem.even_split_power()
+
+    for ci, cluster in enumerate(pem.create_clusters()):
+        ts, tot = cluster.run(power_to_clusters[ci])
+        with subtests.test(f"cluster {ci} time series"):
+            for k, v in ts.items():
+                assert_allclose(h2_ts[k][ci], v, rtol=1e-12)
+        with subtests.test(f"cluster {ci} aggregates"):
+            for k, v in tot.items():
+                if k == "Performance By Year":
+                    for metric, by_year in v.items():
+                        assert_allclose(h2_tot[k][metric][ci], list(by_year.values()), rtol=1e-12)
+                else:
+                    assert h2_tot[k][ci] == pytest.approx(v, rel=1e-12, nan_ok=True)
+
+    with subtests.test("dataframes"):
+        df_ts, df_tot = pem.cluster_results_to_dataframes(h2_ts, h2_tot)
+        assert list(df_ts.columns) == ["Cluster #{}".format(ci) for ci in range(pem.num_clusters)]
+        assert df_tot.loc["Total H2 Production [kg]"].sum() == pytest.approx(h2_tot["Total H2 Production [kg]"].sum())
+        assert len(df_tot.loc["Performance By Year"].iloc[0]["Capacity Factor [-]"]) == 10
+
+
+def test_power_split_optimizer_reuse():
+    pytest.importorskip("highspy")
+    rng = np.random.default_rng(1)
+    windows = [rng.uniform(0, 60000, 24) for _ in range(3)]
+    optimizer = PowerSplitOptimizer(T=24, n_stacks=3, c_sw=500, rated_power=20000, solver="appsi_highs")
+    for P_wind_t in windows:
+        reused = optimizer.solve(P_wind_t)
+        fresh = PowerSplitOptimizer(T=24, n_stacks=3, c_sw=500, rated_power=20000, solver="appsi_highs").solve(
+            P_wind_t
+        )
+        assert reused[6] - reused[7] == pytest.approx(fresh[6] - fresh[7], rel=1e-3)
+        assert np.all(reused[0] <= P_wind_t + 1e-6)
+
+
+def test_power_split_optimizer_requires_highspy(monkeypatch):
+    optimizer = PowerSplitOptimizer(T=24, n_stacks=3, c_sw=500, rated_power=20000, solver="appsi_highs")
+    assert optimizer.solver_options == {"mip_rel_gap": 0.001}
+    monkeypatch.setattr(Highs, "available", lambda self: Highs.Availability.NotFound)
+    with pytest.raises(ImportError, match="highspy"):
+        optimizer.solve(np.full(24, 30000.))
+
+
+def test_optimize_power_split(pem, subtests):
+    pytest.importorskip("highspy")
+    pem.input_power_kw = pem.input_power_kw[:72]
+    pem.T = 72
+    for n_workers in [1, 2]:
+        with subtests.test(f"{n_workers} workers"):
+            power_to_clusters = pem.optimize_power_split(window_hrs=24, n_workers=n_workers, solver="appsi_highs")
+            assert power_to_clusters.shape == (pem.num_clusters, 72)
+            available_power = np.where(pem.input_power_kw > 0, pem.input_power_kw, np.inf)
+            assert np.all(power_to_clusters.sum(axis=0) <= available_power + 1e-6)
+            is_on = power_to_clusters > 1e-3
+            assert np.all(power_to_clusters[is_on] >= pem.cluster_min_power - 1e-3)
+            assert np.all(power_to_clusters <= pem.cluster_max_power + 1e-6)
@@ -201,6 +201,16 @@ class TestTankinator():
         assert tank.get_mass_metal() == pytest.approx(mass_f_ref, abs= 0.1)
         assert tank.get_cost_metal() == pytest.approx(cost_f_ref, abs= 0.01)    
 
+    def test_von_mises_cycle_vectorized(self):
+        pressure= np.linspace(10., 200., 5)[:, np.newaxis]
+        radius= np.array([0.1, 0.5, 1.0])
+        thickness, WTAF, n_iter= von_mises.cycle_vectorized(pressure, radius, 0.005, 250., 500.)
+
+        assert thickness.shape == (5, 3)
+        for i, p in enumerate(pressure[:, 0]):
+            for j, R0 in enumerate(radius):
+                assert (thickness[i, j], WTAF[i, j], n_iter[i, j]) == von_mises.cycle(p, R0, 0.005, 250., 500.)
+
     def test_tankinator_typeIII_comp(self):
         """ compare to the tankinator case """
 
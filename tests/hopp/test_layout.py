@@ -7,12 +7,15 @@ import json
 import matplotlib.pyplot as plt
 from shapely import affinity
 from shapely.ops import unary_union
-from shapely.geometry import Point, MultiLineString
+from shapely.geometry import Point, MultiLineString, LineString, box
 
 from hopp.simulation.technologies.wind.wind_plant import WindPlant, WindConfig
 from hopp.simulation.technologies.pv.pv_plant import PVPlant, PVConfig
 from hopp.simulation.technologies.layout.hybrid_layout import HybridLayout, WindBoundaryGridParameters, PVGridParameters, get_flicker_loss_multiplier
 from hopp.simulation.technologies.layout.wind_layout_tools import create_grid
+from hopp.simulation.technologies.layout.layout_tools import LayoutGeometry, segments_intersect_bounds
+from hopp.simulation.technologies.layout import flicker_library
+from hopp.simulation.technologies.layout.flicker_library import FlickerHeatMapLibrary, FlickerHeatMapSettings
 from hopp.simulation.technologies.layout.pv_design_utils import size_electrical_parameters, find_modules_per_string
 from hopp.simulation.technologies.pv.detailed_pv_plant import DetailedPVPlant, DetailedPVConfig
 
@@ -72,6 +75,42 @@ def test_create_grid(site):
         assert(t.y == pytest.approx(expected_positions[n][1], 1e-1))
 
 
+def test_layout_geometry_contains_points(site, subtests):
+    rng = np.random.default_rng(0)
+    shapes = {
+        "site": site.polygon,
+        "hole": site.polygon.difference(site.polygon.centroid.buffer(200)),
+        "multipolygon": site.polygon.difference(box(600, -1e4, 700, 1e4)),
+    }
+    for name, shape in shapes.items():
+        with subtests.test(name):
+            bounds = np.array(shape.bounds)
+            points = rng.uniform(bounds[:2] - 100, bounds[2:] + 100, (2000, 2))
+            near_boundary = np.array([shape.boundary.interpolate(d, normalized=True).coords[0]
+                                      for d in np.linspace(0, 1, 50)])
+            vertices = np.vstack([np.array(line.coords) for line in getattr(shape.boundary, "geoms", [shape.boundary])])
+            points = np.vstack((points, near_boundary, vertices))
+
+            contains = LayoutGeometry(shape).contains_points(points[:, 0], points[:, 1])
+            assert contains.tolist() == [shape.contains(Point(p)) for p in points]
+            assert not contains[-len(vertices):].any()
+
+    lines = rng.uniform(-500, 2500, (500, 2, 2))
+    intersect = segments_intersect_bounds(lines, site.polygon.bounds)
+    assert intersect.tolist() == [box(*site.polygon.bounds).intersects(LineString(line)) for line in lines]
+
+
+def test_create_grid_reuses_site_geometry(site):
+    site_shape = site.polygon.buffer(-200)
+    site_geometry = LayoutGeometry(site_shape)
+    for spacing in (150, 200, 350):
+        positions = create_grid(site_shape, site.polygon.centroid, np.pi / 4, spacing, spacing * 1.5, .5)
+        reused = create_grid(site_shape, site.polygon.centroid, np.pi / 4, spacing, spacing * 1.5, .5,
+                             site_geometry=site_geometry)
+        assert [(p.x, p.y) for p in reused] == [(p.x, p.y) for p in positions]
+        assert all(site_shape.contains(p) for p in positions)
+
+
 def test_wind_layout(site):
     config = WindConfig.from_dict(technology['wind'])
     wind_model = WindPlant(site, config=config)
@@ -122,6 +161,25 @@ def test_hybrid_layout(site):
     assert (layout.pv.flicker_loss > 0.0001)
 
 
+def test_hybrid_layout_flicker_library(site, tmp_path, monkeypatch):
+    monkeypatch.setattr(flicker_library, "FLICKER_LIBRARY_DIR", tmp_path)
+    pv_config = PVConfig.from_dict(technology['pv'])
+    wind_config = WindConfig.from_dict(technology['wind'])
+    power_sources = {
+        'wind': WindPlant(site, config=wind_config),
+        'pv': PVPlant(site, config=pv_config)
+    }
+    settings = FlickerHeatMapSettings(diameter=power_sources['wind']._layout.rotor_diameter,
+                                      gridcell_width=90, gridcell_height=90, gridcells_per_string=1)
+    heat_map = np.full(settings.heat_map_template()[0].shape, 0.01)
+    FlickerHeatMapLibrary().save(site.data['lat'] + 0.01, site.data['lon'], settings, heat_map)
+
+    layout = HybridLayout(site, power_sources, flicker_load_nearest=False)
+    assert layout._flicker_data[0] == settings.diameter
+    assert np.array_equal(layout._flicker_data[2], heat_map)
+    assert layout.pv.flicker_loss > 0
+
+
 def test_hybrid_layout_rotated_array(site):
     pv_config = PVConfig.from_dict(technology['pv'])
     wind_config = WindConfig.from_dict(technology['wind'])
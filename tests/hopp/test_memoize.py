@@ -0,0 +1,44 @@
+import numpy as np
+
+from hopp.utilities.memoize import memoize
+
+
+def test_memoize(tmp_path, subtests):
+    calls = []
+
+    @memoize(maxsize=2)
+    def size(length, flow=1.0):
+        calls.append(length)
+        return {"diameter": np.array([length * flow])}
+
+    with subtests.test("cache hit"):
+        assert size(1.0)["diameter"][0] == 1.0
+        assert size(1.0, flow=1.0)["diameter"][0] == 1.0
+        assert calls == [1.0]
+        assert (size.cache.hits, size.cache.misses) == (1, 1)
+
+    with subtests.test("results are copies"):
+        size(1.0)["diameter"][0] = -1
+        assert size(1.0)["diameter"][0] == 1.0
+
+    with subtests.test("array arguments"):
+        size(np.array([2.0, 3.0]))
+        size(np.array([2.0, 3.0]))
+        assert len(calls) == 2
+
+    with subtests.test("lru eviction"):
+        size(4.0)
+        assert len(size.cache.entries) == 2
+        size(1.0)
+        assert calls[-1] == 1.0
+
+    with subtests.test("disk persistence"):
+        size.cache.set_disk_dir(tmp_path)
+        size(5.0)
+        assert len(list(tmp_path.glob("size_*.pkl"))) == 1
+        size.cache.clear()
+        n_calls = len(calls)
+        assert size(5.0)["diameter"][0] == 5.0
+        assert len(calls) == n_calls
+        size.cache.clear(disk=True)
+        assert len(list(tmp_path.glob("size_*.pkl"))) == 0
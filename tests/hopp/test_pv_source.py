@@ -78,4 +78,32 @@ def test_pv_plant_mass(site, subtests):
     pv_plant = PVPlant(site=site, config=config)
 
     with subtests.test("plant mass"):
-        assert pv_plant.plant_mass == pytest.approx(5079.51,0.01)
\ No newline at end of file
+        assert pv_plant.plant_mass == pytest.approx(5079.51,0.01)
+
+def test_pv_plant_values(site, subtests):
+    config = PVConfig.from_dict({'system_capacity_kw': 100.0})
+    pv_plant = PVPlant(site=site, config=config)
+
+    with subtests.test("values matches value"):
+        names = ['dc_ac_ratio', 'gcr', 'ppa_price_input', 'system_capacity_kw']
+        values = pv_plant.values(names)
+        assert list(values.keys()) == names
+        for name in names:
+            assert values[name] == pv_plant.value(name)
+
+    with subtests.test("assign_fast sets system, financial and class variables"):
+        pv_plant.assign_fast({'gcr': 0.35, 'ppa_price_input': (0.05,), 'system_capacity_kw': 200.0})
+        assert pv_plant._system_model.SystemDesign.gcr == pytest.approx(0.35)
+        assert pv_plant.ppa_price == pytest.approx((0.05,))
+        assert pv_plant.system_capacity_kw == pytest.approx(200.0)
+
+    with subtests.test("resolution is shared by instances of the same class"):
+        other_plant = PVPlant(site=site, config=config)
+        assert other_plant.value('gcr') == pytest.approx(0.3)
+        assert pv_plant.value('gcr') == pytest.approx(0.35)
+
+    with subtests.test("variable not found"):
+        with pytest.raises(ValueError):
+            pv_plant.value('not_a_variable')
+        with pytest.raises(ValueError):
+            pv_plant.assign_fast({'not_a_variable': 1.0})
@@ -1,4 +1,5 @@
 import os
+import shutil
 
 import requests
 import pytest
@@ -72,4 +73,57 @@ def test_call_api_429_error():
         status=429
     )
     with pytest.raises(RuntimeError):
-        Resource.call_api(api_url, fname)
\ No newline at end of file
+        Resource.call_api(api_url, fname)
+
+def test_read_solar_csv_cache(tmp_path):
+    from hopp import ROOT_DIR
+    from PySAM.ResourceTools import SAM_CSV_to_solar_data
+    from hopp.simulation.technologies.resource import solar_csv
+
+    solar_file = tmp_path / "solar.csv"
+    shutil.copy(ROOT_DIR.parent / "resource_files" / "solar" / "35.2018863_-101.945027_psmv3_60_2012.csv", solar_file)
+
+    expected = SAM_CSV_to_solar_data(str(solar_file))
+    data = solar_csv.solar_csv_to_sam_data(solar_file)
+    for key, value in expected.items():
+        assert data[key] == pytest.approx(value)
+
+    cache_files = list((tmp_path / solar_csv.CACHE_DIR_NAME).glob("*.npz"))
+    assert len(cache_files) == 1
+
+    # second read is served from the binary cache rather than the csv
+    solar_csv._memo.clear()
+    header, columns = solar_csv.read_solar_csv(solar_file)
+    assert header['Time Zone'] == '-6'
+    assert columns['GHI'].tolist() == expected['gh']
+
+
+def test_read_solar_csv_cache_dir(tmp_path, monkeypatch):
+    from hopp import ROOT_DIR
+    from hopp.simulation.technologies.resource import solar_csv
+
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    solar_files = [source_dir / f"solar_{i}.csv" for i in range(3)]
+    for solar_file in solar_files:
+        shutil.copy(ROOT_DIR.parent / "resource_files" / "solar" / "35.2018863_-101.945027_psmv3_60_2012.csv",
+                    solar_file)
+
+    monkeypatch.setattr(solar_csv, "MEMO_MAXSIZE", 2)
+    monkeypatch.setattr(solar_csv, "_memo", solar_csv.OrderedDict())
+    solar_csv.set_cache_dir(tmp_path / "cache")
+    try:
+        for solar_file in solar_files:
+            solar_csv.read_solar_csv(solar_file)
+    finally:
+        solar_csv.set_cache_dir(None)
+    assert [key[0] for key in solar_csv._memo] == [str(f) for f in solar_files[1:]]
+    assert len(list((tmp_path / "cache").glob("*.npz"))) == 3
+    assert not (source_dir / solar_csv.CACHE_DIR_NAME).exists()
+
+    # the cache is skipped rather than written in a read-only directory
+    monkeypatch.setattr(solar_csv.os, "access", lambda path, mode: False)
+    solar_csv._memo.clear()
+    header, _ = solar_csv.read_solar_csv(solar_files[0])
+    assert header['Time Zone'] == '-6'
+    assert not (source_dir / solar_csv.CACHE_DIR_NAME).exists()
@@ -1,6 +1,8 @@
 from pytest import approx, fixture
 import responses
+import csv
 import os
+from types import SimpleNamespace
 
 from hopp import ROOT_DIR
 from hopp.simulation.technologies.resource.solar_resource import BASE_URL as SOLAR_URL
@@ -137,6 +139,42 @@ def test_wind_combine():
     assert resp.call_count == 2
 
 
+def test_wind_combine_matches_csv_rows(tmp_path):
+    def combine_wind_files_lists(file_resource_heights, filename):
+        # previous implementation, which loads all rows into lists
+        data = [None] * 2
+        for height, f in file_resource_heights.items():
+            if os.path.isfile(f):
+                with open(f) as file_in:
+                    csv_reader = csv.reader(file_in, delimiter=',')
+                    line = 0
+                    for row in csv_reader:
+                        if line < 2:
+                            data[line] = row
+                        else:
+                            if line >= len(data):
+                                data.append(row)
+                            else:
+                                data[line] += row
+                        line += 1
+
+        with open(filename, 'w', newline='') as fo:
+            writer = csv.writer(fo)
+            writer.writerows(data)
+
+    files = {80: tmp_path / "80m.srw", 100: tmp_path / "100m.srw"}
+    files[80].write_text('id,city,state,country,lat,lon\n"1,2",Golden,CO,USA,39.7,-105.2\n'
+                         'Temperature,Pressure,Speed,Direction\nC,atm,m/s,degrees\n80,80,80,80\n'
+                         '10.1,0.8,,270\n11.2,0.81,5.5,265\n')
+    files[100].write_text('id,city,state,country,lat,lon\n"1,2",Golden,CO,USA,39.7,-105.3\r\n'
+                          'Temperature,Pressure,Speed,Direction\nC,atm,m/s,degrees\n100,100,100,100\n'
+                          '9.9,0.79,6.0,\n11.0,0.8,6.2,266\n12.0,0.8,6.3,267\n')
+
+    WindResource.combine_wind_files(SimpleNamespace(file_resource_heights=files, filename=tmp_path / "combined.srw"))
+    combine_wind_files_lists(files, tmp_path / "expected.srw")
+    assert (tmp_path / "combined.srw").read_bytes() == (tmp_path / "expected.srw").read_bytes()
+
+
 def test_from_file():
     wind_resource = WindResource(
         lat=lat, 
@@ -154,3 +192,27 @@ def test_from_file():
         filepath=str(solar_file)
     )
     assert(len(solar_resource.data['gh']) > 0)
+
+
+def test_wind_resource_array():
+    from PySAM.ResourceTools import SRW_to_wind_data
+
+    wind_resource = WindResource(
+        lat=lat,
+        lon=lon,
+        year=year,
+        wind_turbine_hub_ht=90,
+        filepath=str(DEFAULT_WIND_RESOURCE_FILE),
+    )
+    expected = SRW_to_wind_data(str(DEFAULT_WIND_RESOURCE_FILE))
+    assert wind_resource.data == expected
+
+    assert wind_resource.resource_heights.tolist() == [80., 100.]
+    assert wind_resource.resource_array.shape == (8760, 2, 4)
+
+    speed_80 = [row[2] for row in expected['data']]
+    speed_100 = [row[6] for row in expected['data']]
+    at_hub = wind_resource.at_height(90)
+    assert at_hub[:, 2] == approx([(a + b) / 2 for a, b in zip(speed_80, speed_100)])
+    assert wind_resource.at_height(60)[:, 2] == approx(speed_80)
+    assert wind_resource.at_height(100)[:, 3] == approx([row[7] for row in expected['data']])
@@ -156,4 +156,40 @@ def test_site_kml_file_append():
     assert filepath_new.exists()
     k, valid_region, lat, lon = SiteInfo.kml_read(kml_filepath)
     assert valid_region.area > 0
-    os.remove(filepath_new)
\ No newline at end of file
+    os.remove(filepath_new)
+
+def _shared_site_totals(_):
+    from hopp.simulation.technologies.resource.shared_resource import SOLAR, get_shared_resource
+
+    site = SiteInfo(
+        flatirons_site,
+        solar_resource_file=solar_resource_file,
+        wind_resource_file=wind_resource_file,
+        grid_resource_file=grid_resource_file
+    )
+    return (
+        get_shared_resource(SOLAR, solar_resource_file) is not None,
+        sum(site.solar_resource.data['gh']),
+        float(np.sum(site.wind_resource.data['data'])),
+        float(np.sum(site.elec_prices.data))
+    )
+
+
+def test_site_shared_resources(site):
+    import multiprocessing
+    from hopp.simulation.technologies.resource import SharedResourceStore, attach_shared_resources
+
+    expected = (
+        True,
+        sum(site.solar_resource.data['gh']),
+        float(np.sum(site.wind_resource.data['data'])),
+        float(np.sum(site.elec_prices.data))
+    )
+    with SharedResourceStore.from_site(site) as store:
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(2, initializer=attach_shared_resources, initargs=(store.handle,)) as pool:
+            results = pool.map(_shared_site_totals, range(2))
+
+    for result in results:
+        assert result[0]
+        assert result[1:] == pytest.approx(expected[1:])
@@ -0,0 +1,31 @@
+from hopp.utilities.timing import StageTimer
+
+
+def test_stage_timer(subtests):
+    timer = StageTimer()
+    for _ in range(3):
+        with timer.stage("solve"):
+            pass
+    with timer.stage("setup"):
+        pass
+
+    with subtests.test("accumulates stages"):
+        assert list(timer.totals.keys()) == ["solve", "setup"]
+        assert timer.counts == {"solve": 3, "setup": 1}
+        assert timer.totals["solve"] >= 0
+
+    with subtests.test("records time on error"):
+        try:
+            with timer.stage("failed"):
+                raise ValueError
+        except ValueError:
+            pass
+        assert timer.counts["failed"] == 1
+
+    with subtests.test("summary"):
+        assert "solve" in timer.summary()
+
+    with subtests.test("reset"):
+        timer.reset()
+        assert timer.totals == {}
+        assert timer.counts == {}
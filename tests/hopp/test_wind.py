@@ -2,8 +2,12 @@ import pytest
 from pytest import fixture
 import math
 
+import numpy as np
+from numpy.testing import assert_allclose
 import PySAM.Windpower as windpower
 
+from hopp import ROOT_DIR
+from hopp.simulation.technologies.wind.floris import Floris
 from hopp.simulation.technologies.wind.wind_plant import WindPlant, WindConfig
 from tests.hopp.utils import create_default_site_info
 
@@ -130,3 +134,33 @@ def test_changing_system_capacity(site):
 
 
 
+
+
+def test_floris_power_table(site, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # Floris saves its speeds and directions to the working directory
+    floris_config = ROOT_DIR.parent / "examples" / "inputs" / "floris" / "gch.yaml"
+    config = {
+        "num_turbines": 4,
+        "turbine_rating_kw": 5000,
+        "model_name": "floris",
+        "timestep": (0, 500),
+        "floris_config": floris_config,
+    }
+    time_series = Floris(site, WindConfig.from_dict(config))
+    time_series.execute(25)
+    interpolated = Floris(site, WindConfig.from_dict({**config, "floris_power_table": True}))
+    interpolated.execute(25)
+
+    assert interpolated.annual_energy == pytest.approx(time_series.annual_energy, rel=1e-3)
+    assert np.corrcoef(interpolated.gen, time_series.gen)[0, 1] > 0.9999
+
+    table = interpolated.power_table()
+    assert interpolated.power_table() is table
+    assert table.max_wind_speed >= np.max(interpolated.speeds)
+    speeds, directions = np.meshgrid(table.wind_speeds, table.wind_directions)
+    assert_allclose(table.turbine_power(speeds.ravel(), directions.ravel()),
+                    table.turbine_powers.reshape(-1, interpolated.nTurbs))
+    assert_allclose(table.farm_power([5.0, 5.0], [-90.0, 270.0]), table.farm_power([5.0, 5.0], [270.0, 270.0]))
+
+    interpolated.fi.reinitialize(layout_x=np.array(interpolated.fi.layout_x) * 2)
+    assert interpolated.power_table() is not table